@@ -1,17 +1,20 @@
 # app/auth.py
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 import os
+import time
 
-from fastapi import APIRouter, HTTPException, status, Depends, Security
+import anyio
+from fastapi import APIRouter, HTTPException, status, Request, Security
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, EmailStr
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
 
-from .database import get_db
-from . import crud
-from .security import verify_password  # ✅ security.pyの関数だけ使う
+from .database import SessionLocal
+from . import crud, models, principals
+from .cache import TTLCache
+from .security import PasswordHashBusy, verify_password_async  # ✅ security.pyの関数だけ使う
+from .throttle import SlidingWindow
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -19,11 +22,28 @@ SECRET_KEY = os.getenv("SECRET_KEY", "change-me-please")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
+# ログイン失敗の回数制限（直近 LOGIN_THROTTLE_WINDOW 秒の失敗回数。成功したログインは数えない）
+# - メールアドレスごと: 1アカウントへのパスワード総当たり対策
+# - 接続元IPごと: 多数のアカウントを試すリスト型攻撃対策（店舗の共有回線を考えて多めにする）
+# 上限に達したら、パスワード照合（CPU を使う）の前に 429 で断る
+LOGIN_THROTTLE_WINDOW = float(os.getenv("LOGIN_THROTTLE_WINDOW", "300"))
+LOGIN_MAX_FAILURES_PER_EMAIL = int(os.getenv("LOGIN_MAX_FAILURES_PER_EMAIL", "5"))
+LOGIN_MAX_FAILURES_PER_IP = int(os.getenv("LOGIN_MAX_FAILURES_PER_IP", "50"))
+
+# 接続元IPの取り方: リバースプロキシ（PythonAnywhere など）の後ろでは request.client がプロキシのアドレスになるので、
+# 信頼できるプロキシの段数を TRUSTED_PROXY_HOPS に入れる（PythonAnywhere は 1）。
+# X-Forwarded-For の右から その段数番目（いちばん外側の信頼できるプロキシが付けた値）を使う。
+# それより左はクライアントが自由に書けるので使わない。0（既定）なら X-Forwarded-For は見ない
+TRUSTED_PROXY_HOPS = int(os.getenv("TRUSTED_PROXY_HOPS", "0"))
+
+_failures_by_email = SlidingWindow(LOGIN_MAX_FAILURES_PER_EMAIL, LOGIN_THROTTLE_WINDOW)
+_failures_by_ip = SlidingWindow(LOGIN_MAX_FAILURES_PER_IP, LOGIN_THROTTLE_WINDOW)
+
 
 def create_access_token(data: dict, expires_minutes: int = ACCESS_TOKEN_EXPIRE_MINUTES) -> str:
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(minutes=expires_minutes)
-    to_encode.update({"exp": expire})
+    now = datetime.utcnow()
+    to_encode.update({"iat": now, "exp": now + timedelta(minutes=expires_minutes)})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
@@ -45,16 +65,62 @@ class TokenOut(BaseModel):
     user: PublicUser
 
 
+def _client_ip(request: Request) -> str:
+    if TRUSTED_PROXY_HOPS > 0:
+        forwarded = [
+            ip.strip()
+            for header in request.headers.getlist("x-forwarded-for")
+            for ip in header.split(",")
+            if ip.strip()
+        ]
+        if len(forwarded) >= TRUSTED_PROXY_HOPS:
+            return forwarded[-TRUSTED_PROXY_HOPS]
+    return request.client.host if request.client else "unknown"
+
+
+def _find_staff(email: str) -> models.Staff | None:
+    # パスワード照合の順番待ちの間 DB コネクションを握らないよう、引いたらすぐ閉じる
+    with SessionLocal() as db:
+        return crud.get_staff_by_email(db, email=email)
+
+
 @router.post("/login", response_model=TokenOut)
-def login(payload: LoginIn, db: Session = Depends(get_db)):
-    staff = crud.get_staff_by_email(db, email=str(payload.email))
+async def login(payload: LoginIn, request: Request):
+    email_key = str(payload.email).lower()
+    ip_key = _client_ip(request)
 
-    if (not staff) or (not verify_password(payload.password, staff.hashed_password)):
+    wait = max(_failures_by_email.retry_after(email_key), _failures_by_ip.retry_after(ip_key))
+    if wait > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="ログインの失敗が続いたため、しばらく時間をおいてから再度お試しください",
+            headers={"Retry-After": str(int(wait) + 1)},
+        )
+
+    staff = await anyio.to_thread.run_sync(_find_staff, str(payload.email))
+    try:
+        ok = staff is not None and await verify_password_async(payload.password, staff.hashed_password)
+    except PasswordHashBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="ログインが混み合っています。少し待ってから再度お試しください",
+            headers={"Retry-After": "1"},
+        )
+
+    if not ok:
+        _failures_by_email.hit(email_key)
+        _failures_by_ip.hit(ip_key)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="メールアドレスまたはパスワードが違います",
         )
+    if staff.is_active is False:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="このアカウントは無効化されています",
+        )
 
+    _failures_by_email.reset(email_key)
     token = create_access_token({"sub": str(staff.id), "email": staff.email, "role": "staff"})
 
     return TokenOut(
@@ -79,54 +145,81 @@ def ping():
 security = HTTPBearer()
 optional_security = HTTPBearer(auto_error=False)
 
+# 検証済みトークン → (スタッフID, iat, exp)。スタッフの状態はここではなく principals で確認する
+_token_cache = TTLCache(ttl=principals.PRINCIPAL_CACHE_TTL, maxsize=4096)
 
-def get_current_user(
-    db: Session = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials = Security(security),
-) -> dict:
-    token = credentials.credentials
-
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="認証情報が無効です。ログインし直してください。",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
 
+def _verify_token(token: str) -> tuple[int, int | None, int] | None:
+    # (スタッフID, 発行時刻 iat, 期限 exp) を返す。不正なトークンなら None
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         sub = payload.get("sub")
         if not sub:
-            raise credentials_exception
-        staff_id = int(sub)
-    except (JWTError, ValueError):
-        raise credentials_exception
-
-    staff = crud.get_staff_by_id(db, staff_id)
-    if staff is None:
-        raise credentials_exception
+            return None
+        return int(sub), payload.get("iat"), int(payload["exp"])
+    except (JWTError, ValueError, KeyError):
+        return None
 
-    return {"id": staff.id, "name": getattr(staff, "name", None), "email": staff.email, "role": "staff"}
 
+def _decode_token(token: str) -> tuple[int, int | None] | None:
+    # 署名の検証は同じトークンにつき1回だけ（検証済みのトークンは期限まで覚えておく）
+    verified = _token_cache.get(token)
+    if verified is None:
+        verified = _verify_token(token)
+        if verified is None:
+            return None
+        _token_cache.set(token, verified)
 
-def get_optional_user(
-    db: Session = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials | None = Security(optional_security),
-) -> dict | None:
-    if credentials is None:
+    staff_id, issued_at, expires_at = verified
+    if expires_at <= time.time():
+        _token_cache.invalidate(token)
         return None
+    return staff_id, issued_at
 
-    token = credentials.credentials
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        sub = payload.get("sub")
-        if not sub:
-            return None
-        staff_id = int(sub)
-    except Exception:
+
+def _load_principal(staff_id: int) -> principals.Principal | None:
+    with SessionLocal() as db:
+        return principals.load(db, staff_id)
+
+
+async def _authenticate(token: str) -> principals.Principal | None:
+    decoded = _decode_token(token)
+    if decoded is None:
         return None
+    staff_id, issued_at = decoded
+
+    # キャッシュに無いときだけ DB を見る（スレッドで実行してイベントループを止めない）
+    principal = principals.get_cached(staff_id)
+    if principal is principals.MISSING:
+        principal = await anyio.to_thread.run_sync(_load_principal, staff_id)
 
-    staff = crud.get_staff_by_id(db, staff_id)
-    if not staff:
+    if principal is None or not principal.is_active:
         return None
+    # パスワード変更より前に発行されたトークンは無効
+    if principal.password_changed_at is not None:
+        changed = principal.password_changed_at.replace(tzinfo=timezone.utc).timestamp()
+        if issued_at is None or issued_at < changed:
+            return None
+    return principal
 
-    return {"id": staff.id, "name": getattr(staff, "name", None), "email": staff.email, "role": "staff"}
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Security(security),
+) -> dict:
+    principal = await _authenticate(credentials.credentials)
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="認証情報が無効です。ログインし直してください。",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return principal.as_user()
+
+
+async def get_optional_user(
+    credentials: HTTPAuthorizationCredentials | None = Security(optional_security),
+) -> dict | None:
+    if credentials is None:
+        return None
+    principal = await _authenticate(credentials.credentials)
+    return principal.as_user() if principal else None
@@ -0,0 +1,123 @@
+# app/cli.py
+# 運用コマンド（beauty-backend ディレクトリで実行）
+#
+#   python -m app.cli migrate [--status]               # スキーマのマイグレーション（デプロイ時に実行）
+#   python -m app.cli rebuild-last-purchases          # 最終購入サマリーを全件作り直す
+#   python -m app.cli rebuild-rollups [--days 35]     # 来店の日別集計を作り直す（夜間バッチ。cron 例: 0 3 * * *）
+#   python -m app.cli check-last-visit-dates [--repair] # Customer.last_visit_date のズレを確認（直す）
+#   python -m app.cli import-visits visits.csv        # 来店履歴の一括取り込み（CSV / NDJSON）
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from .database import SessionLocal, engine  # noqa: E402
+from . import crud, last_purchases, migrations, rollups, visit_import  # noqa: E402
+
+
+def cmd_migrate(args) -> None:
+    if args.status:
+        for mig, applied_at in migrations.status(engine):
+            mark = f"applied {applied_at:%Y-%m-%d %H:%M}" if applied_at else "pending"
+            print(f"{mig.version}_{mig.name:<24} {mark:<24} {mig.description}")
+        return
+
+    t0 = time.perf_counter()
+    applied = migrations.upgrade(engine, log=print)
+    if applied:
+        print(f"applied {len(applied)} migrations in {time.perf_counter() - t0:.1f}s")
+    else:
+        print("already up to date")
+
+
+def cmd_rebuild_last_purchases(args) -> None:
+    t0 = time.perf_counter()
+    with SessionLocal() as db:
+        count = last_purchases.rebuild(db, chunk_size=args.chunk_size)
+    print(f"rebuilt {count} rows in {time.perf_counter() - t0:.1f}s")
+
+
+def cmd_rebuild_rollups(args) -> None:
+    date_to = args.to
+    date_from = args.date_from
+    if args.days:
+        date_to = date_to or date.today()
+        date_from = date_to - timedelta(days=args.days - 1)
+    t0 = time.perf_counter()
+    with SessionLocal() as db:
+        days = rollups.rebuild(db, date_from, date_to, chunk_days=args.chunk_days)
+    print(f"rebuilt {days} days in {time.perf_counter() - t0:.1f}s")
+
+
+def cmd_check_last_visit_dates(args) -> None:
+    with SessionLocal() as db:
+        mismatches = crud.check_last_visit_dates(db, repair=args.repair)
+    for customer_id, stored, actual in mismatches[:20]:
+        print(f"customer {customer_id}: stored={stored} actual={actual}")
+    if len(mismatches) > 20:
+        print(f"... and {len(mismatches) - 20} more")
+    action = "repaired" if args.repair else "found"
+    print(f"{action} {len(mismatches)} mismatched customers")
+
+
+def cmd_import_visits(args) -> None:
+    fmt = args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+
+    def progress(r):
+        print(
+            f"\rvisits={r.visits} items={r.items} skipped={r.skipped} "
+            f"{r.elapsed_sec:.1f}s {r.rows_per_sec:,.0f} rows/s",
+            end="", file=sys.stderr, flush=True,
+        )
+
+    with SessionLocal() as db, open(args.path, encoding="utf-8-sig", newline="") as f:
+        result = visit_import.import_visits(
+            db, visit_import.read_records(f, fmt), chunk_size=args.chunk_size, on_progress=progress
+        )
+    print(file=sys.stderr)
+    for e in result.errors[:20]:
+        print(f"line {e['line']}: {e['error']}")
+    if result.skipped > 20:
+        print(f"... and {result.skipped - 20} more")
+    print(f"imported {result.visits} visits / {result.items} items, skipped {result.skipped}")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("migrate", help="未適用のスキーマのマイグレーションを適用する")
+    p.add_argument("--status", action="store_true", help="適用せずに状況だけ表示する")
+    p.set_defaults(func=cmd_migrate)
+
+    p = sub.add_parser("rebuild-last-purchases", help="顧客×カテゴリの最終購入サマリーを作り直す")
+    p.add_argument("--chunk-size", type=int, default=10000, help="1回の INSERT で扱う顧客ID幅（commit は最後に1回）")
+    p.set_defaults(func=cmd_rebuild_last_purchases)
+
+    p = sub.add_parser("rebuild-rollups", help="来店の日別集計（推移グラフ用）を作り直す")
+    p.add_argument("--from", dest="date_from", type=date.fromisoformat, help="この日から（省略時は最初の来店日）")
+    p.add_argument("--to", type=date.fromisoformat, help="この日まで（省略時は最後の来店日）")
+    p.add_argument("--days", type=int, help="直近 N 日分だけ（夜間バッチ用。--to か今日まで）")
+    p.add_argument("--chunk-days", type=int, default=31, help="1回の commit で作り直す日数")
+    p.set_defaults(func=cmd_rebuild_rollups)
+
+    p = sub.add_parser("check-last-visit-dates", help="Customer.last_visit_date と来店履歴のズレを確認する")
+    p.add_argument("--repair", action="store_true", help="ズレていたら来店履歴の値で直す")
+    p.set_defaults(func=cmd_check_last_visit_dates)
+
+    p = sub.add_parser("import-visits", help="来店履歴を CSV / NDJSON から一括取り込みする")
+    p.add_argument("path", help="取り込むファイル（.csv ならCSV、それ以外は NDJSON として読む）")
+    p.add_argument("--format", choices=visit_import.FORMATS, help="拡張子で判断しない場合に指定")
+    p.add_argument("--chunk-size", type=int, default=1000, help="1回の commit で登録する来店数")
+    p.set_defaults(func=cmd_import_visits)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
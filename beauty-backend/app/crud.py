@@ -1,15 +1,25 @@
 # app/crud.py
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from . import models, schemas
 from datetime import date, datetime, timedelta #○日後を計算する
-from sqlalchemy import func, or_
-from .security import get_password_hash
+from sqlalchemy import bindparam, func, select, tuple_, update
+from . import search, last_purchases, follow_rules, principals, dashboard, rollups, segments
+from .pagination import Page, paginate, read_cursor
+
+# 入力値から作るカラム（検索用の正規化値・誕生月日）をそろえる
+def _apply_derived_fields(customer: models.Customer) -> None:
+    search.apply_normalized_fields(customer)
+    customer.birth_month = customer.birthday.month if customer.birthday else None
+    customer.birth_day = customer.birthday.day if customer.birthday else None
 
 #顧客情報作成
 def create_customer(db: Session, customer: schemas.CustomerCreate):
     db_customer = models.Customer(**customer.dict())
+    _apply_derived_fields(db_customer)
     db.add(db_customer)
     db.commit()
+    dashboard.invalidate()
+    segments.invalidate()
     db.refresh(db_customer)
     return db_customer
 
@@ -27,8 +37,11 @@ def update_customer(db: Session, customer_id: int, customer_in: schemas.Customer
 
     for k, v in data.items():
         setattr(customer, k, v)
+    _apply_derived_fields(customer)
 
     db.commit()
+    dashboard.invalidate()
+    segments.invalidate()
     db.refresh(customer)
     return customer
 
@@ -37,25 +50,49 @@ def delete_customer(db: Session, customer_id: int) -> bool:
     customer = db.query(models.Customer).filter(models.Customer.id == customer_id).first()
     if not customer:
         return False
+    last_purchases.delete_customer(db, customer_id) #最終購入サマリーも消す
+    visit_days = [d for (d,) in db.query(models.Visit.visit_date).filter(models.Visit.customer_id == customer_id).distinct()]
     db.delete(customer)
+    db.flush()
+    rollups.refresh_days(db, visit_days) #消えた来店の日の集計を作り直す
     db.commit()
+    dashboard.invalidate()
+    segments.invalidate()
     return True
 
 
-#スタッフアカウント作成
-def create_staff(db: Session, staff_in: schemas.StaffCreate):
-    hashed = get_password_hash(staff_in.password)
-
-
+#スタッフアカウント作成。hashed_password は呼び出し側で作っておく（pbkdf2 の計算を DB 処理の中でしない）
+def create_staff(db: Session, staff_in: schemas.StaffCreate, hashed_password: str):
     staff = models.Staff(
         staff_code=staff_in.staff_code,
         name=staff_in.name,
         email=staff_in.email,
-        hashed_password=hashed,
+        hashed_password=hashed_password,
     )
     db.add(staff)
     db.commit()
     db.refresh(staff)
+    principals.invalidate(staff.id)  # 「存在しないID」としてキャッシュされていた場合に備える
+    return staff
+
+
+#スタッフ情報の更新（無効化・パスワード変更も）。認証キャッシュも捨てる
+# パスワード変更は hashed_password に新しいハッシュを渡す（staff_in.password は使わない）
+def update_staff(db: Session, staff_id: int, staff_in: schemas.StaffUpdate, hashed_password: str | None = None):
+    staff = db.get(models.Staff, staff_id)
+    if staff is None:
+        return None
+
+    data = staff_in.model_dump(exclude_unset=True, exclude={"current_password", "password"})  # 確認はルーター側
+    for key, value in data.items():
+        setattr(staff, key, value)
+    if hashed_password:
+        staff.hashed_password = hashed_password
+        staff.password_changed_at = datetime.utcnow().replace(microsecond=0)  # 今までのトークンを無効にする
+
+    db.commit()
+    db.refresh(staff)
+    principals.invalidate(staff.id)
     return staff
 
 
@@ -75,90 +112,45 @@ def get_staff_by_email(db, email: str):
 def count_staffs(db: Session) -> int:
     return db.query(func.count(models.Staff.id)).scalar() or 0
 
-# イベントフォロー対象：直近1年以内に来店がある人
-def get_event_targets(db: Session, within_days: int = 365):
-    since = date.today() - timedelta(days=within_days)
-
-    latest_visit_sq = (
-        db.query(
-            models.Visit.customer_id.label("customer_id"),
-            func.max(models.Visit.visit_date).label("latest_visit_date"),
-        )
-        .group_by(models.Visit.customer_id)
-        .subquery()
-    )
-
-    rows = (
-        db.query(models.Customer, latest_visit_sq.c.latest_visit_date)
-        .join(latest_visit_sq, latest_visit_sq.c.customer_id == models.Customer.id)
-        .filter(latest_visit_sq.c.latest_visit_date >= since)
-        .filter(models.Customer.email.isnot(None))
-        .filter(models.Customer.email_opt_in.is_(True))
-        .order_by(models.Customer.id.desc())
-        
-        .all()
-    )
-    return rows
-
-
-
-#誕生日フォロー対象：直近1年以内に来店がある人で、今月誕生日の人
-def get_birthday_targets_this_month_recent(db: Session, within_days: int = 365):
-    since = date.today() - timedelta(days=within_days)
-    this_month = date.today().month
-
-    latest_visit_sq = (
-        db.query(
-            models.Visit.customer_id.label("customer_id"),
-            func.max(models.Visit.visit_date).label("latest_visit_date"),
-        )
-        .group_by(models.Visit.customer_id)
-        .subquery()
-    )
-
-    rows = (
-        db.query(models.Customer, latest_visit_sq.c.latest_visit_date)
-        .join(latest_visit_sq, latest_visit_sq.c.customer_id == models.Customer.id)
-        .filter(latest_visit_sq.c.latest_visit_date >= since)
-        .filter(models.Customer.email.isnot(None))
-        .filter(models.Customer.email_opt_in == True)
-        .filter(models.Customer.birthday.isnot(None))
-        .filter(func.extract("month", models.Customer.birthday) == this_month)
-        .order_by(models.Customer.id.desc())
-        .all()
-    )
-    return rows
-
-# 顧客×カテゴリ：最後にそのカテゴリを買った来店日から一定日数以上空いてる人
-FOLLOW_THRESHOLD = {"skincare": 90, "makeup": 120}
-
+# 次の誕生日（うるう年以外の 2/29 生まれは 2/28 扱い）
+def next_birthday(birthday: date, today: date) -> date:
+    for year in (today.year, today.year + 1):
+        try:
+            d = birthday.replace(year=year)
+        except ValueError:
+            d = date(year, 2, 28)
+        if d >= today:
+            return d
+    return date(today.year + 1, birthday.month, min(birthday.day, 28))
+
+
+#誕生日フォロー対象：今日から days 日以内に誕生日が来る人（直近 within_days 日以内に来店あり）
+#戻り値: [(顧客の行, 最終来店日, 次の誕生日)]（誕生日が近い順）
+def get_upcoming_birthday_targets(db: Session, days: int = 30, within_days: int = 365, today: date | None = None):
+    today = today or date.today()
+    end = today + timedelta(days=days)
+    rows = segments.targets(db, "upcoming_birthday", today=today, days=days, within_days=within_days)
+
+    targets = []
+    for c in rows:
+        nb = next_birthday(c.birthday, today)
+        if nb <= end:
+            targets.append((c, c.last_visit_date, nb))
+    targets.sort(key=lambda t: (t[2], t[0].id))
+    return targets
+
+# 顧客×カテゴリ：最後にそのカテゴリを買った来店日から一定日数以上空いてる人（日数はフォロー周期ルールのカテゴリ設定）
 def get_inactive_customers_by_segment(db: Session, segment: str):
     today = date.today()
-    days = FOLLOW_THRESHOLD.get(segment)
+    days = follow_rules.get_rules(db).category_days(segment)
     if not days:
         return []
 
-    cutoff = today - timedelta(days=days)
-
-    rows = (
-        db.query(
-            models.Customer.id.label("customer_id"),
-            models.Customer.name.label("name"),
-            models.Customer.email.label("email"),
-            func.max(models.Visit.visit_date).label("last_visit_date"),
-        )
-        .join(models.Visit, models.Visit.customer_id == models.Customer.id)
-        .join(models.VisitItem, models.VisitItem.visit_id == models.Visit.id)
-        .filter(
-            models.Customer.email.isnot(None),
-            models.Customer.email_opt_in.is_(True),
-            models.VisitItem.category == segment,
-        )
-        .group_by(models.Customer.id, models.Customer.name, models.Customer.email)
-        .having(func.max(models.Visit.visit_date) <= cutoff)
-        .order_by(func.max(models.Visit.visit_date).asc())
-        .all()
-    )
+    # 最終購入サマリーを (category, last_purchase_date) のインデックスで範囲スキャン（条件は segments）
+    stmt = segments.build_lapsed(
+        [segments.category_lapsed(segment, days, today), segments.opted_in()]
+    ).order_by(models.CustomerLastPurchase.last_purchase_date.asc())
+    rows = db.execute(stmt).all()
 
     return [
         {
@@ -170,46 +162,36 @@ def get_inactive_customers_by_segment(db: Session, segment: str):
             "segment": segment,
         }
         for r in rows
-        if r.last_visit_date is not None
     ]
 
 
-# 各対象メール（birthday / event 専用）
+# 各対象メール（birthday / event 専用）の宛先。セグメント（segments.SEGMENTS）の行を返す
+#   event: 直近within_days以内に来店がある（emailあり & 同意あり）
+#   birthday: 今月誕生日 & 直近within_days以内に来店がある
 def get_mail_targets(
     db: Session,
     mail_type: schemas.MailType,
     within_days: int = 365,
 ):
-    if mail_type == schemas.MailType.event:
-        # 直近within_days以内に来店がある（emailあり & 同意あり）
-        return get_event_targets(db, within_days=within_days)
-
-    if mail_type == schemas.MailType.birthday:
-        # 今月誕生日 & 直近within_days以内に来店がある
-        return get_birthday_targets_this_month_recent(db, within_days=within_days)
+    if mail_type in (schemas.MailType.event, schemas.MailType.birthday):
+        return segments.targets(db, mail_type.value, within_days=within_days)
 
     # purchase_follow はここでは扱わない（別APIへ誘導する方針）
     return []
 
 
-#条件に合う顧客を、DBから探して取ってくる　（limit: int = 50＝最大50人）
-def get_customers(db: Session, q: str | None = None, limit: int = 50): 
-    query = db.query(models.Customer) #顧客テーブルを参照
+#条件に合う顧客を、DBから探して取ってくる　（limit: int = 50＝1ページ最大50人）
+def get_customers(db: Session, q: str | None = None, limit: int = 50, cursor: str | None = None) -> Page:
+    if q: #検索ワードがある時は検索インデックスで探す（関連度順）
+        return search.search_customers(db, q, limit=limit, cursor=cursor)
 
-    if q: #検索ワードがある時のみ実行
-        like = f"%{q}%" 
-        query = query.filter(
-            or_( #OR検索↓どれか1つでも当てはまればOK　（ilike = 大文字・小文字を区別しない）
-                models.Customer.name.ilike(like),
-                models.Customer.kana.ilike(like),
-                models.Customer.phone.ilike(like),
-                models.Customer.email.ilike(like),
-            )
-        )
-
-    return query.order_by(models.Customer.id.desc()).limit(limit).all() #新しく登録した順に並び替えて返す※最大50人
+    after = read_cursor(cursor, id=int) #前ページの最後の顧客ID
+    query = db.query(models.Customer) #顧客テーブルを参照
+    if after:
+        query = query.filter(models.Customer.id < after["id"])
 
-FOLLOW_DAYS = {"skincare": 90,"makeup": 120}
+    rows = query.order_by(models.Customer.id.desc()).limit(limit + 1).all() #新しく登録した順に並び替えて返す
+    return paginate(rows, limit, key=lambda c: {"id": c.id})
 
 #購入品（VisitItem）に対して、フォロー送信済みの日時を記録する
 def mark_purchase_follow_sent(db: Session, visit_item_id: int):
@@ -230,8 +212,95 @@ def mark_purchase_follow_sent(db: Session, visit_item_id: int):
     return item
 
 
+#購入フォロー対象：フォロー期限（follow_due_date）が来ていて、まだ送っていない購入品
+#顧客×カテゴリごとに「最後に買ったもの」だけ（最終購入サマリーと突き合わせ。買い直した人には送らない）
+#期限の古い順に limit 件ずつ（カーソルは (follow_due_date, visit_item_id)）
+def get_purchase_follow_targets(
+    db: Session,
+    category: str | None = None,
+    limit: int = 100,
+    cursor: str | None = None,
+    today: date | None = None,
+) -> Page:
+    today = today or date.today()
+    after = read_cursor(cursor, d=date.fromisoformat, id=int)
+    VI, V, C, LP = models.VisitItem, models.Visit, models.Customer, models.CustomerLastPurchase
+
+    query = (
+        db.query(
+            VI.id.label("visit_item_id"),
+            C.id.label("customer_id"),
+            C.name.label("name"),
+            C.email.label("email"),
+            VI.category.label("category"),
+            VI.product_name.label("product_name"),
+            V.visit_date.label("visit_date"),
+            VI.follow_due_date.label("follow_due_date"),
+        )
+        .join(V, V.id == VI.visit_id)
+        .join(C, C.id == V.customer_id)
+        .join(LP, LP.last_visit_item_id == VI.id)
+        .filter(
+            VI.follow_due_date <= today,
+            VI.follow_sent_at.is_(None),
+            VI.category.in_(follow_rules.get_rules(db).categories()), #フォロー周期ルールがあるカテゴリだけ（other などは対象外）
+            C.email.isnot(None),
+            C.email_opt_in.is_(True),
+        )
+    )
+    if category:
+        query = query.filter(VI.category == category)
+    if after:
+        query = query.filter(tuple_(VI.follow_due_date, VI.id) > tuple_(after["d"], after["id"]))
+
+    rows = query.order_by(VI.follow_due_date, VI.id).limit(limit + 1).all()
+    page = paginate(rows, limit, key=lambda r: {"d": r.follow_due_date.isoformat(), "id": r.visit_item_id})
+    page.items = [
+        {**r._asdict(), "days_overdue": (today - r.follow_due_date).days}
+        for r in page.items
+    ]
+    return page
+
+
+#購入品（VisitItem）をまとめて送信済みにする（未送信のものだけ。1トランザクション・1回の commit）
+#2人のスタッフが同時に送っても、UPDATE の「follow_sent_at IS NULL」条件でどちらか一方だけが marked になる
+def mark_purchase_follow_sent_bulk(db: Session, visit_item_ids: list[int], chunk_size: int = 500) -> dict:
+    ids = sorted(set(visit_item_ids))
+    now = datetime.utcnow()
+    VI = models.VisitItem
+    can_return = db.get_bind().dialect.update_returning
+
+    marked: list[int] = []
+    existing: list[int] = []
+    for start in range(0, len(ids), chunk_size):
+        chunk = ids[start:start + chunk_size]
+        stmt = (
+            update(VI)
+            .where(VI.id.in_(chunk), VI.follow_sent_at.is_(None))
+            .values(follow_sent_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        if can_return:
+            marked += db.execute(stmt.returning(VI.id)).scalars().all()
+        else:
+            db.execute(stmt)
+            marked += db.execute(select(VI.id).where(VI.id.in_(chunk), VI.follow_sent_at == now)).scalars().all()
+        existing += db.execute(select(VI.id).where(VI.id.in_(chunk))).scalars().all()
+
+    db.commit()
+
+    marked_set, existing_set = set(marked), set(existing)
+    return {
+        "sent_at": now,
+        "marked": sorted(marked_set),
+        "already_sent": sorted(existing_set - marked_set),
+        "not_found": [i for i in ids if i not in existing_set],
+    }
+
+
 # 1回の来店分を作成
 def create_visit(db: Session, visit_in: schemas.VisitCreate) -> models.Visit:
+    first_days = rollups.first_visit_days(db, [visit_in.customer_id]) #初来店より前の来店なら、元の初来店の日も再来数が変わる
     visit = models.Visit(
         customer_id=visit_in.customer_id,
         visit_date=visit_in.visit_date,
@@ -242,10 +311,10 @@ def create_visit(db: Session, visit_in: schemas.VisitCreate) -> models.Visit:
     db.flush()  # visit.id をここで確定させる（itemsにFKで使う）
 
     # VisitItem（明細）作成
+    rules = follow_rules.get_rules(db)
     for item_in in visit_in.items:
         cat = item_in.category
-        days = FOLLOW_DAYS.get(cat, 0)  # ← 未知カテゴリは0日（フォローなし扱い）
-        due = visit_in.visit_date + timedelta(days=days)
+        due = rules.due_date(visit_in.visit_date, cat, item_in.product_name)  # ← 商品ルール → カテゴリルール。未知カテゴリは0日（フォローなし扱い）
 
         db_item = models.VisitItem(
             visit_id=visit.id,
@@ -256,9 +325,16 @@ def create_visit(db: Session, visit_in: schemas.VisitCreate) -> models.Visit:
         )
         db.add(db_item)
 
+    # Customer.last_visit_date と最終購入サマリーを更新（今回のカテゴリ分だけ）
+    db.flush()
+    refresh_last_visit_date(db, visit.customer_id)
+    last_purchases.refresh_customer(db, visit.customer_id, [i.category for i in visit_in.items])
+    rollups.refresh_days(db, first_days | {visit_in.visit_date}) #日別集計（来店日と元の初来店日）
+
     db.commit()
-    db.refresh(visit)
-    return visit
+    dashboard.invalidate()
+    segments.invalidate()
+    return get_visit_with_items(db, visit.id)
 
 
 
@@ -269,19 +345,25 @@ def update_visit(db: Session, visit_id: int, visit_in: schemas.VisitUpdate) -> m
     if not visit:
         return None
 
+    # 日別集計を作り直す日（変更前の来店日・変更前後の初来店日・変更後の来店日）
+    rollup_days = rollups.first_visit_days(db, [visit.customer_id]) | {visit.visit_date}
+
     # 1) Visit（ヘッダ）更新
     visit.visit_date = visit_in.visit_date
     visit.memo = visit_in.memo
     visit.staff_id = visit_in.staff_id
 
-    # 2) VisitItem（明細）を全部入れ替え
+    # 2) VisitItem（明細）を全部入れ替え（入れ替え前のカテゴリはサマリー更新用に覚えておく）
+    old_categories = [
+        c for (c,) in db.query(models.VisitItem.category).filter(models.VisitItem.visit_id == visit_id).all()
+    ]
     db.query(models.VisitItem).filter(models.VisitItem.visit_id == visit_id).delete()
     db.flush()
     
+    rules = follow_rules.get_rules(db)
     for item_in in visit_in.items:
         cat = item_in.category
-        days = FOLLOW_DAYS.get(cat, 0)  # ← 未知カテゴリは0日（フォローなし扱い）
-        due = visit_in.visit_date + timedelta(days=days)
+        due = rules.due_date(visit_in.visit_date, cat, item_in.product_name)  # ← 商品ルール → カテゴリルール。未知カテゴリは0日（フォローなし扱い）
 
         db_item = models.VisitItem(
             visit_id=visit.id,
@@ -292,29 +374,99 @@ def update_visit(db: Session, visit_id: int, visit_in: schemas.VisitUpdate) -> m
         )
         db.add(db_item)
 
-    #Customer.last_visit_date を再計算
-    customer = db.query(models.Customer).filter(models.Customer.id == visit.customer_id).first()
-    if customer:
-        latest = (
-            db.query(func.max(models.Visit.visit_date))
-            .filter(models.Visit.customer_id == customer.id)
-            .scalar()
-        )
-        customer.last_visit_date = latest
+    # Customer.last_visit_date と最終購入サマリーを更新（入れ替え前後のカテゴリ分）
+    db.flush()
+    refresh_last_visit_date(db, visit.customer_id)
+    last_purchases.refresh_customer(
+        db, visit.customer_id, old_categories + [i.category for i in visit_in.items]
+    )
+    rollup_days |= rollups.first_visit_days(db, [visit.customer_id]) | {visit_in.visit_date}
+    rollups.refresh_days(db, rollup_days)
 
     db.commit()
-    db.refresh(visit)
-    return visit
+    dashboard.invalidate()
+    segments.invalidate()
+    return get_visit_with_items(db, visit.id)
+
+
+# Customer.last_visit_date をその顧客の来店から再計算（visits の (customer_id, visit_date) インデックスで1行引くだけ）
+def refresh_last_visit_date(db: Session, customer_id: int) -> None:
+    latest = (
+        select(func.max(models.Visit.visit_date))
+        .where(models.Visit.customer_id == customer_id)
+        .scalar_subquery()
+    )
+    db.execute(
+        update(models.Customer)
+        .where(models.Customer.id == customer_id)
+        .values(last_visit_date=latest)
+        .execution_options(synchronize_session="fetch")
+    )
 
 
-#来店記録を新しい順に取ってくる
-def get_visits_by_customer(db: Session, customer_id: int):
+# Customer.last_visit_date の整合性チェック（repair=True なら直す）
+# 戻り値: ズレていた顧客の [(customer_id, 保存値, 正しい値)]
+def check_last_visit_dates(db: Session, repair: bool = False, chunk_size: int = 1000):
+    latest_sq = (
+        db.query(
+            models.Visit.customer_id.label("customer_id"),
+            func.max(models.Visit.visit_date).label("latest_visit_date"),
+        )
+        .group_by(models.Visit.customer_id)
+        .subquery()
+    )
+    mismatches = (
+        db.query(models.Customer.id, models.Customer.last_visit_date, latest_sq.c.latest_visit_date)
+        .outerjoin(latest_sq, latest_sq.c.customer_id == models.Customer.id)
+        .filter(models.Customer.last_visit_date.is_distinct_from(latest_sq.c.latest_visit_date))
+        .order_by(models.Customer.id)
+        .all()
+    )
+
+    if repair and mismatches:
+        stmt = (
+            update(models.Customer)
+            .where(models.Customer.id == bindparam("_id"))
+            .values(last_visit_date=bindparam("_latest"))
+        )
+        for start in range(0, len(mismatches), chunk_size):
+            chunk = mismatches[start:start + chunk_size]
+            db.connection().execute(stmt, [{"_id": cid, "_latest": latest} for (cid, _, latest) in chunk])
+            db.commit()
+
+    return [tuple(r) for r in mismatches]
+
+
+#来店1件を明細ごと取ってくる（VisitRead で返す用。明細は selectin で1クエリ）
+def get_visit_with_items(db: Session, visit_id: int) -> models.Visit | None:
     return (
         db.query(models.Visit)
+        .options(selectinload(models.Visit.items))
+        .populate_existing() #commit 後の古い状態を使わず読み直す
+        .filter(models.Visit.id == visit_id)
+        .first()
+    )
+
+#来店記録を新しい順に取ってくる（1ページ最大 limit 件）
+def get_visits_by_customer(db: Session, customer_id: int, limit: int = 100, cursor: str | None = None) -> Page:
+    after = read_cursor(cursor, d=date.fromisoformat, id=int) #前ページの最後の (来店日, ID)
+
+    query = (
+        db.query(models.Visit)
+        .options(selectinload(models.Visit.items)) #明細はページ分まとめて1クエリで取る（N+1防止）
         .filter(models.Visit.customer_id == customer_id)
-        .order_by(models.Visit.visit_date.desc(), models.Visit.id.desc())#新しく来店した順に取ってくる
+    )
+    if after:
+        query = query.filter(
+            tuple_(models.Visit.visit_date, models.Visit.id) < tuple_(after["d"], after["id"])
+        )
+
+    rows = (
+        query.order_by(models.Visit.visit_date.desc(), models.Visit.id.desc())#新しく来店した順に取ってくる
+        .limit(limit + 1)
         .all()
     )
+    return paginate(rows, limit, key=lambda v: {"d": v.visit_date.isoformat(), "id": v.id})
 
 # 来店記録を削除する（Visitと紐づく明細も削除）
 def delete_visit(db: Session, visit_id: int) -> bool:
@@ -322,13 +474,28 @@ def delete_visit(db: Session, visit_id: int) -> bool:
     if not visit:
         return False
 
+    customer_id = visit.customer_id
+    rollup_days = rollups.first_visit_days(db, [customer_id]) | {visit.visit_date} #日別集計を作り直す日
+    categories = [
+        c for (c,) in db.query(models.VisitItem.category).filter(models.VisitItem.visit_id == visit_id).all()
+    ]
+
     # 明細（VisitItem）を先に消す（cascade設定が無くても消える）
     db.query(models.VisitItem).filter(models.VisitItem.visit_id == visit_id).delete()
 
     # ヘッダ（Visit）を消す
     db.delete(visit)
 
+    # Customer.last_visit_date と最終購入サマリーを更新（消した来店のカテゴリ分）
+    db.flush()
+    refresh_last_visit_date(db, customer_id)
+    last_purchases.refresh_customer(db, customer_id, categories)
+    rollup_days |= rollups.first_visit_days(db, [customer_id]) #消した来店が初来店なら、次の来店が初来店になる
+    rollups.refresh_days(db, rollup_days)
+
     db.commit()
+    dashboard.invalidate()
+    segments.invalidate()
     return True
 
 # 本日の来店数を取得
@@ -352,4 +519,27 @@ def get_monthly_new_customer_count(db: Session) -> int:
         .filter(models.Customer.created_at >= first_day)
         .scalar()
         or 0
-    )
\ No newline at end of file
+    )
+
+#一斉送信ジョブ
+def get_email_job(db: Session, job_id: int) -> models.EmailJob | None:
+    return db.get(models.EmailJob, job_id)
+
+#一斉送信の宛先ごとの結果（status で絞り込み、outbox ID 順のキーセットページング）
+def get_email_recipients(
+    db: Session,
+    job_id: int,
+    status: str | None = None,
+    limit: int = 100,
+    cursor: str | None = None,
+) -> Page:
+    after = read_cursor(cursor, id=int)
+
+    query = db.query(models.EmailOutbox).filter(models.EmailOutbox.job_id == job_id)
+    if status:
+        query = query.filter(models.EmailOutbox.status == status)
+    if after:
+        query = query.filter(models.EmailOutbox.id > after["id"])
+
+    rows = query.order_by(models.EmailOutbox.id).limit(limit + 1).all()
+    return paginate(rows, limit, key=lambda r: {"id": r.id})
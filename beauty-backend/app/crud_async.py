@@ -0,0 +1,70 @@
+# app/crud_async.py
+# crud の非同期版（async def のルーターから await で呼ぶ）
+#
+# 中身は crud の同期関数をそのまま使う（db.run_sync で実行）。本当の非同期クエリではない:
+# - DB_ASYNC=1: AsyncSession.run_sync → 同期関数をイベントループのスレッド上（greenlet）で動かす。
+#   待たずに済むのは DB との通信（aiosqlite / asyncpg）だけで、ORM の組み立て・結果の詰め替えなど
+#   Python の処理の間はイベントループが止まる
+# - DB_ASYNC=0: ThreadedSession.run_sync → これまで通りスレッドプールで実行
+# なので CPU を長く使う処理（パスワードハッシュなど）は crud の中でしない。
+# ルーター側でスレッドに逃がしてから結果を渡す（例: create_staff / update_staff の hashed_password）
+# クエリの中身は crud.py だけを直せばよい
+from functools import wraps
+
+from . import crud, dashboard, follow_rules, rollups, segments
+from .mail_worker import enqueue_job as _enqueue_job
+
+
+def _async(fn):
+    @wraps(fn)
+    async def wrapper(db, *args, **kwargs):
+        return await db.run_sync(fn, *args, **kwargs)
+
+    return wrapper
+
+
+# 顧客
+create_customer = _async(crud.create_customer)
+get_customer = _async(crud.get_customer)
+get_customers = _async(crud.get_customers)
+update_customer = _async(crud.update_customer)
+delete_customer = _async(crud.delete_customer)
+
+# スタッフ
+create_staff = _async(crud.create_staff)
+update_staff = _async(crud.update_staff)
+get_staffs = _async(crud.get_staffs)
+get_staff_by_id = _async(crud.get_staff_by_id)
+count_staffs = _async(crud.count_staffs)
+
+# 来店
+create_visit = _async(crud.create_visit)
+update_visit = _async(crud.update_visit)
+delete_visit = _async(crud.delete_visit)
+get_visits_by_customer = _async(crud.get_visits_by_customer)
+get_today_visit_count = _async(crud.get_today_visit_count)
+
+# フォローメール
+get_mail_targets = _async(crud.get_mail_targets)
+get_upcoming_birthday_targets = _async(crud.get_upcoming_birthday_targets)
+get_purchase_follow_targets = _async(crud.get_purchase_follow_targets)
+mark_purchase_follow_sent_bulk = _async(crud.mark_purchase_follow_sent_bulk)
+
+# セグメント
+preview_segment = _async(segments.preview)
+
+# フォロー周期ルール
+list_follow_rules = _async(follow_rules.list_rules)
+upsert_follow_rule = _async(follow_rules.upsert_rule)
+delete_follow_rule = _async(follow_rules.delete_rule)
+
+# ダッシュボード
+get_inactive_customers_by_segment = _async(crud.get_inactive_customers_by_segment)
+get_monthly_new_customer_count = _async(crud.get_monthly_new_customer_count)
+get_dashboard_summary = _async(dashboard.get_summary)
+get_timeseries = _async(rollups.timeseries)
+
+# 一斉メール
+enqueue_email_job = _async(_enqueue_job)
+get_email_job = _async(crud.get_email_job)
+get_email_recipients = _async(crud.get_email_recipients)
@@ -0,0 +1,101 @@
+# app/dashboard.py
+# ダッシュボード上部のサマリー（本日の来店数・今月の新規・カテゴリごとの来店なし顧客）をまとめて集計する
+#
+# - 全ウィジェット分を2クエリで集計し、結果をプロセス内に DASHBOARD_CACHE_TTL 秒キャッシュする
+#   （複数の端末がポーリングしても、TTL の間は集計1回分で済む）
+# - 顧客・来店の登録/更新/削除（crud・一括取り込み）で invalidate して、次のリクエストで集計し直す
+# - フォロー周期ルールの変更は TTL が切れたときに反映される
+import os
+from datetime import date, datetime
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from . import follow_rules, models, segments
+from .cache import TTLCache
+
+DASHBOARD_CACHE_TTL = float(os.getenv("DASHBOARD_CACHE_TTL", "5"))
+INACTIVE_PREVIEW = 5  # カテゴリごとに返す来店なし顧客の人数（来店が空いている順）
+
+_cache = TTLCache(ttl=DASHBOARD_CACHE_TTL, maxsize=2)  # キーは日付（日付が変わったら別の集計）
+# invalidate のたびに進める。集計中に書き込みがあった結果はキャッシュしない
+_generation = 0
+
+LP = models.CustomerLastPurchase
+
+
+def get_cached() -> dict | None:
+    return _cache.get(date.today())
+
+
+def get_summary(db: Session) -> dict:
+    summary = get_cached()
+    if summary is None:
+        started = _generation
+        summary = summarize(db)
+        if started == _generation:
+            _cache.set(summary["date"], summary)
+    return summary
+
+
+def invalidate() -> None:
+    global _generation
+    _generation += 1
+    _cache.clear()
+
+
+def summarize(db: Session) -> dict:
+    today = date.today()
+    first_day = date(today.year, today.month, 1)
+
+    # 1) 本日の来店数・今月の新規（1行で）
+    today_visits, monthly_new = db.execute(
+        select(
+            select(func.count(models.Visit.id))
+            .where(models.Visit.visit_date == today)
+            .scalar_subquery(),
+            select(func.count(models.Customer.id))
+            .where(models.Customer.created_at >= first_day)
+            .scalar_subquery(),
+        )
+    ).one()
+
+    # 2) カテゴリごとの来店なし顧客: 人数（count over）と、来店が空いている順の先頭 INACTIVE_PREVIEW 人
+    thresholds = follow_rules.get_rules(db).by_category
+    inactive = {
+        segment: {"segment": segment, "threshold_days": days, "count": 0, "customers": []}
+        for segment, days in sorted(thresholds.items())
+    }
+    if thresholds:
+        lapsed = segments.build_lapsed([
+            or_(*[segments.category_lapsed(segment, days, today) for segment, days in thresholds.items()]),
+            segments.opted_in(),
+        ])
+        ranked = lapsed.add_columns(
+            func.count().over(partition_by=LP.category).label("total"),
+            func.row_number()
+            .over(partition_by=LP.category, order_by=(LP.last_purchase_date.asc(), models.Customer.id.asc()))
+            .label("rn"),
+        ).subquery()
+        rows = db.execute(
+            select(ranked).where(ranked.c.rn <= INACTIVE_PREVIEW).order_by(ranked.c.segment, ranked.c.rn)
+        ).all()
+        for r in rows:
+            widget = inactive[r.segment]
+            widget["count"] = r.total
+            widget["customers"].append({
+                "customer_id": r.customer_id,
+                "name": r.name,
+                "email": r.email,
+                "last_visit_date": r.last_visit_date,
+                "days_since": (today - r.last_visit_date).days,
+                "segment": r.segment,
+            })
+
+    return {
+        "date": today,
+        "today_visit_count": today_visits or 0,
+        "monthly_new_customer_count": monthly_new or 0,
+        "inactive": list(inactive.values()),
+        "generated_at": datetime.now(),
+    }
@@ -0,0 +1,155 @@
+# app/export.py
+# 顧客・来店の全件エクスポート（CSV / NDJSON）
+#
+# - 行は yield_per でサーバー側カーソルから少しずつ読み、文字列にしてすぐ返す（全件をメモリに載せない）
+# - 出力はある程度まとめて（FLUSH_BYTES ごとに）返す。gzip 指定時は圧縮しながら返す
+# - 来店の CSV は visit_import の CSV と同じ列（visit_ref = 来店ID）なので、別の環境（移行先・検証用）にはそのまま取り込める。
+#   visit_import の visit_ref は行を来店にまとめるためのキーで、既存の来店とは突き合わせない。
+#   同じ DB に取り込み直すと来店が重複する（差分を戻すなら date_from / date_to で絞った分だけを別の DB に）
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from itertools import groupby
+from typing import Any, Iterable, Iterator
+
+from sqlalchemy import select
+
+from . import models
+
+# DB から1回に読む行数
+YIELD_PER = 1000
+# この大きさ（バイト）たまったらクライアントへ送る
+FLUSH_BYTES = 64 * 1024
+
+CUSTOMER_COLUMNS = (
+    "id", "name", "kana", "phone", "email", "email_opt_in",
+    "birthday", "note", "last_visit_date", "created_at",
+)
+VISIT_COLUMNS = (
+    "visit_ref", "customer_id", "visit_date", "memo", "staff_id",
+    "category", "product_name", "note", "follow_due_date", "follow_sent_at", "visit_item_id",
+)
+
+
+def _json_default(value: Any):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+# =======================
+# 行の読み出し（dict を1行ずつ返す）
+# =======================
+def iter_customer_rows(db) -> Iterator[dict]:
+    C = models.Customer
+    result = db.execute(
+        select(*(getattr(C, c) for c in CUSTOMER_COLUMNS))
+        .order_by(C.id)
+        .execution_options(yield_per=YIELD_PER)
+    )
+    for row in result.mappings():
+        yield dict(row)
+
+
+def iter_visit_rows(db, date_from: date | None = None, date_to: date | None = None) -> Iterator[dict]:
+    # 1行 = 1明細（明細なしの来店は category 等が空の1行）。来店ID → 明細ID 順
+    V, VI = models.Visit, models.VisitItem
+    stmt = (
+        select(
+            V.id.label("visit_ref"),
+            V.customer_id,
+            V.visit_date,
+            V.memo,
+            V.staff_id,
+            VI.category,
+            VI.product_name,
+            VI.note,
+            VI.follow_due_date,
+            VI.follow_sent_at,
+            VI.id.label("visit_item_id"),
+        )
+        .outerjoin(VI, VI.visit_id == V.id)
+        .order_by(V.id, VI.id)
+    )
+    if date_from:
+        stmt = stmt.where(V.visit_date >= date_from)
+    if date_to:
+        stmt = stmt.where(V.visit_date <= date_to)
+
+    for row in db.execute(stmt.execution_options(yield_per=YIELD_PER)).mappings():
+        yield dict(row)
+
+
+# =======================
+# 書き出し（文字列のかたまりを返す）
+# =======================
+def _buffered(pieces: Iterable[str]) -> Iterator[bytes]:
+    buf, size = [], 0
+    for piece in pieces:
+        buf.append(piece)
+        size += len(piece)
+        if size >= FLUSH_BYTES:
+            yield "".join(buf).encode("utf-8")
+            buf, size = [], 0
+    if buf:
+        yield "".join(buf).encode("utf-8")
+
+
+def to_csv(rows: Iterable[dict], columns: tuple[str, ...]) -> Iterator[bytes]:
+    # Excel で文字化けしないように BOM を付ける
+    def lines():
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator="\n")
+        yield "\ufeff"
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow(["" if row[c] is None else row[c] for c in columns])
+            yield out.getvalue()
+            out.seek(0)
+            out.truncate()
+        yield out.getvalue()
+
+    return _buffered(lines())
+
+
+def to_ndjson(records: Iterable[dict]) -> Iterator[bytes]:
+    return _buffered(
+        json.dumps(r, ensure_ascii=False, default=_json_default) + "\n" for r in records
+    )
+
+
+def group_visits(rows: Iterable[dict]) -> Iterator[dict]:
+    """明細ごとの行を来店ごとにまとめる（VisitCreate と同じ形 + id / follow 情報）"""
+    for visit_id, group in groupby(rows, key=lambda r: r["visit_ref"]):
+        group = list(group)
+        first = group[0]
+        yield {
+            "id": visit_id,
+            "customer_id": first["customer_id"],
+            "visit_date": first["visit_date"],
+            "memo": first["memo"],
+            "staff_id": first["staff_id"],
+            "items": [
+                {
+                    "id": r["visit_item_id"],
+                    "category": r["category"],
+                    "product_name": r["product_name"],
+                    "note": r["note"],
+                    "follow_due_date": r["follow_due_date"],
+                    "follow_sent_at": r["follow_sent_at"],
+                }
+                for r in group
+                if r["visit_item_id"] is not None
+            ],
+        }
+
+
+def gzip_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    comp = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # gzip 形式
+    for chunk in chunks:
+        data = comp.compress(chunk)
+        if data:
+            yield data
+    yield comp.flush()
@@ -0,0 +1,180 @@
+# app/follow_rules.py
+# フォロー周期ルール（models.FollowRule）の読み込み・キャッシュ・期限の再計算
+#
+# - ルールは全件まとめて読み、プロセス内にキャッシュする（ルール変更時に invalidate。他プロセス向けに TTL も付ける）
+# - ルールを変えたら recompute_due_dates で、未送信の VisitItem.follow_due_date を明細IDの範囲ごとに SQL の UPDATE 1文で作り直す
+from dataclasses import dataclass
+from datetime import timedelta
+
+from sqlalchemy import String, bindparam, cast, func, literal, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from . import models
+from .cache import TTLCache
+
+# テーブルが空のときに入れる初期値（以前 crud.py にハードコードしていた値）
+DEFAULT_FOLLOW_DAYS = {"skincare": 90, "makeup": 120}
+
+_cache = TTLCache(ttl=60, maxsize=1)
+_CACHE_KEY = "rules"
+
+
+@dataclass(frozen=True)
+class FollowRules:
+    by_category: dict[str, int]
+    by_product: dict[tuple[str, str], int]
+
+    def categories(self) -> list[str]:
+        return sorted(self.by_category)
+
+    def category_days(self, category: str) -> int | None:
+        return self.by_category.get(category)
+
+    def days_for(self, category: str, product_name: str | None = None) -> int | None:
+        """商品ルール → カテゴリルールの順に探す（どちらも無ければ None = フォローなし）"""
+        if product_name:
+            days = self.by_product.get((category, product_name))
+            if days is not None:
+                return days
+        return self.by_category.get(category)
+
+    def due_date(self, visit_date, category: str, product_name: str | None = None):
+        # 未知カテゴリは0日（フォローなし扱い。以前の FOLLOW_DAYS.get(cat, 0) と同じ）
+        return visit_date + timedelta(days=self.days_for(category, product_name) or 0)
+
+
+def get_rules(db: Session) -> FollowRules:
+    return _cache.get_or_set(_CACHE_KEY, lambda: _load(db))
+
+
+def invalidate() -> None:
+    _cache.clear()
+
+
+def _load(db: Session) -> FollowRules:
+    by_category, by_product = {}, {}
+    for r in db.query(models.FollowRule).all():
+        if r.product_name:
+            by_product[(r.category, r.product_name)] = r.cycle_days
+        else:
+            by_category[r.category] = r.cycle_days
+    return FollowRules(by_category, by_product)
+
+
+def seed_defaults(db: Session) -> None:
+    if db.query(models.FollowRule.id).first() is None:
+        db.add_all(models.FollowRule(category=c, cycle_days=d) for c, d in DEFAULT_FOLLOW_DAYS.items())
+        db.commit()
+        invalidate()
+
+
+# =======================
+# ルールの登録・削除
+# =======================
+def list_rules(db: Session) -> list[models.FollowRule]:
+    return (
+        db.query(models.FollowRule)
+        .order_by(models.FollowRule.category, models.FollowRule.product_name)
+        .all()
+    )
+
+
+# ON CONFLICT を書ける INSERT（方言ごと）
+_UPSERT = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def upsert_rule(db: Session, category: str, product_name: str | None, cycle_days: int) -> models.FollowRule:
+    # 同じ (category, product_name) のルールが同時に登録されても1件になるよう、一意インデックスに ON CONFLICT で書く
+    R = models.FollowRule
+    product_name = product_name or None
+    ins = _UPSERT[db.get_bind().dialect.name](R).values(
+        category=category, product_name=product_name, cycle_days=cycle_days
+    )
+    set_ = {"cycle_days": ins.excluded.cycle_days, "updated_at": func.now()}
+    if product_name is None:
+        ins = ins.on_conflict_do_update(index_elements=[R.category], index_where=R.product_name.is_(None), set_=set_)
+    else:
+        ins = ins.on_conflict_do_update(index_elements=[R.category, R.product_name], set_=set_)
+    db.execute(ins)
+    db.commit()
+    invalidate()
+
+    query = db.query(R).filter(R.category == category)
+    if product_name is None:
+        return query.filter(R.product_name.is_(None)).one()
+    return query.filter(R.product_name == product_name).one()
+
+
+def delete_rule(db: Session, rule_id: int) -> models.FollowRule | None:
+    rule = db.get(models.FollowRule, rule_id)
+    if rule is None:
+        return None
+    db.delete(rule)
+    db.commit()
+    invalidate()
+    return rule
+
+
+# =======================
+# フォロー期限の再計算（バックグラウンドで実行）
+# =======================
+def _add_days(dialect: str, day, days):
+    # 日付 + 日数（SQLite は date(day, '+N days')、PostgreSQL は date + integer）
+    if dialect == "sqlite":
+        return func.date(day, literal("+") + cast(days, String) + literal(" days"))
+    return day + days
+
+
+def _due_date_expr(dialect: str):
+    """明細1行の follow_due_date を SQL で計算する式（FollowRules.due_date と同じ規則）
+
+    商品ルール → カテゴリルール → どちらも無ければ0日。ルールは一意インデックスで各1件なので
+    相関サブクエリは1行しか返さない
+    """
+    VI, V, R = models.VisitItem, models.Visit, models.FollowRule
+    product_days = (
+        select(R.cycle_days).where(R.category == VI.category, R.product_name == VI.product_name).scalar_subquery()
+    )
+    category_days = (
+        select(R.cycle_days).where(R.category == VI.category, R.product_name.is_(None)).scalar_subquery()
+    )
+    visit_date = select(V.visit_date).where(V.id == VI.visit_id).scalar_subquery()
+    return _add_days(dialect, visit_date, func.coalesce(product_days, category_days, 0))
+
+
+def recompute_due_dates(
+    session_factory,
+    category: str,
+    product_name: str | None = None,
+    chunk_size: int = 5000,
+) -> int:
+    """ルール変更の影響を受ける未送信の明細の follow_due_date を作り直す。更新件数を返す
+
+    明細ID chunk_size 件分の範囲ごとに UPDATE を1文実行 → commit（期限は来店日 + 周期を SQL の中で計算し、
+    値が変わる行だけ書く）。明細を Python に読み込まず、1回のトランザクションも短くして visit_items を長くロックしない
+    """
+    VI = models.VisitItem
+
+    updated = 0
+    with session_factory() as db:
+        max_id = db.execute(select(func.max(VI.id))).scalar() or 0
+        due = _due_date_expr(db.get_bind().dialect.name)
+        conds = [
+            VI.category == category,
+            VI.follow_sent_at.is_(None),
+            VI.id > bindparam("_lo"),
+            VI.id <= bindparam("_hi"),
+            VI.follow_due_date.is_distinct_from(due),
+        ]
+        if product_name:
+            conds.append(VI.product_name == product_name)
+        stmt = update(VI.__table__).where(*conds).values(follow_due_date=due)
+
+        # 範囲ごとに実行時のルールを読み直すので、実行中にルールがさらに変わっても残りの範囲には最新が使われる
+        for lo in range(0, max_id, chunk_size):
+            result = db.connection().execute(stmt, {"_lo": lo, "_hi": lo + chunk_size})
+            db.commit()
+            updated += result.rowcount
+
+    return updated
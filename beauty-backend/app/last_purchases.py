@@ -0,0 +1,122 @@
+# app/last_purchases.py
+# 顧客×カテゴリの最終購入サマリー（models.CustomerLastPurchase）の更新処理
+#
+# - 来店の登録・更新・削除: refresh_customer でその顧客の該当カテゴリだけ作り直す
+# - 顧客削除: delete_customer でその顧客の行を消す
+# - 来店の一括取り込み: refresh_customers で取り込んだ顧客の分だけまとめて作り直す
+# - 既存データの取り込み: rebuild で全件作り直す（python -m app.cli rebuild-last-purchases）
+#
+# 作り直しは「対象の行を消す → INSERT ... ON CONFLICT DO UPDATE」。同じ顧客の来店を2つのトランザクションが
+# 同時に書いても（Postgres の READ COMMITTED で、相手が入れた行が DELETE から見えなくても）一意制約違反にならない
+from typing import Iterable
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from . import models
+
+LP = models.CustomerLastPurchase
+
+
+def _latest_items_select(*conditions):
+    # 顧客×カテゴリごとに「来店日が一番新しい明細」（同日なら明細IDが大きい方）を1行選ぶ
+    ranked = (
+        select(
+            models.Visit.customer_id.label("customer_id"),
+            models.VisitItem.category.label("category"),
+            models.Visit.visit_date.label("visit_date"),
+            models.VisitItem.id.label("visit_item_id"),
+            func.row_number()
+            .over(
+                partition_by=(models.Visit.customer_id, models.VisitItem.category),
+                order_by=(models.Visit.visit_date.desc(), models.VisitItem.id.desc()),
+            )
+            .label("rn"),
+        )
+        .join(models.Visit, models.Visit.id == models.VisitItem.visit_id)
+        .where(*conditions)
+        .subquery()
+    )
+    return select(
+        ranked.c.customer_id,
+        ranked.c.category,
+        ranked.c.visit_date,
+        ranked.c.visit_item_id,
+    ).where(ranked.c.rn == 1)
+
+
+# ON CONFLICT を書ける INSERT（方言ごと）
+_UPSERT = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def _insert_from(db: Session, select_stmt):
+    ins = _UPSERT[db.get_bind().dialect.name](LP).from_select(
+        ["customer_id", "category", "last_purchase_date", "last_visit_item_id"],
+        select_stmt,
+    )
+    return ins.on_conflict_do_update(
+        index_elements=[LP.customer_id, LP.category],
+        set_={
+            "last_purchase_date": ins.excluded.last_purchase_date,
+            "last_visit_item_id": ins.excluded.last_visit_item_id,
+        },
+    )
+
+
+def refresh_customer(db: Session, customer_id: int, categories: Iterable[str] | None = None) -> None:
+    """1人分（指定カテゴリのみ）を作り直す。呼び出し側で flush 済み・commit は呼び出し側"""
+    cats = None if categories is None else sorted(set(categories))
+    if cats == []:
+        return
+
+    del_stmt = delete(LP).where(LP.customer_id == customer_id)
+    conds = [models.Visit.customer_id == customer_id]
+    if cats is not None:
+        del_stmt = del_stmt.where(LP.category.in_(cats))
+        conds.append(models.VisitItem.category.in_(cats))
+
+    db.execute(del_stmt)
+    db.execute(_insert_from(db, _latest_items_select(*conds)))
+
+
+def refresh_customers(db: Session, customer_ids: Iterable[int]) -> None:
+    """複数人分（全カテゴリ）をまとめて作り直す。commit は呼び出し側"""
+    ids = sorted(set(customer_ids))
+    if not ids:
+        return
+    db.execute(delete(LP).where(LP.customer_id.in_(ids)))
+    db.execute(_insert_from(db, _latest_items_select(models.Visit.customer_id.in_(ids))))
+
+
+def delete_customer(db: Session, customer_id: int) -> None:
+    db.execute(delete(LP).where(LP.customer_id == customer_id))
+
+
+def rebuild(db: Session, chunk_size: int = 10000) -> int:
+    """全件作り直す（1トランザクション。途中で失敗しても元のサマリーが残る）。作った行数を返す
+
+    INSERT は顧客IDの範囲ごとに分けて、1文が大きくなりすぎないようにする
+    """
+    try:
+        db.execute(delete(LP))
+        max_id = db.query(func.max(models.Customer.id)).scalar() or 0
+        for start in range(0, max_id + 1, chunk_size):
+            db.execute(_insert_from(db, _latest_items_select(
+                models.Visit.customer_id >= start,
+                models.Visit.customer_id < start + chunk_size,
+            )))
+        count = db.query(func.count()).select_from(LP).scalar() or 0
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return count
+
+
+def ensure_populated(db: Session) -> None:
+    # サマリーテーブルを後から追加した既存DB向け：空なのに明細があれば1回だけ作る
+    has_summary = db.query(LP.customer_id).first() is not None
+    has_items = db.query(models.VisitItem.id).first() is not None
+    if has_items and not has_summary:
+        rebuild(db)
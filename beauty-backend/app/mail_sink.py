@@ -0,0 +1,115 @@
+# app/mail_sink.py
+# ローカル用の SMTP 受信サーバー（受け取ったメールをメモリに貯めるだけ。外には送らない）
+# 一斉送信の動作確認・ベンチマーク用。SMTP_HOST=127.0.0.1 / SMTP_PORT=<port> / SMTP_STARTTLS=0 で使う
+#
+#   python -m app.mail_sink --port 1025
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ReceivedMail:
+    mail_from: str
+    rcpt_to: list[str]
+    data: bytes
+
+
+@dataclass
+class LocalSMTPSink:
+    host: str = "127.0.0.1"
+    port: int = 0  # 0 なら空いているポート（start 後に self.port に入る）
+    messages: list[ReceivedMail] = field(default_factory=list)
+    verbose: bool = False
+    # 宛先ごとに、あと何回 RCPT を 550 で断るか（-1 ならずっと断る）。再送・失敗の動作確認用
+    refuse: dict[str, int] = field(default_factory=dict)
+
+    async def start(self) -> "LocalSMTPSink":
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        def reply(line: str) -> None:
+            writer.write(line.encode() + b"\r\n")
+
+        mail_from, rcpt_to = "", []
+        reply("220 localhost ESMTP beauty-crm sink")
+        try:
+            while True:
+                await writer.drain()
+                line = await reader.readline()
+                if not line:
+                    break
+                cmd = line.decode("utf-8", "replace").strip()
+                verb = cmd[:4].upper()
+
+                if verb == "EHLO":
+                    reply("250-localhost")
+                    reply("250-PIPELINING")
+                    reply("250-8BITMIME")
+                    reply("250 SMTPUTF8")
+                elif verb == "HELO":
+                    reply("250 localhost")
+                elif verb == "MAIL":
+                    mail_from, rcpt_to = cmd[10:].strip(), []
+                    reply("250 OK")
+                elif verb == "RCPT":
+                    rcpt = cmd[8:].strip()
+                    if self._refused(rcpt.strip("<>")):
+                        reply("550 Mailbox unavailable")
+                    else:
+                        rcpt_to.append(rcpt)
+                        reply("250 OK")
+                elif verb == "DATA":
+                    reply("354 End data with <CR><LF>.<CR><LF>")
+                    await writer.drain()
+                    lines = []
+                    while True:
+                        data_line = await reader.readline()
+                        if data_line in (b".\r\n", b".\n", b""):
+                            break
+                        if data_line.startswith(b".."):
+                            data_line = data_line[1:]
+                        lines.append(data_line)
+                    self.messages.append(ReceivedMail(mail_from, rcpt_to, b"".join(lines)))
+                    if self.verbose:
+                        print(f"received: from={mail_from} to={rcpt_to}")
+                    reply("250 OK: queued")
+                elif verb == "RSET":
+                    mail_from, rcpt_to = "", []
+                    reply("250 OK")
+                elif verb == "NOOP":
+                    reply("250 OK")
+                elif verb == "QUIT":
+                    reply("221 Bye")
+                    await writer.drain()
+                    break
+                else:
+                    reply("502 Command not implemented")
+        finally:
+            writer.close()
+
+    def _refused(self, address: str) -> bool:
+        left = self.refuse.get(address, 0)
+        if left > 0:
+            self.refuse[address] = left - 1
+        return left != 0
+
+
+async def _serve(host: str, port: int) -> None:
+    sink = await LocalSMTPSink(host=host, port=port, verbose=True).start()
+    print(f"SMTP sink listening on {sink.host}:{sink.port}")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1025)
+    args = parser.parse_args()
+    asyncio.run(_serve(args.host, args.port))
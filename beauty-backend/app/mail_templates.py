@@ -0,0 +1,92 @@
+# app/mail_templates.py
+# 一斉メールの差し込みテンプレート
+#
+#   件名: {{name}}様、お久しぶりです
+#   本文: 前回ご購入の {{product_name}}（{{last_purchase_date}}）はいかがですか？
+#
+# テンプレートはジョブごとに1回だけ compile（文字列の分解と差し込み項目のチェック）して、
+# 宛先ごとの render は「部品をつなぐだけ」にする
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Iterable, Iterator, Mapping
+
+# 差し込みできる項目（MailTarget / InactiveCustomerTarget の項目名に合わせる）
+FIELDS = {
+    "name",                # 顧客名
+    "email",
+    "birthday",
+    "last_visit_date",     # 最終来店日
+    "days_since",          # 最終来店（segment 指定時はそのカテゴリの最終購入）からの日数
+    "segment",             # カテゴリ（skincare / makeup）
+    "product_name",        # segment カテゴリで最後に買った商品
+    "last_purchase_date",  # segment カテゴリの最終購入日
+}
+# 別名（MailTarget は latest_visit_date という名前なので両方使えるようにする）
+ALIASES = {
+    "latest_visit_date": "last_visit_date",
+    "product": "product_name",
+}
+
+_PLACEHOLDER = re.compile(r"\{\{\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*\}\}")
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    # 偶数番目 = そのままの文字列、奇数番目 = 差し込み項目名
+    parts: tuple[str, ...]
+
+    @property
+    def fields(self) -> set[str]:
+        return set(self.parts[1::2])
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        parts = self.parts
+        out = [parts[0]]
+        for i in range(1, len(parts), 2):
+            out.append(_format(values.get(parts[i])))
+            out.append(parts[i + 1])
+        return "".join(out)
+
+
+def compile_template(src: str) -> CompiledTemplate:
+    """{{項目}} を分解する。知らない項目があれば ValueError（送信前に気づけるように）"""
+    pieces = _PLACEHOLDER.split(src)
+    unknown = []
+    for i in range(1, len(pieces), 2):
+        name = ALIASES.get(pieces[i], pieces[i])
+        if name not in FIELDS:
+            unknown.append(pieces[i])
+        pieces[i] = name
+    if unknown:
+        raise ValueError(f"テンプレートに使えない項目があります: {', '.join(sorted(set(unknown)))}")
+    return CompiledTemplate(tuple(pieces))
+
+
+def _format(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return value.strftime("%Y/%m/%d")
+    return str(value)
+
+
+def render_messages(
+    subject: CompiledTemplate,
+    body: CompiledTemplate,
+    recipients: Iterable[Mapping[str, Any]],
+) -> Iterator[tuple[Mapping[str, Any], str, str]]:
+    """宛先を1件ずつ差し込んで (宛先, 件名, 本文) を返すジェネレーター（まとめてリストにしない）"""
+    for r in recipients:
+        yield r, subject.render(r), body.render(r)
+
+
+def recipient_values(row: Mapping[str, Any], segment: str | None, today: date) -> dict[str, Any]:
+    """DB から取った1行を差し込み用の値にする（days_since はここで計算）"""
+    values = dict(row)
+    values["segment"] = segment
+    base = values.get("last_purchase_date") if segment else values.get("last_visit_date")
+    values["days_since"] = (today - base).days if base else None
+    return values
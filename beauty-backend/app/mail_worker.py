@@ -0,0 +1,450 @@
+# app/mail_worker.py
+# 一斉メールの送信パイプライン
+#
+# 1) API（POST /emails/bulk）: enqueue_job でジョブと宛先（outbox）を DB に書いて、すぐ job_id を返す
+# 2) MailWorker（アプリ起動時に開始するバックグラウンドタスク）:
+#    未処理のジョブを取り、outbox を batch_size 件ずつ sending にして（取り出して）から送信する
+#    - 件名・本文のテンプレートはジョブごとに1回 compile、差し込み値はバッチごとに1クエリでまとめて取る
+#    - 同時送信数は MAIL_CONCURRENCY、送信レートは MAIL_RATE_PER_SEC で制限
+#    - 宛先ごとの結果（sent / failed / 試行回数 / エラー）を outbox に記録
+#      SMTP 未設定（ConsoleBackend）のときは sent ではなく logged（コンソールに出しただけ）
+#    - DB アクセスはスレッドに逃がすので、送信中もイベントループ（他のリクエスト）は止まらない
+#    - ジョブのリース（locked_until）は各送信の直前とバッチを取り出すときに延長する。
+#      延長は locked_until が自分の設定した値のままのときだけ成功するので、リース切れで他のワーカーに
+#      引き継がれたら（LeaseLost）そこで送信をやめる。引き継いだ側は sending のまま残った宛先を
+#      送れたか分からないものとして failed にする（再送しない = 二重送信しない）
+import asyncio
+import logging
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import and_, bindparam, case, insert, literal, or_, select, update
+from sqlalchemy.orm import Session
+
+from . import models
+from .database import SessionLocal
+from .mail_templates import compile_template, recipient_values, render_messages
+from .mailer import MailSettings, RateLimiter, build_message, create_backend
+
+logger = logging.getLogger(__name__)
+
+# ジョブのリース時間（この間に更新が無ければ、他のワーカーが引き継げる）
+LEASE = timedelta(minutes=5)
+
+# 送信の直前に、前回の延長からこれだけ経っていたらリースを延長する（1通ごとには DB を書かない）
+# レート制限で1バッチに何分かかっても、リースが切れる前に延長される
+LEASE_RENEW_AFTER = timedelta(minutes=1)
+
+# 引き継いだジョブで sending のまま残っていた宛先に記録するエラー
+INTERRUPTED_ERROR = "送信中にワーカーが止まったため、送信済みか不明（二重送信を避けて再送しない）"
+
+# 新しいジョブが無いか確認する間隔（notify されたらすぐ起きる）
+POLL_INTERVAL_SEC = 30
+
+Job = models.EmailJob
+Outbox = models.EmailOutbox
+
+
+class LeaseLost(Exception):
+    """ジョブのリースが切れて、他のワーカーに引き継がれた"""
+
+
+class _Lease:
+    """ワーカーが持っている1ジョブ分のリース（until は自分が最後に書いた locked_until）"""
+
+    def __init__(self, job_id: int, until: datetime):
+        self.job_id = job_id
+        self.lost = False
+        self.lock = asyncio.Lock()
+        self.update(until)
+
+    def update(self, until: datetime) -> None:
+        self.until = until
+        self._renewed = time.monotonic()
+
+    def due(self) -> bool:
+        return time.monotonic() - self._renewed >= LEASE_RENEW_AFTER.total_seconds()
+
+
+# =======================
+# ジョブ登録（API から呼ぶ）
+# =======================
+def enqueue_job(
+    db: Session,
+    subject: str,
+    body: str,
+    customer_ids: list[int],
+    requested_by: str | None = None,
+    segment: str | None = None,
+    chunk_size: int = 500,
+) -> models.EmailJob:
+    """ジョブと宛先を登録する（メールなし・配信停止の顧客はここで除外）
+
+    テンプレートに使えない差し込み項目があれば ValueError
+    """
+    compile_template(subject)
+    compile_template(body)
+
+    job = Job(subject=subject, body=body, segment=segment, requested_by=requested_by, status="queued")
+    db.add(job)
+    db.flush()
+
+    ids = list(dict.fromkeys(customer_ids))  # 重複を除く（順序は保つ）
+    for start in range(0, len(ids), chunk_size):
+        chunk = ids[start:start + chunk_size]
+        db.execute(
+            insert(Outbox).from_select(
+                ["job_id", "customer_id", "email", "status", "attempts"],
+                select(
+                    literal(job.id),
+                    models.Customer.id,
+                    models.Customer.email,
+                    literal("pending"),
+                    literal(0),
+                ).where(
+                    models.Customer.id.in_(chunk),
+                    models.Customer.email.isnot(None),
+                    models.Customer.email_opt_in.is_(True),
+                ),
+            )
+        )
+
+    job.total_count = db.query(Outbox).filter(Outbox.job_id == job.id).count()
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+# =======================
+# ワーカー
+# =======================
+class MailWorker:
+    def __init__(self, session_factory=SessionLocal, settings: MailSettings | None = None, backend=None):
+        self.session_factory = session_factory
+        self.settings = settings or MailSettings.from_env()
+        self.backend = backend
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    # ---- アプリの起動・停止 ----
+    def start(self) -> None:
+        if self.backend is None:
+            self.backend = create_backend(self.settings)
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.backend is not None:
+            await self.backend.close()
+
+    def notify(self) -> None:
+        """新しいジョブを登録したら呼ぶ（ワーカーがすぐ処理を始める）"""
+        self._wakeup.set()
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                while (claimed := await asyncio.to_thread(self._claim_next_job)) is not None:
+                    await self.run_job(*claimed)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("mail worker failed; retrying later")
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=POLL_INTERVAL_SEC)
+            except asyncio.TimeoutError:
+                pass
+
+    # ---- 1ジョブ分の送信 ----
+    async def run_job(self, job_id: int, locked_until: datetime | None = None) -> None:
+        """未送信の宛先を batch_size 件ずつ取り出して送る（メモリに載るのは1バッチ分だけ）
+
+        locked_until は _claim_next_job で取ったリース。None ならここでジョブを取る（他のワーカーが処理中なら何もしない）
+        """
+        s = self.settings
+        if self.backend is None:
+            self.backend = create_backend(s)
+        if locked_until is None:
+            locked_until = await asyncio.to_thread(self._claim_job, job_id)
+            if locked_until is None:
+                return
+        lease = _Lease(job_id, locked_until)
+
+        subject_src, body_src, segment = await asyncio.to_thread(self._load_job, job_id)
+        subject_tpl = compile_template(subject_src)
+        body_tpl = compile_template(body_src)
+        sem = asyncio.Semaphore(s.concurrency)
+        limiter = RateLimiter(s.rate_per_sec)
+
+        async def send_one(outbox_id: int, email: str, subject: str, body: str):
+            # 送らなかった（リースを失った）ときは None
+            async with sem:
+                await limiter.acquire()
+                try:
+                    await self._keep_lease(lease)  # レート制限で待った後、送る直前に延長
+                except LeaseLost:
+                    return None
+                try:
+                    await self.backend.send(build_message(s, email, subject, body))
+                    return outbox_id, None
+                except Exception as e:
+                    return outbox_id, f"{type(e).__name__}: {e}"[:500]
+
+        # 失敗した宛先は次の周回で再送（max_attempts 回まで）
+        try:
+            for _ in range(s.max_attempts):
+                last_id = 0
+                processed = 0
+                while batch := await self._claim_batch_async(lease, last_id, segment):
+                    today = date.today()
+                    rendered = render_messages(
+                        subject_tpl, body_tpl, (recipient_values(r, segment, today) for r in batch)
+                    )
+                    results = await asyncio.gather(*(
+                        send_one(r["outbox_id"], r["email"], subj, body) for r, subj, body in rendered
+                    ))
+                    done = [r for r in results if r is not None]
+                    unsent = [b["outbox_id"] for b, r in zip(batch, results) if r is None]
+                    await asyncio.to_thread(self._record_results, job_id, done, unsent)
+                    if lease.lost:
+                        raise LeaseLost()
+                    last_id = batch[-1]["outbox_id"]
+                    processed += len(batch)
+                if processed == 0:
+                    break
+            await asyncio.to_thread(self._finish_job, lease.job_id, lease.until)
+        except LeaseLost:
+            logger.warning("mail job %s: lease was taken over by another worker; stopped sending", job_id)
+
+    async def _keep_lease(self, lease: _Lease) -> None:
+        if lease.lost:
+            raise LeaseLost()
+        if not lease.due():
+            return
+        async with lease.lock:  # 同時に送っている他の宛先と重ねて延長しない
+            if lease.lost:
+                raise LeaseLost()
+            if lease.due():
+                try:
+                    lease.update(await asyncio.to_thread(self._renew_lease, lease.job_id, lease.until))
+                except LeaseLost:
+                    lease.lost = True
+                    raise
+
+    async def _claim_batch_async(self, lease: _Lease, last_id: int, segment: str | None) -> list[dict]:
+        async with lease.lock:
+            until, batch = await asyncio.to_thread(self._claim_batch, lease.job_id, lease.until, last_id, segment)
+            lease.update(until)
+            return batch
+
+    # ---- DB 操作（スレッドで実行） ----
+    def _claim_next_job(self) -> tuple[int, datetime] | None:
+        # queued のジョブ、または処理中のまま止まった（リース切れの）ジョブを1件取る。(ジョブID, リース期限) を返す
+        now = datetime.utcnow()
+        with self.session_factory() as db:
+            candidates = db.execute(
+                select(Job.id)
+                .where(
+                    Job.status.in_(("queued", "running")),
+                    or_(Job.locked_until.is_(None), Job.locked_until < now),
+                )
+                .order_by(Job.id)
+                .limit(5)
+            ).scalars().all()
+
+        for job_id in candidates:
+            locked_until = self._claim_job(job_id)
+            if locked_until is not None:
+                return job_id, locked_until
+        return None
+
+    def _claim_job(self, job_id: int) -> datetime | None:
+        # 条件付き UPDATE で取り合いを防ぐ（他プロセスが先に取ったら rowcount 0 → None）
+        now = datetime.utcnow()
+        locked_until = now + LEASE
+        with self.session_factory() as db:
+            claimed = db.execute(
+                update(Job)
+                .where(
+                    Job.id == job_id,
+                    Job.status.in_(("queued", "running")),
+                    or_(Job.locked_until.is_(None), Job.locked_until < now),
+                )
+                .values(status="running", locked_until=locked_until, started_at=now)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if not claimed:
+                db.rollback()
+                return None
+
+            # 前のワーカーが sending のまま止まった宛先は、送れたかどうか分からないので failed にする
+            interrupted = db.execute(
+                update(Outbox)
+                .where(Outbox.job_id == job_id, Outbox.status == "sending")
+                .values(status="failed", error=INTERRUPTED_ERROR, attempts=Outbox.attempts + 1)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if interrupted:
+                logger.warning("mail job %s: %d recipients were interrupted mid-send; not resending", job_id, interrupted)
+                db.execute(
+                    update(Job)
+                    .where(Job.id == job_id)
+                    .values(failed_count=Job.failed_count + interrupted)
+                    .execution_options(synchronize_session=False)
+                )
+            db.commit()
+        return locked_until
+
+    @staticmethod
+    def _extend_lease(db: Session, job_id: int, locked_until: datetime) -> datetime:
+        # locked_until がこちらの書いた値のままのときだけ延長する（変わっていたら他のワーカーのもの）
+        new_until = datetime.utcnow() + LEASE
+        extended = db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == "running", Job.locked_until == locked_until)
+            .values(locked_until=new_until)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not extended:
+            raise LeaseLost()
+        return new_until
+
+    def _renew_lease(self, job_id: int, locked_until: datetime) -> datetime:
+        with self.session_factory() as db:
+            new_until = self._extend_lease(db, job_id, locked_until)
+            db.commit()
+            return new_until
+
+    def _load_job(self, job_id: int) -> tuple[str, str, str | None]:
+        with self.session_factory() as db:
+            job = db.get(Job, job_id)
+            return job.subject, job.body, job.segment
+
+    def _claim_batch(
+        self, job_id: int, locked_until: datetime, last_id: int, segment: str | None
+    ) -> tuple[datetime, list[dict]]:
+        """未送信の宛先を batch_size 件 sending にして、差し込み値と一緒に返す（リースも延長する）
+
+        リースを他のワーカーに取られていたら何も取り出さずに LeaseLost
+        """
+        C, LP, VI = models.Customer, models.CustomerLastPurchase, models.VisitItem
+        with self.session_factory() as db:
+            new_until = self._extend_lease(db, job_id, locked_until)
+            ids = db.execute(
+                select(Outbox.id)
+                .where(Outbox.job_id == job_id, Outbox.status == "pending", Outbox.id > last_id)
+                .order_by(Outbox.id)
+                .limit(self.settings.batch_size)
+            ).scalars().all()
+            if not ids:
+                db.commit()
+                return new_until, []
+            db.execute(
+                update(Outbox)
+                .where(Outbox.id.in_(ids))
+                .values(status="sending")
+                .execution_options(synchronize_session=False)
+            )
+
+            # 差し込み値を1クエリで取る（顧客・最終購入・その明細を外部結合）
+            rows = db.execute(
+                select(
+                    Outbox.id.label("outbox_id"),
+                    Outbox.email.label("email"),
+                    C.name.label("name"),
+                    C.birthday.label("birthday"),
+                    C.last_visit_date.label("last_visit_date"),
+                    LP.last_purchase_date.label("last_purchase_date"),
+                    VI.product_name.label("product_name"),
+                )
+                .outerjoin(C, C.id == Outbox.customer_id)
+                .outerjoin(LP, and_(LP.customer_id == Outbox.customer_id, LP.category == segment))
+                .outerjoin(VI, VI.id == LP.last_visit_item_id)
+                .where(Outbox.id.in_(ids))
+                .order_by(Outbox.id)
+            ).mappings().all()
+            db.commit()
+            return new_until, [dict(r) for r in rows]
+
+    def _record_results(self, job_id: int, results: list[tuple[int, str | None]], unsent: list[int]) -> None:
+        now = datetime.utcnow()
+        sent = [{"_id": oid} for oid, err in results if err is None]
+        failed = [{"_id": oid, "_error": err} for oid, err in results if err is not None]
+
+        # 実際に届けたときだけ sent（バックエンドが delivered_status を持たなければ sent 扱い）
+        delivered_status = getattr(self.backend, "delivered_status", "sent")
+        delivered = delivered_status == "sent"
+
+        t = Outbox.__table__
+        with self.session_factory() as db:
+            conn = db.connection()
+            if sent:
+                conn.execute(
+                    update(t)
+                    .where(t.c.id == bindparam("_id"))
+                    .values(
+                        status=delivered_status,
+                        sent_at=now if delivered else None,
+                        error=None,
+                        attempts=t.c.attempts + 1,
+                    ),
+                    sent,
+                )
+            if failed:
+                # 試行回数が上限に達したら failed、まだなら pending に戻して次の周回で再送
+                conn.execute(
+                    update(t)
+                    .where(t.c.id == bindparam("_id"), t.c.status == "sending")
+                    .values(
+                        error=bindparam("_error"),
+                        attempts=t.c.attempts + 1,
+                        status=case((t.c.attempts + 1 >= self.settings.max_attempts, "failed"), else_="pending"),
+                    ),
+                    failed,
+                )
+                n_failed = db.query(Outbox).filter(
+                    Outbox.id.in_([f["_id"] for f in failed]), Outbox.status == "failed"
+                ).count()
+            else:
+                n_failed = 0
+            if unsent:
+                # リースを失って送らなかった宛先は pending に戻す（引き継いだ側がまだ failed にしていなければ）
+                conn.execute(
+                    update(t).where(t.c.id.in_(unsent), t.c.status == "sending").values(status="pending")
+                )
+
+            db.execute(
+                update(Job)
+                .where(Job.id == job_id)
+                .values(
+                    sent_count=Job.sent_count + (len(sent) if delivered else 0),
+                    failed_count=Job.failed_count + n_failed,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+
+    def _finish_job(self, job_id: int, locked_until: datetime) -> None:
+        with self.session_factory() as db:
+            finished = db.execute(
+                update(Job)
+                .where(Job.id == job_id, Job.locked_until == locked_until)
+                .values(status="done", finished_at=datetime.utcnow(), locked_until=None)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if not finished:
+                raise LeaseLost()
+            db.commit()
+
+
+# アプリ全体で使うワーカー（main.py の lifespan で start / stop）
+worker = MailWorker()
@@ -0,0 +1,157 @@
+# app/mailer.py
+# メール送信の実装（送信先の切り替えは .env で行う）
+#
+# - SMTP_HOST 未設定: ConsoleBackend（今までどおりコンソールに出すだけ。開発用）
+#   実際には届いていないので、outbox は sent ではなく logged にする（SMTP を設定すれば送り直せる）
+# - SMTP_HOST 設定あり: SMTPPool（SMTP 接続を使い回すプール。送信はスレッドに逃がしてイベントループを止めない）
+import asyncio
+import os
+import smtplib
+import time
+from dataclasses import dataclass
+from email.message import EmailMessage
+from email.utils import formataddr
+
+
+@dataclass
+class MailSettings:
+    smtp_host: str | None = None
+    smtp_port: int = 587
+    smtp_user: str | None = None
+    smtp_password: str | None = None
+    smtp_starttls: bool = True
+    mail_from: str = "noreply@example.com"
+    mail_from_name: str = "Re:Beauty"
+
+    concurrency: int = 4      # 同時に使う SMTP 接続数
+    rate_per_sec: float = 0   # 1秒あたりの送信上限（0 = 制限なし）
+    batch_size: int = 200     # 1回に outbox から取り出す件数
+    max_attempts: int = 3     # 失敗時の再送回数の上限
+
+    @classmethod
+    def from_env(cls) -> "MailSettings":
+        return cls(
+            smtp_host=os.getenv("SMTP_HOST") or None,
+            smtp_port=int(os.getenv("SMTP_PORT", "587")),
+            smtp_user=os.getenv("SMTP_USER") or None,
+            smtp_password=os.getenv("SMTP_PASSWORD") or None,
+            smtp_starttls=os.getenv("SMTP_STARTTLS", "1") == "1",
+            mail_from=os.getenv("MAIL_FROM", cls.mail_from),
+            mail_from_name=os.getenv("MAIL_FROM_NAME", cls.mail_from_name),
+            concurrency=int(os.getenv("MAIL_CONCURRENCY", "4")),
+            rate_per_sec=float(os.getenv("MAIL_RATE_PER_SEC", "0")),
+            batch_size=int(os.getenv("MAIL_BATCH_SIZE", "200")),
+            max_attempts=int(os.getenv("MAIL_MAX_ATTEMPTS", "3")),
+        )
+
+
+def build_message(settings: MailSettings, to: str, subject: str, body: str) -> EmailMessage:
+    msg = EmailMessage()
+    msg["From"] = formataddr((settings.mail_from_name, settings.mail_from))
+    msg["To"] = to
+    msg["Subject"] = subject
+    msg.set_content(body)
+    return msg
+
+
+class ConsoleBackend:
+    """SMTP を設定していない環境用（コンソールに出すだけ。送信済みにはしない）"""
+
+    delivered_status = "logged"  # outbox に記録する状態
+
+    async def send(self, msg: EmailMessage) -> None:
+        print(f"==== [EMAIL] to={msg['To']} subject={msg['Subject']} ====")
+
+    async def close(self) -> None:
+        pass
+
+
+class SMTPPool:
+    """
+    SMTP 接続のプール
+    size 本の接続を使い回す（1通ごとに接続・認証し直さない）。
+    smtplib はブロッキングなので、1通の送信は asyncio.to_thread で実行する
+    """
+
+    delivered_status = "sent"
+
+    # この例外は「その宛先だけの失敗」なので接続はそのまま使い回せる
+    _RECIPIENT_ERRORS = (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError)
+
+    def __init__(self, settings: MailSettings, size: int | None = None, timeout: float = 30):
+        self.settings = settings
+        self.timeout = timeout
+        self._pool: asyncio.Queue = asyncio.Queue()
+        for _ in range(size or settings.concurrency):
+            self._pool.put_nowait(None)  # 接続は使うときに作る
+
+    def _connect(self) -> smtplib.SMTP:
+        s = self.settings
+        conn = smtplib.SMTP(s.smtp_host, s.smtp_port, timeout=self.timeout)
+        conn.ehlo()
+        if s.smtp_starttls and conn.has_extn("starttls"):
+            conn.starttls()
+            conn.ehlo()
+        if s.smtp_user:
+            conn.login(s.smtp_user, s.smtp_password or "")
+        return conn
+
+    async def send(self, msg: EmailMessage) -> None:
+        conn = await self._pool.get()
+        try:
+            if conn is None:
+                conn = await asyncio.to_thread(self._connect)
+            await asyncio.to_thread(conn.send_message, msg)
+        except self._RECIPIENT_ERRORS:
+            raise
+        except Exception:
+            # 切断などで接続が使えなくなった → 捨てて次回作り直す
+            if conn is not None:
+                await asyncio.to_thread(_close_quietly, conn)
+            conn = None
+            raise
+        finally:
+            self._pool.put_nowait(conn)
+
+    async def close(self) -> None:
+        while not self._pool.empty():
+            conn = self._pool.get_nowait()
+            if conn is not None:
+                await asyncio.to_thread(_close_quietly, conn)
+
+
+def _close_quietly(conn: smtplib.SMTP) -> None:
+    try:
+        conn.quit()
+    except Exception:
+        conn.close()
+
+
+class RateLimiter:
+    """送信レート制限（トークンバケット。rate_per_sec <= 0 なら何もしない）"""
+
+    def __init__(self, rate_per_sec: float):
+        self.rate = rate_per_sec
+        self._capacity = max(rate_per_sec, 1.0)  # 1秒分まではまとめて送れる
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def create_backend(settings: MailSettings):
+    if settings.smtp_host:
+        return SMTPPool(settings)
+    return ConsoleBackend()
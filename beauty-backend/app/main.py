@@ -2,24 +2,43 @@
 from dotenv import load_dotenv
 load_dotenv()
 
-from fastapi import FastAPI
+import hmac
+import os
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from pathlib import Path
-from fastapi.responses import FileResponse
-from fastapi import Request
+from contextlib import asynccontextmanager
+import logging
 
 from .auth import router as auth_router
 from .routers.customers import router as customers_router
-from .database import Base, engine
-from . import models  # モデル登録のため
-from .routers import staffs, emails, visits, follow_mail, dashboard  # ←相対で統一
+from .database import engine, async_engine
+from . import metrics, migrations
+from .mail_worker import worker as mail_worker
+from .static_files import SPAStaticFiles
+from .routers import staffs, emails, visits, follow_mail, follow_rules, dashboard, export, segments  # ←相対で統一
+
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # スキーマは python -m app.cli migrate で更新する（起動時は未適用が無いか確認するだけ）
+    not_applied = migrations.pending(engine)
+    if not_applied:
+        logging.getLogger(__name__).warning(
+            "未適用のマイグレーションがあります: %s（python -m app.cli migrate を実行してください）",
+            ", ".join(not_applied),
+        )
+    # 一斉メールの送信ワーカー（起動中のジョブ・止まっていたジョブもここから再開）
+    mail_worker.start()
+    yield
+    await mail_worker.stop()
+    if async_engine is not None:  # DB_ASYNC=1 のときだけ
+        await async_engine.dispose()
 
-app = FastAPI(title="Re:Beauty API")
 
-# ここでテーブルを作成（models 内の Base クラスたちを読み込んだあと）
-Base.metadata.create_all(bind=engine)
+app = FastAPI(title="Re:Beauty API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -28,7 +47,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Server-Timing"],  # ページングのカーソル・処理時間をフロントから読めるように
 )
+# ルートごとのレイテンシ・SQL 回数の計測（CORS より外側で、全リクエストが対象）
+app.add_middleware(metrics.MetricsMiddleware)
+
+# /api/metrics を Prometheus から取るときのトークン（設定すると Authorization: Bearer <token> が必要）
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
 
 API_PREFIX = "/api"
 # ここで登録！
@@ -38,28 +63,26 @@ app.include_router(staffs.router, prefix="/api")      #スタッフ登録
 app.include_router(emails.router, prefix="/api")      #メール送信(ダミー)
 app.include_router(visits.router, prefix="/api")      #来店／購入履歴の登録
 app.include_router(follow_mail.router, prefix="/api") #フォロー対象の抽出API
+app.include_router(follow_rules.router, prefix="/api") #フォロー周期ルール
 app.include_router(dashboard.router, prefix="/api") #ダッシュボード系
+app.include_router(export.router, prefix="/api") #顧客・来店のエクスポート
+app.include_router(segments.router, prefix="/api") #セグメント（条件を組み立てて対象者をプレビュー）
 
 @app.get("/api/status")
 def status():
     return {"status": "ok"}
 
 
-BASE_DIR = Path(__file__).resolve().parent
-static_dir = BASE_DIR / "static"
-app.mount("/", StaticFiles(directory=str(static_dir), html=True), name="frontend")
+@app.get("/api/metrics", include_in_schema=False)
+def metrics_endpoint(request: Request):
+    if METRICS_TOKEN:
+        given = request.headers.get("authorization", "").removeprefix("Bearer ").strip()
+        if not hmac.compare_digest(given.encode(), METRICS_TOKEN.encode()):
+            raise HTTPException(status_code=401, detail="Unauthorized")
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
 
-INDEX_HTML = static_dir / "index.html"
 
-@app.get("/{full_path:path}")
-def spa_fallback(full_path: str, request: Request):
-    # APIと静的ファイルは触らない
-    if full_path.startswith("api/"):
-        return {"detail": "Not Found"}  # ここはAPI側の404として返す
-
-    # 実ファイルが存在するなら StaticFiles に任せたいが、
-    # ここに来る時点でStaticFilesが拾えてないので index.html を返す
-    if INDEX_HTML.exists():
-        return FileResponse(str(INDEX_HTML))
-
-    return {"detail": "index.html not found"}
\ No newline at end of file
+BASE_DIR = Path(__file__).resolve().parent
+static_dir = BASE_DIR / "static"
+# フロントの配信（圧縮版・キャッシュヘッダー・index.html へのフォールバックは static_files 側で）
+app.mount("/", SPAStaticFiles(static_dir), name="frontend")
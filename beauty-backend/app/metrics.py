@@ -0,0 +1,249 @@
+# app/metrics.py
+# リクエストごとの性能計測（ルート別のレイテンシ・SQL の回数と時間・遅いクエリのログ）
+#
+# - MetricsMiddleware（main.py で app に登録）: ルートのテンプレート（/api/customers/{customer_id} など）ごとに
+#   レイテンシ・SQL 回数・DB 時間をヒストグラムに記録し、レスポンスに Server-Timing ヘッダーを付ける
+# - instrument_engine（database.py でエンジンに登録）: SQL の実行を数え、実行中のリクエストに足し込む
+#   時間は cursor.execute から、行を返す文は結果を取り出し終わる（カーソルを閉じる）まで。
+#   SQLite は execute では最初の1行しか作らないので、取り出し（fetch）も含めないと DB 時間が小さく出る
+#   SLOW_QUERY_MS を超えたクエリは SQL 文だけをログに出す（バインド値は出さない）
+# - render: Prometheus のテキスト形式（GET /api/metrics）
+# 値はプロセスごと。複数プロセスで動かす場合は Prometheus 側で合計する
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("app.sql")
+
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+QUERY_COUNT_WARN = int(os.getenv("QUERY_COUNT_WARN", "50"))  # 1リクエストでこれ以上 SQL を出したら警告（N+1 の検知）
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, buckets: tuple, labelnames: tuple = ()):
+        self.name = name
+        self.help = help
+        self.buckets = buckets
+        self.labelnames = labelnames
+        self._series: dict[tuple, list] = {}  # ラベル値 → [バケットごとの件数..., 合計, 件数]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._series.items())
+        for labels, series in items:
+            base = _labels(self.labelnames, labels)
+            for bound, n in zip(self.buckets, series):
+                lines.append(f'{self.name}_bucket{{{base}{"," if base else ""}le="{bound}"}} {n}')
+            lines.append(f'{self.name}_bucket{{{base}{"," if base else ""}le="+Inf"}} {series[-1]}')
+            lines.append(f"{self.name}_sum{{{base}}} {series[-2]:.6f}".replace("{}", ""))
+            lines.append(f"{self.name}_count{{{base}}} {series[-1]}".replace("{}", ""))
+        return lines
+
+
+class Counter:
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, n: int = 1) -> None:
+        with self._lock:
+            self.value += n
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter", f"{self.name} {self.value}"]
+
+
+def _labels(names: tuple, values: tuple) -> str:
+    def escape(v: str) -> str:
+        return v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return ",".join(f'{n}="{escape(str(v))}"' for n, v in zip(names, values))
+
+
+REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds", "リクエストの処理時間", LATENCY_BUCKETS, ("method", "route", "status")
+)
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries", "1リクエストで実行した SQL の数", QUERY_COUNT_BUCKETS, ("method", "route")
+)
+REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds", "1リクエストの SQL 実行時間の合計（行の取り出しを含む）", LATENCY_BUCKETS, ("method", "route")
+)
+QUERY_SECONDS = Histogram(
+    "db_query_duration_seconds", "SQL 1回の実行時間（行の取り出しを含む。リクエスト外も含む）", LATENCY_BUCKETS
+)
+SLOW_QUERIES = Counter("db_slow_queries_total", f"{SLOW_QUERY_MS:g}ms を超えた SQL の数")
+
+REGISTRY = (REQUEST_SECONDS, REQUEST_QUERIES, REQUEST_DB_SECONDS, QUERY_SECONDS, SLOW_QUERIES)
+
+
+def render() -> str:
+    return "\n".join(line for metric in REGISTRY for line in metric.render()) + "\n"
+
+
+# =======================
+# リクエストごとの SQL 集計
+# =======================
+@dataclass
+class RequestStats:
+    queries: int = 0
+    db_seconds: float = 0.0
+
+
+# 実行中のリクエストの集計先（スレッドプール・AsyncSession のどちらで SQL を実行してもコンテキストが引き継がれる）
+_current: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+
+    stats = _current.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+
+    if context is not None and context.cursor is cursor and cursor.description is not None:
+        # 行を返す文: 取り出しの時間も足して、カーソルを閉じたときに記録する
+        context.cursor = _TimedCursor(cursor, elapsed, statement, parameters, executemany)
+    else:
+        _record_query(elapsed, statement, parameters, executemany)
+
+
+class _TimedCursor:
+    """DBAPI カーソルのラッパー（fetch* の時間を SQL の時間に足す）
+
+    SQLAlchemy は結果を読み切ったとき・結果を閉じたときにカーソルを close する。そこで1回分として記録する
+    """
+
+    def __init__(self, cursor, elapsed: float, statement, parameters, executemany):
+        self._cursor = cursor
+        self._elapsed = elapsed
+        self._query = (statement, parameters, executemany)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def _timed(self, fetch, *args):
+        start = time.perf_counter()
+        try:
+            return fetch(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            self._elapsed += elapsed
+            stats = _current.get()
+            if stats is not None:
+                stats.db_seconds += elapsed
+
+    def fetchone(self):
+        return self._timed(self._cursor.fetchone)
+
+    def fetchmany(self, *args):
+        return self._timed(self._cursor.fetchmany, *args)
+
+    def fetchall(self):
+        return self._timed(self._cursor.fetchall)
+
+    def close(self):
+        try:
+            self._cursor.close()
+        finally:
+            if self._query is not None:
+                _record_query(self._elapsed, *self._query)
+                self._query = None
+
+
+def _record_query(elapsed: float, statement, parameters, executemany) -> None:
+    QUERY_SECONDS.observe(elapsed)
+    if elapsed * 1000 >= SLOW_QUERY_MS:
+        SLOW_QUERIES.inc()
+        # バインド値（顧客の名前・メールアドレスなど）はログに出さない
+        n_params = len(parameters) if isinstance(parameters, (list, tuple, dict)) else 0
+        logger.warning(
+            "slow query %.0fms%s [%d params redacted]: %s",
+            elapsed * 1000, " (executemany)" if executemany else "", n_params, " ".join(statement.split())[:2000],
+        )
+
+
+def instrument_engine(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# =======================
+# ミドルウェア
+# =======================
+def _route_label(scope) -> str:
+    # 実際のパスではなくテンプレートで集計する（/api/customers/1 と /2 を同じ系列に）
+    ctx = scope.get("fastapi", {}).get("effective_route_context")  # include_router の prefix 込みのパス
+    path = getattr(ctx, "path", None) or getattr(scope.get("route"), "path", None)
+    if path:
+        return path
+    return "static" if scope.get("endpoint") is not None else "unmatched"
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                # ヘッダーを送る時点までの時間（ストリーミングのレスポンスは本文を送る前まで）
+                app_ms = (time.perf_counter() - start) * 1000
+                timing = (
+                    f'app;dur={app_ms:.1f}, db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries"'
+                )
+                message["headers"] = [*message.get("headers", []), (b"server-timing", timing.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            elapsed = time.perf_counter() - start
+            route = _route_label(scope)
+            method = scope["method"]
+            REQUEST_SECONDS.observe(elapsed, method, route, str(status))
+            REQUEST_QUERIES.observe(stats.queries, method, route)
+            REQUEST_DB_SECONDS.observe(stats.db_seconds, method, route)
+            if stats.queries >= QUERY_COUNT_WARN:
+                logger.warning("%s %s issued %d SQL queries (%.0fms in DB)", method, route, stats.queries, stats.db_seconds * 1000)
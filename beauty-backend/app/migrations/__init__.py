@@ -0,0 +1,95 @@
+# app/migrations/__init__.py
+# スキーマのマイグレーション（組み込みの簡易ランナー）
+#
+#   python -m app.cli migrate           # 未適用のマイグレーションを順に適用
+#   python -m app.cli migrate --status  # 適用状況を表示
+#
+# - マイグレーションはこのパッケージの m0001_xxx.py, m0002_xxx.py ...（番号順に適用）
+#   それぞれ upgrade(engine) を持ち、モジュールの docstring が説明になる
+#   テーブル・インデックス・データの移し方はその時点の定義をマイグレーションの中に書く
+#   （app.models や crud などアプリのモジュールは使わない。後から変えても適用済みの結果と食い違わないように）
+# - 適用済みのバージョンは schema_migrations テーブルに記録する
+# - アプリの起動時はマイグレーションを実行しない（未適用があれば警告を出すだけ）
+import importlib
+import logging
+import pkgutil
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, func, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+logger = logging.getLogger(__name__)
+
+_NAME = re.compile(r"^m(\d{4})_(\w+)$")
+
+_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    _metadata,
+    Column("version", String, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("applied_at", DateTime, server_default=func.now(), nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: str
+    name: str
+    description: str
+    upgrade: Callable[[Engine], None]
+
+
+def discover() -> list[Migration]:
+    migrations = []
+    for info in pkgutil.iter_modules(__path__):
+        m = _NAME.match(info.name)
+        if not m:
+            continue
+        module = importlib.import_module(f"{__name__}.{info.name}")
+        doc = (module.__doc__ or "").strip().splitlines()
+        migrations.append(Migration(m.group(1), m.group(2), doc[0] if doc else "", module.upgrade))
+    return sorted(migrations, key=lambda x: x.version)
+
+
+def applied_versions(engine: Engine) -> dict[str, datetime]:
+    with engine.connect() as conn:
+        rows = conn.execute(select(schema_migrations.c.version, schema_migrations.c.applied_at)).all()
+    return {r.version: r.applied_at for r in rows}
+
+
+def upgrade(engine: Engine, log: Callable[[str], None] = logger.info) -> list[str]:
+    """未適用のマイグレーションを番号順に適用する。適用したバージョンを返す"""
+    _metadata.create_all(engine)
+    done = applied_versions(engine)
+
+    applied = []
+    for mig in discover():
+        if mig.version in done:
+            continue
+        log(f"applying {mig.version}_{mig.name}: {mig.description}")
+        mig.upgrade(engine)
+        with engine.begin() as conn:
+            conn.execute(insert(schema_migrations).values(version=mig.version, name=mig.name))
+        applied.append(mig.version)
+    return applied
+
+
+def status(engine: Engine) -> list[tuple[Migration, datetime | None]]:
+    _metadata.create_all(engine)
+    done = applied_versions(engine)
+    return [(mig, done.get(mig.version)) for mig in discover()]
+
+
+def pending(engine: Engine) -> list[str]:
+    """未適用のバージョン（起動時のチェック用。テーブルを読むだけでスキーマには触らない）"""
+    versions = [mig.version for mig in discover()]
+    try:
+        done = applied_versions(engine)
+    except SQLAlchemyError:
+        return versions  # schema_migrations が無い = 一度も migrate していない
+    return [v for v in versions if v not in done]
@@ -0,0 +1,336 @@
+# app/migrations/m0001_baseline.py
+"""既存のスキーマに揃える（テーブル作成・後から足したカラム/インデックス・検索インデックス・初期データ）
+
+マイグレーション導入前は起動時（db_setup.init_db）にやっていた処理。
+新規DBはここで全テーブルを作り、導入前からあるDBは足りないカラム・インデックスだけ追加する
+
+テーブル・インデックス・初期データ・正規化の規則は導入時点のものをここに書き写してある（app のモジュールは使わない）。
+後からモデルを変えるときは、このファイルではなく新しいマイグレーションを足す
+"""
+import logging
+import re
+import unicodedata
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    bindparam,
+    extract,
+    func,
+    insert,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.engine import Connection, Engine
+
+from . import ops
+
+logger = logging.getLogger(__name__)
+
+_metadata = MetaData()
+
+customers = Table(
+    "customers",
+    _metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("name", String, index=True, nullable=False),
+    Column("kana", String, index=True, nullable=True),
+    Column("phone", String, index=True, nullable=True),
+    Column("email", String, index=True, nullable=True),
+    Column("note", String, nullable=True),
+    Column("birthday", Date, nullable=True),
+    Column("birth_month", Integer, nullable=True),
+    Column("birth_day", Integer, nullable=True),
+    Column("email_opt_in", Boolean, nullable=False, server_default="1"),
+    Column("last_visit_date", Date, nullable=True, index=True),
+    Column("kana_norm", String, index=True, nullable=True),
+    Column("phone_norm", String, index=True, nullable=True),
+    Column("created_at", DateTime, server_default=func.now(), nullable=False),
+    Index("ix_customers_birth_month_day", "birth_month", "birth_day"),
+)
+
+staffs = Table(
+    "staffs",
+    _metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("staff_code", String, unique=True, index=True, nullable=False),
+    Column("name", String, nullable=True),
+    Column("email", String, unique=True, index=True, nullable=False),
+    Column("is_active", Boolean),
+    Column("hashed_password", String, nullable=False),
+)
+
+visits = Table(
+    "visits",
+    _metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("customer_id", Integer, ForeignKey("customers.id"), nullable=False, index=True),
+    Column("visit_date", Date, nullable=False),
+    Column("memo", String, nullable=True),
+    Column("staff_id", Integer, ForeignKey("staffs.id"), nullable=True, index=True),
+    Column("created_at", DateTime, server_default=func.now()),
+    Index("ix_visits_customer_date_id", "customer_id", "visit_date", "id"),
+)
+
+visit_items = Table(
+    "visit_items",
+    _metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("visit_id", Integer, ForeignKey("visits.id"), nullable=False, index=True),
+    Column("category", String, nullable=False, index=True),
+    Column("product_name", String, nullable=True),
+    Column("note", String, nullable=True),
+    Column("follow_due_date", Date, nullable=False, index=True),
+    Column("follow_sent_at", DateTime, nullable=True),
+    Column("created_at", DateTime, server_default=func.now()),
+    Index(
+        "ix_visit_items_follow_pending",
+        "follow_due_date",
+        "id",
+        sqlite_where=text("follow_sent_at IS NULL"),
+        postgresql_where=text("follow_sent_at IS NULL"),
+    ),
+)
+
+customer_last_purchases = Table(
+    "customer_last_purchases",
+    _metadata,
+    Column("customer_id", Integer, ForeignKey("customers.id"), primary_key=True),
+    Column("category", String, primary_key=True),
+    Column("last_purchase_date", Date, nullable=False),
+    Column("last_visit_item_id", Integer, nullable=False, index=True),
+    Index("ix_last_purchases_category_date", "category", "last_purchase_date"),
+)
+
+email_jobs = Table(
+    "email_jobs",
+    _metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("subject", String, nullable=False),
+    Column("body", String, nullable=False),
+    Column("segment", String, nullable=True),
+    Column("status", String, nullable=False, index=True),
+    Column("requested_by", String, nullable=True),
+    Column("total_count", Integer, nullable=False),
+    Column("sent_count", Integer, nullable=False),
+    Column("failed_count", Integer, nullable=False),
+    Column("locked_until", DateTime, nullable=True),
+    Column("created_at", DateTime, server_default=func.now(), nullable=False),
+    Column("started_at", DateTime, nullable=True),
+    Column("finished_at", DateTime, nullable=True),
+)
+
+email_outbox = Table(
+    "email_outbox",
+    _metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("job_id", Integer, ForeignKey("email_jobs.id"), nullable=False),
+    Column("customer_id", Integer, nullable=True),
+    Column("email", String, nullable=False),
+    Column("status", String, nullable=False),
+    Column("attempts", Integer, nullable=False),
+    Column("error", String, nullable=True),
+    Column("sent_at", DateTime, nullable=True),
+    Index("ix_email_outbox_job_status_id", "job_id", "status", "id"),
+)
+
+follow_rules = Table(
+    "follow_rules",
+    _metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("category", String, nullable=False),
+    Column("product_name", String, nullable=True),
+    Column("cycle_days", Integer, nullable=False),
+    Column("updated_at", DateTime, server_default=func.now(), onupdate=func.now()),
+    Index("ix_follow_rules_category_product", "category", "product_name"),
+)
+
+DEFAULT_FOLLOW_DAYS = {"skincare": 90, "makeup": 120}
+
+# 検索インデックス（SQLite: FTS5 trigram / PostgreSQL: pg_trgm）の対象列
+FTS_TABLE = "customers_fts"
+FTS_COLUMNS = ("name", "kana_norm", "phone_norm", "email")
+
+
+def upgrade(engine: Engine) -> None:
+    _metadata.create_all(bind=engine)
+    ops.add_missing_columns(engine, _metadata)
+    created_indexes = ops.add_missing_indexes(engine, _metadata)
+    _backfill_normalized_columns(engine)
+    _setup_search_index(engine)
+
+    with engine.begin() as conn:
+        if conn.execute(select(follow_rules.c.id).limit(1)).first() is None:
+            conn.execute(insert(follow_rules), [
+                {"category": c, "cycle_days": d} for c, d in DEFAULT_FOLLOW_DAYS.items()
+            ])
+
+        _populate_last_purchases(conn)
+
+        # last_visit_date を検索条件に使い始めた時点で、過去に更新漏れした値を1回だけ直す
+        if "ix_customers_last_visit_date" in created_indexes:
+            latest = (
+                select(func.max(visits.c.visit_date))
+                .where(visits.c.customer_id == customers.c.id)
+                .scalar_subquery()
+            )
+            conn.execute(update(customers).values(last_visit_date=latest))
+
+        # birth_month / birth_day を追加した既存DBは birthday から埋める
+        if "ix_customers_birth_month_day" in created_indexes:
+            conn.execute(
+                update(customers)
+                .where(customers.c.birthday.isnot(None))
+                .values(
+                    birth_month=extract("month", customers.c.birthday),
+                    birth_day=extract("day", customers.c.birthday),
+                )
+            )
+
+
+# =======================
+# 検索用カラム・検索インデックス
+# =======================
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize_kana(value: str | None) -> str | None:
+    # 全角カタカナ・空白なし（半角ｶﾅ・ひらがなもそろえる）
+    if not value:
+        return None
+    s = unicodedata.normalize("NFKC", value)
+    s = "".join(chr(ord(ch) + 0x60) if "ぁ" <= ch <= "ゖ" else ch for ch in s)
+    return _WHITESPACE.sub("", s) or None
+
+
+def _normalize_phone(value: str | None) -> str | None:
+    # 数字だけ
+    if not value:
+        return None
+    return "".join(ch for ch in unicodedata.normalize("NFKC", value) if ch.isdigit()) or None
+
+
+def _backfill_normalized_columns(engine: Engine, batch_size: int = 1000) -> None:
+    # 既存データの kana_norm / phone_norm を埋める（カラム追加直後の1回だけ実質的に動く）
+    needs_backfill = or_(
+        customers.c.kana.isnot(None) & customers.c.kana_norm.is_(None),
+        customers.c.phone.isnot(None) & customers.c.phone_norm.is_(None),
+    )
+    stmt = (
+        customers.update()
+        .where(customers.c.id == bindparam("_id"))
+        .values(kana_norm=bindparam("_kana_norm"), phone_norm=bindparam("_phone_norm"))
+    )
+
+    last_id = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                select(customers.c.id, customers.c.kana, customers.c.phone)
+                .where(customers.c.id > last_id, needs_backfill)
+                .order_by(customers.c.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            conn.execute(stmt, [
+                {"_id": r.id, "_kana_norm": _normalize_kana(r.kana), "_phone_norm": _normalize_phone(r.phone)}
+                for r in rows
+            ])
+        last_id = rows[-1].id
+
+
+def _setup_search_index(engine: Engine) -> None:
+    if engine.dialect.name == "sqlite":
+        _setup_sqlite_fts(engine)
+    elif engine.dialect.name == "postgresql":
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            for col in FTS_COLUMNS:
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS ix_customers_{col}_trgm "
+                    f"ON customers USING gin ({col} gin_trgm_ops)"
+                ))
+
+
+def _setup_sqlite_fts(engine: Engine) -> None:
+    cols = ", ".join(FTS_COLUMNS)
+    new_cols = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+    old_cols = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+
+    with engine.begin() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": FTS_TABLE},
+        ).first()
+
+        try:
+            conn.execute(text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+                f"{cols}, content='customers', content_rowid='id', tokenize='trigram')"
+            ))
+        except Exception:
+            # FTS5 / trigram が無い SQLite（3.34 未満など）は ilike 検索のまま動かす
+            logger.warning("FTS5 trigram is not available; customer search falls back to LIKE scans")
+            return
+
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON customers BEGIN "
+            f"INSERT INTO {FTS_TABLE}(rowid, {cols}) VALUES (new.id, {new_cols}); END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON customers BEGIN "
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {cols}) VALUES ('delete', old.id, {old_cols}); END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF {cols} ON customers BEGIN "
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {cols}) VALUES ('delete', old.id, {old_cols}); "
+            f"INSERT INTO {FTS_TABLE}(rowid, {cols}) VALUES (new.id, {new_cols}); END"
+        ))
+
+        # 既存の顧客がいるDBに後から作った場合は中身を作り直す
+        if not exists:
+            conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+
+
+# =======================
+# 最終購入サマリー
+# =======================
+def _populate_last_purchases(conn: Connection) -> None:
+    # サマリーテーブルを後から追加した既存DB向け：空なのに明細があれば1回だけ作る
+    # 顧客×カテゴリごとに「来店日が一番新しい明細」（同日なら明細IDが大きい方）
+    if conn.execute(select(customer_last_purchases.c.customer_id).limit(1)).first() is not None:
+        return
+    ranked = (
+        select(
+            visits.c.customer_id,
+            visit_items.c.category,
+            visits.c.visit_date,
+            visit_items.c.id.label("visit_item_id"),
+            func.row_number()
+            .over(
+                partition_by=(visits.c.customer_id, visit_items.c.category),
+                order_by=(visits.c.visit_date.desc(), visit_items.c.id.desc()),
+            )
+            .label("rn"),
+        )
+        .select_from(visit_items.join(visits, visits.c.id == visit_items.c.visit_id))
+        .subquery()
+    )
+    conn.execute(
+        insert(customer_last_purchases).from_select(
+            ["customer_id", "category", "last_purchase_date", "last_visit_item_id"],
+            select(ranked.c.customer_id, ranked.c.category, ranked.c.visit_date, ranked.c.visit_item_id)
+            .where(ranked.c.rn == 1),
+        )
+    )
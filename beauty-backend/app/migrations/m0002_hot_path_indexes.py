@@ -0,0 +1,18 @@
+# app/migrations/m0002_hot_path_indexes.py
+"""よく使う検索のインデックス（来店履歴・カテゴリ別の明細・メール宛先）を運用中のDBに安全に追加する
+
+- visits(customer_id, visit_date): 既存の ix_visits_customer_date_id (customer_id, visit_date, id) が
+  同じ並びで始まるので、それを確実に作る（同じ列の索引を重ねて書き込みを遅くしない）
+- visit_items(category, visit_id): 新規。category 単体のインデックスはこれで代用できるので削除
+- customers(email_opt_in, email): 新規
+"""
+from sqlalchemy.engine import Engine
+
+from . import ops
+
+
+def upgrade(engine: Engine) -> None:
+    ops.create_index(engine, ops.index("visits", "ix_visits_customer_date_id", "customer_id", "visit_date", "id"))
+    ops.create_index(engine, ops.index("visit_items", "ix_visit_items_category_visit", "category", "visit_id"))
+    ops.create_index(engine, ops.index("customers", "ix_customers_opt_in_email", "email_opt_in", "email"))
+    ops.drop_index(engine, "ix_visit_items_category")
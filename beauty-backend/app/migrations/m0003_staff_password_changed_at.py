@@ -0,0 +1,10 @@
+# app/migrations/m0003_staff_password_changed_at.py
+"""staffs.password_changed_at を追加（パスワード変更前に発行したトークンを無効にする）"""
+from sqlalchemy import Column, DateTime
+from sqlalchemy.engine import Engine
+
+from . import ops
+
+
+def upgrade(engine: Engine) -> None:
+    ops.add_column(engine, "staffs", Column("password_changed_at", DateTime, nullable=True))
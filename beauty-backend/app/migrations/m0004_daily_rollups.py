@@ -0,0 +1,45 @@
+# app/migrations/m0004_daily_rollups.py
+"""来店の日別集計テーブル daily_rollups と visits(visit_date) のインデックスを追加し、既存の来店から集計を作る"""
+from sqlalchemy import Column, Date, Integer, MetaData, String, Table, select, text
+from sqlalchemy.engine import Engine
+
+from . import ops
+
+daily_rollups = Table(
+    "daily_rollups",
+    MetaData(),
+    Column("metric", String, primary_key=True),
+    Column("day", Date, primary_key=True),
+    Column("dim", String, primary_key=True),
+    Column("value", Integer, nullable=False),
+)
+
+# 既存の来店からの集計（集計の種類と「再来」の定義はこのマイグレーションの時点のもの）
+#   visits: 来店数 / repeat_visits: その顧客の最初の来店（来店日・ID 順）以外の来店数
+#   category_items: カテゴリ別の明細数 / staff_visits: スタッフ別の来店数（担当なしは dim = ""）
+_POPULATE = """
+INSERT INTO daily_rollups (day, metric, dim, value)
+SELECT v.visit_date, 'visits', '', count(*) FROM visits v GROUP BY v.visit_date
+UNION ALL
+SELECT v.visit_date, 'repeat_visits', '', count(*) FROM visits v
+WHERE EXISTS (
+    SELECT 1 FROM visits p
+    WHERE p.customer_id = v.customer_id AND (p.visit_date, p.id) < (v.visit_date, v.id)
+)
+GROUP BY v.visit_date
+UNION ALL
+SELECT v.visit_date, 'category_items', i.category, count(*) FROM visits v JOIN visit_items i ON i.visit_id = v.id
+GROUP BY v.visit_date, i.category
+UNION ALL
+SELECT v.visit_date, 'staff_visits', coalesce(CAST(v.staff_id AS VARCHAR), ''), count(*) FROM visits v
+GROUP BY v.visit_date, coalesce(CAST(v.staff_id AS VARCHAR), '')
+"""
+
+
+def upgrade(engine: Engine) -> None:
+    ops.create_index(engine, ops.index("visits", "ix_visits_visit_date", "visit_date"))
+    ops.create_table(engine, daily_rollups)
+    with engine.begin() as conn:
+        # 空なのに来店があるときだけ作る（何度実行しても同じ結果）
+        if conn.execute(select(daily_rollups.c.day).limit(1)).first() is None:
+            conn.execute(text(_POPULATE))
@@ -0,0 +1,34 @@
+# app/migrations/m0005_follow_rules_unique.py
+"""follow_rules を (category, product_name) ごとに1件にする（重複を消して一意インデックスを張る）"""
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from . import ops
+
+# 同じカテゴリ・商品のルールが複数あれば最後に登録したもの（id が最大）だけ残す
+# （GROUP BY では product_name が NULL の行も1つのグループになる）
+_DEDUPE = """
+DELETE FROM follow_rules
+WHERE id NOT IN (SELECT max(id) FROM follow_rules GROUP BY category, product_name)
+"""
+
+
+def upgrade(engine: Engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(text(_DEDUPE))
+    ops.create_index(
+        engine, ops.index("follow_rules", "ux_follow_rules_category_product", "category", "product_name", unique=True)
+    )
+    # カテゴリ全体のルール（product_name が NULL）は上の一意インデックスでは重複を防げないので部分インデックスで
+    ops.create_index(
+        engine,
+        ops.index(
+            "follow_rules",
+            "ux_follow_rules_category",
+            "category",
+            unique=True,
+            sqlite_where=text("product_name IS NULL"),
+            postgresql_where=text("product_name IS NULL"),
+        ),
+    )
+    ops.drop_index(engine, "ix_follow_rules_category_product")
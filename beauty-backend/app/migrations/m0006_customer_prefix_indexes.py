@@ -0,0 +1,19 @@
+# app/migrations/m0006_customer_prefix_indexes.py
+"""PostgreSQL: 1〜2文字の顧客検索（先頭一致）用に text_pattern_ops のインデックスを追加（SQLite は既存のインデックスで足りる）"""
+from sqlalchemy.engine import Engine
+
+from . import ops
+
+# 先頭一致で探すカラム（app.search の _PREFIX_COLUMNS と同じ）
+_COLUMNS = ("name", "kana_norm", "phone_norm", "email")
+
+
+def upgrade(engine: Engine) -> None:
+    # 照合順序が C 以外の PostgreSQL では、通常の B-tree インデックスで LIKE 'v%' を引けない
+    if engine.dialect.name != "postgresql":
+        return
+    for col in _COLUMNS:
+        ops.create_index(
+            engine,
+            ops.index("customers", f"ix_customers_{col}_prefix", col, postgresql_ops={col: "text_pattern_ops"}),
+        )
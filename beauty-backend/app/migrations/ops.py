@@ -0,0 +1,86 @@
+# app/migrations/ops.py
+# マイグレーションで使う DDL ヘルパー（何度実行しても同じ結果になるように書く）
+#
+# テーブル・カラム・インデックスは呼び出し側（各マイグレーション）がその時点の定義を渡す。
+# app.models は参照しない（後でモデルを変えても、適用済みのマイグレーションの結果が変わらないように）
+#
+# インデックスは運用中のDBにも安全に作れるようにする:
+# - PostgreSQL: CREATE INDEX CONCURRENTLY（テーブルへの書き込みを止めない。トランザクション外で実行）
+# - SQLite: 同時作成の仕組みは無いが、WAL モードなので作成中も読み込みは止まらない
+from sqlalchemy import Column, Index, MetaData, Table, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateColumn, CreateIndex
+
+
+def _is_pg(engine: Engine) -> bool:
+    return engine.dialect.name == "postgresql"
+
+
+def create_table(engine: Engine, table: Table) -> None:
+    # テーブルとそのインデックスを作る（既にあれば何もしない）
+    table.create(engine, checkfirst=True)
+
+
+def index(table_name: str, name: str, *columns: str, **kw) -> Index:
+    # 既存のテーブルに足すインデックスを列名で組み立てる（DDL を作るだけなので列の型は要らない）
+    table = Table(table_name, MetaData(), *(Column(c) for c in columns))
+    return Index(name, *(table.c[c] for c in columns), **kw)
+
+
+def create_index(engine: Engine, index: Index) -> None:
+    ddl = str(CreateIndex(index, if_not_exists=True).compile(dialect=engine.dialect))
+    if _is_pg(engine):
+        ddl = ddl.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1).replace(
+            "CREATE UNIQUE INDEX", "CREATE UNIQUE INDEX CONCURRENTLY", 1
+        )
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text(ddl))
+    else:
+        with engine.begin() as conn:
+            conn.execute(text(ddl))
+
+
+def drop_index(engine: Engine, name: str) -> None:
+    if _is_pg(engine):
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+    else:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+
+def add_column(engine: Engine, table_name: str, column: Column) -> None:
+    # カラムを1つ追加する（既にあれば何もしない。nullable 前提）
+    if column.name in {c["name"] for c in inspect(engine).get_columns(table_name)}:
+        return
+    Table(table_name, MetaData(), column)
+    ddl = CreateColumn(column).compile(dialect=engine.dialect)
+    with engine.begin() as conn:
+        conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {ddl}"))
+
+
+def add_missing_columns(engine: Engine, metadata: MetaData) -> None:
+    # metadata にあって DB に無いカラムを足す（nullable 前提。ALTER TABLE ... ADD COLUMN で足せる範囲）
+    insp = inspect(engine)
+    with engine.begin() as conn:
+        for table in metadata.sorted_tables:
+            existing = {c["name"] for c in insp.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                ddl = CreateColumn(column).compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {ddl}"))
+
+
+def add_missing_indexes(engine: Engine, metadata: MetaData) -> set[str]:
+    # metadata にあって DB に無いインデックスを作る。新しく作ったインデックス名を返す
+    insp = inspect(engine)
+    created = set()
+    for table in metadata.sorted_tables:
+        existing = {ix["name"] for ix in insp.get_indexes(table.name)}
+        for ix in table.indexes:
+            if ix.name in existing:
+                continue
+            create_index(engine, ix)
+            created.add(ix.name)
+    return created
@@ -8,6 +8,8 @@ from sqlalchemy import (
     Date,
     func,
     ForeignKey,
+    Index,
+    text,
 )
 from sqlalchemy.orm import relationship
 from .database import Base
@@ -15,6 +17,12 @@ from .database import Base
 
 class Customer(Base):
     __tablename__ = "customers"
+    __table_args__ = (
+        # 誕生月・誕生日での検索（「今月」「N日以内」の誕生日メール）用
+        Index("ix_customers_birth_month_day", "birth_month", "birth_day"),
+        # 一斉メール・フォローメールの宛先（配信OK かつ email あり）の絞り込み用
+        Index("ix_customers_opt_in_email", "email_opt_in", "email"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True, nullable=False)
@@ -24,8 +32,14 @@ class Customer(Base):
     note = Column(String, nullable=True)
 
     birthday = Column(Date, nullable=True)  # 誕生日（誕生日メール用）
+    birth_month = Column(Integer, nullable=True)  # birthday の月（crud が同期。インデックス検索用）
+    birth_day = Column(Integer, nullable=True)  # birthday の日
     email_opt_in = Column(Boolean, nullable=False, server_default="1")  # メール配信OK?
-    last_visit_date = Column(Date, nullable=True)  # 最終来店日
+    last_visit_date = Column(Date, nullable=True, index=True)  # 最終来店日（来店の登録・更新・削除で crud が更新）
+
+    # 検索用に正規化した値（search.apply_normalized_fields で同期）
+    kana_norm = Column(String, index=True, nullable=True)  # 全角カタカナ・空白なし
+    phone_norm = Column(String, index=True, nullable=True)  # 数字のみ
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     visits = relationship("Visit",back_populates="customer",cascade="all, delete-orphan",)
@@ -40,6 +54,7 @@ class Staff(Base):
     email = Column(String, unique=True, index=True, nullable=False)
     is_active = Column(Boolean, default=True)
     hashed_password = Column(String, nullable=False)
+    password_changed_at = Column(DateTime, nullable=True)  # これより前に発行したトークンは無効（UTC・秒単位）
 
 
 class Visit(Base):
@@ -48,6 +63,12 @@ class Visit(Base):
     """
 
     __tablename__ = "visits"
+    __table_args__ = (
+        # 顧客ごとの来店履歴（来店日・ID 降順のキーセットページング）用
+        Index("ix_visits_customer_date_id", "customer_id", "visit_date", "id"),
+        # 日付で絞る集計（本日の来店数・日別集計の作り直し）用
+        Index("ix_visits_visit_date", "visit_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -79,6 +100,18 @@ class VisitItem(Base):
     """
 
     __tablename__ = "visit_items"
+    __table_args__ = (
+        # 未送信のフォロー対象だけの部分インデックス（期限が来た順に範囲スキャン・キーセットページング）
+        Index(
+            "ix_visit_items_follow_pending",
+            "follow_due_date",
+            "id",
+            sqlite_where=text("follow_sent_at IS NULL"),
+            postgresql_where=text("follow_sent_at IS NULL"),
+        ),
+        # カテゴリで絞って来店と結合（最終購入の集計・休眠顧客の抽出）用。category 単体の検索もこれで足りる
+        Index("ix_visit_items_category_visit", "category", "visit_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -86,7 +119,7 @@ class VisitItem(Base):
     visit_id = Column(Integer, ForeignKey("visits.id"), nullable=False, index=True)# 親Visitに紐付け
 
    
-    category = Column(String, nullable=False, index=True) # "skincare" or "makeup"
+    category = Column(String, nullable=False) # "skincare" or "makeup"
 
     
     product_name = Column(String, nullable=True)# 将来拡張用
@@ -103,3 +136,116 @@ class VisitItem(Base):
     
     visit = relationship("Visit", back_populates="items")# 親Visitへ戻る
 
+
+
+class CustomerLastPurchase(Base):
+    """
+    顧客×カテゴリごとの最終購入（フォロー抽出用のサマリー）
+    来店の登録・更新・削除のたびに last_purchases.refresh_customer で更新する
+    """
+
+    __tablename__ = "customer_last_purchases"
+    __table_args__ = (
+        # 「カテゴリ = X かつ 最終購入日 <= 基準日」を範囲スキャンで引く
+        Index("ix_last_purchases_category_date", "category", "last_purchase_date"),
+    )
+
+    customer_id = Column(Integer, ForeignKey("customers.id"), primary_key=True)
+    category = Column(String, primary_key=True)
+
+    last_purchase_date = Column(Date, nullable=False)  # そのカテゴリを最後に買った来店日
+
+    # どの明細が最終購入か（明細の入れ替え中に一時的に消えることがあるので FK は張らない）
+    last_visit_item_id = Column(Integer, nullable=False, index=True)
+
+
+class DailyRollup(Base):
+    """
+    来店の日別集計（ダッシュボードの推移グラフ用。種類は rollups.METRICS）
+    来店の登録・更新・削除のたびに rollups.refresh_days で該当日を作り直す
+    """
+
+    __tablename__ = "daily_rollups"
+
+    # 「集計の種類 = X かつ 日付が期間内」を主キーの範囲スキャンで引く
+    metric = Column(String, primary_key=True)  # visits / repeat_visits / category_items / staff_visits
+    day = Column(Date, primary_key=True)
+    dim = Column(String, primary_key=True, default="")  # カテゴリ・スタッフID（無い種類は ""）
+
+    value = Column(Integer, nullable=False)
+
+
+class EmailJob(Base):
+    """
+    一斉メール送信のジョブ（1回の一斉送信 = 1行）
+    宛先ごとの状態は EmailOutbox に持つ。送信は mail_worker がバックグラウンドで行う
+    """
+
+    __tablename__ = "email_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    subject = Column(String, nullable=False)  # 差し込みテンプレート（mail_templates）
+    body = Column(String, nullable=False)
+    segment = Column(String, nullable=True)  # 差し込みの商品名・経過日数に使うカテゴリ（任意）
+
+    status = Column(String, nullable=False, default="queued", index=True)  # queued / running / done
+    requested_by = Column(String, nullable=True)  # 依頼したスタッフ
+
+    total_count = Column(Integer, nullable=False, default=0)  # 宛先数（メールなし・配信停止の人は除外済み）
+    sent_count = Column(Integer, nullable=False, default=0)
+    failed_count = Column(Integer, nullable=False, default=0)
+
+    locked_until = Column(DateTime, nullable=True)  # 処理中ワーカーのリース期限（複数プロセスで二重送信しない）
+
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+
+class EmailOutbox(Base):
+    """
+    一斉メールの宛先（1人 = 1行）
+    """
+
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # ワーカーが「このジョブの未送信」を ID 順に取り出す用
+        Index("ix_email_outbox_job_status_id", "job_id", "status", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("email_jobs.id"), nullable=False)
+    customer_id = Column(Integer, nullable=True)  # 顧客が後で削除されても送信記録は残す
+
+    email = Column(String, nullable=False)
+    status = Column(String, nullable=False, default="pending")  # pending / sending（ワーカーが取り出して送信中） / sent / logged（SMTP 未設定でコンソールに出しただけ） / failed
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(String, nullable=True)
+    sent_at = Column(DateTime, nullable=True)
+
+
+class FollowRule(Base):
+    """
+    フォローの周期（何日後にフォローするか）
+    product_name が空ならカテゴリ全体のルール、入っていればその商品だけのルール（商品ルールが優先）
+    """
+
+    __tablename__ = "follow_rules"
+    __table_args__ = (
+        # ルールは (category, product_name) ごとに1件。NULL 同士は重複とみなされないので、
+        # カテゴリ全体のルール（product_name が NULL）は部分インデックスで category ごとに1件にする
+        Index("ux_follow_rules_category_product", "category", "product_name", unique=True),
+        Index(
+            "ux_follow_rules_category",
+            "category",
+            unique=True,
+            sqlite_where=text("product_name IS NULL"),
+            postgresql_where=text("product_name IS NULL"),
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    category = Column(String, nullable=False)  # "skincare" / "makeup" など
+    product_name = Column(String, nullable=True)
+    cycle_days = Column(Integer, nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,59 @@
+# app/pagination.py
+# キーセット（カーソル）ページング
+# カーソルは「最後に返した行のソートキー」を JSON → base64url にしただけの不透明な文字列
+# OFFSET を使わないので、何ページ目でも1ページ目と同じコストで取れる
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Optional
+
+# 次ページのカーソルを返すレスポンスヘッダ（本文は従来どおりの配列のまま）
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass
+class Page:
+    items: list
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(values: dict[str, Any]) -> str:
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """壊れた／改ざんされたカーソルは ValueError（ルーター側で 400 にする）"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("cursor が不正です") from e
+    if not isinstance(values, dict):
+        raise ValueError("cursor が不正です")
+    return values
+
+
+def paginate(rows: list, limit: int, key) -> Page:
+    """limit + 1 件取ってきた rows から1ページ分と次のカーソルを作る
+
+    key: 行 → カーソルに入れるソートキー(dict) を返す関数
+    """
+    items = rows[:limit]
+    next_cursor = encode_cursor(key(items[-1])) if len(rows) > limit else None
+    return Page(items=items, next_cursor=next_cursor)
+
+
+def read_cursor(cursor: str | None, **converters) -> dict[str, Any] | None:
+    """カーソルを decode して、キーごとに型変換した dict を返す（cursor なしなら None）
+
+    例: read_cursor(cursor, d=date.fromisoformat, id=int)
+    """
+    if not cursor:
+        return None
+    values = decode_cursor(cursor)
+    try:
+        return {k: conv(values[k]) for k, conv in converters.items()}
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError("cursor が不正です") from e
@@ -0,0 +1,62 @@
+# app/principals.py
+# ログイン中スタッフ（JWT の sub）の情報キャッシュ
+#
+# 認証のたびに staffs を SELECT しないよう、スタッフID → Principal をプロセス内にキャッシュする
+# - スタッフの作成・更新（無効化・パスワード変更）時は invalidate で即時に捨てる
+# - 他プロセスでの変更は TTL（PRINCIPAL_CACHE_TTL 秒）が切れるまで反映されない
+# - 存在しないスタッフID も None としてキャッシュする（作成時に invalidate）
+import os
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from . import models
+from .cache import TTLCache
+
+PRINCIPAL_CACHE_TTL = float(os.getenv("PRINCIPAL_CACHE_TTL", "60"))
+
+_cache = TTLCache(ttl=PRINCIPAL_CACHE_TTL, maxsize=4096)
+MISSING = object()  # get_cached でキャッシュに無いことを表す
+
+
+@dataclass(frozen=True)
+class Principal:
+    id: int
+    name: str | None
+    email: str
+    is_active: bool
+    password_changed_at: datetime | None
+    role: str = "staff"
+
+    def as_user(self) -> dict:
+        # ルーターに渡す current_user（これまで通りの dict）
+        return {"id": self.id, "name": self.name, "email": self.email, "role": self.role}
+
+
+def get_cached(staff_id: int):
+    """キャッシュにあれば Principal か None（存在しない）、無ければ MISSING"""
+    return _cache.get(staff_id, MISSING)
+
+
+def load(db: Session, staff_id: int) -> Principal | None:
+    staff = db.get(models.Staff, staff_id)
+    principal = None
+    if staff is not None:
+        principal = Principal(
+            id=staff.id,
+            name=staff.name,
+            email=staff.email,
+            is_active=staff.is_active is not False,  # NULL（古いデータ）は有効扱い
+            password_changed_at=staff.password_changed_at,
+        )
+    _cache.set(staff_id, principal)
+    return principal
+
+
+def invalidate(staff_id: int) -> None:
+    _cache.invalidate(staff_id)
+
+
+def clear() -> None:
+    _cache.clear()
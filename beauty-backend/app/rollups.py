@@ -0,0 +1,232 @@
+# app/rollups.py
+# 来店の日別集計（models.DailyRollup）の更新と、ダッシュボードの推移グラフ用の読み出し
+#
+# - 来店の登録・更新・削除・一括取り込み: refresh_days で影響する日だけ作り直す（commit は呼び出し側）
+# - 夜間のバックフィル: rebuild で期間をまとめて作り直す（python -m app.cli rebuild-rollups）
+# - グラフ（/dashboard/timeseries）は集計テーブルだけを読む（1年分の日別でも 365 行×系列数）
+#
+# 集計の種類（metric）と dim:
+#   visits          来店数                   dim = ""
+#   repeat_visits   再来（2回目以降）の来店数  dim = ""
+#   category_items  カテゴリ別の明細数         dim = カテゴリ
+#   staff_visits    スタッフ別の来店数         dim = スタッフID（担当なしは ""）
+# 「再来」はその顧客の最初の来店（来店日・ID 順）以外。最初の来店が変わると別の日の値も変わるので、
+# 書き込みの前後で first_visit_days を取り、その日も作り直す
+#
+# 作り直しは「その日の行を消す → 集計を INSERT ... ON CONFLICT DO UPDATE」。同じ日の来店を2つのトランザクションが
+# 同時に書いても（Postgres の READ COMMITTED で、相手が入れた行が DELETE から見えなくても）一意制約違反にならない
+from datetime import date, timedelta
+from typing import Iterable
+
+from sqlalchemy import String, bindparam, cast, delete, func, literal, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, aliased
+
+from . import models
+
+R = models.DailyRollup
+METRICS = ("visits", "repeat_visits", "category_items", "staff_visits")
+GRANULARITIES = ("day", "week", "month")
+TIMESERIES_METRICS = ("visits", "repeat_rate", "category_mix", "staff_visits")
+MAX_RANGE_DAYS = 366 * 5
+
+_DAYS_PER_STATEMENT = 500  # IN 句に並べる日数の上限
+
+
+def _aggregate_selects(*visit_conditions):
+    # 日 × 集計の種類 × dim ごとの件数を返す SELECT（INSERT ... SELECT で使う）
+    V = models.Visit
+    prev = aliased(models.Visit)
+
+    visits = (
+        select(V.visit_date, literal("visits"), literal(""), func.count())
+        .where(*visit_conditions)
+        .group_by(V.visit_date)
+    )
+    repeat_visits = (
+        select(V.visit_date, literal("repeat_visits"), literal(""), func.count())
+        .where(
+            *visit_conditions,
+            select(prev.id)
+            .where(
+                prev.customer_id == V.customer_id,
+                tuple_(prev.visit_date, prev.id) < tuple_(V.visit_date, V.id),
+            )
+            .exists(),
+        )
+        .group_by(V.visit_date)
+    )
+    category_items = (
+        select(V.visit_date, literal("category_items"), models.VisitItem.category, func.count())
+        .join(models.VisitItem, models.VisitItem.visit_id == V.id)
+        .where(*visit_conditions)
+        .group_by(V.visit_date, models.VisitItem.category)
+    )
+    staff_dim = func.coalesce(cast(V.staff_id, String), "")
+    staff_visits = (
+        select(V.visit_date, literal("staff_visits"), staff_dim, func.count())
+        .where(*visit_conditions)
+        .group_by(V.visit_date, staff_dim)
+    )
+    return visits, repeat_visits, category_items, staff_visits
+
+
+# ON CONFLICT を書ける INSERT（方言ごと）
+_UPSERT = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def _upsert_from(dialect: str, stmt):
+    ins = _UPSERT[dialect](R).from_select(["day", "metric", "dim", "value"], stmt)
+    return ins.on_conflict_do_update(index_elements=[R.metric, R.day, R.dim], set_={"value": ins.excluded.value})
+
+
+def _replace_statements(dialect: str, visit_condition, rollup_condition) -> list:
+    return [
+        delete(R).where(R.metric.in_(METRICS), rollup_condition).execution_options(synchronize_session=False),
+        *(_upsert_from(dialect, stmt) for stmt in _aggregate_selects(visit_condition)),
+    ]
+
+
+# 来店の書き込みのたびに使うので、文は方言ごとに1回だけ組み立てる（日付は実行時に渡す）
+_replace_days: dict[str, list] = {}
+
+
+def _replace_days_statements(dialect: str) -> list:
+    stmts = _replace_days.get(dialect)
+    if stmts is None:
+        stmts = _replace_days[dialect] = _replace_statements(
+            dialect,
+            models.Visit.visit_date.in_(bindparam("days", expanding=True)),
+            R.day.in_(bindparam("days", expanding=True)),
+        )
+    return stmts
+
+
+def first_visit_days(db: Session, customer_ids: Iterable[int]) -> set[date]:
+    """顧客ごとの最初の来店日（再来の判定が変わりうる日）"""
+    ids = sorted(set(customer_ids))
+    if not ids:
+        return set()
+    rows = db.execute(
+        select(func.min(models.Visit.visit_date))
+        .where(models.Visit.customer_id.in_(ids))
+        .group_by(models.Visit.customer_id)
+    ).all()
+    return {d for (d,) in rows}
+
+
+def refresh_days(db: Session, days: Iterable[date]) -> None:
+    """指定した日の集計を作り直す。呼び出し側で flush 済み・commit は呼び出し側"""
+    days = sorted(set(days))
+    if not days:
+        return
+    conn = db.connection()
+    stmts = _replace_days_statements(conn.dialect.name)
+    for start in range(0, len(days), _DAYS_PER_STATEMENT):
+        chunk = days[start:start + _DAYS_PER_STATEMENT]
+        for stmt in stmts:
+            conn.execute(stmt, {"days": chunk})
+
+
+def rebuild(db: Session, date_from: date | None = None, date_to: date | None = None, chunk_days: int = 31) -> int:
+    """期間の集計を作り直す（chunk_days 日ごとに commit）。期間を省略すると来店のある全期間。作り直した日数を返す"""
+    if date_from is None or date_to is None:
+        first, last = db.execute(select(func.min(models.Visit.visit_date), func.max(models.Visit.visit_date))).one()
+        if first is None:
+            db.execute(delete(R).where(R.metric.in_(METRICS)))
+            db.commit()
+            return 0
+        date_from = date_from or first
+        date_to = date_to or last
+
+    dialect = db.get_bind().dialect.name
+    start = date_from
+    while start <= date_to:
+        end = min(start + timedelta(days=chunk_days - 1), date_to)
+        stmts = _replace_statements(dialect, models.Visit.visit_date.between(start, end), R.day.between(start, end))
+        for stmt in stmts:
+            db.execute(stmt)
+        db.commit()
+        start = end + timedelta(days=1)
+    return (date_to - date_from).days + 1
+
+
+def ensure_populated(db: Session) -> None:
+    # 集計テーブルを後から追加した既存DB向け：空なのに来店があれば1回だけ作る
+    has_rollups = db.query(R.day).first() is not None
+    has_visits = db.query(models.Visit.id).first() is not None
+    if has_visits and not has_rollups:
+        rebuild(db)
+
+
+# =======================
+# 推移グラフ
+# =======================
+def bucket(d: date, granularity: str) -> date:
+    if granularity == "week":
+        return d - timedelta(days=d.weekday())  # 月曜始まり
+    if granularity == "month":
+        return d.replace(day=1)
+    return d
+
+
+def _periods(date_from: date, date_to: date, granularity: str) -> list[date]:
+    periods, d = [], bucket(date_from, granularity)
+    while d <= date_to:
+        periods.append(d)
+        if granularity == "month":
+            d = (d + timedelta(days=32)).replace(day=1)
+        else:
+            d += timedelta(days=7 if granularity == "week" else 1)
+    return periods
+
+
+def timeseries(db: Session, metric: str, date_from: date, date_to: date, granularity: str = "day") -> dict:
+    """集計テーブルから推移を作る。期間内で値が無い区間は 0 で埋める"""
+    if metric not in TIMESERIES_METRICS:
+        raise ValueError(f"unknown metric: {metric}")
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"unknown granularity: {granularity}")
+    if date_from > date_to:
+        raise ValueError("from は to 以前の日付にしてください")
+    if (date_to - date_from).days >= MAX_RANGE_DAYS:
+        raise ValueError(f"期間は {MAX_RANGE_DAYS} 日以内にしてください")
+
+    source = {
+        "visits": ("visits",),
+        "repeat_rate": ("visits", "repeat_visits"),
+        "category_mix": ("category_items",),
+        "staff_visits": ("staff_visits",),
+    }[metric]
+    rows = db.execute(
+        select(R.day, R.metric, R.dim, R.value)
+        .where(R.metric.in_(source), R.day.between(date_from, date_to))
+    ).all()
+
+    # (metric, dim) → 区間 → 合計
+    sums: dict[tuple[str, str], dict[date, int]] = {}
+    for day, m, dim, value in rows:
+        per_period = sums.setdefault((m, dim), {})
+        key = bucket(day, granularity)
+        per_period[key] = per_period.get(key, 0) + value
+
+    periods = _periods(date_from, date_to, granularity)
+    if metric == "repeat_rate":
+        visits = sums.get(("visits", ""), {})
+        repeats = sums.get(("repeat_visits", ""), {})
+        series = {"total": {p: round(repeats.get(p, 0) / visits[p], 4) for p in periods if visits.get(p)}}
+    elif metric == "visits":
+        series = {"total": sums.get(("visits", ""), {})}
+    else:
+        series = {(dim or "unassigned"): per_period for (_, dim), per_period in sums.items()}
+
+    return {
+        "metric": metric,
+        "granularity": granularity,
+        "date_from": date_from,
+        "date_to": date_to,
+        "series": [
+            {"key": key, "points": [{"period": p, "value": values.get(p, 0)} for p in periods]}
+            for key, values in sorted(series.items())
+        ],
+    }
@@ -1,11 +1,11 @@
 # app/routers/customers.py
 from typing import Optional, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
-from ..database import get_db
-from .. import schemas, crud
+from ..database import get_async_db
+from .. import schemas, crud_async
+from ..pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(
     prefix="/customers",
@@ -13,33 +13,46 @@ router = APIRouter(
 )
 
 @router.post("", response_model=schemas.CustomerRead)
-def create_customer_endpoint(
+async def create_customer_endpoint(
     customer: schemas.CustomerCreate,
-    db: Session = Depends(get_db),
+    db=Depends(get_async_db),
 ):
-    return crud.create_customer(db, customer)
+    return await crud_async.create_customer(db, customer)
 
+# 次ページがあれば X-Next-Cursor ヘッダにカーソルを入れて返す
 @router.get("", response_model=List[schemas.CustomerRead])
-def list_customers(q: Optional[str] = None, db: Session = Depends(get_db)):
-    return crud.get_customers(db, q=q)
+async def list_customers(
+    response: Response,
+    q: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    db=Depends(get_async_db),
+):
+    try:
+        page = await crud_async.get_customers(db, q=q, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
 
 @router.get("/{customer_id}", response_model=schemas.CustomerRead)
-def read_customer(customer_id: int, db: Session = Depends(get_db)):
-    customer = crud.get_customer(db, customer_id)
+async def read_customer(customer_id: int, db=Depends(get_async_db)):
+    customer = await crud_async.get_customer(db, customer_id)
     if customer is None:
         raise HTTPException(status_code=404, detail="Customer not found")
     return customer
 
 @router.patch("/{customer_id}", response_model=schemas.CustomerRead)
-def update_customer(customer_id: int, customer_in: schemas.CustomerUpdate, db: Session = Depends(get_db)):
-    updated = crud.update_customer(db, customer_id, customer_in)
+async def update_customer(customer_id: int, customer_in: schemas.CustomerUpdate, db=Depends(get_async_db)):
+    updated = await crud_async.update_customer(db, customer_id, customer_in)
     if not updated:
         raise HTTPException(status_code=404, detail="Customer not found")
     return updated
 
 @router.delete("/{customer_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_customer(customer_id: int, db: Session = Depends(get_db)):
-    ok = crud.delete_customer(db, customer_id)
+async def delete_customer(customer_id: int, db=Depends(get_async_db)):
+    ok = await crud_async.delete_customer(db, customer_id)
     if not ok:
         raise HTTPException(status_code=404, detail="Customer not found")
     return
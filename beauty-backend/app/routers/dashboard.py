@@ -1,17 +1,45 @@
 # app/routers/dashboard.py
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from typing import List
+import asyncio
+from datetime import date, timedelta
 
-from ..database import get_db
-from .. import crud, schemas
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Literal, Optional
+
+from ..database import get_async_db
+from .. import crud_async, dashboard, schemas
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
+# キャッシュが切れた瞬間に端末からのポーリングが重なっても、集計は1回だけ走らせる
+_summary_lock = asyncio.Lock()
+
+@router.get("/summary", response_model=schemas.DashboardSummary)
+async def summary(db=Depends(get_async_db)):
+    cached = dashboard.get_cached()
+    if cached is not None:
+        return cached
+    async with _summary_lock:
+        return await crud_async.get_dashboard_summary(db)  # 待っている間に誰かが集計していればキャッシュを返す
+
 @router.get("/inactive-customers", response_model=List[schemas.InactiveCustomerTarget])
-def inactive_customers(segment: str = "skincare", db: Session = Depends(get_db)):
-    return crud.get_inactive_customers_by_segment(db, segment=segment)
+async def inactive_customers(segment: str = "skincare", db=Depends(get_async_db)):
+    return await crud_async.get_inactive_customers_by_segment(db, segment=segment)
 
 @router.get("/monthly-new-count")
-def monthly_new_count(db: Session = Depends(get_db)):
-    return {"count": crud.get_monthly_new_customer_count(db)}
+async def monthly_new_count(db=Depends(get_async_db)):
+    return {"count": await crud_async.get_monthly_new_customer_count(db)}
+
+@router.get("/timeseries", response_model=schemas.Timeseries)
+async def timeseries(
+    metric: Literal["visits", "repeat_rate", "category_mix", "staff_visits"] = "visits",
+    date_from: Optional[date] = Query(None, alias="from"),  # 省略時は to の29日前から
+    date_to: Optional[date] = Query(None, alias="to"),      # 省略時は今日まで
+    granularity: Literal["day", "week", "month"] = "day",
+    db=Depends(get_async_db),
+):
+    date_to = date_to or date.today()
+    date_from = date_from or date_to - timedelta(days=29)
+    try:
+        return await crud_async.get_timeseries(db, metric, date_from, date_to, granularity)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) #期間の指定が不正
@@ -1,9 +1,12 @@
 # app/routers/emails.py
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from .. import schemas
-from ..database import get_db
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from .. import crud_async, schemas
+from ..database import get_async_db
 from ..auth import get_current_user
+from ..mail_worker import worker
+from ..pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(
     prefix="/emails",
@@ -25,9 +28,9 @@ def user_label(u):
     )
 
 @router.post("/test", response_model=schemas.EmailSendResponse)
-def send_test_email(
+async def send_test_email(
     payload: schemas.EmailTestRequest,
-    db: Session = Depends(get_db),
+    db=Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
     # 実際の開発ならここでメール送信サービス（SendGrid等）を呼ぶ
@@ -42,20 +45,59 @@ def send_test_email(
         sent_count=1,
     )
 
+# 一斉送信：宛先を outbox に登録して job_id をすぐ返す（送信はバックグラウンドの mail_worker）
 @router.post("/bulk", response_model=schemas.EmailSendResponse)
-def send_bulk_email(
+async def send_bulk_email(
     payload: schemas.EmailBulkRequest,
-    db: Session = Depends(get_db),
+    db=Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
-    print("==== [BULK EMAIL] ====")
-    print(f"requested by: {user_label(current_user)} (id={user_get(current_user, 'id', 'unknown')})")
-    print(f"to customer_ids: {payload.customer_ids}")
-    print(f"subject: {payload.subject}")
-    print(f"body:\n{payload.body}")
-    print("======================")
+    try:
+        job = await crud_async.enqueue_email_job(
+            db,
+            subject=payload.subject,
+            body=payload.body,
+            customer_ids=payload.customer_ids,
+            requested_by=user_label(current_user),
+            segment=payload.segment,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) #テンプレートの差し込み項目が不正
+    worker.notify()
 
     return schemas.EmailSendResponse(
-        message="一斉メール送信処理を実行しました（ダミー）",
-        sent_count=len(payload.customer_ids),
+        message="一斉メール送信を受け付けました",
+        sent_count=job.total_count,
+        job_id=job.id,
     )
+
+# 一斉送信ジョブの進捗
+@router.get("/jobs/{job_id}", response_model=schemas.EmailJobRead)
+async def get_email_job(
+    job_id: int,
+    db=Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    job = await crud_async.get_email_job(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Email job not found")
+    return job
+
+# 一斉送信の宛先ごとの結果（status で絞り込み可。次ページは X-Next-Cursor）
+@router.get("/jobs/{job_id}/recipients", response_model=List[schemas.EmailRecipientRead])
+async def list_email_job_recipients(
+    job_id: int,
+    response: Response,
+    status: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    db=Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    try:
+        page = await crud_async.get_email_recipients(db, job_id, status=status, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
@@ -0,0 +1,69 @@
+# app/routers/export.py
+# 顧客・来店の全件エクスポート（ストリーミングで返すので件数が増えてもメモリは一定）
+#
+# DB_ASYNC に関係なく同期の SessionLocal で読む（get_async_db / crud_async は通らない。来店の取り込みと同じ）。
+# yield_per のサーバー側カーソルを同期のジェネレーターで回し、StreamingResponse がスレッドプールで
+# 1かたまりずつ進めるので、イベントループは止めない。接続はレスポンスを返し終わるまで同期エンジンのプールから1本使う
+from datetime import date
+from typing import Iterator, Literal, Optional
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from ..database import SessionLocal
+from .. import export
+from ..auth import get_current_user
+
+router = APIRouter(
+    prefix="/export",
+    tags=["export"],
+)
+
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+
+
+def _stream(name: str, format: str, gzip: bool, build) -> StreamingResponse:
+    # セッションはレスポンスを返し終わるまで使うので、get_db ではなくジェネレーターの中で開く
+    def body() -> Iterator[bytes]:
+        with SessionLocal() as db:
+            yield from build(db)
+
+    chunks = export.gzip_stream(body()) if gzip else body()
+    filename = f"{name}-{date.today():%Y%m%d}.{format}" + (".gz" if gzip else "")
+    return StreamingResponse(
+        chunks,
+        media_type="application/gzip" if gzip else MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/customers")
+def export_customers(
+    format: Literal["csv", "ndjson"] = "csv",
+    gzip: bool = False,
+    current_user=Depends(get_current_user),
+):
+    def build(db):
+        rows = export.iter_customer_rows(db)
+        if format == "csv":
+            return export.to_csv(rows, export.CUSTOMER_COLUMNS)
+        return export.to_ndjson(rows)
+
+    return _stream("customers", format, gzip, build)
+
+
+# CSV は1行 = 1明細（visit_import の CSV と同じ列。同じ DB に取り込み直すと来店は重複する）、NDJSON は1行 = 1来店（明細は items に入れる）
+@router.get("/visits")
+def export_visits(
+    format: Literal["csv", "ndjson"] = "csv",
+    gzip: bool = False,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    current_user=Depends(get_current_user),
+):
+    def build(db):
+        rows = export.iter_visit_rows(db, date_from=date_from, date_to=date_to)
+        if format == "csv":
+            return export.to_csv(rows, export.VISIT_COLUMNS)
+        return export.to_ndjson(export.group_visits(rows))
+
+    return _stream("visits", format, gzip, build)
@@ -1,11 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
-from sqlalchemy.orm import Session
-from datetime import date, timedelta
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from typing import List, Optional
+from datetime import date
 
-from .. import models, schemas
-from ..database import get_db
+from .. import crud_async, schemas
+from ..database import get_async_db
+from ..pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(
     prefix="/follow-mail",
@@ -16,68 +15,83 @@ router = APIRouter(
 # birthday / event 用（Customer単位）
 # =========================
 @router.get("/targets", response_model=List[schemas.MailTarget])
-def fetch_targets_for_customer_mails(
+async def fetch_targets_for_customer_mails(
     mail_type: schemas.MailType,   # birthday / event / purchase_follow
     within_days: int = 365,         # 直近◯日以内（デフォ1年）
-    db: Session = Depends(get_db),
+    db=Depends(get_async_db),
 ):
-    # purchase_follow は dashboard のAPIへ誘導
+    # purchase_follow は専用のAPIへ誘導
     if mail_type == schemas.MailType.purchase_follow:
         raise HTTPException(
             status_code=400,
-            detail="purchase_follow は /dashboard/inactive-customers を使う",
+            detail="purchase_follow は /follow-mail/purchase-follow/targets を使う",
         )
 
-    since = date.today() - timedelta(days=within_days)
+    # 直近来店あり + メール同意 + emailあり（条件は segments.SEGMENTS。最新来店日は Customer.last_visit_date）
+    rows = await crud_async.get_mail_targets(db, mail_type, within_days=within_days)
+    return [
+        schemas.MailTarget(
+            id=r.id,
+            name=r.name,
+            email=r.email,
+            birthday=r.birthday,
+            latest_visit_date=r.last_visit_date,
+        )
+        for r in rows
+    ]
+
 
-    # 顧客ごとの最新来店日
-    latest_visit_sq = (
-        db.query(
-            models.Visit.customer_id.label("customer_id"),
-            func.max(models.Visit.visit_date).label("latest_visit_date"),
+# =========================
+# 誕生日が近い人（今日から days 日以内。年末年始のまたぎも対応）
+# =========================
+@router.get("/upcoming-birthdays", response_model=List[schemas.UpcomingBirthdayTarget])
+async def fetch_upcoming_birthdays(
+    days: int = Query(30, ge=0, le=366),  # 今日から◯日以内に誕生日
+    within_days: int = 365,               # 直近◯日以内に来店あり
+    db=Depends(get_async_db),
+):
+    today = date.today()
+    rows = await crud_async.get_upcoming_birthday_targets(db, days=days, within_days=within_days, today=today)
+    return [
+        schemas.UpcomingBirthdayTarget(
+            id=c.id,
+            name=c.name,
+            email=c.email,
+            birthday=c.birthday,
+            latest_visit_date=latest,
+            next_birthday=nb,
+            days_until=(nb - today).days,
         )
-        .group_by(models.Visit.customer_id)
-        .subquery()
-    )
+        for (c, latest, nb) in rows
+    ]
 
-    # ベース：直近来店あり + メール同意 + emailあり
-    q = (
-        db.query(models.Customer, latest_visit_sq.c.latest_visit_date)
-        .join(latest_visit_sq, latest_visit_sq.c.customer_id == models.Customer.id)
-        .filter(latest_visit_sq.c.latest_visit_date >= since)
-        .filter(models.Customer.email.isnot(None))
-        .filter(models.Customer.email_opt_in.is_(True))
-    )
 
-    if mail_type == schemas.MailType.event:
-        rows = q.order_by(models.Customer.id.desc()).all()
-        return [
-            schemas.MailTarget(
-                id=c.id,
-                name=c.name,
-                email=c.email,
-                birthday=c.birthday,
-                latest_visit_date=latest,
-            )
-            for (c, latest) in rows
-        ]
+# =========================
+# purchase_follow: フォロー期限が来ていて未送信の購入品（期限の古い順。次ページは X-Next-Cursor）
+# =========================
+@router.get("/purchase-follow/targets", response_model=List[schemas.PurchaseFollowTarget])
+async def fetch_purchase_follow_targets(
+    response: Response,
+    category: Optional[str] = None,  # skincare / makeup（省略で全カテゴリ）
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    db=Depends(get_async_db),
+):
+    try:
+        page = await crud_async.get_purchase_follow_targets(db, category=category, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
 
-    if mail_type == schemas.MailType.birthday:
-        this_month = date.today().month
-        q2 = (
-            q.filter(models.Customer.birthday.isnot(None))
-             .filter(func.extract("month", models.Customer.birthday) == this_month)
-        )
-        rows = q2.order_by(models.Customer.id.desc()).all()
-        return [
-            schemas.MailTarget(
-                id=c.id,
-                name=c.name,
-                email=c.email,
-                birthday=c.birthday,
-                latest_visit_date=latest,
-            )
-            for (c, latest) in rows
-        ]
 
-    raise HTTPException(status_code=400, detail="Unsupported mail_type")
+# =========================
+# purchase_follow: 送信済みをまとめて記録（未送信のものだけ）
+# =========================
+@router.post("/purchase-follow/mark-sent", response_model=schemas.PurchaseFollowMarkResult)
+async def mark_purchase_follow_sent(
+    payload: schemas.PurchaseFollowMarkRequest,
+    db=Depends(get_async_db),
+):
+    return await crud_async.mark_purchase_follow_sent_bulk(db, payload.visit_item_ids)
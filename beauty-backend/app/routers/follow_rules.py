@@ -0,0 +1,45 @@
+# app/routers/follow_rules.py
+# フォロー周期ルールの一覧・登録・削除
+# ルールを変えたら、未送信の明細の follow_due_date をバックグラウンドで作り直す
+from typing import List
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from .. import crud_async, follow_rules, schemas
+from ..database import get_async_db, SessionLocal
+from ..auth import get_current_user
+
+router = APIRouter(
+    prefix="/follow-rules",
+    tags=["follow-rules"],
+)
+
+@router.get("", response_model=List[schemas.FollowRuleRead])
+async def list_follow_rules(
+    db=Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    return await crud_async.list_follow_rules(db)
+
+# 登録 or 更新（category + product_name が同じルールがあれば日数を上書き）
+@router.put("", response_model=schemas.FollowRuleRead)
+async def upsert_follow_rule(
+    payload: schemas.FollowRuleUpsert,
+    background_tasks: BackgroundTasks,
+    db=Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    rule = await crud_async.upsert_follow_rule(db, payload.category, payload.product_name, payload.cycle_days)
+    background_tasks.add_task(follow_rules.recompute_due_dates, SessionLocal, rule.category, rule.product_name)
+    return rule
+
+@router.delete("/{rule_id}", status_code=204)
+async def delete_follow_rule(
+    rule_id: int,
+    background_tasks: BackgroundTasks,
+    db=Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    rule = await crud_async.delete_follow_rule(db, rule_id)
+    if rule is None:
+        raise HTTPException(status_code=404, detail="Follow rule not found")
+    background_tasks.add_task(follow_rules.recompute_due_dates, SessionLocal, rule.category, rule.product_name)
@@ -0,0 +1,28 @@
+# app/routers/segments.py
+# セグメントのプレビュー（キャンペーンの前に「この条件だと何人か」を確かめる）
+from fastapi import APIRouter, Depends, HTTPException
+
+from ..database import get_async_db
+from .. import crud_async, schemas, segments
+from ..auth import get_current_user
+
+router = APIRouter(
+    prefix="/segments",
+    tags=["segments"],
+)
+
+
+# 条件ツリー（schemas.SegmentFilter）に合う人数と先頭 limit 人
+# 人数は SEGMENT_COUNT_CAP で打ち切り（count_capped）、SQL が SEGMENT_PREVIEW_TIMEOUT 秒を超えたら 503
+@router.post("/preview", response_model=schemas.SegmentPreview)
+async def preview_segment(
+    payload: schemas.SegmentPreviewRequest,
+    db=Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    try:
+        return await crud_async.preview_segment(db, payload.filter, limit=payload.limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except segments.SegmentTimeout as e:
+        raise HTTPException(status_code=503, detail=str(e))
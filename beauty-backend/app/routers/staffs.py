@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Header
-from sqlalchemy.orm import Session
 import os
 
-from .. import schemas, crud
-from ..database import get_db
+from .. import schemas, crud_async
+from ..database import get_async_db
 from ..auth import get_current_user, get_optional_user
+from ..security import PasswordHashBusy, get_password_hash_async, verify_password_async
 
 router = APIRouter(
     prefix="/staffs",
@@ -12,22 +12,39 @@ router = APIRouter(
 )
 
 
+# パスワードの照合・ハッシュ作成が混み合っているとき（ログインと同じく 503）
+def _hash_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="混み合っています。少し待ってから再度お試しください",
+        headers={"Retry-After": "1"},
+    )
+
+
+# pbkdf2 はスレッドで計算し、出来上がったハッシュを crud に渡す
+async def _hash_password(password: str) -> str:
+    try:
+        return await get_password_hash_async(password)
+    except PasswordHashBusy:
+        raise _hash_busy()
+
+
 @router.get("/", response_model=list[schemas.StaffRead])
-def list_staffs(
-    db: Session = Depends(get_db),
+async def list_staffs(
+    db=Depends(get_async_db),
     current_user=Depends(get_current_user),  # 一覧はログイン必須
 ):
-    return crud.get_staffs(db)
+    return await crud_async.get_staffs(db)
 
 
 @router.post("/", response_model=schemas.StaffRead)
-def create_staff(
+async def create_staff(
     staff: schemas.StaffCreate,
-    db: Session = Depends(get_db),
+    db=Depends(get_async_db),
     current_user=Depends(get_optional_user),  #（トークン無しなら None）
     x_bootstrap_code: str | None = Header(default=None, alias="X-Bootstrap-Code"),
 ):
-    staff_count = crud.count_staffs(db)
+    staff_count = await crud_async.count_staffs(db)
 
     # .env の値を読む
     secret = os.getenv("STAFF_BOOTSTRAP_CODE")
@@ -44,7 +61,7 @@ def create_staff(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Bootstrap code が違います（X-Bootstrap-Code）",
             )
-        return crud.create_staff(db, staff)
+        return await crud_async.create_staff(db, staff, await _hash_password(staff.password))
 
     # 1人以上ならログイン必須
     if current_user is None:
@@ -53,4 +70,40 @@ def create_staff(
             detail="Not authenticated",
         )
 
-    return crud.create_staff(db, staff)
+    return await crud_async.create_staff(db, staff, await _hash_password(staff.password))
+
+
+# スタッフ情報の更新（名前・無効化・パスワード変更）。無効化・パスワード変更はすぐ認証に反映される
+# 変更できるのは自分の情報だけ（他のスタッフのパスワード変更・無効化は不可）。
+# パスワード変更は現在のパスワードの確認が必要（トークンを盗まれただけでは乗っ取れないように）
+@router.patch("/{staff_id}", response_model=schemas.StaffRead)
+async def update_staff(
+    staff_id: int,
+    staff_in: schemas.StaffUpdate,
+    db=Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    if current_user["id"] != staff_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="他のスタッフの情報は変更できません",
+        )
+
+    if staff_in.password:
+        if not staff_in.current_password:
+            raise HTTPException(status_code=400, detail="パスワードを変更するには current_password が必要です")
+        staff = await crud_async.get_staff_by_id(db, staff_id)
+        if staff is None:
+            raise HTTPException(status_code=404, detail="Staff not found")
+        try:
+            ok = await verify_password_async(staff_in.current_password, staff.hashed_password)
+        except PasswordHashBusy:
+            raise _hash_busy()
+        if not ok:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="現在のパスワードが違います")
+
+    hashed = await _hash_password(staff_in.password) if staff_in.password else None
+    staff = await crud_async.update_staff(db, staff_id, staff_in, hashed)
+    if staff is None:
+        raise HTTPException(status_code=404, detail="Staff not found")
+    return staff
@@ -1,42 +1,132 @@
 # app/routers/visits.py
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
-from ..database import get_db
-from .. import schemas, crud
+import io
+
+import anyio
+from anyio.from_thread import run as run_from_thread
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from typing import List, Literal, Optional
+from ..database import get_async_db, SessionLocal
+from .. import schemas, crud_async, visit_import
+from ..auth import get_current_user
+from ..pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/visits", tags=["visits"])
 
+# 取り込み中に先読みしておく本文のかたまりの数（これ以上たまると受信を待たせる = メモリは一定）
+IMPORT_READ_AHEAD = 16
+
 #フロントから新しく来店記録を登録（POST）
 @router.post("/", response_model=schemas.VisitRead)
-def create_visit(payload: schemas.VisitCreate, db: Session = Depends(get_db)): #フロントから送られてきた内容をschema指定の形でdbが登録
+async def create_visit(payload: schemas.VisitCreate, db=Depends(get_async_db)): #フロントから送られてきた内容をschema指定の形でdbが登録
     try:
-        return crud.create_visit(db, payload) #crud.create_visiに登録依頼
+        return await crud_async.create_visit(db, payload) #crud.create_visiに登録依頼
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) #登録できなかった場合400 Bad Requestを返す
 
-#来店履歴を取得(GET)
+
+class _BodyReader(io.RawIOBase):
+    """取り込みスレッドから、イベントループ側で受信中のリクエスト本文を読むファイル
+
+    受信側（_feed）がメモリストリームに入れたかたまりを、スレッドから1つずつ受け取る。
+    受信側で起きた例外（切断など）はここで投げ直し、取り込み中のチャンクを commit させない
+    """
+
+    def __init__(self, receive):
+        self._receive = receive
+        self._buf = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        if not self._buf:
+            try:
+                data = run_from_thread(self._receive.receive)
+            except anyio.EndOfStream:
+                return 0
+            if isinstance(data, Exception):
+                raise data
+            self._buf = data
+        n = min(len(b), len(self._buf))
+        b[:n] = self._buf[:n]
+        self._buf = self._buf[n:]
+        return n
+
+
+async def _feed(request: Request, send) -> None:
+    # 本文を受け取ったそばからスレッドに渡す（取り込みが追いつかなければ send が待つ）
+    async with send:
+        try:
+            async for data in request.stream():
+                if data:
+                    await send.send(data)
+        except anyio.BrokenResourceError:
+            pass  # 取り込み側が先に終わった（ヘッダ不正など）。残りは読まない
+        except Exception as e:
+            await send.send(e)
+
+
+#来店履歴の一括取り込み（POS・旧システムからの移行）
+#本文は CSV / NDJSON をそのまま送る。受け取りながらスレッドで読み、chunk_size 来店ずつ登録（本文全体はためない）
+@router.post("/import", response_model=schemas.VisitImportResult)
+async def import_visits(
+    request: Request,
+    format: Literal["csv", "ndjson"] = "ndjson",
+    chunk_size: int = Query(1000, ge=1, le=10000),
+    current_user=Depends(get_current_user),
+):
+    send, receive = anyio.create_memory_object_stream(max_buffer_size=IMPORT_READ_AHEAD)
+
+    def run():
+        try:
+            raw = io.BufferedReader(_BodyReader(receive))
+            with SessionLocal() as db, io.TextIOWrapper(raw, encoding="utf-8-sig", newline="") as f:
+                return visit_import.import_visits(db, visit_import.read_records(f, format), chunk_size=chunk_size)
+        finally:
+            run_from_thread(receive.aclose)  # 受信側が待っていれば BrokenResourceError で止まる
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_feed, request, send)
+        try:
+            return await anyio.to_thread.run_sync(run)
+        except (ValueError, UnicodeDecodeError) as e:
+            error = str(e) #CSV のヘッダ不足・文字コード不正など
+    raise HTTPException(status_code=400, detail=error)
+
+#来店履歴を取得(GET)　※次ページがあれば X-Next-Cursor ヘッダにカーソルを入れて返す
 @router.get("/by-customer/{customer_id}", response_model=List[schemas.VisitRead]) #List=複数ある来店履歴
-def list_visits_by_customer(customer_id: int, db: Session = Depends(get_db)): #顧客IDで来店履歴を取ってくる
-    return crud.get_visits_by_customer(db, customer_id) #crud.get_visitsに取得依頼
+async def list_visits_by_customer(
+    customer_id: int,
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    db=Depends(get_async_db),
+): #顧客IDで来店履歴を取ってくる
+    try:
+        page = await crud_async.get_visits_by_customer(db, customer_id, limit=limit, cursor=cursor) #crud.get_visitsに取得依頼
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) #カーソルが壊れている場合400 Bad Requestを返す
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
 
 #来店記録を削除
 @router.delete("/{visit_id}") #削除したい来店記録をIDで指定して取ってくる
-def delete_visit_endpoint(visit_id: int, db: Session = Depends(get_db)):
-    ok = crud.delete_visit(db, visit_id) #crud.delete_visiに削除依頼
+async def delete_visit_endpoint(visit_id: int, db=Depends(get_async_db)):
+    ok = await crud_async.delete_visit(db, visit_id) #crud.delete_visiに削除依頼
     if not ok: #削除完了
         raise HTTPException(status_code=404, detail="Visit not found") #削除できなかった場合404 Not Foundを返す
     return {"ok": True}
 
 #来店記録を編集して更新
 @router.put("/{visit_id}", response_model=schemas.VisitRead) #来店記録のIDを指定して取ってくる
-def update_visit_endpoint(
+async def update_visit_endpoint(
     visit_id: int, #URLからどの来店を編集するか
     payload: schemas.VisitUpdate, #修正したい内容
-    db: Session = Depends(get_db), #データベース操作
+    db=Depends(get_async_db), #データベース操作
 ):
     try:
-        updated = crud.update_visit(db, visit_id, payload) #更新依頼
+        updated = await crud_async.update_visit(db, visit_id, payload) #更新依頼
         if not updated:
             raise HTTPException(status_code=404, detail="Visit not found") #更新できなかった場合404 Not Foundで返す
         return updated #正常に更新できたら更新内容を返す
@@ -45,7 +135,7 @@ def update_visit_endpoint(
 
 #本日の来店数を取得
 @router.get("/today-count")
-def get_today_count(db: Session = Depends(get_db)):
+async def get_today_count(db=Depends(get_async_db)):
     return {
-        "count": crud.get_today_visit_count(db)
+        "count": await crud_async.get_today_visit_count(db)
     }
\ No newline at end of file
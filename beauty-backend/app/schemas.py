@@ -1,8 +1,8 @@
 # app/schemas.py
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from enum import Enum
 from datetime import date, datetime
-from typing import Optional,List
+from typing import Any, List, Literal, Optional, Union
 
 #//////////////////////
 #購入品の共通部分
@@ -52,6 +52,23 @@ class VisitRead(VisitBase):
     class Config:
         from_attributes = True
 
+#来店の一括取り込みの結果
+class VisitImportError(BaseModel):
+    line: int
+    error: str
+
+class VisitImportResult(BaseModel):
+    visits: int        # 登録した来店数
+    items: int         # 登録した明細数
+    skipped: int       # 不正で飛ばした来店数
+    chunks: int
+    elapsed_sec: float
+    rows_per_sec: float
+    errors: List[VisitImportError]  # 先頭100件まで
+
+    class Config:
+        from_attributes = True
+
 #顧客＋カテゴリの最終来店
 class InactiveCustomerTarget(BaseModel):
     customer_id: int
@@ -61,6 +78,36 @@ class InactiveCustomerTarget(BaseModel):
     days_since: int
     segment: str
 
+#ダッシュボード上部のサマリー（/dashboard/summary）
+class InactiveSegmentSummary(BaseModel):
+    segment: str
+    threshold_days: int
+    count: int                               # 来店なし顧客の人数
+    customers: List[InactiveCustomerTarget]  # 来店が空いている順に先頭数名
+
+class DashboardSummary(BaseModel):
+    date: date
+    today_visit_count: int
+    monthly_new_customer_count: int
+    inactive: List[InactiveSegmentSummary]
+    generated_at: datetime
+
+#推移グラフ（/dashboard/timeseries）
+class TimeseriesPoint(BaseModel):
+    period: date   # 区間の初日（週は月曜・月は1日）
+    value: float
+
+class TimeseriesSeries(BaseModel):
+    key: str       # total / カテゴリ / スタッフID（担当なしは unassigned）
+    points: List[TimeseriesPoint]
+
+class Timeseries(BaseModel):
+    metric: str
+    granularity: str
+    date_from: date
+    date_to: date
+    series: List[TimeseriesSeries]
+
 
 #//////////////////////
 # 顧客の基本情報（共通）
@@ -109,12 +156,21 @@ class StaffCreate(BaseModel):
     email: EmailStr
     password: str
 
+# スタッフ情報を更新するとき（送った項目だけ変更。is_active=False で無効化）
+# 変更できるのは自分の情報だけ。password を変えるときは current_password も必要
+class StaffUpdate(BaseModel):
+    name: Optional[str] = None
+    is_active: Optional[bool] = None
+    password: Optional[str] = None
+    current_password: Optional[str] = None
+
 #スタッフ詳細を画面に返す
 class StaffRead(BaseModel):
     id: int
     staff_code: Optional[str] = None
     name: Optional[str] = None
     email: EmailStr
+    is_active: Optional[bool] = True
     class Config:
         from_attributes = True
 
@@ -128,15 +184,48 @@ class EmailTestRequest(BaseModel):
     body: str
 
 #複数人への一斉送信
+#subject / body には {{name}} {{last_visit_date}} {{product_name}} などを差し込める（mail_templates.FIELDS）
 class EmailBulkRequest(BaseModel):
     subject: str
     body: str
     customer_ids: List[int]
+    segment: Optional[str] = None  # "skincare" など。{{product_name}} {{days_since}} をそのカテゴリの最終購入で埋める
 
-#フロントへ返す送信結果
+#フロントへ返す送信結果（一斉送信は受付のみ。sent_count は送信予定の件数、進捗は job_id で確認）
 class EmailSendResponse(BaseModel):
     message: str
     sent_count: int
+    job_id: Optional[int] = None
+
+#一斉送信ジョブの状態
+class EmailJobRead(BaseModel):
+    id: int
+    subject: str
+    segment: Optional[str] = None
+    status: str  # queued / running / done
+    requested_by: Optional[str] = None
+    total_count: int
+    sent_count: int
+    failed_count: int
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+#一斉送信の宛先ごとの結果
+class EmailRecipientRead(BaseModel):
+    id: int
+    customer_id: Optional[int] = None
+    email: str
+    status: str  # pending / sending / sent / logged / failed
+    attempts: int
+    error: Optional[str] = None
+    sent_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
 
 #メールの種類(誕生日、イベント、フォロー対象)
 class MailType(str, Enum):
@@ -154,3 +243,120 @@ class MailTarget(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+#誕生日が近い人（N日以内）
+class UpcomingBirthdayTarget(MailTarget):
+    next_birthday: date  # 次の誕生日
+    days_until: int      # 今日から何日後か
+
+
+#購入フォローの送信済みをまとめて記録
+class PurchaseFollowMarkRequest(BaseModel):
+    visit_item_ids: List[int] = Field(..., min_length=1, max_length=10000)
+
+#送信済み記録の結果（今回記録した / すでに送信済みだった / 存在しない）
+class PurchaseFollowMarkResult(BaseModel):
+    sent_at: datetime
+    marked: List[int]
+    already_sent: List[int]
+    not_found: List[int]
+
+
+#購入フォロー対象（フォロー期限が来ていて未送信の購入品）
+class PurchaseFollowTarget(BaseModel):
+    visit_item_id: int
+    customer_id: int
+    name: str
+    email: EmailStr
+    category: str
+    product_name: Optional[str] = None
+    visit_date: date
+    follow_due_date: date
+    days_overdue: int  # 期限から何日過ぎているか
+
+
+#フォロー周期ルール（product_name なし = カテゴリ全体のルール）
+class FollowRuleUpsert(BaseModel):
+    category: str
+    product_name: Optional[str] = None
+    cycle_days: int = Field(..., ge=0)
+
+class FollowRuleRead(FollowRuleUpsert):
+    id: int
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+#セグメントのプレビュー（/segments/preview）の条件ツリー
+# 例: 配信OKで、直近180日に makeup を買い、skincare は買っていない人
+#   {"and": [
+#     {"field": "customer.email_opt_in", "op": "eq", "value": true},
+#     {"exists": "purchase", "where": {"and": [
+#       {"field": "item.category", "op": "eq", "value": "makeup"},
+#       {"field": "visit.visit_date", "op": "within_days", "value": 180}]}},
+#     {"not": {"exists": "purchase", "where": {"and": [
+#       {"field": "item.category", "op": "eq", "value": "skincare"},
+#       {"field": "visit.visit_date", "op": "within_days", "value": 180}]}}}]}
+# 使えるフィールドは segments.FIELDS（visit.* / item.* は exists・count の where の中だけ）
+SegmentOp = Literal[
+    "eq", "ne", "lt", "lte", "gt", "gte", "in", "not_in", "is_null", "not_null", "contains",
+    "within_days",  # 日付が今日から◯日以内
+    "before_days",  # 日付が今日から◯日より前
+]
+
+class SegmentCondition(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    field: str                 # "customer.birth_month" / "visit.visit_date" / "item.category" など
+    op: SegmentOp
+    value: Any = None          # is_null / not_null では不要。in / not_in はリスト
+
+class SegmentAnd(BaseModel):
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+    and_: List["SegmentFilter"] = Field(..., alias="and", min_length=1)
+
+class SegmentOr(BaseModel):
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+    or_: List["SegmentFilter"] = Field(..., alias="or", min_length=1)
+
+class SegmentNot(BaseModel):
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+    not_: "SegmentFilter" = Field(..., alias="not")
+
+class SegmentExists(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    exists: Literal["visit", "purchase"]  # visit: 来店 / purchase: 購入品（明細と来店）
+    where: Optional["SegmentFilter"] = None
+
+class SegmentCount(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    count: Literal["visit", "purchase"]   # 条件に合う来店・購入品の数を比べる
+    where: Optional["SegmentFilter"] = None
+    op: Literal["eq", "ne", "lt", "lte", "gt", "gte"]
+    value: int = Field(..., ge=0)
+
+SegmentFilter = Union[SegmentAnd, SegmentOr, SegmentNot, SegmentExists, SegmentCount, SegmentCondition]
+
+for _model in (SegmentAnd, SegmentOr, SegmentNot, SegmentExists, SegmentCount):
+    _model.model_rebuild()
+
+class SegmentPreviewRequest(BaseModel):
+    filter: SegmentFilter
+    limit: int = Field(50, ge=1, le=200)  # 一緒に返す顧客の人数（ID の新しい順）
+
+class SegmentCustomer(BaseModel):
+    id: int
+    name: str
+    email: Optional[str] = None
+    birthday: Optional[date] = None
+    last_visit_date: Optional[date] = None
+
+    class Config:
+        from_attributes = True
+
+class SegmentPreview(BaseModel):
+    count: int              # 条件に合う人数（count_capped なら「これ以上」）
+    count_capped: bool      # 数えるのを上限で打ち切った
+    customers: List[SegmentCustomer]
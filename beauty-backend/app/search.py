@@ -0,0 +1,374 @@
+# app/search.py
+# 顧客検索（名前・かな・電話・メール）のインデックスと検索処理
+#
+# - SQLite  : FTS5（trigram トークナイザ）の外部コンテンツテーブル + トリガーで同期
+# - Postgres: pg_trgm の GIN インデックス（ILIKE '%q%' がインデックスを使える）
+# - 1〜2文字の検索語（trigram では引けない。日本人の姓の多くは2文字）:
+#   名前・かな・電話・メールの「先頭一致」を B-tree インデックスの範囲検索で引く（部分一致はしない）
+#   SQLite は各カラムの通常のインデックス、PostgreSQL は text_pattern_ops のインデックス（m0006）を使う
+# - それ以外の DB: 従来どおりの ilike 検索
+#
+# 並び順は検索方法ごとに違う（完全な関連度順ではない）:
+# - SQLite FTS: 新しい顧客から RANK_CANDIDATES 件ずつの窓に区切り、窓の中だけ関連度（bm25）順
+#   一致が RANK_CANDIDATES 件以下なら全体が関連度順。それより多いと、古い窓のよく一致する顧客は後のページになる
+# - PostgreSQL: 一致した全件を similarity 順
+# - 先頭一致 / ilike: 新しい顧客順
+import logging
+import re
+import unicodedata
+
+from sqlalchemy import and_, bindparam, func, or_, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from . import models
+from .pagination import Page, paginate, read_cursor
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "customers_fts"
+
+# trigram は3文字未満の語ではインデックスを引けない
+MIN_INDEXED_QUERY_LENGTH = 3
+
+# 関連度で並べ替える単位（窓）の件数（SQLite FTS）
+# "example.com" のようにほぼ全員に当たる語で、全件をスコア計算しないため、一致した顧客を新しい順に
+# この件数ずつの窓に区切り、窓の中を関連度順に返す。窓を読み切ったら次の（より古い）窓に進むので、
+# ページを進めれば古い顧客も必ず出てくる（並びは「新しい窓が先、窓の中は関連度順」。全体の関連度順ではない）
+RANK_CANDIDATES = 1000
+
+_FTS_COLUMNS = ("name", "kana_norm", "phone_norm", "email")
+
+# 短い検索語を先頭一致で探すカラム（どれも B-tree インデックスがある）
+_PREFIX_COLUMNS = ("name", "kana_norm", "phone_norm", "email")
+
+# SQLite の先頭一致の範囲の上端（v 以上 v + この文字未満 = v で始まる。UTF-8 で最大の文字）
+_PREFIX_END = "\U0010ffff"
+
+# 電話番号として扱う入力（数字・ハイフン・括弧・空白・+ のみ）
+_PHONE_LIKE = re.compile(r"^[0-9()+\-\s]+$")
+_WHITESPACE = re.compile(r"\s+")
+
+# SQLite の FTS テーブルが使えるか（bind の URL ごとに1回だけ確認）
+_fts_available: dict[str, bool] = {}
+
+
+# =======================
+# 正規化
+# =======================
+def _hira_to_kata(s: str) -> str:
+    # ひらがな（ぁ〜ゖ）をカタカナに寄せる
+    return "".join(chr(ord(ch) + 0x60) if "ぁ" <= ch <= "ゖ" else ch for ch in s)
+
+
+def normalize_kana(value: str | None) -> str | None:
+    """かなを「全角カタカナ・空白なし」にそろえる（半角ｶﾅ・ひらがな入力でも一致させる）"""
+    if not value:
+        return None
+    s = unicodedata.normalize("NFKC", value)
+    s = _WHITESPACE.sub("", _hira_to_kata(s))
+    return s or None
+
+
+def normalize_phone(value: str | None) -> str | None:
+    """電話番号を数字だけにそろえる（"090-1234-5678" → "09012345678"）"""
+    if not value:
+        return None
+    digits = "".join(ch for ch in unicodedata.normalize("NFKC", value) if ch.isdigit())
+    return digits or None
+
+
+def apply_normalized_fields(customer: models.Customer) -> None:
+    # create_customer / update_customer から呼び、検索用カラムを同期する
+    customer.kana_norm = normalize_kana(customer.kana)
+    customer.phone_norm = normalize_phone(customer.phone)
+
+
+def _query_variants(q: str) -> list[str]:
+    # 検索語を「そのまま」「カタカナ」「数字のみ」の3通りに展開する
+    base = unicodedata.normalize("NFKC", q).strip()
+    variants = [base]
+
+    kana = normalize_kana(base)
+    if kana:
+        variants.append(kana)
+
+    if _PHONE_LIKE.match(base):
+        phone = normalize_phone(base)
+        if phone:
+            variants.append(phone)
+
+    # 重複を除きつつ順序は保つ
+    return list(dict.fromkeys(v for v in variants if v))
+
+
+# =======================
+# インデックス作成
+# =======================
+def setup_search_index(engine: Engine) -> None:
+    """検索用カラムのバックフィルと、DB ごとの検索インデックスを作る（何度呼んでもOK）"""
+    _backfill_normalized_columns(engine)
+
+    if engine.dialect.name == "sqlite":
+        _setup_sqlite_fts(engine)
+    elif engine.dialect.name == "postgresql":
+        _setup_pg_trgm(engine)
+
+
+def _backfill_normalized_columns(engine: Engine, batch_size: int = 1000) -> None:
+    # 既存データの kana_norm / phone_norm を埋める（カラム追加直後の1回だけ実質的に動く）
+    customers = models.Customer.__table__
+    needs_backfill = or_(
+        customers.c.kana.isnot(None) & customers.c.kana_norm.is_(None),
+        customers.c.phone.isnot(None) & customers.c.phone_norm.is_(None),
+    )
+    stmt = (
+        customers.update()
+        .where(customers.c.id == bindparam("_id"))
+        .values(kana_norm=bindparam("_kana_norm"), phone_norm=bindparam("_phone_norm"))
+    )
+
+    last_id = 0
+    with Session(engine) as db:
+        while True:
+            rows = db.execute(
+                select(customers.c.id, customers.c.kana, customers.c.phone)
+                .where(customers.c.id > last_id, needs_backfill)
+                .order_by(customers.c.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+
+            db.execute(stmt, [
+                {
+                    "_id": r.id,
+                    "_kana_norm": normalize_kana(r.kana),
+                    "_phone_norm": normalize_phone(r.phone),
+                }
+                for r in rows
+            ])
+            db.commit()
+            last_id = rows[-1].id
+
+
+def _setup_sqlite_fts(engine: Engine) -> None:
+    cols = ", ".join(_FTS_COLUMNS)
+    new_cols = ", ".join(f"new.{c}" for c in _FTS_COLUMNS)
+    old_cols = ", ".join(f"old.{c}" for c in _FTS_COLUMNS)
+
+    with engine.begin() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": FTS_TABLE},
+        ).first()
+
+        try:
+            conn.execute(text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+                f"{cols}, content='customers', content_rowid='id', tokenize='trigram')"
+            ))
+        except Exception:
+            # FTS5 / trigram が無い SQLite（3.34 未満など）は ilike 検索のまま動かす
+            logger.warning("FTS5 trigram is not available; customer search falls back to LIKE scans")
+            return
+
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON customers BEGIN "
+            f"INSERT INTO {FTS_TABLE}(rowid, {cols}) VALUES (new.id, {new_cols}); END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON customers BEGIN "
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {cols}) VALUES ('delete', old.id, {old_cols}); END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF {cols} ON customers BEGIN "
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {cols}) VALUES ('delete', old.id, {old_cols}); "
+            f"INSERT INTO {FTS_TABLE}(rowid, {cols}) VALUES (new.id, {new_cols}); END"
+        ))
+
+        # 既存の顧客がいるDBに後から作った場合は中身を作り直す
+        if not exists:
+            conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+
+
+def _setup_pg_trgm(engine: Engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for col in _FTS_COLUMNS:
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS ix_customers_{col}_trgm "
+                f"ON customers USING gin ({col} gin_trgm_ops)"
+            ))
+
+
+def _has_sqlite_fts(db: Session) -> bool:
+    bind = db.get_bind()
+    key = str(bind.url)
+    if key not in _fts_available:
+        row = db.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": FTS_TABLE},
+        ).first()
+        _fts_available[key] = row is not None
+    return _fts_available[key]
+
+
+# =======================
+# 検索
+# =======================
+def search_customers(db: Session, q: str, limit: int = 50, cursor: str | None = None) -> Page:
+    """検索語に一致する顧客を1ページ分返す（並び順は検索方法ごと。モジュール先頭のコメント参照）"""
+    variants = _query_variants(q)
+    if not variants:
+        return Page(items=[])
+
+    indexed = [v for v in variants if len(v) >= MIN_INDEXED_QUERY_LENGTH]
+    dialect = db.get_bind().dialect.name
+
+    if indexed and dialect == "sqlite" and _has_sqlite_fts(db):
+        return _search_sqlite_fts(db, indexed, limit, cursor)
+    if indexed and dialect == "postgresql":
+        return _search_pg_trgm(db, indexed, limit, cursor)
+    if not indexed and dialect in ("sqlite", "postgresql"):
+        return _search_prefix(db, variants, limit, cursor)
+    return _search_like(db, variants, limit, cursor)
+
+
+def _fts_match_expr(variants: list[str]) -> str:
+    # ユーザー入力はフレーズ（"..."）として渡し、FTS の演算子として解釈させない
+    return " OR ".join('"' + v.replace('"', '""') + '"' for v in variants)
+
+
+def _search_sqlite_fts(db: Session, variants: list[str], limit: int, cursor: str | None) -> Page:
+    # カーソル: w = 窓の上端の rowid（窓は rowid <= w の一致を新しい順に RANK_CANDIDATES 件）、(s, id) = 窓の中の位置
+    after = read_cursor(cursor, w=int, s=float, id=int)
+    match = _fts_match_expr(variants)
+
+    top = after["w"] if after else None  # None = 最新の窓
+    position = (after["s"], after["id"]) if after else None
+    found: list[tuple[int, float, int]] = []  # (id, score, 窓の上端)
+    while True:
+        rows, (w_min, w_max, w_count) = _fts_window(db, match, top, position, limit + 1 - len(found))
+        found.extend((r.id, r.score, w_max) for r in rows)
+        if len(found) > limit or w_count < RANK_CANDIDATES:
+            break  # 1ページ分そろった / 最後の（いちばん古い）窓まで読んだ
+        top, position = w_min - 1, None  # 次の窓へ
+
+    page = paginate(found, limit, key=lambda r: {"w": r[2], "s": r[1], "id": r[0]})
+    ids = [r[0] for r in page.items]
+    if not ids:
+        return page
+
+    by_id = {
+        c.id: c
+        for c in db.query(models.Customer).filter(models.Customer.id.in_(ids)).all()
+    }
+    page.items = [by_id[i] for i in ids if i in by_id]
+    return page
+
+
+def _fts_window(db: Session, match: str, top: int | None, position: tuple[float, int] | None, n: int):
+    """窓の中の (score ASC, id DESC) で position より後ろを n 件と、窓の (最小 rowid, 最大 rowid, 件数) を返す"""
+    params = {"match": match, "candidates": RANK_CANDIDATES, "limit": n}
+    window = f"SELECT rowid AS id, rank AS score FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match"
+    if top is not None:
+        window += " AND rowid <= :top"
+        params["top"] = top
+    window += " ORDER BY rowid DESC LIMIT :candidates"
+
+    where = ""
+    if position:
+        where = "WHERE score > :after_s OR (score = :after_s AND id < :after_id)"
+        params.update(after_s=position[0], after_id=position[1])
+
+    rows = db.execute(
+        text(
+            "SELECT id, score, w_min, w_max, w_count FROM ("
+            "  SELECT id, score, min(id) OVER () AS w_min, max(id) OVER () AS w_max, count(*) OVER () AS w_count"
+            f"  FROM ({window})"
+            f") {where} ORDER BY score, id DESC LIMIT :limit"
+        ),
+        params,
+    ).all()
+    if rows:
+        return rows, (rows[0].w_min, rows[0].w_max, rows[0].w_count)
+
+    # 窓の続きが無いとき（前のページで窓の最後まで返した）は窓の範囲だけ取る
+    params.pop("after_s", None)
+    params.pop("after_id", None)
+    bounds = db.execute(text(f"SELECT min(id), max(id), count(*) FROM ({window})"), params).one()
+    return [], (bounds[0] or 0, bounds[1] or 0, bounds[2])
+
+
+def _search_pg_trgm(db: Session, variants: list[str], limit: int, cursor: str | None) -> Page:
+    after = read_cursor(cursor, s=float, id=int)
+    C = models.Customer
+    conds = []
+    scores = []
+    for v in variants:
+        like = f"%{v}%"
+        for col in (C.name, C.kana_norm, C.phone_norm, C.email):
+            conds.append(col.ilike(like))
+            scores.append(func.coalesce(func.similarity(col, v), 0))
+
+    score = func.greatest(*scores).label("score")
+    query = db.query(C, score).filter(or_(*conds))
+    if after:
+        # 並び順は (score DESC, id DESC)
+        query = query.filter(or_(score < after["s"], and_(score == after["s"], C.id < after["id"])))
+
+    rows = query.order_by(score.desc(), C.id.desc()).limit(limit + 1).all()
+    page = paginate(rows, limit, key=lambda r: {"s": r.score, "id": r[0].id})
+    page.items = [c for (c, _score) in page.items]
+    return page
+
+
+def _prefix_match(dialect: str, col, v: str):
+    # SQLite は範囲比較（LIKE 'v%' は大文字小文字を区別しない比較になり、通常のインデックスを使えない）
+    # PostgreSQL は LIKE 'v%'（text_pattern_ops のインデックスを使う）
+    if dialect == "sqlite":
+        return and_(col >= v, col < v + _PREFIX_END)
+    return col.startswith(v, autoescape=True)
+
+
+def _search_prefix(db: Session, variants: list[str], limit: int, cursor: str | None) -> Page:
+    # 1〜2文字の検索語用。各カラムのインデックスで先頭一致の顧客を集め、新しい順に返す
+    # （全件は読まない。読むのは一致した顧客のインデックスだけ）
+    after = read_cursor(cursor, id=int)
+    C = models.Customer
+    dialect = db.get_bind().dialect.name
+    conds = [_prefix_match(dialect, getattr(C, col), v) for v in variants for col in _PREFIX_COLUMNS]
+
+    query = db.query(C).filter(or_(*conds))
+    if after:
+        query = query.filter(C.id < after["id"])
+
+    # LIMIT をバインド変数にすると SQLite は件数が少ないと見て主キーを逆順に全件スキャンするので、値を埋め込む
+    # （埋め込めば各カラムのインデックスで一致した行だけ集めてから並べ替える）
+    rows = query.order_by(C.id.desc()).limit(bindparam("limit", limit + 1, literal_execute=True)).all()
+    return paginate(rows, limit, key=lambda c: {"id": c.id})
+
+
+def _search_like(db: Session, variants: list[str], limit: int, cursor: str | None) -> Page:
+    # 検索インデックスが無い DB 用（新しい顧客から順に見て limit 件で打ち切る）
+    after = read_cursor(cursor, id=int)
+    C = models.Customer
+    conds = []
+    for v in variants:
+        like = f"%{v}%"
+        conds.extend([
+            C.name.ilike(like),
+            C.kana.ilike(like),
+            C.kana_norm.ilike(like),
+            C.phone.ilike(like),
+            C.phone_norm.ilike(like),
+            C.email.ilike(like),
+        ])
+
+    query = db.query(C).filter(or_(*conds))
+    if after:
+        query = query.filter(C.id < after["id"])
+
+    rows = query.order_by(C.id.desc()).limit(limit + 1).all()
+    return paginate(rows, limit, key=lambda c: {"id": c.id})
@@ -1,10 +1,49 @@
 # app/security.py
+import os
+
+import anyio
 from passlib.context import CryptContext
 
 pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
 
+# パスワード照合・ハッシュ作成（pbkdf2 は1回数十ms CPU を使う）を同時に何件まで走らせるか
+# - hashlib.pbkdf2_hmac は計算中 GIL を離すので、スレッドでも CPU コア数までは並列に動く
+# - 専用の上限を設けるので、ログインが殺到しても他のリクエスト用のスレッドプールを使い切らない
+# - 待ちが PASSWORD_HASH_MAX_PENDING 件を超えたら待たせずに PasswordHashBusy（ログイン・スタッフ作成/変更は 503）
+HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1)))
+HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+
+_hash_limiter = anyio.CapacityLimiter(HASH_WORKERS)
+_pending = 0  # 実行中 + 待ち（イベントループ上でだけ触る）
+
+
+class PasswordHashBusy(Exception):
+    """パスワード照合の待ちが上限を超えた"""
+
+
 def get_password_hash(plain: str) -> str:
     return pwd_context.hash(plain)
 
 def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
+
+
+async def _run_hash(fn, *args):
+    # イベントループを止めないよう、上限付きのスレッドで計算する（照合もハッシュ作成も同じ上限）
+    global _pending
+    if _pending >= HASH_MAX_PENDING:
+        raise PasswordHashBusy()
+    _pending += 1
+    try:
+        return await anyio.to_thread.run_sync(fn, *args, limiter=_hash_limiter)
+    finally:
+        _pending -= 1
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    return await _run_hash(verify_password, plain, hashed)
+
+
+async def get_password_hash_async(plain: str) -> str:
+    # スタッフ作成・パスワード変更用。crud には出来上がったハッシュを渡す
+    return await _run_hash(get_password_hash, plain)
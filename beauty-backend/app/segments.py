@@ -0,0 +1,377 @@
+# app/segments.py
+# 顧客セグメント（メールの宛先リストなど）を条件の組み合わせで作るクエリビルダー
+#
+# - 条件の関数（opted_in / recent_visit / by_staff / min_visits / birth_month / birthday_within）は
+#   Customer に対する WHERE 条件を返す。build で AND してまとめて1本の SELECT にする
+# - カテゴリの購入が空いている顧客（category_lapsed）は最終購入サマリー（顧客×カテゴリ）の行の条件。
+#   build_lapsed でサマリーから引いて顧客を付ける（来店なし顧客の一覧・ダッシュボードで使う）
+# - スタッフ・来店回数の条件（by_staff / min_visits）は来店の EXISTS / 件数の相関サブクエリ。
+#   画面から組み立てる条件ツリーの exists / count と同じ形
+# - 名前付きのセグメント（SEGMENTS）は「パラメータ → 条件のリスト」。新しいセグメントはここに足すだけでよい
+# - targets の結果は (セグメント, パラメータ, 日付) ごとに SEGMENT_CACHE_TTL 秒キャッシュする
+#   顧客・来店の登録/更新/削除（crud・一括取り込み）で invalidate（他プロセスの書き込みは TTL で反映）
+# - 画面から組み立てる条件ツリー（schemas.SegmentFilter）も compile_filter で同じように1本の SELECT にする（preview）
+import calendar
+import operator
+import os
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Callable
+
+from sqlalchemy import Row, and_, func, or_, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+from sqlalchemy.util import await_only
+
+from . import models, schemas
+from .cache import TTLCache
+
+SEGMENT_CACHE_TTL = float(os.getenv("SEGMENT_CACHE_TTL", "60"))
+
+_cache = TTLCache(ttl=SEGMENT_CACHE_TTL, maxsize=32)
+# invalidate のたびに進める。抽出中に書き込みがあった結果はキャッシュしない
+_generation = 0
+
+C = models.Customer
+V = models.Visit
+LP = models.CustomerLastPurchase
+
+# セグメントの結果の列（ORM オブジェクトではなく行で返すので、セッションをまたいでキャッシュできる）
+COLUMNS = (C.id, C.name, C.email, C.birthday, C.last_visit_date)
+
+
+# =======================
+# 条件
+# =======================
+def opted_in():
+    """メールあり・配信OK"""
+    return and_(C.email.isnot(None), C.email_opt_in.is_(True))
+
+
+def recent_visit(within_days: int, today: date):
+    """直近 within_days 日以内に来店あり（Customer.last_visit_date のインデックスで範囲検索）"""
+    return C.last_visit_date >= today - timedelta(days=within_days)
+
+
+def by_staff(staff_id: int, since: date | None = None):
+    """そのスタッフが担当した来店がある（since を指定するとその日以降の来店だけ）"""
+    conds = [V.customer_id == C.id, V.staff_id == staff_id]
+    if since is not None:
+        conds.append(V.visit_date >= since)
+    return select(V.id).where(*conds).exists()
+
+
+def min_visits(n: int, since: date | None = None):
+    """来店回数が n 回以上（since を指定するとその日以降の来店だけ数える）"""
+    conds = [V.customer_id == C.id]
+    if since is not None:
+        conds.append(V.visit_date >= since)
+    # (customer_id, visit_date, id) のインデックスだけで数える
+    return select(func.count(V.id)).where(*conds).scalar_subquery() >= n
+
+
+def birth_month(month: int):
+    return C.birth_month == month
+
+
+def _month_day_between(start: date, end: date):
+    # 誕生日の (月, 日) が start〜end（同じ年の中）に入る条件。(birth_month, birth_day) のインデックスで範囲検索できる形にする
+    bm, bd = C.birth_month, C.birth_day
+    if start.month == end.month:
+        return and_(bm == start.month, bd >= start.day, bd <= end.day)
+    return or_(
+        and_(bm == start.month, bd >= start.day),
+        and_(bm > start.month, bm < end.month),
+        and_(bm == end.month, bd <= end.day),
+    )
+
+
+def birthday_within(days: int, today: date):
+    """今日から days 日以内に誕生日が来る（年末年始のまたぎ・うるう年以外の 2/29 生まれも対象）"""
+    end = today + timedelta(days=days)
+    if days >= 365:
+        return C.birth_month.isnot(None)
+    if end.year == today.year:
+        cond = _month_day_between(today, end)
+    else:
+        # 年をまたぐ（例: 12/20〜1/10）→ 12/20〜12/31 と 1/1〜1/10 に分ける
+        cond = or_(
+            _month_day_between(today, date(today.year, 12, 31)),
+            _month_day_between(date(end.year, 1, 1), end),
+        )
+
+    # うるう年以外の 2/28 が期間に入るなら 2/29 生まれも対象
+    for year in range(today.year, end.year + 1):
+        feb28 = date(year, 2, 28)
+        if today <= feb28 <= end and not calendar.isleap(year):
+            return or_(cond, and_(C.birth_month == 2, C.birth_day == 29))
+    return cond
+
+
+def category_lapsed(category: str, days: int, today: date):
+    """そのカテゴリを最後に買ってから days 日以上空いている（最終購入サマリーの行の条件。build_lapsed で使う）"""
+    return and_(LP.category == category, LP.last_purchase_date <= today - timedelta(days=days))
+
+
+def build(conditions, order_by=(C.id.desc(),)):
+    return select(*COLUMNS).where(*conditions).order_by(*order_by)
+
+
+def build_lapsed(conditions):
+    """最終購入サマリー（顧客×カテゴリ）の行に顧客を付けた SELECT。last_visit_date はそのカテゴリを最後に買った日
+
+    category_lapsed の条件は (category, last_purchase_date) のインデックスで範囲スキャンになる。
+    顧客の条件（opted_in など）も一緒に渡せる
+    """
+    return (
+        select(
+            LP.category.label("segment"),
+            C.id.label("customer_id"),
+            C.name,
+            C.email,
+            LP.last_purchase_date.label("last_visit_date"),
+        )
+        .join(C, C.id == LP.customer_id)
+        .where(*conditions)
+    )
+
+
+# =======================
+# 名前付きのセグメント
+# =======================
+def _event(today: date, within_days: int = 365) -> list:
+    # イベントフォロー: 直近1年以内に来店がある人
+    return [opted_in(), recent_visit(within_days, today)]
+
+
+def _birthday(today: date, within_days: int = 365) -> list:
+    # 誕生日フォロー: 直近1年以内に来店がある人で、今月誕生日の人
+    return [opted_in(), recent_visit(within_days, today), birth_month(today.month)]
+
+
+def _upcoming_birthday(today: date, days: int = 30, within_days: int = 365) -> list:
+    # 今日から days 日以内に誕生日が来る人（直近 within_days 日以内に来店あり）
+    return [opted_in(), recent_visit(within_days, today), birthday_within(days, today)]
+
+
+SEGMENTS: dict[str, Callable[..., list]] = {
+    "event": _event,
+    "birthday": _birthday,
+    "upcoming_birthday": _upcoming_birthday,
+}
+
+
+def targets(db: Session, name: str, today: date | None = None, **params) -> list[Row]:
+    """セグメントの顧客（COLUMNS の行・ID の降順）。同じ日・同じパラメータならキャッシュを返す"""
+    today = today or date.today()
+    key = (name, tuple(sorted(params.items())), today)
+    rows = _cache.get(key)
+    if rows is None:
+        started = _generation
+        rows = db.execute(build(SEGMENTS[name](today, **params))).all()
+        if started == _generation:
+            _cache.set(key, rows)
+    return rows
+
+
+def invalidate() -> None:
+    global _generation
+    _generation += 1
+    _cache.clear()
+
+
+# =======================
+# 条件ツリー（/api/segments/preview）
+# =======================
+# ツリー（schemas.SegmentFilter）を1本の SELECT の WHERE に組み立てる。来店・購入品の条件は EXISTS / 相関サブクエリ
+# 重い条件でもサーバーを止めないよう、件数は SEGMENT_COUNT_CAP で打ち切り、SQL は SEGMENT_PREVIEW_TIMEOUT 秒で中断する
+SEGMENT_PREVIEW_TIMEOUT = float(os.getenv("SEGMENT_PREVIEW_TIMEOUT", "2"))
+SEGMENT_COUNT_CAP = int(os.getenv("SEGMENT_COUNT_CAP", "100000"))
+MAX_TREE_NODES = 50
+MAX_IN_VALUES = 1000
+
+I = models.VisitItem
+
+FIELDS = {
+    "customer.id": C.id,
+    "customer.name": C.name,
+    "customer.kana": C.kana,
+    "customer.email": C.email,
+    "customer.phone": C.phone,
+    "customer.birthday": C.birthday,
+    "customer.birth_month": C.birth_month,
+    "customer.birth_day": C.birth_day,
+    "customer.email_opt_in": C.email_opt_in,
+    "customer.last_visit_date": C.last_visit_date,
+    "customer.created_at": C.created_at,
+    "visit.visit_date": V.visit_date,
+    "visit.staff_id": V.staff_id,
+    "item.category": I.category,
+    "item.product_name": I.product_name,
+    "item.follow_due_date": I.follow_due_date,
+    "item.follow_sent_at": I.follow_sent_at,
+}
+
+# exists / count の中で使えるテーブル（外側の customer.* も参照できる）
+_SCOPES = {"visit": ("customer", "visit"), "purchase": ("customer", "visit", "item")}
+_COMPARE = {
+    "eq": operator.eq, "ne": operator.ne, "lt": operator.lt, "lte": operator.le, "gt": operator.gt, "gte": operator.ge,
+}
+
+
+class SegmentTimeout(Exception):
+    pass
+
+
+def _coerce(field: str, column, value):
+    python_type = column.type.python_type
+    try:
+        if python_type is bool:
+            if not isinstance(value, bool):
+                raise ValueError
+            return value
+        if python_type is int:
+            # 1.5 → 1 のような切り捨てはしない（整数で表せる値だけ受け付ける）
+            if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+                raise ValueError
+            return int(value)
+        if python_type is datetime:
+            return value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+        if python_type is date:
+            return value if isinstance(value, date) else date.fromisoformat(str(value))
+        if not isinstance(value, str):
+            raise ValueError
+        return value
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"{field}: {value!r} は {python_type.__name__} として扱えません")
+
+
+def _condition(node: schemas.SegmentCondition, today: date, scope: tuple[str, ...]):
+    column = FIELDS.get(node.field)
+    if column is None:
+        raise ValueError(f"unknown field: {node.field}")
+    if node.field.split(".")[0] not in scope:
+        raise ValueError(f"{node.field} は exists / count の where の中でだけ使えます")
+
+    op, value = node.op, node.value
+    if op == "is_null":
+        return column.is_(None)
+    if op == "not_null":
+        return column.isnot(None)
+    if value is None:
+        raise ValueError(f"{node.field}: {op} には value が必要です（空かどうかは is_null / not_null）")
+
+    if op in ("within_days", "before_days"):
+        if column.type.python_type not in (date, datetime):
+            raise ValueError(f"{node.field}: {op} は日付のフィールドだけに使えます")
+        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+            raise ValueError(f"{node.field}: {op} の value は 0 以上の日数です")
+        cutoff = today - timedelta(days=value)
+        if column.type.python_type is datetime:
+            cutoff = datetime.combine(cutoff, datetime.min.time())
+        return column >= cutoff if op == "within_days" else column < cutoff
+
+    if op in ("in", "not_in"):
+        if not isinstance(value, list) or not value or len(value) > MAX_IN_VALUES:
+            raise ValueError(f"{node.field}: {op} の value は 1〜{MAX_IN_VALUES} 件のリストです")
+        values = [_coerce(node.field, column, v) for v in value]
+        return column.in_(values) if op == "in" else column.not_in(values)
+
+    if op == "contains":
+        if column.type.python_type is not str or not isinstance(value, str):
+            raise ValueError(f"{node.field}: contains は文字列のフィールドだけに使えます")
+        return column.contains(value, autoescape=True)
+
+    return _COMPARE[op](column, _coerce(node.field, column, value))
+
+
+def _related(kind: str, where, today: date, counter: list[int]):
+    # 顧客に紐づく来店（visit）・購入品（purchase = 明細 + 来店）の相関サブクエリ
+    if kind == "visit":
+        stmt = select(V.id).where(V.customer_id == C.id)
+    else:
+        stmt = select(I.id).join(V, V.id == I.visit_id).where(V.customer_id == C.id)
+    if where is not None:
+        stmt = stmt.where(_compile(where, today, _SCOPES[kind], counter))
+    return stmt
+
+
+def _compile(node, today: date, scope: tuple[str, ...], counter: list[int]):
+    counter[0] += 1
+    if counter[0] > MAX_TREE_NODES:
+        raise ValueError(f"条件が多すぎます（{MAX_TREE_NODES} 個まで）")
+
+    if isinstance(node, schemas.SegmentAnd):
+        return and_(*(_compile(n, today, scope, counter) for n in node.and_))
+    if isinstance(node, schemas.SegmentOr):
+        return or_(*(_compile(n, today, scope, counter) for n in node.or_))
+    if isinstance(node, schemas.SegmentNot):
+        return ~_compile(node.not_, today, scope, counter)
+    if isinstance(node, (schemas.SegmentExists, schemas.SegmentCount)):
+        if scope != ("customer",):
+            raise ValueError("exists / count は入れ子にできません")
+        if isinstance(node, schemas.SegmentExists):
+            return _related(node.exists, node.where, today, counter).exists()
+        related = _related(node.count, node.where, today, counter)
+        n = related.with_only_columns(func.count()).scalar_subquery()  # 相関を保つため FROM 句のサブクエリにはしない
+        return _COMPARE[node.op](n, node.value)
+    return _condition(node, today, scope)
+
+
+def compile_filter(node: schemas.SegmentFilter, today: date | None = None):
+    """条件ツリー → Customer に対する WHERE 条件。使えない条件は ValueError"""
+    return _compile(node, today or date.today(), ("customer",), [0])
+
+
+@contextmanager
+def statement_timeout(db: Session, seconds: float):
+    """この中で実行した SQL が seconds 秒を超えたら中断して SegmentTimeout"""
+    conn = db.connection()
+    dialect = conn.dialect.name
+    driver_conn = conn.connection.driver_connection
+    deadline = time.monotonic() + seconds
+    if dialect == "sqlite":
+        # SQLite には文のタイムアウトが無いので、進捗ハンドラで期限を過ぎたら中断させる
+        _set_progress_handler(driver_conn, lambda: time.monotonic() > deadline)
+    elif dialect == "postgresql":
+        conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(seconds * 1000)}")
+
+    try:
+        try:
+            yield
+        finally:
+            # プールに戻す前に外す（他のリクエストの SQL が中断されないように）
+            if dialect == "sqlite":
+                _set_progress_handler(driver_conn, None)
+    except DBAPIError as e:
+        if time.monotonic() < deadline:
+            raise
+        db.rollback()
+        raise SegmentTimeout(f"{seconds:g} 秒以内に終わりませんでした。条件を絞ってください") from e
+
+
+def _set_progress_handler(driver_conn, handler) -> None:
+    if type(driver_conn).__module__.startswith("aiosqlite"):
+        # DB_ASYNC=1: aiosqlite のワーカースレッド側の接続に設定する（run_sync の中なので await_only で待てる）
+        await_only(driver_conn.set_progress_handler(handler, 10000))
+    else:
+        driver_conn.set_progress_handler(handler, 10000)
+
+
+def preview(db: Session, node: schemas.SegmentFilter, limit: int = 50) -> dict:
+    """条件に合う人数（SEGMENT_COUNT_CAP で打ち切り）と先頭 limit 人（ID の降順）"""
+    cond = compile_filter(node)
+
+    # 上限+1件まで数えれば「上限以上」かどうかわかる（全件を数えない）
+    capped = select(C.id).where(cond).limit(SEGMENT_COUNT_CAP + 1).subquery()
+    with statement_timeout(db, SEGMENT_PREVIEW_TIMEOUT):
+        n = db.execute(select(func.count()).select_from(capped)).scalar()
+    with statement_timeout(db, SEGMENT_PREVIEW_TIMEOUT):
+        rows = db.execute(build([cond]).limit(limit)).all()
+
+    return {
+        "count": min(n, SEGMENT_COUNT_CAP),
+        "count_capped": n > SEGMENT_COUNT_CAP,
+        "customers": rows,
+    }
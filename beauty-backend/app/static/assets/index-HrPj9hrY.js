@@ -57,6 +57,6 @@ Error generating stack: `+l.message+`
  * @license MIT
  */var Wp="popstate";function Jb(a={}){function i(c,f){let{pathname:d="/",search:m="",hash:p=""}=ka(c.location.hash.substring(1));return!d.startsWith("/")&&!d.startsWith(".")&&(d="/"+d),Rc("",{pathname:d,search:m,hash:p},f.state&&f.state.usr||null,f.state&&f.state.key||"default")}function s(c,f){let d=c.document.querySelector("base"),m="";if(d&&d.getAttribute("href")){let p=c.location.href,y=p.indexOf("#");m=y===-1?p:p.slice(0,y)}return m+"#"+(typeof f=="string"?f:Xl(f))}function r(c,f){Be(c.pathname.charAt(0)==="/",`relative pathnames are not supported in hash history.push(${JSON.stringify(f)})`)}return Fb(i,s,r,a)}function Bt(a,i){if(a===!1||a===null||typeof a>"u")throw new Error(i)}function Be(a,i){if(!a){typeof console<"u"&&console.warn(i);try{throw new Error(i)}catch{}}}function Pb(){return Math.random().toString(36).substring(2,10)}function Ip(a,i){return{usr:a.state,key:a.key,idx:i}}function Rc(a,i,s=null,r){return{pathname:typeof a=="string"?a:a.pathname,search:"",hash:"",...typeof i=="string"?ka(i):i,state:s,key:i&&i.key||r||Pb()}}function Xl({pathname:a="/",search:i="",hash:s=""}){return i&&i!=="?"&&(a+=i.charAt(0)==="?"?i:"?"+i),s&&s!=="#"&&(a+=s.charAt(0)==="#"?s:"#"+s),a}function ka(a){let i={};if(a){let s=a.indexOf("#");s>=0&&(i.hash=a.substring(s),a=a.substring(0,s));let r=a.indexOf("?");r>=0&&(i.search=a.substring(r),a=a.substring(0,r)),a&&(i.pathname=a)}return i}function Fb(a,i,s,r={}){let{window:c=document.defaultView,v5Compat:f=!1}=r,d=c.history,m="POP",p=null,y=g();y==null&&(y=0,d.replaceState({...d.state,idx:y},""));function g(){return(d.state||{idx:null}).idx}function b(){m="POP";let U=g(),j=U==null?null:U-y;y=U,p&&p({action:m,location:B.location,delta:j})}function S(U,j){m="PUSH";let _=Rc(B.location,U,j);s&&s(_,U),y=g()+1;let O=Ip(_,y),$=B.createHref(_);try{d.pushState(O,"",$)}catch(K){if(K instanceof DOMException&&K.name==="DataCloneError")throw K;c.location.assign($)}f&&p&&p({action:m,location:B.location,delta:1})}function N(U,j){m="REPLACE";let _=Rc(B.location,U,j);s&&s(_,U),y=g();let O=Ip(_,y),$=B.createHref(_);d.replaceState(O,"",$),f&&p&&p({action:m,location:B.location,delta:0})}function V(U){return Wb(U)}let B={get action(){return m},get location(){return a(c,d)},listen(U){if(p)throw new Error("A history only accepts one active listener");return c.addEventListener(Wp,b),p=U,()=>{c.removeEventListener(Wp,b),p=null}},createHref(U){return i(c,U)},createURL:V,encodeLocation(U){let j=V(U);return{pathname:j.pathname,search:j.search,hash:j.hash}},push:S,replace:N,go(U){return d.go(U)}};return B}function Wb(a,i=!1){let s="http://localhost";typeof window<"u"&&(s=window.location.origin!=="null"?window.location.origin:window.location.href),Bt(s,"No window.location.(origin|href) available to create URL");let r=typeof a=="string"?a:Xl(a);return r=r.replace(/ $/,"%20"),!i&&r.startsWith("//")&&(r=s+r),new URL(r,s)}function bg(a,i,s="/"){return Ib(a,i,s,!1)}function Ib(a,i,s,r){let c=typeof i=="string"?ka(i):i,f=Rn(c.pathname||"/",s);if(f==null)return null;let d=Sg(a);tS(d);let m=null;for(let p=0;m==null&&p<d.length;++p){let y=fS(f);m=uS(d[p],y,r)}return m}function Sg(a,i=[],s=[],r="",c=!1){let f=(d,m,p=c,y)=>{let g={relativePath:y===void 0?d.path||"":y,caseSensitive:d.caseSensitive===!0,childrenIndex:m,route:d};if(g.relativePath.startsWith("/")){if(!g.relativePath.startsWith(r)&&p)return;Bt(g.relativePath.startsWith(r),`Absolute route path "${g.relativePath}" nested under path "${r}" is not valid. An absolute child route path must start with the combined path of all its parent routes.`),g.relativePath=g.relativePath.slice(r.length)}let b=wn([r,g.relativePath]),S=s.concat(g);d.children&&d.children.length>0&&(Bt(d.index!==!0,`Index routes must not have child routes. Please remove all child routes from route path "${b}".`),Sg(d.children,i,S,b,p)),!(d.path==null&&!d.index)&&i.push({path:b,score:rS(b,d.index),routesMeta:S})};return a.forEach((d,m)=>{if(d.path===""||!d.path?.includes("?"))f(d,m);else for(let p of Tg(d.path))f(d,m,!0,p)}),i}function Tg(a){let i=a.split("/");if(i.length===0)return[];let[s,...r]=i,c=s.endsWith("?"),f=s.replace(/\?$/,"");if(r.length===0)return c?[f,""]:[f];let d=Tg(r.join("/")),m=[];return m.push(...d.map(p=>p===""?f:[f,p].join("/"))),c&&m.push(...d),m.map(p=>a.startsWith("/")&&p===""?"/":p)}function tS(a){a.sort((i,s)=>i.score!==s.score?s.score-i.score:oS(i.routesMeta.map(r=>r.childrenIndex),s.routesMeta.map(r=>r.childrenIndex)))}var eS=/^:[\w-]+$/,nS=3,aS=2,iS=1,lS=10,sS=-2,ty=a=>a==="*";function rS(a,i){let s=a.split("/"),r=s.length;return s.some(ty)&&(r+=sS),i&&(r+=aS),s.filter(c=>!ty(c)).reduce((c,f)=>c+(eS.test(f)?nS:f===""?iS:lS),r)}function oS(a,i){return a.length===i.length&&a.slice(0,-1).every((r,c)=>r===i[c])?a[a.length-1]-i[i.length-1]:0}function uS(a,i,s=!1){let{routesMeta:r}=a,c={},f="/",d=[];for(let m=0;m<r.length;++m){let p=r[m],y=m===r.length-1,g=f==="/"?i:i.slice(f.length)||"/",b=Or({path:p.relativePath,caseSensitive:p.caseSensitive,end:y},g),S=p.route;if(!b&&y&&s&&!r[r.length-1].route.index&&(b=Or({path:p.relativePath,caseSensitive:p.caseSensitive,end:!1},g)),!b)return null;Object.assign(c,b.params),d.push({params:c,pathname:wn([f,b.pathname]),pathnameBase:pS(wn([f,b.pathnameBase])),route:S}),b.pathnameBase!=="/"&&(f=wn([f,b.pathnameBase]))}return d}function Or(a,i){typeof a=="string"&&(a={path:a,caseSensitive:!1,end:!0});let[s,r]=cS(a.path,a.caseSensitive,a.end),c=i.match(s);if(!c)return null;let f=c[0],d=f.replace(/(.)\/+$/,"$1"),m=c.slice(1);return{params:r.reduce((y,{paramName:g,isOptional:b},S)=>{if(g==="*"){let V=m[S]||"";d=f.slice(0,f.length-V.length).replace(/(.)\/+$/,"$1")}const N=m[S];return b&&!N?y[g]=void 0:y[g]=(N||"").replace(/%2F/g,"/"),y},{}),pathname:f,pathnameBase:d,pattern:a}}function cS(a,i=!1,s=!0){Be(a==="*"||!a.endsWith("*")||a.endsWith("/*"),`Route path "${a}" will be treated as if it were "${a.replace(/\*$/,"/*")}" because the \`*\` character must always follow a \`/\` in the pattern. To get rid of this warning, please change the route path to "${a.replace(/\*$/,"/*")}".`);let r=[],c="^"+a.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,(d,m,p)=>(r.push({paramName:m,isOptional:p!=null}),p?"/?([^\\/]+)?":"/([^\\/]+)")).replace(/\/([\w-]+)\?(\/|$)/g,"(/$1)?$2");return a.endsWith("*")?(r.push({paramName:"*"}),c+=a==="*"||a==="/*"?"(.*)$":"(?:\\/(.+)|\\/*)$"):s?c+="\\/*$":a!==""&&a!=="/"&&(c+="(?:(?=\\/|$))"),[new RegExp(c,i?void 0:"i"),r]}function fS(a){try{return a.split("/").map(i=>decodeURIComponent(i).replace(/\//g,"%2F")).join("/")}catch(i){return Be(!1,`The URL path "${a}" could not be decoded because it is a malformed URL segment. This is probably due to a bad percent encoding (${i}).`),a}}function Rn(a,i){if(i==="/")return a;if(!a.toLowerCase().startsWith(i.toLowerCase()))return null;let s=i.endsWith("/")?i.length-1:i.length,r=a.charAt(s);return r&&r!=="/"?null:a.slice(s)||"/"}var Eg=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,dS=a=>Eg.test(a);function hS(a,i="/"){let{pathname:s,search:r="",hash:c=""}=typeof a=="string"?ka(a):a,f;if(s)if(dS(s))f=s;else{if(s.includes("//")){let d=s;s=s.replace(/\/\/+/g,"/"),Be(!1,`Pathnames cannot have embedded double slashes - normalizing ${d} -> ${s}`)}s.startsWith("/")?f=ey(s.substring(1),"/"):f=ey(s,i)}else f=i;return{pathname:f,search:yS(r),hash:gS(c)}}function ey(a,i){let s=i.replace(/\/+$/,"").split("/");return a.split("/").forEach(c=>{c===".."?s.length>1&&s.pop():c!=="."&&s.push(c)}),s.length>1?s.join("/"):"/"}function cc(a,i,s,r){return`Cannot include a '${a}' character in a manually specified \`to.${i}\` field [${JSON.stringify(r)}].  Please separate it out to the \`to.${s}\` field. Alternatively you may provide the full path as a string in <Link to="..."> and the router will parse it for you.`}function mS(a){return a.filter((i,s)=>s===0||i.route.path&&i.route.path.length>0)}function nf(a){let i=mS(a);return i.map((s,r)=>r===i.length-1?s.pathname:s.pathnameBase)}function af(a,i,s,r=!1){let c;typeof a=="string"?c=ka(a):(c={...a},Bt(!c.pathname||!c.pathname.includes("?"),cc("?","pathname","search",c)),Bt(!c.pathname||!c.pathname.includes("#"),cc("#","pathname","hash",c)),Bt(!c.search||!c.search.includes("#"),cc("#","search","hash",c)));let f=a===""||c.pathname==="",d=f?"/":c.pathname,m;if(d==null)m=s;else{let b=i.length-1;if(!r&&d.startsWith("..")){let S=d.split("/");for(;S[0]==="..";)S.shift(),b-=1;c.pathname=S.join("/")}m=b>=0?i[b]:"/"}let p=hS(c,m),y=d&&d!=="/"&&d.endsWith("/"),g=(f||d===".")&&s.endsWith("/");return!p.pathname.endsWith("/")&&(y||g)&&(p.pathname+="/"),p}var wn=a=>a.join("/").replace(/\/\/+/g,"/"),pS=a=>a.replace(/\/+$/,"").replace(/^\/*/,"/"),yS=a=>!a||a==="?"?"":a.startsWith("?")?a:"?"+a,gS=a=>!a||a==="#"?"":a.startsWith("#")?a:"#"+a,vS=class{constructor(a,i,s,r=!1){this.status=a,this.statusText=i||"",this.internal=r,s instanceof Error?(this.data=s.toString(),this.error=s):this.data=s}};function xS(a){return a!=null&&typeof a.status=="number"&&typeof a.statusText=="string"&&typeof a.internal=="boolean"&&"data"in a}function bS(a){return a.map(i=>i.route.path).filter(Boolean).join("/").replace(/\/\/*/g,"/")||"/"}var Ag=typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u";function Cg(a,i){let s=a;if(typeof s!="string"||!Eg.test(s))return{absoluteURL:void 0,isExternal:!1,to:s};let r=s,c=!1;if(Ag)try{let f=new URL(window.location.href),d=s.startsWith("//")?new URL(f.protocol+s):new URL(s),m=Rn(d.pathname,i);d.origin===f.origin&&m!=null?s=m+d.search+d.hash:c=!0}catch{Be(!1,`<Link to="${s}"> contains an invalid URL which will probably break when clicked - please update to a valid URL path.`)}return{absoluteURL:r,isExternal:c,to:s}}Object.getOwnPropertyNames(Object.prototype).sort().join("\0");var Ng=["POST","PUT","PATCH","DELETE"];new Set(Ng);var SS=["GET",...Ng];new Set(SS);var zi=E.createContext(null);zi.displayName="DataRouter";var Hr=E.createContext(null);Hr.displayName="DataRouterState";var TS=E.createContext(!1),jg=E.createContext({isTransitioning:!1});jg.displayName="ViewTransition";var ES=E.createContext(new Map);ES.displayName="Fetchers";var AS=E.createContext(null);AS.displayName="Await";var Le=E.createContext(null);Le.displayName="Navigation";var Fl=E.createContext(null);Fl.displayName="Location";var ln=E.createContext({outlet:null,matches:[],isDataRoute:!1});ln.displayName="Route";var lf=E.createContext(null);lf.displayName="RouteError";var Dg="REACT_ROUTER_ERROR",CS="REDIRECT",NS="ROUTE_ERROR_RESPONSE";function jS(a){if(a.startsWith(`${Dg}:${CS}:{`))try{let i=JSON.parse(a.slice(28));if(typeof i=="object"&&i&&typeof i.status=="number"&&typeof i.statusText=="string"&&typeof i.location=="string"&&typeof i.reloadDocument=="boolean"&&typeof i.replace=="boolean")return i}catch{}}function DS(a){if(a.startsWith(`${Dg}:${NS}:{`))try{let i=JSON.parse(a.slice(40));if(typeof i=="object"&&i&&typeof i.status=="number"&&typeof i.statusText=="string")return new vS(i.status,i.statusText,i.data)}catch{}}function MS(a,{relative:i}={}){Bt(Vi(),"useHref() may be used only in the context of a <Router> component.");let{basename:s,navigator:r}=E.useContext(Le),{hash:c,pathname:f,search:d}=Wl(a,{relative:i}),m=f;return s!=="/"&&(m=f==="/"?s:wn([s,f])),r.createHref({pathname:m,search:d,hash:c})}function Vi(){return E.useContext(Fl)!=null}function fa(){return Bt(Vi(),"useLocation() may be used only in the context of a <Router> component."),E.useContext(Fl).location}var Mg="You should call navigate() in a React.useEffect(), not when your component is first rendered.";function wg(a){E.useContext(Le).static||E.useLayoutEffect(a)}function da(){let{isDataRoute:a}=E.useContext(ln);return a?GS():wS()}function wS(){Bt(Vi(),"useNavigate() may be used only in the context of a <Router> component.");let a=E.useContext(zi),{basename:i,navigator:s}=E.useContext(Le),{matches:r}=E.useContext(ln),{pathname:c}=fa(),f=JSON.stringify(nf(r)),d=E.useRef(!1);return wg(()=>{d.current=!0}),E.useCallback((p,y={})=>{if(Be(d.current,Mg),!d.current)return;if(typeof p=="number"){s.go(p);return}let g=af(p,JSON.parse(f),c,y.relative==="path");a==null&&i!=="/"&&(g.pathname=g.pathname==="/"?i:wn([i,g.pathname])),(y.replace?s.replace:s.push)(g,y.state,y)},[i,s,f,c,a])}E.createContext(null);function RS(){let{matches:a}=E.useContext(ln),i=a[a.length-1];return i?i.params:{}}function Wl(a,{relative:i}={}){let{matches:s}=E.useContext(ln),{pathname:r}=fa(),c=JSON.stringify(nf(s));return E.useMemo(()=>af(a,JSON.parse(c),r,i==="path"),[a,c,r,i])}function _S(a,i){return Rg(a,i)}function Rg(a,i,s,r,c){Bt(Vi(),"useRoutes() may be used only in the context of a <Router> component.");let{navigator:f}=E.useContext(Le),{matches:d}=E.useContext(ln),m=d[d.length-1],p=m?m.params:{},y=m?m.pathname:"/",g=m?m.pathnameBase:"/",b=m&&m.route;{let _=b&&b.path||"";Og(y,!b||_.endsWith("*")||_.endsWith("*?"),`You rendered descendant <Routes> (or called \`useRoutes()\`) at "${y}" (under <Route path="${_}">) but the parent route path has no trailing "*". This means if you navigate deeper, the parent won't match anymore and therefore the child routes will never render.
 
-Please change the parent <Route path="${_}"> to <Route path="${_==="/"?"*":`${_}/*`}">.`)}let S=fa(),N;if(i){let _=typeof i=="string"?ka(i):i;Bt(g==="/"||_.pathname?.startsWith(g),`When overriding the location using \`<Routes location>\` or \`useRoutes(routes, location)\`, the location pathname must begin with the portion of the URL pathname that was matched by all parent routes. The current pathname base is "${g}" but pathname "${_.pathname}" was given in the \`location\` prop.`),N=_}else N=S;let V=N.pathname||"/",B=V;if(g!=="/"){let _=g.replace(/^\//,"").split("/");B="/"+V.replace(/^\//,"").split("/").slice(_.length).join("/")}let U=bg(a,{pathname:B});Be(b||U!=null,`No routes matched location "${N.pathname}${N.search}${N.hash}" `),Be(U==null||U[U.length-1].route.element!==void 0||U[U.length-1].route.Component!==void 0||U[U.length-1].route.lazy!==void 0,`Matched leaf route at location "${N.pathname}${N.search}${N.hash}" does not have an element or Component. This means it will render an <Outlet /> with a null value by default resulting in an "empty" page.`);let j=BS(U&&U.map(_=>Object.assign({},_,{params:Object.assign({},p,_.params),pathname:wn([g,f.encodeLocation?f.encodeLocation(_.pathname.replace(/\?/g,"%3F").replace(/#/g,"%23")).pathname:_.pathname]),pathnameBase:_.pathnameBase==="/"?g:wn([g,f.encodeLocation?f.encodeLocation(_.pathnameBase.replace(/\?/g,"%3F").replace(/#/g,"%23")).pathname:_.pathnameBase])})),d,s,r,c);return i&&j?E.createElement(Fl.Provider,{value:{location:{pathname:"/",search:"",hash:"",state:null,key:"default",...N},navigationType:"POP"}},j):j}function OS(){let a=qS(),i=xS(a)?`${a.status} ${a.statusText}`:a instanceof Error?a.message:JSON.stringify(a),s=a instanceof Error?a.stack:null,r="rgba(200,200,200, 0.5)",c={padding:"0.5rem",backgroundColor:r},f={padding:"2px 4px",backgroundColor:r},d=null;return console.error("Error handled by React Router default ErrorBoundary:",a),d=E.createElement(E.Fragment,null,E.createElement("p",null,"💿 Hey developer 👋"),E.createElement("p",null,"You can provide a way better UX than this when your app throws errors by providing your own ",E.createElement("code",{style:f},"ErrorBoundary")," or"," ",E.createElement("code",{style:f},"errorElement")," prop on your route.")),E.createElement(E.Fragment,null,E.createElement("h2",null,"Unexpected Application Error!"),E.createElement("h3",{style:{fontStyle:"italic"}},i),s?E.createElement("pre",{style:c},s):null,d)}var zS=E.createElement(OS,null),_g=class extends E.Component{constructor(a){super(a),this.state={location:a.location,revalidation:a.revalidation,error:a.error}}static getDerivedStateFromError(a){return{error:a}}static getDerivedStateFromProps(a,i){return i.location!==a.location||i.revalidation!=="idle"&&a.revalidation==="idle"?{error:a.error,location:a.location,revalidation:a.revalidation}:{error:a.error!==void 0?a.error:i.error,location:i.location,revalidation:a.revalidation||i.revalidation}}componentDidCatch(a,i){this.props.onError?this.props.onError(a,i):console.error("React Router caught the following error during render",a)}render(){let a=this.state.error;if(this.context&&typeof a=="object"&&a&&"digest"in a&&typeof a.digest=="string"){const s=DS(a.digest);s&&(a=s)}let i=a!==void 0?E.createElement(ln.Provider,{value:this.props.routeContext},E.createElement(lf.Provider,{value:a,children:this.props.component})):this.props.children;return this.context?E.createElement(VS,{error:a},i):i}};_g.contextType=TS;var fc=new WeakMap;function VS({children:a,error:i}){let{basename:s}=E.useContext(Le);if(typeof i=="object"&&i&&"digest"in i&&typeof i.digest=="string"){let r=jS(i.digest);if(r){let c=fc.get(i);if(c)throw c;let f=Cg(r.location,s);if(Ag&&!fc.get(i))if(f.isExternal||r.reloadDocument)window.location.href=f.absoluteURL||f.to;else{const d=Promise.resolve().then(()=>window.__reactRouterDataRouter.navigate(f.to,{replace:r.replace}));throw fc.set(i,d),d}return E.createElement("meta",{httpEquiv:"refresh",content:`0;url=${f.absoluteURL||f.to}`})}}return a}function US({routeContext:a,match:i,children:s}){let r=E.useContext(zi);return r&&r.static&&r.staticContext&&(i.route.errorElement||i.route.ErrorBoundary)&&(r.staticContext._deepestRenderedBoundaryId=i.route.id),E.createElement(ln.Provider,{value:a},s)}function BS(a,i=[],s=null,r=null,c=null){if(a==null){if(!s)return null;if(s.errors)a=s.matches;else if(i.length===0&&!s.initialized&&s.matches.length>0)a=s.matches;else return null}let f=a,d=s?.errors;if(d!=null){let g=f.findIndex(b=>b.route.id&&d?.[b.route.id]!==void 0);Bt(g>=0,`Could not find a matching route for errors on route IDs: ${Object.keys(d).join(",")}`),f=f.slice(0,Math.min(f.length,g+1))}let m=!1,p=-1;if(s)for(let g=0;g<f.length;g++){let b=f[g];if((b.route.HydrateFallback||b.route.hydrateFallbackElement)&&(p=g),b.route.id){let{loaderData:S,errors:N}=s,V=b.route.loader&&!S.hasOwnProperty(b.route.id)&&(!N||N[b.route.id]===void 0);if(b.route.lazy||V){m=!0,p>=0?f=f.slice(0,p+1):f=[f[0]];break}}}let y=s&&r?(g,b)=>{r(g,{location:s.location,params:s.matches?.[0]?.params??{},unstable_pattern:bS(s.matches),errorInfo:b})}:void 0;return f.reduceRight((g,b,S)=>{let N,V=!1,B=null,U=null;s&&(N=d&&b.route.id?d[b.route.id]:void 0,B=b.route.errorElement||zS,m&&(p<0&&S===0?(Og("route-fallback",!1,"No `HydrateFallback` element provided to render during initial hydration"),V=!0,U=null):p===S&&(V=!0,U=b.route.hydrateFallbackElement||null)));let j=i.concat(f.slice(0,S+1)),_=()=>{let O;return N?O=B:V?O=U:b.route.Component?O=E.createElement(b.route.Component,null):b.route.element?O=b.route.element:O=g,E.createElement(US,{match:b,routeContext:{outlet:g,matches:j,isDataRoute:s!=null},children:O})};return s&&(b.route.ErrorBoundary||b.route.errorElement||S===0)?E.createElement(_g,{location:s.location,revalidation:s.revalidation,component:B,error:N,children:_(),routeContext:{outlet:null,matches:j,isDataRoute:!0},onError:y}):_()},null)}function sf(a){return`${a} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function LS(a){let i=E.useContext(zi);return Bt(i,sf(a)),i}function HS(a){let i=E.useContext(Hr);return Bt(i,sf(a)),i}function kS(a){let i=E.useContext(ln);return Bt(i,sf(a)),i}function rf(a){let i=kS(a),s=i.matches[i.matches.length-1];return Bt(s.route.id,`${a} can only be used on routes that contain a unique "id"`),s.route.id}function YS(){return rf("useRouteId")}function qS(){let a=E.useContext(lf),i=HS("useRouteError"),s=rf("useRouteError");return a!==void 0?a:i.errors?.[s]}function GS(){let{router:a}=LS("useNavigate"),i=rf("useNavigate"),s=E.useRef(!1);return wg(()=>{s.current=!0}),E.useCallback(async(c,f={})=>{Be(s.current,Mg),s.current&&(typeof c=="number"?await a.navigate(c):await a.navigate(c,{fromRouteId:i,...f}))},[a,i])}var ny={};function Og(a,i,s){!i&&!ny[a]&&(ny[a]=!0,Be(!1,s))}E.memo(XS);function XS({routes:a,future:i,state:s,onError:r}){return Rg(a,void 0,s,r,i)}function _c({to:a,replace:i,state:s,relative:r}){Bt(Vi(),"<Navigate> may be used only in the context of a <Router> component.");let{static:c}=E.useContext(Le);Be(!c,"<Navigate> must not be used on the initial render in a <StaticRouter>. This is a no-op, but you should modify your code so the <Navigate> is only ever rendered in response to some user interaction or state change.");let{matches:f}=E.useContext(ln),{pathname:d}=fa(),m=da(),p=af(a,nf(f),d,r==="path"),y=JSON.stringify(p);return E.useEffect(()=>{m(JSON.parse(y),{replace:i,state:s,relative:r})},[m,y,r,i,s]),null}function ra(a){Bt(!1,"A <Route> is only ever to be used as the child of <Routes> element, never rendered directly. Please wrap your <Route> in a <Routes>.")}function KS({basename:a="/",children:i=null,location:s,navigationType:r="POP",navigator:c,static:f=!1,unstable_useTransitions:d}){Bt(!Vi(),"You cannot render a <Router> inside another <Router>. You should never have more than one in your app.");let m=a.replace(/^\/*/,"/"),p=E.useMemo(()=>({basename:m,navigator:c,static:f,unstable_useTransitions:d,future:{}}),[m,c,f,d]);typeof s=="string"&&(s=ka(s));let{pathname:y="/",search:g="",hash:b="",state:S=null,key:N="default"}=s,V=E.useMemo(()=>{let B=Rn(y,m);return B==null?null:{location:{pathname:B,search:g,hash:b,state:S,key:N},navigationType:r}},[m,y,g,b,S,N,r]);return Be(V!=null,`<Router basename="${m}"> is not able to match the URL "${y}${g}${b}" because it does not start with the basename, so the <Router> won't render anything.`),V==null?null:E.createElement(Le.Provider,{value:p},E.createElement(Fl.Provider,{children:i,value:V}))}function QS({children:a,location:i}){return _S(Oc(a),i)}function Oc(a,i=[]){let s=[];return E.Children.forEach(a,(r,c)=>{if(!E.isValidElement(r))return;let f=[...i,c];if(r.type===E.Fragment){s.push.apply(s,Oc(r.props.children,f));return}Bt(r.type===ra,`[${typeof r.type=="string"?r.type:r.type.name}] is not a <Route> component. All component children of <Routes> must be a <Route> or <React.Fragment>`),Bt(!r.props.index||!r.props.children,"An index route cannot have child routes.");let d={id:r.props.id||f.join("-"),caseSensitive:r.props.caseSensitive,element:r.props.element,Component:r.props.Component,index:r.props.index,path:r.props.path,middleware:r.props.middleware,loader:r.props.loader,action:r.props.action,hydrateFallbackElement:r.props.hydrateFallbackElement,HydrateFallback:r.props.HydrateFallback,errorElement:r.props.errorElement,ErrorBoundary:r.props.ErrorBoundary,hasErrorBoundary:r.props.hasErrorBoundary===!0||r.props.ErrorBoundary!=null||r.props.errorElement!=null,shouldRevalidate:r.props.shouldRevalidate,handle:r.props.handle,lazy:r.props.lazy};r.props.children&&(d.children=Oc(r.props.children,f)),s.push(d)}),s}var jr="get",Dr="application/x-www-form-urlencoded";function kr(a){return typeof HTMLElement<"u"&&a instanceof HTMLElement}function ZS(a){return kr(a)&&a.tagName.toLowerCase()==="button"}function $S(a){return kr(a)&&a.tagName.toLowerCase()==="form"}function JS(a){return kr(a)&&a.tagName.toLowerCase()==="input"}function PS(a){return!!(a.metaKey||a.altKey||a.ctrlKey||a.shiftKey)}function FS(a,i){return a.button===0&&(!i||i==="_self")&&!PS(a)}var Sr=null;function WS(){if(Sr===null)try{new FormData(document.createElement("form"),0),Sr=!1}catch{Sr=!0}return Sr}var IS=new Set(["application/x-www-form-urlencoded","multipart/form-data","text/plain"]);function dc(a){return a!=null&&!IS.has(a)?(Be(!1,`"${a}" is not a valid \`encType\` for \`<Form>\`/\`<fetcher.Form>\` and will default to "${Dr}"`),null):a}function t1(a,i){let s,r,c,f,d;if($S(a)){let m=a.getAttribute("action");r=m?Rn(m,i):null,s=a.getAttribute("method")||jr,c=dc(a.getAttribute("enctype"))||Dr,f=new FormData(a)}else if(ZS(a)||JS(a)&&(a.type==="submit"||a.type==="image")){let m=a.form;if(m==null)throw new Error('Cannot submit a <button> or <input type="submit"> without a <form>');let p=a.getAttribute("formaction")||m.getAttribute("action");if(r=p?Rn(p,i):null,s=a.getAttribute("formmethod")||m.getAttribute("method")||jr,c=dc(a.getAttribute("formenctype"))||dc(m.getAttribute("enctype"))||Dr,f=new FormData(m,a),!WS()){let{name:y,type:g,value:b}=a;if(g==="image"){let S=y?`${y}.`:"";f.append(`${S}x`,"0"),f.append(`${S}y`,"0")}else y&&f.append(y,b)}}else{if(kr(a))throw new Error('Cannot submit element that is not <form>, <button>, or <input type="submit|image">');s=jr,r=null,c=Dr,d=a}return f&&c==="text/plain"&&(d=f,f=void 0),{action:r,method:s.toLowerCase(),encType:c,formData:f,body:d}}Object.getOwnPropertyNames(Object.prototype).sort().join("\0");function of(a,i){if(a===!1||a===null||typeof a>"u")throw new Error(i)}function e1(a,i,s,r){let c=typeof a=="string"?new URL(a,typeof window>"u"?"server://singlefetch/":window.location.origin):a;return s?c.pathname.endsWith("/")?c.pathname=`${c.pathname}_.${r}`:c.pathname=`${c.pathname}.${r}`:c.pathname==="/"?c.pathname=`_root.${r}`:i&&Rn(c.pathname,i)==="/"?c.pathname=`${i.replace(/\/$/,"")}/_root.${r}`:c.pathname=`${c.pathname.replace(/\/$/,"")}.${r}`,c}async function n1(a,i){if(a.id in i)return i[a.id];try{let s=await import(a.module);return i[a.id]=s,s}catch(s){return console.error(`Error loading route module \`${a.module}\`, reloading page...`),console.error(s),window.__reactRouterContext&&window.__reactRouterContext.isSpaMode,window.location.reload(),new Promise(()=>{})}}function a1(a){return a==null?!1:a.href==null?a.rel==="preload"&&typeof a.imageSrcSet=="string"&&typeof a.imageSizes=="string":typeof a.rel=="string"&&typeof a.href=="string"}async function i1(a,i,s){let r=await Promise.all(a.map(async c=>{let f=i.routes[c.route.id];if(f){let d=await n1(f,s);return d.links?d.links():[]}return[]}));return o1(r.flat(1).filter(a1).filter(c=>c.rel==="stylesheet"||c.rel==="preload").map(c=>c.rel==="stylesheet"?{...c,rel:"prefetch",as:"style"}:{...c,rel:"prefetch"}))}function ay(a,i,s,r,c,f){let d=(p,y)=>s[y]?p.route.id!==s[y].route.id:!0,m=(p,y)=>s[y].pathname!==p.pathname||s[y].route.path?.endsWith("*")&&s[y].params["*"]!==p.params["*"];return f==="assets"?i.filter((p,y)=>d(p,y)||m(p,y)):f==="data"?i.filter((p,y)=>{let g=r.routes[p.route.id];if(!g||!g.hasLoader)return!1;if(d(p,y)||m(p,y))return!0;if(p.route.shouldRevalidate){let b=p.route.shouldRevalidate({currentUrl:new URL(c.pathname+c.search+c.hash,window.origin),currentParams:s[0]?.params||{},nextUrl:new URL(a,window.origin),nextParams:p.params,defaultShouldRevalidate:!0});if(typeof b=="boolean")return b}return!0}):[]}function l1(a,i,{includeHydrateFallback:s}={}){return s1(a.map(r=>{let c=i.routes[r.route.id];if(!c)return[];let f=[c.module];return c.clientActionModule&&(f=f.concat(c.clientActionModule)),c.clientLoaderModule&&(f=f.concat(c.clientLoaderModule)),s&&c.hydrateFallbackModule&&(f=f.concat(c.hydrateFallbackModule)),c.imports&&(f=f.concat(c.imports)),f}).flat(1))}function s1(a){return[...new Set(a)]}function r1(a){let i={},s=Object.keys(a).sort();for(let r of s)i[r]=a[r];return i}function o1(a,i){let s=new Set;return new Set(i),a.reduce((r,c)=>{let f=JSON.stringify(r1(c));return s.has(f)||(s.add(f),r.push({key:f,link:c})),r},[])}function zg(){let a=E.useContext(zi);return of(a,"You must render this element inside a <DataRouterContext.Provider> element"),a}function u1(){let a=E.useContext(Hr);return of(a,"You must render this element inside a <DataRouterStateContext.Provider> element"),a}var uf=E.createContext(void 0);uf.displayName="FrameworkContext";function Vg(){let a=E.useContext(uf);return of(a,"You must render this element inside a <HydratedRouter> element"),a}function c1(a,i){let s=E.useContext(uf),[r,c]=E.useState(!1),[f,d]=E.useState(!1),{onFocus:m,onBlur:p,onMouseEnter:y,onMouseLeave:g,onTouchStart:b}=i,S=E.useRef(null);E.useEffect(()=>{if(a==="render"&&d(!0),a==="viewport"){let B=j=>{j.forEach(_=>{d(_.isIntersecting)})},U=new IntersectionObserver(B,{threshold:.5});return S.current&&U.observe(S.current),()=>{U.disconnect()}}},[a]),E.useEffect(()=>{if(r){let B=setTimeout(()=>{d(!0)},100);return()=>{clearTimeout(B)}}},[r]);let N=()=>{c(!0)},V=()=>{c(!1),d(!1)};return s?a!=="intent"?[f,S,{}]:[f,S,{onFocus:zl(m,N),onBlur:zl(p,V),onMouseEnter:zl(y,N),onMouseLeave:zl(g,V),onTouchStart:zl(b,N)}]:[!1,S,{}]}function zl(a,i){return s=>{a&&a(s),s.defaultPrevented||i(s)}}function f1({page:a,...i}){let{router:s}=zg(),r=E.useMemo(()=>bg(s.routes,a,s.basename),[s.routes,a,s.basename]);return r?E.createElement(h1,{page:a,matches:r,...i}):null}function d1(a){let{manifest:i,routeModules:s}=Vg(),[r,c]=E.useState([]);return E.useEffect(()=>{let f=!1;return i1(a,i,s).then(d=>{f||c(d)}),()=>{f=!0}},[a,i,s]),r}function h1({page:a,matches:i,...s}){let r=fa(),{future:c,manifest:f,routeModules:d}=Vg(),{basename:m}=zg(),{loaderData:p,matches:y}=u1(),g=E.useMemo(()=>ay(a,i,y,f,r,"data"),[a,i,y,f,r]),b=E.useMemo(()=>ay(a,i,y,f,r,"assets"),[a,i,y,f,r]),S=E.useMemo(()=>{if(a===r.pathname+r.search+r.hash)return[];let B=new Set,U=!1;if(i.forEach(_=>{let O=f.routes[_.route.id];!O||!O.hasLoader||(!g.some($=>$.route.id===_.route.id)&&_.route.id in p&&d[_.route.id]?.shouldRevalidate||O.hasClientLoader?U=!0:B.add(_.route.id))}),B.size===0)return[];let j=e1(a,m,c.unstable_trailingSlashAwareDataRequests,"data");return U&&B.size>0&&j.searchParams.set("_routes",i.filter(_=>B.has(_.route.id)).map(_=>_.route.id).join(",")),[j.pathname+j.search]},[m,c.unstable_trailingSlashAwareDataRequests,p,r,f,g,i,a,d]),N=E.useMemo(()=>l1(b,f),[b,f]),V=d1(b);return E.createElement(E.Fragment,null,S.map(B=>E.createElement("link",{key:B,rel:"prefetch",as:"fetch",href:B,...s})),N.map(B=>E.createElement("link",{key:B,rel:"modulepreload",href:B,...s})),V.map(({key:B,link:U})=>E.createElement("link",{key:B,nonce:s.nonce,...U})))}function m1(...a){return i=>{a.forEach(s=>{typeof s=="function"?s(i):s!=null&&(s.current=i)})}}var p1=typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u";try{p1&&(window.__reactRouterVersion="7.12.0")}catch{}function y1({basename:a,children:i,unstable_useTransitions:s,window:r}){let c=E.useRef();c.current==null&&(c.current=Jb({window:r,v5Compat:!0}));let f=c.current,[d,m]=E.useState({action:f.action,location:f.location}),p=E.useCallback(y=>{s===!1?m(y):E.startTransition(()=>m(y))},[s]);return E.useLayoutEffect(()=>f.listen(p),[f,p]),E.createElement(KS,{basename:a,children:i,location:d.location,navigationType:d.action,navigator:f,unstable_useTransitions:s})}var Ug=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,cf=E.forwardRef(function({onClick:i,discover:s="render",prefetch:r="none",relative:c,reloadDocument:f,replace:d,state:m,target:p,to:y,preventScrollReset:g,viewTransition:b,unstable_defaultShouldRevalidate:S,...N},V){let{basename:B,unstable_useTransitions:U}=E.useContext(Le),j=typeof y=="string"&&Ug.test(y),_=Cg(y,B);y=_.to;let O=MS(y,{relative:c}),[$,K,tt]=c1(r,N),Q=x1(y,{replace:d,state:m,target:p,preventScrollReset:g,relative:c,viewTransition:b,unstable_defaultShouldRevalidate:S,unstable_useTransitions:U});function P(Tt){i&&i(Tt),Tt.defaultPrevented||Q(Tt)}let ht=E.createElement("a",{...N,...tt,href:_.absoluteURL||O,onClick:_.isExternal||f?i:P,ref:m1(V,K),target:p,"data-discover":!j&&s==="render"?"true":void 0});return $&&!j?E.createElement(E.Fragment,null,ht,E.createElement(f1,{page:O})):ht});cf.displayName="Link";var Bg=E.forwardRef(function({"aria-current":i="page",caseSensitive:s=!1,className:r="",end:c=!1,style:f,to:d,viewTransition:m,children:p,...y},g){let b=Wl(d,{relative:y.relative}),S=fa(),N=E.useContext(Hr),{navigator:V,basename:B}=E.useContext(Le),U=N!=null&&A1(b)&&m===!0,j=V.encodeLocation?V.encodeLocation(b).pathname:b.pathname,_=S.pathname,O=N&&N.navigation&&N.navigation.location?N.navigation.location.pathname:null;s||(_=_.toLowerCase(),O=O?O.toLowerCase():null,j=j.toLowerCase()),O&&B&&(O=Rn(O,B)||O);const $=j!=="/"&&j.endsWith("/")?j.length-1:j.length;let K=_===j||!c&&_.startsWith(j)&&_.charAt($)==="/",tt=O!=null&&(O===j||!c&&O.startsWith(j)&&O.charAt(j.length)==="/"),Q={isActive:K,isPending:tt,isTransitioning:U},P=K?i:void 0,ht;typeof r=="function"?ht=r(Q):ht=[r,K?"active":null,tt?"pending":null,U?"transitioning":null].filter(Boolean).join(" ");let Tt=typeof f=="function"?f(Q):f;return E.createElement(cf,{...y,"aria-current":P,className:ht,ref:g,style:Tt,to:d,viewTransition:m},typeof p=="function"?p(Q):p)});Bg.displayName="NavLink";var g1=E.forwardRef(({discover:a="render",fetcherKey:i,navigate:s,reloadDocument:r,replace:c,state:f,method:d=jr,action:m,onSubmit:p,relative:y,preventScrollReset:g,viewTransition:b,unstable_defaultShouldRevalidate:S,...N},V)=>{let{unstable_useTransitions:B}=E.useContext(Le),U=T1(),j=E1(m,{relative:y}),_=d.toLowerCase()==="get"?"get":"post",O=typeof m=="string"&&Ug.test(m),$=K=>{if(p&&p(K),K.defaultPrevented)return;K.preventDefault();let tt=K.nativeEvent.submitter,Q=tt?.getAttribute("formmethod")||d,P=()=>U(tt||K.currentTarget,{fetcherKey:i,method:Q,navigate:s,replace:c,state:f,relative:y,preventScrollReset:g,viewTransition:b,unstable_defaultShouldRevalidate:S});B&&s!==!1?E.startTransition(()=>P()):P()};return E.createElement("form",{ref:V,method:_,action:j,onSubmit:r?p:$,...N,"data-discover":!O&&a==="render"?"true":void 0})});g1.displayName="Form";function v1(a){return`${a} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function Lg(a){let i=E.useContext(zi);return Bt(i,v1(a)),i}function x1(a,{target:i,replace:s,state:r,preventScrollReset:c,relative:f,viewTransition:d,unstable_defaultShouldRevalidate:m,unstable_useTransitions:p}={}){let y=da(),g=fa(),b=Wl(a,{relative:f});return E.useCallback(S=>{if(FS(S,i)){S.preventDefault();let N=s!==void 0?s:Xl(g)===Xl(b),V=()=>y(a,{replace:N,state:r,preventScrollReset:c,relative:f,viewTransition:d,unstable_defaultShouldRevalidate:m});p?E.startTransition(()=>V()):V()}},[g,y,b,s,r,i,a,c,f,d,m,p])}var b1=0,S1=()=>`__${String(++b1)}__`;function T1(){let{router:a}=Lg("useSubmit"),{basename:i}=E.useContext(Le),s=YS(),r=a.fetch,c=a.navigate;return E.useCallback(async(f,d={})=>{let{action:m,method:p,encType:y,formData:g,body:b}=t1(f,i);if(d.navigate===!1){let S=d.fetcherKey||S1();await r(S,s,d.action||m,{unstable_defaultShouldRevalidate:d.unstable_defaultShouldRevalidate,preventScrollReset:d.preventScrollReset,formData:g,body:b,formMethod:d.method||p,formEncType:d.encType||y,flushSync:d.flushSync})}else await c(d.action||m,{unstable_defaultShouldRevalidate:d.unstable_defaultShouldRevalidate,preventScrollReset:d.preventScrollReset,formData:g,body:b,formMethod:d.method||p,formEncType:d.encType||y,replace:d.replace,state:d.state,fromRouteId:s,flushSync:d.flushSync,viewTransition:d.viewTransition})},[r,c,i,s])}function E1(a,{relative:i}={}){let{basename:s}=E.useContext(Le),r=E.useContext(ln);Bt(r,"useFormAction must be used inside a RouteContext");let[c]=r.matches.slice(-1),f={...Wl(a||".",{relative:i})},d=fa();if(a==null){f.search=d.search;let m=new URLSearchParams(f.search),p=m.getAll("index");if(p.some(g=>g==="")){m.delete("index"),p.filter(b=>b).forEach(b=>m.append("index",b));let g=m.toString();f.search=g?`?${g}`:""}}return(!a||a===".")&&c.route.index&&(f.search=f.search?f.search.replace(/^\?/,"?index&"):"?index"),s!=="/"&&(f.pathname=f.pathname==="/"?s:wn([s,f.pathname])),Xl(f)}function A1(a,{relative:i}={}){let s=E.useContext(jg);Bt(s!=null,"`useViewTransitionState` must be used within `react-router-dom`'s `RouterProvider`.  Did you accidentally import `RouterProvider` from `react-router`?");let{basename:r}=Lg("useViewTransitionState"),c=Wl(a,{relative:i});if(!s.isTransitioning)return!1;let f=Rn(s.currentLocation.pathname,r)||s.currentLocation.pathname,d=Rn(s.nextLocation.pathname,r)||s.nextLocation.pathname;return Or(c.pathname,d)!=null||Or(c.pathname,f)!=null}const Hg=E.createContext({});function C1(a){const i=E.useRef(null);return i.current===null&&(i.current=a()),i.current}const ff=typeof window<"u",N1=ff?E.useLayoutEffect:E.useEffect,df=E.createContext(null);function hf(a,i){a.indexOf(i)===-1&&a.push(i)}function mf(a,i){const s=a.indexOf(i);s>-1&&a.splice(s,1)}const _n=(a,i,s)=>s>i?i:s<a?a:s;let pf=()=>{};const On={},kg=a=>/^-?(?:\d+(?:\.\d+)?|\.\d+)$/u.test(a);function Yg(a){return typeof a=="object"&&a!==null}const qg=a=>/^0[^.\s]+$/u.test(a);function yf(a){let i;return()=>(i===void 0&&(i=a()),i)}const We=a=>a,j1=(a,i)=>s=>i(a(s)),Il=(...a)=>a.reduce(j1),Kl=(a,i,s)=>{const r=i-a;return r===0?1:(s-a)/r};class gf{constructor(){this.subscriptions=[]}add(i){return hf(this.subscriptions,i),()=>mf(this.subscriptions,i)}notify(i,s,r){const c=this.subscriptions.length;if(c)if(c===1)this.subscriptions[0](i,s,r);else for(let f=0;f<c;f++){const d=this.subscriptions[f];d&&d(i,s,r)}}getSize(){return this.subscriptions.length}clear(){this.subscriptions.length=0}}const cn=a=>a*1e3,Fe=a=>a/1e3;function Gg(a,i){return i?a*(1e3/i):0}const Xg=(a,i,s)=>(((1-3*s+3*i)*a+(3*s-6*i))*a+3*i)*a,D1=1e-7,M1=12;function w1(a,i,s,r,c){let f,d,m=0;do d=i+(s-i)/2,f=Xg(d,r,c)-a,f>0?s=d:i=d;while(Math.abs(f)>D1&&++m<M1);return d}function ts(a,i,s,r){if(a===i&&s===r)return We;const c=f=>w1(f,0,1,a,s);return f=>f===0||f===1?f:Xg(c(f),i,r)}const Kg=a=>i=>i<=.5?a(2*i)/2:(2-a(2*(1-i)))/2,Qg=a=>i=>1-a(1-i),Zg=ts(.33,1.53,.69,.99),vf=Qg(Zg),$g=Kg(vf),Jg=a=>(a*=2)<1?.5*vf(a):.5*(2-Math.pow(2,-10*(a-1))),xf=a=>1-Math.sin(Math.acos(a)),Pg=Qg(xf),Fg=Kg(xf),R1=ts(.42,0,1,1),_1=ts(0,0,.58,1),Wg=ts(.42,0,.58,1),O1=a=>Array.isArray(a)&&typeof a[0]!="number",Ig=a=>Array.isArray(a)&&typeof a[0]=="number",z1={linear:We,easeIn:R1,easeInOut:Wg,easeOut:_1,circIn:xf,circInOut:Fg,circOut:Pg,backIn:vf,backInOut:$g,backOut:Zg,anticipate:Jg},V1=a=>typeof a=="string",iy=a=>{if(Ig(a)){pf(a.length===4);const[i,s,r,c]=a;return ts(i,s,r,c)}else if(V1(a))return z1[a];return a},Tr=["setup","read","resolveKeyframes","preUpdate","update","preRender","render","postRender"];function U1(a,i){let s=new Set,r=new Set,c=!1,f=!1;const d=new WeakSet;let m={delta:0,timestamp:0,isProcessing:!1};function p(g){d.has(g)&&(y.schedule(g),a()),g(m)}const y={schedule:(g,b=!1,S=!1)=>{const V=S&&c?s:r;return b&&d.add(g),V.has(g)||V.add(g),g},cancel:g=>{r.delete(g),d.delete(g)},process:g=>{if(m=g,c){f=!0;return}c=!0,[s,r]=[r,s],s.forEach(p),s.clear(),c=!1,f&&(f=!1,y.process(g))}};return y}const B1=40;function t0(a,i){let s=!1,r=!0;const c={delta:0,timestamp:0,isProcessing:!1},f=()=>s=!0,d=Tr.reduce((O,$)=>(O[$]=U1(f),O),{}),{setup:m,read:p,resolveKeyframes:y,preUpdate:g,update:b,preRender:S,render:N,postRender:V}=d,B=()=>{const O=On.useManualTiming?c.timestamp:performance.now();s=!1,On.useManualTiming||(c.delta=r?1e3/60:Math.max(Math.min(O-c.timestamp,B1),1)),c.timestamp=O,c.isProcessing=!0,m.process(c),p.process(c),y.process(c),g.process(c),b.process(c),S.process(c),N.process(c),V.process(c),c.isProcessing=!1,s&&i&&(r=!1,a(B))},U=()=>{s=!0,r=!0,c.isProcessing||a(B)};return{schedule:Tr.reduce((O,$)=>{const K=d[$];return O[$]=(tt,Q=!1,P=!1)=>(s||U(),K.schedule(tt,Q,P)),O},{}),cancel:O=>{for(let $=0;$<Tr.length;$++)d[Tr[$]].cancel(O)},state:c,steps:d}}const{schedule:Ut,cancel:ua,state:ce,steps:hc}=t0(typeof requestAnimationFrame<"u"?requestAnimationFrame:We,!0);let Mr;function L1(){Mr=void 0}const Ce={now:()=>(Mr===void 0&&Ce.set(ce.isProcessing||On.useManualTiming?ce.timestamp:performance.now()),Mr),set:a=>{Mr=a,queueMicrotask(L1)}},e0=a=>i=>typeof i=="string"&&i.startsWith(a),bf=e0("--"),H1=e0("var(--"),Sf=a=>H1(a)?k1.test(a.split("/*")[0].trim()):!1,k1=/var\(--(?:[\w-]+\s*|[\w-]+\s*,(?:\s*[^)(\s]|\s*\((?:[^)(]|\([^)(]*\))*\))+\s*)\)$/iu,Ui={test:a=>typeof a=="number",parse:parseFloat,transform:a=>a},Ql={...Ui,transform:a=>_n(0,1,a)},Er={...Ui,default:1},Hl=a=>Math.round(a*1e5)/1e5,Tf=/-?(?:\d+(?:\.\d+)?|\.\d+)/gu;function Y1(a){return a==null}const q1=/^(?:#[\da-f]{3,8}|(?:rgb|hsl)a?\((?:-?[\d.]+%?[,\s]+){2}-?[\d.]+%?\s*(?:[,/]\s*)?(?:\b\d+(?:\.\d+)?|\.\d+)?%?\))$/iu,Ef=(a,i)=>s=>!!(typeof s=="string"&&q1.test(s)&&s.startsWith(a)||i&&!Y1(s)&&Object.prototype.hasOwnProperty.call(s,i)),n0=(a,i,s)=>r=>{if(typeof r!="string")return r;const[c,f,d,m]=r.match(Tf);return{[a]:parseFloat(c),[i]:parseFloat(f),[s]:parseFloat(d),alpha:m!==void 0?parseFloat(m):1}},G1=a=>_n(0,255,a),mc={...Ui,transform:a=>Math.round(G1(a))},Ua={test:Ef("rgb","red"),parse:n0("red","green","blue"),transform:({red:a,green:i,blue:s,alpha:r=1})=>"rgba("+mc.transform(a)+", "+mc.transform(i)+", "+mc.transform(s)+", "+Hl(Ql.transform(r))+")"};function X1(a){let i="",s="",r="",c="";return a.length>5?(i=a.substring(1,3),s=a.substring(3,5),r=a.substring(5,7),c=a.substring(7,9)):(i=a.substring(1,2),s=a.substring(2,3),r=a.substring(3,4),c=a.substring(4,5),i+=i,s+=s,r+=r,c+=c),{red:parseInt(i,16),green:parseInt(s,16),blue:parseInt(r,16),alpha:c?parseInt(c,16)/255:1}}const zc={test:Ef("#"),parse:X1,transform:Ua.transform},es=a=>({test:i=>typeof i=="string"&&i.endsWith(a)&&i.split(" ").length===1,parse:parseFloat,transform:i=>`${i}${a}`}),oa=es("deg"),fn=es("%"),it=es("px"),K1=es("vh"),Q1=es("vw"),ly={...fn,parse:a=>fn.parse(a)/100,transform:a=>fn.transform(a*100)},Ni={test:Ef("hsl","hue"),parse:n0("hue","saturation","lightness"),transform:({hue:a,saturation:i,lightness:s,alpha:r=1})=>"hsla("+Math.round(a)+", "+fn.transform(Hl(i))+", "+fn.transform(Hl(s))+", "+Hl(Ql.transform(r))+")"},Wt={test:a=>Ua.test(a)||zc.test(a)||Ni.test(a),parse:a=>Ua.test(a)?Ua.parse(a):Ni.test(a)?Ni.parse(a):zc.parse(a),transform:a=>typeof a=="string"?a:a.hasOwnProperty("red")?Ua.transform(a):Ni.transform(a),getAnimatableNone:a=>{const i=Wt.parse(a);return i.alpha=0,Wt.transform(i)}},Z1=/(?:#[\da-f]{3,8}|(?:rgb|hsl)a?\((?:-?[\d.]+%?[,\s]+){2}-?[\d.]+%?\s*(?:[,/]\s*)?(?:\b\d+(?:\.\d+)?|\.\d+)?%?\))/giu;function $1(a){return isNaN(a)&&typeof a=="string"&&(a.match(Tf)?.length||0)+(a.match(Z1)?.length||0)>0}const a0="number",i0="color",J1="var",P1="var(",sy="${}",F1=/var\s*\(\s*--(?:[\w-]+\s*|[\w-]+\s*,(?:\s*[^)(\s]|\s*\((?:[^)(]|\([^)(]*\))*\))+\s*)\)|#[\da-f]{3,8}|(?:rgb|hsl)a?\((?:-?[\d.]+%?[,\s]+){2}-?[\d.]+%?\s*(?:[,/]\s*)?(?:\b\d+(?:\.\d+)?|\.\d+)?%?\)|-?(?:\d+(?:\.\d+)?|\.\d+)/giu;function Zl(a){const i=a.toString(),s=[],r={color:[],number:[],var:[]},c=[];let f=0;const m=i.replace(F1,p=>(Wt.test(p)?(r.color.push(f),c.push(i0),s.push(Wt.parse(p))):p.startsWith(P1)?(r.var.push(f),c.push(J1),s.push(p)):(r.number.push(f),c.push(a0),s.push(parseFloat(p))),++f,sy)).split(sy);return{values:s,split:m,indexes:r,types:c}}function l0(a){return Zl(a).values}function s0(a){const{split:i,types:s}=Zl(a),r=i.length;return c=>{let f="";for(let d=0;d<r;d++)if(f+=i[d],c[d]!==void 0){const m=s[d];m===a0?f+=Hl(c[d]):m===i0?f+=Wt.transform(c[d]):f+=c[d]}return f}}const W1=a=>typeof a=="number"?0:Wt.test(a)?Wt.getAnimatableNone(a):a;function I1(a){const i=l0(a);return s0(a)(i.map(W1))}const ca={test:$1,parse:l0,createTransformer:s0,getAnimatableNone:I1};function pc(a,i,s){return s<0&&(s+=1),s>1&&(s-=1),s<1/6?a+(i-a)*6*s:s<1/2?i:s<2/3?a+(i-a)*(2/3-s)*6:a}function tT({hue:a,saturation:i,lightness:s,alpha:r}){a/=360,i/=100,s/=100;let c=0,f=0,d=0;if(!i)c=f=d=s;else{const m=s<.5?s*(1+i):s+i-s*i,p=2*s-m;c=pc(p,m,a+1/3),f=pc(p,m,a),d=pc(p,m,a-1/3)}return{red:Math.round(c*255),green:Math.round(f*255),blue:Math.round(d*255),alpha:r}}function zr(a,i){return s=>s>0?i:a}const Ht=(a,i,s)=>a+(i-a)*s,yc=(a,i,s)=>{const r=a*a,c=s*(i*i-r)+r;return c<0?0:Math.sqrt(c)},eT=[zc,Ua,Ni],nT=a=>eT.find(i=>i.test(a));function ry(a){const i=nT(a);if(!i)return!1;let s=i.parse(a);return i===Ni&&(s=tT(s)),s}const oy=(a,i)=>{const s=ry(a),r=ry(i);if(!s||!r)return zr(a,i);const c={...s};return f=>(c.red=yc(s.red,r.red,f),c.green=yc(s.green,r.green,f),c.blue=yc(s.blue,r.blue,f),c.alpha=Ht(s.alpha,r.alpha,f),Ua.transform(c))},Vc=new Set(["none","hidden"]);function aT(a,i){return Vc.has(a)?s=>s<=0?a:i:s=>s>=1?i:a}function iT(a,i){return s=>Ht(a,i,s)}function Af(a){return typeof a=="number"?iT:typeof a=="string"?Sf(a)?zr:Wt.test(a)?oy:rT:Array.isArray(a)?r0:typeof a=="object"?Wt.test(a)?oy:lT:zr}function r0(a,i){const s=[...a],r=s.length,c=a.map((f,d)=>Af(f)(f,i[d]));return f=>{for(let d=0;d<r;d++)s[d]=c[d](f);return s}}function lT(a,i){const s={...a,...i},r={};for(const c in s)a[c]!==void 0&&i[c]!==void 0&&(r[c]=Af(a[c])(a[c],i[c]));return c=>{for(const f in r)s[f]=r[f](c);return s}}function sT(a,i){const s=[],r={color:0,var:0,number:0};for(let c=0;c<i.values.length;c++){const f=i.types[c],d=a.indexes[f][r[f]],m=a.values[d]??0;s[c]=m,r[f]++}return s}const rT=(a,i)=>{const s=ca.createTransformer(i),r=Zl(a),c=Zl(i);return r.indexes.var.length===c.indexes.var.length&&r.indexes.color.length===c.indexes.color.length&&r.indexes.number.length>=c.indexes.number.length?Vc.has(a)&&!c.values.length||Vc.has(i)&&!r.values.length?aT(a,i):Il(r0(sT(r,c),c.values),s):zr(a,i)};function o0(a,i,s){return typeof a=="number"&&typeof i=="number"&&typeof s=="number"?Ht(a,i,s):Af(a)(a,i)}const oT=a=>{const i=({timestamp:s})=>a(s);return{start:(s=!0)=>Ut.update(i,s),stop:()=>ua(i),now:()=>ce.isProcessing?ce.timestamp:Ce.now()}},u0=(a,i,s=10)=>{let r="";const c=Math.max(Math.round(i/s),2);for(let f=0;f<c;f++)r+=Math.round(a(f/(c-1))*1e4)/1e4+", ";return`linear(${r.substring(0,r.length-2)})`},Vr=2e4;function Cf(a){let i=0;const s=50;let r=a.next(i);for(;!r.done&&i<Vr;)i+=s,r=a.next(i);return i>=Vr?1/0:i}function uT(a,i=100,s){const r=s({...a,keyframes:[0,i]}),c=Math.min(Cf(r),Vr);return{type:"keyframes",ease:f=>r.next(c*f).value/i,duration:Fe(c)}}const cT=5;function c0(a,i,s){const r=Math.max(i-cT,0);return Gg(s-a(r),i-r)}const Gt={stiffness:100,damping:10,mass:1,velocity:0,duration:800,bounce:.3,visualDuration:.3,restSpeed:{granular:.01,default:2},restDelta:{granular:.005,default:.5},minDuration:.01,maxDuration:10,minDamping:.05,maxDamping:1},gc=.001;function fT({duration:a=Gt.duration,bounce:i=Gt.bounce,velocity:s=Gt.velocity,mass:r=Gt.mass}){let c,f,d=1-i;d=_n(Gt.minDamping,Gt.maxDamping,d),a=_n(Gt.minDuration,Gt.maxDuration,Fe(a)),d<1?(c=y=>{const g=y*d,b=g*a,S=g-s,N=Uc(y,d),V=Math.exp(-b);return gc-S/N*V},f=y=>{const b=y*d*a,S=b*s+s,N=Math.pow(d,2)*Math.pow(y,2)*a,V=Math.exp(-b),B=Uc(Math.pow(y,2),d);return(-c(y)+gc>0?-1:1)*((S-N)*V)/B}):(c=y=>{const g=Math.exp(-y*a),b=(y-s)*a+1;return-gc+g*b},f=y=>{const g=Math.exp(-y*a),b=(s-y)*(a*a);return g*b});const m=5/a,p=hT(c,f,m);if(a=cn(a),isNaN(p))return{stiffness:Gt.stiffness,damping:Gt.damping,duration:a};{const y=Math.pow(p,2)*r;return{stiffness:y,damping:d*2*Math.sqrt(r*y),duration:a}}}const dT=12;function hT(a,i,s){let r=s;for(let c=1;c<dT;c++)r=r-a(r)/i(r);return r}function Uc(a,i){return a*Math.sqrt(1-i*i)}const mT=["duration","bounce"],pT=["stiffness","damping","mass"];function uy(a,i){return i.some(s=>a[s]!==void 0)}function yT(a){let i={velocity:Gt.velocity,stiffness:Gt.stiffness,damping:Gt.damping,mass:Gt.mass,isResolvedFromDuration:!1,...a};if(!uy(a,pT)&&uy(a,mT))if(a.visualDuration){const s=a.visualDuration,r=2*Math.PI/(s*1.2),c=r*r,f=2*_n(.05,1,1-(a.bounce||0))*Math.sqrt(c);i={...i,mass:Gt.mass,stiffness:c,damping:f}}else{const s=fT(a);i={...i,...s,mass:Gt.mass},i.isResolvedFromDuration=!0}return i}function Ur(a=Gt.visualDuration,i=Gt.bounce){const s=typeof a!="object"?{visualDuration:a,keyframes:[0,1],bounce:i}:a;let{restSpeed:r,restDelta:c}=s;const f=s.keyframes[0],d=s.keyframes[s.keyframes.length-1],m={done:!1,value:f},{stiffness:p,damping:y,mass:g,duration:b,velocity:S,isResolvedFromDuration:N}=yT({...s,velocity:-Fe(s.velocity||0)}),V=S||0,B=y/(2*Math.sqrt(p*g)),U=d-f,j=Fe(Math.sqrt(p/g)),_=Math.abs(U)<5;r||(r=_?Gt.restSpeed.granular:Gt.restSpeed.default),c||(c=_?Gt.restDelta.granular:Gt.restDelta.default);let O;if(B<1){const K=Uc(j,B);O=tt=>{const Q=Math.exp(-B*j*tt);return d-Q*((V+B*j*U)/K*Math.sin(K*tt)+U*Math.cos(K*tt))}}else if(B===1)O=K=>d-Math.exp(-j*K)*(U+(V+j*U)*K);else{const K=j*Math.sqrt(B*B-1);O=tt=>{const Q=Math.exp(-B*j*tt),P=Math.min(K*tt,300);return d-Q*((V+B*j*U)*Math.sinh(P)+K*U*Math.cosh(P))/K}}const $={calculatedDuration:N&&b||null,next:K=>{const tt=O(K);if(N)m.done=K>=b;else{let Q=K===0?V:0;B<1&&(Q=K===0?cn(V):c0(O,K,tt));const P=Math.abs(Q)<=r,ht=Math.abs(d-tt)<=c;m.done=P&&ht}return m.value=m.done?d:tt,m},toString:()=>{const K=Math.min(Cf($),Vr),tt=u0(Q=>$.next(K*Q).value,K,30);return K+"ms "+tt},toTransition:()=>{}};return $}Ur.applyToOptions=a=>{const i=uT(a,100,Ur);return a.ease=i.ease,a.duration=cn(i.duration),a.type="keyframes",a};function Bc({keyframes:a,velocity:i=0,power:s=.8,timeConstant:r=325,bounceDamping:c=10,bounceStiffness:f=500,modifyTarget:d,min:m,max:p,restDelta:y=.5,restSpeed:g}){const b=a[0],S={done:!1,value:b},N=P=>m!==void 0&&P<m||p!==void 0&&P>p,V=P=>m===void 0?p:p===void 0||Math.abs(m-P)<Math.abs(p-P)?m:p;let B=s*i;const U=b+B,j=d===void 0?U:d(U);j!==U&&(B=j-b);const _=P=>-B*Math.exp(-P/r),O=P=>j+_(P),$=P=>{const ht=_(P),Tt=O(P);S.done=Math.abs(ht)<=y,S.value=S.done?j:Tt};let K,tt;const Q=P=>{N(S.value)&&(K=P,tt=Ur({keyframes:[S.value,V(S.value)],velocity:c0(O,P,S.value),damping:c,stiffness:f,restDelta:y,restSpeed:g}))};return Q(0),{calculatedDuration:null,next:P=>{let ht=!1;return!tt&&K===void 0&&(ht=!0,$(P),Q(P)),K!==void 0&&P>=K?tt.next(P-K):(!ht&&$(P),S)}}}function gT(a,i,s){const r=[],c=s||On.mix||o0,f=a.length-1;for(let d=0;d<f;d++){let m=c(a[d],a[d+1]);if(i){const p=Array.isArray(i)?i[d]||We:i;m=Il(p,m)}r.push(m)}return r}function vT(a,i,{clamp:s=!0,ease:r,mixer:c}={}){const f=a.length;if(pf(f===i.length),f===1)return()=>i[0];if(f===2&&i[0]===i[1])return()=>i[1];const d=a[0]===a[1];a[0]>a[f-1]&&(a=[...a].reverse(),i=[...i].reverse());const m=gT(i,r,c),p=m.length,y=g=>{if(d&&g<a[0])return i[0];let b=0;if(p>1)for(;b<a.length-2&&!(g<a[b+1]);b++);const S=Kl(a[b],a[b+1],g);return m[b](S)};return s?g=>y(_n(a[0],a[f-1],g)):y}function xT(a,i){const s=a[a.length-1];for(let r=1;r<=i;r++){const c=Kl(0,i,r);a.push(Ht(s,1,c))}}function bT(a){const i=[0];return xT(i,a.length-1),i}function ST(a,i){return a.map(s=>s*i)}function TT(a,i){return a.map(()=>i||Wg).splice(0,a.length-1)}function kl({duration:a=300,keyframes:i,times:s,ease:r="easeInOut"}){const c=O1(r)?r.map(iy):iy(r),f={done:!1,value:i[0]},d=ST(s&&s.length===i.length?s:bT(i),a),m=vT(d,i,{ease:Array.isArray(c)?c:TT(i,c)});return{calculatedDuration:a,next:p=>(f.value=m(p),f.done=p>=a,f)}}const ET=a=>a!==null;function Nf(a,{repeat:i,repeatType:s="loop"},r,c=1){const f=a.filter(ET),m=c<0||i&&s!=="loop"&&i%2===1?0:f.length-1;return!m||r===void 0?f[m]:r}const AT={decay:Bc,inertia:Bc,tween:kl,keyframes:kl,spring:Ur};function f0(a){typeof a.type=="string"&&(a.type=AT[a.type])}class jf{constructor(){this.updateFinished()}get finished(){return this._finished}updateFinished(){this._finished=new Promise(i=>{this.resolve=i})}notifyFinished(){this.resolve()}then(i,s){return this.finished.then(i,s)}}const CT=a=>a/100;class Df extends jf{constructor(i){super(),this.state="idle",this.startTime=null,this.isStopped=!1,this.currentTime=0,this.holdTime=null,this.playbackSpeed=1,this.stop=()=>{const{motionValue:s}=this.options;s&&s.updatedAt!==Ce.now()&&this.tick(Ce.now()),this.isStopped=!0,this.state!=="idle"&&(this.teardown(),this.options.onStop?.())},this.options=i,this.initAnimation(),this.play(),i.autoplay===!1&&this.pause()}initAnimation(){const{options:i}=this;f0(i);const{type:s=kl,repeat:r=0,repeatDelay:c=0,repeatType:f,velocity:d=0}=i;let{keyframes:m}=i;const p=s||kl;p!==kl&&typeof m[0]!="number"&&(this.mixKeyframes=Il(CT,o0(m[0],m[1])),m=[0,100]);const y=p({...i,keyframes:m});f==="mirror"&&(this.mirroredGenerator=p({...i,keyframes:[...m].reverse(),velocity:-d})),y.calculatedDuration===null&&(y.calculatedDuration=Cf(y));const{calculatedDuration:g}=y;this.calculatedDuration=g,this.resolvedDuration=g+c,this.totalDuration=this.resolvedDuration*(r+1)-c,this.generator=y}updateTime(i){const s=Math.round(i-this.startTime)*this.playbackSpeed;this.holdTime!==null?this.currentTime=this.holdTime:this.currentTime=s}tick(i,s=!1){const{generator:r,totalDuration:c,mixKeyframes:f,mirroredGenerator:d,resolvedDuration:m,calculatedDuration:p}=this;if(this.startTime===null)return r.next(0);const{delay:y=0,keyframes:g,repeat:b,repeatType:S,repeatDelay:N,type:V,onUpdate:B,finalKeyframe:U}=this.options;this.speed>0?this.startTime=Math.min(this.startTime,i):this.speed<0&&(this.startTime=Math.min(i-c/this.speed,this.startTime)),s?this.currentTime=i:this.updateTime(i);const j=this.currentTime-y*(this.playbackSpeed>=0?1:-1),_=this.playbackSpeed>=0?j<0:j>c;this.currentTime=Math.max(j,0),this.state==="finished"&&this.holdTime===null&&(this.currentTime=c);let O=this.currentTime,$=r;if(b){const P=Math.min(this.currentTime,c)/m;let ht=Math.floor(P),Tt=P%1;!Tt&&P>=1&&(Tt=1),Tt===1&&ht--,ht=Math.min(ht,b+1),!!(ht%2)&&(S==="reverse"?(Tt=1-Tt,N&&(Tt-=N/m)):S==="mirror"&&($=d)),O=_n(0,1,Tt)*m}const K=_?{done:!1,value:g[0]}:$.next(O);f&&(K.value=f(K.value));let{done:tt}=K;!_&&p!==null&&(tt=this.playbackSpeed>=0?this.currentTime>=c:this.currentTime<=0);const Q=this.holdTime===null&&(this.state==="finished"||this.state==="running"&&tt);return Q&&V!==Bc&&(K.value=Nf(g,this.options,U,this.speed)),B&&B(K.value),Q&&this.finish(),K}then(i,s){return this.finished.then(i,s)}get duration(){return Fe(this.calculatedDuration)}get iterationDuration(){const{delay:i=0}=this.options||{};return this.duration+Fe(i)}get time(){return Fe(this.currentTime)}set time(i){i=cn(i),this.currentTime=i,this.startTime===null||this.holdTime!==null||this.playbackSpeed===0?this.holdTime=i:this.driver&&(this.startTime=this.driver.now()-i/this.playbackSpeed),this.driver?.start(!1)}get speed(){return this.playbackSpeed}set speed(i){this.updateTime(Ce.now());const s=this.playbackSpeed!==i;this.playbackSpeed=i,s&&(this.time=Fe(this.currentTime))}play(){if(this.isStopped)return;const{driver:i=oT,startTime:s}=this.options;this.driver||(this.driver=i(c=>this.tick(c))),this.options.onPlay?.();const r=this.driver.now();this.state==="finished"?(this.updateFinished(),this.startTime=r):this.holdTime!==null?this.startTime=r-this.holdTime:this.startTime||(this.startTime=s??r),this.state==="finished"&&this.speed<0&&(this.startTime+=this.calculatedDuration),this.holdTime=null,this.state="running",this.driver.start()}pause(){this.state="paused",this.updateTime(Ce.now()),this.holdTime=this.currentTime}complete(){this.state!=="running"&&this.play(),this.state="finished",this.holdTime=null}finish(){this.notifyFinished(),this.teardown(),this.state="finished",this.options.onComplete?.()}cancel(){this.holdTime=null,this.startTime=0,this.tick(0),this.teardown(),this.options.onCancel?.()}teardown(){this.state="idle",this.stopDriver(),this.startTime=this.holdTime=null}stopDriver(){this.driver&&(this.driver.stop(),this.driver=void 0)}sample(i){return this.startTime=0,this.tick(i,!0)}attachTimeline(i){return this.options.allowFlatten&&(this.options.type="keyframes",this.options.ease="linear",this.initAnimation()),this.driver?.stop(),i.observe(this)}}function NT(a){for(let i=1;i<a.length;i++)a[i]??(a[i]=a[i-1])}const Ba=a=>a*180/Math.PI,Lc=a=>{const i=Ba(Math.atan2(a[1],a[0]));return Hc(i)},jT={x:4,y:5,translateX:4,translateY:5,scaleX:0,scaleY:3,scale:a=>(Math.abs(a[0])+Math.abs(a[3]))/2,rotate:Lc,rotateZ:Lc,skewX:a=>Ba(Math.atan(a[1])),skewY:a=>Ba(Math.atan(a[2])),skew:a=>(Math.abs(a[1])+Math.abs(a[2]))/2},Hc=a=>(a=a%360,a<0&&(a+=360),a),cy=Lc,fy=a=>Math.sqrt(a[0]*a[0]+a[1]*a[1]),dy=a=>Math.sqrt(a[4]*a[4]+a[5]*a[5]),DT={x:12,y:13,z:14,translateX:12,translateY:13,translateZ:14,scaleX:fy,scaleY:dy,scale:a=>(fy(a)+dy(a))/2,rotateX:a=>Hc(Ba(Math.atan2(a[6],a[5]))),rotateY:a=>Hc(Ba(Math.atan2(-a[2],a[0]))),rotateZ:cy,rotate:cy,skewX:a=>Ba(Math.atan(a[4])),skewY:a=>Ba(Math.atan(a[1])),skew:a=>(Math.abs(a[1])+Math.abs(a[4]))/2};function kc(a){return a.includes("scale")?1:0}function Yc(a,i){if(!a||a==="none")return kc(i);const s=a.match(/^matrix3d\(([-\d.e\s,]+)\)$/u);let r,c;if(s)r=DT,c=s;else{const m=a.match(/^matrix\(([-\d.e\s,]+)\)$/u);r=jT,c=m}if(!c)return kc(i);const f=r[i],d=c[1].split(",").map(wT);return typeof f=="function"?f(d):d[f]}const MT=(a,i)=>{const{transform:s="none"}=getComputedStyle(a);return Yc(s,i)};function wT(a){return parseFloat(a.trim())}const Bi=["transformPerspective","x","y","z","translateX","translateY","translateZ","scale","scaleX","scaleY","rotate","rotateX","rotateY","rotateZ","skew","skewX","skewY"],Li=new Set(Bi),hy=a=>a===Ui||a===it,RT=new Set(["x","y","z"]),_T=Bi.filter(a=>!RT.has(a));function OT(a){const i=[];return _T.forEach(s=>{const r=a.getValue(s);r!==void 0&&(i.push([s,r.get()]),r.set(s.startsWith("scale")?1:0))}),i}const La={width:({x:a},{paddingLeft:i="0",paddingRight:s="0"})=>a.max-a.min-parseFloat(i)-parseFloat(s),height:({y:a},{paddingTop:i="0",paddingBottom:s="0"})=>a.max-a.min-parseFloat(i)-parseFloat(s),top:(a,{top:i})=>parseFloat(i),left:(a,{left:i})=>parseFloat(i),bottom:({y:a},{top:i})=>parseFloat(i)+(a.max-a.min),right:({x:a},{left:i})=>parseFloat(i)+(a.max-a.min),x:(a,{transform:i})=>Yc(i,"x"),y:(a,{transform:i})=>Yc(i,"y")};La.translateX=La.x;La.translateY=La.y;const Ha=new Set;let qc=!1,Gc=!1,Xc=!1;function d0(){if(Gc){const a=Array.from(Ha).filter(r=>r.needsMeasurement),i=new Set(a.map(r=>r.element)),s=new Map;i.forEach(r=>{const c=OT(r);c.length&&(s.set(r,c),r.render())}),a.forEach(r=>r.measureInitialState()),i.forEach(r=>{r.render();const c=s.get(r);c&&c.forEach(([f,d])=>{r.getValue(f)?.set(d)})}),a.forEach(r=>r.measureEndState()),a.forEach(r=>{r.suspendedScrollY!==void 0&&window.scrollTo(0,r.suspendedScrollY)})}Gc=!1,qc=!1,Ha.forEach(a=>a.complete(Xc)),Ha.clear()}function h0(){Ha.forEach(a=>{a.readKeyframes(),a.needsMeasurement&&(Gc=!0)})}function zT(){Xc=!0,h0(),d0(),Xc=!1}class Mf{constructor(i,s,r,c,f,d=!1){this.state="pending",this.isAsync=!1,this.needsMeasurement=!1,this.unresolvedKeyframes=[...i],this.onComplete=s,this.name=r,this.motionValue=c,this.element=f,this.isAsync=d}scheduleResolve(){this.state="scheduled",this.isAsync?(Ha.add(this),qc||(qc=!0,Ut.read(h0),Ut.resolveKeyframes(d0))):(this.readKeyframes(),this.complete())}readKeyframes(){const{unresolvedKeyframes:i,name:s,element:r,motionValue:c}=this;if(i[0]===null){const f=c?.get(),d=i[i.length-1];if(f!==void 0)i[0]=f;else if(r&&s){const m=r.readValue(s,d);m!=null&&(i[0]=m)}i[0]===void 0&&(i[0]=d),c&&f===void 0&&c.set(i[0])}NT(i)}setFinalKeyframe(){}measureInitialState(){}renderEndStyles(){}measureEndState(){}complete(i=!1){this.state="complete",this.onComplete(this.unresolvedKeyframes,this.finalKeyframe,i),Ha.delete(this)}cancel(){this.state==="scheduled"&&(Ha.delete(this),this.state="pending")}resume(){this.state==="pending"&&this.scheduleResolve()}}const VT=a=>a.startsWith("--");function UT(a,i,s){VT(i)?a.style.setProperty(i,s):a.style[i]=s}const BT=yf(()=>window.ScrollTimeline!==void 0),LT={};function HT(a,i){const s=yf(a);return()=>LT[i]??s()}const m0=HT(()=>{try{document.createElement("div").animate({opacity:0},{easing:"linear(0, 1)"})}catch{return!1}return!0},"linearEasing"),Bl=([a,i,s,r])=>`cubic-bezier(${a}, ${i}, ${s}, ${r})`,my={linear:"linear",ease:"ease",easeIn:"ease-in",easeOut:"ease-out",easeInOut:"ease-in-out",circIn:Bl([0,.65,.55,1]),circOut:Bl([.55,0,1,.45]),backIn:Bl([.31,.01,.66,-.59]),backOut:Bl([.33,1.53,.69,.99])};function p0(a,i){if(a)return typeof a=="function"?m0()?u0(a,i):"ease-out":Ig(a)?Bl(a):Array.isArray(a)?a.map(s=>p0(s,i)||my.easeOut):my[a]}function kT(a,i,s,{delay:r=0,duration:c=300,repeat:f=0,repeatType:d="loop",ease:m="easeOut",times:p}={},y=void 0){const g={[i]:s};p&&(g.offset=p);const b=p0(m,c);Array.isArray(b)&&(g.easing=b);const S={delay:r,duration:c,easing:Array.isArray(b)?"linear":b,fill:"both",iterations:f+1,direction:d==="reverse"?"alternate":"normal"};return y&&(S.pseudoElement=y),a.animate(g,S)}function y0(a){return typeof a=="function"&&"applyToOptions"in a}function YT({type:a,...i}){return y0(a)&&m0()?a.applyToOptions(i):(i.duration??(i.duration=300),i.ease??(i.ease="easeOut"),i)}class qT extends jf{constructor(i){if(super(),this.finishedTime=null,this.isStopped=!1,!i)return;const{element:s,name:r,keyframes:c,pseudoElement:f,allowFlatten:d=!1,finalKeyframe:m,onComplete:p}=i;this.isPseudoElement=!!f,this.allowFlatten=d,this.options=i,pf(typeof i.type!="string");const y=YT(i);this.animation=kT(s,r,c,y,f),y.autoplay===!1&&this.animation.pause(),this.animation.onfinish=()=>{if(this.finishedTime=this.time,!f){const g=Nf(c,this.options,m,this.speed);this.updateMotionValue?this.updateMotionValue(g):UT(s,r,g),this.animation.cancel()}p?.(),this.notifyFinished()}}play(){this.isStopped||(this.animation.play(),this.state==="finished"&&this.updateFinished())}pause(){this.animation.pause()}complete(){this.animation.finish?.()}cancel(){try{this.animation.cancel()}catch{}}stop(){if(this.isStopped)return;this.isStopped=!0;const{state:i}=this;i==="idle"||i==="finished"||(this.updateMotionValue?this.updateMotionValue():this.commitStyles(),this.isPseudoElement||this.cancel())}commitStyles(){this.isPseudoElement||this.animation.commitStyles?.()}get duration(){const i=this.animation.effect?.getComputedTiming?.().duration||0;return Fe(Number(i))}get iterationDuration(){const{delay:i=0}=this.options||{};return this.duration+Fe(i)}get time(){return Fe(Number(this.animation.currentTime)||0)}set time(i){this.finishedTime=null,this.animation.currentTime=cn(i)}get speed(){return this.animation.playbackRate}set speed(i){i<0&&(this.finishedTime=null),this.animation.playbackRate=i}get state(){return this.finishedTime!==null?"finished":this.animation.playState}get startTime(){return Number(this.animation.startTime)}set startTime(i){this.animation.startTime=i}attachTimeline({timeline:i,observe:s}){return this.allowFlatten&&this.animation.effect?.updateTiming({easing:"linear"}),this.animation.onfinish=null,i&&BT()?(this.animation.timeline=i,We):s(this)}}const g0={anticipate:Jg,backInOut:$g,circInOut:Fg};function GT(a){return a in g0}function XT(a){typeof a.ease=="string"&&GT(a.ease)&&(a.ease=g0[a.ease])}const py=10;class KT extends qT{constructor(i){XT(i),f0(i),super(i),i.startTime&&(this.startTime=i.startTime),this.options=i}updateMotionValue(i){const{motionValue:s,onUpdate:r,onComplete:c,element:f,...d}=this.options;if(!s)return;if(i!==void 0){s.set(i);return}const m=new Df({...d,autoplay:!1}),p=cn(this.finishedTime??this.time);s.setWithVelocity(m.sample(p-py).value,m.sample(p).value,py),m.stop()}}const yy=(a,i)=>i==="zIndex"?!1:!!(typeof a=="number"||Array.isArray(a)||typeof a=="string"&&(ca.test(a)||a==="0")&&!a.startsWith("url("));function QT(a){const i=a[0];if(a.length===1)return!0;for(let s=0;s<a.length;s++)if(a[s]!==i)return!0}function ZT(a,i,s,r){const c=a[0];if(c===null)return!1;if(i==="display"||i==="visibility")return!0;const f=a[a.length-1],d=yy(c,i),m=yy(f,i);return!d||!m?!1:QT(a)||(s==="spring"||y0(s))&&r}function Kc(a){a.duration=0,a.type="keyframes"}const $T=new Set(["opacity","clipPath","filter","transform"]),JT=yf(()=>Object.hasOwnProperty.call(Element.prototype,"animate"));function PT(a){const{motionValue:i,name:s,repeatDelay:r,repeatType:c,damping:f,type:d}=a;if(!(i?.owner?.current instanceof HTMLElement))return!1;const{onUpdate:p,transformTemplate:y}=i.owner.getProps();return JT()&&s&&$T.has(s)&&(s!=="transform"||!y)&&!p&&!r&&c!=="mirror"&&f!==0&&d!=="inertia"}const FT=40;class WT extends jf{constructor({autoplay:i=!0,delay:s=0,type:r="keyframes",repeat:c=0,repeatDelay:f=0,repeatType:d="loop",keyframes:m,name:p,motionValue:y,element:g,...b}){super(),this.stop=()=>{this._animation&&(this._animation.stop(),this.stopTimeline?.()),this.keyframeResolver?.cancel()},this.createdAt=Ce.now();const S={autoplay:i,delay:s,type:r,repeat:c,repeatDelay:f,repeatType:d,name:p,motionValue:y,element:g,...b},N=g?.KeyframeResolver||Mf;this.keyframeResolver=new N(m,(V,B,U)=>this.onKeyframesResolved(V,B,S,!U),p,y,g),this.keyframeResolver?.scheduleResolve()}onKeyframesResolved(i,s,r,c){this.keyframeResolver=void 0;const{name:f,type:d,velocity:m,delay:p,isHandoff:y,onUpdate:g}=r;this.resolvedAt=Ce.now(),ZT(i,f,d,m)||((On.instantAnimations||!p)&&g?.(Nf(i,r,s)),i[0]=i[i.length-1],Kc(r),r.repeat=0);const S={startTime:c?this.resolvedAt?this.resolvedAt-this.createdAt>FT?this.resolvedAt:this.createdAt:this.createdAt:void 0,finalKeyframe:s,...r,keyframes:i},N=!y&&PT(S)?new KT({...S,element:S.motionValue.owner.current}):new Df(S);N.finished.then(()=>this.notifyFinished()).catch(We),this.pendingTimeline&&(this.stopTimeline=N.attachTimeline(this.pendingTimeline),this.pendingTimeline=void 0),this._animation=N}get finished(){return this._animation?this.animation.finished:this._finished}then(i,s){return this.finished.finally(i).then(()=>{})}get animation(){return this._animation||(this.keyframeResolver?.resume(),zT()),this._animation}get duration(){return this.animation.duration}get iterationDuration(){return this.animation.iterationDuration}get time(){return this.animation.time}set time(i){this.animation.time=i}get speed(){return this.animation.speed}get state(){return this.animation.state}set speed(i){this.animation.speed=i}get startTime(){return this.animation.startTime}attachTimeline(i){return this._animation?this.stopTimeline=this.animation.attachTimeline(i):this.pendingTimeline=i,()=>this.stop()}play(){this.animation.play()}pause(){this.animation.pause()}complete(){this.animation.complete()}cancel(){this._animation&&this.animation.cancel(),this.keyframeResolver?.cancel()}}const IT=/^var\(--(?:([\w-]+)|([\w-]+), ?([a-zA-Z\d ()%#.,-]+))\)/u;function t2(a){const i=IT.exec(a);if(!i)return[,];const[,s,r,c]=i;return[`--${s??r}`,c]}function v0(a,i,s=1){const[r,c]=t2(a);if(!r)return;const f=window.getComputedStyle(i).getPropertyValue(r);if(f){const d=f.trim();return kg(d)?parseFloat(d):d}return Sf(c)?v0(c,i,s+1):c}function wf(a,i){return a?.[i]??a?.default??a}const x0=new Set(["width","height","top","left","right","bottom",...Bi]),e2={test:a=>a==="auto",parse:a=>a},b0=a=>i=>i.test(a),S0=[Ui,it,fn,oa,Q1,K1,e2],gy=a=>S0.find(b0(a));function n2(a){return typeof a=="number"?a===0:a!==null?a==="none"||a==="0"||qg(a):!0}const a2=new Set(["brightness","contrast","saturate","opacity"]);function i2(a){const[i,s]=a.slice(0,-1).split("(");if(i==="drop-shadow")return a;const[r]=s.match(Tf)||[];if(!r)return a;const c=s.replace(r,"");let f=a2.has(i)?1:0;return r!==s&&(f*=100),i+"("+f+c+")"}const l2=/\b([a-z-]*)\(.*?\)/gu,Qc={...ca,getAnimatableNone:a=>{const i=a.match(l2);return i?i.map(i2).join(" "):a}},vy={...Ui,transform:Math.round},s2={rotate:oa,rotateX:oa,rotateY:oa,rotateZ:oa,scale:Er,scaleX:Er,scaleY:Er,scaleZ:Er,skew:oa,skewX:oa,skewY:oa,distance:it,translateX:it,translateY:it,translateZ:it,x:it,y:it,z:it,perspective:it,transformPerspective:it,opacity:Ql,originX:ly,originY:ly,originZ:it},Rf={borderWidth:it,borderTopWidth:it,borderRightWidth:it,borderBottomWidth:it,borderLeftWidth:it,borderRadius:it,radius:it,borderTopLeftRadius:it,borderTopRightRadius:it,borderBottomRightRadius:it,borderBottomLeftRadius:it,width:it,maxWidth:it,height:it,maxHeight:it,top:it,right:it,bottom:it,left:it,padding:it,paddingTop:it,paddingRight:it,paddingBottom:it,paddingLeft:it,margin:it,marginTop:it,marginRight:it,marginBottom:it,marginLeft:it,backgroundPositionX:it,backgroundPositionY:it,...s2,zIndex:vy,fillOpacity:Ql,strokeOpacity:Ql,numOctaves:vy},r2={...Rf,color:Wt,backgroundColor:Wt,outlineColor:Wt,fill:Wt,stroke:Wt,borderColor:Wt,borderTopColor:Wt,borderRightColor:Wt,borderBottomColor:Wt,borderLeftColor:Wt,filter:Qc,WebkitFilter:Qc},T0=a=>r2[a];function E0(a,i){let s=T0(a);return s!==Qc&&(s=ca),s.getAnimatableNone?s.getAnimatableNone(i):void 0}const o2=new Set(["auto","none","0"]);function u2(a,i,s){let r=0,c;for(;r<a.length&&!c;){const f=a[r];typeof f=="string"&&!o2.has(f)&&Zl(f).values.length&&(c=a[r]),r++}if(c&&s)for(const f of i)a[f]=E0(s,c)}class c2 extends Mf{constructor(i,s,r,c,f){super(i,s,r,c,f,!0)}readKeyframes(){const{unresolvedKeyframes:i,element:s,name:r}=this;if(!s||!s.current)return;super.readKeyframes();for(let p=0;p<i.length;p++){let y=i[p];if(typeof y=="string"&&(y=y.trim(),Sf(y))){const g=v0(y,s.current);g!==void 0&&(i[p]=g),p===i.length-1&&(this.finalKeyframe=y)}}if(this.resolveNoneKeyframes(),!x0.has(r)||i.length!==2)return;const[c,f]=i,d=gy(c),m=gy(f);if(d!==m)if(hy(d)&&hy(m))for(let p=0;p<i.length;p++){const y=i[p];typeof y=="string"&&(i[p]=parseFloat(y))}else La[r]&&(this.needsMeasurement=!0)}resolveNoneKeyframes(){const{unresolvedKeyframes:i,name:s}=this,r=[];for(let c=0;c<i.length;c++)(i[c]===null||n2(i[c]))&&r.push(c);r.length&&u2(i,r,s)}measureInitialState(){const{element:i,unresolvedKeyframes:s,name:r}=this;if(!i||!i.current)return;r==="height"&&(this.suspendedScrollY=window.pageYOffset),this.measuredOrigin=La[r](i.measureViewportBox(),window.getComputedStyle(i.current)),s[0]=this.measuredOrigin;const c=s[s.length-1];c!==void 0&&i.getValue(r,c).jump(c,!1)}measureEndState(){const{element:i,name:s,unresolvedKeyframes:r}=this;if(!i||!i.current)return;const c=i.getValue(s);c&&c.jump(this.measuredOrigin,!1);const f=r.length-1,d=r[f];r[f]=La[s](i.measureViewportBox(),window.getComputedStyle(i.current)),d!==null&&this.finalKeyframe===void 0&&(this.finalKeyframe=d),this.removedTransforms?.length&&this.removedTransforms.forEach(([m,p])=>{i.getValue(m).set(p)}),this.resolveNoneKeyframes()}}function f2(a,i,s){if(a instanceof EventTarget)return[a];if(typeof a=="string"){let r=document;const c=s?.[a]??r.querySelectorAll(a);return c?Array.from(c):[]}return Array.from(a)}const A0=(a,i)=>i&&typeof a=="number"?i.transform(a):a;function d2(a){return Yg(a)&&"offsetHeight"in a}const xy=30,h2=a=>!isNaN(parseFloat(a));class m2{constructor(i,s={}){this.canTrackVelocity=null,this.events={},this.updateAndNotify=r=>{const c=Ce.now();if(this.updatedAt!==c&&this.setPrevFrameValue(),this.prev=this.current,this.setCurrent(r),this.current!==this.prev&&(this.events.change?.notify(this.current),this.dependents))for(const f of this.dependents)f.dirty()},this.hasAnimated=!1,this.setCurrent(i),this.owner=s.owner}setCurrent(i){this.current=i,this.updatedAt=Ce.now(),this.canTrackVelocity===null&&i!==void 0&&(this.canTrackVelocity=h2(this.current))}setPrevFrameValue(i=this.current){this.prevFrameValue=i,this.prevUpdatedAt=this.updatedAt}onChange(i){return this.on("change",i)}on(i,s){this.events[i]||(this.events[i]=new gf);const r=this.events[i].add(s);return i==="change"?()=>{r(),Ut.read(()=>{this.events.change.getSize()||this.stop()})}:r}clearListeners(){for(const i in this.events)this.events[i].clear()}attach(i,s){this.passiveEffect=i,this.stopPassiveEffect=s}set(i){this.passiveEffect?this.passiveEffect(i,this.updateAndNotify):this.updateAndNotify(i)}setWithVelocity(i,s,r){this.set(s),this.prev=void 0,this.prevFrameValue=i,this.prevUpdatedAt=this.updatedAt-r}jump(i,s=!0){this.updateAndNotify(i),this.prev=i,this.prevUpdatedAt=this.prevFrameValue=void 0,s&&this.stop(),this.stopPassiveEffect&&this.stopPassiveEffect()}dirty(){this.events.change?.notify(this.current)}addDependent(i){this.dependents||(this.dependents=new Set),this.dependents.add(i)}removeDependent(i){this.dependents&&this.dependents.delete(i)}get(){return this.current}getPrevious(){return this.prev}getVelocity(){const i=Ce.now();if(!this.canTrackVelocity||this.prevFrameValue===void 0||i-this.updatedAt>xy)return 0;const s=Math.min(this.updatedAt-this.prevUpdatedAt,xy);return Gg(parseFloat(this.current)-parseFloat(this.prevFrameValue),s)}start(i){return this.stop(),new Promise(s=>{this.hasAnimated=!0,this.animation=i(s),this.events.animationStart&&this.events.animationStart.notify()}).then(()=>{this.events.animationComplete&&this.events.animationComplete.notify(),this.clearAnimation()})}stop(){this.animation&&(this.animation.stop(),this.events.animationCancel&&this.events.animationCancel.notify()),this.clearAnimation()}isAnimating(){return!!this.animation}clearAnimation(){delete this.animation}destroy(){this.dependents?.clear(),this.events.destroy?.notify(),this.clearListeners(),this.stop(),this.stopPassiveEffect&&this.stopPassiveEffect()}}function _i(a,i){return new m2(a,i)}const{schedule:_f}=t0(queueMicrotask,!1),an={x:!1,y:!1};function C0(){return an.x||an.y}function p2(a){return a==="x"||a==="y"?an[a]?null:(an[a]=!0,()=>{an[a]=!1}):an.x||an.y?null:(an.x=an.y=!0,()=>{an.x=an.y=!1})}function N0(a,i){const s=f2(a),r=new AbortController,c={passive:!0,...i,signal:r.signal};return[s,c,()=>r.abort()]}function by(a){return!(a.pointerType==="touch"||C0())}function y2(a,i,s={}){const[r,c,f]=N0(a,s),d=m=>{if(!by(m))return;const{target:p}=m,y=i(p,m);if(typeof y!="function"||!p)return;const g=b=>{by(b)&&(y(b),p.removeEventListener("pointerleave",g))};p.addEventListener("pointerleave",g,c)};return r.forEach(m=>{m.addEventListener("pointerenter",d,c)}),f}const j0=(a,i)=>i?a===i?!0:j0(a,i.parentElement):!1,Of=a=>a.pointerType==="mouse"?typeof a.button!="number"||a.button<=0:a.isPrimary!==!1,g2=new Set(["BUTTON","INPUT","SELECT","TEXTAREA","A"]);function v2(a){return g2.has(a.tagName)||a.tabIndex!==-1}const wr=new WeakSet;function Sy(a){return i=>{i.key==="Enter"&&a(i)}}function vc(a,i){a.dispatchEvent(new PointerEvent("pointer"+i,{isPrimary:!0,bubbles:!0}))}const x2=(a,i)=>{const s=a.currentTarget;if(!s)return;const r=Sy(()=>{if(wr.has(s))return;vc(s,"down");const c=Sy(()=>{vc(s,"up")}),f=()=>vc(s,"cancel");s.addEventListener("keyup",c,i),s.addEventListener("blur",f,i)});s.addEventListener("keydown",r,i),s.addEventListener("blur",()=>s.removeEventListener("keydown",r),i)};function Ty(a){return Of(a)&&!C0()}function b2(a,i,s={}){const[r,c,f]=N0(a,s),d=m=>{const p=m.currentTarget;if(!Ty(m))return;wr.add(p);const y=i(p,m),g=(N,V)=>{window.removeEventListener("pointerup",b),window.removeEventListener("pointercancel",S),wr.has(p)&&wr.delete(p),Ty(N)&&typeof y=="function"&&y(N,{success:V})},b=N=>{g(N,p===window||p===document||s.useGlobalTarget||j0(p,N.target))},S=N=>{g(N,!1)};window.addEventListener("pointerup",b,c),window.addEventListener("pointercancel",S,c)};return r.forEach(m=>{(s.useGlobalTarget?window:m).addEventListener("pointerdown",d,c),d2(m)&&(m.addEventListener("focus",y=>x2(y,c)),!v2(m)&&!m.hasAttribute("tabindex")&&(m.tabIndex=0))}),f}function D0(a){return Yg(a)&&"ownerSVGElement"in a}function S2(a){return D0(a)&&a.tagName==="svg"}const he=a=>!!(a&&a.getVelocity),T2=[...S0,Wt,ca],E2=a=>T2.find(b0(a)),M0=E.createContext({transformPagePoint:a=>a,isStatic:!1,reducedMotion:"never"});function A2(a=!0){const i=E.useContext(df);if(i===null)return[!0,null];const{isPresent:s,onExitComplete:r,register:c}=i,f=E.useId();E.useEffect(()=>{if(a)return c(f)},[a]);const d=E.useCallback(()=>a&&r&&r(f),[f,r,a]);return!s&&r?[!1,d]:[!0]}const w0=E.createContext({strict:!1}),Ey={animation:["animate","variants","whileHover","whileTap","exit","whileInView","whileFocus","whileDrag"],exit:["exit"],drag:["drag","dragControls"],focus:["whileFocus"],hover:["whileHover","onHoverStart","onHoverEnd"],tap:["whileTap","onTap","onTapStart","onTapCancel"],pan:["onPan","onPanStart","onPanSessionStart","onPanEnd"],inView:["whileInView","onViewportEnter","onViewportLeave"],layout:["layout","layoutId"]},Oi={};for(const a in Ey)Oi[a]={isEnabled:i=>Ey[a].some(s=>!!i[s])};function C2(a){for(const i in a)Oi[i]={...Oi[i],...a[i]}}const N2=new Set(["animate","exit","variants","initial","style","values","variants","transition","transformTemplate","custom","inherit","onBeforeLayoutMeasure","onAnimationStart","onAnimationComplete","onUpdate","onDragStart","onDrag","onDragEnd","onMeasureDragConstraints","onDirectionLock","onDragTransitionEnd","_dragX","_dragY","onHoverStart","onHoverEnd","onViewportEnter","onViewportLeave","globalTapTarget","ignoreStrict","viewport"]);function Br(a){return a.startsWith("while")||a.startsWith("drag")&&a!=="draggable"||a.startsWith("layout")||a.startsWith("onTap")||a.startsWith("onPan")||a.startsWith("onLayout")||N2.has(a)}let R0=a=>!Br(a);function j2(a){typeof a=="function"&&(R0=i=>i.startsWith("on")?!Br(i):a(i))}try{j2(require("@emotion/is-prop-valid").default)}catch{}function D2(a,i,s){const r={};for(const c in a)c==="values"&&typeof a.values=="object"||(R0(c)||s===!0&&Br(c)||!i&&!Br(c)||a.draggable&&c.startsWith("onDrag"))&&(r[c]=a[c]);return r}const Yr=E.createContext({});function qr(a){return a!==null&&typeof a=="object"&&typeof a.start=="function"}function $l(a){return typeof a=="string"||Array.isArray(a)}const zf=["animate","whileInView","whileFocus","whileHover","whileTap","whileDrag","exit"],Vf=["initial",...zf];function Gr(a){return qr(a.animate)||Vf.some(i=>$l(a[i]))}function _0(a){return!!(Gr(a)||a.variants)}function M2(a,i){if(Gr(a)){const{initial:s,animate:r}=a;return{initial:s===!1||$l(s)?s:void 0,animate:$l(r)?r:void 0}}return a.inherit!==!1?i:{}}function w2(a){const{initial:i,animate:s}=M2(a,E.useContext(Yr));return E.useMemo(()=>({initial:i,animate:s}),[Ay(i),Ay(s)])}function Ay(a){return Array.isArray(a)?a.join(" "):a}const Jl={};function R2(a){for(const i in a)Jl[i]=a[i],bf(i)&&(Jl[i].isCSSVariable=!0)}function O0(a,{layout:i,layoutId:s}){return Li.has(a)||a.startsWith("origin")||(i||s!==void 0)&&(!!Jl[a]||a==="opacity")}const _2={x:"translateX",y:"translateY",z:"translateZ",transformPerspective:"perspective"},O2=Bi.length;function z2(a,i,s){let r="",c=!0;for(let f=0;f<O2;f++){const d=Bi[f],m=a[d];if(m===void 0)continue;let p=!0;if(typeof m=="number"?p=m===(d.startsWith("scale")?1:0):p=parseFloat(m)===0,!p||s){const y=A0(m,Rf[d]);if(!p){c=!1;const g=_2[d]||d;r+=`${g}(${y}) `}s&&(i[d]=y)}}return r=r.trim(),s?r=s(i,c?"":r):c&&(r="none"),r}function Uf(a,i,s){const{style:r,vars:c,transformOrigin:f}=a;let d=!1,m=!1;for(const p in i){const y=i[p];if(Li.has(p)){d=!0;continue}else if(bf(p)){c[p]=y;continue}else{const g=A0(y,Rf[p]);p.startsWith("origin")?(m=!0,f[p]=g):r[p]=g}}if(i.transform||(d||s?r.transform=z2(i,a.transform,s):r.transform&&(r.transform="none")),m){const{originX:p="50%",originY:y="50%",originZ:g=0}=f;r.transformOrigin=`${p} ${y} ${g}`}}const Bf=()=>({style:{},transform:{},transformOrigin:{},vars:{}});function z0(a,i,s){for(const r in i)!he(i[r])&&!O0(r,s)&&(a[r]=i[r])}function V2({transformTemplate:a},i){return E.useMemo(()=>{const s=Bf();return Uf(s,i,a),Object.assign({},s.vars,s.style)},[i])}function U2(a,i){const s=a.style||{},r={};return z0(r,s,a),Object.assign(r,V2(a,i)),r}function B2(a,i){const s={},r=U2(a,i);return a.drag&&a.dragListener!==!1&&(s.draggable=!1,r.userSelect=r.WebkitUserSelect=r.WebkitTouchCallout="none",r.touchAction=a.drag===!0?"none":`pan-${a.drag==="x"?"y":"x"}`),a.tabIndex===void 0&&(a.onTap||a.onTapStart||a.whileTap)&&(s.tabIndex=0),s.style=r,s}const L2={offset:"stroke-dashoffset",array:"stroke-dasharray"},H2={offset:"strokeDashoffset",array:"strokeDasharray"};function k2(a,i,s=1,r=0,c=!0){a.pathLength=1;const f=c?L2:H2;a[f.offset]=it.transform(-r);const d=it.transform(i),m=it.transform(s);a[f.array]=`${d} ${m}`}function V0(a,{attrX:i,attrY:s,attrScale:r,pathLength:c,pathSpacing:f=1,pathOffset:d=0,...m},p,y,g){if(Uf(a,m,y),p){a.style.viewBox&&(a.attrs.viewBox=a.style.viewBox);return}a.attrs=a.style,a.style={};const{attrs:b,style:S}=a;b.transform&&(S.transform=b.transform,delete b.transform),(S.transform||b.transformOrigin)&&(S.transformOrigin=b.transformOrigin??"50% 50%",delete b.transformOrigin),S.transform&&(S.transformBox=g?.transformBox??"fill-box",delete b.transformBox),i!==void 0&&(b.x=i),s!==void 0&&(b.y=s),r!==void 0&&(b.scale=r),c!==void 0&&k2(b,c,f,d,!1)}const U0=()=>({...Bf(),attrs:{}}),B0=a=>typeof a=="string"&&a.toLowerCase()==="svg";function Y2(a,i,s,r){const c=E.useMemo(()=>{const f=U0();return V0(f,i,B0(r),a.transformTemplate,a.style),{...f.attrs,style:{...f.style}}},[i]);if(a.style){const f={};z0(f,a.style,a),c.style={...f,...c.style}}return c}const q2=["animate","circle","defs","desc","ellipse","g","image","line","filter","marker","mask","metadata","path","pattern","polygon","polyline","rect","stop","switch","symbol","svg","text","tspan","use","view"];function Lf(a){return typeof a!="string"||a.includes("-")?!1:!!(q2.indexOf(a)>-1||/[A-Z]/u.test(a))}function G2(a,i,s,{latestValues:r},c,f=!1){const m=(Lf(a)?Y2:B2)(i,r,c,a),p=D2(i,typeof a=="string",f),y=a!==E.Fragment?{...p,...m,ref:s}:{},{children:g}=i,b=E.useMemo(()=>he(g)?g.get():g,[g]);return E.createElement(a,{...y,children:b})}function Cy(a){const i=[{},{}];return a?.values.forEach((s,r)=>{i[0][r]=s.get(),i[1][r]=s.getVelocity()}),i}function Hf(a,i,s,r){if(typeof i=="function"){const[c,f]=Cy(r);i=i(s!==void 0?s:a.custom,c,f)}if(typeof i=="string"&&(i=a.variants&&a.variants[i]),typeof i=="function"){const[c,f]=Cy(r);i=i(s!==void 0?s:a.custom,c,f)}return i}function Rr(a){return he(a)?a.get():a}function X2({scrapeMotionValuesFromProps:a,createRenderState:i},s,r,c){return{latestValues:K2(s,r,c,a),renderState:i()}}function K2(a,i,s,r){const c={},f=r(a,{});for(const S in f)c[S]=Rr(f[S]);let{initial:d,animate:m}=a;const p=Gr(a),y=_0(a);i&&y&&!p&&a.inherit!==!1&&(d===void 0&&(d=i.initial),m===void 0&&(m=i.animate));let g=s?s.initial===!1:!1;g=g||d===!1;const b=g?m:d;if(b&&typeof b!="boolean"&&!qr(b)){const S=Array.isArray(b)?b:[b];for(let N=0;N<S.length;N++){const V=Hf(a,S[N]);if(V){const{transitionEnd:B,transition:U,...j}=V;for(const _ in j){let O=j[_];if(Array.isArray(O)){const $=g?O.length-1:0;O=O[$]}O!==null&&(c[_]=O)}for(const _ in B)c[_]=B[_]}}}return c}const L0=a=>(i,s)=>{const r=E.useContext(Yr),c=E.useContext(df),f=()=>X2(a,i,r,c);return s?f():C1(f)};function kf(a,i,s){const{style:r}=a,c={};for(const f in r)(he(r[f])||i.style&&he(i.style[f])||O0(f,a)||s?.getValue(f)?.liveStyle!==void 0)&&(c[f]=r[f]);return c}const Q2=L0({scrapeMotionValuesFromProps:kf,createRenderState:Bf});function H0(a,i,s){const r=kf(a,i,s);for(const c in a)if(he(a[c])||he(i[c])){const f=Bi.indexOf(c)!==-1?"attr"+c.charAt(0).toUpperCase()+c.substring(1):c;r[f]=a[c]}return r}const Z2=L0({scrapeMotionValuesFromProps:H0,createRenderState:U0}),$2=Symbol.for("motionComponentSymbol");function ji(a){return a&&typeof a=="object"&&Object.prototype.hasOwnProperty.call(a,"current")}function J2(a,i,s){return E.useCallback(r=>{r&&a.onMount&&a.onMount(r),i&&(r?i.mount(r):i.unmount()),s&&(typeof s=="function"?s(r):ji(s)&&(s.current=r))},[i])}const Yf=a=>a.replace(/([a-z])([A-Z])/gu,"$1-$2").toLowerCase(),P2="framerAppearId",k0="data-"+Yf(P2),Y0=E.createContext({});function F2(a,i,s,r,c){const{visualElement:f}=E.useContext(Yr),d=E.useContext(w0),m=E.useContext(df),p=E.useContext(M0).reducedMotion,y=E.useRef(null);r=r||d.renderer,!y.current&&r&&(y.current=r(a,{visualState:i,parent:f,props:s,presenceContext:m,blockInitialAnimation:m?m.initial===!1:!1,reducedMotionConfig:p}));const g=y.current,b=E.useContext(Y0);g&&!g.projection&&c&&(g.type==="html"||g.type==="svg")&&W2(y.current,s,c,b);const S=E.useRef(!1);E.useInsertionEffect(()=>{g&&S.current&&g.update(s,m)});const N=s[k0],V=E.useRef(!!N&&!window.MotionHandoffIsComplete?.(N)&&window.MotionHasOptimisedAnimation?.(N));return N1(()=>{g&&(S.current=!0,window.MotionIsMounted=!0,g.updateFeatures(),g.scheduleRenderMicrotask(),V.current&&g.animationState&&g.animationState.animateChanges())}),E.useEffect(()=>{g&&(!V.current&&g.animationState&&g.animationState.animateChanges(),V.current&&(queueMicrotask(()=>{window.MotionHandoffMarkAsComplete?.(N)}),V.current=!1),g.enteringChildren=void 0)}),g}function W2(a,i,s,r){const{layoutId:c,layout:f,drag:d,dragConstraints:m,layoutScroll:p,layoutRoot:y,layoutCrossfade:g}=i;a.projection=new s(a.latestValues,i["data-framer-portal-id"]?void 0:q0(a.parent)),a.projection.setOptions({layoutId:c,layout:f,alwaysMeasureLayout:!!d||m&&ji(m),visualElement:a,animationType:typeof f=="string"?f:"both",initialPromotionConfig:r,crossfade:g,layoutScroll:p,layoutRoot:y})}function q0(a){if(a)return a.options.allowProjection!==!1?a.projection:q0(a.parent)}function xc(a,{forwardMotionProps:i=!1}={},s,r){s&&C2(s);const c=Lf(a)?Z2:Q2;function f(m,p){let y;const g={...E.useContext(M0),...m,layoutId:I2(m)},{isStatic:b}=g,S=w2(m),N=c(m,b);if(!b&&ff){tE();const V=eE(g);y=V.MeasureLayout,S.visualElement=F2(a,N,g,r,V.ProjectionNode)}return v.jsxs(Yr.Provider,{value:S,children:[y&&S.visualElement?v.jsx(y,{visualElement:S.visualElement,...g}):null,G2(a,m,J2(N,S.visualElement,p),N,b,i)]})}f.displayName=`motion.${typeof a=="string"?a:`create(${a.displayName??a.name??""})`}`;const d=E.forwardRef(f);return d[$2]=a,d}function I2({layoutId:a}){const i=E.useContext(Hg).id;return i&&a!==void 0?i+"-"+a:a}function tE(a,i){E.useContext(w0).strict}function eE(a){const{drag:i,layout:s}=Oi;if(!i&&!s)return{};const r={...i,...s};return{MeasureLayout:i?.isEnabled(a)||s?.isEnabled(a)?r.MeasureLayout:void 0,ProjectionNode:r.ProjectionNode}}function nE(a,i){if(typeof Proxy>"u")return xc;const s=new Map,r=(f,d)=>xc(f,d,a,i),c=(f,d)=>r(f,d);return new Proxy(c,{get:(f,d)=>d==="create"?r:(s.has(d)||s.set(d,xc(d,void 0,a,i)),s.get(d))})}function G0({top:a,left:i,right:s,bottom:r}){return{x:{min:i,max:s},y:{min:a,max:r}}}function aE({x:a,y:i}){return{top:i.min,right:a.max,bottom:i.max,left:a.min}}function iE(a,i){if(!i)return a;const s=i({x:a.left,y:a.top}),r=i({x:a.right,y:a.bottom});return{top:s.y,left:s.x,bottom:r.y,right:r.x}}function bc(a){return a===void 0||a===1}function Zc({scale:a,scaleX:i,scaleY:s}){return!bc(a)||!bc(i)||!bc(s)}function Va(a){return Zc(a)||X0(a)||a.z||a.rotate||a.rotateX||a.rotateY||a.skewX||a.skewY}function X0(a){return Ny(a.x)||Ny(a.y)}function Ny(a){return a&&a!=="0%"}function Lr(a,i,s){const r=a-s,c=i*r;return s+c}function jy(a,i,s,r,c){return c!==void 0&&(a=Lr(a,c,r)),Lr(a,s,r)+i}function $c(a,i=0,s=1,r,c){a.min=jy(a.min,i,s,r,c),a.max=jy(a.max,i,s,r,c)}function K0(a,{x:i,y:s}){$c(a.x,i.translate,i.scale,i.originPoint),$c(a.y,s.translate,s.scale,s.originPoint)}const Dy=.999999999999,My=1.0000000000001;function lE(a,i,s,r=!1){const c=s.length;if(!c)return;i.x=i.y=1;let f,d;for(let m=0;m<c;m++){f=s[m],d=f.projectionDelta;const{visualElement:p}=f.options;p&&p.props.style&&p.props.style.display==="contents"||(r&&f.options.layoutScroll&&f.scroll&&f!==f.root&&Mi(a,{x:-f.scroll.offset.x,y:-f.scroll.offset.y}),d&&(i.x*=d.x.scale,i.y*=d.y.scale,K0(a,d)),r&&Va(f.latestValues)&&Mi(a,f.latestValues))}i.x<My&&i.x>Dy&&(i.x=1),i.y<My&&i.y>Dy&&(i.y=1)}function Di(a,i){a.min=a.min+i,a.max=a.max+i}function wy(a,i,s,r,c=.5){const f=Ht(a.min,a.max,c);$c(a,i,s,f,r)}function Mi(a,i){wy(a.x,i.x,i.scaleX,i.scale,i.originX),wy(a.y,i.y,i.scaleY,i.scale,i.originY)}function Q0(a,i){return G0(iE(a.getBoundingClientRect(),i))}function sE(a,i,s){const r=Q0(a,s),{scroll:c}=i;return c&&(Di(r.x,c.offset.x),Di(r.y,c.offset.y)),r}const Ry=()=>({translate:0,scale:1,origin:0,originPoint:0}),wi=()=>({x:Ry(),y:Ry()}),_y=()=>({min:0,max:0}),Zt=()=>({x:_y(),y:_y()}),Jc={current:null},Z0={current:!1};function rE(){if(Z0.current=!0,!!ff)if(window.matchMedia){const a=window.matchMedia("(prefers-reduced-motion)"),i=()=>Jc.current=a.matches;a.addEventListener("change",i),i()}else Jc.current=!1}const oE=new WeakMap;function uE(a,i,s){for(const r in i){const c=i[r],f=s[r];if(he(c))a.addValue(r,c);else if(he(f))a.addValue(r,_i(c,{owner:a}));else if(f!==c)if(a.hasValue(r)){const d=a.getValue(r);d.liveStyle===!0?d.jump(c):d.hasAnimated||d.set(c)}else{const d=a.getStaticValue(r);a.addValue(r,_i(d!==void 0?d:c,{owner:a}))}}for(const r in s)i[r]===void 0&&a.removeValue(r);return i}const Oy=["AnimationStart","AnimationComplete","Update","BeforeLayoutMeasure","LayoutMeasure","LayoutAnimationStart","LayoutAnimationComplete"];class cE{scrapeMotionValuesFromProps(i,s,r){return{}}constructor({parent:i,props:s,presenceContext:r,reducedMotionConfig:c,blockInitialAnimation:f,visualState:d},m={}){this.current=null,this.children=new Set,this.isVariantNode=!1,this.isControllingVariants=!1,this.shouldReduceMotion=null,this.values=new Map,this.KeyframeResolver=Mf,this.features={},this.valueSubscriptions=new Map,this.prevMotionValues={},this.events={},this.propEventSubscriptions={},this.notifyUpdate=()=>this.notify("Update",this.latestValues),this.render=()=>{this.current&&(this.triggerBuild(),this.renderInstance(this.current,this.renderState,this.props.style,this.projection))},this.renderScheduledAt=0,this.scheduleRender=()=>{const S=Ce.now();this.renderScheduledAt<S&&(this.renderScheduledAt=S,Ut.render(this.render,!1,!0))};const{latestValues:p,renderState:y}=d;this.latestValues=p,this.baseTarget={...p},this.initialValues=s.initial?{...p}:{},this.renderState=y,this.parent=i,this.props=s,this.presenceContext=r,this.depth=i?i.depth+1:0,this.reducedMotionConfig=c,this.options=m,this.blockInitialAnimation=!!f,this.isControllingVariants=Gr(s),this.isVariantNode=_0(s),this.isVariantNode&&(this.variantChildren=new Set),this.manuallyAnimateOnMount=!!(i&&i.current);const{willChange:g,...b}=this.scrapeMotionValuesFromProps(s,{},this);for(const S in b){const N=b[S];p[S]!==void 0&&he(N)&&N.set(p[S])}}mount(i){this.current=i,oE.set(i,this),this.projection&&!this.projection.instance&&this.projection.mount(i),this.parent&&this.isVariantNode&&!this.isControllingVariants&&(this.removeFromVariantTree=this.parent.addVariantChild(this)),this.values.forEach((s,r)=>this.bindToMotionValue(r,s)),Z0.current||rE(),this.shouldReduceMotion=this.reducedMotionConfig==="never"?!1:this.reducedMotionConfig==="always"?!0:Jc.current,this.parent?.addChild(this),this.update(this.props,this.presenceContext)}unmount(){this.projection&&this.projection.unmount(),ua(this.notifyUpdate),ua(this.render),this.valueSubscriptions.forEach(i=>i()),this.valueSubscriptions.clear(),this.removeFromVariantTree&&this.removeFromVariantTree(),this.parent?.removeChild(this);for(const i in this.events)this.events[i].clear();for(const i in this.features){const s=this.features[i];s&&(s.unmount(),s.isMounted=!1)}this.current=null}addChild(i){this.children.add(i),this.enteringChildren??(this.enteringChildren=new Set),this.enteringChildren.add(i)}removeChild(i){this.children.delete(i),this.enteringChildren&&this.enteringChildren.delete(i)}bindToMotionValue(i,s){this.valueSubscriptions.has(i)&&this.valueSubscriptions.get(i)();const r=Li.has(i);r&&this.onBindTransform&&this.onBindTransform();const c=s.on("change",d=>{this.latestValues[i]=d,this.props.onUpdate&&Ut.preRender(this.notifyUpdate),r&&this.projection&&(this.projection.isTransformDirty=!0),this.scheduleRender()});let f;window.MotionCheckAppearSync&&(f=window.MotionCheckAppearSync(this,i,s)),this.valueSubscriptions.set(i,()=>{c(),f&&f(),s.owner&&s.stop()})}sortNodePosition(i){return!this.current||!this.sortInstanceNodePosition||this.type!==i.type?0:this.sortInstanceNodePosition(this.current,i.current)}updateFeatures(){let i="animation";for(i in Oi){const s=Oi[i];if(!s)continue;const{isEnabled:r,Feature:c}=s;if(!this.features[i]&&c&&r(this.props)&&(this.features[i]=new c(this)),this.features[i]){const f=this.features[i];f.isMounted?f.update():(f.mount(),f.isMounted=!0)}}}triggerBuild(){this.build(this.renderState,this.latestValues,this.props)}measureViewportBox(){return this.current?this.measureInstanceViewportBox(this.current,this.props):Zt()}getStaticValue(i){return this.latestValues[i]}setStaticValue(i,s){this.latestValues[i]=s}update(i,s){(i.transformTemplate||this.props.transformTemplate)&&this.scheduleRender(),this.prevProps=this.props,this.props=i,this.prevPresenceContext=this.presenceContext,this.presenceContext=s;for(let r=0;r<Oy.length;r++){const c=Oy[r];this.propEventSubscriptions[c]&&(this.propEventSubscriptions[c](),delete this.propEventSubscriptions[c]);const f="on"+c,d=i[f];d&&(this.propEventSubscriptions[c]=this.on(c,d))}this.prevMotionValues=uE(this,this.scrapeMotionValuesFromProps(i,this.prevProps,this),this.prevMotionValues),this.handleChildMotionValue&&this.handleChildMotionValue()}getProps(){return this.props}getVariant(i){return this.props.variants?this.props.variants[i]:void 0}getDefaultTransition(){return this.props.transition}getTransformPagePoint(){return this.props.transformPagePoint}getClosestVariantNode(){return this.isVariantNode?this:this.parent?this.parent.getClosestVariantNode():void 0}addVariantChild(i){const s=this.getClosestVariantNode();if(s)return s.variantChildren&&s.variantChildren.add(i),()=>s.variantChildren.delete(i)}addValue(i,s){const r=this.values.get(i);s!==r&&(r&&this.removeValue(i),this.bindToMotionValue(i,s),this.values.set(i,s),this.latestValues[i]=s.get())}removeValue(i){this.values.delete(i);const s=this.valueSubscriptions.get(i);s&&(s(),this.valueSubscriptions.delete(i)),delete this.latestValues[i],this.removeValueFromRenderState(i,this.renderState)}hasValue(i){return this.values.has(i)}getValue(i,s){if(this.props.values&&this.props.values[i])return this.props.values[i];let r=this.values.get(i);return r===void 0&&s!==void 0&&(r=_i(s===null?void 0:s,{owner:this}),this.addValue(i,r)),r}readValue(i,s){let r=this.latestValues[i]!==void 0||!this.current?this.latestValues[i]:this.getBaseTargetFromProps(this.props,i)??this.readValueFromInstance(this.current,i,this.options);return r!=null&&(typeof r=="string"&&(kg(r)||qg(r))?r=parseFloat(r):!E2(r)&&ca.test(s)&&(r=E0(i,s)),this.setBaseTarget(i,he(r)?r.get():r)),he(r)?r.get():r}setBaseTarget(i,s){this.baseTarget[i]=s}getBaseTarget(i){const{initial:s}=this.props;let r;if(typeof s=="string"||typeof s=="object"){const f=Hf(this.props,s,this.presenceContext?.custom);f&&(r=f[i])}if(s&&r!==void 0)return r;const c=this.getBaseTargetFromProps(this.props,i);return c!==void 0&&!he(c)?c:this.initialValues[i]!==void 0&&r===void 0?void 0:this.baseTarget[i]}on(i,s){return this.events[i]||(this.events[i]=new gf),this.events[i].add(s)}notify(i,...s){this.events[i]&&this.events[i].notify(...s)}scheduleRenderMicrotask(){_f.render(this.render)}}class $0 extends cE{constructor(){super(...arguments),this.KeyframeResolver=c2}sortInstanceNodePosition(i,s){return i.compareDocumentPosition(s)&2?1:-1}getBaseTargetFromProps(i,s){return i.style?i.style[s]:void 0}removeValueFromRenderState(i,{vars:s,style:r}){delete s[i],delete r[i]}handleChildMotionValue(){this.childSubscription&&(this.childSubscription(),delete this.childSubscription);const{children:i}=this.props;he(i)&&(this.childSubscription=i.on("change",s=>{this.current&&(this.current.textContent=`${s}`)}))}}function J0(a,{style:i,vars:s},r,c){const f=a.style;let d;for(d in i)f[d]=i[d];c?.applyProjectionStyles(f,r);for(d in s)f.setProperty(d,s[d])}function fE(a){return window.getComputedStyle(a)}class dE extends $0{constructor(){super(...arguments),this.type="html",this.renderInstance=J0}readValueFromInstance(i,s){if(Li.has(s))return this.projection?.isProjecting?kc(s):MT(i,s);{const r=fE(i),c=(bf(s)?r.getPropertyValue(s):r[s])||0;return typeof c=="string"?c.trim():c}}measureInstanceViewportBox(i,{transformPagePoint:s}){return Q0(i,s)}build(i,s,r){Uf(i,s,r.transformTemplate)}scrapeMotionValuesFromProps(i,s,r){return kf(i,s,r)}}const P0=new Set(["baseFrequency","diffuseConstant","kernelMatrix","kernelUnitLength","keySplines","keyTimes","limitingConeAngle","markerHeight","markerWidth","numOctaves","targetX","targetY","surfaceScale","specularConstant","specularExponent","stdDeviation","tableValues","viewBox","gradientTransform","pathLength","startOffset","textLength","lengthAdjust"]);function hE(a,i,s,r){J0(a,i,void 0,r);for(const c in i.attrs)a.setAttribute(P0.has(c)?c:Yf(c),i.attrs[c])}class mE extends $0{constructor(){super(...arguments),this.type="svg",this.isSVGTag=!1,this.measureInstanceViewportBox=Zt}getBaseTargetFromProps(i,s){return i[s]}readValueFromInstance(i,s){if(Li.has(s)){const r=T0(s);return r&&r.default||0}return s=P0.has(s)?s:Yf(s),i.getAttribute(s)}scrapeMotionValuesFromProps(i,s,r){return H0(i,s,r)}build(i,s,r){V0(i,s,this.isSVGTag,r.transformTemplate,r.style)}renderInstance(i,s,r,c){hE(i,s,r,c)}mount(i){this.isSVGTag=B0(i.tagName),super.mount(i)}}const pE=(a,i)=>Lf(a)?new mE(i):new dE(i,{allowProjection:a!==E.Fragment});function Ri(a,i,s){const r=a.getProps();return Hf(r,i,s!==void 0?s:r.custom,a)}const Pc=a=>Array.isArray(a);function yE(a,i,s){a.hasValue(i)?a.getValue(i).set(s):a.addValue(i,_i(s))}function gE(a){return Pc(a)?a[a.length-1]||0:a}function vE(a,i){const s=Ri(a,i);let{transitionEnd:r={},transition:c={},...f}=s||{};f={...f,...r};for(const d in f){const m=gE(f[d]);yE(a,d,m)}}function xE(a){return!!(he(a)&&a.add)}function Fc(a,i){const s=a.getValue("willChange");if(xE(s))return s.add(i);if(!s&&On.WillChange){const r=new On.WillChange("auto");a.addValue("willChange",r),r.add(i)}}function F0(a){return a.props[k0]}const bE=a=>a!==null;function SE(a,{repeat:i,repeatType:s="loop"},r){const c=a.filter(bE),f=i&&s!=="loop"&&i%2===1?0:c.length-1;return c[f]}const TE={type:"spring",stiffness:500,damping:25,restSpeed:10},EE=a=>({type:"spring",stiffness:550,damping:a===0?2*Math.sqrt(550):30,restSpeed:10}),AE={type:"keyframes",duration:.8},CE={type:"keyframes",ease:[.25,.1,.35,1],duration:.3},NE=(a,{keyframes:i})=>i.length>2?AE:Li.has(a)?a.startsWith("scale")?EE(i[1]):TE:CE;function jE({when:a,delay:i,delayChildren:s,staggerChildren:r,staggerDirection:c,repeat:f,repeatType:d,repeatDelay:m,from:p,elapsed:y,...g}){return!!Object.keys(g).length}const qf=(a,i,s,r={},c,f)=>d=>{const m=wf(r,a)||{},p=m.delay||r.delay||0;let{elapsed:y=0}=r;y=y-cn(p);const g={keyframes:Array.isArray(s)?s:[null,s],ease:"easeOut",velocity:i.getVelocity(),...m,delay:-y,onUpdate:S=>{i.set(S),m.onUpdate&&m.onUpdate(S)},onComplete:()=>{d(),m.onComplete&&m.onComplete()},name:a,motionValue:i,element:f?void 0:c};jE(m)||Object.assign(g,NE(a,g)),g.duration&&(g.duration=cn(g.duration)),g.repeatDelay&&(g.repeatDelay=cn(g.repeatDelay)),g.from!==void 0&&(g.keyframes[0]=g.from);let b=!1;if((g.type===!1||g.duration===0&&!g.repeatDelay)&&(Kc(g),g.delay===0&&(b=!0)),(On.instantAnimations||On.skipAnimations)&&(b=!0,Kc(g),g.delay=0),g.allowFlatten=!m.type&&!m.ease,b&&!f&&i.get()!==void 0){const S=SE(g.keyframes,m);if(S!==void 0){Ut.update(()=>{g.onUpdate(S),g.onComplete()});return}}return m.isSync?new Df(g):new WT(g)};function DE({protectedKeys:a,needsAnimating:i},s){const r=a.hasOwnProperty(s)&&i[s]!==!0;return i[s]=!1,r}function W0(a,i,{delay:s=0,transitionOverride:r,type:c}={}){let{transition:f=a.getDefaultTransition(),transitionEnd:d,...m}=i;r&&(f=r);const p=[],y=c&&a.animationState&&a.animationState.getState()[c];for(const g in m){const b=a.getValue(g,a.latestValues[g]??null),S=m[g];if(S===void 0||y&&DE(y,g))continue;const N={delay:s,...wf(f||{},g)},V=b.get();if(V!==void 0&&!b.isAnimating&&!Array.isArray(S)&&S===V&&!N.velocity)continue;let B=!1;if(window.MotionHandoffAnimation){const j=F0(a);if(j){const _=window.MotionHandoffAnimation(j,g,Ut);_!==null&&(N.startTime=_,B=!0)}}Fc(a,g),b.start(qf(g,b,S,a.shouldReduceMotion&&x0.has(g)?{type:!1}:N,a,B));const U=b.animation;U&&p.push(U)}return d&&Promise.all(p).then(()=>{Ut.update(()=>{d&&vE(a,d)})}),p}function I0(a,i,s,r=0,c=1){const f=Array.from(a).sort((y,g)=>y.sortNodePosition(g)).indexOf(i),d=a.size,m=(d-1)*r;return typeof s=="function"?s(f,d):c===1?f*r:m-f*r}function Wc(a,i,s={}){const r=Ri(a,i,s.type==="exit"?a.presenceContext?.custom:void 0);let{transition:c=a.getDefaultTransition()||{}}=r||{};s.transitionOverride&&(c=s.transitionOverride);const f=r?()=>Promise.all(W0(a,r,s)):()=>Promise.resolve(),d=a.variantChildren&&a.variantChildren.size?(p=0)=>{const{delayChildren:y=0,staggerChildren:g,staggerDirection:b}=c;return ME(a,i,p,y,g,b,s)}:()=>Promise.resolve(),{when:m}=c;if(m){const[p,y]=m==="beforeChildren"?[f,d]:[d,f];return p().then(()=>y())}else return Promise.all([f(),d(s.delay)])}function ME(a,i,s=0,r=0,c=0,f=1,d){const m=[];for(const p of a.variantChildren)p.notify("AnimationStart",i),m.push(Wc(p,i,{...d,delay:s+(typeof r=="function"?0:r)+I0(a.variantChildren,p,r,c,f)}).then(()=>p.notify("AnimationComplete",i)));return Promise.all(m)}function wE(a,i,s={}){a.notify("AnimationStart",i);let r;if(Array.isArray(i)){const c=i.map(f=>Wc(a,f,s));r=Promise.all(c)}else if(typeof i=="string")r=Wc(a,i,s);else{const c=typeof i=="function"?Ri(a,i,s.custom):i;r=Promise.all(W0(a,c,s))}return r.then(()=>{a.notify("AnimationComplete",i)})}function tv(a,i){if(!Array.isArray(i))return!1;const s=i.length;if(s!==a.length)return!1;for(let r=0;r<s;r++)if(i[r]!==a[r])return!1;return!0}const RE=Vf.length;function ev(a){if(!a)return;if(!a.isControllingVariants){const s=a.parent?ev(a.parent)||{}:{};return a.props.initial!==void 0&&(s.initial=a.props.initial),s}const i={};for(let s=0;s<RE;s++){const r=Vf[s],c=a.props[r];($l(c)||c===!1)&&(i[r]=c)}return i}const _E=[...zf].reverse(),OE=zf.length;function zE(a){return i=>Promise.all(i.map(({animation:s,options:r})=>wE(a,s,r)))}function VE(a){let i=zE(a),s=zy(),r=!0;const c=p=>(y,g)=>{const b=Ri(a,g,p==="exit"?a.presenceContext?.custom:void 0);if(b){const{transition:S,transitionEnd:N,...V}=b;y={...y,...V,...N}}return y};function f(p){i=p(a)}function d(p){const{props:y}=a,g=ev(a.parent)||{},b=[],S=new Set;let N={},V=1/0;for(let U=0;U<OE;U++){const j=_E[U],_=s[j],O=y[j]!==void 0?y[j]:g[j],$=$l(O),K=j===p?_.isActive:null;K===!1&&(V=U);let tt=O===g[j]&&O!==y[j]&&$;if(tt&&r&&a.manuallyAnimateOnMount&&(tt=!1),_.protectedKeys={...N},!_.isActive&&K===null||!O&&!_.prevProp||qr(O)||typeof O=="boolean")continue;const Q=UE(_.prevProp,O);let P=Q||j===p&&_.isActive&&!tt&&$||U>V&&$,ht=!1;const Tt=Array.isArray(O)?O:[O];let kt=Tt.reduce(c(j),{});K===!1&&(kt={});const{prevResolvedValues:It={}}=_,fe={...It,...kt},me=X=>{P=!0,S.has(X)&&(ht=!0,S.delete(X)),_.needsAnimating[X]=!0;const J=a.getValue(X);J&&(J.liveStyle=!1)};for(const X in fe){const J=kt[X],ut=It[X];if(N.hasOwnProperty(X))continue;let pt=!1;Pc(J)&&Pc(ut)?pt=!tv(J,ut):pt=J!==ut,pt?J!=null?me(X):S.add(X):J!==void 0&&S.has(X)?me(X):_.protectedKeys[X]=!0}_.prevProp=O,_.prevResolvedValues=kt,_.isActive&&(N={...N,...kt}),r&&a.blockInitialAnimation&&(P=!1);const te=tt&&Q;P&&(!te||ht)&&b.push(...Tt.map(X=>{const J={type:j};if(typeof X=="string"&&r&&!te&&a.manuallyAnimateOnMount&&a.parent){const{parent:ut}=a,pt=Ri(ut,X);if(ut.enteringChildren&&pt){const{delayChildren:C}=pt.transition||{};J.delay=I0(ut.enteringChildren,a,C)}}return{animation:X,options:J}}))}if(S.size){const U={};if(typeof y.initial!="boolean"){const j=Ri(a,Array.isArray(y.initial)?y.initial[0]:y.initial);j&&j.transition&&(U.transition=j.transition)}S.forEach(j=>{const _=a.getBaseTarget(j),O=a.getValue(j);O&&(O.liveStyle=!0),U[j]=_??null}),b.push({animation:U})}let B=!!b.length;return r&&(y.initial===!1||y.initial===y.animate)&&!a.manuallyAnimateOnMount&&(B=!1),r=!1,B?i(b):Promise.resolve()}function m(p,y){if(s[p].isActive===y)return Promise.resolve();a.variantChildren?.forEach(b=>b.animationState?.setActive(p,y)),s[p].isActive=y;const g=d(p);for(const b in s)s[b].protectedKeys={};return g}return{animateChanges:d,setActive:m,setAnimateFunction:f,getState:()=>s,reset:()=>{s=zy()}}}function UE(a,i){return typeof i=="string"?i!==a:Array.isArray(i)?!tv(i,a):!1}function za(a=!1){return{isActive:a,protectedKeys:{},needsAnimating:{},prevResolvedValues:{}}}function zy(){return{animate:za(!0),whileInView:za(),whileHover:za(),whileTap:za(),whileDrag:za(),whileFocus:za(),exit:za()}}class ha{constructor(i){this.isMounted=!1,this.node=i}update(){}}class BE extends ha{constructor(i){super(i),i.animationState||(i.animationState=VE(i))}updateAnimationControlsSubscription(){const{animate:i}=this.node.getProps();qr(i)&&(this.unmountControls=i.subscribe(this.node))}mount(){this.updateAnimationControlsSubscription()}update(){const{animate:i}=this.node.getProps(),{animate:s}=this.node.prevProps||{};i!==s&&this.updateAnimationControlsSubscription()}unmount(){this.node.animationState.reset(),this.unmountControls?.()}}let LE=0;class HE extends ha{constructor(){super(...arguments),this.id=LE++}update(){if(!this.node.presenceContext)return;const{isPresent:i,onExitComplete:s}=this.node.presenceContext,{isPresent:r}=this.node.prevPresenceContext||{};if(!this.node.animationState||i===r)return;const c=this.node.animationState.setActive("exit",!i);s&&!i&&c.then(()=>{s(this.id)})}mount(){const{register:i,onExitComplete:s}=this.node.presenceContext||{};s&&s(this.id),i&&(this.unmount=i(this.id))}unmount(){}}const kE={animation:{Feature:BE},exit:{Feature:HE}};function Pl(a,i,s,r={passive:!0}){return a.addEventListener(i,s,r),()=>a.removeEventListener(i,s)}function ns(a){return{point:{x:a.pageX,y:a.pageY}}}const YE=a=>i=>Of(i)&&a(i,ns(i));function Yl(a,i,s,r){return Pl(a,i,YE(s),r)}const nv=1e-4,qE=1-nv,GE=1+nv,av=.01,XE=0-av,KE=0+av;function ge(a){return a.max-a.min}function QE(a,i,s){return Math.abs(a-i)<=s}function Vy(a,i,s,r=.5){a.origin=r,a.originPoint=Ht(i.min,i.max,a.origin),a.scale=ge(s)/ge(i),a.translate=Ht(s.min,s.max,a.origin)-a.originPoint,(a.scale>=qE&&a.scale<=GE||isNaN(a.scale))&&(a.scale=1),(a.translate>=XE&&a.translate<=KE||isNaN(a.translate))&&(a.translate=0)}function ql(a,i,s,r){Vy(a.x,i.x,s.x,r?r.originX:void 0),Vy(a.y,i.y,s.y,r?r.originY:void 0)}function Uy(a,i,s){a.min=s.min+i.min,a.max=a.min+ge(i)}function ZE(a,i,s){Uy(a.x,i.x,s.x),Uy(a.y,i.y,s.y)}function By(a,i,s){a.min=i.min-s.min,a.max=a.min+ge(i)}function Gl(a,i,s){By(a.x,i.x,s.x),By(a.y,i.y,s.y)}function Pe(a){return[a("x"),a("y")]}const iv=({current:a})=>a?a.ownerDocument.defaultView:null,Ly=(a,i)=>Math.abs(a-i);function $E(a,i){const s=Ly(a.x,i.x),r=Ly(a.y,i.y);return Math.sqrt(s**2+r**2)}class lv{constructor(i,s,{transformPagePoint:r,contextWindow:c=window,dragSnapToOrigin:f=!1,distanceThreshold:d=3}={}){if(this.startEvent=null,this.lastMoveEvent=null,this.lastMoveEventInfo=null,this.handlers={},this.contextWindow=window,this.updatePoint=()=>{if(!(this.lastMoveEvent&&this.lastMoveEventInfo))return;const S=Tc(this.lastMoveEventInfo,this.history),N=this.startEvent!==null,V=$E(S.offset,{x:0,y:0})>=this.distanceThreshold;if(!N&&!V)return;const{point:B}=S,{timestamp:U}=ce;this.history.push({...B,timestamp:U});const{onStart:j,onMove:_}=this.handlers;N||(j&&j(this.lastMoveEvent,S),this.startEvent=this.lastMoveEvent),_&&_(this.lastMoveEvent,S)},this.handlePointerMove=(S,N)=>{this.lastMoveEvent=S,this.lastMoveEventInfo=Sc(N,this.transformPagePoint),Ut.update(this.updatePoint,!0)},this.handlePointerUp=(S,N)=>{this.end();const{onEnd:V,onSessionEnd:B,resumeAnimation:U}=this.handlers;if(this.dragSnapToOrigin&&U&&U(),!(this.lastMoveEvent&&this.lastMoveEventInfo))return;const j=Tc(S.type==="pointercancel"?this.lastMoveEventInfo:Sc(N,this.transformPagePoint),this.history);this.startEvent&&V&&V(S,j),B&&B(S,j)},!Of(i))return;this.dragSnapToOrigin=f,this.handlers=s,this.transformPagePoint=r,this.distanceThreshold=d,this.contextWindow=c||window;const m=ns(i),p=Sc(m,this.transformPagePoint),{point:y}=p,{timestamp:g}=ce;this.history=[{...y,timestamp:g}];const{onSessionStart:b}=s;b&&b(i,Tc(p,this.history)),this.removeListeners=Il(Yl(this.contextWindow,"pointermove",this.handlePointerMove),Yl(this.contextWindow,"pointerup",this.handlePointerUp),Yl(this.contextWindow,"pointercancel",this.handlePointerUp))}updateHandlers(i){this.handlers=i}end(){this.removeListeners&&this.removeListeners(),ua(this.updatePoint)}}function Sc(a,i){return i?{point:i(a.point)}:a}function Hy(a,i){return{x:a.x-i.x,y:a.y-i.y}}function Tc({point:a},i){return{point:a,delta:Hy(a,sv(i)),offset:Hy(a,JE(i)),velocity:PE(i,.1)}}function JE(a){return a[0]}function sv(a){return a[a.length-1]}function PE(a,i){if(a.length<2)return{x:0,y:0};let s=a.length-1,r=null;const c=sv(a);for(;s>=0&&(r=a[s],!(c.timestamp-r.timestamp>cn(i)));)s--;if(!r)return{x:0,y:0};const f=Fe(c.timestamp-r.timestamp);if(f===0)return{x:0,y:0};const d={x:(c.x-r.x)/f,y:(c.y-r.y)/f};return d.x===1/0&&(d.x=0),d.y===1/0&&(d.y=0),d}function FE(a,{min:i,max:s},r){return i!==void 0&&a<i?a=r?Ht(i,a,r.min):Math.max(a,i):s!==void 0&&a>s&&(a=r?Ht(s,a,r.max):Math.min(a,s)),a}function ky(a,i,s){return{min:i!==void 0?a.min+i:void 0,max:s!==void 0?a.max+s-(a.max-a.min):void 0}}function WE(a,{top:i,left:s,bottom:r,right:c}){return{x:ky(a.x,s,c),y:ky(a.y,i,r)}}function Yy(a,i){let s=i.min-a.min,r=i.max-a.max;return i.max-i.min<a.max-a.min&&([s,r]=[r,s]),{min:s,max:r}}function IE(a,i){return{x:Yy(a.x,i.x),y:Yy(a.y,i.y)}}function tA(a,i){let s=.5;const r=ge(a),c=ge(i);return c>r?s=Kl(i.min,i.max-r,a.min):r>c&&(s=Kl(a.min,a.max-c,i.min)),_n(0,1,s)}function eA(a,i){const s={};return i.min!==void 0&&(s.min=i.min-a.min),i.max!==void 0&&(s.max=i.max-a.min),s}const Ic=.35;function nA(a=Ic){return a===!1?a=0:a===!0&&(a=Ic),{x:qy(a,"left","right"),y:qy(a,"top","bottom")}}function qy(a,i,s){return{min:Gy(a,i),max:Gy(a,s)}}function Gy(a,i){return typeof a=="number"?a:a[i]||0}const aA=new WeakMap;class iA{constructor(i){this.openDragLock=null,this.isDragging=!1,this.currentDirection=null,this.originPoint={x:0,y:0},this.constraints=!1,this.hasMutatedConstraints=!1,this.elastic=Zt(),this.latestPointerEvent=null,this.latestPanInfo=null,this.visualElement=i}start(i,{snapToCursor:s=!1,distanceThreshold:r}={}){const{presenceContext:c}=this.visualElement;if(c&&c.isPresent===!1)return;const f=b=>{const{dragSnapToOrigin:S}=this.getProps();S?this.pauseAnimation():this.stopAnimation(),s&&this.snapToCursor(ns(b).point)},d=(b,S)=>{const{drag:N,dragPropagation:V,onDragStart:B}=this.getProps();if(N&&!V&&(this.openDragLock&&this.openDragLock(),this.openDragLock=p2(N),!this.openDragLock))return;this.latestPointerEvent=b,this.latestPanInfo=S,this.isDragging=!0,this.currentDirection=null,this.resolveConstraints(),this.visualElement.projection&&(this.visualElement.projection.isAnimationBlocked=!0,this.visualElement.projection.target=void 0),Pe(j=>{let _=this.getAxisMotionValue(j).get()||0;if(fn.test(_)){const{projection:O}=this.visualElement;if(O&&O.layout){const $=O.layout.layoutBox[j];$&&(_=ge($)*(parseFloat(_)/100))}}this.originPoint[j]=_}),B&&Ut.postRender(()=>B(b,S)),Fc(this.visualElement,"transform");const{animationState:U}=this.visualElement;U&&U.setActive("whileDrag",!0)},m=(b,S)=>{this.latestPointerEvent=b,this.latestPanInfo=S;const{dragPropagation:N,dragDirectionLock:V,onDirectionLock:B,onDrag:U}=this.getProps();if(!N&&!this.openDragLock)return;const{offset:j}=S;if(V&&this.currentDirection===null){this.currentDirection=lA(j),this.currentDirection!==null&&B&&B(this.currentDirection);return}this.updateAxis("x",S.point,j),this.updateAxis("y",S.point,j),this.visualElement.render(),U&&U(b,S)},p=(b,S)=>{this.latestPointerEvent=b,this.latestPanInfo=S,this.stop(b,S),this.latestPointerEvent=null,this.latestPanInfo=null},y=()=>Pe(b=>this.getAnimationState(b)==="paused"&&this.getAxisMotionValue(b).animation?.play()),{dragSnapToOrigin:g}=this.getProps();this.panSession=new lv(i,{onSessionStart:f,onStart:d,onMove:m,onSessionEnd:p,resumeAnimation:y},{transformPagePoint:this.visualElement.getTransformPagePoint(),dragSnapToOrigin:g,distanceThreshold:r,contextWindow:iv(this.visualElement)})}stop(i,s){const r=i||this.latestPointerEvent,c=s||this.latestPanInfo,f=this.isDragging;if(this.cancel(),!f||!c||!r)return;const{velocity:d}=c;this.startAnimation(d);const{onDragEnd:m}=this.getProps();m&&Ut.postRender(()=>m(r,c))}cancel(){this.isDragging=!1;const{projection:i,animationState:s}=this.visualElement;i&&(i.isAnimationBlocked=!1),this.panSession&&this.panSession.end(),this.panSession=void 0;const{dragPropagation:r}=this.getProps();!r&&this.openDragLock&&(this.openDragLock(),this.openDragLock=null),s&&s.setActive("whileDrag",!1)}updateAxis(i,s,r){const{drag:c}=this.getProps();if(!r||!Ar(i,c,this.currentDirection))return;const f=this.getAxisMotionValue(i);let d=this.originPoint[i]+r[i];this.constraints&&this.constraints[i]&&(d=FE(d,this.constraints[i],this.elastic[i])),f.set(d)}resolveConstraints(){const{dragConstraints:i,dragElastic:s}=this.getProps(),r=this.visualElement.projection&&!this.visualElement.projection.layout?this.visualElement.projection.measure(!1):this.visualElement.projection?.layout,c=this.constraints;i&&ji(i)?this.constraints||(this.constraints=this.resolveRefConstraints()):i&&r?this.constraints=WE(r.layoutBox,i):this.constraints=!1,this.elastic=nA(s),c!==this.constraints&&r&&this.constraints&&!this.hasMutatedConstraints&&Pe(f=>{this.constraints!==!1&&this.getAxisMotionValue(f)&&(this.constraints[f]=eA(r.layoutBox[f],this.constraints[f]))})}resolveRefConstraints(){const{dragConstraints:i,onMeasureDragConstraints:s}=this.getProps();if(!i||!ji(i))return!1;const r=i.current,{projection:c}=this.visualElement;if(!c||!c.layout)return!1;const f=sE(r,c.root,this.visualElement.getTransformPagePoint());let d=IE(c.layout.layoutBox,f);if(s){const m=s(aE(d));this.hasMutatedConstraints=!!m,m&&(d=G0(m))}return d}startAnimation(i){const{drag:s,dragMomentum:r,dragElastic:c,dragTransition:f,dragSnapToOrigin:d,onDragTransitionEnd:m}=this.getProps(),p=this.constraints||{},y=Pe(g=>{if(!Ar(g,s,this.currentDirection))return;let b=p&&p[g]||{};d&&(b={min:0,max:0});const S=c?200:1e6,N=c?40:1e7,V={type:"inertia",velocity:r?i[g]:0,bounceStiffness:S,bounceDamping:N,timeConstant:750,restDelta:1,restSpeed:10,...f,...b};return this.startAxisValueAnimation(g,V)});return Promise.all(y).then(m)}startAxisValueAnimation(i,s){const r=this.getAxisMotionValue(i);return Fc(this.visualElement,i),r.start(qf(i,r,0,s,this.visualElement,!1))}stopAnimation(){Pe(i=>this.getAxisMotionValue(i).stop())}pauseAnimation(){Pe(i=>this.getAxisMotionValue(i).animation?.pause())}getAnimationState(i){return this.getAxisMotionValue(i).animation?.state}getAxisMotionValue(i){const s=`_drag${i.toUpperCase()}`,r=this.visualElement.getProps(),c=r[s];return c||this.visualElement.getValue(i,(r.initial?r.initial[i]:void 0)||0)}snapToCursor(i){Pe(s=>{const{drag:r}=this.getProps();if(!Ar(s,r,this.currentDirection))return;const{projection:c}=this.visualElement,f=this.getAxisMotionValue(s);if(c&&c.layout){const{min:d,max:m}=c.layout.layoutBox[s];f.set(i[s]-Ht(d,m,.5))}})}scalePositionWithinConstraints(){if(!this.visualElement.current)return;const{drag:i,dragConstraints:s}=this.getProps(),{projection:r}=this.visualElement;if(!ji(s)||!r||!this.constraints)return;this.stopAnimation();const c={x:0,y:0};Pe(d=>{const m=this.getAxisMotionValue(d);if(m&&this.constraints!==!1){const p=m.get();c[d]=tA({min:p,max:p},this.constraints[d])}});const{transformTemplate:f}=this.visualElement.getProps();this.visualElement.current.style.transform=f?f({},""):"none",r.root&&r.root.updateScroll(),r.updateLayout(),this.resolveConstraints(),Pe(d=>{if(!Ar(d,i,null))return;const m=this.getAxisMotionValue(d),{min:p,max:y}=this.constraints[d];m.set(Ht(p,y,c[d]))})}addListeners(){if(!this.visualElement.current)return;aA.set(this.visualElement,this);const i=this.visualElement.current,s=Yl(i,"pointerdown",p=>{const{drag:y,dragListener:g=!0}=this.getProps();y&&g&&this.start(p)}),r=()=>{const{dragConstraints:p}=this.getProps();ji(p)&&p.current&&(this.constraints=this.resolveRefConstraints())},{projection:c}=this.visualElement,f=c.addEventListener("measure",r);c&&!c.layout&&(c.root&&c.root.updateScroll(),c.updateLayout()),Ut.read(r);const d=Pl(window,"resize",()=>this.scalePositionWithinConstraints()),m=c.addEventListener("didUpdate",(({delta:p,hasLayoutChanged:y})=>{this.isDragging&&y&&(Pe(g=>{const b=this.getAxisMotionValue(g);b&&(this.originPoint[g]+=p[g].translate,b.set(b.get()+p[g].translate))}),this.visualElement.render())}));return()=>{d(),s(),f(),m&&m()}}getProps(){const i=this.visualElement.getProps(),{drag:s=!1,dragDirectionLock:r=!1,dragPropagation:c=!1,dragConstraints:f=!1,dragElastic:d=Ic,dragMomentum:m=!0}=i;return{...i,drag:s,dragDirectionLock:r,dragPropagation:c,dragConstraints:f,dragElastic:d,dragMomentum:m}}}function Ar(a,i,s){return(i===!0||i===a)&&(s===null||s===a)}function lA(a,i=10){let s=null;return Math.abs(a.y)>i?s="y":Math.abs(a.x)>i&&(s="x"),s}class sA extends ha{constructor(i){super(i),this.removeGroupControls=We,this.removeListeners=We,this.controls=new iA(i)}mount(){const{dragControls:i}=this.node.getProps();i&&(this.removeGroupControls=i.subscribe(this.controls)),this.removeListeners=this.controls.addListeners()||We}unmount(){this.removeGroupControls(),this.removeListeners()}}const Xy=a=>(i,s)=>{a&&Ut.postRender(()=>a(i,s))};class rA extends ha{constructor(){super(...arguments),this.removePointerDownListener=We}onPointerDown(i){this.session=new lv(i,this.createPanHandlers(),{transformPagePoint:this.node.getTransformPagePoint(),contextWindow:iv(this.node)})}createPanHandlers(){const{onPanSessionStart:i,onPanStart:s,onPan:r,onPanEnd:c}=this.node.getProps();return{onSessionStart:Xy(i),onStart:Xy(s),onMove:r,onEnd:(f,d)=>{delete this.session,c&&Ut.postRender(()=>c(f,d))}}}mount(){this.removePointerDownListener=Yl(this.node.current,"pointerdown",i=>this.onPointerDown(i))}update(){this.session&&this.session.updateHandlers(this.createPanHandlers())}unmount(){this.removePointerDownListener(),this.session&&this.session.end()}}const _r={hasAnimatedSinceResize:!0,hasEverUpdated:!1};function Ky(a,i){return i.max===i.min?0:a/(i.max-i.min)*100}const Vl={correct:(a,i)=>{if(!i.target)return a;if(typeof a=="string")if(it.test(a))a=parseFloat(a);else return a;const s=Ky(a,i.target.x),r=Ky(a,i.target.y);return`${s}% ${r}%`}},oA={correct:(a,{treeScale:i,projectionDelta:s})=>{const r=a,c=ca.parse(a);if(c.length>5)return r;const f=ca.createTransformer(a),d=typeof c[0]!="number"?1:0,m=s.x.scale*i.x,p=s.y.scale*i.y;c[0+d]/=m,c[1+d]/=p;const y=Ht(m,p,.5);return typeof c[2+d]=="number"&&(c[2+d]/=y),typeof c[3+d]=="number"&&(c[3+d]/=y),f(c)}};let Ec=!1;class uA extends E.Component{componentDidMount(){const{visualElement:i,layoutGroup:s,switchLayoutGroup:r,layoutId:c}=this.props,{projection:f}=i;R2(cA),f&&(s.group&&s.group.add(f),r&&r.register&&c&&r.register(f),Ec&&f.root.didUpdate(),f.addEventListener("animationComplete",()=>{this.safeToRemove()}),f.setOptions({...f.options,onExitComplete:()=>this.safeToRemove()})),_r.hasEverUpdated=!0}getSnapshotBeforeUpdate(i){const{layoutDependency:s,visualElement:r,drag:c,isPresent:f}=this.props,{projection:d}=r;return d&&(d.isPresent=f,Ec=!0,c||i.layoutDependency!==s||s===void 0||i.isPresent!==f?d.willUpdate():this.safeToRemove(),i.isPresent!==f&&(f?d.promote():d.relegate()||Ut.postRender(()=>{const m=d.getStack();(!m||!m.members.length)&&this.safeToRemove()}))),null}componentDidUpdate(){const{projection:i}=this.props.visualElement;i&&(i.root.didUpdate(),_f.postRender(()=>{!i.currentAnimation&&i.isLead()&&this.safeToRemove()}))}componentWillUnmount(){const{visualElement:i,layoutGroup:s,switchLayoutGroup:r}=this.props,{projection:c}=i;Ec=!0,c&&(c.scheduleCheckAfterUnmount(),s&&s.group&&s.group.remove(c),r&&r.deregister&&r.deregister(c))}safeToRemove(){const{safeToRemove:i}=this.props;i&&i()}render(){return null}}function rv(a){const[i,s]=A2(),r=E.useContext(Hg);return v.jsx(uA,{...a,layoutGroup:r,switchLayoutGroup:E.useContext(Y0),isPresent:i,safeToRemove:s})}const cA={borderRadius:{...Vl,applyTo:["borderTopLeftRadius","borderTopRightRadius","borderBottomLeftRadius","borderBottomRightRadius"]},borderTopLeftRadius:Vl,borderTopRightRadius:Vl,borderBottomLeftRadius:Vl,borderBottomRightRadius:Vl,boxShadow:oA};function fA(a,i,s){const r=he(a)?a:_i(a);return r.start(qf("",r,i,s)),r.animation}const dA=(a,i)=>a.depth-i.depth;class hA{constructor(){this.children=[],this.isDirty=!1}add(i){hf(this.children,i),this.isDirty=!0}remove(i){mf(this.children,i),this.isDirty=!0}forEach(i){this.isDirty&&this.children.sort(dA),this.isDirty=!1,this.children.forEach(i)}}function mA(a,i){const s=Ce.now(),r=({timestamp:c})=>{const f=c-s;f>=i&&(ua(r),a(f-i))};return Ut.setup(r,!0),()=>ua(r)}const ov=["TopLeft","TopRight","BottomLeft","BottomRight"],pA=ov.length,Qy=a=>typeof a=="string"?parseFloat(a):a,Zy=a=>typeof a=="number"||it.test(a);function yA(a,i,s,r,c,f){c?(a.opacity=Ht(0,s.opacity??1,gA(r)),a.opacityExit=Ht(i.opacity??1,0,vA(r))):f&&(a.opacity=Ht(i.opacity??1,s.opacity??1,r));for(let d=0;d<pA;d++){const m=`border${ov[d]}Radius`;let p=$y(i,m),y=$y(s,m);if(p===void 0&&y===void 0)continue;p||(p=0),y||(y=0),p===0||y===0||Zy(p)===Zy(y)?(a[m]=Math.max(Ht(Qy(p),Qy(y),r),0),(fn.test(y)||fn.test(p))&&(a[m]+="%")):a[m]=y}(i.rotate||s.rotate)&&(a.rotate=Ht(i.rotate||0,s.rotate||0,r))}function $y(a,i){return a[i]!==void 0?a[i]:a.borderRadius}const gA=uv(0,.5,Pg),vA=uv(.5,.95,We);function uv(a,i,s){return r=>r<a?0:r>i?1:s(Kl(a,i,r))}function Jy(a,i){a.min=i.min,a.max=i.max}function Je(a,i){Jy(a.x,i.x),Jy(a.y,i.y)}function Py(a,i){a.translate=i.translate,a.scale=i.scale,a.originPoint=i.originPoint,a.origin=i.origin}function Fy(a,i,s,r,c){return a-=i,a=Lr(a,1/s,r),c!==void 0&&(a=Lr(a,1/c,r)),a}function xA(a,i=0,s=1,r=.5,c,f=a,d=a){if(fn.test(i)&&(i=parseFloat(i),i=Ht(d.min,d.max,i/100)-d.min),typeof i!="number")return;let m=Ht(f.min,f.max,r);a===f&&(m-=i),a.min=Fy(a.min,i,s,m,c),a.max=Fy(a.max,i,s,m,c)}function Wy(a,i,[s,r,c],f,d){xA(a,i[s],i[r],i[c],i.scale,f,d)}const bA=["x","scaleX","originX"],SA=["y","scaleY","originY"];function Iy(a,i,s,r){Wy(a.x,i,bA,s?s.x:void 0,r?r.x:void 0),Wy(a.y,i,SA,s?s.y:void 0,r?r.y:void 0)}function tg(a){return a.translate===0&&a.scale===1}function cv(a){return tg(a.x)&&tg(a.y)}function eg(a,i){return a.min===i.min&&a.max===i.max}function TA(a,i){return eg(a.x,i.x)&&eg(a.y,i.y)}function ng(a,i){return Math.round(a.min)===Math.round(i.min)&&Math.round(a.max)===Math.round(i.max)}function fv(a,i){return ng(a.x,i.x)&&ng(a.y,i.y)}function ag(a){return ge(a.x)/ge(a.y)}function ig(a,i){return a.translate===i.translate&&a.scale===i.scale&&a.originPoint===i.originPoint}class EA{constructor(){this.members=[]}add(i){hf(this.members,i),i.scheduleRender()}remove(i){if(mf(this.members,i),i===this.prevLead&&(this.prevLead=void 0),i===this.lead){const s=this.members[this.members.length-1];s&&this.promote(s)}}relegate(i){const s=this.members.findIndex(c=>i===c);if(s===0)return!1;let r;for(let c=s;c>=0;c--){const f=this.members[c];if(f.isPresent!==!1){r=f;break}}return r?(this.promote(r),!0):!1}promote(i,s){const r=this.lead;if(i!==r&&(this.prevLead=r,this.lead=i,i.show(),r)){r.instance&&r.scheduleRender(),i.scheduleRender(),i.resumeFrom=r,s&&(i.resumeFrom.preserveOpacity=!0),r.snapshot&&(i.snapshot=r.snapshot,i.snapshot.latestValues=r.animationValues||r.latestValues),i.root&&i.root.isUpdating&&(i.isLayoutDirty=!0);const{crossfade:c}=i.options;c===!1&&r.hide()}}exitAnimationComplete(){this.members.forEach(i=>{const{options:s,resumingFrom:r}=i;s.onExitComplete&&s.onExitComplete(),r&&r.options.onExitComplete&&r.options.onExitComplete()})}scheduleRender(){this.members.forEach(i=>{i.instance&&i.scheduleRender(!1)})}removeLeadSnapshot(){this.lead&&this.lead.snapshot&&(this.lead.snapshot=void 0)}}function AA(a,i,s){let r="";const c=a.x.translate/i.x,f=a.y.translate/i.y,d=s?.z||0;if((c||f||d)&&(r=`translate3d(${c}px, ${f}px, ${d}px) `),(i.x!==1||i.y!==1)&&(r+=`scale(${1/i.x}, ${1/i.y}) `),s){const{transformPerspective:y,rotate:g,rotateX:b,rotateY:S,skewX:N,skewY:V}=s;y&&(r=`perspective(${y}px) ${r}`),g&&(r+=`rotate(${g}deg) `),b&&(r+=`rotateX(${b}deg) `),S&&(r+=`rotateY(${S}deg) `),N&&(r+=`skewX(${N}deg) `),V&&(r+=`skewY(${V}deg) `)}const m=a.x.scale*i.x,p=a.y.scale*i.y;return(m!==1||p!==1)&&(r+=`scale(${m}, ${p})`),r||"none"}const Ac=["","X","Y","Z"],CA=1e3;let NA=0;function Cc(a,i,s,r){const{latestValues:c}=i;c[a]&&(s[a]=c[a],i.setStaticValue(a,0),r&&(r[a]=0))}function dv(a){if(a.hasCheckedOptimisedAppear=!0,a.root===a)return;const{visualElement:i}=a.options;if(!i)return;const s=F0(i);if(window.MotionHasOptimisedAnimation(s,"transform")){const{layout:c,layoutId:f}=a.options;window.MotionCancelOptimisedAnimation(s,"transform",Ut,!(c||f))}const{parent:r}=a;r&&!r.hasCheckedOptimisedAppear&&dv(r)}function hv({attachResizeListener:a,defaultParent:i,measureScroll:s,checkIsScrollRoot:r,resetTransform:c}){return class{constructor(d={},m=i?.()){this.id=NA++,this.animationId=0,this.animationCommitId=0,this.children=new Set,this.options={},this.isTreeAnimating=!1,this.isAnimationBlocked=!1,this.isLayoutDirty=!1,this.isProjectionDirty=!1,this.isSharedProjectionDirty=!1,this.isTransformDirty=!1,this.updateManuallyBlocked=!1,this.updateBlockedByResize=!1,this.isUpdating=!1,this.isSVG=!1,this.needsReset=!1,this.shouldResetTransform=!1,this.hasCheckedOptimisedAppear=!1,this.treeScale={x:1,y:1},this.eventHandlers=new Map,this.hasTreeAnimated=!1,this.updateScheduled=!1,this.scheduleUpdate=()=>this.update(),this.projectionUpdateScheduled=!1,this.checkUpdateFailed=()=>{this.isUpdating&&(this.isUpdating=!1,this.clearAllSnapshots())},this.updateProjection=()=>{this.projectionUpdateScheduled=!1,this.nodes.forEach(MA),this.nodes.forEach(OA),this.nodes.forEach(zA),this.nodes.forEach(wA)},this.resolvedRelativeTargetAt=0,this.hasProjected=!1,this.isVisible=!0,this.animationProgress=0,this.sharedNodes=new Map,this.latestValues=d,this.root=m?m.root||m:this,this.path=m?[...m.path,m]:[],this.parent=m,this.depth=m?m.depth+1:0;for(let p=0;p<this.path.length;p++)this.path[p].shouldResetTransform=!0;this.root===this&&(this.nodes=new hA)}addEventListener(d,m){return this.eventHandlers.has(d)||this.eventHandlers.set(d,new gf),this.eventHandlers.get(d).add(m)}notifyListeners(d,...m){const p=this.eventHandlers.get(d);p&&p.notify(...m)}hasListeners(d){return this.eventHandlers.has(d)}mount(d){if(this.instance)return;this.isSVG=D0(d)&&!S2(d),this.instance=d;const{layoutId:m,layout:p,visualElement:y}=this.options;if(y&&!y.current&&y.mount(d),this.root.nodes.add(this),this.parent&&this.parent.children.add(this),this.root.hasTreeAnimated&&(p||m)&&(this.isLayoutDirty=!0),a){let g,b=0;const S=()=>this.root.updateBlockedByResize=!1;Ut.read(()=>{b=window.innerWidth}),a(d,()=>{const N=window.innerWidth;N!==b&&(b=N,this.root.updateBlockedByResize=!0,g&&g(),g=mA(S,250),_r.hasAnimatedSinceResize&&(_r.hasAnimatedSinceResize=!1,this.nodes.forEach(rg)))})}m&&this.root.registerSharedNode(m,this),this.options.animate!==!1&&y&&(m||p)&&this.addEventListener("didUpdate",({delta:g,hasLayoutChanged:b,hasRelativeLayoutChanged:S,layout:N})=>{if(this.isTreeAnimationBlocked()){this.target=void 0,this.relativeTarget=void 0;return}const V=this.options.transition||y.getDefaultTransition()||HA,{onLayoutAnimationStart:B,onLayoutAnimationComplete:U}=y.getProps(),j=!this.targetLayout||!fv(this.targetLayout,N),_=!b&&S;if(this.options.layoutRoot||this.resumeFrom||_||b&&(j||!this.currentAnimation)){this.resumeFrom&&(this.resumingFrom=this.resumeFrom,this.resumingFrom.resumingFrom=void 0);const O={...wf(V,"layout"),onPlay:B,onComplete:U};(y.shouldReduceMotion||this.options.layoutRoot)&&(O.delay=0,O.type=!1),this.startAnimation(O),this.setAnimationOrigin(g,_)}else b||rg(this),this.isLead()&&this.options.onExitComplete&&this.options.onExitComplete();this.targetLayout=N})}unmount(){this.options.layoutId&&this.willUpdate(),this.root.nodes.remove(this);const d=this.getStack();d&&d.remove(this),this.parent&&this.parent.children.delete(this),this.instance=void 0,this.eventHandlers.clear(),ua(this.updateProjection)}blockUpdate(){this.updateManuallyBlocked=!0}unblockUpdate(){this.updateManuallyBlocked=!1}isUpdateBlocked(){return this.updateManuallyBlocked||this.updateBlockedByResize}isTreeAnimationBlocked(){return this.isAnimationBlocked||this.parent&&this.parent.isTreeAnimationBlocked()||!1}startUpdate(){this.isUpdateBlocked()||(this.isUpdating=!0,this.nodes&&this.nodes.forEach(VA),this.animationId++)}getTransformTemplate(){const{visualElement:d}=this.options;return d&&d.getProps().transformTemplate}willUpdate(d=!0){if(this.root.hasTreeAnimated=!0,this.root.isUpdateBlocked()){this.options.onExitComplete&&this.options.onExitComplete();return}if(window.MotionCancelOptimisedAnimation&&!this.hasCheckedOptimisedAppear&&dv(this),!this.root.isUpdating&&this.root.startUpdate(),this.isLayoutDirty)return;this.isLayoutDirty=!0;for(let g=0;g<this.path.length;g++){const b=this.path[g];b.shouldResetTransform=!0,b.updateScroll("snapshot"),b.options.layoutRoot&&b.willUpdate(!1)}const{layoutId:m,layout:p}=this.options;if(m===void 0&&!p)return;const y=this.getTransformTemplate();this.prevTransformTemplateValue=y?y(this.latestValues,""):void 0,this.updateSnapshot(),d&&this.notifyListeners("willUpdate")}update(){if(this.updateScheduled=!1,this.isUpdateBlocked()){this.unblockUpdate(),this.clearAllSnapshots(),this.nodes.forEach(lg);return}if(this.animationId<=this.animationCommitId){this.nodes.forEach(sg);return}this.animationCommitId=this.animationId,this.isUpdating?(this.isUpdating=!1,this.nodes.forEach(_A),this.nodes.forEach(jA),this.nodes.forEach(DA)):this.nodes.forEach(sg),this.clearAllSnapshots();const m=Ce.now();ce.delta=_n(0,1e3/60,m-ce.timestamp),ce.timestamp=m,ce.isProcessing=!0,hc.update.process(ce),hc.preRender.process(ce),hc.render.process(ce),ce.isProcessing=!1}didUpdate(){this.updateScheduled||(this.updateScheduled=!0,_f.read(this.scheduleUpdate))}clearAllSnapshots(){this.nodes.forEach(RA),this.sharedNodes.forEach(UA)}scheduleUpdateProjection(){this.projectionUpdateScheduled||(this.projectionUpdateScheduled=!0,Ut.preRender(this.updateProjection,!1,!0))}scheduleCheckAfterUnmount(){Ut.postRender(()=>{this.isLayoutDirty?this.root.didUpdate():this.root.checkUpdateFailed()})}updateSnapshot(){this.snapshot||!this.instance||(this.snapshot=this.measure(),this.snapshot&&!ge(this.snapshot.measuredBox.x)&&!ge(this.snapshot.measuredBox.y)&&(this.snapshot=void 0))}updateLayout(){if(!this.instance||(this.updateScroll(),!(this.options.alwaysMeasureLayout&&this.isLead())&&!this.isLayoutDirty))return;if(this.resumeFrom&&!this.resumeFrom.instance)for(let p=0;p<this.path.length;p++)this.path[p].updateScroll();const d=this.layout;this.layout=this.measure(!1),this.layoutCorrected=Zt(),this.isLayoutDirty=!1,this.projectionDelta=void 0,this.notifyListeners("measure",this.layout.layoutBox);const{visualElement:m}=this.options;m&&m.notify("LayoutMeasure",this.layout.layoutBox,d?d.layoutBox:void 0)}updateScroll(d="measure"){let m=!!(this.options.layoutScroll&&this.instance);if(this.scroll&&this.scroll.animationId===this.root.animationId&&this.scroll.phase===d&&(m=!1),m&&this.instance){const p=r(this.instance);this.scroll={animationId:this.root.animationId,phase:d,isRoot:p,offset:s(this.instance),wasRoot:this.scroll?this.scroll.isRoot:p}}}resetTransform(){if(!c)return;const d=this.isLayoutDirty||this.shouldResetTransform||this.options.alwaysMeasureLayout,m=this.projectionDelta&&!cv(this.projectionDelta),p=this.getTransformTemplate(),y=p?p(this.latestValues,""):void 0,g=y!==this.prevTransformTemplateValue;d&&this.instance&&(m||Va(this.latestValues)||g)&&(c(this.instance,y),this.shouldResetTransform=!1,this.scheduleRender())}measure(d=!0){const m=this.measurePageBox();let p=this.removeElementScroll(m);return d&&(p=this.removeTransform(p)),kA(p),{animationId:this.root.animationId,measuredBox:m,layoutBox:p,latestValues:{},source:this.id}}measurePageBox(){const{visualElement:d}=this.options;if(!d)return Zt();const m=d.measureViewportBox();if(!(this.scroll?.wasRoot||this.path.some(YA))){const{scroll:y}=this.root;y&&(Di(m.x,y.offset.x),Di(m.y,y.offset.y))}return m}removeElementScroll(d){const m=Zt();if(Je(m,d),this.scroll?.wasRoot)return m;for(let p=0;p<this.path.length;p++){const y=this.path[p],{scroll:g,options:b}=y;y!==this.root&&g&&b.layoutScroll&&(g.wasRoot&&Je(m,d),Di(m.x,g.offset.x),Di(m.y,g.offset.y))}return m}applyTransform(d,m=!1){const p=Zt();Je(p,d);for(let y=0;y<this.path.length;y++){const g=this.path[y];!m&&g.options.layoutScroll&&g.scroll&&g!==g.root&&Mi(p,{x:-g.scroll.offset.x,y:-g.scroll.offset.y}),Va(g.latestValues)&&Mi(p,g.latestValues)}return Va(this.latestValues)&&Mi(p,this.latestValues),p}removeTransform(d){const m=Zt();Je(m,d);for(let p=0;p<this.path.length;p++){const y=this.path[p];if(!y.instance||!Va(y.latestValues))continue;Zc(y.latestValues)&&y.updateSnapshot();const g=Zt(),b=y.measurePageBox();Je(g,b),Iy(m,y.latestValues,y.snapshot?y.snapshot.layoutBox:void 0,g)}return Va(this.latestValues)&&Iy(m,this.latestValues),m}setTargetDelta(d){this.targetDelta=d,this.root.scheduleUpdateProjection(),this.isProjectionDirty=!0}setOptions(d){this.options={...this.options,...d,crossfade:d.crossfade!==void 0?d.crossfade:!0}}clearMeasurements(){this.scroll=void 0,this.layout=void 0,this.snapshot=void 0,this.prevTransformTemplateValue=void 0,this.targetDelta=void 0,this.target=void 0,this.isLayoutDirty=!1}forceRelativeParentToResolveTarget(){this.relativeParent&&this.relativeParent.resolvedRelativeTargetAt!==ce.timestamp&&this.relativeParent.resolveTargetDelta(!0)}resolveTargetDelta(d=!1){const m=this.getLead();this.isProjectionDirty||(this.isProjectionDirty=m.isProjectionDirty),this.isTransformDirty||(this.isTransformDirty=m.isTransformDirty),this.isSharedProjectionDirty||(this.isSharedProjectionDirty=m.isSharedProjectionDirty);const p=!!this.resumingFrom||this!==m;if(!(d||p&&this.isSharedProjectionDirty||this.isProjectionDirty||this.parent?.isProjectionDirty||this.attemptToResolveRelativeTarget||this.root.updateBlockedByResize))return;const{layout:g,layoutId:b}=this.options;if(!(!this.layout||!(g||b))){if(this.resolvedRelativeTargetAt=ce.timestamp,!this.targetDelta&&!this.relativeTarget){const S=this.getClosestProjectingParent();S&&S.layout&&this.animationProgress!==1?(this.relativeParent=S,this.forceRelativeParentToResolveTarget(),this.relativeTarget=Zt(),this.relativeTargetOrigin=Zt(),Gl(this.relativeTargetOrigin,this.layout.layoutBox,S.layout.layoutBox),Je(this.relativeTarget,this.relativeTargetOrigin)):this.relativeParent=this.relativeTarget=void 0}if(!(!this.relativeTarget&&!this.targetDelta)&&(this.target||(this.target=Zt(),this.targetWithTransforms=Zt()),this.relativeTarget&&this.relativeTargetOrigin&&this.relativeParent&&this.relativeParent.target?(this.forceRelativeParentToResolveTarget(),ZE(this.target,this.relativeTarget,this.relativeParent.target)):this.targetDelta?(this.resumingFrom?this.target=this.applyTransform(this.layout.layoutBox):Je(this.target,this.layout.layoutBox),K0(this.target,this.targetDelta)):Je(this.target,this.layout.layoutBox),this.attemptToResolveRelativeTarget)){this.attemptToResolveRelativeTarget=!1;const S=this.getClosestProjectingParent();S&&!!S.resumingFrom==!!this.resumingFrom&&!S.options.layoutScroll&&S.target&&this.animationProgress!==1?(this.relativeParent=S,this.forceRelativeParentToResolveTarget(),this.relativeTarget=Zt(),this.relativeTargetOrigin=Zt(),Gl(this.relativeTargetOrigin,this.target,S.target),Je(this.relativeTarget,this.relativeTargetOrigin)):this.relativeParent=this.relativeTarget=void 0}}}getClosestProjectingParent(){if(!(!this.parent||Zc(this.parent.latestValues)||X0(this.parent.latestValues)))return this.parent.isProjecting()?this.parent:this.parent.getClosestProjectingParent()}isProjecting(){return!!((this.relativeTarget||this.targetDelta||this.options.layoutRoot)&&this.layout)}calcProjection(){const d=this.getLead(),m=!!this.resumingFrom||this!==d;let p=!0;if((this.isProjectionDirty||this.parent?.isProjectionDirty)&&(p=!1),m&&(this.isSharedProjectionDirty||this.isTransformDirty)&&(p=!1),this.resolvedRelativeTargetAt===ce.timestamp&&(p=!1),p)return;const{layout:y,layoutId:g}=this.options;if(this.isTreeAnimating=!!(this.parent&&this.parent.isTreeAnimating||this.currentAnimation||this.pendingAnimation),this.isTreeAnimating||(this.targetDelta=this.relativeTarget=void 0),!this.layout||!(y||g))return;Je(this.layoutCorrected,this.layout.layoutBox);const b=this.treeScale.x,S=this.treeScale.y;lE(this.layoutCorrected,this.treeScale,this.path,m),d.layout&&!d.target&&(this.treeScale.x!==1||this.treeScale.y!==1)&&(d.target=d.layout.layoutBox,d.targetWithTransforms=Zt());const{target:N}=d;if(!N){this.prevProjectionDelta&&(this.createProjectionDeltas(),this.scheduleRender());return}!this.projectionDelta||!this.prevProjectionDelta?this.createProjectionDeltas():(Py(this.prevProjectionDelta.x,this.projectionDelta.x),Py(this.prevProjectionDelta.y,this.projectionDelta.y)),ql(this.projectionDelta,this.layoutCorrected,N,this.latestValues),(this.treeScale.x!==b||this.treeScale.y!==S||!ig(this.projectionDelta.x,this.prevProjectionDelta.x)||!ig(this.projectionDelta.y,this.prevProjectionDelta.y))&&(this.hasProjected=!0,this.scheduleRender(),this.notifyListeners("projectionUpdate",N))}hide(){this.isVisible=!1}show(){this.isVisible=!0}scheduleRender(d=!0){if(this.options.visualElement?.scheduleRender(),d){const m=this.getStack();m&&m.scheduleRender()}this.resumingFrom&&!this.resumingFrom.instance&&(this.resumingFrom=void 0)}createProjectionDeltas(){this.prevProjectionDelta=wi(),this.projectionDelta=wi(),this.projectionDeltaWithTransform=wi()}setAnimationOrigin(d,m=!1){const p=this.snapshot,y=p?p.latestValues:{},g={...this.latestValues},b=wi();(!this.relativeParent||!this.relativeParent.options.layoutRoot)&&(this.relativeTarget=this.relativeTargetOrigin=void 0),this.attemptToResolveRelativeTarget=!m;const S=Zt(),N=p?p.source:void 0,V=this.layout?this.layout.source:void 0,B=N!==V,U=this.getStack(),j=!U||U.members.length<=1,_=!!(B&&!j&&this.options.crossfade===!0&&!this.path.some(LA));this.animationProgress=0;let O;this.mixTargetDelta=$=>{const K=$/1e3;og(b.x,d.x,K),og(b.y,d.y,K),this.setTargetDelta(b),this.relativeTarget&&this.relativeTargetOrigin&&this.layout&&this.relativeParent&&this.relativeParent.layout&&(Gl(S,this.layout.layoutBox,this.relativeParent.layout.layoutBox),BA(this.relativeTarget,this.relativeTargetOrigin,S,K),O&&TA(this.relativeTarget,O)&&(this.isProjectionDirty=!1),O||(O=Zt()),Je(O,this.relativeTarget)),B&&(this.animationValues=g,yA(g,y,this.latestValues,K,_,j)),this.root.scheduleUpdateProjection(),this.scheduleRender(),this.animationProgress=K},this.mixTargetDelta(this.options.layoutRoot?1e3:0)}startAnimation(d){this.notifyListeners("animationStart"),this.currentAnimation?.stop(),this.resumingFrom?.currentAnimation?.stop(),this.pendingAnimation&&(ua(this.pendingAnimation),this.pendingAnimation=void 0),this.pendingAnimation=Ut.update(()=>{_r.hasAnimatedSinceResize=!0,this.motionValue||(this.motionValue=_i(0)),this.currentAnimation=fA(this.motionValue,[0,1e3],{...d,velocity:0,isSync:!0,onUpdate:m=>{this.mixTargetDelta(m),d.onUpdate&&d.onUpdate(m)},onStop:()=>{},onComplete:()=>{d.onComplete&&d.onComplete(),this.completeAnimation()}}),this.resumingFrom&&(this.resumingFrom.currentAnimation=this.currentAnimation),this.pendingAnimation=void 0})}completeAnimation(){this.resumingFrom&&(this.resumingFrom.currentAnimation=void 0,this.resumingFrom.preserveOpacity=void 0);const d=this.getStack();d&&d.exitAnimationComplete(),this.resumingFrom=this.currentAnimation=this.animationValues=void 0,this.notifyListeners("animationComplete")}finishAnimation(){this.currentAnimation&&(this.mixTargetDelta&&this.mixTargetDelta(CA),this.currentAnimation.stop()),this.completeAnimation()}applyTransformsToTarget(){const d=this.getLead();let{targetWithTransforms:m,target:p,layout:y,latestValues:g}=d;if(!(!m||!p||!y)){if(this!==d&&this.layout&&y&&mv(this.options.animationType,this.layout.layoutBox,y.layoutBox)){p=this.target||Zt();const b=ge(this.layout.layoutBox.x);p.x.min=d.target.x.min,p.x.max=p.x.min+b;const S=ge(this.layout.layoutBox.y);p.y.min=d.target.y.min,p.y.max=p.y.min+S}Je(m,p),Mi(m,g),ql(this.projectionDeltaWithTransform,this.layoutCorrected,m,g)}}registerSharedNode(d,m){this.sharedNodes.has(d)||this.sharedNodes.set(d,new EA),this.sharedNodes.get(d).add(m);const y=m.options.initialPromotionConfig;m.promote({transition:y?y.transition:void 0,preserveFollowOpacity:y&&y.shouldPreserveFollowOpacity?y.shouldPreserveFollowOpacity(m):void 0})}isLead(){const d=this.getStack();return d?d.lead===this:!0}getLead(){const{layoutId:d}=this.options;return d?this.getStack()?.lead||this:this}getPrevLead(){const{layoutId:d}=this.options;return d?this.getStack()?.prevLead:void 0}getStack(){const{layoutId:d}=this.options;if(d)return this.root.sharedNodes.get(d)}promote({needsReset:d,transition:m,preserveFollowOpacity:p}={}){const y=this.getStack();y&&y.promote(this,p),d&&(this.projectionDelta=void 0,this.needsReset=!0),m&&this.setOptions({transition:m})}relegate(){const d=this.getStack();return d?d.relegate(this):!1}resetSkewAndRotation(){const{visualElement:d}=this.options;if(!d)return;let m=!1;const{latestValues:p}=d;if((p.z||p.rotate||p.rotateX||p.rotateY||p.rotateZ||p.skewX||p.skewY)&&(m=!0),!m)return;const y={};p.z&&Cc("z",d,y,this.animationValues);for(let g=0;g<Ac.length;g++)Cc(`rotate${Ac[g]}`,d,y,this.animationValues),Cc(`skew${Ac[g]}`,d,y,this.animationValues);d.render();for(const g in y)d.setStaticValue(g,y[g]),this.animationValues&&(this.animationValues[g]=y[g]);d.scheduleRender()}applyProjectionStyles(d,m){if(!this.instance||this.isSVG)return;if(!this.isVisible){d.visibility="hidden";return}const p=this.getTransformTemplate();if(this.needsReset){this.needsReset=!1,d.visibility="",d.opacity="",d.pointerEvents=Rr(m?.pointerEvents)||"",d.transform=p?p(this.latestValues,""):"none";return}const y=this.getLead();if(!this.projectionDelta||!this.layout||!y.target){this.options.layoutId&&(d.opacity=this.latestValues.opacity!==void 0?this.latestValues.opacity:1,d.pointerEvents=Rr(m?.pointerEvents)||""),this.hasProjected&&!Va(this.latestValues)&&(d.transform=p?p({},""):"none",this.hasProjected=!1);return}d.visibility="";const g=y.animationValues||y.latestValues;this.applyTransformsToTarget();let b=AA(this.projectionDeltaWithTransform,this.treeScale,g);p&&(b=p(g,b)),d.transform=b;const{x:S,y:N}=this.projectionDelta;d.transformOrigin=`${S.origin*100}% ${N.origin*100}% 0`,y.animationValues?d.opacity=y===this?g.opacity??this.latestValues.opacity??1:this.preserveOpacity?this.latestValues.opacity:g.opacityExit:d.opacity=y===this?g.opacity!==void 0?g.opacity:"":g.opacityExit!==void 0?g.opacityExit:0;for(const V in Jl){if(g[V]===void 0)continue;const{correct:B,applyTo:U,isCSSVariable:j}=Jl[V],_=b==="none"?g[V]:B(g[V],y);if(U){const O=U.length;for(let $=0;$<O;$++)d[U[$]]=_}else j?this.options.visualElement.renderState.vars[V]=_:d[V]=_}this.options.layoutId&&(d.pointerEvents=y===this?Rr(m?.pointerEvents)||"":"none")}clearSnapshot(){this.resumeFrom=this.snapshot=void 0}resetTree(){this.root.nodes.forEach(d=>d.currentAnimation?.stop()),this.root.nodes.forEach(lg),this.root.sharedNodes.clear()}}}function jA(a){a.updateLayout()}function DA(a){const i=a.resumeFrom?.snapshot||a.snapshot;if(a.isLead()&&a.layout&&i&&a.hasListeners("didUpdate")){const{layoutBox:s,measuredBox:r}=a.layout,{animationType:c}=a.options,f=i.source!==a.layout.source;c==="size"?Pe(g=>{const b=f?i.measuredBox[g]:i.layoutBox[g],S=ge(b);b.min=s[g].min,b.max=b.min+S}):mv(c,i.layoutBox,s)&&Pe(g=>{const b=f?i.measuredBox[g]:i.layoutBox[g],S=ge(s[g]);b.max=b.min+S,a.relativeTarget&&!a.currentAnimation&&(a.isProjectionDirty=!0,a.relativeTarget[g].max=a.relativeTarget[g].min+S)});const d=wi();ql(d,s,i.layoutBox);const m=wi();f?ql(m,a.applyTransform(r,!0),i.measuredBox):ql(m,s,i.layoutBox);const p=!cv(d);let y=!1;if(!a.resumeFrom){const g=a.getClosestProjectingParent();if(g&&!g.resumeFrom){const{snapshot:b,layout:S}=g;if(b&&S){const N=Zt();Gl(N,i.layoutBox,b.layoutBox);const V=Zt();Gl(V,s,S.layoutBox),fv(N,V)||(y=!0),g.options.layoutRoot&&(a.relativeTarget=V,a.relativeTargetOrigin=N,a.relativeParent=g)}}}a.notifyListeners("didUpdate",{layout:s,snapshot:i,delta:m,layoutDelta:d,hasLayoutChanged:p,hasRelativeLayoutChanged:y})}else if(a.isLead()){const{onExitComplete:s}=a.options;s&&s()}a.options.transition=void 0}function MA(a){a.parent&&(a.isProjecting()||(a.isProjectionDirty=a.parent.isProjectionDirty),a.isSharedProjectionDirty||(a.isSharedProjectionDirty=!!(a.isProjectionDirty||a.parent.isProjectionDirty||a.parent.isSharedProjectionDirty)),a.isTransformDirty||(a.isTransformDirty=a.parent.isTransformDirty))}function wA(a){a.isProjectionDirty=a.isSharedProjectionDirty=a.isTransformDirty=!1}function RA(a){a.clearSnapshot()}function lg(a){a.clearMeasurements()}function sg(a){a.isLayoutDirty=!1}function _A(a){const{visualElement:i}=a.options;i&&i.getProps().onBeforeLayoutMeasure&&i.notify("BeforeLayoutMeasure"),a.resetTransform()}function rg(a){a.finishAnimation(),a.targetDelta=a.relativeTarget=a.target=void 0,a.isProjectionDirty=!0}function OA(a){a.resolveTargetDelta()}function zA(a){a.calcProjection()}function VA(a){a.resetSkewAndRotation()}function UA(a){a.removeLeadSnapshot()}function og(a,i,s){a.translate=Ht(i.translate,0,s),a.scale=Ht(i.scale,1,s),a.origin=i.origin,a.originPoint=i.originPoint}function ug(a,i,s,r){a.min=Ht(i.min,s.min,r),a.max=Ht(i.max,s.max,r)}function BA(a,i,s,r){ug(a.x,i.x,s.x,r),ug(a.y,i.y,s.y,r)}function LA(a){return a.animationValues&&a.animationValues.opacityExit!==void 0}const HA={duration:.45,ease:[.4,0,.1,1]},cg=a=>typeof navigator<"u"&&navigator.userAgent&&navigator.userAgent.toLowerCase().includes(a),fg=cg("applewebkit/")&&!cg("chrome/")?Math.round:We;function dg(a){a.min=fg(a.min),a.max=fg(a.max)}function kA(a){dg(a.x),dg(a.y)}function mv(a,i,s){return a==="position"||a==="preserve-aspect"&&!QE(ag(i),ag(s),.2)}function YA(a){return a!==a.root&&a.scroll?.wasRoot}const qA=hv({attachResizeListener:(a,i)=>Pl(a,"resize",i),measureScroll:()=>({x:document.documentElement.scrollLeft||document.body.scrollLeft,y:document.documentElement.scrollTop||document.body.scrollTop}),checkIsScrollRoot:()=>!0}),Nc={current:void 0},pv=hv({measureScroll:a=>({x:a.scrollLeft,y:a.scrollTop}),defaultParent:()=>{if(!Nc.current){const a=new qA({});a.mount(window),a.setOptions({layoutScroll:!0}),Nc.current=a}return Nc.current},resetTransform:(a,i)=>{a.style.transform=i!==void 0?i:"none"},checkIsScrollRoot:a=>window.getComputedStyle(a).position==="fixed"}),GA={pan:{Feature:rA},drag:{Feature:sA,ProjectionNode:pv,MeasureLayout:rv}};function hg(a,i,s){const{props:r}=a;a.animationState&&r.whileHover&&a.animationState.setActive("whileHover",s==="Start");const c="onHover"+s,f=r[c];f&&Ut.postRender(()=>f(i,ns(i)))}class XA extends ha{mount(){const{current:i}=this.node;i&&(this.unmount=y2(i,(s,r)=>(hg(this.node,r,"Start"),c=>hg(this.node,c,"End"))))}unmount(){}}class KA extends ha{constructor(){super(...arguments),this.isActive=!1}onFocus(){let i=!1;try{i=this.node.current.matches(":focus-visible")}catch{i=!0}!i||!this.node.animationState||(this.node.animationState.setActive("whileFocus",!0),this.isActive=!0)}onBlur(){!this.isActive||!this.node.animationState||(this.node.animationState.setActive("whileFocus",!1),this.isActive=!1)}mount(){this.unmount=Il(Pl(this.node.current,"focus",()=>this.onFocus()),Pl(this.node.current,"blur",()=>this.onBlur()))}unmount(){}}function mg(a,i,s){const{props:r}=a;if(a.current instanceof HTMLButtonElement&&a.current.disabled)return;a.animationState&&r.whileTap&&a.animationState.setActive("whileTap",s==="Start");const c="onTap"+(s==="End"?"":s),f=r[c];f&&Ut.postRender(()=>f(i,ns(i)))}class QA extends ha{mount(){const{current:i}=this.node;i&&(this.unmount=b2(i,(s,r)=>(mg(this.node,r,"Start"),(c,{success:f})=>mg(this.node,c,f?"End":"Cancel")),{useGlobalTarget:this.node.props.globalTapTarget}))}unmount(){}}const tf=new WeakMap,jc=new WeakMap,ZA=a=>{const i=tf.get(a.target);i&&i(a)},$A=a=>{a.forEach(ZA)};function JA({root:a,...i}){const s=a||document;jc.has(s)||jc.set(s,{});const r=jc.get(s),c=JSON.stringify(i);return r[c]||(r[c]=new IntersectionObserver($A,{root:a,...i})),r[c]}function PA(a,i,s){const r=JA(i);return tf.set(a,s),r.observe(a),()=>{tf.delete(a),r.unobserve(a)}}const FA={some:0,all:1};class WA extends ha{constructor(){super(...arguments),this.hasEnteredView=!1,this.isInView=!1}startObserver(){this.unmount();const{viewport:i={}}=this.node.getProps(),{root:s,margin:r,amount:c="some",once:f}=i,d={root:s?s.current:void 0,rootMargin:r,threshold:typeof c=="number"?c:FA[c]},m=p=>{const{isIntersecting:y}=p;if(this.isInView===y||(this.isInView=y,f&&!y&&this.hasEnteredView))return;y&&(this.hasEnteredView=!0),this.node.animationState&&this.node.animationState.setActive("whileInView",y);const{onViewportEnter:g,onViewportLeave:b}=this.node.getProps(),S=y?g:b;S&&S(p)};return PA(this.node.current,d,m)}mount(){this.startObserver()}update(){if(typeof IntersectionObserver>"u")return;const{props:i,prevProps:s}=this.node;["amount","margin","root"].some(IA(i,s))&&this.startObserver()}unmount(){}}function IA({viewport:a={}},{viewport:i={}}={}){return s=>a[s]!==i[s]}const tC={inView:{Feature:WA},tap:{Feature:QA},focus:{Feature:KA},hover:{Feature:XA}},eC={layout:{ProjectionNode:pv,MeasureLayout:rv}},nC={...kE,...tC,...GA,...eC},aC=nE(nC,pE);function Dc({label:a,onClick:i,description:s}){return v.jsxs("button",{type:"button",onClick:i,className:"group block w-full rounded-2xl border bg-white p-8 shadow-sm transition-all hover:shadow-md focus:outline-none focus-visible:ring-2 focus-visible:ring-pink-300",children:[v.jsxs("div",{className:"flex items-center justify-between",children:[v.jsx("p",{className:"text-2xl font-semibold tracking-wide text-gray-800",children:a}),v.jsx("span",{className:"text-sm text-gray-400 transition-transform group-hover:translate-x-0.5",children:"▶"})]}),s?v.jsx("p",{className:"mt-2 text-sm text-gray-500",children:s}):null]})}function iC({text:a}){return v.jsx("h1",{className:"flex gap-1 text-4xl font-extrabold tracking-tight text-gray-900",children:a.split("").map((i,s)=>v.jsx(aC.span,{initial:{opacity:0,y:10},animate:{opacity:1,y:0},transition:{delay:s*.05,duration:.4},children:i},s))})}function lC(){const a=da();return v.jsx("main",{className:"min-h-screen bg-gray-50",children:v.jsxs("div",{className:"mx-auto max-w-6xl px-4 py-8",children:[v.jsxs("header",{className:"mb-6",children:[v.jsx("button",{type:"button",onClick:()=>a("/"),className:"text-left hover:opacity-80",children:v.jsx(iC,{text:"Re:Beauty"})}),v.jsx("p",{className:"mt-2 text-lg text-gray-500",children:"ホーム"})]}),v.jsxs("div",{className:"flex flex-col gap-4",children:[v.jsx(Dc,{label:"顧客登録",description:"新しい顧客を追加します",onClick:()=>a("/customers/new")}),v.jsx(Dc,{label:"顧客検索",description:"名前・電話・メモから検索",onClick:()=>a("/customers/search")}),v.jsx(Dc,{label:"ダッシュボード",description:"KPI / フォロー進捗 / カテゴリ別売上など",onClick:()=>a("/dashboard")})]})]})})}function sC(){const[a,i]=E.useState(""),[s,r]=E.useState(""),[c,f]=E.useState(""),[d,m]=E.useState(!1),p=da(),y=async g=>{g.preventDefault(),f(""),m(!0);const b={email:a.trim(),password:s.trim()};try{const S=await fetch("https://mitsukidev.pythonanywhere.com/api/auth/login",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(b)}),N=await S.json().catch(()=>({}));if(!S.ok)throw new Error(N?.detail||"ログインに失敗しました");localStorage.setItem("access_token",N.access_token),localStorage.setItem("rb_token",N.access_token),localStorage.setItem("rb_user",JSON.stringify(N.user));const V=N?.user?.name||N?.user?.email||a.trim();localStorage.setItem("rb_staff_name",V),p("/home")}catch(S){f(S.message)}finally{m(!1)}};return v.jsxs("div",{className:"flex min-h-screen flex-col items-center justify-center bg-white",children:[v.jsx("h1",{className:"mb-10 text-3xl font-bold text-gray-800 tracking-wide",children:"Re:Beauty"}),v.jsxs("form",{onSubmit:y,className:"flex w-full max-w-xs flex-col items-center space-y-4",children:[c&&v.jsx("p",{className:"text-red-500 text-sm",children:c}),v.jsx("input",{type:"email",placeholder:"メールアドレス",value:a,onChange:g=>i(g.target.value),className:"w-full rounded-md border border-gray-300 px-4 py-2 text-center text-gray-700 placeholder-gray-400 focus:border-pink-400 focus:ring-2 focus:ring-pink-200 focus:outline-none"}),v.jsx("input",{type:"password",placeholder:"パスワード",value:s,onChange:g=>r(g.target.value),className:"w-full rounded-md border border-gray-300 px-4 py-2 text-center text-gray-700 placeholder-gray-400 focus:border-pink-400 focus:ring-2 focus:ring-pink-200 focus:outline-none"}),v.jsx("button",{type:"submit",disabled:d,className:"mt-6 w-full rounded-md bg-pink-500 py-2 text-white hover:bg-pink-600 transition-colors disabled:opacity-60",children:d?"ログイン中...":"ログイン"})]})]})}function Xr({sidebar:a,children:i}){const s=localStorage.getItem("rb_staff_name")||"—";return v.jsxs("div",{className:"min-h-screen bg-gray-50",children:[v.jsx("header",{className:"border-b bg-white",children:v.jsxs("div",{className:"mx-auto flex max-w-6xl items-center justify-between px-4 py-3",children:[v.jsx(cf,{to:"/Home",className:"text-xl font-bold tracking-tight hover:opacity-80","aria-label":"ホームへ戻る",children:"Re:Beauty"}),v.jsxs("div",{className:"text-sm text-gray-600",children:["ログイン中：",s]})]})}),v.jsxs("main",{className:"mx-auto flex max-w-6xl gap-4 px-4 py-6",children:[a&&v.jsx("aside",{className:"w-56 shrink-0",children:v.jsx("div",{className:"space-y-2",children:a})}),v.jsx("section",{className:"flex-1 space-y-4",children:i})]})]})}const rC=[{label:"ダッシュボード",to:"/dashboard"},{label:"ホーム",to:"/home"},{label:"顧客登録",to:"/customers/new"},{label:"顧客検索",to:"/customers/search"}];function oC(){const a=da(),i=()=>{window.confirm("本当にログアウトしますか？")&&(localStorage.removeItem("access_token"),localStorage.removeItem("rb_token"),localStorage.removeItem("rb_staff_name"),localStorage.removeItem("rb_user"),a("/login",{replace:!0}))};return v.jsxs("nav",{className:"space-y-1",children:[rC.map(s=>v.jsx(Bg,{to:s.to,className:({isActive:r})=>`flex w-full items-center rounded-lg px-3 py-2 text-left text-sm transition ${r?"bg-pink-50 font-semibold text-pink-600":"text-gray-700 hover:bg-gray-100"}`,children:s.label},s.label)),v.jsx("button",{type:"button",onClick:i,className:"mt-2 flex w-full items-center rounded-lg px-3 py-2 text-left text-sm font-semibold text-pink-600 hover:bg-pink-50",children:"ログアウト"})]})}const ye="https://mitsukidev.pythonanywhere.com/api";function uC({children:a}){return v.jsx("h2",{className:"text-base font-semibold text-gray-800 tracking-tight",children:a})}function cC({onClick:a}){return v.jsx("button",{type:"button",onClick:a,className:"mt-3 inline-flex items-center gap-1 rounded-md border border-gray-200 bg-gray-50 px-2 py-1 text-xs text-gray-600 hover:bg-pink-50 active:translate-y-[1px]",children:"もっとみる"})}function fC({segment:a,setSegment:i}){const s=(r,c)=>v.jsx("button",{type:"button",onClick:()=>i(r),className:`rounded-xl px-3 py-1.5 text-xs font-medium border ${a===r?"bg-gray-900 text-white border-gray-900":"bg-white hover:bg-gray-50 border-gray-200 text-gray-700"}`,children:c});return v.jsxs("div",{className:"flex gap-2",children:[s("skincare","スキンケア"),s("makeup","メイク")]})}function dC({limit:a=5,showSeeMore:i=!0}){const s=da(),[r,c]=E.useState("skincare"),[f,d]=E.useState([]),[m,p]=E.useState(!1),[y,g]=E.useState("");E.useEffect(()=>{const N=new AbortController;async function V(){p(!0),g("");try{const B=localStorage.getItem("access_token")||localStorage.getItem("rb_token"),U=new URLSearchParams({segment:r}),j=await fetch(`${ye}/dashboard/inactive-customers?${U.toString()}`,{headers:B?{Authorization:`Bearer ${B}`}:{},signal:N.signal});if(!j.ok){const O=await j.text().catch(()=>"");throw new Error(`取得に失敗しました (${j.status}) ${O}`)}const _=await j.json();d(Array.isArray(_)?_:[])}catch(B){B.name!=="AbortError"&&(console.error(B),g("フォロー対象の取得に失敗しました"),d([]))}finally{p(!1)}}return V(),()=>N.abort()},[r]);const b=E.useMemo(()=>[...f].sort((N,V)=>(V.days_since??0)-(N.days_since??0)),[f]),S=r==="skincare"?"90日":"120日";return v.jsxs("div",{className:"w-full rounded-2xl border bg-white p-4 shadow-sm",children:[v.jsxs("div",{className:"flex items-start justify-between gap-3",children:[v.jsxs("div",{children:[v.jsx(uC,{children:"フォローが必要なお客様（来店なし）"}),v.jsxs("p",{className:"mt-1 text-xs text-gray-500",children:["最新の来店記録から",S,"以上来店がないお客様を表示しています（読み取り専用）。"]})]}),v.jsx(fC,{segment:r,setSegment:c})]}),y?v.jsx("div",{className:"mt-3 rounded-xl border border-red-200 bg-red-50 p-3 text-xs text-red-700",children:y}):null,v.jsx("div",{className:"mt-3",children:m?v.jsx("div",{className:"py-4 text-xs text-gray-500",children:"読み込み中…"}):b.length===0?v.jsx("div",{className:"py-4 text-xs text-gray-500",children:"該当するお客様はいません 🎉"}):v.jsx("ul",{className:"space-y-3",children:b.slice(0,a).map(N=>v.jsx("li",{className:"cursor-pointer rounded-xl border border-gray-100 bg-gray-50 px-3 py-2 hover:bg-gray-100",onClick:()=>s(`/customers/${N.customer_id}`),title:"クリックで顧客詳細へ",children:v.jsxs("div",{className:"flex items-center justify-between gap-3",children:[v.jsxs("div",{className:"min-w-0",children:[v.jsxs("p",{className:"text-sm font-semibold text-gray-800 truncate",children:[N.name,v.jsxs("span",{className:"ml-2 text-[10px] text-gray-400",children:["（ID:",N.customer_id,"）"]})]}),v.jsxs("p",{className:"mt-1 text-xs text-gray-700",children:["最終来店：",N.last_visit_date," ／"," ",v.jsxs("span",{className:"font-semibold text-red-600",children:[N.days_since,"日"]}),"来店なし"]}),v.jsxs("div",{className:"mt-1 flex flex-wrap gap-1",children:[v.jsx("span",{className:"rounded-full bg-white px-2 py-0.5 text-[10px] text-gray-600",children:r}),v.jsx("span",{className:"rounded-full bg-white px-2 py-0.5 text-[10px] text-gray-600",children:"inactive-customers"})]}),v.jsx("div",{className:"mt-1 text-[10px] text-gray-500 truncate",children:N.email})]}),v.jsx("div",{className:"shrink-0 text-xs text-gray-500",children:"詳細 →"})]})},N.customer_id))})}),i?v.jsx(cC,{onClick:()=>s("/follow")}):null]})}function hC(){const[a,i]=E.useState({staffCode:"",name:"",email:"",password:""}),[s,r]=E.useState([]),[c,f]=E.useState(!1),[d,m]=E.useState(""),p=()=>{const S=localStorage.getItem("access_token")||localStorage.getItem("rb_token"),N={"Content-Type":"application/json"};return S&&(N.Authorization=`Bearer ${S}`),N},y=S=>{const{name:N,value:V}=S.target;i(B=>({...B,[N]:V}))},g=async()=>{try{const S=await fetch(`${ye}/staffs/`,{method:"GET",headers:p()});if(!S.ok){const V=await S.text().catch(()=>"");console.warn("スタッフ一覧の取得に失敗しました",S.status,V);return}const N=await S.json();r(Array.isArray(N)?N:[])}catch(S){console.error("スタッフ一覧取得エラー:",S)}};E.useEffect(()=>{g()},[]);const b=async S=>{if(S.preventDefault(),m(""),!a.staffCode.trim()||!a.email.trim()||!a.password.trim()){m("スタッフID・メールアドレス・パスワードは必須です");return}f(!0);try{const N=await fetch(`${ye}/staffs/`,{method:"POST",headers:p(),body:JSON.stringify({staff_code:a.staffCode,name:a.name,email:a.email,password:a.password})});if(!N.ok){const V=await N.text().catch(()=>"");m(`登録に失敗しました (${N.status})`),console.error("スタッフ登録失敗:",N.status,V);return}m("スタッフを登録しました"),i({staffCode:"",name:"",email:"",password:""}),g()}catch(N){console.error("スタッフ登録エラー:",N),m("エラーが発生しました")}finally{f(!1)}};return v.jsxs("section",{className:"rounded-2xl border bg-white p-6 shadow-sm",children:[v.jsx("h2",{className:"text-lg font-semibold text-gray-800",children:"スタッフアカウント登録"}),v.jsx("p",{className:"mt-1 text-xs text-gray-500",children:"サロンで利用するスタッフのIDとメールアドレスを管理します。"}),v.jsxs("form",{onSubmit:b,className:"mt-4 space-y-3",children:[v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm text-gray-700 mb-1",children:"スタッフID"}),v.jsx("input",{type:"text",name:"staffCode",value:a.staffCode,onChange:y,placeholder:"例）S-0001",className:"w-full rounded-md border px-3 py-2 text-sm"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm text-gray-700 mb-1",children:"スタッフ名（任意）"}),v.jsx("input",{type:"text",name:"name",value:a.name,onChange:y,placeholder:"例）山田 花子",className:"w-full rounded-md border px-3 py-2 text-sm"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm text-gray-700 mb-1",children:"メールアドレス"}),v.jsx("input",{type:"email",name:"email",value:a.email,onChange:y,placeholder:"example@salon.co.jp",className:"w-full rounded-md border px-3 py-2 text-sm"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm text-gray-700 mb-1",children:"パスワード"}),v.jsx("input",{type:"password",name:"password",value:a.password,onChange:y,placeholder:"ログイン用パスワード",className:"w-full rounded-md border px-3 py-2 text-sm"}),v.jsx("p",{className:"mt-1 text-[11px] text-gray-400",children:"※ 登録したメール＋このパスワードでログインできます"})]}),v.jsxs("div",{className:"pt-2 flex items-center gap-3",children:[v.jsx("button",{type:"submit",disabled:c,className:"rounded-md bg-pink-500 px-4 py-2 text-sm font-semibold text-white hover:bg-pink-600 disabled:opacity-60",children:c?"登録中...":"登録する"}),d&&v.jsx("p",{className:"text-xs text-gray-600","aria-live":"polite",children:d})]})]}),v.jsxs("div",{className:"mt-6",children:[v.jsx("h3",{className:"text-sm font-semibold text-gray-700 mb-2",children:"登録済みスタッフ"}),s.length===0?v.jsx("p",{className:"text-xs text-gray-500",children:"まだスタッフが登録されていません。"}):v.jsx("ul",{className:"space-y-1 max-h-40 overflow-auto text-xs",children:s.map(S=>v.jsx("li",{className:"flex justify-between gap-2 rounded-md border px-2 py-1 bg-gray-50",children:v.jsxs("div",{className:"flex flex-col",children:[v.jsxs("span",{className:"font-medium",children:[S.name||"（名前未設定）",S.staff_code&&v.jsxs("span",{className:"text-gray-400",children:[" / ",S.staff_code]})]}),v.jsx("span",{className:"text-gray-500",children:S.email})]})},S.id??S.staff_code))})]})]})}const Ll="https://mitsukidev.pythonanywhere.com/api";console.log("VITE_API_BASE_URL =","https://mitsukidev.pythonanywhere.com/api");console.log("API_BASE_URL =",Ll);const mC=[{value:"birthday",label:"誕生日"},{value:"event",label:"イベント"},{value:"purchase_follow",label:"購入フォロー"}];function pC(){const[a,i]=E.useState("birthday"),[s,r]=E.useState("skincare"),[c,f]=E.useState([]),[d,m]=E.useState(""),[p,y]=E.useState(""),[g,b]=E.useState(!1),[S,N]=E.useState("");E.useEffect(()=>{const j=new AbortController;async function _(){b(!0),N("");try{const O=localStorage.getItem("access_token")||localStorage.getItem("rb_token");let $="";if(a==="purchase_follow"){const Q=new URLSearchParams({segment:s});$=`${Ll}/dashboard/inactive-customers?${Q.toString()}`}else{const Q=new URLSearchParams({mail_type:a});$=`${Ll}/follow-mail/targets?${Q.toString()}`}const K=await fetch($,{headers:O?{Authorization:`Bearer ${O}`}:{},signal:j.signal});if(!K.ok){const Q=await K.text().catch(()=>"");throw new Error(`取得に失敗しました (${K.status}) ${Q}`)}const tt=await K.json();f(Array.isArray(tt)?tt:[])}catch(O){O.name!=="AbortError"&&(console.error(O),N("フォロー対象の取得に失敗しました"),f([]))}finally{b(!1)}}return _(),()=>j.abort()},[a,s]);const V=async()=>{try{const j=localStorage.getItem("access_token")||localStorage.getItem("rb_token"),_={subject:d,body:p},O=await fetch(`${Ll}/emails/test`,{method:"POST",headers:{"Content-Type":"application/json",...j?{Authorization:`Bearer ${j}`}:{}},body:JSON.stringify(_)});if(!O.ok){const K=await O.text().catch(()=>"");throw new Error(`テスト送信に失敗しました (${O.status}) ${K}`)}const $=await O.json().catch(()=>null);alert($?.message||"自分にテスト送信しました！")}catch(j){console.error(j),alert("テスト送信に失敗しました（コンソールも確認してね）")}},B=async()=>{try{const j=localStorage.getItem("access_token")||localStorage.getItem("rb_token"),_=a==="purchase_follow"?c.map(Q=>Q.customer_id):c.map(Q=>Q.id),O=Array.from(new Set(_)),$={subject:d,body:p,customer_ids:O},K=await fetch(`${Ll}/emails/bulk`,{method:"POST",headers:{"Content-Type":"application/json",...j?{Authorization:`Bearer ${j}`}:{}},body:JSON.stringify($)});if(!K.ok){const Q=await K.text().catch(()=>"");throw new Error(`一斉送信に失敗しました (${K.status}) ${Q}`)}const tt=await K.json().catch(()=>null);alert(tt?.message||"フォロー対象へ一斉送信しました！")}catch(j){console.error(j),alert("一斉送信に失敗しました（コンソールも確認してね）")}},U=a==="purchase_follow";return v.jsxs("section",{className:"rounded-2xl border bg-white p-6 shadow-sm",children:[v.jsxs("div",{children:[v.jsxs("div",{children:[v.jsx("h2",{className:"text-lg font-semibold text-gray-900",children:"フォロー対象へ一斉メール"}),v.jsx("p",{className:"mt-1 text-xs text-gray-500",children:"誕生日・イベント・購入フォローのお客様に、一括でメールを送信します。"})]}),v.jsx("div",{className:"mt-3 flex flex-wrap gap-2 text-xs",children:mC.map(j=>v.jsx("button",{type:"button",onClick:()=>i(j.value),className:`rounded-full px-4 py-1 whitespace-nowrap transition ${a===j.value?"bg-pink-500 text-white shadow-sm":"bg-gray-100 text-gray-600 hover:bg-gray-200"}`,children:j.label},j.value))})]}),U&&v.jsxs("div",{className:"mt-3 flex flex-wrap items-center gap-2 text-xs",children:[v.jsx("span",{className:"text-gray-500",children:"購入カテゴリ："}),v.jsx("button",{type:"button",onClick:()=>r("skincare"),className:`rounded-full border px-3 py-1 ${s==="skincare"?"border-pink-400 bg-pink-50 text-pink-700":"border-gray-200 bg-white text-gray-600 hover:bg-gray-50"}`,children:"スキンケア（90日〜）"}),v.jsx("button",{type:"button",onClick:()=>r("makeup"),className:`rounded-full border px-3 py-1 ${s==="makeup"?"border-pink-400 bg-pink-50 text-pink-700":"border-gray-200 bg-white text-gray-600 hover:bg-gray-50"}`,children:"メイクアップ（120日〜）"})]}),v.jsxs("div",{className:"mt-4 grid gap-4 md:grid-cols-2",children:[v.jsxs("div",{className:"space-y-3 text-sm",children:[v.jsxs("div",{children:[v.jsx("label",{className:"mb-1 block text-xs font-medium text-gray-600",children:"件名"}),v.jsx("input",{type:"text",value:d,onChange:j=>m(j.target.value),placeholder:"例）【Re:Beauty】 いつもご利用ありがとうございます",className:"w-full rounded-lg border border-gray-200 px-3 py-2 text-sm focus:border-pink-400 focus:outline-none focus:ring-1 focus:ring-pink-300"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"mb-1 block text-xs font-medium text-gray-600",children:"本文"}),v.jsx("textarea",{rows:8,value:p,onChange:j=>y(j.target.value),placeholder:"例）いつも Re:Beauty をご利用いただきありがとうございます。そろそろお肌のお手入れのタイミングかと思い、ご案内をお送りいたしました。",className:"w-full resize-none rounded-lg border border-gray-200 px-3 py-2 text-sm focus:border-pink-400 focus:outline-none focus:ring-1 focus:ring-pink-300"})]}),v.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-2",children:[v.jsxs("p",{className:"text-xs text-gray-500",children:["対象件数："," ",v.jsx("span",{className:"font-semibold text-gray-800",children:g?"読み込み中…":`${c.length} 件`})]}),v.jsxs("div",{className:"flex gap-2",children:[v.jsx("button",{type:"button",onClick:V,className:"rounded-full border border-gray-200 px-3 py-1.5 text-xs font-medium text-gray-600 hover:bg-gray-50",children:"自分にテスト送信"}),v.jsx("button",{type:"button",onClick:B,className:"rounded-full bg-pink-500 px-4 py-1.5 text-xs font-semibold text-white shadow-sm hover:bg-pink-600 disabled:bg-gray-300",disabled:c.length===0,children:"フォロー対象に一斉送信"})]})]}),S&&v.jsx("p",{className:"text-xs text-red-500",children:S})]}),v.jsxs("div",{className:"flex h-full flex-col rounded-xl border border-gray-100 bg-gray-50 p-3 text-xs",children:[v.jsxs("div",{className:"mb-2 flex items-center justify-between",children:[v.jsx("p",{className:"font-semibold text-gray-700",children:"フォロー対象リスト"}),v.jsx("span",{className:"rounded-full bg-white px-2 py-0.5 text-[10px] text-gray-500",children:g?"更新中…":`${c.length}件`})]}),v.jsxs("div",{className:"h-[220px] space-y-1 overflow-y-auto rounded-lg bg-white p-2",children:[g&&v.jsx("p",{className:"py-6 text-center text-gray-400",children:"読み込み中です…"}),!g&&c.length===0&&v.jsx("p",{className:"py-6 text-center text-gray-400",children:"現在、該当するお客様はいません。"}),!g&&c.map(j=>v.jsx("div",{className:"flex items-start justify-between rounded-md border border-gray-100 px-2 py-1.5",children:v.jsxs("div",{children:[v.jsx("p",{className:"text-[11px] font-semibold text-gray-800",children:j.name}),v.jsx("p",{className:"text-[10px] text-gray-500",children:j.email})]})},a==="purchase_follow"?j.customer_id:j.id))]}),v.jsx("p",{className:"mt-2 text-[10px] text-gray-400",children:"※ 対象条件は「上部タブ（誕生日 / イベント / 購入フォロー）」と 「購入カテゴリ」で切り替え可能"})]})]})]})}function pg({title:a,value:i,emphasize:s=!1}){return v.jsxs("div",{className:"rounded-2xl border bg-white p-5 shadow-sm",children:[v.jsx("div",{className:"text-sm text-gray-500",children:a}),v.jsx("div",{className:`mt-2 text-3xl font-bold ${s?"text-red-600":""}`,children:i})]})}function yC(){const[a,i]=E.useState(0),[s,r]=E.useState(0),c=()=>{const f=localStorage.getItem("access_token")||localStorage.getItem("rb_token");return f?{Authorization:`Bearer ${f}`}:{}};return E.useEffect(()=>{const f=new AbortController;async function d(){try{const m=await fetch(`${ye}/visits/today-count`,{headers:c(),signal:f.signal});if(!m.ok)return;const p=await m.json();i(p.count??0)}catch(m){m.name!=="AbortError"&&console.error(m)}}return d(),()=>f.abort()},[]),E.useEffect(()=>{const f=new AbortController;async function d(){try{const m=await fetch(`${ye}/dashboard/monthly-new-count`,{headers:c(),signal:f.signal});if(!m.ok)return;const p=await m.json();r(p.count??0)}catch(m){m.name!=="AbortError"&&console.error(m)}}return d(),()=>f.abort()},[]),v.jsxs("div",{className:"grid grid-cols-1 gap-4 md:grid-cols-2",children:[v.jsx(pg,{title:"本日の来店数",value:a}),v.jsx(pg,{title:"今月の新規",value:s})]})}function gC(){const a=xg.useMemo(()=>JSON.parse(localStorage.getItem("rb_user")||"{}"),[]);return v.jsx(Xr,{sidebar:v.jsx(oC,{}),header:v.jsxs("div",{className:"text-xs text-gray-600",children:["ログイン中：",v.jsx("span",{className:"font-semibold",children:a?.name||"staff"})]}),children:v.jsxs("div",{className:"space-y-6",children:[v.jsx(yC,{}),v.jsxs("div",{className:"grid grid-cols-1 gap-4 lg:grid-cols-2",children:[v.jsx(dC,{limit:5,showSeeMore:!1}),v.jsx(hC,{}),v.jsx("div",{className:"lg:col-span-2",children:v.jsx(pC,{})})]})]})})}const vC=()=>localStorage.getItem("access_token")||localStorage.getItem("rb_token")||localStorage.getItem("accessToken")||"",yv=()=>{const a=vC();return a?{Authorization:`Bearer ${a}`}:{}};async function xC(a){const i=await fetch(`${ye}/customers`,{method:"POST",headers:{"Content-Type":"application/json",...yv()},body:JSON.stringify(a)});if(!i.ok){const s=await i.text().catch(()=>"");throw new Error(s||"顧客の登録に失敗しました")}return i.json()}async function bC(a,i){const s=await fetch(`${ye}/customers/${a}`,{method:"PATCH",headers:{"Content-Type":"application/json",...yv()},body:JSON.stringify(i)});if(!s.ok){const r=await s.text().catch(()=>"");throw new Error(r||"顧客の更新に失敗しました")}return s.json()}const SC=["乾燥肌","脂性肌","混合肌","普通肌","わからない"],TC=Array.from({length:100},(a,i)=>new Date().getFullYear()-i),EC=Array.from({length:12},(a,i)=>i+1),Mc=(a,i)=>!a||!i?31:new Date(Number(a),Number(i),0).getDate(),AC=["乾燥","ニキビ","吹き出物","くすみ","シミ","シワ","たるみ","毛穴"],CC=["保湿","ハリ・ツヤ","透明感","美白ケア","キメ","なめらかさ"];function yg({label:a,checked:i,onChange:s,name:r}){return v.jsxs("label",{className:"cursor-pointer select-none",children:[v.jsx("input",{type:"checkbox",className:"peer sr-only",name:r,value:a,checked:i,onChange:s}),v.jsx("span",{className:`inline-flex items-center gap-2 rounded-full border px-3 py-1.5 text-sm transition
-                       peer-checked:border-blue-600 peer-checked:bg-blue-50 peer-checked:text-blue-700`,children:a})]})}function NC(){const[a,i]=E.useState({lastName:"",firstName:"",furigana:"",birthYear:"",birthMonth:"",birthDay:"",birthdate:"",email:"",phone:"",address:"",skinType:"",skinConcerns:[],idealSkin:[],concernNote:"",idealNote:"",sensitiveInfo:"",emailOptIn:!0}),s=(f,d)=>{i(m=>{const p=m[f].includes(d);return{...m,[f]:p?m[f].filter(y=>y!==d):[...m[f],d]}})},r=f=>{const{name:d,value:m}=f.target;i(p=>({...p,[d]:m}))},c=async f=>{f.preventDefault();const d={name:`${a.lastName} ${a.firstName}`.trim(),kana:a.furigana||null,phone:a.phone||null,email:a.email||null,birthday:a.birthdate||null,note:[a.address&&`住所: ${a.address}`,a.skinType&&`肌タイプ: ${a.skinType}`,a.skinConcerns.length>0&&`肌悩み: ${a.skinConcerns.join(", ")}`,a.concernNote&&`悩みメモ: ${a.concernNote}`,a.idealSkin.length>0&&`理想の肌: ${a.idealSkin.join(", ")}`,a.idealNote&&`理想メモ: ${a.idealNote}`,a.sensitiveInfo&&`敏感情報: ${a.sensitiveInfo}`].filter(Boolean).join(" / "),email_opt_in:a.emailOptIn};try{console.log("送信するペイロード:",d);const m=await xC(d);console.log("作成された顧客:",m),alert("顧客情報を登録しました！")}catch(m){console.error("顧客登録エラー:",m),alert("顧客情報の登録に失敗しました…コンソールを確認してください")}};return v.jsx(Xr,{header:v.jsx("div",{className:"text-sm text-gray-600",children:"ログイン中：Staff 01"}),children:v.jsx("div",{className:"min-h-screen bg-gray-50 py-8",children:v.jsxs("div",{className:"mx-auto max-w-5xl px-4",children:[v.jsx("h1",{className:"text-2xl font-bold tracking-tight",children:"新規登録"}),v.jsx("p",{className:"mt-1 text-sm text-gray-600",children:"必須項目を入力し、「登録する」を押してください。"}),v.jsxs("form",{onSubmit:c,className:"mt-6 grid gap-6 md:grid-cols-2",children:[v.jsxs("section",{className:"rounded-2xl border bg-white p-6 shadow-sm",children:[v.jsx("h2",{className:"text-lg font-semibold",children:"① 個人情報登録"}),v.jsxs("div",{className:"mt-4 grid gap-4",children:[v.jsxs("div",{className:"grid grid-cols-2 gap-3",children:[v.jsxs("div",{children:[v.jsxs("label",{className:"block text-sm font-medium",children:["姓 ",v.jsx("span",{className:"text-red-600",children:"*"})]}),v.jsx("input",{type:"text",name:"lastName",value:a.lastName,onChange:r,required:!0,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"山田"})]}),v.jsxs("div",{children:[v.jsxs("label",{className:"block text-sm font-medium",children:["名 ",v.jsx("span",{className:"text-red-600",children:"*"})]}),v.jsx("input",{type:"text",name:"firstName",value:a.firstName,onChange:r,required:!0,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"花子"})]})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium",children:"フリガナ"}),v.jsx("input",{type:"text",name:"furigana",value:a.furigana,onChange:r,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"ヤマダ ハナコ"})]}),v.jsxs("div",{children:[v.jsxs("label",{className:"block text-sm font-medium",children:["生年月日 ",v.jsx("span",{className:"text-red-600",children:"*"})]}),v.jsxs("div",{className:"mt-1 grid grid-cols-3 gap-2",children:[v.jsxs("select",{name:"birthYear",value:a.birthYear,onChange:f=>{const d=f.target.value;i(m=>{const p=Mc(d,m.birthMonth),y=m.birthDay&&Number(m.birthDay)>p?String(p):m.birthDay,g=d&&m.birthMonth&&y?`${d}-${String(m.birthMonth).padStart(2,"0")}-${String(y).padStart(2,"0")}`:"";return{...m,birthYear:d,birthDay:y,birthdate:g}})},required:!0,className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",children:[v.jsx("option",{value:"",children:"年"}),TC.map(f=>v.jsx("option",{value:f,children:f},f))]}),v.jsxs("select",{name:"birthMonth",value:a.birthMonth,onChange:f=>{const d=f.target.value;i(m=>{const p=Mc(m.birthYear,d),y=m.birthDay&&Number(m.birthDay)>p?String(p):m.birthDay,g=m.birthYear&&d&&y?`${m.birthYear}-${String(d).padStart(2,"0")}-${String(y).padStart(2,"0")}`:"";return{...m,birthMonth:d,birthDay:y,birthdate:g}})},required:!0,className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",children:[v.jsx("option",{value:"",children:"月"}),EC.map(f=>v.jsx("option",{value:f,children:f},f))]}),v.jsxs("select",{name:"birthDay",value:a.birthDay,onChange:f=>{const d=f.target.value;i(m=>{const p=m.birthYear&&m.birthMonth&&d?`${m.birthYear}-${String(m.birthMonth).padStart(2,"0")}-${String(d).padStart(2,"0")}`:"";return{...m,birthDay:d,birthdate:p}})},required:!0,className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",children:[v.jsx("option",{value:"",children:"日"}),Array.from({length:Mc(a.birthYear,a.birthMonth)},(f,d)=>d+1).map(f=>v.jsx("option",{value:f,children:f},f))]})]}),v.jsx("p",{className:"mt-1 text-xs text-gray-500",children:"年月日を選択してください"})]}),v.jsxs("div",{children:[v.jsxs("label",{className:"block text-sm font-medium",children:["メールアドレス ",v.jsx("span",{className:"text-red-600",children:"*"})]}),v.jsx("input",{type:"email",name:"email",value:a.email,onChange:r,required:!0,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"example@mail.com"})]}),v.jsx("div",{className:"mt-1",children:v.jsxs("label",{className:"flex items-center gap-2 text-xs text-gray-600",children:[v.jsx("input",{type:"checkbox",name:"emailOptIn",checked:a.emailOptIn,onChange:f=>i(d=>({...d,emailOptIn:f.target.checked})),className:"h-4 w-4 rounded border-gray-300 text-blue-600 focus:ring-blue-500"}),v.jsx("span",{children:"お誕生日・イベント・購入フォローなどの ご案内メールを受け取ることに同意します"})]})}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium",children:"電話番号（任意）"}),v.jsx("input",{type:"tel",name:"phone",value:a.phone,onChange:r,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"090-1234-5678"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium",children:"住所（任意）"}),v.jsx("input",{type:"text",name:"address",value:a.address,onChange:r,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"東京都〇〇区…"})]})]})]}),v.jsxs("section",{className:"rounded-2xl border bg-white p-6 shadow-sm",children:[v.jsx("h2",{className:"text-lg font-semibold",children:"② 美容プロフィール（チェックボックス）"}),v.jsxs("div",{className:"mt-4 space-y-5",children:[v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium mb-1",children:"お肌タイプ"}),v.jsxs("select",{name:"skinType",value:a.skinType,onChange:r,className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",children:[v.jsx("option",{value:"",children:"選択してください"}),SC.map(f=>v.jsx("option",{value:f,children:f},f))]})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium mb-2",children:"お肌悩み（複数選択可）"}),v.jsx("div",{className:"flex flex-wrap gap-2",children:AC.map(f=>v.jsx(yg,{name:"skinConcerns",label:f,checked:a.skinConcerns.includes(f),onChange:()=>s("skinConcerns",f)},f))}),v.jsx("input",{type:"text",name:"concernNote",value:a.concernNote,onChange:r,className:"mt-3 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"その他・自由記述"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium mb-2",children:"理想の肌感（複数選択可）"}),v.jsx("div",{className:"flex flex-wrap gap-2",children:CC.map(f=>v.jsx(yg,{name:"idealSkin",label:f,checked:a.idealSkin.includes(f),onChange:()=>s("idealSkin",f)},f))}),v.jsx("input",{type:"text",name:"idealNote",value:a.idealNote,onChange:r,className:"mt-3 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"その他・自由記述"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium mb-1",children:"敏感情報・禁止成分（任意）"}),v.jsx("textarea",{name:"sensitiveInfo",value:a.sensitiveInfo,onChange:r,rows:3,className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"刺激になりやすい成分、避けたい成分（例：アルコール、香料）"}),v.jsx("p",{className:"mt-1 text-xs text-gray-500",children:"個人情報の取扱いに同意の上、必要な範囲でご記入ください。"})]})]})]}),v.jsxs("div",{className:"md:col-span-2 flex items-center justify-end gap-3",children:[v.jsx("button",{type:"button",onClick:()=>window.history.back(),className:"rounded-lg border px-4 py-2 text-sm",children:"戻る"}),v.jsx("button",{type:"submit",className:"rounded-lg bg-blue-600 px-5 py-2.5 text-sm font-semibold text-white shadow-sm transition hover:bg-blue-700 focus:outline-none focus:ring-2 focus:ring-blue-500",children:"登録する"})]})]})]})})})}const la=(a="")=>a.toString().normalize("NFKC").toLowerCase().replace(/[\u30a1-\u30f6]/g,i=>String.fromCharCode(i.charCodeAt(0)-96)).trim(),wc=(a,i)=>{const s=a??"";if(!i)return s;const r=i.replace(/[.*+?^${}()|[\]\\]/g,"\\$&");return s.toString().split(new RegExp(`(${r})`,"i")).map((c,f)=>f%2?v.jsx("mark",{children:c},f):v.jsx("span",{children:c},f))};function jC(){const a=da(),[i,s]=E.useState(""),[r,c]=E.useState(""),[f,d]=E.useState(""),[m,p]=E.useState(0),[y,g]=E.useState([]);E.useEffect(()=>{(async()=>{try{const _=localStorage.getItem("access_token")||localStorage.getItem("rb_token"),O=await fetch(`${ye}/customers`,{headers:_?{Authorization:`Bearer ${_}`}:{}});if(!O.ok)throw new Error(`顧客一覧の取得に失敗しました（${O.status}）`);const $=await O.json(),K=(Array.isArray($)?$:[]).map(tt=>{const Q=(tt.name??"").trim();let P="",ht="";if(Q.includes(" ")){const Tt=Q.split(/\s+/);P=Tt[0]??"",ht=Tt.slice(1).join(" ")??""}else{const Tt=Math.ceil(Q.length/2);P=Q.slice(0,Tt),ht=Q.slice(Tt)}return{id:String(tt.id),number:String(tt.id),lastName:P,firstName:ht,phone:tt.phone??""}});g(K)}catch(_){console.error(_),alert(_.message||"顧客一覧取得エラー")}})()},[]);const[b,S]=E.useState({qNumber:i,qName:r,qPhone:f});E.useEffect(()=>{const j=setTimeout(()=>S({qNumber:i,qName:r,qPhone:f}),250);return()=>clearTimeout(j)},[i,r,f]);const N=E.useMemo(()=>{const j=la(b.qNumber),_=la(b.qName),O=la(b.qPhone);return j||_||O?y.filter(K=>{const tt=`${K.lastName??""}${K.firstName??""}`,Q=j&&la(K.number).includes(j),P=_&&la(tt).includes(_),ht=O&&la(K.phone).includes(O);return Q||P||ht}).slice(0,20):[]},[y,b]);E.useEffect(()=>p(0),[N.length]);const V=j=>{const _=Number(la(j.id));if(!Number.isFinite(_))return alert("顧客IDが不正です");a(`/customers/${_}`)},B=j=>{if(N.length){if(j.key==="ArrowDown")j.preventDefault(),p(_=>Math.min(N.length-1,_+1));else if(j.key==="ArrowUp")j.preventDefault(),p(_=>Math.max(0,_-1));else if(j.key==="Enter"){j.preventDefault();const _=N[m];_&&V(_)}}},U=()=>{s(""),c(""),d("")};return v.jsx(Xr,{header:v.jsx("div",{className:"text-sm text-gray-600",children:"ログイン中：Staff 01"}),children:v.jsx("div",{className:"min-h-screen bg-gray-50 py-8",children:v.jsxs("div",{className:"mx-auto max-w-4xl px-4",children:[v.jsx("h1",{className:"text-2xl font-bold mb-6",children:"顧客検索【顧客番号】or【名前】or【電話】"}),v.jsxs("section",{className:"rounded-2xl border bg-white p-5 shadow-sm",children:[v.jsxs("div",{className:"grid gap-3 md:grid-cols-3",children:[v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm text-gray-600 mb-1",children:"顧客番号"}),v.jsx("input",{value:i,onChange:j=>s(la(j.target.value)),onKeyDown:B,placeholder:"例）1",className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",type:"text",inputMode:"numeric"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm text-gray-600 mb-1",children:"名前（姓 + 名）"}),v.jsx("input",{value:r,onChange:j=>c(j.target.value),onKeyDown:B,placeholder:"例）山田花子 / ﾔﾏﾀﾞﾊﾅｺ",className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",type:"text"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm text-gray-600 mb-1",children:"電話番号"}),v.jsx("input",{value:f,onChange:j=>d(j.target.value),onKeyDown:B,placeholder:"例）090-0000-0000",className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",type:"tel"})]})]}),v.jsx("div",{className:"mt-3 flex justify-center gap-2",children:v.jsx("button",{onClick:U,className:"rounded-md border px-3 py-1.5 text-sm hover:bg-gray-50",children:"クリア"})}),v.jsx("div",{className:"mt-4",children:v.jsx("div",{className:"rounded-xl border",children:v.jsx("ul",{className:"divide-y max-h-[420px] overflow-auto",children:N.length===0?v.jsx("li",{className:"text-sm text-gray-400 p-4",children:"検索候補一覧"}):N.map((j,_)=>{const O=_===m;return v.jsxs("li",{onMouseEnter:()=>p(_),onClick:()=>V(j),className:"cursor-pointer px-4 py-3 grid grid-cols-1 md:grid-cols-[120px_1fr_160px] items-center gap-2 "+(O?"bg-blue-50":"bg-white hover:bg-gray-50"),children:[v.jsxs("div",{className:"font-mono text-sm text-gray-700",children:["#",wc(j.number,i)]}),v.jsx("div",{className:"text-gray-900 font-medium",children:wc(`${j.lastName} ${j.firstName}`,r)}),v.jsx("div",{className:"text-sm text-gray-500",children:wc(j.phone,f)})]},j.id)})})})})]})]})})})}function Cr({title:a,children:i,className:s="",right:r}){return v.jsxs("section",{className:`rounded-2xl border bg-white p-6 shadow-sm ${s}`,children:[v.jsxs("div",{className:"flex items-center justify-between",children:[v.jsx("h2",{className:"text-lg font-semibold",children:a}),r]}),v.jsx("div",{className:"mt-4",children:i})]})}function gg({options:a,value:i,onChange:s}){const r=c=>{i.includes(c)?s(i.filter(f=>f!==c)):s([...i,c])};return v.jsx("div",{className:"flex flex-wrap gap-2",children:a.map(c=>{const f=i.includes(c);return v.jsx("button",{type:"button",onClick:()=>r(c),className:"rounded-full border px-3 py-1.5 text-sm transition "+(f?"bg-blue-600 text-white border-blue-600":"bg-white hover:bg-gray-50"),children:c},c)})})}function gv({value:a,onChange:i,optionsByCategory:s}){const r=f=>{a.includes(f)?i(a.filter(d=>d!==f)):i([...a,f])},c=()=>i([]);return v.jsxs("div",{children:[v.jsxs("div",{className:"mb-2 flex justify-between items-center",children:[v.jsx("span",{className:"block text-xs text-gray-600",children:"購入品・サービス"}),v.jsx("button",{type:"button",onClick:c,className:"text-xs rounded-md border px-2 py-1 hover:bg-gray-50",children:"クリア"})]}),v.jsx("div",{className:"space-y-3",children:Object.entries(s).map(([f,d])=>v.jsxs("div",{children:[v.jsx("div",{className:"text-xs font-semibold text-gray-700 mb-1",children:f}),v.jsx("div",{className:"flex flex-wrap gap-2",children:d.map(m=>{const p=a.includes(m);return v.jsx("button",{type:"button",onClick:()=>r(m),className:"rounded-full border px-3 py-1 text-sm transition "+(p?"bg-blue-600 text-white border-blue-600":"bg-white hover:bg-gray-50"),children:m},m)})})]},f))}),v.jsx("div",{className:"mt-3 text-xs text-gray-600",children:a.length>0?`選択中：${a.join(" / ")}`:"選択なし"})]})}function DC({v:a,isEditing:i,draft:s,onStartEdit:r,onChange:c,onSave:f,onCancel:d,onDelete:m,staffOptions:p,productOptions:y}){return i?v.jsxs("div",{className:"grid grid-cols-[130px_1fr_1fr_auto] items-start gap-2 rounded-lg border bg-gray-50 px-3 py-2",children:[v.jsx("div",{children:v.jsx("input",{type:"text",value:s.date,onChange:g=>c({...s,date:g.target.value}),className:"w-full rounded-md border px-2 py-1",placeholder:"2025/10/16"})}),v.jsx("div",{children:v.jsxs("select",{value:s.staff_id??"",onChange:g=>c({...s,staff_id:g.target.value}),className:"w-full rounded-md border px-2 py-1 bg-white",children:[v.jsx("option",{value:"",children:"— 選択してください —"}),p.map(g=>v.jsx("option",{value:g.value,children:g.label},g.value))]})}),v.jsx("div",{className:"col-span-1",children:v.jsx(gv,{value:s.items,onChange:g=>c({...s,items:g}),optionsByCategory:y})}),v.jsxs("div",{className:"flex gap-2",children:[v.jsx("button",{onClick:f,className:"rounded-md bg-blue-600 px-3 py-1.5 text-sm font-semibold text-white hover:bg-blue-700",children:"保存"}),v.jsx("button",{onClick:d,className:"rounded-md border px-3 py-1.5 text-sm hover:bg-gray-50",children:"キャンセル"}),v.jsx("button",{onClick:()=>m(a.id),className:"rounded-md border border-red-500 text-red-500 px-3 py-1.5 text-sm hover:bg-red-50",children:"削除"})]})]}):v.jsxs("div",{className:"grid grid-cols-[130px_1fr_1fr_auto] items-center gap-2 rounded-lg border px-3 py-2",children:[v.jsx("div",{className:"text-sm text-gray-700",children:a.date}),v.jsx("div",{className:"text-sm text-gray-700",children:a.staff_name?`【担当者】${a.staff_name}`:"【担当者】"}),v.jsx("div",{className:"text-sm text-gray-700",children:a.items?.length?`【購入品・サービス】 ${a.items.join(" / ")}`:"【購入品・サービス】"}),v.jsxs("div",{className:"flex flex-col items-end gap-2",children:[v.jsx("button",{onClick:()=>r(a),className:"rounded-md border px-3 py-1 text-sm hover:bg-gray-50",children:"編集"}),v.jsx("button",{onClick:()=>m(a.id),className:"rounded-md border border-red-500 text-red-500 px-3 py-1 text-sm hover:bg-red-50 transition-colors duration-200",children:"削除"})]})]})}const Nr=a=>{const i={};return a&&a.split(" / ").forEach(s=>{const r=s.indexOf(":");if(r===-1)return;const c=s.slice(0,r).trim(),f=s.slice(r+1).trim();i[c]=f}),i},sa=a=>(a||"").split(",").map(i=>i.trim()).filter(Boolean),MC=a=>[a.address&&`住所: ${a.address}`,a.skinType&&`肌タイプ: ${a.skinType}`,a.skinConcerns?.length?`肌悩み: ${a.skinConcerns.join(", ")}`:null,a.concernNote&&`悩みメモ: ${a.concernNote}`,a.idealSkin?.length?`理想の肌: ${a.idealSkin.join(", ")}`:null,a.idealNote&&`理想メモ: ${a.idealNote}`,a.sensitiveInfo&&`敏感情報: ${a.sensitiveInfo}`,a.memo&&`メモ: ${a.memo}`].filter(Boolean).join(" / "),wC=["乾燥肌","脂性肌","混合肌","普通肌","わからない"],RC=["乾燥","ニキビ","吹き出物","くすみ","シミ","シワ","たるみ","毛穴"],_C=["保湿","ハリ・ツヤ","透明感","美白ケア","キメ","なめらかさ"];function OC(){const{id:a}=RS(),i=da(),[s,r]=E.useState(!1),[c,f]=E.useState([]),[d,m]=E.useState(!1),[p,y]=E.useState(""),[g,b]=E.useState({id:"",name:"",kana:"",phone:"",email:"",birthday:"",note:"",email_opt_in:!0}),[S,N]=E.useState(!1),[V,B]=E.useState(!1),[U,j]=E.useState({birthday:"",email:"",phone:"",emailOptIn:!0,address:"",memo:"",skinType:"",skinConcerns:[],idealSkin:[],concernNote:"",idealNote:"",sensitiveInfo:""}),_=E.useMemo(()=>g.name||"",[g.name]),O=E.useMemo(()=>Nr(g.note),[g.note]),$=E.useMemo(()=>c.map(G=>({value:G.id,label:G.name})),[c]),K=E.useMemo(()=>({スキンケア:["クレンジング","洗顔","導入美容液","化粧水","美容液","乳液","クリーム","パック"],メイクアップ:["下地","ファンデーション","パウダー","アイブロウ","アイシャドウ","マスカラ","アイライナー","リップ"],その他:["スキンケアサンプル","メイクアップサンプル","タッチアップ","マッサージ"]}),[]);E.useEffect(()=>{const G=new AbortController;async function F(){m(!0),y("");try{const st=localStorage.getItem("access_token")||localStorage.getItem("rb_token"),yt=await fetch(`${ye}/staffs/`,{headers:st?{Authorization:`Bearer ${st}`}:{},signal:G.signal});if(!yt.ok){const ft=await yt.text().catch(()=>"");throw new Error(`スタッフ取得に失敗しました（${yt.status}）${ft}`)}const ct=await yt.json();f(Array.isArray(ct)?ct:[])}catch(st){st.name!=="AbortError"&&y(st.message||"スタッフ取得エラー")}finally{m(!1)}}return F(),()=>G.abort()},[]),E.useEffect(()=>{if(!a)return;const G=new AbortController;async function F(){try{const st=localStorage.getItem("access_token")||localStorage.getItem("rb_token"),yt=await fetch(`${ye}/customers/${a}`,{headers:st?{Authorization:`Bearer ${st}`}:{},signal:G.signal});if(!yt.ok){const Ie=await yt.text().catch(()=>"");throw new Error(`顧客取得に失敗しました（${yt.status}）${Ie}`)}const ct=await yt.json();b(ct);const ft=Nr(ct.note);j({birthday:ct.birthday||"",email:ct.email||"",phone:ct.phone||"",emailOptIn:!!ct.email_opt_in,address:ft.住所||"",memo:ft.メモ||"",skinType:ft.肌タイプ||"",skinConcerns:sa(ft.肌悩み),idealSkin:sa(ft.理想の肌),concernNote:ft.悩みメモ||"",idealNote:ft.理想メモ||"",sensitiveInfo:ft.敏感情報||""}),N(!1)}catch(st){st.name!=="AbortError"&&(console.error(st),alert(st.message||"顧客取得エラー"))}}return F(),()=>G.abort()},[a]);const tt=()=>N(!0),Q=()=>{const G=Nr(g.note);j({birthday:g.birthday||"",email:g.email||"",phone:g.phone||"",emailOptIn:!!g.email_opt_in,address:G.住所||"",memo:G.メモ||"",skinType:G.肌タイプ||"",skinConcerns:sa(G.肌悩み),idealSkin:sa(G.理想の肌),concernNote:G.悩みメモ||"",idealNote:G.理想メモ||"",sensitiveInfo:G.敏感情報||""}),N(!1)},P=async()=>{const G=Number(g.id||a);if(!G||!window.confirm(`この顧客を削除しますか？
-※来店記録もすべて削除されます。`))return;const st=localStorage.getItem("access_token")||localStorage.getItem("rb_token");try{r(!0);const yt=await fetch(`${ye}/customers/${G}`,{method:"DELETE",headers:st?{Authorization:`Bearer ${st}`}:{}});if(!yt.ok){const ct=await yt.text().catch(()=>"");throw new Error(`削除に失敗しました (${yt.status}) ${ct}`)}alert("顧客を削除しました。"),i("/customers/search",{replace:!0})}catch(yt){console.error(yt),alert(yt.message||"顧客の削除に失敗しました")}finally{r(!1)}},ht=async()=>{try{B(!0);const G={birthday:U.birthday||null,email:U.email||null,phone:U.phone||null,email_opt_in:U.emailOptIn,note:MC(U)||null},F=await bC(Number(g.id||a),G);b(F);const st=Nr(F.note);j(yt=>({...yt,birthday:F.birthday||"",email:F.email||"",phone:F.phone||"",emailOptIn:!!F.email_opt_in,address:st.住所||"",memo:st.メモ||"",skinType:st.肌タイプ||"",skinConcerns:sa(st.肌悩み),idealSkin:sa(st.理想の肌),concernNote:st.悩みメモ||"",idealNote:st.理想メモ||"",sensitiveInfo:st.敏感情報||""})),N(!1),alert("顧客情報を更新しました！")}catch(G){console.error(G),alert(G.message||"顧客情報の更新に失敗しました")}finally{B(!1)}},[Tt,kt]=E.useState([]),[It,fe]=E.useState(!1),[me,te]=E.useState("");E.useEffect(()=>{if(!a)return;(async()=>{try{fe(!0),te("");const F=localStorage.getItem("access_token")||localStorage.getItem("rb_token"),st=await fetch(`${ye}/visits/by-customer/${a}`,{headers:F?{Authorization:`Bearer ${F}`}:{}});if(!st.ok){const ft=await st.text().catch(()=>"");throw new Error(`来店履歴の取得に失敗しました（${st.status}）${ft}`)}const ct=(await st.json()).map(ft=>{const Ie=(ft.items??[]).map(Ne=>`${Ne.category}${Ne.product_name?`：${Ne.product_name}`:""}`);return{id:ft.id,date:(ft.visit_date??"").replaceAll("-","/"),staff_id:ft.staff_id??"",staff_name:c.find(Ne=>Number(Ne.id)===Number(ft.staff_id))?.name||"",items:Ie,memo:ft.memo??"",_raw:ft}});kt(ct)}catch(F){console.error(F),te(F.message||"来店履歴取得エラー")}finally{fe(!1)}})()},[a,c]);const[H,X]=E.useState(!1),[J,ut]=E.useState({date:"",staff_id:"",items:[]}),[pt,C]=E.useState(null),[k,Z]=E.useState({id:null,date:"",staff_id:"",items:[],memo:""}),I=()=>new Date().toISOString().slice(0,10).replace(/-/g,"/"),lt=()=>{C(null),Z({id:null,date:"",staff_id:"",items:[],memo:""}),ut({date:I(),staff_id:"",items:[]}),X(!0)},mt=G=>G==="スキンケア"?"skincare":G==="メイクアップ"?"makeup":"other",Et=G=>{for(const[F,st]of Object.entries(K))if(st.includes(G))return F;return"その他"},ie=async()=>{if(!J.date?.trim())return alert("日付を入力してください");if(!String(J.staff_id||"").trim())return alert("担当者を選択してください");if(!J.items?.length)return alert("購入品・サービスを1点以上選択してください");const G=localStorage.getItem("access_token")||localStorage.getItem("rb_token"),F=J.date.replaceAll("/","-"),st=J.items.map(ct=>{const ft=Et(ct);return{category:mt(ft),product_name:ct,note:null}}),yt={customer_id:Number(a),visit_date:F,memo:null,staff_id:Number(J.staff_id),items:st};try{fe(!0),te("");const ct=await fetch(`${ye}/visits/`,{method:"POST",headers:{"Content-Type":"application/json",...G?{Authorization:`Bearer ${G}`}:{}},body:JSON.stringify(yt)});if(!ct.ok){const Xt=await ct.text().catch(()=>"");throw new Error(`来店登録に失敗しました（${ct.status}）${Xt}`)}const ft=await ct.json(),Ie=(ft.items??[]).map(Xt=>`${Xt.category}${Xt.product_name?`：${Xt.product_name}`:""}`),Ne=c.find(Xt=>Xt.id===Number(J.staff_id))?.name||"",pa={id:ft.id,date:(ft.visit_date??"").replaceAll("-","/"),staff_id:Number(J.staff_id),staff_name:Ne,items:Ie,memo:ft.memo??"",_raw:ft};kt(Xt=>[pa,...Xt]),X(!1)}catch(ct){console.error(ct),alert(ct.message||"来店登録エラー")}finally{fe(!1)}},Lt=G=>{X(!1),C(G.id);const F=Array.isArray(G.items)?G.items.map(st=>{const yt=String(st);return yt.includes("：")?yt.split("：").pop().trim():yt.trim()}):[];Z({id:G.id,date:G.date,staff_id:String(G.staff_id??""),items:F,memo:G.memo??""})},ma=async()=>{if(!k.date?.trim())return alert("日付を入力してください");if(!String(k.staff_id||"").trim())return alert("担当者を選択してください");if(!k.items?.length)return alert("購入品・サービスを1点以上選択してください");const G=localStorage.getItem("access_token")||localStorage.getItem("rb_token"),F=k.date.replaceAll("/","-"),st=k.items.map(ct=>{const ft=Et(ct);return{category:mt(ft),product_name:ct,note:null}}),yt={visit_date:F,memo:k.memo??null,staff_id:Number(k.staff_id),items:st};try{fe(!0),te("");const ct=await fetch(`${ye}/visits/${pt}`,{method:"PUT",headers:{"Content-Type":"application/json",...G?{Authorization:`Bearer ${G}`}:{}},body:JSON.stringify(yt)});if(!ct.ok){const Xt=await ct.text().catch(()=>"");throw new Error(`編集に失敗しました（${ct.status}）${Xt}`)}const ft=await ct.json(),Ie=(ft.items??[]).map(Xt=>`${Xt.category}${Xt.product_name?`：${Xt.product_name}`:""}`),Ne=c.find(Xt=>Xt.id===Number(k.staff_id))?.name||"",pa={id:ft.id,date:(ft.visit_date??"").replaceAll("-","/"),staff_id:Number(k.staff_id),staff_name:Ne,items:Ie,memo:ft.memo??"",_raw:ft};kt(Xt=>Xt.map(as=>as.id===pt?pa:as)),C(null)}catch(ct){console.error(ct),alert(ct.message||"来店記録の編集に失敗しました")}finally{fe(!1)}},Ya=async G=>{if(!window.confirm("削除してもよろしいですか？"))return;const st=localStorage.getItem("access_token")||localStorage.getItem("rb_token");try{const yt=await fetch(`${ye}/visits/${G}`,{method:"DELETE",headers:st?{Authorization:`Bearer ${st}`}:{}});if(!yt.ok){const ct=await yt.text().catch(()=>"");throw new Error(`削除に失敗しました (${yt.status}) ${ct}`)}kt(ct=>ct.filter(ft=>ft.id!==G))}catch(yt){console.error(yt),alert(yt.message||"来店記録の削除に失敗しました")}},Hi=()=>C(null);return v.jsx(Xr,{header:v.jsx("div",{className:"text-sm text-gray-600",children:"ログイン中：Staff 01"}),children:v.jsxs("div",{className:"space-y-6",children:[v.jsx("header",{className:"rounded-2xl border bg-white px-6 py-5 shadow-sm",children:v.jsxs("div",{className:"flex items-center justify-between gap-3",children:[v.jsxs("h1",{className:"text-2xl font-bold tracking-tight",children:["顧客番号：",g.id," ／ 名前：",_]}),S?v.jsxs("div",{className:"flex gap-2",children:[v.jsx("button",{onClick:ht,disabled:V,className:"rounded-lg bg-blue-600 px-4 py-2 text-sm font-semibold text-white hover:bg-blue-700 disabled:opacity-50",children:"保存"}),v.jsx("button",{onClick:Q,disabled:V,className:"rounded-lg border px-4 py-2 text-sm hover:bg-gray-50 disabled:opacity-50",children:"キャンセル"})]}):v.jsxs("div",{className:"flex gap-2",children:[v.jsx("button",{onClick:tt,className:"rounded-lg border px-4 py-2 text-sm font-semibold hover:bg-gray-50",children:"基本情報を編集"}),v.jsx("button",{onClick:P,disabled:s,className:"rounded-lg border border-red-500 px-4 py-2 text-sm font-semibold text-red-600 hover:bg-red-50 disabled:opacity-50",children:s?"削除中...":"顧客を削除"})]})]})}),v.jsxs("div",{className:"mt-6 grid gap-6 md:grid-cols-2",children:[v.jsx(Cr,{title:"① 基本情報",children:v.jsxs("div",{className:"space-y-4",children:[v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium",children:"生年月日（YYYY-MM-DD）"}),v.jsx("input",{type:"text",value:S?U.birthday:g.birthday??"",onChange:G=>j(F=>({...F,birthday:G.target.value})),readOnly:!S,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500 "+(S?"":"bg-gray-50"),placeholder:"1990-01-01"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium",children:"メールアドレス"}),v.jsx("input",{type:"email",value:S?U.email:g.email??"",onChange:G=>j(F=>({...F,email:G.target.value})),readOnly:!S,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500 "+(S?"":"bg-gray-50"),placeholder:"example@mail.com"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium",children:"電話番号"}),v.jsx("input",{type:"tel",value:S?U.phone:g.phone??"",onChange:G=>j(F=>({...F,phone:G.target.value})),readOnly:!S,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500 "+(S?"":"bg-gray-50"),placeholder:"090-1234-5678"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium",children:"住所（任意）"}),v.jsx("input",{type:"text",value:S?U.address:O.住所??"",onChange:G=>j(F=>({...F,address:G.target.value})),readOnly:!S,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500 "+(S?"":"bg-gray-50"),placeholder:"東京都〇〇区…"})]}),v.jsxs("label",{className:"flex items-center gap-2 text-xs text-gray-600",children:[v.jsx("input",{type:"checkbox",checked:S?U.emailOptIn:!!g.email_opt_in,onChange:G=>j(F=>({...F,emailOptIn:G.target.checked})),disabled:!S,className:"h-4 w-4 rounded border-gray-300 text-blue-600 focus:ring-blue-500"}),v.jsx("span",{children:"ご案内メールを受け取ることに同意"})]})]})}),v.jsxs("div",{className:"space-y-6",children:[v.jsx(Cr,{title:"美容プロフィール",children:S?v.jsxs("div",{className:"space-y-5",children:[v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium mb-1",children:"肌タイプ"}),v.jsxs("select",{value:U.skinType,onChange:G=>j(F=>({...F,skinType:G.target.value})),className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",children:[v.jsx("option",{value:"",children:"選択してください"}),wC.map(G=>v.jsx("option",{value:G,children:G},G))]})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium mb-2",children:"肌悩み（複数選択）"}),v.jsx(gg,{options:RC,value:U.skinConcerns,onChange:G=>j(F=>({...F,skinConcerns:G}))}),v.jsx("input",{type:"text",value:U.concernNote,onChange:G=>j(F=>({...F,concernNote:G.target.value})),className:"mt-3 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"その他・自由記述"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium mb-2",children:"理想の肌（複数選択）"}),v.jsx(gg,{options:_C,value:U.idealSkin,onChange:G=>j(F=>({...F,idealSkin:G}))}),v.jsx("input",{type:"text",value:U.idealNote,onChange:G=>j(F=>({...F,idealNote:G.target.value})),className:"mt-3 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"その他・自由記述"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium mb-1",children:"敏感情報（任意）"}),v.jsx("textarea",{rows:3,value:U.sensitiveInfo,onChange:G=>j(F=>({...F,sensitiveInfo:G.target.value})),className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"刺激になりやすい成分、避けたい成分（例：アルコール、香料）"})]})]}):v.jsxs("div",{className:"space-y-3 text-sm",children:[v.jsxs("div",{children:[v.jsx("div",{className:"text-xs text-gray-500",children:"肌タイプ"}),v.jsx("div",{className:"mt-1",children:O.肌タイプ||"—"})]}),v.jsxs("div",{children:[v.jsx("div",{className:"text-xs text-gray-500",children:"肌悩み"}),v.jsx("div",{className:"mt-1",children:O.肌悩み?v.jsx("div",{className:"flex flex-wrap gap-2",children:sa(O.肌悩み).map(G=>v.jsx("span",{className:"rounded-full border px-3 py-1 text-xs",children:G},G))}):"—"}),O.悩みメモ&&v.jsx("div",{className:"mt-2 text-xs text-gray-600",children:O.悩みメモ})]}),v.jsxs("div",{children:[v.jsx("div",{className:"text-xs text-gray-500",children:"理想の肌"}),v.jsx("div",{className:"mt-1",children:O.理想の肌?v.jsx("div",{className:"flex flex-wrap gap-2",children:sa(O.理想の肌).map(G=>v.jsx("span",{className:"rounded-full border px-3 py-1 text-xs",children:G},G))}):"—"}),O.理想メモ&&v.jsx("div",{className:"mt-2 text-xs text-gray-600",children:O.理想メモ})]}),v.jsxs("div",{children:[v.jsx("div",{className:"text-xs text-gray-500",children:"敏感情報"}),v.jsx("div",{className:"mt-1 whitespace-pre-wrap",children:O.敏感情報||"—"})]})]})}),v.jsx(Cr,{title:"メモ",children:v.jsx("textarea",{value:S?U.memo:O.メモ??"",onChange:G=>j(F=>({...F,memo:G.target.value})),readOnly:!S,rows:10,className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500 "+(S?"":"bg-gray-50"),placeholder:"接客時の気づき、肌状態、好み、注意点 など"})})]})]}),v.jsxs(Cr,{title:"来店記録・購入品",className:"mt-6",children:[v.jsx("div",{className:"flex items-center justify-between",children:v.jsxs("button",{onClick:lt,className:"inline-flex items-center gap-2 rounded-lg border px-4 py-2 text-sm font-semibold hover:bg-gray-50",children:[v.jsx("span",{children:"🔹"})," 登録"]})}),It&&v.jsx("div",{className:"text-sm text-gray-500",children:"読み込み中..."}),me&&v.jsx("div",{className:"text-sm text-red-500",children:me}),H&&v.jsxs("div",{className:"mt-4 grid grid-cols-1 md:grid-cols-[130px_1fr_1fr_auto] items-start gap-2 rounded-lg border bg-gray-50 p-3",children:[v.jsxs("div",{children:[v.jsx("label",{className:"block text-xs text-gray-600",children:"日付"}),v.jsx("input",{type:"text",value:J.date,onChange:G=>ut(F=>({...F,date:G.target.value})),className:"mt-1 w-full rounded-md border px-2 py-1",placeholder:"2025/10/16"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-xs text-gray-600",children:"担当者"}),v.jsxs("select",{value:J.staff_id,onChange:G=>ut(F=>({...F,staff_id:G.target.value})),className:"mt-1 w-full rounded-md border px-2 py-1 bg-white",children:[v.jsx("option",{value:"",children:d?"読み込み中...":"— 選択してください —"}),$.map(G=>v.jsx("option",{value:G.value,children:G.label},G.value))]}),p&&v.jsx("p",{className:"mt-1 text-xs text-red-500",children:p})]}),v.jsx("div",{children:v.jsx(gv,{value:J.items,onChange:G=>ut(F=>({...F,items:G})),optionsByCategory:K})}),v.jsxs("div",{className:"flex gap-2",children:[v.jsx("button",{onClick:ie,className:"rounded-md bg-blue-600 px-3 py-1.5 text-sm font-semibold text-white hover:bg-blue-700",children:"保存"}),v.jsx("button",{onClick:()=>X(!1),className:"rounded-md border px-3 py-1.5 text-sm hover:bg-gray-50",children:"キャンセル"})]})]}),v.jsxs("div",{className:"mt-4 space-y-2",children:[Tt.map(G=>v.jsx(DC,{v:G,isEditing:pt===G.id,draft:pt===G.id?k:G,onStartEdit:Lt,onChange:Z,onSave:ma,onCancel:Hi,onDelete:Ya,staffOptions:$,productOptions:K},G.id)),[...Array(3)].map((G,F)=>v.jsxs("div",{className:"grid grid-cols-[130px_1fr_1fr_auto] items-center gap-2 rounded-lg border px-3 py-3 text-gray-300",children:[v.jsx("div",{children:"— — —"}),v.jsx("div",{children:"— — —"}),v.jsx("div",{children:"— — —"}),v.jsx("div",{children:v.jsx("button",{disabled:!0,className:"rounded-md border px-3 py-1 text-sm opacity-40",children:"編集"})})]},`placeholder-${F}`))]})]})]})})}function Ul({children:a}){return localStorage.getItem("access_token")||localStorage.getItem("rb_token")?a:v.jsx(_c,{to:"/login",replace:!0})}function zC(){const a=localStorage.getItem("access_token")||localStorage.getItem("rb_token");return v.jsx(y1,{children:v.jsxs(QS,{children:[v.jsx(ra,{path:"/",element:a?v.jsx(_c,{to:"/home",replace:!0}):v.jsx(_c,{to:"/login",replace:!0})}),v.jsx(ra,{path:"/login",element:v.jsx(sC,{})}),v.jsx(ra,{path:"/home",element:v.jsx(Ul,{children:v.jsx(lC,{})})}),v.jsx(ra,{path:"/dashboard",element:v.jsx(Ul,{children:v.jsx(gC,{})})}),v.jsx(ra,{path:"/customers/new",element:v.jsx(Ul,{children:v.jsx(NC,{})})}),v.jsx(ra,{path:"/customers/search",element:v.jsx(Ul,{children:v.jsx(jC,{})})}),v.jsx(ra,{path:"/customers/:id",element:v.jsx(Ul,{children:v.jsx(OC,{})})})]})})}$b.createRoot(document.getElementById("root")).render(v.jsx(xg.StrictMode,{children:v.jsx(zC,{})}));
+Please change the parent <Route path="${_}"> to <Route path="${_==="/"?"*":`${_}/*`}">.`)}let S=fa(),N;if(i){let _=typeof i=="string"?ka(i):i;Bt(g==="/"||_.pathname?.startsWith(g),`When overriding the location using \`<Routes location>\` or \`useRoutes(routes, location)\`, the location pathname must begin with the portion of the URL pathname that was matched by all parent routes. The current pathname base is "${g}" but pathname "${_.pathname}" was given in the \`location\` prop.`),N=_}else N=S;let V=N.pathname||"/",B=V;if(g!=="/"){let _=g.replace(/^\//,"").split("/");B="/"+V.replace(/^\//,"").split("/").slice(_.length).join("/")}let U=bg(a,{pathname:B});Be(b||U!=null,`No routes matched location "${N.pathname}${N.search}${N.hash}" `),Be(U==null||U[U.length-1].route.element!==void 0||U[U.length-1].route.Component!==void 0||U[U.length-1].route.lazy!==void 0,`Matched leaf route at location "${N.pathname}${N.search}${N.hash}" does not have an element or Component. This means it will render an <Outlet /> with a null value by default resulting in an "empty" page.`);let j=BS(U&&U.map(_=>Object.assign({},_,{params:Object.assign({},p,_.params),pathname:wn([g,f.encodeLocation?f.encodeLocation(_.pathname.replace(/\?/g,"%3F").replace(/#/g,"%23")).pathname:_.pathname]),pathnameBase:_.pathnameBase==="/"?g:wn([g,f.encodeLocation?f.encodeLocation(_.pathnameBase.replace(/\?/g,"%3F").replace(/#/g,"%23")).pathname:_.pathnameBase])})),d,s,r,c);return i&&j?E.createElement(Fl.Provider,{value:{location:{pathname:"/",search:"",hash:"",state:null,key:"default",...N},navigationType:"POP"}},j):j}function OS(){let a=qS(),i=xS(a)?`${a.status} ${a.statusText}`:a instanceof Error?a.message:JSON.stringify(a),s=a instanceof Error?a.stack:null,r="rgba(200,200,200, 0.5)",c={padding:"0.5rem",backgroundColor:r},f={padding:"2px 4px",backgroundColor:r},d=null;return console.error("Error handled by React Router default ErrorBoundary:",a),d=E.createElement(E.Fragment,null,E.createElement("p",null,"💿 Hey developer 👋"),E.createElement("p",null,"You can provide a way better UX than this when your app throws errors by providing your own ",E.createElement("code",{style:f},"ErrorBoundary")," or"," ",E.createElement("code",{style:f},"errorElement")," prop on your route.")),E.createElement(E.Fragment,null,E.createElement("h2",null,"Unexpected Application Error!"),E.createElement("h3",{style:{fontStyle:"italic"}},i),s?E.createElement("pre",{style:c},s):null,d)}var zS=E.createElement(OS,null),_g=class extends E.Component{constructor(a){super(a),this.state={location:a.location,revalidation:a.revalidation,error:a.error}}static getDerivedStateFromError(a){return{error:a}}static getDerivedStateFromProps(a,i){return i.location!==a.location||i.revalidation!=="idle"&&a.revalidation==="idle"?{error:a.error,location:a.location,revalidation:a.revalidation}:{error:a.error!==void 0?a.error:i.error,location:i.location,revalidation:a.revalidation||i.revalidation}}componentDidCatch(a,i){this.props.onError?this.props.onError(a,i):console.error("React Router caught the following error during render",a)}render(){let a=this.state.error;if(this.context&&typeof a=="object"&&a&&"digest"in a&&typeof a.digest=="string"){const s=DS(a.digest);s&&(a=s)}let i=a!==void 0?E.createElement(ln.Provider,{value:this.props.routeContext},E.createElement(lf.Provider,{value:a,children:this.props.component})):this.props.children;return this.context?E.createElement(VS,{error:a},i):i}};_g.contextType=TS;var fc=new WeakMap;function VS({children:a,error:i}){let{basename:s}=E.useContext(Le);if(typeof i=="object"&&i&&"digest"in i&&typeof i.digest=="string"){let r=jS(i.digest);if(r){let c=fc.get(i);if(c)throw c;let f=Cg(r.location,s);if(Ag&&!fc.get(i))if(f.isExternal||r.reloadDocument)window.location.href=f.absoluteURL||f.to;else{const d=Promise.resolve().then(()=>window.__reactRouterDataRouter.navigate(f.to,{replace:r.replace}));throw fc.set(i,d),d}return E.createElement("meta",{httpEquiv:"refresh",content:`0;url=${f.absoluteURL||f.to}`})}}return a}function US({routeContext:a,match:i,children:s}){let r=E.useContext(zi);return r&&r.static&&r.staticContext&&(i.route.errorElement||i.route.ErrorBoundary)&&(r.staticContext._deepestRenderedBoundaryId=i.route.id),E.createElement(ln.Provider,{value:a},s)}function BS(a,i=[],s=null,r=null,c=null){if(a==null){if(!s)return null;if(s.errors)a=s.matches;else if(i.length===0&&!s.initialized&&s.matches.length>0)a=s.matches;else return null}let f=a,d=s?.errors;if(d!=null){let g=f.findIndex(b=>b.route.id&&d?.[b.route.id]!==void 0);Bt(g>=0,`Could not find a matching route for errors on route IDs: ${Object.keys(d).join(",")}`),f=f.slice(0,Math.min(f.length,g+1))}let m=!1,p=-1;if(s)for(let g=0;g<f.length;g++){let b=f[g];if((b.route.HydrateFallback||b.route.hydrateFallbackElement)&&(p=g),b.route.id){let{loaderData:S,errors:N}=s,V=b.route.loader&&!S.hasOwnProperty(b.route.id)&&(!N||N[b.route.id]===void 0);if(b.route.lazy||V){m=!0,p>=0?f=f.slice(0,p+1):f=[f[0]];break}}}let y=s&&r?(g,b)=>{r(g,{location:s.location,params:s.matches?.[0]?.params??{},unstable_pattern:bS(s.matches),errorInfo:b})}:void 0;return f.reduceRight((g,b,S)=>{let N,V=!1,B=null,U=null;s&&(N=d&&b.route.id?d[b.route.id]:void 0,B=b.route.errorElement||zS,m&&(p<0&&S===0?(Og("route-fallback",!1,"No `HydrateFallback` element provided to render during initial hydration"),V=!0,U=null):p===S&&(V=!0,U=b.route.hydrateFallbackElement||null)));let j=i.concat(f.slice(0,S+1)),_=()=>{let O;return N?O=B:V?O=U:b.route.Component?O=E.createElement(b.route.Component,null):b.route.element?O=b.route.element:O=g,E.createElement(US,{match:b,routeContext:{outlet:g,matches:j,isDataRoute:s!=null},children:O})};return s&&(b.route.ErrorBoundary||b.route.errorElement||S===0)?E.createElement(_g,{location:s.location,revalidation:s.revalidation,component:B,error:N,children:_(),routeContext:{outlet:null,matches:j,isDataRoute:!0},onError:y}):_()},null)}function sf(a){return`${a} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function LS(a){let i=E.useContext(zi);return Bt(i,sf(a)),i}function HS(a){let i=E.useContext(Hr);return Bt(i,sf(a)),i}function kS(a){let i=E.useContext(ln);return Bt(i,sf(a)),i}function rf(a){let i=kS(a),s=i.matches[i.matches.length-1];return Bt(s.route.id,`${a} can only be used on routes that contain a unique "id"`),s.route.id}function YS(){return rf("useRouteId")}function qS(){let a=E.useContext(lf),i=HS("useRouteError"),s=rf("useRouteError");return a!==void 0?a:i.errors?.[s]}function GS(){let{router:a}=LS("useNavigate"),i=rf("useNavigate"),s=E.useRef(!1);return wg(()=>{s.current=!0}),E.useCallback(async(c,f={})=>{Be(s.current,Mg),s.current&&(typeof c=="number"?await a.navigate(c):await a.navigate(c,{fromRouteId:i,...f}))},[a,i])}var ny={};function Og(a,i,s){!i&&!ny[a]&&(ny[a]=!0,Be(!1,s))}E.memo(XS);function XS({routes:a,future:i,state:s,onError:r}){return Rg(a,void 0,s,r,i)}function _c({to:a,replace:i,state:s,relative:r}){Bt(Vi(),"<Navigate> may be used only in the context of a <Router> component.");let{static:c}=E.useContext(Le);Be(!c,"<Navigate> must not be used on the initial render in a <StaticRouter>. This is a no-op, but you should modify your code so the <Navigate> is only ever rendered in response to some user interaction or state change.");let{matches:f}=E.useContext(ln),{pathname:d}=fa(),m=da(),p=af(a,nf(f),d,r==="path"),y=JSON.stringify(p);return E.useEffect(()=>{m(JSON.parse(y),{replace:i,state:s,relative:r})},[m,y,r,i,s]),null}function ra(a){Bt(!1,"A <Route> is only ever to be used as the child of <Routes> element, never rendered directly. Please wrap your <Route> in a <Routes>.")}function KS({basename:a="/",children:i=null,location:s,navigationType:r="POP",navigator:c,static:f=!1,unstable_useTransitions:d}){Bt(!Vi(),"You cannot render a <Router> inside another <Router>. You should never have more than one in your app.");let m=a.replace(/^\/*/,"/"),p=E.useMemo(()=>({basename:m,navigator:c,static:f,unstable_useTransitions:d,future:{}}),[m,c,f,d]);typeof s=="string"&&(s=ka(s));let{pathname:y="/",search:g="",hash:b="",state:S=null,key:N="default"}=s,V=E.useMemo(()=>{let B=Rn(y,m);return B==null?null:{location:{pathname:B,search:g,hash:b,state:S,key:N},navigationType:r}},[m,y,g,b,S,N,r]);return Be(V!=null,`<Router basename="${m}"> is not able to match the URL "${y}${g}${b}" because it does not start with the basename, so the <Router> won't render anything.`),V==null?null:E.createElement(Le.Provider,{value:p},E.createElement(Fl.Provider,{children:i,value:V}))}function QS({children:a,location:i}){return _S(Oc(a),i)}function Oc(a,i=[]){let s=[];return E.Children.forEach(a,(r,c)=>{if(!E.isValidElement(r))return;let f=[...i,c];if(r.type===E.Fragment){s.push.apply(s,Oc(r.props.children,f));return}Bt(r.type===ra,`[${typeof r.type=="string"?r.type:r.type.name}] is not a <Route> component. All component children of <Routes> must be a <Route> or <React.Fragment>`),Bt(!r.props.index||!r.props.children,"An index route cannot have child routes.");let d={id:r.props.id||f.join("-"),caseSensitive:r.props.caseSensitive,element:r.props.element,Component:r.props.Component,index:r.props.index,path:r.props.path,middleware:r.props.middleware,loader:r.props.loader,action:r.props.action,hydrateFallbackElement:r.props.hydrateFallbackElement,HydrateFallback:r.props.HydrateFallback,errorElement:r.props.errorElement,ErrorBoundary:r.props.ErrorBoundary,hasErrorBoundary:r.props.hasErrorBoundary===!0||r.props.ErrorBoundary!=null||r.props.errorElement!=null,shouldRevalidate:r.props.shouldRevalidate,handle:r.props.handle,lazy:r.props.lazy};r.props.children&&(d.children=Oc(r.props.children,f)),s.push(d)}),s}var jr="get",Dr="application/x-www-form-urlencoded";function kr(a){return typeof HTMLElement<"u"&&a instanceof HTMLElement}function ZS(a){return kr(a)&&a.tagName.toLowerCase()==="button"}function $S(a){return kr(a)&&a.tagName.toLowerCase()==="form"}function JS(a){return kr(a)&&a.tagName.toLowerCase()==="input"}function PS(a){return!!(a.metaKey||a.altKey||a.ctrlKey||a.shiftKey)}function FS(a,i){return a.button===0&&(!i||i==="_self")&&!PS(a)}var Sr=null;function WS(){if(Sr===null)try{new FormData(document.createElement("form"),0),Sr=!1}catch{Sr=!0}return Sr}var IS=new Set(["application/x-www-form-urlencoded","multipart/form-data","text/plain"]);function dc(a){return a!=null&&!IS.has(a)?(Be(!1,`"${a}" is not a valid \`encType\` for \`<Form>\`/\`<fetcher.Form>\` and will default to "${Dr}"`),null):a}function t1(a,i){let s,r,c,f,d;if($S(a)){let m=a.getAttribute("action");r=m?Rn(m,i):null,s=a.getAttribute("method")||jr,c=dc(a.getAttribute("enctype"))||Dr,f=new FormData(a)}else if(ZS(a)||JS(a)&&(a.type==="submit"||a.type==="image")){let m=a.form;if(m==null)throw new Error('Cannot submit a <button> or <input type="submit"> without a <form>');let p=a.getAttribute("formaction")||m.getAttribute("action");if(r=p?Rn(p,i):null,s=a.getAttribute("formmethod")||m.getAttribute("method")||jr,c=dc(a.getAttribute("formenctype"))||dc(m.getAttribute("enctype"))||Dr,f=new FormData(m,a),!WS()){let{name:y,type:g,value:b}=a;if(g==="image"){let S=y?`${y}.`:"";f.append(`${S}x`,"0"),f.append(`${S}y`,"0")}else y&&f.append(y,b)}}else{if(kr(a))throw new Error('Cannot submit element that is not <form>, <button>, or <input type="submit|image">');s=jr,r=null,c=Dr,d=a}return f&&c==="text/plain"&&(d=f,f=void 0),{action:r,method:s.toLowerCase(),encType:c,formData:f,body:d}}Object.getOwnPropertyNames(Object.prototype).sort().join("\0");function of(a,i){if(a===!1||a===null||typeof a>"u")throw new Error(i)}function e1(a,i,s,r){let c=typeof a=="string"?new URL(a,typeof window>"u"?"server://singlefetch/":window.location.origin):a;return s?c.pathname.endsWith("/")?c.pathname=`${c.pathname}_.${r}`:c.pathname=`${c.pathname}.${r}`:c.pathname==="/"?c.pathname=`_root.${r}`:i&&Rn(c.pathname,i)==="/"?c.pathname=`${i.replace(/\/$/,"")}/_root.${r}`:c.pathname=`${c.pathname.replace(/\/$/,"")}.${r}`,c}async function n1(a,i){if(a.id in i)return i[a.id];try{let s=await import(a.module);return i[a.id]=s,s}catch(s){return console.error(`Error loading route module \`${a.module}\`, reloading page...`),console.error(s),window.__reactRouterContext&&window.__reactRouterContext.isSpaMode,window.location.reload(),new Promise(()=>{})}}function a1(a){return a==null?!1:a.href==null?a.rel==="preload"&&typeof a.imageSrcSet=="string"&&typeof a.imageSizes=="string":typeof a.rel=="string"&&typeof a.href=="string"}async function i1(a,i,s){let r=await Promise.all(a.map(async c=>{let f=i.routes[c.route.id];if(f){let d=await n1(f,s);return d.links?d.links():[]}return[]}));return o1(r.flat(1).filter(a1).filter(c=>c.rel==="stylesheet"||c.rel==="preload").map(c=>c.rel==="stylesheet"?{...c,rel:"prefetch",as:"style"}:{...c,rel:"prefetch"}))}function ay(a,i,s,r,c,f){let d=(p,y)=>s[y]?p.route.id!==s[y].route.id:!0,m=(p,y)=>s[y].pathname!==p.pathname||s[y].route.path?.endsWith("*")&&s[y].params["*"]!==p.params["*"];return f==="assets"?i.filter((p,y)=>d(p,y)||m(p,y)):f==="data"?i.filter((p,y)=>{let g=r.routes[p.route.id];if(!g||!g.hasLoader)return!1;if(d(p,y)||m(p,y))return!0;if(p.route.shouldRevalidate){let b=p.route.shouldRevalidate({currentUrl:new URL(c.pathname+c.search+c.hash,window.origin),currentParams:s[0]?.params||{},nextUrl:new URL(a,window.origin),nextParams:p.params,defaultShouldRevalidate:!0});if(typeof b=="boolean")return b}return!0}):[]}function l1(a,i,{includeHydrateFallback:s}={}){return s1(a.map(r=>{let c=i.routes[r.route.id];if(!c)return[];let f=[c.module];return c.clientActionModule&&(f=f.concat(c.clientActionModule)),c.clientLoaderModule&&(f=f.concat(c.clientLoaderModule)),s&&c.hydrateFallbackModule&&(f=f.concat(c.hydrateFallbackModule)),c.imports&&(f=f.concat(c.imports)),f}).flat(1))}function s1(a){return[...new Set(a)]}function r1(a){let i={},s=Object.keys(a).sort();for(let r of s)i[r]=a[r];return i}function o1(a,i){let s=new Set;return new Set(i),a.reduce((r,c)=>{let f=JSON.stringify(r1(c));return s.has(f)||(s.add(f),r.push({key:f,link:c})),r},[])}function zg(){let a=E.useContext(zi);return of(a,"You must render this element inside a <DataRouterContext.Provider> element"),a}function u1(){let a=E.useContext(Hr);return of(a,"You must render this element inside a <DataRouterStateContext.Provider> element"),a}var uf=E.createContext(void 0);uf.displayName="FrameworkContext";function Vg(){let a=E.useContext(uf);return of(a,"You must render this element inside a <HydratedRouter> element"),a}function c1(a,i){let s=E.useContext(uf),[r,c]=E.useState(!1),[f,d]=E.useState(!1),{onFocus:m,onBlur:p,onMouseEnter:y,onMouseLeave:g,onTouchStart:b}=i,S=E.useRef(null);E.useEffect(()=>{if(a==="render"&&d(!0),a==="viewport"){let B=j=>{j.forEach(_=>{d(_.isIntersecting)})},U=new IntersectionObserver(B,{threshold:.5});return S.current&&U.observe(S.current),()=>{U.disconnect()}}},[a]),E.useEffect(()=>{if(r){let B=setTimeout(()=>{d(!0)},100);return()=>{clearTimeout(B)}}},[r]);let N=()=>{c(!0)},V=()=>{c(!1),d(!1)};return s?a!=="intent"?[f,S,{}]:[f,S,{onFocus:zl(m,N),onBlur:zl(p,V),onMouseEnter:zl(y,N),onMouseLeave:zl(g,V),onTouchStart:zl(b,N)}]:[!1,S,{}]}function zl(a,i){return s=>{a&&a(s),s.defaultPrevented||i(s)}}function f1({page:a,...i}){let{router:s}=zg(),r=E.useMemo(()=>bg(s.routes,a,s.basename),[s.routes,a,s.basename]);return r?E.createElement(h1,{page:a,matches:r,...i}):null}function d1(a){let{manifest:i,routeModules:s}=Vg(),[r,c]=E.useState([]);return E.useEffect(()=>{let f=!1;return i1(a,i,s).then(d=>{f||c(d)}),()=>{f=!0}},[a,i,s]),r}function h1({page:a,matches:i,...s}){let r=fa(),{future:c,manifest:f,routeModules:d}=Vg(),{basename:m}=zg(),{loaderData:p,matches:y}=u1(),g=E.useMemo(()=>ay(a,i,y,f,r,"data"),[a,i,y,f,r]),b=E.useMemo(()=>ay(a,i,y,f,r,"assets"),[a,i,y,f,r]),S=E.useMemo(()=>{if(a===r.pathname+r.search+r.hash)return[];let B=new Set,U=!1;if(i.forEach(_=>{let O=f.routes[_.route.id];!O||!O.hasLoader||(!g.some($=>$.route.id===_.route.id)&&_.route.id in p&&d[_.route.id]?.shouldRevalidate||O.hasClientLoader?U=!0:B.add(_.route.id))}),B.size===0)return[];let j=e1(a,m,c.unstable_trailingSlashAwareDataRequests,"data");return U&&B.size>0&&j.searchParams.set("_routes",i.filter(_=>B.has(_.route.id)).map(_=>_.route.id).join(",")),[j.pathname+j.search]},[m,c.unstable_trailingSlashAwareDataRequests,p,r,f,g,i,a,d]),N=E.useMemo(()=>l1(b,f),[b,f]),V=d1(b);return E.createElement(E.Fragment,null,S.map(B=>E.createElement("link",{key:B,rel:"prefetch",as:"fetch",href:B,...s})),N.map(B=>E.createElement("link",{key:B,rel:"modulepreload",href:B,...s})),V.map(({key:B,link:U})=>E.createElement("link",{key:B,nonce:s.nonce,...U})))}function m1(...a){return i=>{a.forEach(s=>{typeof s=="function"?s(i):s!=null&&(s.current=i)})}}var p1=typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u";try{p1&&(window.__reactRouterVersion="7.12.0")}catch{}function y1({basename:a,children:i,unstable_useTransitions:s,window:r}){let c=E.useRef();c.current==null&&(c.current=Jb({window:r,v5Compat:!0}));let f=c.current,[d,m]=E.useState({action:f.action,location:f.location}),p=E.useCallback(y=>{s===!1?m(y):E.startTransition(()=>m(y))},[s]);return E.useLayoutEffect(()=>f.listen(p),[f,p]),E.createElement(KS,{basename:a,children:i,location:d.location,navigationType:d.action,navigator:f,unstable_useTransitions:s})}var Ug=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,cf=E.forwardRef(function({onClick:i,discover:s="render",prefetch:r="none",relative:c,reloadDocument:f,replace:d,state:m,target:p,to:y,preventScrollReset:g,viewTransition:b,unstable_defaultShouldRevalidate:S,...N},V){let{basename:B,unstable_useTransitions:U}=E.useContext(Le),j=typeof y=="string"&&Ug.test(y),_=Cg(y,B);y=_.to;let O=MS(y,{relative:c}),[$,K,tt]=c1(r,N),Q=x1(y,{replace:d,state:m,target:p,preventScrollReset:g,relative:c,viewTransition:b,unstable_defaultShouldRevalidate:S,unstable_useTransitions:U});function P(Tt){i&&i(Tt),Tt.defaultPrevented||Q(Tt)}let ht=E.createElement("a",{...N,...tt,href:_.absoluteURL||O,onClick:_.isExternal||f?i:P,ref:m1(V,K),target:p,"data-discover":!j&&s==="render"?"true":void 0});return $&&!j?E.createElement(E.Fragment,null,ht,E.createElement(f1,{page:O})):ht});cf.displayName="Link";var Bg=E.forwardRef(function({"aria-current":i="page",caseSensitive:s=!1,className:r="",end:c=!1,style:f,to:d,viewTransition:m,children:p,...y},g){let b=Wl(d,{relative:y.relative}),S=fa(),N=E.useContext(Hr),{navigator:V,basename:B}=E.useContext(Le),U=N!=null&&A1(b)&&m===!0,j=V.encodeLocation?V.encodeLocation(b).pathname:b.pathname,_=S.pathname,O=N&&N.navigation&&N.navigation.location?N.navigation.location.pathname:null;s||(_=_.toLowerCase(),O=O?O.toLowerCase():null,j=j.toLowerCase()),O&&B&&(O=Rn(O,B)||O);const $=j!=="/"&&j.endsWith("/")?j.length-1:j.length;let K=_===j||!c&&_.startsWith(j)&&_.charAt($)==="/",tt=O!=null&&(O===j||!c&&O.startsWith(j)&&O.charAt(j.length)==="/"),Q={isActive:K,isPending:tt,isTransitioning:U},P=K?i:void 0,ht;typeof r=="function"?ht=r(Q):ht=[r,K?"active":null,tt?"pending":null,U?"transitioning":null].filter(Boolean).join(" ");let Tt=typeof f=="function"?f(Q):f;return E.createElement(cf,{...y,"aria-current":P,className:ht,ref:g,style:Tt,to:d,viewTransition:m},typeof p=="function"?p(Q):p)});Bg.displayName="NavLink";var g1=E.forwardRef(({discover:a="render",fetcherKey:i,navigate:s,reloadDocument:r,replace:c,state:f,method:d=jr,action:m,onSubmit:p,relative:y,preventScrollReset:g,viewTransition:b,unstable_defaultShouldRevalidate:S,...N},V)=>{let{unstable_useTransitions:B}=E.useContext(Le),U=T1(),j=E1(m,{relative:y}),_=d.toLowerCase()==="get"?"get":"post",O=typeof m=="string"&&Ug.test(m),$=K=>{if(p&&p(K),K.defaultPrevented)return;K.preventDefault();let tt=K.nativeEvent.submitter,Q=tt?.getAttribute("formmethod")||d,P=()=>U(tt||K.currentTarget,{fetcherKey:i,method:Q,navigate:s,replace:c,state:f,relative:y,preventScrollReset:g,viewTransition:b,unstable_defaultShouldRevalidate:S});B&&s!==!1?E.startTransition(()=>P()):P()};return E.createElement("form",{ref:V,method:_,action:j,onSubmit:r?p:$,...N,"data-discover":!O&&a==="render"?"true":void 0})});g1.displayName="Form";function v1(a){return`${a} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function Lg(a){let i=E.useContext(zi);return Bt(i,v1(a)),i}function x1(a,{target:i,replace:s,state:r,preventScrollReset:c,relative:f,viewTransition:d,unstable_defaultShouldRevalidate:m,unstable_useTransitions:p}={}){let y=da(),g=fa(),b=Wl(a,{relative:f});return E.useCallback(S=>{if(FS(S,i)){S.preventDefault();let N=s!==void 0?s:Xl(g)===Xl(b),V=()=>y(a,{replace:N,state:r,preventScrollReset:c,relative:f,viewTransition:d,unstable_defaultShouldRevalidate:m});p?E.startTransition(()=>V()):V()}},[g,y,b,s,r,i,a,c,f,d,m,p])}var b1=0,S1=()=>`__${String(++b1)}__`;function T1(){let{router:a}=Lg("useSubmit"),{basename:i}=E.useContext(Le),s=YS(),r=a.fetch,c=a.navigate;return E.useCallback(async(f,d={})=>{let{action:m,method:p,encType:y,formData:g,body:b}=t1(f,i);if(d.navigate===!1){let S=d.fetcherKey||S1();await r(S,s,d.action||m,{unstable_defaultShouldRevalidate:d.unstable_defaultShouldRevalidate,preventScrollReset:d.preventScrollReset,formData:g,body:b,formMethod:d.method||p,formEncType:d.encType||y,flushSync:d.flushSync})}else await c(d.action||m,{unstable_defaultShouldRevalidate:d.unstable_defaultShouldRevalidate,preventScrollReset:d.preventScrollReset,formData:g,body:b,formMethod:d.method||p,formEncType:d.encType||y,replace:d.replace,state:d.state,fromRouteId:s,flushSync:d.flushSync,viewTransition:d.viewTransition})},[r,c,i,s])}function E1(a,{relative:i}={}){let{basename:s}=E.useContext(Le),r=E.useContext(ln);Bt(r,"useFormAction must be used inside a RouteContext");let[c]=r.matches.slice(-1),f={...Wl(a||".",{relative:i})},d=fa();if(a==null){f.search=d.search;let m=new URLSearchParams(f.search),p=m.getAll("index");if(p.some(g=>g==="")){m.delete("index"),p.filter(b=>b).forEach(b=>m.append("index",b));let g=m.toString();f.search=g?`?${g}`:""}}return(!a||a===".")&&c.route.index&&(f.search=f.search?f.search.replace(/^\?/,"?index&"):"?index"),s!=="/"&&(f.pathname=f.pathname==="/"?s:wn([s,f.pathname])),Xl(f)}function A1(a,{relative:i}={}){let s=E.useContext(jg);Bt(s!=null,"`useViewTransitionState` must be used within `react-router-dom`'s `RouterProvider`.  Did you accidentally import `RouterProvider` from `react-router`?");let{basename:r}=Lg("useViewTransitionState"),c=Wl(a,{relative:i});if(!s.isTransitioning)return!1;let f=Rn(s.currentLocation.pathname,r)||s.currentLocation.pathname,d=Rn(s.nextLocation.pathname,r)||s.nextLocation.pathname;return Or(c.pathname,d)!=null||Or(c.pathname,f)!=null}const Hg=E.createContext({});function C1(a){const i=E.useRef(null);return i.current===null&&(i.current=a()),i.current}const ff=typeof window<"u",N1=ff?E.useLayoutEffect:E.useEffect,df=E.createContext(null);function hf(a,i){a.indexOf(i)===-1&&a.push(i)}function mf(a,i){const s=a.indexOf(i);s>-1&&a.splice(s,1)}const _n=(a,i,s)=>s>i?i:s<a?a:s;let pf=()=>{};const On={},kg=a=>/^-?(?:\d+(?:\.\d+)?|\.\d+)$/u.test(a);function Yg(a){return typeof a=="object"&&a!==null}const qg=a=>/^0[^.\s]+$/u.test(a);function yf(a){let i;return()=>(i===void 0&&(i=a()),i)}const We=a=>a,j1=(a,i)=>s=>i(a(s)),Il=(...a)=>a.reduce(j1),Kl=(a,i,s)=>{const r=i-a;return r===0?1:(s-a)/r};class gf{constructor(){this.subscriptions=[]}add(i){return hf(this.subscriptions,i),()=>mf(this.subscriptions,i)}notify(i,s,r){const c=this.subscriptions.length;if(c)if(c===1)this.subscriptions[0](i,s,r);else for(let f=0;f<c;f++){const d=this.subscriptions[f];d&&d(i,s,r)}}getSize(){return this.subscriptions.length}clear(){this.subscriptions.length=0}}const cn=a=>a*1e3,Fe=a=>a/1e3;function Gg(a,i){return i?a*(1e3/i):0}const Xg=(a,i,s)=>(((1-3*s+3*i)*a+(3*s-6*i))*a+3*i)*a,D1=1e-7,M1=12;function w1(a,i,s,r,c){let f,d,m=0;do d=i+(s-i)/2,f=Xg(d,r,c)-a,f>0?s=d:i=d;while(Math.abs(f)>D1&&++m<M1);return d}function ts(a,i,s,r){if(a===i&&s===r)return We;const c=f=>w1(f,0,1,a,s);return f=>f===0||f===1?f:Xg(c(f),i,r)}const Kg=a=>i=>i<=.5?a(2*i)/2:(2-a(2*(1-i)))/2,Qg=a=>i=>1-a(1-i),Zg=ts(.33,1.53,.69,.99),vf=Qg(Zg),$g=Kg(vf),Jg=a=>(a*=2)<1?.5*vf(a):.5*(2-Math.pow(2,-10*(a-1))),xf=a=>1-Math.sin(Math.acos(a)),Pg=Qg(xf),Fg=Kg(xf),R1=ts(.42,0,1,1),_1=ts(0,0,.58,1),Wg=ts(.42,0,.58,1),O1=a=>Array.isArray(a)&&typeof a[0]!="number",Ig=a=>Array.isArray(a)&&typeof a[0]=="number",z1={linear:We,easeIn:R1,easeInOut:Wg,easeOut:_1,circIn:xf,circInOut:Fg,circOut:Pg,backIn:vf,backInOut:$g,backOut:Zg,anticipate:Jg},V1=a=>typeof a=="string",iy=a=>{if(Ig(a)){pf(a.length===4);const[i,s,r,c]=a;return ts(i,s,r,c)}else if(V1(a))return z1[a];return a},Tr=["setup","read","resolveKeyframes","preUpdate","update","preRender","render","postRender"];function U1(a,i){let s=new Set,r=new Set,c=!1,f=!1;const d=new WeakSet;let m={delta:0,timestamp:0,isProcessing:!1};function p(g){d.has(g)&&(y.schedule(g),a()),g(m)}const y={schedule:(g,b=!1,S=!1)=>{const V=S&&c?s:r;return b&&d.add(g),V.has(g)||V.add(g),g},cancel:g=>{r.delete(g),d.delete(g)},process:g=>{if(m=g,c){f=!0;return}c=!0,[s,r]=[r,s],s.forEach(p),s.clear(),c=!1,f&&(f=!1,y.process(g))}};return y}const B1=40;function t0(a,i){let s=!1,r=!0;const c={delta:0,timestamp:0,isProcessing:!1},f=()=>s=!0,d=Tr.reduce((O,$)=>(O[$]=U1(f),O),{}),{setup:m,read:p,resolveKeyframes:y,preUpdate:g,update:b,preRender:S,render:N,postRender:V}=d,B=()=>{const O=On.useManualTiming?c.timestamp:performance.now();s=!1,On.useManualTiming||(c.delta=r?1e3/60:Math.max(Math.min(O-c.timestamp,B1),1)),c.timestamp=O,c.isProcessing=!0,m.process(c),p.process(c),y.process(c),g.process(c),b.process(c),S.process(c),N.process(c),V.process(c),c.isProcessing=!1,s&&i&&(r=!1,a(B))},U=()=>{s=!0,r=!0,c.isProcessing||a(B)};return{schedule:Tr.reduce((O,$)=>{const K=d[$];return O[$]=(tt,Q=!1,P=!1)=>(s||U(),K.schedule(tt,Q,P)),O},{}),cancel:O=>{for(let $=0;$<Tr.length;$++)d[Tr[$]].cancel(O)},state:c,steps:d}}const{schedule:Ut,cancel:ua,state:ce,steps:hc}=t0(typeof requestAnimationFrame<"u"?requestAnimationFrame:We,!0);let Mr;function L1(){Mr=void 0}const Ce={now:()=>(Mr===void 0&&Ce.set(ce.isProcessing||On.useManualTiming?ce.timestamp:performance.now()),Mr),set:a=>{Mr=a,queueMicrotask(L1)}},e0=a=>i=>typeof i=="string"&&i.startsWith(a),bf=e0("--"),H1=e0("var(--"),Sf=a=>H1(a)?k1.test(a.split("/*")[0].trim()):!1,k1=/var\(--(?:[\w-]+\s*|[\w-]+\s*,(?:\s*[^)(\s]|\s*\((?:[^)(]|\([^)(]*\))*\))+\s*)\)$/iu,Ui={test:a=>typeof a=="number",parse:parseFloat,transform:a=>a},Ql={...Ui,transform:a=>_n(0,1,a)},Er={...Ui,default:1},Hl=a=>Math.round(a*1e5)/1e5,Tf=/-?(?:\d+(?:\.\d+)?|\.\d+)/gu;function Y1(a){return a==null}const q1=/^(?:#[\da-f]{3,8}|(?:rgb|hsl)a?\((?:-?[\d.]+%?[,\s]+){2}-?[\d.]+%?\s*(?:[,/]\s*)?(?:\b\d+(?:\.\d+)?|\.\d+)?%?\))$/iu,Ef=(a,i)=>s=>!!(typeof s=="string"&&q1.test(s)&&s.startsWith(a)||i&&!Y1(s)&&Object.prototype.hasOwnProperty.call(s,i)),n0=(a,i,s)=>r=>{if(typeof r!="string")return r;const[c,f,d,m]=r.match(Tf);return{[a]:parseFloat(c),[i]:parseFloat(f),[s]:parseFloat(d),alpha:m!==void 0?parseFloat(m):1}},G1=a=>_n(0,255,a),mc={...Ui,transform:a=>Math.round(G1(a))},Ua={test:Ef("rgb","red"),parse:n0("red","green","blue"),transform:({red:a,green:i,blue:s,alpha:r=1})=>"rgba("+mc.transform(a)+", "+mc.transform(i)+", "+mc.transform(s)+", "+Hl(Ql.transform(r))+")"};function X1(a){let i="",s="",r="",c="";return a.length>5?(i=a.substring(1,3),s=a.substring(3,5),r=a.substring(5,7),c=a.substring(7,9)):(i=a.substring(1,2),s=a.substring(2,3),r=a.substring(3,4),c=a.substring(4,5),i+=i,s+=s,r+=r,c+=c),{red:parseInt(i,16),green:parseInt(s,16),blue:parseInt(r,16),alpha:c?parseInt(c,16)/255:1}}const zc={test:Ef("#"),parse:X1,transform:Ua.transform},es=a=>({test:i=>typeof i=="string"&&i.endsWith(a)&&i.split(" ").length===1,parse:parseFloat,transform:i=>`${i}${a}`}),oa=es("deg"),fn=es("%"),it=es("px"),K1=es("vh"),Q1=es("vw"),ly={...fn,parse:a=>fn.parse(a)/100,transform:a=>fn.transform(a*100)},Ni={test:Ef("hsl","hue"),parse:n0("hue","saturation","lightness"),transform:({hue:a,saturation:i,lightness:s,alpha:r=1})=>"hsla("+Math.round(a)+", "+fn.transform(Hl(i))+", "+fn.transform(Hl(s))+", "+Hl(Ql.transform(r))+")"},Wt={test:a=>Ua.test(a)||zc.test(a)||Ni.test(a),parse:a=>Ua.test(a)?Ua.parse(a):Ni.test(a)?Ni.parse(a):zc.parse(a),transform:a=>typeof a=="string"?a:a.hasOwnProperty("red")?Ua.transform(a):Ni.transform(a),getAnimatableNone:a=>{const i=Wt.parse(a);return i.alpha=0,Wt.transform(i)}},Z1=/(?:#[\da-f]{3,8}|(?:rgb|hsl)a?\((?:-?[\d.]+%?[,\s]+){2}-?[\d.]+%?\s*(?:[,/]\s*)?(?:\b\d+(?:\.\d+)?|\.\d+)?%?\))/giu;function $1(a){return isNaN(a)&&typeof a=="string"&&(a.match(Tf)?.length||0)+(a.match(Z1)?.length||0)>0}const a0="number",i0="color",J1="var",P1="var(",sy="${}",F1=/var\s*\(\s*--(?:[\w-]+\s*|[\w-]+\s*,(?:\s*[^)(\s]|\s*\((?:[^)(]|\([^)(]*\))*\))+\s*)\)|#[\da-f]{3,8}|(?:rgb|hsl)a?\((?:-?[\d.]+%?[,\s]+){2}-?[\d.]+%?\s*(?:[,/]\s*)?(?:\b\d+(?:\.\d+)?|\.\d+)?%?\)|-?(?:\d+(?:\.\d+)?|\.\d+)/giu;function Zl(a){const i=a.toString(),s=[],r={color:[],number:[],var:[]},c=[];let f=0;const m=i.replace(F1,p=>(Wt.test(p)?(r.color.push(f),c.push(i0),s.push(Wt.parse(p))):p.startsWith(P1)?(r.var.push(f),c.push(J1),s.push(p)):(r.number.push(f),c.push(a0),s.push(parseFloat(p))),++f,sy)).split(sy);return{values:s,split:m,indexes:r,types:c}}function l0(a){return Zl(a).values}function s0(a){const{split:i,types:s}=Zl(a),r=i.length;return c=>{let f="";for(let d=0;d<r;d++)if(f+=i[d],c[d]!==void 0){const m=s[d];m===a0?f+=Hl(c[d]):m===i0?f+=Wt.transform(c[d]):f+=c[d]}return f}}const W1=a=>typeof a=="number"?0:Wt.test(a)?Wt.getAnimatableNone(a):a;function I1(a){const i=l0(a);return s0(a)(i.map(W1))}const ca={test:$1,parse:l0,createTransformer:s0,getAnimatableNone:I1};function pc(a,i,s){return s<0&&(s+=1),s>1&&(s-=1),s<1/6?a+(i-a)*6*s:s<1/2?i:s<2/3?a+(i-a)*(2/3-s)*6:a}function tT({hue:a,saturation:i,lightness:s,alpha:r}){a/=360,i/=100,s/=100;let c=0,f=0,d=0;if(!i)c=f=d=s;else{const m=s<.5?s*(1+i):s+i-s*i,p=2*s-m;c=pc(p,m,a+1/3),f=pc(p,m,a),d=pc(p,m,a-1/3)}return{red:Math.round(c*255),green:Math.round(f*255),blue:Math.round(d*255),alpha:r}}function zr(a,i){return s=>s>0?i:a}const Ht=(a,i,s)=>a+(i-a)*s,yc=(a,i,s)=>{const r=a*a,c=s*(i*i-r)+r;return c<0?0:Math.sqrt(c)},eT=[zc,Ua,Ni],nT=a=>eT.find(i=>i.test(a));function ry(a){const i=nT(a);if(!i)return!1;let s=i.parse(a);return i===Ni&&(s=tT(s)),s}const oy=(a,i)=>{const s=ry(a),r=ry(i);if(!s||!r)return zr(a,i);const c={...s};return f=>(c.red=yc(s.red,r.red,f),c.green=yc(s.green,r.green,f),c.blue=yc(s.blue,r.blue,f),c.alpha=Ht(s.alpha,r.alpha,f),Ua.transform(c))},Vc=new Set(["none","hidden"]);function aT(a,i){return Vc.has(a)?s=>s<=0?a:i:s=>s>=1?i:a}function iT(a,i){return s=>Ht(a,i,s)}function Af(a){return typeof a=="number"?iT:typeof a=="string"?Sf(a)?zr:Wt.test(a)?oy:rT:Array.isArray(a)?r0:typeof a=="object"?Wt.test(a)?oy:lT:zr}function r0(a,i){const s=[...a],r=s.length,c=a.map((f,d)=>Af(f)(f,i[d]));return f=>{for(let d=0;d<r;d++)s[d]=c[d](f);return s}}function lT(a,i){const s={...a,...i},r={};for(const c in s)a[c]!==void 0&&i[c]!==void 0&&(r[c]=Af(a[c])(a[c],i[c]));return c=>{for(const f in r)s[f]=r[f](c);return s}}function sT(a,i){const s=[],r={color:0,var:0,number:0};for(let c=0;c<i.values.length;c++){const f=i.types[c],d=a.indexes[f][r[f]],m=a.values[d]??0;s[c]=m,r[f]++}return s}const rT=(a,i)=>{const s=ca.createTransformer(i),r=Zl(a),c=Zl(i);return r.indexes.var.length===c.indexes.var.length&&r.indexes.color.length===c.indexes.color.length&&r.indexes.number.length>=c.indexes.number.length?Vc.has(a)&&!c.values.length||Vc.has(i)&&!r.values.length?aT(a,i):Il(r0(sT(r,c),c.values),s):zr(a,i)};function o0(a,i,s){return typeof a=="number"&&typeof i=="number"&&typeof s=="number"?Ht(a,i,s):Af(a)(a,i)}const oT=a=>{const i=({timestamp:s})=>a(s);return{start:(s=!0)=>Ut.update(i,s),stop:()=>ua(i),now:()=>ce.isProcessing?ce.timestamp:Ce.now()}},u0=(a,i,s=10)=>{let r="";const c=Math.max(Math.round(i/s),2);for(let f=0;f<c;f++)r+=Math.round(a(f/(c-1))*1e4)/1e4+", ";return`linear(${r.substring(0,r.length-2)})`},Vr=2e4;function Cf(a){let i=0;const s=50;let r=a.next(i);for(;!r.done&&i<Vr;)i+=s,r=a.next(i);return i>=Vr?1/0:i}function uT(a,i=100,s){const r=s({...a,keyframes:[0,i]}),c=Math.min(Cf(r),Vr);return{type:"keyframes",ease:f=>r.next(c*f).value/i,duration:Fe(c)}}const cT=5;function c0(a,i,s){const r=Math.max(i-cT,0);return Gg(s-a(r),i-r)}const Gt={stiffness:100,damping:10,mass:1,velocity:0,duration:800,bounce:.3,visualDuration:.3,restSpeed:{granular:.01,default:2},restDelta:{granular:.005,default:.5},minDuration:.01,maxDuration:10,minDamping:.05,maxDamping:1},gc=.001;function fT({duration:a=Gt.duration,bounce:i=Gt.bounce,velocity:s=Gt.velocity,mass:r=Gt.mass}){let c,f,d=1-i;d=_n(Gt.minDamping,Gt.maxDamping,d),a=_n(Gt.minDuration,Gt.maxDuration,Fe(a)),d<1?(c=y=>{const g=y*d,b=g*a,S=g-s,N=Uc(y,d),V=Math.exp(-b);return gc-S/N*V},f=y=>{const b=y*d*a,S=b*s+s,N=Math.pow(d,2)*Math.pow(y,2)*a,V=Math.exp(-b),B=Uc(Math.pow(y,2),d);return(-c(y)+gc>0?-1:1)*((S-N)*V)/B}):(c=y=>{const g=Math.exp(-y*a),b=(y-s)*a+1;return-gc+g*b},f=y=>{const g=Math.exp(-y*a),b=(s-y)*(a*a);return g*b});const m=5/a,p=hT(c,f,m);if(a=cn(a),isNaN(p))return{stiffness:Gt.stiffness,damping:Gt.damping,duration:a};{const y=Math.pow(p,2)*r;return{stiffness:y,damping:d*2*Math.sqrt(r*y),duration:a}}}const dT=12;function hT(a,i,s){let r=s;for(let c=1;c<dT;c++)r=r-a(r)/i(r);return r}function Uc(a,i){return a*Math.sqrt(1-i*i)}const mT=["duration","bounce"],pT=["stiffness","damping","mass"];function uy(a,i){return i.some(s=>a[s]!==void 0)}function yT(a){let i={velocity:Gt.velocity,stiffness:Gt.stiffness,damping:Gt.damping,mass:Gt.mass,isResolvedFromDuration:!1,...a};if(!uy(a,pT)&&uy(a,mT))if(a.visualDuration){const s=a.visualDuration,r=2*Math.PI/(s*1.2),c=r*r,f=2*_n(.05,1,1-(a.bounce||0))*Math.sqrt(c);i={...i,mass:Gt.mass,stiffness:c,damping:f}}else{const s=fT(a);i={...i,...s,mass:Gt.mass},i.isResolvedFromDuration=!0}return i}function Ur(a=Gt.visualDuration,i=Gt.bounce){const s=typeof a!="object"?{visualDuration:a,keyframes:[0,1],bounce:i}:a;let{restSpeed:r,restDelta:c}=s;const f=s.keyframes[0],d=s.keyframes[s.keyframes.length-1],m={done:!1,value:f},{stiffness:p,damping:y,mass:g,duration:b,velocity:S,isResolvedFromDuration:N}=yT({...s,velocity:-Fe(s.velocity||0)}),V=S||0,B=y/(2*Math.sqrt(p*g)),U=d-f,j=Fe(Math.sqrt(p/g)),_=Math.abs(U)<5;r||(r=_?Gt.restSpeed.granular:Gt.restSpeed.default),c||(c=_?Gt.restDelta.granular:Gt.restDelta.default);let O;if(B<1){const K=Uc(j,B);O=tt=>{const Q=Math.exp(-B*j*tt);return d-Q*((V+B*j*U)/K*Math.sin(K*tt)+U*Math.cos(K*tt))}}else if(B===1)O=K=>d-Math.exp(-j*K)*(U+(V+j*U)*K);else{const K=j*Math.sqrt(B*B-1);O=tt=>{const Q=Math.exp(-B*j*tt),P=Math.min(K*tt,300);return d-Q*((V+B*j*U)*Math.sinh(P)+K*U*Math.cosh(P))/K}}const $={calculatedDuration:N&&b||null,next:K=>{const tt=O(K);if(N)m.done=K>=b;else{let Q=K===0?V:0;B<1&&(Q=K===0?cn(V):c0(O,K,tt));const P=Math.abs(Q)<=r,ht=Math.abs(d-tt)<=c;m.done=P&&ht}return m.value=m.done?d:tt,m},toString:()=>{const K=Math.min(Cf($),Vr),tt=u0(Q=>$.next(K*Q).value,K,30);return K+"ms "+tt},toTransition:()=>{}};return $}Ur.applyToOptions=a=>{const i=uT(a,100,Ur);return a.ease=i.ease,a.duration=cn(i.duration),a.type="keyframes",a};function Bc({keyframes:a,velocity:i=0,power:s=.8,timeConstant:r=325,bounceDamping:c=10,bounceStiffness:f=500,modifyTarget:d,min:m,max:p,restDelta:y=.5,restSpeed:g}){const b=a[0],S={done:!1,value:b},N=P=>m!==void 0&&P<m||p!==void 0&&P>p,V=P=>m===void 0?p:p===void 0||Math.abs(m-P)<Math.abs(p-P)?m:p;let B=s*i;const U=b+B,j=d===void 0?U:d(U);j!==U&&(B=j-b);const _=P=>-B*Math.exp(-P/r),O=P=>j+_(P),$=P=>{const ht=_(P),Tt=O(P);S.done=Math.abs(ht)<=y,S.value=S.done?j:Tt};let K,tt;const Q=P=>{N(S.value)&&(K=P,tt=Ur({keyframes:[S.value,V(S.value)],velocity:c0(O,P,S.value),damping:c,stiffness:f,restDelta:y,restSpeed:g}))};return Q(0),{calculatedDuration:null,next:P=>{let ht=!1;return!tt&&K===void 0&&(ht=!0,$(P),Q(P)),K!==void 0&&P>=K?tt.next(P-K):(!ht&&$(P),S)}}}function gT(a,i,s){const r=[],c=s||On.mix||o0,f=a.length-1;for(let d=0;d<f;d++){let m=c(a[d],a[d+1]);if(i){const p=Array.isArray(i)?i[d]||We:i;m=Il(p,m)}r.push(m)}return r}function vT(a,i,{clamp:s=!0,ease:r,mixer:c}={}){const f=a.length;if(pf(f===i.length),f===1)return()=>i[0];if(f===2&&i[0]===i[1])return()=>i[1];const d=a[0]===a[1];a[0]>a[f-1]&&(a=[...a].reverse(),i=[...i].reverse());const m=gT(i,r,c),p=m.length,y=g=>{if(d&&g<a[0])return i[0];let b=0;if(p>1)for(;b<a.length-2&&!(g<a[b+1]);b++);const S=Kl(a[b],a[b+1],g);return m[b](S)};return s?g=>y(_n(a[0],a[f-1],g)):y}function xT(a,i){const s=a[a.length-1];for(let r=1;r<=i;r++){const c=Kl(0,i,r);a.push(Ht(s,1,c))}}function bT(a){const i=[0];return xT(i,a.length-1),i}function ST(a,i){return a.map(s=>s*i)}function TT(a,i){return a.map(()=>i||Wg).splice(0,a.length-1)}function kl({duration:a=300,keyframes:i,times:s,ease:r="easeInOut"}){const c=O1(r)?r.map(iy):iy(r),f={done:!1,value:i[0]},d=ST(s&&s.length===i.length?s:bT(i),a),m=vT(d,i,{ease:Array.isArray(c)?c:TT(i,c)});return{calculatedDuration:a,next:p=>(f.value=m(p),f.done=p>=a,f)}}const ET=a=>a!==null;function Nf(a,{repeat:i,repeatType:s="loop"},r,c=1){const f=a.filter(ET),m=c<0||i&&s!=="loop"&&i%2===1?0:f.length-1;return!m||r===void 0?f[m]:r}const AT={decay:Bc,inertia:Bc,tween:kl,keyframes:kl,spring:Ur};function f0(a){typeof a.type=="string"&&(a.type=AT[a.type])}class jf{constructor(){this.updateFinished()}get finished(){return this._finished}updateFinished(){this._finished=new Promise(i=>{this.resolve=i})}notifyFinished(){this.resolve()}then(i,s){return this.finished.then(i,s)}}const CT=a=>a/100;class Df extends jf{constructor(i){super(),this.state="idle",this.startTime=null,this.isStopped=!1,this.currentTime=0,this.holdTime=null,this.playbackSpeed=1,this.stop=()=>{const{motionValue:s}=this.options;s&&s.updatedAt!==Ce.now()&&this.tick(Ce.now()),this.isStopped=!0,this.state!=="idle"&&(this.teardown(),this.options.onStop?.())},this.options=i,this.initAnimation(),this.play(),i.autoplay===!1&&this.pause()}initAnimation(){const{options:i}=this;f0(i);const{type:s=kl,repeat:r=0,repeatDelay:c=0,repeatType:f,velocity:d=0}=i;let{keyframes:m}=i;const p=s||kl;p!==kl&&typeof m[0]!="number"&&(this.mixKeyframes=Il(CT,o0(m[0],m[1])),m=[0,100]);const y=p({...i,keyframes:m});f==="mirror"&&(this.mirroredGenerator=p({...i,keyframes:[...m].reverse(),velocity:-d})),y.calculatedDuration===null&&(y.calculatedDuration=Cf(y));const{calculatedDuration:g}=y;this.calculatedDuration=g,this.resolvedDuration=g+c,this.totalDuration=this.resolvedDuration*(r+1)-c,this.generator=y}updateTime(i){const s=Math.round(i-this.startTime)*this.playbackSpeed;this.holdTime!==null?this.currentTime=this.holdTime:this.currentTime=s}tick(i,s=!1){const{generator:r,totalDuration:c,mixKeyframes:f,mirroredGenerator:d,resolvedDuration:m,calculatedDuration:p}=this;if(this.startTime===null)return r.next(0);const{delay:y=0,keyframes:g,repeat:b,repeatType:S,repeatDelay:N,type:V,onUpdate:B,finalKeyframe:U}=this.options;this.speed>0?this.startTime=Math.min(this.startTime,i):this.speed<0&&(this.startTime=Math.min(i-c/this.speed,this.startTime)),s?this.currentTime=i:this.updateTime(i);const j=this.currentTime-y*(this.playbackSpeed>=0?1:-1),_=this.playbackSpeed>=0?j<0:j>c;this.currentTime=Math.max(j,0),this.state==="finished"&&this.holdTime===null&&(this.currentTime=c);let O=this.currentTime,$=r;if(b){const P=Math.min(this.currentTime,c)/m;let ht=Math.floor(P),Tt=P%1;!Tt&&P>=1&&(Tt=1),Tt===1&&ht--,ht=Math.min(ht,b+1),!!(ht%2)&&(S==="reverse"?(Tt=1-Tt,N&&(Tt-=N/m)):S==="mirror"&&($=d)),O=_n(0,1,Tt)*m}const K=_?{done:!1,value:g[0]}:$.next(O);f&&(K.value=f(K.value));let{done:tt}=K;!_&&p!==null&&(tt=this.playbackSpeed>=0?this.currentTime>=c:this.currentTime<=0);const Q=this.holdTime===null&&(this.state==="finished"||this.state==="running"&&tt);return Q&&V!==Bc&&(K.value=Nf(g,this.options,U,this.speed)),B&&B(K.value),Q&&this.finish(),K}then(i,s){return this.finished.then(i,s)}get duration(){return Fe(this.calculatedDuration)}get iterationDuration(){const{delay:i=0}=this.options||{};return this.duration+Fe(i)}get time(){return Fe(this.currentTime)}set time(i){i=cn(i),this.currentTime=i,this.startTime===null||this.holdTime!==null||this.playbackSpeed===0?this.holdTime=i:this.driver&&(this.startTime=this.driver.now()-i/this.playbackSpeed),this.driver?.start(!1)}get speed(){return this.playbackSpeed}set speed(i){this.updateTime(Ce.now());const s=this.playbackSpeed!==i;this.playbackSpeed=i,s&&(this.time=Fe(this.currentTime))}play(){if(this.isStopped)return;const{driver:i=oT,startTime:s}=this.options;this.driver||(this.driver=i(c=>this.tick(c))),this.options.onPlay?.();const r=this.driver.now();this.state==="finished"?(this.updateFinished(),this.startTime=r):this.holdTime!==null?this.startTime=r-this.holdTime:this.startTime||(this.startTime=s??r),this.state==="finished"&&this.speed<0&&(this.startTime+=this.calculatedDuration),this.holdTime=null,this.state="running",this.driver.start()}pause(){this.state="paused",this.updateTime(Ce.now()),this.holdTime=this.currentTime}complete(){this.state!=="running"&&this.play(),this.state="finished",this.holdTime=null}finish(){this.notifyFinished(),this.teardown(),this.state="finished",this.options.onComplete?.()}cancel(){this.holdTime=null,this.startTime=0,this.tick(0),this.teardown(),this.options.onCancel?.()}teardown(){this.state="idle",this.stopDriver(),this.startTime=this.holdTime=null}stopDriver(){this.driver&&(this.driver.stop(),this.driver=void 0)}sample(i){return this.startTime=0,this.tick(i,!0)}attachTimeline(i){return this.options.allowFlatten&&(this.options.type="keyframes",this.options.ease="linear",this.initAnimation()),this.driver?.stop(),i.observe(this)}}function NT(a){for(let i=1;i<a.length;i++)a[i]??(a[i]=a[i-1])}const Ba=a=>a*180/Math.PI,Lc=a=>{const i=Ba(Math.atan2(a[1],a[0]));return Hc(i)},jT={x:4,y:5,translateX:4,translateY:5,scaleX:0,scaleY:3,scale:a=>(Math.abs(a[0])+Math.abs(a[3]))/2,rotate:Lc,rotateZ:Lc,skewX:a=>Ba(Math.atan(a[1])),skewY:a=>Ba(Math.atan(a[2])),skew:a=>(Math.abs(a[1])+Math.abs(a[2]))/2},Hc=a=>(a=a%360,a<0&&(a+=360),a),cy=Lc,fy=a=>Math.sqrt(a[0]*a[0]+a[1]*a[1]),dy=a=>Math.sqrt(a[4]*a[4]+a[5]*a[5]),DT={x:12,y:13,z:14,translateX:12,translateY:13,translateZ:14,scaleX:fy,scaleY:dy,scale:a=>(fy(a)+dy(a))/2,rotateX:a=>Hc(Ba(Math.atan2(a[6],a[5]))),rotateY:a=>Hc(Ba(Math.atan2(-a[2],a[0]))),rotateZ:cy,rotate:cy,skewX:a=>Ba(Math.atan(a[4])),skewY:a=>Ba(Math.atan(a[1])),skew:a=>(Math.abs(a[1])+Math.abs(a[4]))/2};function kc(a){return a.includes("scale")?1:0}function Yc(a,i){if(!a||a==="none")return kc(i);const s=a.match(/^matrix3d\(([-\d.e\s,]+)\)$/u);let r,c;if(s)r=DT,c=s;else{const m=a.match(/^matrix\(([-\d.e\s,]+)\)$/u);r=jT,c=m}if(!c)return kc(i);const f=r[i],d=c[1].split(",").map(wT);return typeof f=="function"?f(d):d[f]}const MT=(a,i)=>{const{transform:s="none"}=getComputedStyle(a);return Yc(s,i)};function wT(a){return parseFloat(a.trim())}const Bi=["transformPerspective","x","y","z","translateX","translateY","translateZ","scale","scaleX","scaleY","rotate","rotateX","rotateY","rotateZ","skew","skewX","skewY"],Li=new Set(Bi),hy=a=>a===Ui||a===it,RT=new Set(["x","y","z"]),_T=Bi.filter(a=>!RT.has(a));function OT(a){const i=[];return _T.forEach(s=>{const r=a.getValue(s);r!==void 0&&(i.push([s,r.get()]),r.set(s.startsWith("scale")?1:0))}),i}const La={width:({x:a},{paddingLeft:i="0",paddingRight:s="0"})=>a.max-a.min-parseFloat(i)-parseFloat(s),height:({y:a},{paddingTop:i="0",paddingBottom:s="0"})=>a.max-a.min-parseFloat(i)-parseFloat(s),top:(a,{top:i})=>parseFloat(i),left:(a,{left:i})=>parseFloat(i),bottom:({y:a},{top:i})=>parseFloat(i)+(a.max-a.min),right:({x:a},{left:i})=>parseFloat(i)+(a.max-a.min),x:(a,{transform:i})=>Yc(i,"x"),y:(a,{transform:i})=>Yc(i,"y")};La.translateX=La.x;La.translateY=La.y;const Ha=new Set;let qc=!1,Gc=!1,Xc=!1;function d0(){if(Gc){const a=Array.from(Ha).filter(r=>r.needsMeasurement),i=new Set(a.map(r=>r.element)),s=new Map;i.forEach(r=>{const c=OT(r);c.length&&(s.set(r,c),r.render())}),a.forEach(r=>r.measureInitialState()),i.forEach(r=>{r.render();const c=s.get(r);c&&c.forEach(([f,d])=>{r.getValue(f)?.set(d)})}),a.forEach(r=>r.measureEndState()),a.forEach(r=>{r.suspendedScrollY!==void 0&&window.scrollTo(0,r.suspendedScrollY)})}Gc=!1,qc=!1,Ha.forEach(a=>a.complete(Xc)),Ha.clear()}function h0(){Ha.forEach(a=>{a.readKeyframes(),a.needsMeasurement&&(Gc=!0)})}function zT(){Xc=!0,h0(),d0(),Xc=!1}class Mf{constructor(i,s,r,c,f,d=!1){this.state="pending",this.isAsync=!1,this.needsMeasurement=!1,this.unresolvedKeyframes=[...i],this.onComplete=s,this.name=r,this.motionValue=c,this.element=f,this.isAsync=d}scheduleResolve(){this.state="scheduled",this.isAsync?(Ha.add(this),qc||(qc=!0,Ut.read(h0),Ut.resolveKeyframes(d0))):(this.readKeyframes(),this.complete())}readKeyframes(){const{unresolvedKeyframes:i,name:s,element:r,motionValue:c}=this;if(i[0]===null){const f=c?.get(),d=i[i.length-1];if(f!==void 0)i[0]=f;else if(r&&s){const m=r.readValue(s,d);m!=null&&(i[0]=m)}i[0]===void 0&&(i[0]=d),c&&f===void 0&&c.set(i[0])}NT(i)}setFinalKeyframe(){}measureInitialState(){}renderEndStyles(){}measureEndState(){}complete(i=!1){this.state="complete",this.onComplete(this.unresolvedKeyframes,this.finalKeyframe,i),Ha.delete(this)}cancel(){this.state==="scheduled"&&(Ha.delete(this),this.state="pending")}resume(){this.state==="pending"&&this.scheduleResolve()}}const VT=a=>a.startsWith("--");function UT(a,i,s){VT(i)?a.style.setProperty(i,s):a.style[i]=s}const BT=yf(()=>window.ScrollTimeline!==void 0),LT={};function HT(a,i){const s=yf(a);return()=>LT[i]??s()}const m0=HT(()=>{try{document.createElement("div").animate({opacity:0},{easing:"linear(0, 1)"})}catch{return!1}return!0},"linearEasing"),Bl=([a,i,s,r])=>`cubic-bezier(${a}, ${i}, ${s}, ${r})`,my={linear:"linear",ease:"ease",easeIn:"ease-in",easeOut:"ease-out",easeInOut:"ease-in-out",circIn:Bl([0,.65,.55,1]),circOut:Bl([.55,0,1,.45]),backIn:Bl([.31,.01,.66,-.59]),backOut:Bl([.33,1.53,.69,.99])};function p0(a,i){if(a)return typeof a=="function"?m0()?u0(a,i):"ease-out":Ig(a)?Bl(a):Array.isArray(a)?a.map(s=>p0(s,i)||my.easeOut):my[a]}function kT(a,i,s,{delay:r=0,duration:c=300,repeat:f=0,repeatType:d="loop",ease:m="easeOut",times:p}={},y=void 0){const g={[i]:s};p&&(g.offset=p);const b=p0(m,c);Array.isArray(b)&&(g.easing=b);const S={delay:r,duration:c,easing:Array.isArray(b)?"linear":b,fill:"both",iterations:f+1,direction:d==="reverse"?"alternate":"normal"};return y&&(S.pseudoElement=y),a.animate(g,S)}function y0(a){return typeof a=="function"&&"applyToOptions"in a}function YT({type:a,...i}){return y0(a)&&m0()?a.applyToOptions(i):(i.duration??(i.duration=300),i.ease??(i.ease="easeOut"),i)}class qT extends jf{constructor(i){if(super(),this.finishedTime=null,this.isStopped=!1,!i)return;const{element:s,name:r,keyframes:c,pseudoElement:f,allowFlatten:d=!1,finalKeyframe:m,onComplete:p}=i;this.isPseudoElement=!!f,this.allowFlatten=d,this.options=i,pf(typeof i.type!="string");const y=YT(i);this.animation=kT(s,r,c,y,f),y.autoplay===!1&&this.animation.pause(),this.animation.onfinish=()=>{if(this.finishedTime=this.time,!f){const g=Nf(c,this.options,m,this.speed);this.updateMotionValue?this.updateMotionValue(g):UT(s,r,g),this.animation.cancel()}p?.(),this.notifyFinished()}}play(){this.isStopped||(this.animation.play(),this.state==="finished"&&this.updateFinished())}pause(){this.animation.pause()}complete(){this.animation.finish?.()}cancel(){try{this.animation.cancel()}catch{}}stop(){if(this.isStopped)return;this.isStopped=!0;const{state:i}=this;i==="idle"||i==="finished"||(this.updateMotionValue?this.updateMotionValue():this.commitStyles(),this.isPseudoElement||this.cancel())}commitStyles(){this.isPseudoElement||this.animation.commitStyles?.()}get duration(){const i=this.animation.effect?.getComputedTiming?.().duration||0;return Fe(Number(i))}get iterationDuration(){const{delay:i=0}=this.options||{};return this.duration+Fe(i)}get time(){return Fe(Number(this.animation.currentTime)||0)}set time(i){this.finishedTime=null,this.animation.currentTime=cn(i)}get speed(){return this.animation.playbackRate}set speed(i){i<0&&(this.finishedTime=null),this.animation.playbackRate=i}get state(){return this.finishedTime!==null?"finished":this.animation.playState}get startTime(){return Number(this.animation.startTime)}set startTime(i){this.animation.startTime=i}attachTimeline({timeline:i,observe:s}){return this.allowFlatten&&this.animation.effect?.updateTiming({easing:"linear"}),this.animation.onfinish=null,i&&BT()?(this.animation.timeline=i,We):s(this)}}const g0={anticipate:Jg,backInOut:$g,circInOut:Fg};function GT(a){return a in g0}function XT(a){typeof a.ease=="string"&&GT(a.ease)&&(a.ease=g0[a.ease])}const py=10;class KT extends qT{constructor(i){XT(i),f0(i),super(i),i.startTime&&(this.startTime=i.startTime),this.options=i}updateMotionValue(i){const{motionValue:s,onUpdate:r,onComplete:c,element:f,...d}=this.options;if(!s)return;if(i!==void 0){s.set(i);return}const m=new Df({...d,autoplay:!1}),p=cn(this.finishedTime??this.time);s.setWithVelocity(m.sample(p-py).value,m.sample(p).value,py),m.stop()}}const yy=(a,i)=>i==="zIndex"?!1:!!(typeof a=="number"||Array.isArray(a)||typeof a=="string"&&(ca.test(a)||a==="0")&&!a.startsWith("url("));function QT(a){const i=a[0];if(a.length===1)return!0;for(let s=0;s<a.length;s++)if(a[s]!==i)return!0}function ZT(a,i,s,r){const c=a[0];if(c===null)return!1;if(i==="display"||i==="visibility")return!0;const f=a[a.length-1],d=yy(c,i),m=yy(f,i);return!d||!m?!1:QT(a)||(s==="spring"||y0(s))&&r}function Kc(a){a.duration=0,a.type="keyframes"}const $T=new Set(["opacity","clipPath","filter","transform"]),JT=yf(()=>Object.hasOwnProperty.call(Element.prototype,"animate"));function PT(a){const{motionValue:i,name:s,repeatDelay:r,repeatType:c,damping:f,type:d}=a;if(!(i?.owner?.current instanceof HTMLElement))return!1;const{onUpdate:p,transformTemplate:y}=i.owner.getProps();return JT()&&s&&$T.has(s)&&(s!=="transform"||!y)&&!p&&!r&&c!=="mirror"&&f!==0&&d!=="inertia"}const FT=40;class WT extends jf{constructor({autoplay:i=!0,delay:s=0,type:r="keyframes",repeat:c=0,repeatDelay:f=0,repeatType:d="loop",keyframes:m,name:p,motionValue:y,element:g,...b}){super(),this.stop=()=>{this._animation&&(this._animation.stop(),this.stopTimeline?.()),this.keyframeResolver?.cancel()},this.createdAt=Ce.now();const S={autoplay:i,delay:s,type:r,repeat:c,repeatDelay:f,repeatType:d,name:p,motionValue:y,element:g,...b},N=g?.KeyframeResolver||Mf;this.keyframeResolver=new N(m,(V,B,U)=>this.onKeyframesResolved(V,B,S,!U),p,y,g),this.keyframeResolver?.scheduleResolve()}onKeyframesResolved(i,s,r,c){this.keyframeResolver=void 0;const{name:f,type:d,velocity:m,delay:p,isHandoff:y,onUpdate:g}=r;this.resolvedAt=Ce.now(),ZT(i,f,d,m)||((On.instantAnimations||!p)&&g?.(Nf(i,r,s)),i[0]=i[i.length-1],Kc(r),r.repeat=0);const S={startTime:c?this.resolvedAt?this.resolvedAt-this.createdAt>FT?this.resolvedAt:this.createdAt:this.createdAt:void 0,finalKeyframe:s,...r,keyframes:i},N=!y&&PT(S)?new KT({...S,element:S.motionValue.owner.current}):new Df(S);N.finished.then(()=>this.notifyFinished()).catch(We),this.pendingTimeline&&(this.stopTimeline=N.attachTimeline(this.pendingTimeline),this.pendingTimeline=void 0),this._animation=N}get finished(){return this._animation?this.animation.finished:this._finished}then(i,s){return this.finished.finally(i).then(()=>{})}get animation(){return this._animation||(this.keyframeResolver?.resume(),zT()),this._animation}get duration(){return this.animation.duration}get iterationDuration(){return this.animation.iterationDuration}get time(){return this.animation.time}set time(i){this.animation.time=i}get speed(){return this.animation.speed}get state(){return this.animation.state}set speed(i){this.animation.speed=i}get startTime(){return this.animation.startTime}attachTimeline(i){return this._animation?this.stopTimeline=this.animation.attachTimeline(i):this.pendingTimeline=i,()=>this.stop()}play(){this.animation.play()}pause(){this.animation.pause()}complete(){this.animation.complete()}cancel(){this._animation&&this.animation.cancel(),this.keyframeResolver?.cancel()}}const IT=/^var\(--(?:([\w-]+)|([\w-]+), ?([a-zA-Z\d ()%#.,-]+))\)/u;function t2(a){const i=IT.exec(a);if(!i)return[,];const[,s,r,c]=i;return[`--${s??r}`,c]}function v0(a,i,s=1){const[r,c]=t2(a);if(!r)return;const f=window.getComputedStyle(i).getPropertyValue(r);if(f){const d=f.trim();return kg(d)?parseFloat(d):d}return Sf(c)?v0(c,i,s+1):c}function wf(a,i){return a?.[i]??a?.default??a}const x0=new Set(["width","height","top","left","right","bottom",...Bi]),e2={test:a=>a==="auto",parse:a=>a},b0=a=>i=>i.test(a),S0=[Ui,it,fn,oa,Q1,K1,e2],gy=a=>S0.find(b0(a));function n2(a){return typeof a=="number"?a===0:a!==null?a==="none"||a==="0"||qg(a):!0}const a2=new Set(["brightness","contrast","saturate","opacity"]);function i2(a){const[i,s]=a.slice(0,-1).split("(");if(i==="drop-shadow")return a;const[r]=s.match(Tf)||[];if(!r)return a;const c=s.replace(r,"");let f=a2.has(i)?1:0;return r!==s&&(f*=100),i+"("+f+c+")"}const l2=/\b([a-z-]*)\(.*?\)/gu,Qc={...ca,getAnimatableNone:a=>{const i=a.match(l2);return i?i.map(i2).join(" "):a}},vy={...Ui,transform:Math.round},s2={rotate:oa,rotateX:oa,rotateY:oa,rotateZ:oa,scale:Er,scaleX:Er,scaleY:Er,scaleZ:Er,skew:oa,skewX:oa,skewY:oa,distance:it,translateX:it,translateY:it,translateZ:it,x:it,y:it,z:it,perspective:it,transformPerspective:it,opacity:Ql,originX:ly,originY:ly,originZ:it},Rf={borderWidth:it,borderTopWidth:it,borderRightWidth:it,borderBottomWidth:it,borderLeftWidth:it,borderRadius:it,radius:it,borderTopLeftRadius:it,borderTopRightRadius:it,borderBottomRightRadius:it,borderBottomLeftRadius:it,width:it,maxWidth:it,height:it,maxHeight:it,top:it,right:it,bottom:it,left:it,padding:it,paddingTop:it,paddingRight:it,paddingBottom:it,paddingLeft:it,margin:it,marginTop:it,marginRight:it,marginBottom:it,marginLeft:it,backgroundPositionX:it,backgroundPositionY:it,...s2,zIndex:vy,fillOpacity:Ql,strokeOpacity:Ql,numOctaves:vy},r2={...Rf,color:Wt,backgroundColor:Wt,outlineColor:Wt,fill:Wt,stroke:Wt,borderColor:Wt,borderTopColor:Wt,borderRightColor:Wt,borderBottomColor:Wt,borderLeftColor:Wt,filter:Qc,WebkitFilter:Qc},T0=a=>r2[a];function E0(a,i){let s=T0(a);return s!==Qc&&(s=ca),s.getAnimatableNone?s.getAnimatableNone(i):void 0}const o2=new Set(["auto","none","0"]);function u2(a,i,s){let r=0,c;for(;r<a.length&&!c;){const f=a[r];typeof f=="string"&&!o2.has(f)&&Zl(f).values.length&&(c=a[r]),r++}if(c&&s)for(const f of i)a[f]=E0(s,c)}class c2 extends Mf{constructor(i,s,r,c,f){super(i,s,r,c,f,!0)}readKeyframes(){const{unresolvedKeyframes:i,element:s,name:r}=this;if(!s||!s.current)return;super.readKeyframes();for(let p=0;p<i.length;p++){let y=i[p];if(typeof y=="string"&&(y=y.trim(),Sf(y))){const g=v0(y,s.current);g!==void 0&&(i[p]=g),p===i.length-1&&(this.finalKeyframe=y)}}if(this.resolveNoneKeyframes(),!x0.has(r)||i.length!==2)return;const[c,f]=i,d=gy(c),m=gy(f);if(d!==m)if(hy(d)&&hy(m))for(let p=0;p<i.length;p++){const y=i[p];typeof y=="string"&&(i[p]=parseFloat(y))}else La[r]&&(this.needsMeasurement=!0)}resolveNoneKeyframes(){const{unresolvedKeyframes:i,name:s}=this,r=[];for(let c=0;c<i.length;c++)(i[c]===null||n2(i[c]))&&r.push(c);r.length&&u2(i,r,s)}measureInitialState(){const{element:i,unresolvedKeyframes:s,name:r}=this;if(!i||!i.current)return;r==="height"&&(this.suspendedScrollY=window.pageYOffset),this.measuredOrigin=La[r](i.measureViewportBox(),window.getComputedStyle(i.current)),s[0]=this.measuredOrigin;const c=s[s.length-1];c!==void 0&&i.getValue(r,c).jump(c,!1)}measureEndState(){const{element:i,name:s,unresolvedKeyframes:r}=this;if(!i||!i.current)return;const c=i.getValue(s);c&&c.jump(this.measuredOrigin,!1);const f=r.length-1,d=r[f];r[f]=La[s](i.measureViewportBox(),window.getComputedStyle(i.current)),d!==null&&this.finalKeyframe===void 0&&(this.finalKeyframe=d),this.removedTransforms?.length&&this.removedTransforms.forEach(([m,p])=>{i.getValue(m).set(p)}),this.resolveNoneKeyframes()}}function f2(a,i,s){if(a instanceof EventTarget)return[a];if(typeof a=="string"){let r=document;const c=s?.[a]??r.querySelectorAll(a);return c?Array.from(c):[]}return Array.from(a)}const A0=(a,i)=>i&&typeof a=="number"?i.transform(a):a;function d2(a){return Yg(a)&&"offsetHeight"in a}const xy=30,h2=a=>!isNaN(parseFloat(a));class m2{constructor(i,s={}){this.canTrackVelocity=null,this.events={},this.updateAndNotify=r=>{const c=Ce.now();if(this.updatedAt!==c&&this.setPrevFrameValue(),this.prev=this.current,this.setCurrent(r),this.current!==this.prev&&(this.events.change?.notify(this.current),this.dependents))for(const f of this.dependents)f.dirty()},this.hasAnimated=!1,this.setCurrent(i),this.owner=s.owner}setCurrent(i){this.current=i,this.updatedAt=Ce.now(),this.canTrackVelocity===null&&i!==void 0&&(this.canTrackVelocity=h2(this.current))}setPrevFrameValue(i=this.current){this.prevFrameValue=i,this.prevUpdatedAt=this.updatedAt}onChange(i){return this.on("change",i)}on(i,s){this.events[i]||(this.events[i]=new gf);const r=this.events[i].add(s);return i==="change"?()=>{r(),Ut.read(()=>{this.events.change.getSize()||this.stop()})}:r}clearListeners(){for(const i in this.events)this.events[i].clear()}attach(i,s){this.passiveEffect=i,this.stopPassiveEffect=s}set(i){this.passiveEffect?this.passiveEffect(i,this.updateAndNotify):this.updateAndNotify(i)}setWithVelocity(i,s,r){this.set(s),this.prev=void 0,this.prevFrameValue=i,this.prevUpdatedAt=this.updatedAt-r}jump(i,s=!0){this.updateAndNotify(i),this.prev=i,this.prevUpdatedAt=this.prevFrameValue=void 0,s&&this.stop(),this.stopPassiveEffect&&this.stopPassiveEffect()}dirty(){this.events.change?.notify(this.current)}addDependent(i){this.dependents||(this.dependents=new Set),this.dependents.add(i)}removeDependent(i){this.dependents&&this.dependents.delete(i)}get(){return this.current}getPrevious(){return this.prev}getVelocity(){const i=Ce.now();if(!this.canTrackVelocity||this.prevFrameValue===void 0||i-this.updatedAt>xy)return 0;const s=Math.min(this.updatedAt-this.prevUpdatedAt,xy);return Gg(parseFloat(this.current)-parseFloat(this.prevFrameValue),s)}start(i){return this.stop(),new Promise(s=>{this.hasAnimated=!0,this.animation=i(s),this.events.animationStart&&this.events.animationStart.notify()}).then(()=>{this.events.animationComplete&&this.events.animationComplete.notify(),this.clearAnimation()})}stop(){this.animation&&(this.animation.stop(),this.events.animationCancel&&this.events.animationCancel.notify()),this.clearAnimation()}isAnimating(){return!!this.animation}clearAnimation(){delete this.animation}destroy(){this.dependents?.clear(),this.events.destroy?.notify(),this.clearListeners(),this.stop(),this.stopPassiveEffect&&this.stopPassiveEffect()}}function _i(a,i){return new m2(a,i)}const{schedule:_f}=t0(queueMicrotask,!1),an={x:!1,y:!1};function C0(){return an.x||an.y}function p2(a){return a==="x"||a==="y"?an[a]?null:(an[a]=!0,()=>{an[a]=!1}):an.x||an.y?null:(an.x=an.y=!0,()=>{an.x=an.y=!1})}function N0(a,i){const s=f2(a),r=new AbortController,c={passive:!0,...i,signal:r.signal};return[s,c,()=>r.abort()]}function by(a){return!(a.pointerType==="touch"||C0())}function y2(a,i,s={}){const[r,c,f]=N0(a,s),d=m=>{if(!by(m))return;const{target:p}=m,y=i(p,m);if(typeof y!="function"||!p)return;const g=b=>{by(b)&&(y(b),p.removeEventListener("pointerleave",g))};p.addEventListener("pointerleave",g,c)};return r.forEach(m=>{m.addEventListener("pointerenter",d,c)}),f}const j0=(a,i)=>i?a===i?!0:j0(a,i.parentElement):!1,Of=a=>a.pointerType==="mouse"?typeof a.button!="number"||a.button<=0:a.isPrimary!==!1,g2=new Set(["BUTTON","INPUT","SELECT","TEXTAREA","A"]);function v2(a){return g2.has(a.tagName)||a.tabIndex!==-1}const wr=new WeakSet;function Sy(a){return i=>{i.key==="Enter"&&a(i)}}function vc(a,i){a.dispatchEvent(new PointerEvent("pointer"+i,{isPrimary:!0,bubbles:!0}))}const x2=(a,i)=>{const s=a.currentTarget;if(!s)return;const r=Sy(()=>{if(wr.has(s))return;vc(s,"down");const c=Sy(()=>{vc(s,"up")}),f=()=>vc(s,"cancel");s.addEventListener("keyup",c,i),s.addEventListener("blur",f,i)});s.addEventListener("keydown",r,i),s.addEventListener("blur",()=>s.removeEventListener("keydown",r),i)};function Ty(a){return Of(a)&&!C0()}function b2(a,i,s={}){const[r,c,f]=N0(a,s),d=m=>{const p=m.currentTarget;if(!Ty(m))return;wr.add(p);const y=i(p,m),g=(N,V)=>{window.removeEventListener("pointerup",b),window.removeEventListener("pointercancel",S),wr.has(p)&&wr.delete(p),Ty(N)&&typeof y=="function"&&y(N,{success:V})},b=N=>{g(N,p===window||p===document||s.useGlobalTarget||j0(p,N.target))},S=N=>{g(N,!1)};window.addEventListener("pointerup",b,c),window.addEventListener("pointercancel",S,c)};return r.forEach(m=>{(s.useGlobalTarget?window:m).addEventListener("pointerdown",d,c),d2(m)&&(m.addEventListener("focus",y=>x2(y,c)),!v2(m)&&!m.hasAttribute("tabindex")&&(m.tabIndex=0))}),f}function D0(a){return Yg(a)&&"ownerSVGElement"in a}function S2(a){return D0(a)&&a.tagName==="svg"}const he=a=>!!(a&&a.getVelocity),T2=[...S0,Wt,ca],E2=a=>T2.find(b0(a)),M0=E.createContext({transformPagePoint:a=>a,isStatic:!1,reducedMotion:"never"});function A2(a=!0){const i=E.useContext(df);if(i===null)return[!0,null];const{isPresent:s,onExitComplete:r,register:c}=i,f=E.useId();E.useEffect(()=>{if(a)return c(f)},[a]);const d=E.useCallback(()=>a&&r&&r(f),[f,r,a]);return!s&&r?[!1,d]:[!0]}const w0=E.createContext({strict:!1}),Ey={animation:["animate","variants","whileHover","whileTap","exit","whileInView","whileFocus","whileDrag"],exit:["exit"],drag:["drag","dragControls"],focus:["whileFocus"],hover:["whileHover","onHoverStart","onHoverEnd"],tap:["whileTap","onTap","onTapStart","onTapCancel"],pan:["onPan","onPanStart","onPanSessionStart","onPanEnd"],inView:["whileInView","onViewportEnter","onViewportLeave"],layout:["layout","layoutId"]},Oi={};for(const a in Ey)Oi[a]={isEnabled:i=>Ey[a].some(s=>!!i[s])};function C2(a){for(const i in a)Oi[i]={...Oi[i],...a[i]}}const N2=new Set(["animate","exit","variants","initial","style","values","variants","transition","transformTemplate","custom","inherit","onBeforeLayoutMeasure","onAnimationStart","onAnimationComplete","onUpdate","onDragStart","onDrag","onDragEnd","onMeasureDragConstraints","onDirectionLock","onDragTransitionEnd","_dragX","_dragY","onHoverStart","onHoverEnd","onViewportEnter","onViewportLeave","globalTapTarget","ignoreStrict","viewport"]);function Br(a){return a.startsWith("while")||a.startsWith("drag")&&a!=="draggable"||a.startsWith("layout")||a.startsWith("onTap")||a.startsWith("onPan")||a.startsWith("onLayout")||N2.has(a)}let R0=a=>!Br(a);function j2(a){typeof a=="function"&&(R0=i=>i.startsWith("on")?!Br(i):a(i))}try{j2(require("@emotion/is-prop-valid").default)}catch{}function D2(a,i,s){const r={};for(const c in a)c==="values"&&typeof a.values=="object"||(R0(c)||s===!0&&Br(c)||!i&&!Br(c)||a.draggable&&c.startsWith("onDrag"))&&(r[c]=a[c]);return r}const Yr=E.createContext({});function qr(a){return a!==null&&typeof a=="object"&&typeof a.start=="function"}function $l(a){return typeof a=="string"||Array.isArray(a)}const zf=["animate","whileInView","whileFocus","whileHover","whileTap","whileDrag","exit"],Vf=["initial",...zf];function Gr(a){return qr(a.animate)||Vf.some(i=>$l(a[i]))}function _0(a){return!!(Gr(a)||a.variants)}function M2(a,i){if(Gr(a)){const{initial:s,animate:r}=a;return{initial:s===!1||$l(s)?s:void 0,animate:$l(r)?r:void 0}}return a.inherit!==!1?i:{}}function w2(a){const{initial:i,animate:s}=M2(a,E.useContext(Yr));return E.useMemo(()=>({initial:i,animate:s}),[Ay(i),Ay(s)])}function Ay(a){return Array.isArray(a)?a.join(" "):a}const Jl={};function R2(a){for(const i in a)Jl[i]=a[i],bf(i)&&(Jl[i].isCSSVariable=!0)}function O0(a,{layout:i,layoutId:s}){return Li.has(a)||a.startsWith("origin")||(i||s!==void 0)&&(!!Jl[a]||a==="opacity")}const _2={x:"translateX",y:"translateY",z:"translateZ",transformPerspective:"perspective"},O2=Bi.length;function z2(a,i,s){let r="",c=!0;for(let f=0;f<O2;f++){const d=Bi[f],m=a[d];if(m===void 0)continue;let p=!0;if(typeof m=="number"?p=m===(d.startsWith("scale")?1:0):p=parseFloat(m)===0,!p||s){const y=A0(m,Rf[d]);if(!p){c=!1;const g=_2[d]||d;r+=`${g}(${y}) `}s&&(i[d]=y)}}return r=r.trim(),s?r=s(i,c?"":r):c&&(r="none"),r}function Uf(a,i,s){const{style:r,vars:c,transformOrigin:f}=a;let d=!1,m=!1;for(const p in i){const y=i[p];if(Li.has(p)){d=!0;continue}else if(bf(p)){c[p]=y;continue}else{const g=A0(y,Rf[p]);p.startsWith("origin")?(m=!0,f[p]=g):r[p]=g}}if(i.transform||(d||s?r.transform=z2(i,a.transform,s):r.transform&&(r.transform="none")),m){const{originX:p="50%",originY:y="50%",originZ:g=0}=f;r.transformOrigin=`${p} ${y} ${g}`}}const Bf=()=>({style:{},transform:{},transformOrigin:{},vars:{}});function z0(a,i,s){for(const r in i)!he(i[r])&&!O0(r,s)&&(a[r]=i[r])}function V2({transformTemplate:a},i){return E.useMemo(()=>{const s=Bf();return Uf(s,i,a),Object.assign({},s.vars,s.style)},[i])}function U2(a,i){const s=a.style||{},r={};return z0(r,s,a),Object.assign(r,V2(a,i)),r}function B2(a,i){const s={},r=U2(a,i);return a.drag&&a.dragListener!==!1&&(s.draggable=!1,r.userSelect=r.WebkitUserSelect=r.WebkitTouchCallout="none",r.touchAction=a.drag===!0?"none":`pan-${a.drag==="x"?"y":"x"}`),a.tabIndex===void 0&&(a.onTap||a.onTapStart||a.whileTap)&&(s.tabIndex=0),s.style=r,s}const L2={offset:"stroke-dashoffset",array:"stroke-dasharray"},H2={offset:"strokeDashoffset",array:"strokeDasharray"};function k2(a,i,s=1,r=0,c=!0){a.pathLength=1;const f=c?L2:H2;a[f.offset]=it.transform(-r);const d=it.transform(i),m=it.transform(s);a[f.array]=`${d} ${m}`}function V0(a,{attrX:i,attrY:s,attrScale:r,pathLength:c,pathSpacing:f=1,pathOffset:d=0,...m},p,y,g){if(Uf(a,m,y),p){a.style.viewBox&&(a.attrs.viewBox=a.style.viewBox);return}a.attrs=a.style,a.style={};const{attrs:b,style:S}=a;b.transform&&(S.transform=b.transform,delete b.transform),(S.transform||b.transformOrigin)&&(S.transformOrigin=b.transformOrigin??"50% 50%",delete b.transformOrigin),S.transform&&(S.transformBox=g?.transformBox??"fill-box",delete b.transformBox),i!==void 0&&(b.x=i),s!==void 0&&(b.y=s),r!==void 0&&(b.scale=r),c!==void 0&&k2(b,c,f,d,!1)}const U0=()=>({...Bf(),attrs:{}}),B0=a=>typeof a=="string"&&a.toLowerCase()==="svg";function Y2(a,i,s,r){const c=E.useMemo(()=>{const f=U0();return V0(f,i,B0(r),a.transformTemplate,a.style),{...f.attrs,style:{...f.style}}},[i]);if(a.style){const f={};z0(f,a.style,a),c.style={...f,...c.style}}return c}const q2=["animate","circle","defs","desc","ellipse","g","image","line","filter","marker","mask","metadata","path","pattern","polygon","polyline","rect","stop","switch","symbol","svg","text","tspan","use","view"];function Lf(a){return typeof a!="string"||a.includes("-")?!1:!!(q2.indexOf(a)>-1||/[A-Z]/u.test(a))}function G2(a,i,s,{latestValues:r},c,f=!1){const m=(Lf(a)?Y2:B2)(i,r,c,a),p=D2(i,typeof a=="string",f),y=a!==E.Fragment?{...p,...m,ref:s}:{},{children:g}=i,b=E.useMemo(()=>he(g)?g.get():g,[g]);return E.createElement(a,{...y,children:b})}function Cy(a){const i=[{},{}];return a?.values.forEach((s,r)=>{i[0][r]=s.get(),i[1][r]=s.getVelocity()}),i}function Hf(a,i,s,r){if(typeof i=="function"){const[c,f]=Cy(r);i=i(s!==void 0?s:a.custom,c,f)}if(typeof i=="string"&&(i=a.variants&&a.variants[i]),typeof i=="function"){const[c,f]=Cy(r);i=i(s!==void 0?s:a.custom,c,f)}return i}function Rr(a){return he(a)?a.get():a}function X2({scrapeMotionValuesFromProps:a,createRenderState:i},s,r,c){return{latestValues:K2(s,r,c,a),renderState:i()}}function K2(a,i,s,r){const c={},f=r(a,{});for(const S in f)c[S]=Rr(f[S]);let{initial:d,animate:m}=a;const p=Gr(a),y=_0(a);i&&y&&!p&&a.inherit!==!1&&(d===void 0&&(d=i.initial),m===void 0&&(m=i.animate));let g=s?s.initial===!1:!1;g=g||d===!1;const b=g?m:d;if(b&&typeof b!="boolean"&&!qr(b)){const S=Array.isArray(b)?b:[b];for(let N=0;N<S.length;N++){const V=Hf(a,S[N]);if(V){const{transitionEnd:B,transition:U,...j}=V;for(const _ in j){let O=j[_];if(Array.isArray(O)){const $=g?O.length-1:0;O=O[$]}O!==null&&(c[_]=O)}for(const _ in B)c[_]=B[_]}}}return c}const L0=a=>(i,s)=>{const r=E.useContext(Yr),c=E.useContext(df),f=()=>X2(a,i,r,c);return s?f():C1(f)};function kf(a,i,s){const{style:r}=a,c={};for(const f in r)(he(r[f])||i.style&&he(i.style[f])||O0(f,a)||s?.getValue(f)?.liveStyle!==void 0)&&(c[f]=r[f]);return c}const Q2=L0({scrapeMotionValuesFromProps:kf,createRenderState:Bf});function H0(a,i,s){const r=kf(a,i,s);for(const c in a)if(he(a[c])||he(i[c])){const f=Bi.indexOf(c)!==-1?"attr"+c.charAt(0).toUpperCase()+c.substring(1):c;r[f]=a[c]}return r}const Z2=L0({scrapeMotionValuesFromProps:H0,createRenderState:U0}),$2=Symbol.for("motionComponentSymbol");function ji(a){return a&&typeof a=="object"&&Object.prototype.hasOwnProperty.call(a,"current")}function J2(a,i,s){return E.useCallback(r=>{r&&a.onMount&&a.onMount(r),i&&(r?i.mount(r):i.unmount()),s&&(typeof s=="function"?s(r):ji(s)&&(s.current=r))},[i])}const Yf=a=>a.replace(/([a-z])([A-Z])/gu,"$1-$2").toLowerCase(),P2="framerAppearId",k0="data-"+Yf(P2),Y0=E.createContext({});function F2(a,i,s,r,c){const{visualElement:f}=E.useContext(Yr),d=E.useContext(w0),m=E.useContext(df),p=E.useContext(M0).reducedMotion,y=E.useRef(null);r=r||d.renderer,!y.current&&r&&(y.current=r(a,{visualState:i,parent:f,props:s,presenceContext:m,blockInitialAnimation:m?m.initial===!1:!1,reducedMotionConfig:p}));const g=y.current,b=E.useContext(Y0);g&&!g.projection&&c&&(g.type==="html"||g.type==="svg")&&W2(y.current,s,c,b);const S=E.useRef(!1);E.useInsertionEffect(()=>{g&&S.current&&g.update(s,m)});const N=s[k0],V=E.useRef(!!N&&!window.MotionHandoffIsComplete?.(N)&&window.MotionHasOptimisedAnimation?.(N));return N1(()=>{g&&(S.current=!0,window.MotionIsMounted=!0,g.updateFeatures(),g.scheduleRenderMicrotask(),V.current&&g.animationState&&g.animationState.animateChanges())}),E.useEffect(()=>{g&&(!V.current&&g.animationState&&g.animationState.animateChanges(),V.current&&(queueMicrotask(()=>{window.MotionHandoffMarkAsComplete?.(N)}),V.current=!1),g.enteringChildren=void 0)}),g}function W2(a,i,s,r){const{layoutId:c,layout:f,drag:d,dragConstraints:m,layoutScroll:p,layoutRoot:y,layoutCrossfade:g}=i;a.projection=new s(a.latestValues,i["data-framer-portal-id"]?void 0:q0(a.parent)),a.projection.setOptions({layoutId:c,layout:f,alwaysMeasureLayout:!!d||m&&ji(m),visualElement:a,animationType:typeof f=="string"?f:"both",initialPromotionConfig:r,crossfade:g,layoutScroll:p,layoutRoot:y})}function q0(a){if(a)return a.options.allowProjection!==!1?a.projection:q0(a.parent)}function xc(a,{forwardMotionProps:i=!1}={},s,r){s&&C2(s);const c=Lf(a)?Z2:Q2;function f(m,p){let y;const g={...E.useContext(M0),...m,layoutId:I2(m)},{isStatic:b}=g,S=w2(m),N=c(m,b);if(!b&&ff){tE();const V=eE(g);y=V.MeasureLayout,S.visualElement=F2(a,N,g,r,V.ProjectionNode)}return v.jsxs(Yr.Provider,{value:S,children:[y&&S.visualElement?v.jsx(y,{visualElement:S.visualElement,...g}):null,G2(a,m,J2(N,S.visualElement,p),N,b,i)]})}f.displayName=`motion.${typeof a=="string"?a:`create(${a.displayName??a.name??""})`}`;const d=E.forwardRef(f);return d[$2]=a,d}function I2({layoutId:a}){const i=E.useContext(Hg).id;return i&&a!==void 0?i+"-"+a:a}function tE(a,i){E.useContext(w0).strict}function eE(a){const{drag:i,layout:s}=Oi;if(!i&&!s)return{};const r={...i,...s};return{MeasureLayout:i?.isEnabled(a)||s?.isEnabled(a)?r.MeasureLayout:void 0,ProjectionNode:r.ProjectionNode}}function nE(a,i){if(typeof Proxy>"u")return xc;const s=new Map,r=(f,d)=>xc(f,d,a,i),c=(f,d)=>r(f,d);return new Proxy(c,{get:(f,d)=>d==="create"?r:(s.has(d)||s.set(d,xc(d,void 0,a,i)),s.get(d))})}function G0({top:a,left:i,right:s,bottom:r}){return{x:{min:i,max:s},y:{min:a,max:r}}}function aE({x:a,y:i}){return{top:i.min,right:a.max,bottom:i.max,left:a.min}}function iE(a,i){if(!i)return a;const s=i({x:a.left,y:a.top}),r=i({x:a.right,y:a.bottom});return{top:s.y,left:s.x,bottom:r.y,right:r.x}}function bc(a){return a===void 0||a===1}function Zc({scale:a,scaleX:i,scaleY:s}){return!bc(a)||!bc(i)||!bc(s)}function Va(a){return Zc(a)||X0(a)||a.z||a.rotate||a.rotateX||a.rotateY||a.skewX||a.skewY}function X0(a){return Ny(a.x)||Ny(a.y)}function Ny(a){return a&&a!=="0%"}function Lr(a,i,s){const r=a-s,c=i*r;return s+c}function jy(a,i,s,r,c){return c!==void 0&&(a=Lr(a,c,r)),Lr(a,s,r)+i}function $c(a,i=0,s=1,r,c){a.min=jy(a.min,i,s,r,c),a.max=jy(a.max,i,s,r,c)}function K0(a,{x:i,y:s}){$c(a.x,i.translate,i.scale,i.originPoint),$c(a.y,s.translate,s.scale,s.originPoint)}const Dy=.999999999999,My=1.0000000000001;function lE(a,i,s,r=!1){const c=s.length;if(!c)return;i.x=i.y=1;let f,d;for(let m=0;m<c;m++){f=s[m],d=f.projectionDelta;const{visualElement:p}=f.options;p&&p.props.style&&p.props.style.display==="contents"||(r&&f.options.layoutScroll&&f.scroll&&f!==f.root&&Mi(a,{x:-f.scroll.offset.x,y:-f.scroll.offset.y}),d&&(i.x*=d.x.scale,i.y*=d.y.scale,K0(a,d)),r&&Va(f.latestValues)&&Mi(a,f.latestValues))}i.x<My&&i.x>Dy&&(i.x=1),i.y<My&&i.y>Dy&&(i.y=1)}function Di(a,i){a.min=a.min+i,a.max=a.max+i}function wy(a,i,s,r,c=.5){const f=Ht(a.min,a.max,c);$c(a,i,s,f,r)}function Mi(a,i){wy(a.x,i.x,i.scaleX,i.scale,i.originX),wy(a.y,i.y,i.scaleY,i.scale,i.originY)}function Q0(a,i){return G0(iE(a.getBoundingClientRect(),i))}function sE(a,i,s){const r=Q0(a,s),{scroll:c}=i;return c&&(Di(r.x,c.offset.x),Di(r.y,c.offset.y)),r}const Ry=()=>({translate:0,scale:1,origin:0,originPoint:0}),wi=()=>({x:Ry(),y:Ry()}),_y=()=>({min:0,max:0}),Zt=()=>({x:_y(),y:_y()}),Jc={current:null},Z0={current:!1};function rE(){if(Z0.current=!0,!!ff)if(window.matchMedia){const a=window.matchMedia("(prefers-reduced-motion)"),i=()=>Jc.current=a.matches;a.addEventListener("change",i),i()}else Jc.current=!1}const oE=new WeakMap;function uE(a,i,s){for(const r in i){const c=i[r],f=s[r];if(he(c))a.addValue(r,c);else if(he(f))a.addValue(r,_i(c,{owner:a}));else if(f!==c)if(a.hasValue(r)){const d=a.getValue(r);d.liveStyle===!0?d.jump(c):d.hasAnimated||d.set(c)}else{const d=a.getStaticValue(r);a.addValue(r,_i(d!==void 0?d:c,{owner:a}))}}for(const r in s)i[r]===void 0&&a.removeValue(r);return i}const Oy=["AnimationStart","AnimationComplete","Update","BeforeLayoutMeasure","LayoutMeasure","LayoutAnimationStart","LayoutAnimationComplete"];class cE{scrapeMotionValuesFromProps(i,s,r){return{}}constructor({parent:i,props:s,presenceContext:r,reducedMotionConfig:c,blockInitialAnimation:f,visualState:d},m={}){this.current=null,this.children=new Set,this.isVariantNode=!1,this.isControllingVariants=!1,this.shouldReduceMotion=null,this.values=new Map,this.KeyframeResolver=Mf,this.features={},this.valueSubscriptions=new Map,this.prevMotionValues={},this.events={},this.propEventSubscriptions={},this.notifyUpdate=()=>this.notify("Update",this.latestValues),this.render=()=>{this.current&&(this.triggerBuild(),this.renderInstance(this.current,this.renderState,this.props.style,this.projection))},this.renderScheduledAt=0,this.scheduleRender=()=>{const S=Ce.now();this.renderScheduledAt<S&&(this.renderScheduledAt=S,Ut.render(this.render,!1,!0))};const{latestValues:p,renderState:y}=d;this.latestValues=p,this.baseTarget={...p},this.initialValues=s.initial?{...p}:{},this.renderState=y,this.parent=i,this.props=s,this.presenceContext=r,this.depth=i?i.depth+1:0,this.reducedMotionConfig=c,this.options=m,this.blockInitialAnimation=!!f,this.isControllingVariants=Gr(s),this.isVariantNode=_0(s),this.isVariantNode&&(this.variantChildren=new Set),this.manuallyAnimateOnMount=!!(i&&i.current);const{willChange:g,...b}=this.scrapeMotionValuesFromProps(s,{},this);for(const S in b){const N=b[S];p[S]!==void 0&&he(N)&&N.set(p[S])}}mount(i){this.current=i,oE.set(i,this),this.projection&&!this.projection.instance&&this.projection.mount(i),this.parent&&this.isVariantNode&&!this.isControllingVariants&&(this.removeFromVariantTree=this.parent.addVariantChild(this)),this.values.forEach((s,r)=>this.bindToMotionValue(r,s)),Z0.current||rE(),this.shouldReduceMotion=this.reducedMotionConfig==="never"?!1:this.reducedMotionConfig==="always"?!0:Jc.current,this.parent?.addChild(this),this.update(this.props,this.presenceContext)}unmount(){this.projection&&this.projection.unmount(),ua(this.notifyUpdate),ua(this.render),this.valueSubscriptions.forEach(i=>i()),this.valueSubscriptions.clear(),this.removeFromVariantTree&&this.removeFromVariantTree(),this.parent?.removeChild(this);for(const i in this.events)this.events[i].clear();for(const i in this.features){const s=this.features[i];s&&(s.unmount(),s.isMounted=!1)}this.current=null}addChild(i){this.children.add(i),this.enteringChildren??(this.enteringChildren=new Set),this.enteringChildren.add(i)}removeChild(i){this.children.delete(i),this.enteringChildren&&this.enteringChildren.delete(i)}bindToMotionValue(i,s){this.valueSubscriptions.has(i)&&this.valueSubscriptions.get(i)();const r=Li.has(i);r&&this.onBindTransform&&this.onBindTransform();const c=s.on("change",d=>{this.latestValues[i]=d,this.props.onUpdate&&Ut.preRender(this.notifyUpdate),r&&this.projection&&(this.projection.isTransformDirty=!0),this.scheduleRender()});let f;window.MotionCheckAppearSync&&(f=window.MotionCheckAppearSync(this,i,s)),this.valueSubscriptions.set(i,()=>{c(),f&&f(),s.owner&&s.stop()})}sortNodePosition(i){return!this.current||!this.sortInstanceNodePosition||this.type!==i.type?0:this.sortInstanceNodePosition(this.current,i.current)}updateFeatures(){let i="animation";for(i in Oi){const s=Oi[i];if(!s)continue;const{isEnabled:r,Feature:c}=s;if(!this.features[i]&&c&&r(this.props)&&(this.features[i]=new c(this)),this.features[i]){const f=this.features[i];f.isMounted?f.update():(f.mount(),f.isMounted=!0)}}}triggerBuild(){this.build(this.renderState,this.latestValues,this.props)}measureViewportBox(){return this.current?this.measureInstanceViewportBox(this.current,this.props):Zt()}getStaticValue(i){return this.latestValues[i]}setStaticValue(i,s){this.latestValues[i]=s}update(i,s){(i.transformTemplate||this.props.transformTemplate)&&this.scheduleRender(),this.prevProps=this.props,this.props=i,this.prevPresenceContext=this.presenceContext,this.presenceContext=s;for(let r=0;r<Oy.length;r++){const c=Oy[r];this.propEventSubscriptions[c]&&(this.propEventSubscriptions[c](),delete this.propEventSubscriptions[c]);const f="on"+c,d=i[f];d&&(this.propEventSubscriptions[c]=this.on(c,d))}this.prevMotionValues=uE(this,this.scrapeMotionValuesFromProps(i,this.prevProps,this),this.prevMotionValues),this.handleChildMotionValue&&this.handleChildMotionValue()}getProps(){return this.props}getVariant(i){return this.props.variants?this.props.variants[i]:void 0}getDefaultTransition(){return this.props.transition}getTransformPagePoint(){return this.props.transformPagePoint}getClosestVariantNode(){return this.isVariantNode?this:this.parent?this.parent.getClosestVariantNode():void 0}addVariantChild(i){const s=this.getClosestVariantNode();if(s)return s.variantChildren&&s.variantChildren.add(i),()=>s.variantChildren.delete(i)}addValue(i,s){const r=this.values.get(i);s!==r&&(r&&this.removeValue(i),this.bindToMotionValue(i,s),this.values.set(i,s),this.latestValues[i]=s.get())}removeValue(i){this.values.delete(i);const s=this.valueSubscriptions.get(i);s&&(s(),this.valueSubscriptions.delete(i)),delete this.latestValues[i],this.removeValueFromRenderState(i,this.renderState)}hasValue(i){return this.values.has(i)}getValue(i,s){if(this.props.values&&this.props.values[i])return this.props.values[i];let r=this.values.get(i);return r===void 0&&s!==void 0&&(r=_i(s===null?void 0:s,{owner:this}),this.addValue(i,r)),r}readValue(i,s){let r=this.latestValues[i]!==void 0||!this.current?this.latestValues[i]:this.getBaseTargetFromProps(this.props,i)??this.readValueFromInstance(this.current,i,this.options);return r!=null&&(typeof r=="string"&&(kg(r)||qg(r))?r=parseFloat(r):!E2(r)&&ca.test(s)&&(r=E0(i,s)),this.setBaseTarget(i,he(r)?r.get():r)),he(r)?r.get():r}setBaseTarget(i,s){this.baseTarget[i]=s}getBaseTarget(i){const{initial:s}=this.props;let r;if(typeof s=="string"||typeof s=="object"){const f=Hf(this.props,s,this.presenceContext?.custom);f&&(r=f[i])}if(s&&r!==void 0)return r;const c=this.getBaseTargetFromProps(this.props,i);return c!==void 0&&!he(c)?c:this.initialValues[i]!==void 0&&r===void 0?void 0:this.baseTarget[i]}on(i,s){return this.events[i]||(this.events[i]=new gf),this.events[i].add(s)}notify(i,...s){this.events[i]&&this.events[i].notify(...s)}scheduleRenderMicrotask(){_f.render(this.render)}}class $0 extends cE{constructor(){super(...arguments),this.KeyframeResolver=c2}sortInstanceNodePosition(i,s){return i.compareDocumentPosition(s)&2?1:-1}getBaseTargetFromProps(i,s){return i.style?i.style[s]:void 0}removeValueFromRenderState(i,{vars:s,style:r}){delete s[i],delete r[i]}handleChildMotionValue(){this.childSubscription&&(this.childSubscription(),delete this.childSubscription);const{children:i}=this.props;he(i)&&(this.childSubscription=i.on("change",s=>{this.current&&(this.current.textContent=`${s}`)}))}}function J0(a,{style:i,vars:s},r,c){const f=a.style;let d;for(d in i)f[d]=i[d];c?.applyProjectionStyles(f,r);for(d in s)f.setProperty(d,s[d])}function fE(a){return window.getComputedStyle(a)}class dE extends $0{constructor(){super(...arguments),this.type="html",this.renderInstance=J0}readValueFromInstance(i,s){if(Li.has(s))return this.projection?.isProjecting?kc(s):MT(i,s);{const r=fE(i),c=(bf(s)?r.getPropertyValue(s):r[s])||0;return typeof c=="string"?c.trim():c}}measureInstanceViewportBox(i,{transformPagePoint:s}){return Q0(i,s)}build(i,s,r){Uf(i,s,r.transformTemplate)}scrapeMotionValuesFromProps(i,s,r){return kf(i,s,r)}}const P0=new Set(["baseFrequency","diffuseConstant","kernelMatrix","kernelUnitLength","keySplines","keyTimes","limitingConeAngle","markerHeight","markerWidth","numOctaves","targetX","targetY","surfaceScale","specularConstant","specularExponent","stdDeviation","tableValues","viewBox","gradientTransform","pathLength","startOffset","textLength","lengthAdjust"]);function hE(a,i,s,r){J0(a,i,void 0,r);for(const c in i.attrs)a.setAttribute(P0.has(c)?c:Yf(c),i.attrs[c])}class mE extends $0{constructor(){super(...arguments),this.type="svg",this.isSVGTag=!1,this.measureInstanceViewportBox=Zt}getBaseTargetFromProps(i,s){return i[s]}readValueFromInstance(i,s){if(Li.has(s)){const r=T0(s);return r&&r.default||0}return s=P0.has(s)?s:Yf(s),i.getAttribute(s)}scrapeMotionValuesFromProps(i,s,r){return H0(i,s,r)}build(i,s,r){V0(i,s,this.isSVGTag,r.transformTemplate,r.style)}renderInstance(i,s,r,c){hE(i,s,r,c)}mount(i){this.isSVGTag=B0(i.tagName),super.mount(i)}}const pE=(a,i)=>Lf(a)?new mE(i):new dE(i,{allowProjection:a!==E.Fragment});function Ri(a,i,s){const r=a.getProps();return Hf(r,i,s!==void 0?s:r.custom,a)}const Pc=a=>Array.isArray(a);function yE(a,i,s){a.hasValue(i)?a.getValue(i).set(s):a.addValue(i,_i(s))}function gE(a){return Pc(a)?a[a.length-1]||0:a}function vE(a,i){const s=Ri(a,i);let{transitionEnd:r={},transition:c={},...f}=s||{};f={...f,...r};for(const d in f){const m=gE(f[d]);yE(a,d,m)}}function xE(a){return!!(he(a)&&a.add)}function Fc(a,i){const s=a.getValue("willChange");if(xE(s))return s.add(i);if(!s&&On.WillChange){const r=new On.WillChange("auto");a.addValue("willChange",r),r.add(i)}}function F0(a){return a.props[k0]}const bE=a=>a!==null;function SE(a,{repeat:i,repeatType:s="loop"},r){const c=a.filter(bE),f=i&&s!=="loop"&&i%2===1?0:c.length-1;return c[f]}const TE={type:"spring",stiffness:500,damping:25,restSpeed:10},EE=a=>({type:"spring",stiffness:550,damping:a===0?2*Math.sqrt(550):30,restSpeed:10}),AE={type:"keyframes",duration:.8},CE={type:"keyframes",ease:[.25,.1,.35,1],duration:.3},NE=(a,{keyframes:i})=>i.length>2?AE:Li.has(a)?a.startsWith("scale")?EE(i[1]):TE:CE;function jE({when:a,delay:i,delayChildren:s,staggerChildren:r,staggerDirection:c,repeat:f,repeatType:d,repeatDelay:m,from:p,elapsed:y,...g}){return!!Object.keys(g).length}const qf=(a,i,s,r={},c,f)=>d=>{const m=wf(r,a)||{},p=m.delay||r.delay||0;let{elapsed:y=0}=r;y=y-cn(p);const g={keyframes:Array.isArray(s)?s:[null,s],ease:"easeOut",velocity:i.getVelocity(),...m,delay:-y,onUpdate:S=>{i.set(S),m.onUpdate&&m.onUpdate(S)},onComplete:()=>{d(),m.onComplete&&m.onComplete()},name:a,motionValue:i,element:f?void 0:c};jE(m)||Object.assign(g,NE(a,g)),g.duration&&(g.duration=cn(g.duration)),g.repeatDelay&&(g.repeatDelay=cn(g.repeatDelay)),g.from!==void 0&&(g.keyframes[0]=g.from);let b=!1;if((g.type===!1||g.duration===0&&!g.repeatDelay)&&(Kc(g),g.delay===0&&(b=!0)),(On.instantAnimations||On.skipAnimations)&&(b=!0,Kc(g),g.delay=0),g.allowFlatten=!m.type&&!m.ease,b&&!f&&i.get()!==void 0){const S=SE(g.keyframes,m);if(S!==void 0){Ut.update(()=>{g.onUpdate(S),g.onComplete()});return}}return m.isSync?new Df(g):new WT(g)};function DE({protectedKeys:a,needsAnimating:i},s){const r=a.hasOwnProperty(s)&&i[s]!==!0;return i[s]=!1,r}function W0(a,i,{delay:s=0,transitionOverride:r,type:c}={}){let{transition:f=a.getDefaultTransition(),transitionEnd:d,...m}=i;r&&(f=r);const p=[],y=c&&a.animationState&&a.animationState.getState()[c];for(const g in m){const b=a.getValue(g,a.latestValues[g]??null),S=m[g];if(S===void 0||y&&DE(y,g))continue;const N={delay:s,...wf(f||{},g)},V=b.get();if(V!==void 0&&!b.isAnimating&&!Array.isArray(S)&&S===V&&!N.velocity)continue;let B=!1;if(window.MotionHandoffAnimation){const j=F0(a);if(j){const _=window.MotionHandoffAnimation(j,g,Ut);_!==null&&(N.startTime=_,B=!0)}}Fc(a,g),b.start(qf(g,b,S,a.shouldReduceMotion&&x0.has(g)?{type:!1}:N,a,B));const U=b.animation;U&&p.push(U)}return d&&Promise.all(p).then(()=>{Ut.update(()=>{d&&vE(a,d)})}),p}function I0(a,i,s,r=0,c=1){const f=Array.from(a).sort((y,g)=>y.sortNodePosition(g)).indexOf(i),d=a.size,m=(d-1)*r;return typeof s=="function"?s(f,d):c===1?f*r:m-f*r}function Wc(a,i,s={}){const r=Ri(a,i,s.type==="exit"?a.presenceContext?.custom:void 0);let{transition:c=a.getDefaultTransition()||{}}=r||{};s.transitionOverride&&(c=s.transitionOverride);const f=r?()=>Promise.all(W0(a,r,s)):()=>Promise.resolve(),d=a.variantChildren&&a.variantChildren.size?(p=0)=>{const{delayChildren:y=0,staggerChildren:g,staggerDirection:b}=c;return ME(a,i,p,y,g,b,s)}:()=>Promise.resolve(),{when:m}=c;if(m){const[p,y]=m==="beforeChildren"?[f,d]:[d,f];return p().then(()=>y())}else return Promise.all([f(),d(s.delay)])}function ME(a,i,s=0,r=0,c=0,f=1,d){const m=[];for(const p of a.variantChildren)p.notify("AnimationStart",i),m.push(Wc(p,i,{...d,delay:s+(typeof r=="function"?0:r)+I0(a.variantChildren,p,r,c,f)}).then(()=>p.notify("AnimationComplete",i)));return Promise.all(m)}function wE(a,i,s={}){a.notify("AnimationStart",i);let r;if(Array.isArray(i)){const c=i.map(f=>Wc(a,f,s));r=Promise.all(c)}else if(typeof i=="string")r=Wc(a,i,s);else{const c=typeof i=="function"?Ri(a,i,s.custom):i;r=Promise.all(W0(a,c,s))}return r.then(()=>{a.notify("AnimationComplete",i)})}function tv(a,i){if(!Array.isArray(i))return!1;const s=i.length;if(s!==a.length)return!1;for(let r=0;r<s;r++)if(i[r]!==a[r])return!1;return!0}const RE=Vf.length;function ev(a){if(!a)return;if(!a.isControllingVariants){const s=a.parent?ev(a.parent)||{}:{};return a.props.initial!==void 0&&(s.initial=a.props.initial),s}const i={};for(let s=0;s<RE;s++){const r=Vf[s],c=a.props[r];($l(c)||c===!1)&&(i[r]=c)}return i}const _E=[...zf].reverse(),OE=zf.length;function zE(a){return i=>Promise.all(i.map(({animation:s,options:r})=>wE(a,s,r)))}function VE(a){let i=zE(a),s=zy(),r=!0;const c=p=>(y,g)=>{const b=Ri(a,g,p==="exit"?a.presenceContext?.custom:void 0);if(b){const{transition:S,transitionEnd:N,...V}=b;y={...y,...V,...N}}return y};function f(p){i=p(a)}function d(p){const{props:y}=a,g=ev(a.parent)||{},b=[],S=new Set;let N={},V=1/0;for(let U=0;U<OE;U++){const j=_E[U],_=s[j],O=y[j]!==void 0?y[j]:g[j],$=$l(O),K=j===p?_.isActive:null;K===!1&&(V=U);let tt=O===g[j]&&O!==y[j]&&$;if(tt&&r&&a.manuallyAnimateOnMount&&(tt=!1),_.protectedKeys={...N},!_.isActive&&K===null||!O&&!_.prevProp||qr(O)||typeof O=="boolean")continue;const Q=UE(_.prevProp,O);let P=Q||j===p&&_.isActive&&!tt&&$||U>V&&$,ht=!1;const Tt=Array.isArray(O)?O:[O];let kt=Tt.reduce(c(j),{});K===!1&&(kt={});const{prevResolvedValues:It={}}=_,fe={...It,...kt},me=X=>{P=!0,S.has(X)&&(ht=!0,S.delete(X)),_.needsAnimating[X]=!0;const J=a.getValue(X);J&&(J.liveStyle=!1)};for(const X in fe){const J=kt[X],ut=It[X];if(N.hasOwnProperty(X))continue;let pt=!1;Pc(J)&&Pc(ut)?pt=!tv(J,ut):pt=J!==ut,pt?J!=null?me(X):S.add(X):J!==void 0&&S.has(X)?me(X):_.protectedKeys[X]=!0}_.prevProp=O,_.prevResolvedValues=kt,_.isActive&&(N={...N,...kt}),r&&a.blockInitialAnimation&&(P=!1);const te=tt&&Q;P&&(!te||ht)&&b.push(...Tt.map(X=>{const J={type:j};if(typeof X=="string"&&r&&!te&&a.manuallyAnimateOnMount&&a.parent){const{parent:ut}=a,pt=Ri(ut,X);if(ut.enteringChildren&&pt){const{delayChildren:C}=pt.transition||{};J.delay=I0(ut.enteringChildren,a,C)}}return{animation:X,options:J}}))}if(S.size){const U={};if(typeof y.initial!="boolean"){const j=Ri(a,Array.isArray(y.initial)?y.initial[0]:y.initial);j&&j.transition&&(U.transition=j.transition)}S.forEach(j=>{const _=a.getBaseTarget(j),O=a.getValue(j);O&&(O.liveStyle=!0),U[j]=_??null}),b.push({animation:U})}let B=!!b.length;return r&&(y.initial===!1||y.initial===y.animate)&&!a.manuallyAnimateOnMount&&(B=!1),r=!1,B?i(b):Promise.resolve()}function m(p,y){if(s[p].isActive===y)return Promise.resolve();a.variantChildren?.forEach(b=>b.animationState?.setActive(p,y)),s[p].isActive=y;const g=d(p);for(const b in s)s[b].protectedKeys={};return g}return{animateChanges:d,setActive:m,setAnimateFunction:f,getState:()=>s,reset:()=>{s=zy()}}}function UE(a,i){return typeof i=="string"?i!==a:Array.isArray(i)?!tv(i,a):!1}function za(a=!1){return{isActive:a,protectedKeys:{},needsAnimating:{},prevResolvedValues:{}}}function zy(){return{animate:za(!0),whileInView:za(),whileHover:za(),whileTap:za(),whileDrag:za(),whileFocus:za(),exit:za()}}class ha{constructor(i){this.isMounted=!1,this.node=i}update(){}}class BE extends ha{constructor(i){super(i),i.animationState||(i.animationState=VE(i))}updateAnimationControlsSubscription(){const{animate:i}=this.node.getProps();qr(i)&&(this.unmountControls=i.subscribe(this.node))}mount(){this.updateAnimationControlsSubscription()}update(){const{animate:i}=this.node.getProps(),{animate:s}=this.node.prevProps||{};i!==s&&this.updateAnimationControlsSubscription()}unmount(){this.node.animationState.reset(),this.unmountControls?.()}}let LE=0;class HE extends ha{constructor(){super(...arguments),this.id=LE++}update(){if(!this.node.presenceContext)return;const{isPresent:i,onExitComplete:s}=this.node.presenceContext,{isPresent:r}=this.node.prevPresenceContext||{};if(!this.node.animationState||i===r)return;const c=this.node.animationState.setActive("exit",!i);s&&!i&&c.then(()=>{s(this.id)})}mount(){const{register:i,onExitComplete:s}=this.node.presenceContext||{};s&&s(this.id),i&&(this.unmount=i(this.id))}unmount(){}}const kE={animation:{Feature:BE},exit:{Feature:HE}};function Pl(a,i,s,r={passive:!0}){return a.addEventListener(i,s,r),()=>a.removeEventListener(i,s)}function ns(a){return{point:{x:a.pageX,y:a.pageY}}}const YE=a=>i=>Of(i)&&a(i,ns(i));function Yl(a,i,s,r){return Pl(a,i,YE(s),r)}const nv=1e-4,qE=1-nv,GE=1+nv,av=.01,XE=0-av,KE=0+av;function ge(a){return a.max-a.min}function QE(a,i,s){return Math.abs(a-i)<=s}function Vy(a,i,s,r=.5){a.origin=r,a.originPoint=Ht(i.min,i.max,a.origin),a.scale=ge(s)/ge(i),a.translate=Ht(s.min,s.max,a.origin)-a.originPoint,(a.scale>=qE&&a.scale<=GE||isNaN(a.scale))&&(a.scale=1),(a.translate>=XE&&a.translate<=KE||isNaN(a.translate))&&(a.translate=0)}function ql(a,i,s,r){Vy(a.x,i.x,s.x,r?r.originX:void 0),Vy(a.y,i.y,s.y,r?r.originY:void 0)}function Uy(a,i,s){a.min=s.min+i.min,a.max=a.min+ge(i)}function ZE(a,i,s){Uy(a.x,i.x,s.x),Uy(a.y,i.y,s.y)}function By(a,i,s){a.min=i.min-s.min,a.max=a.min+ge(i)}function Gl(a,i,s){By(a.x,i.x,s.x),By(a.y,i.y,s.y)}function Pe(a){return[a("x"),a("y")]}const iv=({current:a})=>a?a.ownerDocument.defaultView:null,Ly=(a,i)=>Math.abs(a-i);function $E(a,i){const s=Ly(a.x,i.x),r=Ly(a.y,i.y);return Math.sqrt(s**2+r**2)}class lv{constructor(i,s,{transformPagePoint:r,contextWindow:c=window,dragSnapToOrigin:f=!1,distanceThreshold:d=3}={}){if(this.startEvent=null,this.lastMoveEvent=null,this.lastMoveEventInfo=null,this.handlers={},this.contextWindow=window,this.updatePoint=()=>{if(!(this.lastMoveEvent&&this.lastMoveEventInfo))return;const S=Tc(this.lastMoveEventInfo,this.history),N=this.startEvent!==null,V=$E(S.offset,{x:0,y:0})>=this.distanceThreshold;if(!N&&!V)return;const{point:B}=S,{timestamp:U}=ce;this.history.push({...B,timestamp:U});const{onStart:j,onMove:_}=this.handlers;N||(j&&j(this.lastMoveEvent,S),this.startEvent=this.lastMoveEvent),_&&_(this.lastMoveEvent,S)},this.handlePointerMove=(S,N)=>{this.lastMoveEvent=S,this.lastMoveEventInfo=Sc(N,this.transformPagePoint),Ut.update(this.updatePoint,!0)},this.handlePointerUp=(S,N)=>{this.end();const{onEnd:V,onSessionEnd:B,resumeAnimation:U}=this.handlers;if(this.dragSnapToOrigin&&U&&U(),!(this.lastMoveEvent&&this.lastMoveEventInfo))return;const j=Tc(S.type==="pointercancel"?this.lastMoveEventInfo:Sc(N,this.transformPagePoint),this.history);this.startEvent&&V&&V(S,j),B&&B(S,j)},!Of(i))return;this.dragSnapToOrigin=f,this.handlers=s,this.transformPagePoint=r,this.distanceThreshold=d,this.contextWindow=c||window;const m=ns(i),p=Sc(m,this.transformPagePoint),{point:y}=p,{timestamp:g}=ce;this.history=[{...y,timestamp:g}];const{onSessionStart:b}=s;b&&b(i,Tc(p,this.history)),this.removeListeners=Il(Yl(this.contextWindow,"pointermove",this.handlePointerMove),Yl(this.contextWindow,"pointerup",this.handlePointerUp),Yl(this.contextWindow,"pointercancel",this.handlePointerUp))}updateHandlers(i){this.handlers=i}end(){this.removeListeners&&this.removeListeners(),ua(this.updatePoint)}}function Sc(a,i){return i?{point:i(a.point)}:a}function Hy(a,i){return{x:a.x-i.x,y:a.y-i.y}}function Tc({point:a},i){return{point:a,delta:Hy(a,sv(i)),offset:Hy(a,JE(i)),velocity:PE(i,.1)}}function JE(a){return a[0]}function sv(a){return a[a.length-1]}function PE(a,i){if(a.length<2)return{x:0,y:0};let s=a.length-1,r=null;const c=sv(a);for(;s>=0&&(r=a[s],!(c.timestamp-r.timestamp>cn(i)));)s--;if(!r)return{x:0,y:0};const f=Fe(c.timestamp-r.timestamp);if(f===0)return{x:0,y:0};const d={x:(c.x-r.x)/f,y:(c.y-r.y)/f};return d.x===1/0&&(d.x=0),d.y===1/0&&(d.y=0),d}function FE(a,{min:i,max:s},r){return i!==void 0&&a<i?a=r?Ht(i,a,r.min):Math.max(a,i):s!==void 0&&a>s&&(a=r?Ht(s,a,r.max):Math.min(a,s)),a}function ky(a,i,s){return{min:i!==void 0?a.min+i:void 0,max:s!==void 0?a.max+s-(a.max-a.min):void 0}}function WE(a,{top:i,left:s,bottom:r,right:c}){return{x:ky(a.x,s,c),y:ky(a.y,i,r)}}function Yy(a,i){let s=i.min-a.min,r=i.max-a.max;return i.max-i.min<a.max-a.min&&([s,r]=[r,s]),{min:s,max:r}}function IE(a,i){return{x:Yy(a.x,i.x),y:Yy(a.y,i.y)}}function tA(a,i){let s=.5;const r=ge(a),c=ge(i);return c>r?s=Kl(i.min,i.max-r,a.min):r>c&&(s=Kl(a.min,a.max-c,i.min)),_n(0,1,s)}function eA(a,i){const s={};return i.min!==void 0&&(s.min=i.min-a.min),i.max!==void 0&&(s.max=i.max-a.min),s}const Ic=.35;function nA(a=Ic){return a===!1?a=0:a===!0&&(a=Ic),{x:qy(a,"left","right"),y:qy(a,"top","bottom")}}function qy(a,i,s){return{min:Gy(a,i),max:Gy(a,s)}}function Gy(a,i){return typeof a=="number"?a:a[i]||0}const aA=new WeakMap;class iA{constructor(i){this.openDragLock=null,this.isDragging=!1,this.currentDirection=null,this.originPoint={x:0,y:0},this.constraints=!1,this.hasMutatedConstraints=!1,this.elastic=Zt(),this.latestPointerEvent=null,this.latestPanInfo=null,this.visualElement=i}start(i,{snapToCursor:s=!1,distanceThreshold:r}={}){const{presenceContext:c}=this.visualElement;if(c&&c.isPresent===!1)return;const f=b=>{const{dragSnapToOrigin:S}=this.getProps();S?this.pauseAnimation():this.stopAnimation(),s&&this.snapToCursor(ns(b).point)},d=(b,S)=>{const{drag:N,dragPropagation:V,onDragStart:B}=this.getProps();if(N&&!V&&(this.openDragLock&&this.openDragLock(),this.openDragLock=p2(N),!this.openDragLock))return;this.latestPointerEvent=b,this.latestPanInfo=S,this.isDragging=!0,this.currentDirection=null,this.resolveConstraints(),this.visualElement.projection&&(this.visualElement.projection.isAnimationBlocked=!0,this.visualElement.projection.target=void 0),Pe(j=>{let _=this.getAxisMotionValue(j).get()||0;if(fn.test(_)){const{projection:O}=this.visualElement;if(O&&O.layout){const $=O.layout.layoutBox[j];$&&(_=ge($)*(parseFloat(_)/100))}}this.originPoint[j]=_}),B&&Ut.postRender(()=>B(b,S)),Fc(this.visualElement,"transform");const{animationState:U}=this.visualElement;U&&U.setActive("whileDrag",!0)},m=(b,S)=>{this.latestPointerEvent=b,this.latestPanInfo=S;const{dragPropagation:N,dragDirectionLock:V,onDirectionLock:B,onDrag:U}=this.getProps();if(!N&&!this.openDragLock)return;const{offset:j}=S;if(V&&this.currentDirection===null){this.currentDirection=lA(j),this.currentDirection!==null&&B&&B(this.currentDirection);return}this.updateAxis("x",S.point,j),this.updateAxis("y",S.point,j),this.visualElement.render(),U&&U(b,S)},p=(b,S)=>{this.latestPointerEvent=b,this.latestPanInfo=S,this.stop(b,S),this.latestPointerEvent=null,this.latestPanInfo=null},y=()=>Pe(b=>this.getAnimationState(b)==="paused"&&this.getAxisMotionValue(b).animation?.play()),{dragSnapToOrigin:g}=this.getProps();this.panSession=new lv(i,{onSessionStart:f,onStart:d,onMove:m,onSessionEnd:p,resumeAnimation:y},{transformPagePoint:this.visualElement.getTransformPagePoint(),dragSnapToOrigin:g,distanceThreshold:r,contextWindow:iv(this.visualElement)})}stop(i,s){const r=i||this.latestPointerEvent,c=s||this.latestPanInfo,f=this.isDragging;if(this.cancel(),!f||!c||!r)return;const{velocity:d}=c;this.startAnimation(d);const{onDragEnd:m}=this.getProps();m&&Ut.postRender(()=>m(r,c))}cancel(){this.isDragging=!1;const{projection:i,animationState:s}=this.visualElement;i&&(i.isAnimationBlocked=!1),this.panSession&&this.panSession.end(),this.panSession=void 0;const{dragPropagation:r}=this.getProps();!r&&this.openDragLock&&(this.openDragLock(),this.openDragLock=null),s&&s.setActive("whileDrag",!1)}updateAxis(i,s,r){const{drag:c}=this.getProps();if(!r||!Ar(i,c,this.currentDirection))return;const f=this.getAxisMotionValue(i);let d=this.originPoint[i]+r[i];this.constraints&&this.constraints[i]&&(d=FE(d,this.constraints[i],this.elastic[i])),f.set(d)}resolveConstraints(){const{dragConstraints:i,dragElastic:s}=this.getProps(),r=this.visualElement.projection&&!this.visualElement.projection.layout?this.visualElement.projection.measure(!1):this.visualElement.projection?.layout,c=this.constraints;i&&ji(i)?this.constraints||(this.constraints=this.resolveRefConstraints()):i&&r?this.constraints=WE(r.layoutBox,i):this.constraints=!1,this.elastic=nA(s),c!==this.constraints&&r&&this.constraints&&!this.hasMutatedConstraints&&Pe(f=>{this.constraints!==!1&&this.getAxisMotionValue(f)&&(this.constraints[f]=eA(r.layoutBox[f],this.constraints[f]))})}resolveRefConstraints(){const{dragConstraints:i,onMeasureDragConstraints:s}=this.getProps();if(!i||!ji(i))return!1;const r=i.current,{projection:c}=this.visualElement;if(!c||!c.layout)return!1;const f=sE(r,c.root,this.visualElement.getTransformPagePoint());let d=IE(c.layout.layoutBox,f);if(s){const m=s(aE(d));this.hasMutatedConstraints=!!m,m&&(d=G0(m))}return d}startAnimation(i){const{drag:s,dragMomentum:r,dragElastic:c,dragTransition:f,dragSnapToOrigin:d,onDragTransitionEnd:m}=this.getProps(),p=this.constraints||{},y=Pe(g=>{if(!Ar(g,s,this.currentDirection))return;let b=p&&p[g]||{};d&&(b={min:0,max:0});const S=c?200:1e6,N=c?40:1e7,V={type:"inertia",velocity:r?i[g]:0,bounceStiffness:S,bounceDamping:N,timeConstant:750,restDelta:1,restSpeed:10,...f,...b};return this.startAxisValueAnimation(g,V)});return Promise.all(y).then(m)}startAxisValueAnimation(i,s){const r=this.getAxisMotionValue(i);return Fc(this.visualElement,i),r.start(qf(i,r,0,s,this.visualElement,!1))}stopAnimation(){Pe(i=>this.getAxisMotionValue(i).stop())}pauseAnimation(){Pe(i=>this.getAxisMotionValue(i).animation?.pause())}getAnimationState(i){return this.getAxisMotionValue(i).animation?.state}getAxisMotionValue(i){const s=`_drag${i.toUpperCase()}`,r=this.visualElement.getProps(),c=r[s];return c||this.visualElement.getValue(i,(r.initial?r.initial[i]:void 0)||0)}snapToCursor(i){Pe(s=>{const{drag:r}=this.getProps();if(!Ar(s,r,this.currentDirection))return;const{projection:c}=this.visualElement,f=this.getAxisMotionValue(s);if(c&&c.layout){const{min:d,max:m}=c.layout.layoutBox[s];f.set(i[s]-Ht(d,m,.5))}})}scalePositionWithinConstraints(){if(!this.visualElement.current)return;const{drag:i,dragConstraints:s}=this.getProps(),{projection:r}=this.visualElement;if(!ji(s)||!r||!this.constraints)return;this.stopAnimation();const c={x:0,y:0};Pe(d=>{const m=this.getAxisMotionValue(d);if(m&&this.constraints!==!1){const p=m.get();c[d]=tA({min:p,max:p},this.constraints[d])}});const{transformTemplate:f}=this.visualElement.getProps();this.visualElement.current.style.transform=f?f({},""):"none",r.root&&r.root.updateScroll(),r.updateLayout(),this.resolveConstraints(),Pe(d=>{if(!Ar(d,i,null))return;const m=this.getAxisMotionValue(d),{min:p,max:y}=this.constraints[d];m.set(Ht(p,y,c[d]))})}addListeners(){if(!this.visualElement.current)return;aA.set(this.visualElement,this);const i=this.visualElement.current,s=Yl(i,"pointerdown",p=>{const{drag:y,dragListener:g=!0}=this.getProps();y&&g&&this.start(p)}),r=()=>{const{dragConstraints:p}=this.getProps();ji(p)&&p.current&&(this.constraints=this.resolveRefConstraints())},{projection:c}=this.visualElement,f=c.addEventListener("measure",r);c&&!c.layout&&(c.root&&c.root.updateScroll(),c.updateLayout()),Ut.read(r);const d=Pl(window,"resize",()=>this.scalePositionWithinConstraints()),m=c.addEventListener("didUpdate",(({delta:p,hasLayoutChanged:y})=>{this.isDragging&&y&&(Pe(g=>{const b=this.getAxisMotionValue(g);b&&(this.originPoint[g]+=p[g].translate,b.set(b.get()+p[g].translate))}),this.visualElement.render())}));return()=>{d(),s(),f(),m&&m()}}getProps(){const i=this.visualElement.getProps(),{drag:s=!1,dragDirectionLock:r=!1,dragPropagation:c=!1,dragConstraints:f=!1,dragElastic:d=Ic,dragMomentum:m=!0}=i;return{...i,drag:s,dragDirectionLock:r,dragPropagation:c,dragConstraints:f,dragElastic:d,dragMomentum:m}}}function Ar(a,i,s){return(i===!0||i===a)&&(s===null||s===a)}function lA(a,i=10){let s=null;return Math.abs(a.y)>i?s="y":Math.abs(a.x)>i&&(s="x"),s}class sA extends ha{constructor(i){super(i),this.removeGroupControls=We,this.removeListeners=We,this.controls=new iA(i)}mount(){const{dragControls:i}=this.node.getProps();i&&(this.removeGroupControls=i.subscribe(this.controls)),this.removeListeners=this.controls.addListeners()||We}unmount(){this.removeGroupControls(),this.removeListeners()}}const Xy=a=>(i,s)=>{a&&Ut.postRender(()=>a(i,s))};class rA extends ha{constructor(){super(...arguments),this.removePointerDownListener=We}onPointerDown(i){this.session=new lv(i,this.createPanHandlers(),{transformPagePoint:this.node.getTransformPagePoint(),contextWindow:iv(this.node)})}createPanHandlers(){const{onPanSessionStart:i,onPanStart:s,onPan:r,onPanEnd:c}=this.node.getProps();return{onSessionStart:Xy(i),onStart:Xy(s),onMove:r,onEnd:(f,d)=>{delete this.session,c&&Ut.postRender(()=>c(f,d))}}}mount(){this.removePointerDownListener=Yl(this.node.current,"pointerdown",i=>this.onPointerDown(i))}update(){this.session&&this.session.updateHandlers(this.createPanHandlers())}unmount(){this.removePointerDownListener(),this.session&&this.session.end()}}const _r={hasAnimatedSinceResize:!0,hasEverUpdated:!1};function Ky(a,i){return i.max===i.min?0:a/(i.max-i.min)*100}const Vl={correct:(a,i)=>{if(!i.target)return a;if(typeof a=="string")if(it.test(a))a=parseFloat(a);else return a;const s=Ky(a,i.target.x),r=Ky(a,i.target.y);return`${s}% ${r}%`}},oA={correct:(a,{treeScale:i,projectionDelta:s})=>{const r=a,c=ca.parse(a);if(c.length>5)return r;const f=ca.createTransformer(a),d=typeof c[0]!="number"?1:0,m=s.x.scale*i.x,p=s.y.scale*i.y;c[0+d]/=m,c[1+d]/=p;const y=Ht(m,p,.5);return typeof c[2+d]=="number"&&(c[2+d]/=y),typeof c[3+d]=="number"&&(c[3+d]/=y),f(c)}};let Ec=!1;class uA extends E.Component{componentDidMount(){const{visualElement:i,layoutGroup:s,switchLayoutGroup:r,layoutId:c}=this.props,{projection:f}=i;R2(cA),f&&(s.group&&s.group.add(f),r&&r.register&&c&&r.register(f),Ec&&f.root.didUpdate(),f.addEventListener("animationComplete",()=>{this.safeToRemove()}),f.setOptions({...f.options,onExitComplete:()=>this.safeToRemove()})),_r.hasEverUpdated=!0}getSnapshotBeforeUpdate(i){const{layoutDependency:s,visualElement:r,drag:c,isPresent:f}=this.props,{projection:d}=r;return d&&(d.isPresent=f,Ec=!0,c||i.layoutDependency!==s||s===void 0||i.isPresent!==f?d.willUpdate():this.safeToRemove(),i.isPresent!==f&&(f?d.promote():d.relegate()||Ut.postRender(()=>{const m=d.getStack();(!m||!m.members.length)&&this.safeToRemove()}))),null}componentDidUpdate(){const{projection:i}=this.props.visualElement;i&&(i.root.didUpdate(),_f.postRender(()=>{!i.currentAnimation&&i.isLead()&&this.safeToRemove()}))}componentWillUnmount(){const{visualElement:i,layoutGroup:s,switchLayoutGroup:r}=this.props,{projection:c}=i;Ec=!0,c&&(c.scheduleCheckAfterUnmount(),s&&s.group&&s.group.remove(c),r&&r.deregister&&r.deregister(c))}safeToRemove(){const{safeToRemove:i}=this.props;i&&i()}render(){return null}}function rv(a){const[i,s]=A2(),r=E.useContext(Hg);return v.jsx(uA,{...a,layoutGroup:r,switchLayoutGroup:E.useContext(Y0),isPresent:i,safeToRemove:s})}const cA={borderRadius:{...Vl,applyTo:["borderTopLeftRadius","borderTopRightRadius","borderBottomLeftRadius","borderBottomRightRadius"]},borderTopLeftRadius:Vl,borderTopRightRadius:Vl,borderBottomLeftRadius:Vl,borderBottomRightRadius:Vl,boxShadow:oA};function fA(a,i,s){const r=he(a)?a:_i(a);return r.start(qf("",r,i,s)),r.animation}const dA=(a,i)=>a.depth-i.depth;class hA{constructor(){this.children=[],this.isDirty=!1}add(i){hf(this.children,i),this.isDirty=!0}remove(i){mf(this.children,i),this.isDirty=!0}forEach(i){this.isDirty&&this.children.sort(dA),this.isDirty=!1,this.children.forEach(i)}}function mA(a,i){const s=Ce.now(),r=({timestamp:c})=>{const f=c-s;f>=i&&(ua(r),a(f-i))};return Ut.setup(r,!0),()=>ua(r)}const ov=["TopLeft","TopRight","BottomLeft","BottomRight"],pA=ov.length,Qy=a=>typeof a=="string"?parseFloat(a):a,Zy=a=>typeof a=="number"||it.test(a);function yA(a,i,s,r,c,f){c?(a.opacity=Ht(0,s.opacity??1,gA(r)),a.opacityExit=Ht(i.opacity??1,0,vA(r))):f&&(a.opacity=Ht(i.opacity??1,s.opacity??1,r));for(let d=0;d<pA;d++){const m=`border${ov[d]}Radius`;let p=$y(i,m),y=$y(s,m);if(p===void 0&&y===void 0)continue;p||(p=0),y||(y=0),p===0||y===0||Zy(p)===Zy(y)?(a[m]=Math.max(Ht(Qy(p),Qy(y),r),0),(fn.test(y)||fn.test(p))&&(a[m]+="%")):a[m]=y}(i.rotate||s.rotate)&&(a.rotate=Ht(i.rotate||0,s.rotate||0,r))}function $y(a,i){return a[i]!==void 0?a[i]:a.borderRadius}const gA=uv(0,.5,Pg),vA=uv(.5,.95,We);function uv(a,i,s){return r=>r<a?0:r>i?1:s(Kl(a,i,r))}function Jy(a,i){a.min=i.min,a.max=i.max}function Je(a,i){Jy(a.x,i.x),Jy(a.y,i.y)}function Py(a,i){a.translate=i.translate,a.scale=i.scale,a.originPoint=i.originPoint,a.origin=i.origin}function Fy(a,i,s,r,c){return a-=i,a=Lr(a,1/s,r),c!==void 0&&(a=Lr(a,1/c,r)),a}function xA(a,i=0,s=1,r=.5,c,f=a,d=a){if(fn.test(i)&&(i=parseFloat(i),i=Ht(d.min,d.max,i/100)-d.min),typeof i!="number")return;let m=Ht(f.min,f.max,r);a===f&&(m-=i),a.min=Fy(a.min,i,s,m,c),a.max=Fy(a.max,i,s,m,c)}function Wy(a,i,[s,r,c],f,d){xA(a,i[s],i[r],i[c],i.scale,f,d)}const bA=["x","scaleX","originX"],SA=["y","scaleY","originY"];function Iy(a,i,s,r){Wy(a.x,i,bA,s?s.x:void 0,r?r.x:void 0),Wy(a.y,i,SA,s?s.y:void 0,r?r.y:void 0)}function tg(a){return a.translate===0&&a.scale===1}function cv(a){return tg(a.x)&&tg(a.y)}function eg(a,i){return a.min===i.min&&a.max===i.max}function TA(a,i){return eg(a.x,i.x)&&eg(a.y,i.y)}function ng(a,i){return Math.round(a.min)===Math.round(i.min)&&Math.round(a.max)===Math.round(i.max)}function fv(a,i){return ng(a.x,i.x)&&ng(a.y,i.y)}function ag(a){return ge(a.x)/ge(a.y)}function ig(a,i){return a.translate===i.translate&&a.scale===i.scale&&a.originPoint===i.originPoint}class EA{constructor(){this.members=[]}add(i){hf(this.members,i),i.scheduleRender()}remove(i){if(mf(this.members,i),i===this.prevLead&&(this.prevLead=void 0),i===this.lead){const s=this.members[this.members.length-1];s&&this.promote(s)}}relegate(i){const s=this.members.findIndex(c=>i===c);if(s===0)return!1;let r;for(let c=s;c>=0;c--){const f=this.members[c];if(f.isPresent!==!1){r=f;break}}return r?(this.promote(r),!0):!1}promote(i,s){const r=this.lead;if(i!==r&&(this.prevLead=r,this.lead=i,i.show(),r)){r.instance&&r.scheduleRender(),i.scheduleRender(),i.resumeFrom=r,s&&(i.resumeFrom.preserveOpacity=!0),r.snapshot&&(i.snapshot=r.snapshot,i.snapshot.latestValues=r.animationValues||r.latestValues),i.root&&i.root.isUpdating&&(i.isLayoutDirty=!0);const{crossfade:c}=i.options;c===!1&&r.hide()}}exitAnimationComplete(){this.members.forEach(i=>{const{options:s,resumingFrom:r}=i;s.onExitComplete&&s.onExitComplete(),r&&r.options.onExitComplete&&r.options.onExitComplete()})}scheduleRender(){this.members.forEach(i=>{i.instance&&i.scheduleRender(!1)})}removeLeadSnapshot(){this.lead&&this.lead.snapshot&&(this.lead.snapshot=void 0)}}function AA(a,i,s){let r="";const c=a.x.translate/i.x,f=a.y.translate/i.y,d=s?.z||0;if((c||f||d)&&(r=`translate3d(${c}px, ${f}px, ${d}px) `),(i.x!==1||i.y!==1)&&(r+=`scale(${1/i.x}, ${1/i.y}) `),s){const{transformPerspective:y,rotate:g,rotateX:b,rotateY:S,skewX:N,skewY:V}=s;y&&(r=`perspective(${y}px) ${r}`),g&&(r+=`rotate(${g}deg) `),b&&(r+=`rotateX(${b}deg) `),S&&(r+=`rotateY(${S}deg) `),N&&(r+=`skewX(${N}deg) `),V&&(r+=`skewY(${V}deg) `)}const m=a.x.scale*i.x,p=a.y.scale*i.y;return(m!==1||p!==1)&&(r+=`scale(${m}, ${p})`),r||"none"}const Ac=["","X","Y","Z"],CA=1e3;let NA=0;function Cc(a,i,s,r){const{latestValues:c}=i;c[a]&&(s[a]=c[a],i.setStaticValue(a,0),r&&(r[a]=0))}function dv(a){if(a.hasCheckedOptimisedAppear=!0,a.root===a)return;const{visualElement:i}=a.options;if(!i)return;const s=F0(i);if(window.MotionHasOptimisedAnimation(s,"transform")){const{layout:c,layoutId:f}=a.options;window.MotionCancelOptimisedAnimation(s,"transform",Ut,!(c||f))}const{parent:r}=a;r&&!r.hasCheckedOptimisedAppear&&dv(r)}function hv({attachResizeListener:a,defaultParent:i,measureScroll:s,checkIsScrollRoot:r,resetTransform:c}){return class{constructor(d={},m=i?.()){this.id=NA++,this.animationId=0,this.animationCommitId=0,this.children=new Set,this.options={},this.isTreeAnimating=!1,this.isAnimationBlocked=!1,this.isLayoutDirty=!1,this.isProjectionDirty=!1,this.isSharedProjectionDirty=!1,this.isTransformDirty=!1,this.updateManuallyBlocked=!1,this.updateBlockedByResize=!1,this.isUpdating=!1,this.isSVG=!1,this.needsReset=!1,this.shouldResetTransform=!1,this.hasCheckedOptimisedAppear=!1,this.treeScale={x:1,y:1},this.eventHandlers=new Map,this.hasTreeAnimated=!1,this.updateScheduled=!1,this.scheduleUpdate=()=>this.update(),this.projectionUpdateScheduled=!1,this.checkUpdateFailed=()=>{this.isUpdating&&(this.isUpdating=!1,this.clearAllSnapshots())},this.updateProjection=()=>{this.projectionUpdateScheduled=!1,this.nodes.forEach(MA),this.nodes.forEach(OA),this.nodes.forEach(zA),this.nodes.forEach(wA)},this.resolvedRelativeTargetAt=0,this.hasProjected=!1,this.isVisible=!0,this.animationProgress=0,this.sharedNodes=new Map,this.latestValues=d,this.root=m?m.root||m:this,this.path=m?[...m.path,m]:[],this.parent=m,this.depth=m?m.depth+1:0;for(let p=0;p<this.path.length;p++)this.path[p].shouldResetTransform=!0;this.root===this&&(this.nodes=new hA)}addEventListener(d,m){return this.eventHandlers.has(d)||this.eventHandlers.set(d,new gf),this.eventHandlers.get(d).add(m)}notifyListeners(d,...m){const p=this.eventHandlers.get(d);p&&p.notify(...m)}hasListeners(d){return this.eventHandlers.has(d)}mount(d){if(this.instance)return;this.isSVG=D0(d)&&!S2(d),this.instance=d;const{layoutId:m,layout:p,visualElement:y}=this.options;if(y&&!y.current&&y.mount(d),this.root.nodes.add(this),this.parent&&this.parent.children.add(this),this.root.hasTreeAnimated&&(p||m)&&(this.isLayoutDirty=!0),a){let g,b=0;const S=()=>this.root.updateBlockedByResize=!1;Ut.read(()=>{b=window.innerWidth}),a(d,()=>{const N=window.innerWidth;N!==b&&(b=N,this.root.updateBlockedByResize=!0,g&&g(),g=mA(S,250),_r.hasAnimatedSinceResize&&(_r.hasAnimatedSinceResize=!1,this.nodes.forEach(rg)))})}m&&this.root.registerSharedNode(m,this),this.options.animate!==!1&&y&&(m||p)&&this.addEventListener("didUpdate",({delta:g,hasLayoutChanged:b,hasRelativeLayoutChanged:S,layout:N})=>{if(this.isTreeAnimationBlocked()){this.target=void 0,this.relativeTarget=void 0;return}const V=this.options.transition||y.getDefaultTransition()||HA,{onLayoutAnimationStart:B,onLayoutAnimationComplete:U}=y.getProps(),j=!this.targetLayout||!fv(this.targetLayout,N),_=!b&&S;if(this.options.layoutRoot||this.resumeFrom||_||b&&(j||!this.currentAnimation)){this.resumeFrom&&(this.resumingFrom=this.resumeFrom,this.resumingFrom.resumingFrom=void 0);const O={...wf(V,"layout"),onPlay:B,onComplete:U};(y.shouldReduceMotion||this.options.layoutRoot)&&(O.delay=0,O.type=!1),this.startAnimation(O),this.setAnimationOrigin(g,_)}else b||rg(this),this.isLead()&&this.options.onExitComplete&&this.options.onExitComplete();this.targetLayout=N})}unmount(){this.options.layoutId&&this.willUpdate(),this.root.nodes.remove(this);const d=this.getStack();d&&d.remove(this),this.parent&&this.parent.children.delete(this),this.instance=void 0,this.eventHandlers.clear(),ua(this.updateProjection)}blockUpdate(){this.updateManuallyBlocked=!0}unblockUpdate(){this.updateManuallyBlocked=!1}isUpdateBlocked(){return this.updateManuallyBlocked||this.updateBlockedByResize}isTreeAnimationBlocked(){return this.isAnimationBlocked||this.parent&&this.parent.isTreeAnimationBlocked()||!1}startUpdate(){this.isUpdateBlocked()||(this.isUpdating=!0,this.nodes&&this.nodes.forEach(VA),this.animationId++)}getTransformTemplate(){const{visualElement:d}=this.options;return d&&d.getProps().transformTemplate}willUpdate(d=!0){if(this.root.hasTreeAnimated=!0,this.root.isUpdateBlocked()){this.options.onExitComplete&&this.options.onExitComplete();return}if(window.MotionCancelOptimisedAnimation&&!this.hasCheckedOptimisedAppear&&dv(this),!this.root.isUpdating&&this.root.startUpdate(),this.isLayoutDirty)return;this.isLayoutDirty=!0;for(let g=0;g<this.path.length;g++){const b=this.path[g];b.shouldResetTransform=!0,b.updateScroll("snapshot"),b.options.layoutRoot&&b.willUpdate(!1)}const{layoutId:m,layout:p}=this.options;if(m===void 0&&!p)return;const y=this.getTransformTemplate();this.prevTransformTemplateValue=y?y(this.latestValues,""):void 0,this.updateSnapshot(),d&&this.notifyListeners("willUpdate")}update(){if(this.updateScheduled=!1,this.isUpdateBlocked()){this.unblockUpdate(),this.clearAllSnapshots(),this.nodes.forEach(lg);return}if(this.animationId<=this.animationCommitId){this.nodes.forEach(sg);return}this.animationCommitId=this.animationId,this.isUpdating?(this.isUpdating=!1,this.nodes.forEach(_A),this.nodes.forEach(jA),this.nodes.forEach(DA)):this.nodes.forEach(sg),this.clearAllSnapshots();const m=Ce.now();ce.delta=_n(0,1e3/60,m-ce.timestamp),ce.timestamp=m,ce.isProcessing=!0,hc.update.process(ce),hc.preRender.process(ce),hc.render.process(ce),ce.isProcessing=!1}didUpdate(){this.updateScheduled||(this.updateScheduled=!0,_f.read(this.scheduleUpdate))}clearAllSnapshots(){this.nodes.forEach(RA),this.sharedNodes.forEach(UA)}scheduleUpdateProjection(){this.projectionUpdateScheduled||(this.projectionUpdateScheduled=!0,Ut.preRender(this.updateProjection,!1,!0))}scheduleCheckAfterUnmount(){Ut.postRender(()=>{this.isLayoutDirty?this.root.didUpdate():this.root.checkUpdateFailed()})}updateSnapshot(){this.snapshot||!this.instance||(this.snapshot=this.measure(),this.snapshot&&!ge(this.snapshot.measuredBox.x)&&!ge(this.snapshot.measuredBox.y)&&(this.snapshot=void 0))}updateLayout(){if(!this.instance||(this.updateScroll(),!(this.options.alwaysMeasureLayout&&this.isLead())&&!this.isLayoutDirty))return;if(this.resumeFrom&&!this.resumeFrom.instance)for(let p=0;p<this.path.length;p++)this.path[p].updateScroll();const d=this.layout;this.layout=this.measure(!1),this.layoutCorrected=Zt(),this.isLayoutDirty=!1,this.projectionDelta=void 0,this.notifyListeners("measure",this.layout.layoutBox);const{visualElement:m}=this.options;m&&m.notify("LayoutMeasure",this.layout.layoutBox,d?d.layoutBox:void 0)}updateScroll(d="measure"){let m=!!(this.options.layoutScroll&&this.instance);if(this.scroll&&this.scroll.animationId===this.root.animationId&&this.scroll.phase===d&&(m=!1),m&&this.instance){const p=r(this.instance);this.scroll={animationId:this.root.animationId,phase:d,isRoot:p,offset:s(this.instance),wasRoot:this.scroll?this.scroll.isRoot:p}}}resetTransform(){if(!c)return;const d=this.isLayoutDirty||this.shouldResetTransform||this.options.alwaysMeasureLayout,m=this.projectionDelta&&!cv(this.projectionDelta),p=this.getTransformTemplate(),y=p?p(this.latestValues,""):void 0,g=y!==this.prevTransformTemplateValue;d&&this.instance&&(m||Va(this.latestValues)||g)&&(c(this.instance,y),this.shouldResetTransform=!1,this.scheduleRender())}measure(d=!0){const m=this.measurePageBox();let p=this.removeElementScroll(m);return d&&(p=this.removeTransform(p)),kA(p),{animationId:this.root.animationId,measuredBox:m,layoutBox:p,latestValues:{},source:this.id}}measurePageBox(){const{visualElement:d}=this.options;if(!d)return Zt();const m=d.measureViewportBox();if(!(this.scroll?.wasRoot||this.path.some(YA))){const{scroll:y}=this.root;y&&(Di(m.x,y.offset.x),Di(m.y,y.offset.y))}return m}removeElementScroll(d){const m=Zt();if(Je(m,d),this.scroll?.wasRoot)return m;for(let p=0;p<this.path.length;p++){const y=this.path[p],{scroll:g,options:b}=y;y!==this.root&&g&&b.layoutScroll&&(g.wasRoot&&Je(m,d),Di(m.x,g.offset.x),Di(m.y,g.offset.y))}return m}applyTransform(d,m=!1){const p=Zt();Je(p,d);for(let y=0;y<this.path.length;y++){const g=this.path[y];!m&&g.options.layoutScroll&&g.scroll&&g!==g.root&&Mi(p,{x:-g.scroll.offset.x,y:-g.scroll.offset.y}),Va(g.latestValues)&&Mi(p,g.latestValues)}return Va(this.latestValues)&&Mi(p,this.latestValues),p}removeTransform(d){const m=Zt();Je(m,d);for(let p=0;p<this.path.length;p++){const y=this.path[p];if(!y.instance||!Va(y.latestValues))continue;Zc(y.latestValues)&&y.updateSnapshot();const g=Zt(),b=y.measurePageBox();Je(g,b),Iy(m,y.latestValues,y.snapshot?y.snapshot.layoutBox:void 0,g)}return Va(this.latestValues)&&Iy(m,this.latestValues),m}setTargetDelta(d){this.targetDelta=d,this.root.scheduleUpdateProjection(),this.isProjectionDirty=!0}setOptions(d){this.options={...this.options,...d,crossfade:d.crossfade!==void 0?d.crossfade:!0}}clearMeasurements(){this.scroll=void 0,this.layout=void 0,this.snapshot=void 0,this.prevTransformTemplateValue=void 0,this.targetDelta=void 0,this.target=void 0,this.isLayoutDirty=!1}forceRelativeParentToResolveTarget(){this.relativeParent&&this.relativeParent.resolvedRelativeTargetAt!==ce.timestamp&&this.relativeParent.resolveTargetDelta(!0)}resolveTargetDelta(d=!1){const m=this.getLead();this.isProjectionDirty||(this.isProjectionDirty=m.isProjectionDirty),this.isTransformDirty||(this.isTransformDirty=m.isTransformDirty),this.isSharedProjectionDirty||(this.isSharedProjectionDirty=m.isSharedProjectionDirty);const p=!!this.resumingFrom||this!==m;if(!(d||p&&this.isSharedProjectionDirty||this.isProjectionDirty||this.parent?.isProjectionDirty||this.attemptToResolveRelativeTarget||this.root.updateBlockedByResize))return;const{layout:g,layoutId:b}=this.options;if(!(!this.layout||!(g||b))){if(this.resolvedRelativeTargetAt=ce.timestamp,!this.targetDelta&&!this.relativeTarget){const S=this.getClosestProjectingParent();S&&S.layout&&this.animationProgress!==1?(this.relativeParent=S,this.forceRelativeParentToResolveTarget(),this.relativeTarget=Zt(),this.relativeTargetOrigin=Zt(),Gl(this.relativeTargetOrigin,this.layout.layoutBox,S.layout.layoutBox),Je(this.relativeTarget,this.relativeTargetOrigin)):this.relativeParent=this.relativeTarget=void 0}if(!(!this.relativeTarget&&!this.targetDelta)&&(this.target||(this.target=Zt(),this.targetWithTransforms=Zt()),this.relativeTarget&&this.relativeTargetOrigin&&this.relativeParent&&this.relativeParent.target?(this.forceRelativeParentToResolveTarget(),ZE(this.target,this.relativeTarget,this.relativeParent.target)):this.targetDelta?(this.resumingFrom?this.target=this.applyTransform(this.layout.layoutBox):Je(this.target,this.layout.layoutBox),K0(this.target,this.targetDelta)):Je(this.target,this.layout.layoutBox),this.attemptToResolveRelativeTarget)){this.attemptToResolveRelativeTarget=!1;const S=this.getClosestProjectingParent();S&&!!S.resumingFrom==!!this.resumingFrom&&!S.options.layoutScroll&&S.target&&this.animationProgress!==1?(this.relativeParent=S,this.forceRelativeParentToResolveTarget(),this.relativeTarget=Zt(),this.relativeTargetOrigin=Zt(),Gl(this.relativeTargetOrigin,this.target,S.target),Je(this.relativeTarget,this.relativeTargetOrigin)):this.relativeParent=this.relativeTarget=void 0}}}getClosestProjectingParent(){if(!(!this.parent||Zc(this.parent.latestValues)||X0(this.parent.latestValues)))return this.parent.isProjecting()?this.parent:this.parent.getClosestProjectingParent()}isProjecting(){return!!((this.relativeTarget||this.targetDelta||this.options.layoutRoot)&&this.layout)}calcProjection(){const d=this.getLead(),m=!!this.resumingFrom||this!==d;let p=!0;if((this.isProjectionDirty||this.parent?.isProjectionDirty)&&(p=!1),m&&(this.isSharedProjectionDirty||this.isTransformDirty)&&(p=!1),this.resolvedRelativeTargetAt===ce.timestamp&&(p=!1),p)return;const{layout:y,layoutId:g}=this.options;if(this.isTreeAnimating=!!(this.parent&&this.parent.isTreeAnimating||this.currentAnimation||this.pendingAnimation),this.isTreeAnimating||(this.targetDelta=this.relativeTarget=void 0),!this.layout||!(y||g))return;Je(this.layoutCorrected,this.layout.layoutBox);const b=this.treeScale.x,S=this.treeScale.y;lE(this.layoutCorrected,this.treeScale,this.path,m),d.layout&&!d.target&&(this.treeScale.x!==1||this.treeScale.y!==1)&&(d.target=d.layout.layoutBox,d.targetWithTransforms=Zt());const{target:N}=d;if(!N){this.prevProjectionDelta&&(this.createProjectionDeltas(),this.scheduleRender());return}!this.projectionDelta||!this.prevProjectionDelta?this.createProjectionDeltas():(Py(this.prevProjectionDelta.x,this.projectionDelta.x),Py(this.prevProjectionDelta.y,this.projectionDelta.y)),ql(this.projectionDelta,this.layoutCorrected,N,this.latestValues),(this.treeScale.x!==b||this.treeScale.y!==S||!ig(this.projectionDelta.x,this.prevProjectionDelta.x)||!ig(this.projectionDelta.y,this.prevProjectionDelta.y))&&(this.hasProjected=!0,this.scheduleRender(),this.notifyListeners("projectionUpdate",N))}hide(){this.isVisible=!1}show(){this.isVisible=!0}scheduleRender(d=!0){if(this.options.visualElement?.scheduleRender(),d){const m=this.getStack();m&&m.scheduleRender()}this.resumingFrom&&!this.resumingFrom.instance&&(this.resumingFrom=void 0)}createProjectionDeltas(){this.prevProjectionDelta=wi(),this.projectionDelta=wi(),this.projectionDeltaWithTransform=wi()}setAnimationOrigin(d,m=!1){const p=this.snapshot,y=p?p.latestValues:{},g={...this.latestValues},b=wi();(!this.relativeParent||!this.relativeParent.options.layoutRoot)&&(this.relativeTarget=this.relativeTargetOrigin=void 0),this.attemptToResolveRelativeTarget=!m;const S=Zt(),N=p?p.source:void 0,V=this.layout?this.layout.source:void 0,B=N!==V,U=this.getStack(),j=!U||U.members.length<=1,_=!!(B&&!j&&this.options.crossfade===!0&&!this.path.some(LA));this.animationProgress=0;let O;this.mixTargetDelta=$=>{const K=$/1e3;og(b.x,d.x,K),og(b.y,d.y,K),this.setTargetDelta(b),this.relativeTarget&&this.relativeTargetOrigin&&this.layout&&this.relativeParent&&this.relativeParent.layout&&(Gl(S,this.layout.layoutBox,this.relativeParent.layout.layoutBox),BA(this.relativeTarget,this.relativeTargetOrigin,S,K),O&&TA(this.relativeTarget,O)&&(this.isProjectionDirty=!1),O||(O=Zt()),Je(O,this.relativeTarget)),B&&(this.animationValues=g,yA(g,y,this.latestValues,K,_,j)),this.root.scheduleUpdateProjection(),this.scheduleRender(),this.animationProgress=K},this.mixTargetDelta(this.options.layoutRoot?1e3:0)}startAnimation(d){this.notifyListeners("animationStart"),this.currentAnimation?.stop(),this.resumingFrom?.currentAnimation?.stop(),this.pendingAnimation&&(ua(this.pendingAnimation),this.pendingAnimation=void 0),this.pendingAnimation=Ut.update(()=>{_r.hasAnimatedSinceResize=!0,this.motionValue||(this.motionValue=_i(0)),this.currentAnimation=fA(this.motionValue,[0,1e3],{...d,velocity:0,isSync:!0,onUpdate:m=>{this.mixTargetDelta(m),d.onUpdate&&d.onUpdate(m)},onStop:()=>{},onComplete:()=>{d.onComplete&&d.onComplete(),this.completeAnimation()}}),this.resumingFrom&&(this.resumingFrom.currentAnimation=this.currentAnimation),this.pendingAnimation=void 0})}completeAnimation(){this.resumingFrom&&(this.resumingFrom.currentAnimation=void 0,this.resumingFrom.preserveOpacity=void 0);const d=this.getStack();d&&d.exitAnimationComplete(),this.resumingFrom=this.currentAnimation=this.animationValues=void 0,this.notifyListeners("animationComplete")}finishAnimation(){this.currentAnimation&&(this.mixTargetDelta&&this.mixTargetDelta(CA),this.currentAnimation.stop()),this.completeAnimation()}applyTransformsToTarget(){const d=this.getLead();let{targetWithTransforms:m,target:p,layout:y,latestValues:g}=d;if(!(!m||!p||!y)){if(this!==d&&this.layout&&y&&mv(this.options.animationType,this.layout.layoutBox,y.layoutBox)){p=this.target||Zt();const b=ge(this.layout.layoutBox.x);p.x.min=d.target.x.min,p.x.max=p.x.min+b;const S=ge(this.layout.layoutBox.y);p.y.min=d.target.y.min,p.y.max=p.y.min+S}Je(m,p),Mi(m,g),ql(this.projectionDeltaWithTransform,this.layoutCorrected,m,g)}}registerSharedNode(d,m){this.sharedNodes.has(d)||this.sharedNodes.set(d,new EA),this.sharedNodes.get(d).add(m);const y=m.options.initialPromotionConfig;m.promote({transition:y?y.transition:void 0,preserveFollowOpacity:y&&y.shouldPreserveFollowOpacity?y.shouldPreserveFollowOpacity(m):void 0})}isLead(){const d=this.getStack();return d?d.lead===this:!0}getLead(){const{layoutId:d}=this.options;return d?this.getStack()?.lead||this:this}getPrevLead(){const{layoutId:d}=this.options;return d?this.getStack()?.prevLead:void 0}getStack(){const{layoutId:d}=this.options;if(d)return this.root.sharedNodes.get(d)}promote({needsReset:d,transition:m,preserveFollowOpacity:p}={}){const y=this.getStack();y&&y.promote(this,p),d&&(this.projectionDelta=void 0,this.needsReset=!0),m&&this.setOptions({transition:m})}relegate(){const d=this.getStack();return d?d.relegate(this):!1}resetSkewAndRotation(){const{visualElement:d}=this.options;if(!d)return;let m=!1;const{latestValues:p}=d;if((p.z||p.rotate||p.rotateX||p.rotateY||p.rotateZ||p.skewX||p.skewY)&&(m=!0),!m)return;const y={};p.z&&Cc("z",d,y,this.animationValues);for(let g=0;g<Ac.length;g++)Cc(`rotate${Ac[g]}`,d,y,this.animationValues),Cc(`skew${Ac[g]}`,d,y,this.animationValues);d.render();for(const g in y)d.setStaticValue(g,y[g]),this.animationValues&&(this.animationValues[g]=y[g]);d.scheduleRender()}applyProjectionStyles(d,m){if(!this.instance||this.isSVG)return;if(!this.isVisible){d.visibility="hidden";return}const p=this.getTransformTemplate();if(this.needsReset){this.needsReset=!1,d.visibility="",d.opacity="",d.pointerEvents=Rr(m?.pointerEvents)||"",d.transform=p?p(this.latestValues,""):"none";return}const y=this.getLead();if(!this.projectionDelta||!this.layout||!y.target){this.options.layoutId&&(d.opacity=this.latestValues.opacity!==void 0?this.latestValues.opacity:1,d.pointerEvents=Rr(m?.pointerEvents)||""),this.hasProjected&&!Va(this.latestValues)&&(d.transform=p?p({},""):"none",this.hasProjected=!1);return}d.visibility="";const g=y.animationValues||y.latestValues;this.applyTransformsToTarget();let b=AA(this.projectionDeltaWithTransform,this.treeScale,g);p&&(b=p(g,b)),d.transform=b;const{x:S,y:N}=this.projectionDelta;d.transformOrigin=`${S.origin*100}% ${N.origin*100}% 0`,y.animationValues?d.opacity=y===this?g.opacity??this.latestValues.opacity??1:this.preserveOpacity?this.latestValues.opacity:g.opacityExit:d.opacity=y===this?g.opacity!==void 0?g.opacity:"":g.opacityExit!==void 0?g.opacityExit:0;for(const V in Jl){if(g[V]===void 0)continue;const{correct:B,applyTo:U,isCSSVariable:j}=Jl[V],_=b==="none"?g[V]:B(g[V],y);if(U){const O=U.length;for(let $=0;$<O;$++)d[U[$]]=_}else j?this.options.visualElement.renderState.vars[V]=_:d[V]=_}this.options.layoutId&&(d.pointerEvents=y===this?Rr(m?.pointerEvents)||"":"none")}clearSnapshot(){this.resumeFrom=this.snapshot=void 0}resetTree(){this.root.nodes.forEach(d=>d.currentAnimation?.stop()),this.root.nodes.forEach(lg),this.root.sharedNodes.clear()}}}function jA(a){a.updateLayout()}function DA(a){const i=a.resumeFrom?.snapshot||a.snapshot;if(a.isLead()&&a.layout&&i&&a.hasListeners("didUpdate")){const{layoutBox:s,measuredBox:r}=a.layout,{animationType:c}=a.options,f=i.source!==a.layout.source;c==="size"?Pe(g=>{const b=f?i.measuredBox[g]:i.layoutBox[g],S=ge(b);b.min=s[g].min,b.max=b.min+S}):mv(c,i.layoutBox,s)&&Pe(g=>{const b=f?i.measuredBox[g]:i.layoutBox[g],S=ge(s[g]);b.max=b.min+S,a.relativeTarget&&!a.currentAnimation&&(a.isProjectionDirty=!0,a.relativeTarget[g].max=a.relativeTarget[g].min+S)});const d=wi();ql(d,s,i.layoutBox);const m=wi();f?ql(m,a.applyTransform(r,!0),i.measuredBox):ql(m,s,i.layoutBox);const p=!cv(d);let y=!1;if(!a.resumeFrom){const g=a.getClosestProjectingParent();if(g&&!g.resumeFrom){const{snapshot:b,layout:S}=g;if(b&&S){const N=Zt();Gl(N,i.layoutBox,b.layoutBox);const V=Zt();Gl(V,s,S.layoutBox),fv(N,V)||(y=!0),g.options.layoutRoot&&(a.relativeTarget=V,a.relativeTargetOrigin=N,a.relativeParent=g)}}}a.notifyListeners("didUpdate",{layout:s,snapshot:i,delta:m,layoutDelta:d,hasLayoutChanged:p,hasRelativeLayoutChanged:y})}else if(a.isLead()){const{onExitComplete:s}=a.options;s&&s()}a.options.transition=void 0}function MA(a){a.parent&&(a.isProjecting()||(a.isProjectionDirty=a.parent.isProjectionDirty),a.isSharedProjectionDirty||(a.isSharedProjectionDirty=!!(a.isProjectionDirty||a.parent.isProjectionDirty||a.parent.isSharedProjectionDirty)),a.isTransformDirty||(a.isTransformDirty=a.parent.isTransformDirty))}function wA(a){a.isProjectionDirty=a.isSharedProjectionDirty=a.isTransformDirty=!1}function RA(a){a.clearSnapshot()}function lg(a){a.clearMeasurements()}function sg(a){a.isLayoutDirty=!1}function _A(a){const{visualElement:i}=a.options;i&&i.getProps().onBeforeLayoutMeasure&&i.notify("BeforeLayoutMeasure"),a.resetTransform()}function rg(a){a.finishAnimation(),a.targetDelta=a.relativeTarget=a.target=void 0,a.isProjectionDirty=!0}function OA(a){a.resolveTargetDelta()}function zA(a){a.calcProjection()}function VA(a){a.resetSkewAndRotation()}function UA(a){a.removeLeadSnapshot()}function og(a,i,s){a.translate=Ht(i.translate,0,s),a.scale=Ht(i.scale,1,s),a.origin=i.origin,a.originPoint=i.originPoint}function ug(a,i,s,r){a.min=Ht(i.min,s.min,r),a.max=Ht(i.max,s.max,r)}function BA(a,i,s,r){ug(a.x,i.x,s.x,r),ug(a.y,i.y,s.y,r)}function LA(a){return a.animationValues&&a.animationValues.opacityExit!==void 0}const HA={duration:.45,ease:[.4,0,.1,1]},cg=a=>typeof navigator<"u"&&navigator.userAgent&&navigator.userAgent.toLowerCase().includes(a),fg=cg("applewebkit/")&&!cg("chrome/")?Math.round:We;function dg(a){a.min=fg(a.min),a.max=fg(a.max)}function kA(a){dg(a.x),dg(a.y)}function mv(a,i,s){return a==="position"||a==="preserve-aspect"&&!QE(ag(i),ag(s),.2)}function YA(a){return a!==a.root&&a.scroll?.wasRoot}const qA=hv({attachResizeListener:(a,i)=>Pl(a,"resize",i),measureScroll:()=>({x:document.documentElement.scrollLeft||document.body.scrollLeft,y:document.documentElement.scrollTop||document.body.scrollTop}),checkIsScrollRoot:()=>!0}),Nc={current:void 0},pv=hv({measureScroll:a=>({x:a.scrollLeft,y:a.scrollTop}),defaultParent:()=>{if(!Nc.current){const a=new qA({});a.mount(window),a.setOptions({layoutScroll:!0}),Nc.current=a}return Nc.current},resetTransform:(a,i)=>{a.style.transform=i!==void 0?i:"none"},checkIsScrollRoot:a=>window.getComputedStyle(a).position==="fixed"}),GA={pan:{Feature:rA},drag:{Feature:sA,ProjectionNode:pv,MeasureLayout:rv}};function hg(a,i,s){const{props:r}=a;a.animationState&&r.whileHover&&a.animationState.setActive("whileHover",s==="Start");const c="onHover"+s,f=r[c];f&&Ut.postRender(()=>f(i,ns(i)))}class XA extends ha{mount(){const{current:i}=this.node;i&&(this.unmount=y2(i,(s,r)=>(hg(this.node,r,"Start"),c=>hg(this.node,c,"End"))))}unmount(){}}class KA extends ha{constructor(){super(...arguments),this.isActive=!1}onFocus(){let i=!1;try{i=this.node.current.matches(":focus-visible")}catch{i=!0}!i||!this.node.animationState||(this.node.animationState.setActive("whileFocus",!0),this.isActive=!0)}onBlur(){!this.isActive||!this.node.animationState||(this.node.animationState.setActive("whileFocus",!1),this.isActive=!1)}mount(){this.unmount=Il(Pl(this.node.current,"focus",()=>this.onFocus()),Pl(this.node.current,"blur",()=>this.onBlur()))}unmount(){}}function mg(a,i,s){const{props:r}=a;if(a.current instanceof HTMLButtonElement&&a.current.disabled)return;a.animationState&&r.whileTap&&a.animationState.setActive("whileTap",s==="Start");const c="onTap"+(s==="End"?"":s),f=r[c];f&&Ut.postRender(()=>f(i,ns(i)))}class QA extends ha{mount(){const{current:i}=this.node;i&&(this.unmount=b2(i,(s,r)=>(mg(this.node,r,"Start"),(c,{success:f})=>mg(this.node,c,f?"End":"Cancel")),{useGlobalTarget:this.node.props.globalTapTarget}))}unmount(){}}const tf=new WeakMap,jc=new WeakMap,ZA=a=>{const i=tf.get(a.target);i&&i(a)},$A=a=>{a.forEach(ZA)};function JA({root:a,...i}){const s=a||document;jc.has(s)||jc.set(s,{});const r=jc.get(s),c=JSON.stringify(i);return r[c]||(r[c]=new IntersectionObserver($A,{root:a,...i})),r[c]}function PA(a,i,s){const r=JA(i);return tf.set(a,s),r.observe(a),()=>{tf.delete(a),r.unobserve(a)}}const FA={some:0,all:1};class WA extends ha{constructor(){super(...arguments),this.hasEnteredView=!1,this.isInView=!1}startObserver(){this.unmount();const{viewport:i={}}=this.node.getProps(),{root:s,margin:r,amount:c="some",once:f}=i,d={root:s?s.current:void 0,rootMargin:r,threshold:typeof c=="number"?c:FA[c]},m=p=>{const{isIntersecting:y}=p;if(this.isInView===y||(this.isInView=y,f&&!y&&this.hasEnteredView))return;y&&(this.hasEnteredView=!0),this.node.animationState&&this.node.animationState.setActive("whileInView",y);const{onViewportEnter:g,onViewportLeave:b}=this.node.getProps(),S=y?g:b;S&&S(p)};return PA(this.node.current,d,m)}mount(){this.startObserver()}update(){if(typeof IntersectionObserver>"u")return;const{props:i,prevProps:s}=this.node;["amount","margin","root"].some(IA(i,s))&&this.startObserver()}unmount(){}}function IA({viewport:a={}},{viewport:i={}}={}){return s=>a[s]!==i[s]}const tC={inView:{Feature:WA},tap:{Feature:QA},focus:{Feature:KA},hover:{Feature:XA}},eC={layout:{ProjectionNode:pv,MeasureLayout:rv}},nC={...kE,...tC,...GA,...eC},aC=nE(nC,pE);function Dc({label:a,onClick:i,description:s}){return v.jsxs("button",{type:"button",onClick:i,className:"group block w-full rounded-2xl border bg-white p-8 shadow-sm transition-all hover:shadow-md focus:outline-none focus-visible:ring-2 focus-visible:ring-pink-300",children:[v.jsxs("div",{className:"flex items-center justify-between",children:[v.jsx("p",{className:"text-2xl font-semibold tracking-wide text-gray-800",children:a}),v.jsx("span",{className:"text-sm text-gray-400 transition-transform group-hover:translate-x-0.5",children:"▶"})]}),s?v.jsx("p",{className:"mt-2 text-sm text-gray-500",children:s}):null]})}function iC({text:a}){return v.jsx("h1",{className:"flex gap-1 text-4xl font-extrabold tracking-tight text-gray-900",children:a.split("").map((i,s)=>v.jsx(aC.span,{initial:{opacity:0,y:10},animate:{opacity:1,y:0},transition:{delay:s*.05,duration:.4},children:i},s))})}function lC(){const a=da();return v.jsx("main",{className:"min-h-screen bg-gray-50",children:v.jsxs("div",{className:"mx-auto max-w-6xl px-4 py-8",children:[v.jsxs("header",{className:"mb-6",children:[v.jsx("button",{type:"button",onClick:()=>a("/"),className:"text-left hover:opacity-80",children:v.jsx(iC,{text:"Re:Beauty"})}),v.jsx("p",{className:"mt-2 text-lg text-gray-500",children:"ホーム"})]}),v.jsxs("div",{className:"flex flex-col gap-4",children:[v.jsx(Dc,{label:"顧客登録",description:"新しい顧客を追加します",onClick:()=>a("/customers/new")}),v.jsx(Dc,{label:"顧客検索",description:"名前・電話・メモから検索",onClick:()=>a("/customers/search")}),v.jsx(Dc,{label:"ダッシュボード",description:"KPI / フォロー進捗 / カテゴリ別売上など",onClick:()=>a("/dashboard")})]})]})})}function sC(){const[a,i]=E.useState(""),[s,r]=E.useState(""),[c,f]=E.useState(""),[d,m]=E.useState(!1),p=da(),y=async g=>{g.preventDefault(),f(""),m(!0);const b={email:a.trim(),password:s.trim()};try{const S=await fetch("https://mitsukidev.pythonanywhere.com/api/auth/login",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(b)}),N=await S.json().catch(()=>({}));if(!S.ok)throw new Error(N?.detail||"ログインに失敗しました");localStorage.setItem("access_token",N.access_token),localStorage.setItem("rb_token",N.access_token),localStorage.setItem("rb_user",JSON.stringify(N.user));const V=N?.user?.name||N?.user?.email||a.trim();localStorage.setItem("rb_staff_name",V),p("/home")}catch(S){f(S.message)}finally{m(!1)}};return v.jsxs("div",{className:"flex min-h-screen flex-col items-center justify-center bg-white",children:[v.jsx("h1",{className:"mb-10 text-3xl font-bold text-gray-800 tracking-wide",children:"Re:Beauty"}),v.jsxs("form",{onSubmit:y,className:"flex w-full max-w-xs flex-col items-center space-y-4",children:[c&&v.jsx("p",{className:"text-red-500 text-sm",children:c}),v.jsx("input",{type:"email",placeholder:"メールアドレス",value:a,onChange:g=>i(g.target.value),className:"w-full rounded-md border border-gray-300 px-4 py-2 text-center text-gray-700 placeholder-gray-400 focus:border-pink-400 focus:ring-2 focus:ring-pink-200 focus:outline-none"}),v.jsx("input",{type:"password",placeholder:"パスワード",value:s,onChange:g=>r(g.target.value),className:"w-full rounded-md border border-gray-300 px-4 py-2 text-center text-gray-700 placeholder-gray-400 focus:border-pink-400 focus:ring-2 focus:ring-pink-200 focus:outline-none"}),v.jsx("button",{type:"submit",disabled:d,className:"mt-6 w-full rounded-md bg-pink-500 py-2 text-white hover:bg-pink-600 transition-colors disabled:opacity-60",children:d?"ログイン中...":"ログイン"})]})]})}function Xr({sidebar:a,children:i}){const s=localStorage.getItem("rb_staff_name")||"—";return v.jsxs("div",{className:"min-h-screen bg-gray-50",children:[v.jsx("header",{className:"border-b bg-white",children:v.jsxs("div",{className:"mx-auto flex max-w-6xl items-center justify-between px-4 py-3",children:[v.jsx(cf,{to:"/Home",className:"text-xl font-bold tracking-tight hover:opacity-80","aria-label":"ホームへ戻る",children:"Re:Beauty"}),v.jsxs("div",{className:"text-sm text-gray-600",children:["ログイン中：",s]})]})}),v.jsxs("main",{className:"mx-auto flex max-w-6xl gap-4 px-4 py-6",children:[a&&v.jsx("aside",{className:"w-56 shrink-0",children:v.jsx("div",{className:"space-y-2",children:a})}),v.jsx("section",{className:"flex-1 space-y-4",children:i})]})]})}const rC=[{label:"ダッシュボード",to:"/dashboard"},{label:"ホーム",to:"/home"},{label:"顧客登録",to:"/customers/new"},{label:"顧客検索",to:"/customers/search"}];function oC(){const a=da(),i=()=>{window.confirm("本当にログアウトしますか？")&&(localStorage.removeItem("access_token"),localStorage.removeItem("rb_token"),localStorage.removeItem("rb_staff_name"),localStorage.removeItem("rb_user"),a("/login",{replace:!0}))};return v.jsxs("nav",{className:"space-y-1",children:[rC.map(s=>v.jsx(Bg,{to:s.to,className:({isActive:r})=>`flex w-full items-center rounded-lg px-3 py-2 text-left text-sm transition ${r?"bg-pink-50 font-semibold text-pink-600":"text-gray-700 hover:bg-gray-100"}`,children:s.label},s.label)),v.jsx("button",{type:"button",onClick:i,className:"mt-2 flex w-full items-center rounded-lg px-3 py-2 text-left text-sm font-semibold text-pink-600 hover:bg-pink-50",children:"ログアウト"})]})}const ye="https://mitsukidev.pythonanywhere.com/api";async function yFg(a,{pageSize:l,cursor:c,...u}={}){const f=new URLSearchParams;l&&f.set("limit",l),c&&f.set("cursor",c);const d=f.toString(),m=a.includes("?")?"&":"?",p=await fetch(d?`${a}${m}${d}`:a,u);if(!p.ok){const g=await p.text().catch(()=>""),_=new Error(g||`HTTP ${p.status}`);throw _.status=p.status,_.body=g,_}const y=await p.json();return{items:Array.isArray(y)?y:[],nextCursor:p.headers.get("X-Next-Cursor")}}async function yFp(a,{pageSize:l,...u}={}){const r=[];let c=null;do{const f=await yFg(a,{pageSize:l,cursor:c,...u});r.push(...f.items),c=f.nextCursor}while(c);return r}function uC({children:a}){return v.jsx("h2",{className:"text-base font-semibold text-gray-800 tracking-tight",children:a})}function cC({onClick:a}){return v.jsx("button",{type:"button",onClick:a,className:"mt-3 inline-flex items-center gap-1 rounded-md border border-gray-200 bg-gray-50 px-2 py-1 text-xs text-gray-600 hover:bg-pink-50 active:translate-y-[1px]",children:"もっとみる"})}function fC({segment:a,setSegment:i}){const s=(r,c)=>v.jsx("button",{type:"button",onClick:()=>i(r),className:`rounded-xl px-3 py-1.5 text-xs font-medium border ${a===r?"bg-gray-900 text-white border-gray-900":"bg-white hover:bg-gray-50 border-gray-200 text-gray-700"}`,children:c});return v.jsxs("div",{className:"flex gap-2",children:[s("skincare","スキンケア"),s("makeup","メイク")]})}function dC({limit:a=5,showSeeMore:i=!0}){const s=da(),[r,c]=E.useState("skincare"),[f,d]=E.useState([]),[m,p]=E.useState(!1),[y,g]=E.useState("");E.useEffect(()=>{const N=new AbortController;async function V(){p(!0),g("");try{const B=localStorage.getItem("access_token")||localStorage.getItem("rb_token"),U=new URLSearchParams({segment:r}),j=await fetch(`${ye}/dashboard/inactive-customers?${U.toString()}`,{headers:B?{Authorization:`Bearer ${B}`}:{},signal:N.signal});if(!j.ok){const O=await j.text().catch(()=>"");throw new Error(`取得に失敗しました (${j.status}) ${O}`)}const _=await j.json();d(Array.isArray(_)?_:[])}catch(B){B.name!=="AbortError"&&(console.error(B),g("フォロー対象の取得に失敗しました"),d([]))}finally{p(!1)}}return V(),()=>N.abort()},[r]);const b=E.useMemo(()=>[...f].sort((N,V)=>(V.days_since??0)-(N.days_since??0)),[f]),S=r==="skincare"?"90日":"120日";return v.jsxs("div",{className:"w-full rounded-2xl border bg-white p-4 shadow-sm",children:[v.jsxs("div",{className:"flex items-start justify-between gap-3",children:[v.jsxs("div",{children:[v.jsx(uC,{children:"フォローが必要なお客様（来店なし）"}),v.jsxs("p",{className:"mt-1 text-xs text-gray-500",children:["最新の来店記録から",S,"以上来店がないお客様を表示しています（読み取り専用）。"]})]}),v.jsx(fC,{segment:r,setSegment:c})]}),y?v.jsx("div",{className:"mt-3 rounded-xl border border-red-200 bg-red-50 p-3 text-xs text-red-700",children:y}):null,v.jsx("div",{className:"mt-3",children:m?v.jsx("div",{className:"py-4 text-xs text-gray-500",children:"読み込み中…"}):b.length===0?v.jsx("div",{className:"py-4 text-xs text-gray-500",children:"該当するお客様はいません 🎉"}):v.jsx("ul",{className:"space-y-3",children:b.slice(0,a).map(N=>v.jsx("li",{className:"cursor-pointer rounded-xl border border-gray-100 bg-gray-50 px-3 py-2 hover:bg-gray-100",onClick:()=>s(`/customers/${N.customer_id}`),title:"クリックで顧客詳細へ",children:v.jsxs("div",{className:"flex items-center justify-between gap-3",children:[v.jsxs("div",{className:"min-w-0",children:[v.jsxs("p",{className:"text-sm font-semibold text-gray-800 truncate",children:[N.name,v.jsxs("span",{className:"ml-2 text-[10px] text-gray-400",children:["（ID:",N.customer_id,"）"]})]}),v.jsxs("p",{className:"mt-1 text-xs text-gray-700",children:["最終来店：",N.last_visit_date," ／"," ",v.jsxs("span",{className:"font-semibold text-red-600",children:[N.days_since,"日"]}),"来店なし"]}),v.jsxs("div",{className:"mt-1 flex flex-wrap gap-1",children:[v.jsx("span",{className:"rounded-full bg-white px-2 py-0.5 text-[10px] text-gray-600",children:r}),v.jsx("span",{className:"rounded-full bg-white px-2 py-0.5 text-[10px] text-gray-600",children:"inactive-customers"})]}),v.jsx("div",{className:"mt-1 text-[10px] text-gray-500 truncate",children:N.email})]}),v.jsx("div",{className:"shrink-0 text-xs text-gray-500",children:"詳細 →"})]})},N.customer_id))})}),i?v.jsx(cC,{onClick:()=>s("/follow")}):null]})}function hC(){const[a,i]=E.useState({staffCode:"",name:"",email:"",password:""}),[s,r]=E.useState([]),[c,f]=E.useState(!1),[d,m]=E.useState(""),p=()=>{const S=localStorage.getItem("access_token")||localStorage.getItem("rb_token"),N={"Content-Type":"application/json"};return S&&(N.Authorization=`Bearer ${S}`),N},y=S=>{const{name:N,value:V}=S.target;i(B=>({...B,[N]:V}))},g=async()=>{try{const S=await fetch(`${ye}/staffs/`,{method:"GET",headers:p()});if(!S.ok){const V=await S.text().catch(()=>"");console.warn("スタッフ一覧の取得に失敗しました",S.status,V);return}const N=await S.json();r(Array.isArray(N)?N:[])}catch(S){console.error("スタッフ一覧取得エラー:",S)}};E.useEffect(()=>{g()},[]);const b=async S=>{if(S.preventDefault(),m(""),!a.staffCode.trim()||!a.email.trim()||!a.password.trim()){m("スタッフID・メールアドレス・パスワードは必須です");return}f(!0);try{const N=await fetch(`${ye}/staffs/`,{method:"POST",headers:p(),body:JSON.stringify({staff_code:a.staffCode,name:a.name,email:a.email,password:a.password})});if(!N.ok){const V=await N.text().catch(()=>"");m(`登録に失敗しました (${N.status})`),console.error("スタッフ登録失敗:",N.status,V);return}m("スタッフを登録しました"),i({staffCode:"",name:"",email:"",password:""}),g()}catch(N){console.error("スタッフ登録エラー:",N),m("エラーが発生しました")}finally{f(!1)}};return v.jsxs("section",{className:"rounded-2xl border bg-white p-6 shadow-sm",children:[v.jsx("h2",{className:"text-lg font-semibold text-gray-800",children:"スタッフアカウント登録"}),v.jsx("p",{className:"mt-1 text-xs text-gray-500",children:"サロンで利用するスタッフのIDとメールアドレスを管理します。"}),v.jsxs("form",{onSubmit:b,className:"mt-4 space-y-3",children:[v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm text-gray-700 mb-1",children:"スタッフID"}),v.jsx("input",{type:"text",name:"staffCode",value:a.staffCode,onChange:y,placeholder:"例）S-0001",className:"w-full rounded-md border px-3 py-2 text-sm"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm text-gray-700 mb-1",children:"スタッフ名（任意）"}),v.jsx("input",{type:"text",name:"name",value:a.name,onChange:y,placeholder:"例）山田 花子",className:"w-full rounded-md border px-3 py-2 text-sm"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm text-gray-700 mb-1",children:"メールアドレス"}),v.jsx("input",{type:"email",name:"email",value:a.email,onChange:y,placeholder:"example@salon.co.jp",className:"w-full rounded-md border px-3 py-2 text-sm"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm text-gray-700 mb-1",children:"パスワード"}),v.jsx("input",{type:"password",name:"password",value:a.password,onChange:y,placeholder:"ログイン用パスワード",className:"w-full rounded-md border px-3 py-2 text-sm"}),v.jsx("p",{className:"mt-1 text-[11px] text-gray-400",children:"※ 登録したメール＋このパスワードでログインできます"})]}),v.jsxs("div",{className:"pt-2 flex items-center gap-3",children:[v.jsx("button",{type:"submit",disabled:c,className:"rounded-md bg-pink-500 px-4 py-2 text-sm font-semibold text-white hover:bg-pink-600 disabled:opacity-60",children:c?"登録中...":"登録する"}),d&&v.jsx("p",{className:"text-xs text-gray-600","aria-live":"polite",children:d})]})]}),v.jsxs("div",{className:"mt-6",children:[v.jsx("h3",{className:"text-sm font-semibold text-gray-700 mb-2",children:"登録済みスタッフ"}),s.length===0?v.jsx("p",{className:"text-xs text-gray-500",children:"まだスタッフが登録されていません。"}):v.jsx("ul",{className:"space-y-1 max-h-40 overflow-auto text-xs",children:s.map(S=>v.jsx("li",{className:"flex justify-between gap-2 rounded-md border px-2 py-1 bg-gray-50",children:v.jsxs("div",{className:"flex flex-col",children:[v.jsxs("span",{className:"font-medium",children:[S.name||"（名前未設定）",S.staff_code&&v.jsxs("span",{className:"text-gray-400",children:[" / ",S.staff_code]})]}),v.jsx("span",{className:"text-gray-500",children:S.email})]})},S.id??S.staff_code))})]})]})}const Ll="https://mitsukidev.pythonanywhere.com/api";console.log("VITE_API_BASE_URL =","https://mitsukidev.pythonanywhere.com/api");console.log("API_BASE_URL =",Ll);const mC=[{value:"birthday",label:"誕生日"},{value:"event",label:"イベント"},{value:"purchase_follow",label:"購入フォロー"}];function pC(){const[a,i]=E.useState("birthday"),[s,r]=E.useState("skincare"),[c,f]=E.useState([]),[d,m]=E.useState(""),[p,y]=E.useState(""),[g,b]=E.useState(!1),[S,N]=E.useState("");E.useEffect(()=>{const j=new AbortController;async function _(){b(!0),N("");try{const O=localStorage.getItem("access_token")||localStorage.getItem("rb_token");let $="";if(a==="purchase_follow"){const Q=new URLSearchParams({segment:s});$=`${Ll}/dashboard/inactive-customers?${Q.toString()}`}else{const Q=new URLSearchParams({mail_type:a});$=`${Ll}/follow-mail/targets?${Q.toString()}`}const K=await fetch($,{headers:O?{Authorization:`Bearer ${O}`}:{},signal:j.signal});if(!K.ok){const Q=await K.text().catch(()=>"");throw new Error(`取得に失敗しました (${K.status}) ${Q}`)}const tt=await K.json();f(Array.isArray(tt)?tt:[])}catch(O){O.name!=="AbortError"&&(console.error(O),N("フォロー対象の取得に失敗しました"),f([]))}finally{b(!1)}}return _(),()=>j.abort()},[a,s]);const V=async()=>{try{const j=localStorage.getItem("access_token")||localStorage.getItem("rb_token"),_={subject:d,body:p},O=await fetch(`${Ll}/emails/test`,{method:"POST",headers:{"Content-Type":"application/json",...j?{Authorization:`Bearer ${j}`}:{}},body:JSON.stringify(_)});if(!O.ok){const K=await O.text().catch(()=>"");throw new Error(`テスト送信に失敗しました (${O.status}) ${K}`)}const $=await O.json().catch(()=>null);alert($?.message||"自分にテスト送信しました！")}catch(j){console.error(j),alert("テスト送信に失敗しました（コンソールも確認してね）")}},B=async()=>{try{const j=localStorage.getItem("access_token")||localStorage.getItem("rb_token"),_=a==="purchase_follow"?c.map(Q=>Q.customer_id):c.map(Q=>Q.id),O=Array.from(new Set(_)),$={subject:d,body:p,customer_ids:O},K=await fetch(`${Ll}/emails/bulk`,{method:"POST",headers:{"Content-Type":"application/json",...j?{Authorization:`Bearer ${j}`}:{}},body:JSON.stringify($)});if(!K.ok){const Q=await K.text().catch(()=>"");throw new Error(`一斉送信に失敗しました (${K.status}) ${Q}`)}const tt=await K.json().catch(()=>null);alert(tt?.message||"フォロー対象へ一斉送信しました！")}catch(j){console.error(j),alert("一斉送信に失敗しました（コンソールも確認してね）")}},U=a==="purchase_follow";return v.jsxs("section",{className:"rounded-2xl border bg-white p-6 shadow-sm",children:[v.jsxs("div",{children:[v.jsxs("div",{children:[v.jsx("h2",{className:"text-lg font-semibold text-gray-900",children:"フォロー対象へ一斉メール"}),v.jsx("p",{className:"mt-1 text-xs text-gray-500",children:"誕生日・イベント・購入フォローのお客様に、一括でメールを送信します。"})]}),v.jsx("div",{className:"mt-3 flex flex-wrap gap-2 text-xs",children:mC.map(j=>v.jsx("button",{type:"button",onClick:()=>i(j.value),className:`rounded-full px-4 py-1 whitespace-nowrap transition ${a===j.value?"bg-pink-500 text-white shadow-sm":"bg-gray-100 text-gray-600 hover:bg-gray-200"}`,children:j.label},j.value))})]}),U&&v.jsxs("div",{className:"mt-3 flex flex-wrap items-center gap-2 text-xs",children:[v.jsx("span",{className:"text-gray-500",children:"購入カテゴリ："}),v.jsx("button",{type:"button",onClick:()=>r("skincare"),className:`rounded-full border px-3 py-1 ${s==="skincare"?"border-pink-400 bg-pink-50 text-pink-700":"border-gray-200 bg-white text-gray-600 hover:bg-gray-50"}`,children:"スキンケア（90日〜）"}),v.jsx("button",{type:"button",onClick:()=>r("makeup"),className:`rounded-full border px-3 py-1 ${s==="makeup"?"border-pink-400 bg-pink-50 text-pink-700":"border-gray-200 bg-white text-gray-600 hover:bg-gray-50"}`,children:"メイクアップ（120日〜）"})]}),v.jsxs("div",{className:"mt-4 grid gap-4 md:grid-cols-2",children:[v.jsxs("div",{className:"space-y-3 text-sm",children:[v.jsxs("div",{children:[v.jsx("label",{className:"mb-1 block text-xs font-medium text-gray-600",children:"件名"}),v.jsx("input",{type:"text",value:d,onChange:j=>m(j.target.value),placeholder:"例）【Re:Beauty】 いつもご利用ありがとうございます",className:"w-full rounded-lg border border-gray-200 px-3 py-2 text-sm focus:border-pink-400 focus:outline-none focus:ring-1 focus:ring-pink-300"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"mb-1 block text-xs font-medium text-gray-600",children:"本文"}),v.jsx("textarea",{rows:8,value:p,onChange:j=>y(j.target.value),placeholder:"例）いつも Re:Beauty をご利用いただきありがとうございます。そろそろお肌のお手入れのタイミングかと思い、ご案内をお送りいたしました。",className:"w-full resize-none rounded-lg border border-gray-200 px-3 py-2 text-sm focus:border-pink-400 focus:outline-none focus:ring-1 focus:ring-pink-300"})]}),v.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-2",children:[v.jsxs("p",{className:"text-xs text-gray-500",children:["対象件数："," ",v.jsx("span",{className:"font-semibold text-gray-800",children:g?"読み込み中…":`${c.length} 件`})]}),v.jsxs("div",{className:"flex gap-2",children:[v.jsx("button",{type:"button",onClick:V,className:"rounded-full border border-gray-200 px-3 py-1.5 text-xs font-medium text-gray-600 hover:bg-gray-50",children:"自分にテスト送信"}),v.jsx("button",{type:"button",onClick:B,className:"rounded-full bg-pink-500 px-4 py-1.5 text-xs font-semibold text-white shadow-sm hover:bg-pink-600 disabled:bg-gray-300",disabled:c.length===0,children:"フォロー対象に一斉送信"})]})]}),S&&v.jsx("p",{className:"text-xs text-red-500",children:S})]}),v.jsxs("div",{className:"flex h-full flex-col rounded-xl border border-gray-100 bg-gray-50 p-3 text-xs",children:[v.jsxs("div",{className:"mb-2 flex items-center justify-between",children:[v.jsx("p",{className:"font-semibold text-gray-700",children:"フォロー対象リスト"}),v.jsx("span",{className:"rounded-full bg-white px-2 py-0.5 text-[10px] text-gray-500",children:g?"更新中…":`${c.length}件`})]}),v.jsxs("div",{className:"h-[220px] space-y-1 overflow-y-auto rounded-lg bg-white p-2",children:[g&&v.jsx("p",{className:"py-6 text-center text-gray-400",children:"読み込み中です…"}),!g&&c.length===0&&v.jsx("p",{className:"py-6 text-center text-gray-400",children:"現在、該当するお客様はいません。"}),!g&&c.map(j=>v.jsx("div",{className:"flex items-start justify-between rounded-md border border-gray-100 px-2 py-1.5",children:v.jsxs("div",{children:[v.jsx("p",{className:"text-[11px] font-semibold text-gray-800",children:j.name}),v.jsx("p",{className:"text-[10px] text-gray-500",children:j.email})]})},a==="purchase_follow"?j.customer_id:j.id))]}),v.jsx("p",{className:"mt-2 text-[10px] text-gray-400",children:"※ 対象条件は「上部タブ（誕生日 / イベント / 購入フォロー）」と 「購入カテゴリ」で切り替え可能"})]})]})]})}const yCp=3e4,yCl={skincare:"スキンケア",makeup:"メイク"};function pg({title:a,value:i,note:s,emphasize:r=!1}){return v.jsxs("div",{className:"rounded-2xl border bg-white p-5 shadow-sm",children:[v.jsx("div",{className:"text-sm text-gray-500",children:a}),v.jsx("div",{className:`mt-2 text-3xl font-bold ${r?"text-red-600":""}`,children:i}),s&&v.jsx("div",{className:"mt-1 text-xs text-gray-400",children:s})]})}function yC(){const[a,i]=E.useState(null),s=()=>{const f=localStorage.getItem("access_token")||localStorage.getItem("rb_token");return f?{Authorization:`Bearer ${f}`}:{}};E.useEffect(()=>{const f=new AbortController;async function d(){if(!document.hidden)try{const m=await fetch(`${ye}/dashboard/summary`,{headers:s(),signal:f.signal});if(!m.ok)return;i(await m.json())}catch(m){m.name!=="AbortError"&&console.error(m)}}d();const m=setInterval(d,yCp);return()=>{clearInterval(m),f.abort()}},[]);const r=a?.inactive??[];return v.jsxs("div",{className:"grid grid-cols-1 gap-4 md:grid-cols-2 lg:grid-cols-4",children:[v.jsx(pg,{title:"本日の来店数",value:a?.today_visit_count??0}),v.jsx(pg,{title:"今月の新規",value:a?.monthly_new_customer_count??0}),r.map(c=>v.jsx(pg,{title:`フォロー対象（${yCl[c.segment]??c.segment}）`,value:c.count,note:`${c.threshold_days}日以上来店なし`,emphasize:c.count>0},c.segment))]})}function gC(){const a=xg.useMemo(()=>JSON.parse(localStorage.getItem("rb_user")||"{}"),[]);return v.jsx(Xr,{sidebar:v.jsx(oC,{}),header:v.jsxs("div",{className:"text-xs text-gray-600",children:["ログイン中：",v.jsx("span",{className:"font-semibold",children:a?.name||"staff"})]}),children:v.jsxs("div",{className:"space-y-6",children:[v.jsx(yC,{}),v.jsxs("div",{className:"grid grid-cols-1 gap-4 lg:grid-cols-2",children:[v.jsx(dC,{limit:5,showSeeMore:!1}),v.jsx(hC,{}),v.jsx("div",{className:"lg:col-span-2",children:v.jsx(pC,{})})]})]})})}const vC=()=>localStorage.getItem("access_token")||localStorage.getItem("rb_token")||localStorage.getItem("accessToken")||"",yv=()=>{const a=vC();return a?{Authorization:`Bearer ${a}`}:{}};async function xC(a){const i=await fetch(`${ye}/customers`,{method:"POST",headers:{"Content-Type":"application/json",...yv()},body:JSON.stringify(a)});if(!i.ok){const s=await i.text().catch(()=>"");throw new Error(s||"顧客の登録に失敗しました")}return i.json()}async function bC(a,i){const s=await fetch(`${ye}/customers/${a}`,{method:"PATCH",headers:{"Content-Type":"application/json",...yv()},body:JSON.stringify(i)});if(!s.ok){const r=await s.text().catch(()=>"");throw new Error(r||"顧客の更新に失敗しました")}return s.json()}const SC=["乾燥肌","脂性肌","混合肌","普通肌","わからない"],TC=Array.from({length:100},(a,i)=>new Date().getFullYear()-i),EC=Array.from({length:12},(a,i)=>i+1),Mc=(a,i)=>!a||!i?31:new Date(Number(a),Number(i),0).getDate(),AC=["乾燥","ニキビ","吹き出物","くすみ","シミ","シワ","たるみ","毛穴"],CC=["保湿","ハリ・ツヤ","透明感","美白ケア","キメ","なめらかさ"];function yg({label:a,checked:i,onChange:s,name:r}){return v.jsxs("label",{className:"cursor-pointer select-none",children:[v.jsx("input",{type:"checkbox",className:"peer sr-only",name:r,value:a,checked:i,onChange:s}),v.jsx("span",{className:`inline-flex items-center gap-2 rounded-full border px-3 py-1.5 text-sm transition
+                       peer-checked:border-blue-600 peer-checked:bg-blue-50 peer-checked:text-blue-700`,children:a})]})}function NC(){const[a,i]=E.useState({lastName:"",firstName:"",furigana:"",birthYear:"",birthMonth:"",birthDay:"",birthdate:"",email:"",phone:"",address:"",skinType:"",skinConcerns:[],idealSkin:[],concernNote:"",idealNote:"",sensitiveInfo:"",emailOptIn:!0}),s=(f,d)=>{i(m=>{const p=m[f].includes(d);return{...m,[f]:p?m[f].filter(y=>y!==d):[...m[f],d]}})},r=f=>{const{name:d,value:m}=f.target;i(p=>({...p,[d]:m}))},c=async f=>{f.preventDefault();const d={name:`${a.lastName} ${a.firstName}`.trim(),kana:a.furigana||null,phone:a.phone||null,email:a.email||null,birthday:a.birthdate||null,note:[a.address&&`住所: ${a.address}`,a.skinType&&`肌タイプ: ${a.skinType}`,a.skinConcerns.length>0&&`肌悩み: ${a.skinConcerns.join(", ")}`,a.concernNote&&`悩みメモ: ${a.concernNote}`,a.idealSkin.length>0&&`理想の肌: ${a.idealSkin.join(", ")}`,a.idealNote&&`理想メモ: ${a.idealNote}`,a.sensitiveInfo&&`敏感情報: ${a.sensitiveInfo}`].filter(Boolean).join(" / "),email_opt_in:a.emailOptIn};try{console.log("送信するペイロード:",d);const m=await xC(d);console.log("作成された顧客:",m),alert("顧客情報を登録しました！")}catch(m){console.error("顧客登録エラー:",m),alert("顧客情報の登録に失敗しました…コンソールを確認してください")}};return v.jsx(Xr,{header:v.jsx("div",{className:"text-sm text-gray-600",children:"ログイン中：Staff 01"}),children:v.jsx("div",{className:"min-h-screen bg-gray-50 py-8",children:v.jsxs("div",{className:"mx-auto max-w-5xl px-4",children:[v.jsx("h1",{className:"text-2xl font-bold tracking-tight",children:"新規登録"}),v.jsx("p",{className:"mt-1 text-sm text-gray-600",children:"必須項目を入力し、「登録する」を押してください。"}),v.jsxs("form",{onSubmit:c,className:"mt-6 grid gap-6 md:grid-cols-2",children:[v.jsxs("section",{className:"rounded-2xl border bg-white p-6 shadow-sm",children:[v.jsx("h2",{className:"text-lg font-semibold",children:"① 個人情報登録"}),v.jsxs("div",{className:"mt-4 grid gap-4",children:[v.jsxs("div",{className:"grid grid-cols-2 gap-3",children:[v.jsxs("div",{children:[v.jsxs("label",{className:"block text-sm font-medium",children:["姓 ",v.jsx("span",{className:"text-red-600",children:"*"})]}),v.jsx("input",{type:"text",name:"lastName",value:a.lastName,onChange:r,required:!0,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"山田"})]}),v.jsxs("div",{children:[v.jsxs("label",{className:"block text-sm font-medium",children:["名 ",v.jsx("span",{className:"text-red-600",children:"*"})]}),v.jsx("input",{type:"text",name:"firstName",value:a.firstName,onChange:r,required:!0,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"花子"})]})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium",children:"フリガナ"}),v.jsx("input",{type:"text",name:"furigana",value:a.furigana,onChange:r,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"ヤマダ ハナコ"})]}),v.jsxs("div",{children:[v.jsxs("label",{className:"block text-sm font-medium",children:["生年月日 ",v.jsx("span",{className:"text-red-600",children:"*"})]}),v.jsxs("div",{className:"mt-1 grid grid-cols-3 gap-2",children:[v.jsxs("select",{name:"birthYear",value:a.birthYear,onChange:f=>{const d=f.target.value;i(m=>{const p=Mc(d,m.birthMonth),y=m.birthDay&&Number(m.birthDay)>p?String(p):m.birthDay,g=d&&m.birthMonth&&y?`${d}-${String(m.birthMonth).padStart(2,"0")}-${String(y).padStart(2,"0")}`:"";return{...m,birthYear:d,birthDay:y,birthdate:g}})},required:!0,className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",children:[v.jsx("option",{value:"",children:"年"}),TC.map(f=>v.jsx("option",{value:f,children:f},f))]}),v.jsxs("select",{name:"birthMonth",value:a.birthMonth,onChange:f=>{const d=f.target.value;i(m=>{const p=Mc(m.birthYear,d),y=m.birthDay&&Number(m.birthDay)>p?String(p):m.birthDay,g=m.birthYear&&d&&y?`${m.birthYear}-${String(d).padStart(2,"0")}-${String(y).padStart(2,"0")}`:"";return{...m,birthMonth:d,birthDay:y,birthdate:g}})},required:!0,className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",children:[v.jsx("option",{value:"",children:"月"}),EC.map(f=>v.jsx("option",{value:f,children:f},f))]}),v.jsxs("select",{name:"birthDay",value:a.birthDay,onChange:f=>{const d=f.target.value;i(m=>{const p=m.birthYear&&m.birthMonth&&d?`${m.birthYear}-${String(m.birthMonth).padStart(2,"0")}-${String(d).padStart(2,"0")}`:"";return{...m,birthDay:d,birthdate:p}})},required:!0,className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",children:[v.jsx("option",{value:"",children:"日"}),Array.from({length:Mc(a.birthYear,a.birthMonth)},(f,d)=>d+1).map(f=>v.jsx("option",{value:f,children:f},f))]})]}),v.jsx("p",{className:"mt-1 text-xs text-gray-500",children:"年月日を選択してください"})]}),v.jsxs("div",{children:[v.jsxs("label",{className:"block text-sm font-medium",children:["メールアドレス ",v.jsx("span",{className:"text-red-600",children:"*"})]}),v.jsx("input",{type:"email",name:"email",value:a.email,onChange:r,required:!0,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"example@mail.com"})]}),v.jsx("div",{className:"mt-1",children:v.jsxs("label",{className:"flex items-center gap-2 text-xs text-gray-600",children:[v.jsx("input",{type:"checkbox",name:"emailOptIn",checked:a.emailOptIn,onChange:f=>i(d=>({...d,emailOptIn:f.target.checked})),className:"h-4 w-4 rounded border-gray-300 text-blue-600 focus:ring-blue-500"}),v.jsx("span",{children:"お誕生日・イベント・購入フォローなどの ご案内メールを受け取ることに同意します"})]})}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium",children:"電話番号（任意）"}),v.jsx("input",{type:"tel",name:"phone",value:a.phone,onChange:r,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"090-1234-5678"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium",children:"住所（任意）"}),v.jsx("input",{type:"text",name:"address",value:a.address,onChange:r,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"東京都〇〇区…"})]})]})]}),v.jsxs("section",{className:"rounded-2xl border bg-white p-6 shadow-sm",children:[v.jsx("h2",{className:"text-lg font-semibold",children:"② 美容プロフィール（チェックボックス）"}),v.jsxs("div",{className:"mt-4 space-y-5",children:[v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium mb-1",children:"お肌タイプ"}),v.jsxs("select",{name:"skinType",value:a.skinType,onChange:r,className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",children:[v.jsx("option",{value:"",children:"選択してください"}),SC.map(f=>v.jsx("option",{value:f,children:f},f))]})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium mb-2",children:"お肌悩み（複数選択可）"}),v.jsx("div",{className:"flex flex-wrap gap-2",children:AC.map(f=>v.jsx(yg,{name:"skinConcerns",label:f,checked:a.skinConcerns.includes(f),onChange:()=>s("skinConcerns",f)},f))}),v.jsx("input",{type:"text",name:"concernNote",value:a.concernNote,onChange:r,className:"mt-3 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"その他・自由記述"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium mb-2",children:"理想の肌感（複数選択可）"}),v.jsx("div",{className:"flex flex-wrap gap-2",children:CC.map(f=>v.jsx(yg,{name:"idealSkin",label:f,checked:a.idealSkin.includes(f),onChange:()=>s("idealSkin",f)},f))}),v.jsx("input",{type:"text",name:"idealNote",value:a.idealNote,onChange:r,className:"mt-3 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"その他・自由記述"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium mb-1",children:"敏感情報・禁止成分（任意）"}),v.jsx("textarea",{name:"sensitiveInfo",value:a.sensitiveInfo,onChange:r,rows:3,className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"刺激になりやすい成分、避けたい成分（例：アルコール、香料）"}),v.jsx("p",{className:"mt-1 text-xs text-gray-500",children:"個人情報の取扱いに同意の上、必要な範囲でご記入ください。"})]})]})]}),v.jsxs("div",{className:"md:col-span-2 flex items-center justify-end gap-3",children:[v.jsx("button",{type:"button",onClick:()=>window.history.back(),className:"rounded-lg border px-4 py-2 text-sm",children:"戻る"}),v.jsx("button",{type:"submit",className:"rounded-lg bg-blue-600 px-5 py-2.5 text-sm font-semibold text-white shadow-sm transition hover:bg-blue-700 focus:outline-none focus:ring-2 focus:ring-blue-500",children:"登録する"})]})]})]})})})}const la=(a="")=>a.toString().normalize("NFKC").toLowerCase().replace(/[\u30a1-\u30f6]/g,i=>String.fromCharCode(i.charCodeAt(0)-96)).trim(),wc=(a,i)=>{const s=a??"";if(!i)return s;const r=i.replace(/[.*+?^${}()|[\]\\]/g,"\\$&");return s.toString().split(new RegExp(`(${r})`,"i")).map((c,f)=>f%2?v.jsx("mark",{children:c},f):v.jsx("span",{children:c},f))};const yCs=20,yCr=t=>{const Q=(t.name??"").trim();let P="",ht="";if(Q.includes(" ")){const Tt=Q.split(/\s+/);P=Tt[0]??"",ht=Tt.slice(1).join(" ")??""}else{const Tt=Math.ceil(Q.length/2);P=Q.slice(0,Tt),ht=Q.slice(Tt)}return{id:String(t.id),number:String(t.id),lastName:P,firstName:ht,phone:t.phone??""}},yCh=()=>{const t=localStorage.getItem("access_token")||localStorage.getItem("rb_token");return t?{Authorization:`Bearer ${t}`}:{}},yCi=async t=>{const Q=await fetch(`${ye}/customers/${t}`,{headers:yCh()});if(Q.status===404)return[];if(!Q.ok)throw new Error(`顧客の取得に失敗しました（${Q.status}）`);return[await Q.json()]};function jC(){const a=da(),[i,s]=E.useState(""),[r,c]=E.useState(""),[f,d]=E.useState(""),[m,p]=E.useState(0),[N,g]=E.useState([]),[k,x]=E.useState({}),[h,H]=E.useState(!1),[w,W]=E.useState(""),z=E.useRef(0),[b,S]=E.useState({qNumber:i,qName:r,qPhone:f});E.useEffect(()=>{const j=setTimeout(()=>S({qNumber:i,qName:r,qPhone:f}),250);return()=>clearTimeout(j)},[i,r,f]);const L=async(j,_,O)=>{const $=O?z.current:++z.current;H(!0),W("");try{const K=yCh(),[tt,...Q]=await Promise.all([_?yCi(_):[],...Object.entries(j).map(([P,{q:ht,cursor:Tt}])=>yFg(`${ye}/customers?q=${encodeURIComponent(ht)}`,{headers:K,pageSize:yCs,cursor:Tt}).then(I=>({key:P,q:ht,...I})))]);if($!==z.current)return;const P={},ht=tt.map(yCr);for(const Tt of Q)Tt.nextCursor&&(P[Tt.key]={q:Tt.q,cursor:Tt.nextCursor}),ht.push(...Tt.items.map(yCr));x(P),g(Tt=>{const I=new Set;return[...(O?Tt:[]),...ht].filter(Y=>!I.has(Y.id)&&I.add(Y.id))})}catch(K){if($!==z.current)return;console.error(K),W(K.status?`顧客検索に失敗しました（${K.status}）`:K.message||"顧客検索エラー")}finally{$===z.current&&H(!1)}};E.useEffect(()=>{const j={},_=b.qName.trim(),O=b.qPhone.trim();_&&(j.name={q:_}),O&&(j.phone={q:O});const $=/^\d+$/.test(b.qNumber)?b.qNumber:"";if(!$&&!_&&!O){z.current++,g([]),x({}),H(!1),W("");return}L(j,$,!1)},[b]);const T=Object.keys(k).length>0,M=()=>{T&&!h&&L(k,"",!0)},R=j=>{const _=j.currentTarget;_.scrollTop+_.clientHeight>=_.scrollHeight-40&&M()};E.useEffect(()=>p(0),[b]);const V=j=>{const _=Number(la(j.id));if(!Number.isFinite(_))return alert("顧客IDが不正です");a(`/customers/${_}`)},B=j=>{if(N.length){if(j.key==="ArrowDown")j.preventDefault(),p(_=>Math.min(N.length-1,_+1));else if(j.key==="ArrowUp")j.preventDefault(),p(_=>Math.max(0,_-1));else if(j.key==="Enter"){j.preventDefault();const _=N[m];_&&V(_)}}},U=()=>{s(""),c(""),d("")};return v.jsx(Xr,{header:v.jsx("div",{className:"text-sm text-gray-600",children:"ログイン中：Staff 01"}),children:v.jsx("div",{className:"min-h-screen bg-gray-50 py-8",children:v.jsxs("div",{className:"mx-auto max-w-4xl px-4",children:[v.jsx("h1",{className:"text-2xl font-bold mb-6",children:"顧客検索【顧客番号】or【名前】or【電話】"}),v.jsxs("section",{className:"rounded-2xl border bg-white p-5 shadow-sm",children:[v.jsxs("div",{className:"grid gap-3 md:grid-cols-3",children:[v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm text-gray-600 mb-1",children:"顧客番号"}),v.jsx("input",{value:i,onChange:j=>s(la(j.target.value)),onKeyDown:B,placeholder:"例）1",className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",type:"text",inputMode:"numeric"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm text-gray-600 mb-1",children:"名前（姓 + 名）"}),v.jsx("input",{value:r,onChange:j=>c(j.target.value),onKeyDown:B,placeholder:"例）山田花子 / ﾔﾏﾀﾞﾊﾅｺ",className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",type:"text"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm text-gray-600 mb-1",children:"電話番号"}),v.jsx("input",{value:f,onChange:j=>d(j.target.value),onKeyDown:B,placeholder:"例）090-0000-0000",className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",type:"tel"})]})]}),v.jsx("div",{className:"mt-3 flex justify-center gap-2",children:v.jsx("button",{onClick:U,className:"rounded-md border px-3 py-1.5 text-sm hover:bg-gray-50",children:"クリア"})}),v.jsx("div",{className:"mt-4",children:v.jsxs("div",{className:"rounded-xl border",children:[v.jsx("ul",{className:"divide-y max-h-[420px] overflow-auto",onScroll:R,children:w?v.jsx("li",{className:"text-sm text-red-600 p-4",children:w}):N.length===0?v.jsx("li",{className:"text-sm text-gray-400 p-4",children:h?"検索中…":"検索候補一覧"}):N.map((j,_)=>{const O=_===m;return v.jsxs("li",{onMouseEnter:()=>p(_),onClick:()=>V(j),className:"cursor-pointer px-4 py-3 grid grid-cols-1 md:grid-cols-[120px_1fr_160px] items-center gap-2 "+(O?"bg-blue-50":"bg-white hover:bg-gray-50"),children:[v.jsxs("div",{className:"font-mono text-sm text-gray-700",children:["#",wc(j.number,i)]}),v.jsx("div",{className:"text-gray-900 font-medium",children:wc(`${j.lastName} ${j.firstName}`,r)}),v.jsx("div",{className:"text-sm text-gray-500",children:wc(j.phone,f)})]},j.id)})}),T&&N.length>0&&v.jsx("div",{className:"border-t p-2 text-center",children:v.jsx("button",{onClick:M,disabled:h,className:"rounded-md border px-3 py-1.5 text-sm hover:bg-gray-50 disabled:opacity-50",children:h?"読み込み中…":"さらに表示"})})]})})]})]})})})}function Cr({title:a,children:i,className:s="",right:r}){return v.jsxs("section",{className:`rounded-2xl border bg-white p-6 shadow-sm ${s}`,children:[v.jsxs("div",{className:"flex items-center justify-between",children:[v.jsx("h2",{className:"text-lg font-semibold",children:a}),r]}),v.jsx("div",{className:"mt-4",children:i})]})}function gg({options:a,value:i,onChange:s}){const r=c=>{i.includes(c)?s(i.filter(f=>f!==c)):s([...i,c])};return v.jsx("div",{className:"flex flex-wrap gap-2",children:a.map(c=>{const f=i.includes(c);return v.jsx("button",{type:"button",onClick:()=>r(c),className:"rounded-full border px-3 py-1.5 text-sm transition "+(f?"bg-blue-600 text-white border-blue-600":"bg-white hover:bg-gray-50"),children:c},c)})})}function gv({value:a,onChange:i,optionsByCategory:s}){const r=f=>{a.includes(f)?i(a.filter(d=>d!==f)):i([...a,f])},c=()=>i([]);return v.jsxs("div",{children:[v.jsxs("div",{className:"mb-2 flex justify-between items-center",children:[v.jsx("span",{className:"block text-xs text-gray-600",children:"購入品・サービス"}),v.jsx("button",{type:"button",onClick:c,className:"text-xs rounded-md border px-2 py-1 hover:bg-gray-50",children:"クリア"})]}),v.jsx("div",{className:"space-y-3",children:Object.entries(s).map(([f,d])=>v.jsxs("div",{children:[v.jsx("div",{className:"text-xs font-semibold text-gray-700 mb-1",children:f}),v.jsx("div",{className:"flex flex-wrap gap-2",children:d.map(m=>{const p=a.includes(m);return v.jsx("button",{type:"button",onClick:()=>r(m),className:"rounded-full border px-3 py-1 text-sm transition "+(p?"bg-blue-600 text-white border-blue-600":"bg-white hover:bg-gray-50"),children:m},m)})})]},f))}),v.jsx("div",{className:"mt-3 text-xs text-gray-600",children:a.length>0?`選択中：${a.join(" / ")}`:"選択なし"})]})}function DC({v:a,isEditing:i,draft:s,onStartEdit:r,onChange:c,onSave:f,onCancel:d,onDelete:m,staffOptions:p,productOptions:y}){return i?v.jsxs("div",{className:"grid grid-cols-[130px_1fr_1fr_auto] items-start gap-2 rounded-lg border bg-gray-50 px-3 py-2",children:[v.jsx("div",{children:v.jsx("input",{type:"text",value:s.date,onChange:g=>c({...s,date:g.target.value}),className:"w-full rounded-md border px-2 py-1",placeholder:"2025/10/16"})}),v.jsx("div",{children:v.jsxs("select",{value:s.staff_id??"",onChange:g=>c({...s,staff_id:g.target.value}),className:"w-full rounded-md border px-2 py-1 bg-white",children:[v.jsx("option",{value:"",children:"— 選択してください —"}),p.map(g=>v.jsx("option",{value:g.value,children:g.label},g.value))]})}),v.jsx("div",{className:"col-span-1",children:v.jsx(gv,{value:s.items,onChange:g=>c({...s,items:g}),optionsByCategory:y})}),v.jsxs("div",{className:"flex gap-2",children:[v.jsx("button",{onClick:f,className:"rounded-md bg-blue-600 px-3 py-1.5 text-sm font-semibold text-white hover:bg-blue-700",children:"保存"}),v.jsx("button",{onClick:d,className:"rounded-md border px-3 py-1.5 text-sm hover:bg-gray-50",children:"キャンセル"}),v.jsx("button",{onClick:()=>m(a.id),className:"rounded-md border border-red-500 text-red-500 px-3 py-1.5 text-sm hover:bg-red-50",children:"削除"})]})]}):v.jsxs("div",{className:"grid grid-cols-[130px_1fr_1fr_auto] items-center gap-2 rounded-lg border px-3 py-2",children:[v.jsx("div",{className:"text-sm text-gray-700",children:a.date}),v.jsx("div",{className:"text-sm text-gray-700",children:a.staff_name?`【担当者】${a.staff_name}`:"【担当者】"}),v.jsx("div",{className:"text-sm text-gray-700",children:a.items?.length?`【購入品・サービス】 ${a.items.join(" / ")}`:"【購入品・サービス】"}),v.jsxs("div",{className:"flex flex-col items-end gap-2",children:[v.jsx("button",{onClick:()=>r(a),className:"rounded-md border px-3 py-1 text-sm hover:bg-gray-50",children:"編集"}),v.jsx("button",{onClick:()=>m(a.id),className:"rounded-md border border-red-500 text-red-500 px-3 py-1 text-sm hover:bg-red-50 transition-colors duration-200",children:"削除"})]})]})}const Nr=a=>{const i={};return a&&a.split(" / ").forEach(s=>{const r=s.indexOf(":");if(r===-1)return;const c=s.slice(0,r).trim(),f=s.slice(r+1).trim();i[c]=f}),i},sa=a=>(a||"").split(",").map(i=>i.trim()).filter(Boolean),MC=a=>[a.address&&`住所: ${a.address}`,a.skinType&&`肌タイプ: ${a.skinType}`,a.skinConcerns?.length?`肌悩み: ${a.skinConcerns.join(", ")}`:null,a.concernNote&&`悩みメモ: ${a.concernNote}`,a.idealSkin?.length?`理想の肌: ${a.idealSkin.join(", ")}`:null,a.idealNote&&`理想メモ: ${a.idealNote}`,a.sensitiveInfo&&`敏感情報: ${a.sensitiveInfo}`,a.memo&&`メモ: ${a.memo}`].filter(Boolean).join(" / "),wC=["乾燥肌","脂性肌","混合肌","普通肌","わからない"],RC=["乾燥","ニキビ","吹き出物","くすみ","シミ","シワ","たるみ","毛穴"],_C=["保湿","ハリ・ツヤ","透明感","美白ケア","キメ","なめらかさ"];function OC(){const{id:a}=RS(),i=da(),[s,r]=E.useState(!1),[c,f]=E.useState([]),[d,m]=E.useState(!1),[p,y]=E.useState(""),[g,b]=E.useState({id:"",name:"",kana:"",phone:"",email:"",birthday:"",note:"",email_opt_in:!0}),[S,N]=E.useState(!1),[V,B]=E.useState(!1),[U,j]=E.useState({birthday:"",email:"",phone:"",emailOptIn:!0,address:"",memo:"",skinType:"",skinConcerns:[],idealSkin:[],concernNote:"",idealNote:"",sensitiveInfo:""}),_=E.useMemo(()=>g.name||"",[g.name]),O=E.useMemo(()=>Nr(g.note),[g.note]),$=E.useMemo(()=>c.map(G=>({value:G.id,label:G.name})),[c]),K=E.useMemo(()=>({スキンケア:["クレンジング","洗顔","導入美容液","化粧水","美容液","乳液","クリーム","パック"],メイクアップ:["下地","ファンデーション","パウダー","アイブロウ","アイシャドウ","マスカラ","アイライナー","リップ"],その他:["スキンケアサンプル","メイクアップサンプル","タッチアップ","マッサージ"]}),[]);E.useEffect(()=>{const G=new AbortController;async function F(){m(!0),y("");try{const st=localStorage.getItem("access_token")||localStorage.getItem("rb_token"),yt=await fetch(`${ye}/staffs/`,{headers:st?{Authorization:`Bearer ${st}`}:{},signal:G.signal});if(!yt.ok){const ft=await yt.text().catch(()=>"");throw new Error(`スタッフ取得に失敗しました（${yt.status}）${ft}`)}const ct=await yt.json();f(Array.isArray(ct)?ct:[])}catch(st){st.name!=="AbortError"&&y(st.message||"スタッフ取得エラー")}finally{m(!1)}}return F(),()=>G.abort()},[]),E.useEffect(()=>{if(!a)return;const G=new AbortController;async function F(){try{const st=localStorage.getItem("access_token")||localStorage.getItem("rb_token"),yt=await fetch(`${ye}/customers/${a}`,{headers:st?{Authorization:`Bearer ${st}`}:{},signal:G.signal});if(!yt.ok){const Ie=await yt.text().catch(()=>"");throw new Error(`顧客取得に失敗しました（${yt.status}）${Ie}`)}const ct=await yt.json();b(ct);const ft=Nr(ct.note);j({birthday:ct.birthday||"",email:ct.email||"",phone:ct.phone||"",emailOptIn:!!ct.email_opt_in,address:ft.住所||"",memo:ft.メモ||"",skinType:ft.肌タイプ||"",skinConcerns:sa(ft.肌悩み),idealSkin:sa(ft.理想の肌),concernNote:ft.悩みメモ||"",idealNote:ft.理想メモ||"",sensitiveInfo:ft.敏感情報||""}),N(!1)}catch(st){st.name!=="AbortError"&&(console.error(st),alert(st.message||"顧客取得エラー"))}}return F(),()=>G.abort()},[a]);const tt=()=>N(!0),Q=()=>{const G=Nr(g.note);j({birthday:g.birthday||"",email:g.email||"",phone:g.phone||"",emailOptIn:!!g.email_opt_in,address:G.住所||"",memo:G.メモ||"",skinType:G.肌タイプ||"",skinConcerns:sa(G.肌悩み),idealSkin:sa(G.理想の肌),concernNote:G.悩みメモ||"",idealNote:G.理想メモ||"",sensitiveInfo:G.敏感情報||""}),N(!1)},P=async()=>{const G=Number(g.id||a);if(!G||!window.confirm(`この顧客を削除しますか？
+※来店記録もすべて削除されます。`))return;const st=localStorage.getItem("access_token")||localStorage.getItem("rb_token");try{r(!0);const yt=await fetch(`${ye}/customers/${G}`,{method:"DELETE",headers:st?{Authorization:`Bearer ${st}`}:{}});if(!yt.ok){const ct=await yt.text().catch(()=>"");throw new Error(`削除に失敗しました (${yt.status}) ${ct}`)}alert("顧客を削除しました。"),i("/customers/search",{replace:!0})}catch(yt){console.error(yt),alert(yt.message||"顧客の削除に失敗しました")}finally{r(!1)}},ht=async()=>{try{B(!0);const G={birthday:U.birthday||null,email:U.email||null,phone:U.phone||null,email_opt_in:U.emailOptIn,note:MC(U)||null},F=await bC(Number(g.id||a),G);b(F);const st=Nr(F.note);j(yt=>({...yt,birthday:F.birthday||"",email:F.email||"",phone:F.phone||"",emailOptIn:!!F.email_opt_in,address:st.住所||"",memo:st.メモ||"",skinType:st.肌タイプ||"",skinConcerns:sa(st.肌悩み),idealSkin:sa(st.理想の肌),concernNote:st.悩みメモ||"",idealNote:st.理想メモ||"",sensitiveInfo:st.敏感情報||""})),N(!1),alert("顧客情報を更新しました！")}catch(G){console.error(G),alert(G.message||"顧客情報の更新に失敗しました")}finally{B(!1)}},[Tt,kt]=E.useState([]),[It,fe]=E.useState(!1),[me,te]=E.useState("");E.useEffect(()=>{if(!a)return;(async()=>{try{fe(!0),te("");const F=localStorage.getItem("access_token")||localStorage.getItem("rb_token"),st=await yFp(`${ye}/visits/by-customer/${a}`,{headers:F?{Authorization:`Bearer ${F}`}:{},pageSize:500}).catch(ft=>{throw ft.status?new Error(`来店履歴の取得に失敗しました（${ft.status}）${ft.body}`):ft}),ct=st.map(ft=>{const Ie=(ft.items??[]).map(Ne=>`${Ne.category}${Ne.product_name?`：${Ne.product_name}`:""}`);return{id:ft.id,date:(ft.visit_date??"").replaceAll("-","/"),staff_id:ft.staff_id??"",staff_name:c.find(Ne=>Number(Ne.id)===Number(ft.staff_id))?.name||"",items:Ie,memo:ft.memo??"",_raw:ft}});kt(ct)}catch(F){console.error(F),te(F.message||"来店履歴取得エラー")}finally{fe(!1)}})()},[a,c]);const[H,X]=E.useState(!1),[J,ut]=E.useState({date:"",staff_id:"",items:[]}),[pt,C]=E.useState(null),[k,Z]=E.useState({id:null,date:"",staff_id:"",items:[],memo:""}),I=()=>new Date().toISOString().slice(0,10).replace(/-/g,"/"),lt=()=>{C(null),Z({id:null,date:"",staff_id:"",items:[],memo:""}),ut({date:I(),staff_id:"",items:[]}),X(!0)},mt=G=>G==="スキンケア"?"skincare":G==="メイクアップ"?"makeup":"other",Et=G=>{for(const[F,st]of Object.entries(K))if(st.includes(G))return F;return"その他"},ie=async()=>{if(!J.date?.trim())return alert("日付を入力してください");if(!String(J.staff_id||"").trim())return alert("担当者を選択してください");if(!J.items?.length)return alert("購入品・サービスを1点以上選択してください");const G=localStorage.getItem("access_token")||localStorage.getItem("rb_token"),F=J.date.replaceAll("/","-"),st=J.items.map(ct=>{const ft=Et(ct);return{category:mt(ft),product_name:ct,note:null}}),yt={customer_id:Number(a),visit_date:F,memo:null,staff_id:Number(J.staff_id),items:st};try{fe(!0),te("");const ct=await fetch(`${ye}/visits/`,{method:"POST",headers:{"Content-Type":"application/json",...G?{Authorization:`Bearer ${G}`}:{}},body:JSON.stringify(yt)});if(!ct.ok){const Xt=await ct.text().catch(()=>"");throw new Error(`来店登録に失敗しました（${ct.status}）${Xt}`)}const ft=await ct.json(),Ie=(ft.items??[]).map(Xt=>`${Xt.category}${Xt.product_name?`：${Xt.product_name}`:""}`),Ne=c.find(Xt=>Xt.id===Number(J.staff_id))?.name||"",pa={id:ft.id,date:(ft.visit_date??"").replaceAll("-","/"),staff_id:Number(J.staff_id),staff_name:Ne,items:Ie,memo:ft.memo??"",_raw:ft};kt(Xt=>[pa,...Xt]),X(!1)}catch(ct){console.error(ct),alert(ct.message||"来店登録エラー")}finally{fe(!1)}},Lt=G=>{X(!1),C(G.id);const F=Array.isArray(G.items)?G.items.map(st=>{const yt=String(st);return yt.includes("：")?yt.split("：").pop().trim():yt.trim()}):[];Z({id:G.id,date:G.date,staff_id:String(G.staff_id??""),items:F,memo:G.memo??""})},ma=async()=>{if(!k.date?.trim())return alert("日付を入力してください");if(!String(k.staff_id||"").trim())return alert("担当者を選択してください");if(!k.items?.length)return alert("購入品・サービスを1点以上選択してください");const G=localStorage.getItem("access_token")||localStorage.getItem("rb_token"),F=k.date.replaceAll("/","-"),st=k.items.map(ct=>{const ft=Et(ct);return{category:mt(ft),product_name:ct,note:null}}),yt={visit_date:F,memo:k.memo??null,staff_id:Number(k.staff_id),items:st};try{fe(!0),te("");const ct=await fetch(`${ye}/visits/${pt}`,{method:"PUT",headers:{"Content-Type":"application/json",...G?{Authorization:`Bearer ${G}`}:{}},body:JSON.stringify(yt)});if(!ct.ok){const Xt=await ct.text().catch(()=>"");throw new Error(`編集に失敗しました（${ct.status}）${Xt}`)}const ft=await ct.json(),Ie=(ft.items??[]).map(Xt=>`${Xt.category}${Xt.product_name?`：${Xt.product_name}`:""}`),Ne=c.find(Xt=>Xt.id===Number(k.staff_id))?.name||"",pa={id:ft.id,date:(ft.visit_date??"").replaceAll("-","/"),staff_id:Number(k.staff_id),staff_name:Ne,items:Ie,memo:ft.memo??"",_raw:ft};kt(Xt=>Xt.map(as=>as.id===pt?pa:as)),C(null)}catch(ct){console.error(ct),alert(ct.message||"来店記録の編集に失敗しました")}finally{fe(!1)}},Ya=async G=>{if(!window.confirm("削除してもよろしいですか？"))return;const st=localStorage.getItem("access_token")||localStorage.getItem("rb_token");try{const yt=await fetch(`${ye}/visits/${G}`,{method:"DELETE",headers:st?{Authorization:`Bearer ${st}`}:{}});if(!yt.ok){const ct=await yt.text().catch(()=>"");throw new Error(`削除に失敗しました (${yt.status}) ${ct}`)}kt(ct=>ct.filter(ft=>ft.id!==G))}catch(yt){console.error(yt),alert(yt.message||"来店記録の削除に失敗しました")}},Hi=()=>C(null);return v.jsx(Xr,{header:v.jsx("div",{className:"text-sm text-gray-600",children:"ログイン中：Staff 01"}),children:v.jsxs("div",{className:"space-y-6",children:[v.jsx("header",{className:"rounded-2xl border bg-white px-6 py-5 shadow-sm",children:v.jsxs("div",{className:"flex items-center justify-between gap-3",children:[v.jsxs("h1",{className:"text-2xl font-bold tracking-tight",children:["顧客番号：",g.id," ／ 名前：",_]}),S?v.jsxs("div",{className:"flex gap-2",children:[v.jsx("button",{onClick:ht,disabled:V,className:"rounded-lg bg-blue-600 px-4 py-2 text-sm font-semibold text-white hover:bg-blue-700 disabled:opacity-50",children:"保存"}),v.jsx("button",{onClick:Q,disabled:V,className:"rounded-lg border px-4 py-2 text-sm hover:bg-gray-50 disabled:opacity-50",children:"キャンセル"})]}):v.jsxs("div",{className:"flex gap-2",children:[v.jsx("button",{onClick:tt,className:"rounded-lg border px-4 py-2 text-sm font-semibold hover:bg-gray-50",children:"基本情報を編集"}),v.jsx("button",{onClick:P,disabled:s,className:"rounded-lg border border-red-500 px-4 py-2 text-sm font-semibold text-red-600 hover:bg-red-50 disabled:opacity-50",children:s?"削除中...":"顧客を削除"})]})]})}),v.jsxs("div",{className:"mt-6 grid gap-6 md:grid-cols-2",children:[v.jsx(Cr,{title:"① 基本情報",children:v.jsxs("div",{className:"space-y-4",children:[v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium",children:"生年月日（YYYY-MM-DD）"}),v.jsx("input",{type:"text",value:S?U.birthday:g.birthday??"",onChange:G=>j(F=>({...F,birthday:G.target.value})),readOnly:!S,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500 "+(S?"":"bg-gray-50"),placeholder:"1990-01-01"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium",children:"メールアドレス"}),v.jsx("input",{type:"email",value:S?U.email:g.email??"",onChange:G=>j(F=>({...F,email:G.target.value})),readOnly:!S,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500 "+(S?"":"bg-gray-50"),placeholder:"example@mail.com"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium",children:"電話番号"}),v.jsx("input",{type:"tel",value:S?U.phone:g.phone??"",onChange:G=>j(F=>({...F,phone:G.target.value})),readOnly:!S,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500 "+(S?"":"bg-gray-50"),placeholder:"090-1234-5678"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium",children:"住所（任意）"}),v.jsx("input",{type:"text",value:S?U.address:O.住所??"",onChange:G=>j(F=>({...F,address:G.target.value})),readOnly:!S,className:"mt-1 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500 "+(S?"":"bg-gray-50"),placeholder:"東京都〇〇区…"})]}),v.jsxs("label",{className:"flex items-center gap-2 text-xs text-gray-600",children:[v.jsx("input",{type:"checkbox",checked:S?U.emailOptIn:!!g.email_opt_in,onChange:G=>j(F=>({...F,emailOptIn:G.target.checked})),disabled:!S,className:"h-4 w-4 rounded border-gray-300 text-blue-600 focus:ring-blue-500"}),v.jsx("span",{children:"ご案内メールを受け取ることに同意"})]})]})}),v.jsxs("div",{className:"space-y-6",children:[v.jsx(Cr,{title:"美容プロフィール",children:S?v.jsxs("div",{className:"space-y-5",children:[v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium mb-1",children:"肌タイプ"}),v.jsxs("select",{value:U.skinType,onChange:G=>j(F=>({...F,skinType:G.target.value})),className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",children:[v.jsx("option",{value:"",children:"選択してください"}),wC.map(G=>v.jsx("option",{value:G,children:G},G))]})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium mb-2",children:"肌悩み（複数選択）"}),v.jsx(gg,{options:RC,value:U.skinConcerns,onChange:G=>j(F=>({...F,skinConcerns:G}))}),v.jsx("input",{type:"text",value:U.concernNote,onChange:G=>j(F=>({...F,concernNote:G.target.value})),className:"mt-3 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"その他・自由記述"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium mb-2",children:"理想の肌（複数選択）"}),v.jsx(gg,{options:_C,value:U.idealSkin,onChange:G=>j(F=>({...F,idealSkin:G}))}),v.jsx("input",{type:"text",value:U.idealNote,onChange:G=>j(F=>({...F,idealNote:G.target.value})),className:"mt-3 w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"その他・自由記述"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-sm font-medium mb-1",children:"敏感情報（任意）"}),v.jsx("textarea",{rows:3,value:U.sensitiveInfo,onChange:G=>j(F=>({...F,sensitiveInfo:G.target.value})),className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500",placeholder:"刺激になりやすい成分、避けたい成分（例：アルコール、香料）"})]})]}):v.jsxs("div",{className:"space-y-3 text-sm",children:[v.jsxs("div",{children:[v.jsx("div",{className:"text-xs text-gray-500",children:"肌タイプ"}),v.jsx("div",{className:"mt-1",children:O.肌タイプ||"—"})]}),v.jsxs("div",{children:[v.jsx("div",{className:"text-xs text-gray-500",children:"肌悩み"}),v.jsx("div",{className:"mt-1",children:O.肌悩み?v.jsx("div",{className:"flex flex-wrap gap-2",children:sa(O.肌悩み).map(G=>v.jsx("span",{className:"rounded-full border px-3 py-1 text-xs",children:G},G))}):"—"}),O.悩みメモ&&v.jsx("div",{className:"mt-2 text-xs text-gray-600",children:O.悩みメモ})]}),v.jsxs("div",{children:[v.jsx("div",{className:"text-xs text-gray-500",children:"理想の肌"}),v.jsx("div",{className:"mt-1",children:O.理想の肌?v.jsx("div",{className:"flex flex-wrap gap-2",children:sa(O.理想の肌).map(G=>v.jsx("span",{className:"rounded-full border px-3 py-1 text-xs",children:G},G))}):"—"}),O.理想メモ&&v.jsx("div",{className:"mt-2 text-xs text-gray-600",children:O.理想メモ})]}),v.jsxs("div",{children:[v.jsx("div",{className:"text-xs text-gray-500",children:"敏感情報"}),v.jsx("div",{className:"mt-1 whitespace-pre-wrap",children:O.敏感情報||"—"})]})]})}),v.jsx(Cr,{title:"メモ",children:v.jsx("textarea",{value:S?U.memo:O.メモ??"",onChange:G=>j(F=>({...F,memo:G.target.value})),readOnly:!S,rows:10,className:"w-full rounded-lg border px-3 py-2 outline-none focus:ring-2 focus:ring-blue-500 "+(S?"":"bg-gray-50"),placeholder:"接客時の気づき、肌状態、好み、注意点 など"})})]})]}),v.jsxs(Cr,{title:"来店記録・購入品",className:"mt-6",children:[v.jsx("div",{className:"flex items-center justify-between",children:v.jsxs("button",{onClick:lt,className:"inline-flex items-center gap-2 rounded-lg border px-4 py-2 text-sm font-semibold hover:bg-gray-50",children:[v.jsx("span",{children:"🔹"})," 登録"]})}),It&&v.jsx("div",{className:"text-sm text-gray-500",children:"読み込み中..."}),me&&v.jsx("div",{className:"text-sm text-red-500",children:me}),H&&v.jsxs("div",{className:"mt-4 grid grid-cols-1 md:grid-cols-[130px_1fr_1fr_auto] items-start gap-2 rounded-lg border bg-gray-50 p-3",children:[v.jsxs("div",{children:[v.jsx("label",{className:"block text-xs text-gray-600",children:"日付"}),v.jsx("input",{type:"text",value:J.date,onChange:G=>ut(F=>({...F,date:G.target.value})),className:"mt-1 w-full rounded-md border px-2 py-1",placeholder:"2025/10/16"})]}),v.jsxs("div",{children:[v.jsx("label",{className:"block text-xs text-gray-600",children:"担当者"}),v.jsxs("select",{value:J.staff_id,onChange:G=>ut(F=>({...F,staff_id:G.target.value})),className:"mt-1 w-full rounded-md border px-2 py-1 bg-white",children:[v.jsx("option",{value:"",children:d?"読み込み中...":"— 選択してください —"}),$.map(G=>v.jsx("option",{value:G.value,children:G.label},G.value))]}),p&&v.jsx("p",{className:"mt-1 text-xs text-red-500",children:p})]}),v.jsx("div",{children:v.jsx(gv,{value:J.items,onChange:G=>ut(F=>({...F,items:G})),optionsByCategory:K})}),v.jsxs("div",{className:"flex gap-2",children:[v.jsx("button",{onClick:ie,className:"rounded-md bg-blue-600 px-3 py-1.5 text-sm font-semibold text-white hover:bg-blue-700",children:"保存"}),v.jsx("button",{onClick:()=>X(!1),className:"rounded-md border px-3 py-1.5 text-sm hover:bg-gray-50",children:"キャンセル"})]})]}),v.jsxs("div",{className:"mt-4 space-y-2",children:[Tt.map(G=>v.jsx(DC,{v:G,isEditing:pt===G.id,draft:pt===G.id?k:G,onStartEdit:Lt,onChange:Z,onSave:ma,onCancel:Hi,onDelete:Ya,staffOptions:$,productOptions:K},G.id)),[...Array(3)].map((G,F)=>v.jsxs("div",{className:"grid grid-cols-[130px_1fr_1fr_auto] items-center gap-2 rounded-lg border px-3 py-3 text-gray-300",children:[v.jsx("div",{children:"— — —"}),v.jsx("div",{children:"— — —"}),v.jsx("div",{children:"— — —"}),v.jsx("div",{children:v.jsx("button",{disabled:!0,className:"rounded-md border px-3 py-1 text-sm opacity-40",children:"編集"})})]},`placeholder-${F}`))]})]})]})})}function Ul({children:a}){return localStorage.getItem("access_token")||localStorage.getItem("rb_token")?a:v.jsx(_c,{to:"/login",replace:!0})}function zC(){const a=localStorage.getItem("access_token")||localStorage.getItem("rb_token");return v.jsx(y1,{children:v.jsxs(QS,{children:[v.jsx(ra,{path:"/",element:a?v.jsx(_c,{to:"/home",replace:!0}):v.jsx(_c,{to:"/login",replace:!0})}),v.jsx(ra,{path:"/login",element:v.jsx(sC,{})}),v.jsx(ra,{path:"/home",element:v.jsx(Ul,{children:v.jsx(lC,{})})}),v.jsx(ra,{path:"/dashboard",element:v.jsx(Ul,{children:v.jsx(gC,{})})}),v.jsx(ra,{path:"/customers/new",element:v.jsx(Ul,{children:v.jsx(NC,{})})}),v.jsx(ra,{path:"/customers/search",element:v.jsx(Ul,{children:v.jsx(jC,{})})}),v.jsx(ra,{path:"/customers/:id",element:v.jsx(Ul,{children:v.jsx(OC,{})})})]})})}$b.createRoot(document.getElementById("root")).render(v.jsx(xg.StrictMode,{children:v.jsx(zC,{})}));
@@ -0,0 +1,162 @@
+# app/static_files.py
+# フロント（Vite のビルド結果 app/static）の配信
+#
+# - 起動時に全ファイルを読み込み、圧縮版（gzip / brotli）も作ってメモリに置く
+#   ビルド時に .gz / .br を一緒に出力していればそれを使う（brotli はパッケージが入っているときだけ）
+# - Accept-Encoding を見て圧縮版を返す（Vary: Accept-Encoding）
+# - assets/ のハッシュ付きファイル（index-DFhVN9qZ.js など）は中身が変わると名前も変わるので1年キャッシュ（immutable）
+#   index.html などそれ以外は毎回 ETag で確認（変わっていなければ 304）
+# - 存在しないパスは SPA のルーティング用に index.html を返す（/api/ と assets/ は 404）
+# ビルドし直したファイルは再起動で反映される
+import gzip
+import hashlib
+import logging
+import mimetypes
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, JSONResponse, PlainTextResponse, Response
+
+try:
+    import brotli
+except ImportError:  # 任意の依存（pip install brotli）。無ければ gzip だけ
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+MAX_MEMORY_FILE_SIZE = 2 * 1024 * 1024  # これより大きいファイルはメモリに置かずディスクから返す（圧縮もしない）
+MIN_COMPRESS_SIZE = 512
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml", "application/wasm")
+HASHED_NAME = re.compile(r"[-.][A-Za-z0-9_-]{8,}\.\w+$")  # Vite の [name]-[hash].[ext]
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"  # キャッシュしてよいが、使う前に毎回 ETag で確認する
+
+
+@dataclass
+class StaticFile:
+    path: Path
+    media_type: str
+    cache_control: str
+    etag: str
+    body: bytes | None = None  # None ならディスクから返す
+    encoded: dict[str, bytes] = field(default_factory=dict)  # "br" / "gzip" → 圧縮済みの中身
+
+
+def _media_type(path: Path) -> str:
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    if media_type.startswith("text/") or media_type == "application/javascript":
+        media_type += "; charset=utf-8"
+    return media_type
+
+
+def _load(path: Path, rel: str) -> StaticFile:
+    media_type = _media_type(path)
+    immutable = rel.startswith("assets/") and HASHED_NAME.search(rel)
+    cache_control = IMMUTABLE if immutable else REVALIDATE
+
+    stat = path.stat()
+    size = stat.st_size
+    if size > MAX_MEMORY_FILE_SIZE:
+        return StaticFile(path, media_type, cache_control, f'"{stat.st_mtime_ns:x}-{size:x}"')
+
+    body = path.read_bytes()
+    f = StaticFile(path, media_type, cache_control, f'"{hashlib.md5(body).hexdigest()}"', body)
+    if size >= MIN_COMPRESS_SIZE and media_type.startswith(COMPRESSIBLE_TYPES):
+        for encoding, suffix, compress in (
+            ("br", ".br", (lambda b: brotli.compress(b, quality=11)) if brotli else None),
+            ("gzip", ".gz", lambda b: gzip.compress(b, compresslevel=9, mtime=0)),
+        ):
+            prebuilt = path.with_name(path.name + suffix)
+            if prebuilt.is_file():
+                data = prebuilt.read_bytes()
+            elif compress:
+                data = compress(body)
+            else:
+                continue
+            if len(data) < size:
+                f.encoded[encoding] = data
+    return f
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    accepted = set()
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name, params = name.strip().lower(), params.strip()
+        try:
+            q = float(params[2:]) if params.startswith("q=") else 1.0
+        except ValueError:
+            q = 1.0
+        if name and q > 0:  # q=0 は「使わない」
+            accepted.add(name)
+    return accepted
+
+
+class SPAStaticFiles:
+    """app.mount("/", ...) する ASGI アプリ（API のルートに当たらなかったリクエストが来る）"""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.files: dict[str, StaticFile] = {}
+        if self.directory.is_dir():
+            for path in sorted(self.directory.rglob("*")):
+                if not path.is_file() or path.suffix in (".gz", ".br"):
+                    continue
+                rel = path.relative_to(self.directory).as_posix()
+                self.files[rel] = _load(path, rel)
+        self.index = self.files.get("index.html")
+        logger.info(
+            "static: %d files (%d compressed, brotli=%s)",
+            len(self.files), sum(1 for f in self.files.values() if f.encoded), brotli is not None,
+        )
+
+    async def __call__(self, scope, receive, send) -> None:
+        response = self.get_response(scope)
+        await response(scope, receive, send)
+
+    def get_response(self, scope) -> Response:
+        if scope["type"] != "http":
+            return PlainTextResponse("Not Found", status_code=404)
+        if scope["method"] not in ("GET", "HEAD"):
+            return PlainTextResponse("Method Not Allowed", status_code=405, headers={"Allow": "GET, HEAD"})
+
+        path = scope["path"].lstrip("/")
+        if path.startswith("api/"):
+            return JSONResponse({"detail": "Not Found"}, status_code=404)  # API側の404として返す
+
+        f = self.files.get(path or "index.html")
+        if f is None:
+            if path.startswith("assets/") or self.index is None:
+                return PlainTextResponse("Not Found", status_code=404)
+            f = self.index  # SPA のルーティング（/customers/1 など）
+        return self._respond(f, Headers(scope=scope), scope["method"] == "HEAD")
+
+    def _respond(self, f: StaticFile, request_headers: Headers, head: bool) -> Response:
+        headers = {"Cache-Control": f.cache_control}
+        if f.body is None:
+            headers["ETag"] = f.etag
+            if f.etag in request_headers.get("if-none-match", ""):
+                return Response(status_code=304, headers=headers)
+            return FileResponse(f.path, media_type=f.media_type, headers=headers)  # HEAD なら本文なしで返す（scope を見る）
+
+        body, etag = f.body, f.etag
+        if f.encoded:
+            headers["Vary"] = "Accept-Encoding"
+            accepted = _accepted_encodings(request_headers.get("accept-encoding", ""))
+            for encoding in ("br", "gzip"):
+                if encoding in f.encoded and encoding in accepted:
+                    body = f.encoded[encoding]
+                    etag = f'{f.etag[:-1]}-{encoding}"'  # 圧縮形式ごとに別の ETag
+                    headers["Content-Encoding"] = encoding
+                    break
+        headers["ETag"] = etag
+
+        if etag in request_headers.get("if-none-match", ""):
+            headers.pop("Content-Encoding", None)
+            return Response(status_code=304, headers=headers)
+
+        headers["Content-Length"] = str(len(body))
+        return Response(b"" if head else body, media_type=f.media_type, headers=headers)
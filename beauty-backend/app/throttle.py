@@ -0,0 +1,64 @@
+# app/throttle.py
+# プロセス内のスライディングウィンドウ（キーごとに直近 window 秒の回数を数える）
+# ログイン失敗の回数制限に使う。複数プロセスで動かす場合、回数はプロセスごとに数えられる点に注意
+import threading
+import time
+from collections import deque
+from typing import Hashable
+
+
+class SlidingWindow:
+    def __init__(self, limit: int, window: float, maxkeys: int = 10000):
+        self.limit = limit
+        self.window = window
+        self.maxkeys = maxkeys
+        self._hits: dict[Hashable, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def retry_after(self, key: Hashable) -> float:
+        """上限に達していれば、次に受け付けられるまでの秒数。まだ余裕があれば 0"""
+        now = time.monotonic()
+        with self._lock:
+            hits = self._hits.get(key)
+            if hits is None:
+                return 0.0
+            self._trim(hits, now)
+            if not hits:
+                del self._hits[key]
+                return 0.0
+            if len(hits) < self.limit:
+                return 0.0
+            return max(hits[len(hits) - self.limit] + self.window - now, 0.0)
+
+    def hit(self, key: Hashable) -> None:
+        now = time.monotonic()
+        with self._lock:
+            hits = self._hits.get(key)
+            if hits is None:
+                if len(self._hits) >= self.maxkeys:
+                    self._evict(now)
+                hits = self._hits[key] = deque()
+            self._trim(hits, now)
+            hits.append(now)
+            # 上限を大きく超えた分は覚えておく必要がない
+            while len(hits) > self.limit:
+                hits.popleft()
+
+    def reset(self, key: Hashable) -> None:
+        with self._lock:
+            self._hits.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._hits.clear()
+
+    def _trim(self, hits: deque[float], now: float) -> None:
+        while hits and hits[0] <= now - self.window:
+            hits.popleft()
+
+    def _evict(self, now: float) -> None:
+        # 窓から外れたキーを消して、それでも満杯なら一番古く入れたキーを消す
+        for k in [k for k, h in self._hits.items() if not h or h[-1] <= now - self.window]:
+            del self._hits[k]
+        if len(self._hits) >= self.maxkeys:
+            del self._hits[next(iter(self._hits))]
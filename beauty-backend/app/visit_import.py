@@ -0,0 +1,262 @@
+# app/visit_import.py
+# 来店履歴の一括取り込み（POS・旧システムからの移行用）
+#
+#   API: POST /api/visits/import?format=csv|ndjson（リクエスト本文をそのまま流す）
+#   CLI: python -m app.cli import-visits visits.csv
+#
+# 入力形式
+#   NDJSON: 1行 = 1来店（VisitCreate と同じ形）
+#     {"customer_id": 1, "visit_date": "2024-04-01", "items": [{"category": "skincare", "product_name": "化粧水"}]}
+#   CSV: 1行 = 1明細。ヘッダ行必須
+#     customer_id,visit_date,memo,staff_id,category,product_name,note[,visit_ref]
+#     連続する行で visit_ref（無ければ customer_id・visit_date・memo・staff_id）が同じなら1来店にまとめる
+#     visit_ref はまとめるためだけのキー（既存の来店 ID とは突き合わせず、毎回新しい来店として登録する）
+#     category が空の行は「明細なしの来店」
+#
+# chunk_size 来店ずつ VisitCreate で検証 → visits / visit_items を executemany でまとめて INSERT → commit
+# follow_due_date はフォロー周期ルールでまとめて計算、last_visit_date・最終購入サマリーはチャンクごとに顧客単位で1回だけ更新
+# 日別集計（rollups）は取り込みの最後に、commit 済みのチャンクが触れた日をまとめて1回だけ作り直す
+import csv
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from itertools import groupby
+from typing import Callable, Iterable, Iterator, TextIO
+
+from pydantic import ValidationError
+from sqlalchemy import bindparam, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from . import dashboard, follow_rules, last_purchases, models, rollups, schemas, segments
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("csv", "ndjson")
+
+# レポートに載せるエラーの上限（件数そのものは skipped で数える）
+MAX_ERRORS = 100
+
+
+@dataclass
+class ImportResult:
+    visits: int = 0
+    items: int = 0
+    skipped: int = 0
+    chunks: int = 0
+    elapsed_sec: float = 0.0
+    errors: list[dict] = field(default_factory=list)
+
+    @property
+    def rows_per_sec(self) -> float:
+        # INSERT した行数（visits + visit_items）/ 秒
+        return (self.visits + self.items) / self.elapsed_sec if self.elapsed_sec > 0 else 0.0
+
+    def add_error(self, line: int, message: str) -> None:
+        self.skipped += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append({"line": line, "error": message})
+
+
+# =======================
+# 入力の読み込み（1来店ずつ (行番号, dict) を返す）
+# =======================
+def read_ndjson(lines: Iterable[str]) -> Iterator[tuple[int, dict | None, str | None]]:
+    for line_no, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_no, json.loads(line), None
+        except json.JSONDecodeError as e:
+            yield line_no, None, f"JSON として読めません: {e.msg}"
+
+
+def read_csv(f: TextIO) -> Iterator[tuple[int, dict | None, str | None]]:
+    reader = csv.DictReader(f)
+    missing = [c for c in ("customer_id", "visit_date") if c not in (reader.fieldnames or [])]
+    if missing:
+        raise ValueError(f"CSV のヘッダに必要な列がありません: {', '.join(missing)}")
+    has_ref = "visit_ref" in reader.fieldnames
+
+    def visit_key(row):
+        if has_ref and row.get("visit_ref"):
+            return ("ref", row["visit_ref"])
+        return ("row", row.get("customer_id"), row.get("visit_date"), row.get("memo"), row.get("staff_id"))
+
+    # DictReader.line_num は「読んだ物理行数」なので、行ごとに控えておく
+    numbered = ((reader.line_num, row) for row in reader)
+    for _, group in groupby(numbered, key=lambda x: visit_key(x[1])):
+        group = list(group)
+        line_no, first = group[0]
+        visit = {
+            "customer_id": first.get("customer_id"),
+            "visit_date": first.get("visit_date"),
+            "memo": first.get("memo") or None,
+            "staff_id": first.get("staff_id") or None,
+            "items": [
+                {
+                    "category": row["category"],
+                    "product_name": row.get("product_name") or None,
+                    "note": row.get("note") or None,
+                }
+                for _, row in group
+                if row.get("category")
+            ],
+        }
+        yield line_no, visit, None
+
+
+def read_records(f: TextIO, fmt: str) -> Iterator[tuple[int, dict | None, str | None]]:
+    if fmt == "csv":
+        return read_csv(f)
+    if fmt == "ndjson":
+        return read_ndjson(f)
+    raise ValueError(f"未対応の形式です: {fmt}（{' / '.join(FORMATS)}）")
+
+
+# =======================
+# 取り込み
+# =======================
+def import_visits(
+    db: Session,
+    records: Iterable[tuple[int, dict | None, str | None]],
+    chunk_size: int = 1000,
+    on_progress: Callable[[ImportResult], None] | None = None,
+) -> ImportResult:
+    """来店を chunk_size 件ずつ検証して INSERT する（チャンクごとに commit）
+
+    不正な行は飛ばして errors に記録する。DB エラーはそのチャンクを rollback して送出
+    （それまでのチャンクは commit 済み）
+    """
+    result = ImportResult()
+    t0 = time.perf_counter()
+    rollup_days: set = set()  # commit 済みのチャンクで日別集計を作り直す日（最後にまとめて作り直す）
+
+    chunk: list[tuple[int, schemas.VisitCreate]] = []
+    try:
+        for line_no, data, error in records:
+            if error:
+                result.add_error(line_no, error)
+                continue
+            try:
+                chunk.append((line_no, schemas.VisitCreate.model_validate(data)))
+            except ValidationError as e:
+                result.add_error(line_no, _format_validation_error(e))
+                continue
+
+            if len(chunk) >= chunk_size:
+                _import_chunk(db, chunk, result, rollup_days)
+                chunk = []
+                _report(result, t0, on_progress)
+
+        if chunk:
+            _import_chunk(db, chunk, result, rollup_days)
+    finally:
+        # チャンクごとに作り直すと、日付が散らばった取り込みでは毎回ほぼ全期間の集計をやり直すことになる
+        if rollup_days:
+            rollups.refresh_days(db, rollup_days)
+            db.commit()
+            dashboard.invalidate()
+            segments.invalidate()
+    _report(result, t0, on_progress)
+    return result
+
+
+def _report(result: ImportResult, t0: float, on_progress) -> None:
+    result.elapsed_sec = time.perf_counter() - t0
+    logger.info(
+        "visit import: visits=%d items=%d skipped=%d (%.0f rows/s)",
+        result.visits, result.items, result.skipped, result.rows_per_sec,
+    )
+    if on_progress:
+        on_progress(result)
+
+
+def _format_validation_error(e: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors()
+    )
+
+
+def _import_chunk(
+    db: Session, chunk: list[tuple[int, schemas.VisitCreate]], result: ImportResult, rollup_days: set
+) -> None:
+    # 存在しない顧客・スタッフを参照している来店は飛ばす（1チャンク1クエリずつで確認）
+    customer_ids = {v.customer_id for _, v in chunk}
+    staff_ids = {v.staff_id for _, v in chunk if v.staff_id is not None}
+    known_customers = set(db.execute(
+        select(models.Customer.id).where(models.Customer.id.in_(customer_ids))
+    ).scalars())
+    known_staffs = set(db.execute(
+        select(models.Staff.id).where(models.Staff.id.in_(staff_ids))
+    ).scalars()) if staff_ids else set()
+
+    visits = []
+    for line_no, v in chunk:
+        if v.customer_id not in known_customers:
+            result.add_error(line_no, f"customer_id {v.customer_id} は存在しません")
+        elif v.staff_id is not None and v.staff_id not in known_staffs:
+            result.add_error(line_no, f"staff_id {v.staff_id} は存在しません")
+        else:
+            visits.append(v)
+    if not visits:
+        return
+
+    rules = follow_rules.get_rules(db)
+    try:
+        # 追加だけなので、日別集計はチャンク内の来店日と、取り込み前の初来店日を作り直せば足りる
+        days = rollups.first_visit_days(db, {v.customer_id for v in visits}) | {v.visit_date for v in visits}
+
+        visit_ids = db.execute(
+            insert(models.Visit).returning(models.Visit.id, sort_by_parameter_order=True),
+            [
+                {"customer_id": v.customer_id, "visit_date": v.visit_date, "memo": v.memo, "staff_id": v.staff_id}
+                for v in visits
+            ],
+        ).scalars().all()
+
+        items = [
+            {
+                "visit_id": visit_id,
+                "category": item.category,
+                "product_name": item.product_name,
+                "note": item.note,
+                "follow_due_date": rules.due_date(v.visit_date, item.category, item.product_name),
+            }
+            for visit_id, v in zip(visit_ids, visits)
+            for item in v.items
+        ]
+        if items:
+            db.execute(insert(models.VisitItem), items)
+
+        # 最終来店日は顧客ごとにチャンク内の最新日だけで更新（今より新しい場合のみ）
+        latest: dict[int, object] = {}
+        for v in visits:
+            if v.customer_id not in latest or latest[v.customer_id] < v.visit_date:
+                latest[v.customer_id] = v.visit_date
+        t = models.Customer.__table__
+        db.connection().execute(
+            update(t)
+            .where(
+                t.c.id == bindparam("_id"),
+                or_(t.c.last_visit_date.is_(None), t.c.last_visit_date < bindparam("_date")),
+            )
+            .values(last_visit_date=bindparam("_date")),
+            [{"_id": cid, "_date": d} for cid, d in latest.items()],
+        )
+
+        if items:
+            last_purchases.refresh_customers(db, {v.customer_id for v in visits if v.items})
+
+        db.commit()
+        dashboard.invalidate()
+        segments.invalidate()
+    except Exception:
+        db.rollback()
+        raise
+    rollup_days |= days
+
+    result.visits += len(visits)
+    result.items += len(items)
+    result.chunks += 1
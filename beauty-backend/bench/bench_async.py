@@ -0,0 +1,122 @@
+# bench/bench_async.py
+# 同期 DB（DB_ASYNC=0: スレッドプール）と非同期 DB（DB_ASYNC=1: AsyncSession）の負荷試験
+#
+# 一時ディレクトリにデータを入れた beauty_crm.db を作り、uvicorn をそれぞれのモードで起動して
+# ダッシュボードのポーリングに近い GET を同時に投げ、req/s とレイテンシを比べる
+#
+#   cd beauty-backend
+#   python -m bench.bench_async --customers 5000 --visits 20000 --concurrency 10 50 --requests 1000
+import argparse
+import asyncio
+import io
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from bench.bench_import import fresh_db, make_ndjson
+from app import visit_import
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+PATHS = [
+    "/api/dashboard/inactive-customers?segment=skincare",
+    "/api/dashboard/monthly-new-count",
+    "/api/visits/today-count",
+    "/api/customers?limit=50",
+]
+
+
+def seed(tmp: str, customers: int, visits: int) -> None:
+    engine, session_factory = fresh_db(tmp, "beauty_crm.db", customers)
+    with session_factory() as db:
+        visit_import.import_visits(db, visit_import.read_ndjson(io.StringIO(make_ndjson(visits, customers))))
+    engine.dispose()
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(tmp: str, port: int, async_db: bool) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        SQLALCHEMY_DATABASE_URL=f"sqlite:///{Path(tmp) / 'beauty_crm.db'}",
+        DB_ASYNC="1" if async_db else "0",
+        PYTHONPATH=str(BACKEND_DIR),
+    )
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=tmp, env=env,
+    )
+    for _ in range(100):
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/api/auth/ping", timeout=0.5)
+            return proc
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("server did not start")
+
+
+async def load(port: int, concurrency: int, total: int) -> tuple[float, list[float], int]:
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(total))
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=60) as client:
+        async def user():
+            nonlocal errors
+            for i in counter:
+                t0 = time.perf_counter()
+                r = await client.get(PATHS[i % len(PATHS)])
+                latencies.append(time.perf_counter() - t0)
+                if r.status_code != 200:
+                    errors += 1
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - t0
+
+    return total / elapsed, latencies, errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--customers", type=int, default=5000)
+    parser.add_argument("--visits", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 50])
+    parser.add_argument("--requests", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        seed(tmp, args.customers, args.visits)
+        print(f"customers={args.customers} visits={args.visits} requests={args.requests}")
+        for async_db in (False, True):
+            port = free_port()
+            proc = start_server(tmp, port, async_db)
+            try:
+                for c in args.concurrency:
+                    rps, lat, errors = asyncio.run(load(port, c, args.requests))
+                    lat.sort()
+                    print(
+                        f"{'async' if async_db else 'sync ':5} concurrency={c:<4} {rps:8.0f} req/s "
+                        f"p50={statistics.median(lat) * 1000:7.1f}ms p99={lat[int(len(lat) * 0.99) - 1] * 1000:7.1f}ms "
+                        f"errors={errors}"
+                    )
+            finally:
+                proc.terminate()
+                proc.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# bench/bench_auth.py
+# 認証（get_current_user）1回あたりのコスト: 毎回 DB を引く場合とスタッフ情報キャッシュに当たる場合の比較
+#
+#   cd beauty-backend
+#   python -m bench.bench_auth --iterations 5000
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+_tmp = tempfile.TemporaryDirectory()
+os.environ["SQLALCHEMY_DATABASE_URL"] = f"sqlite:///{Path(_tmp.name) / 'bench.db'}"
+
+from fastapi.security import HTTPAuthorizationCredentials  # noqa: E402
+
+from app import auth, crud, migrations, principals, schemas, security  # noqa: E402
+from app.database import SessionLocal, engine  # noqa: E402
+
+
+def per_call_us(fn, n: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) / n * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+    n = args.iterations
+
+    migrations.upgrade(engine)
+    with SessionLocal() as db:
+        staff = crud.create_staff(db, schemas.StaffCreate(staff_code="B-1", email="bench@example.com", password="x"), security.get_password_hash("x"))
+    token = auth.create_access_token({"sub": str(staff.id)})
+    creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    async def run():
+        # 1) JWT の検証・デコードだけ（キャッシュなし）
+        decode_us = per_call_us(lambda: auth._verify_token(token), n)
+
+        # 2) これまでの方式: デコード + 毎回 staffs を SELECT
+        def legacy():
+            staff_id, _, _ = auth._verify_token(token)
+            with SessionLocal() as db:
+                crud.get_staff_by_id(db, staff_id)
+        legacy_us = per_call_us(legacy, n)
+
+        # 3) キャッシュに当たる場合
+        await auth.get_current_user(creds)
+        t0 = time.perf_counter()
+        for _ in range(n):
+            await auth.get_current_user(creds)
+        cached_us = (time.perf_counter() - t0) / n * 1e6
+
+        # 4) 毎回スタッフ情報のキャッシュを捨てた場合（キャッシュミス: スレッドで DB を引く）
+        t0 = time.perf_counter()
+        for _ in range(n // 10):
+            principals.invalidate(staff.id)
+            await auth.get_current_user(creds)
+        miss_us = (time.perf_counter() - t0) / (n // 10) * 1e6
+        return decode_us, legacy_us, cached_us, miss_us
+
+    decode_us, legacy_us, cached_us, miss_us = asyncio.run(run())
+    print(f"jwt decode only        {decode_us:8.1f} us/call")
+    print(f"decode + SELECT staff  {legacy_us:8.1f} us/call")
+    print(f"cached principal       {cached_us:8.1f} us/call")
+    print(f"cache miss (thread+DB) {miss_us:8.1f} us/call")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
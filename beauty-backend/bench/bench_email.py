@@ -0,0 +1,68 @@
+# bench/bench_email.py
+# 一斉メール送信のスループット（通/秒）をローカルの SMTP sink 相手に測る
+#
+#   cd beauty-backend
+#   python -m bench.bench_email --recipients 5000 --concurrency 1 4 8
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app import migrations, models
+from app.mail_sink import LocalSMTPSink
+from app.mail_worker import MailWorker, enqueue_job
+from app.mailer import MailSettings, SMTPPool
+
+
+async def run(session_factory, n: int, concurrency: int, batch_size: int) -> float:
+    sink = await LocalSMTPSink().start()
+    settings = MailSettings(
+        smtp_host=sink.host,
+        smtp_port=sink.port,
+        smtp_starttls=False,
+        concurrency=concurrency,
+        batch_size=batch_size,
+    )
+    with session_factory() as db:
+        job = enqueue_job(db, "ベンチマーク", "本文\n" * 20, list(range(1, n + 1)))
+
+    worker = MailWorker(session_factory=session_factory, settings=settings, backend=SMTPPool(settings))
+    t0 = time.perf_counter()
+    await worker.run_job(job.id)
+    elapsed = time.perf_counter() - t0
+    await worker.backend.close()
+    await sink.stop()
+
+    assert len(sink.messages) == n, f"expected {n} messages, sink got {len(sink.messages)}"
+    return n / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--recipients", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", connect_args={"check_same_thread": False})
+        migrations.upgrade(engine)
+        with engine.begin() as conn:
+            conn.execute(insert(models.Customer), [
+                {"name": f"顧客{i}", "email": f"user{i}@example.com"} for i in range(args.recipients)
+            ])
+        session_factory = sessionmaker(bind=engine, autoflush=False)
+
+        print(f"recipients={args.recipients} batch_size={args.batch_size}")
+        for c in args.concurrency:
+            rate = asyncio.run(run(session_factory, args.recipients, c, args.batch_size))
+            print(f"concurrency={c:<3} {rate:10.0f} msg/s")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
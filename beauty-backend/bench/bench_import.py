@@ -0,0 +1,78 @@
+# bench/bench_import.py
+# 来店の一括取り込み（visit_import）と1件ずつの crud.create_visit のスループットを比べる
+#
+#   cd beauty-backend
+#   python -m bench.bench_import --visits 20000 --customers 2000
+import argparse
+import io
+import json
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app import crud, migrations, models, schemas, visit_import
+
+
+def make_ndjson(n: int, customers: int) -> str:
+    rnd = random.Random(0)
+    start = date(2021, 1, 1)
+    lines = []
+    for _ in range(n):
+        lines.append(json.dumps({
+            "customer_id": rnd.randint(1, customers),
+            "visit_date": (start + timedelta(days=rnd.randint(0, 5 * 365))).isoformat(),
+            "items": [
+                {"category": rnd.choice(["skincare", "makeup", "other"]), "product_name": f"商品{rnd.randint(1, 50)}"}
+                for _ in range(rnd.randint(1, 3))
+            ],
+        }))
+    return "\n".join(lines)
+
+
+def fresh_db(tmp: str, name: str, customers: int):
+    engine = create_engine(f"sqlite:///{Path(tmp) / name}", connect_args={"check_same_thread": False})
+    migrations.upgrade(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(models.Customer), [{"name": f"顧客{i}"} for i in range(customers)])
+    return engine, sessionmaker(bind=engine, autoflush=False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--visits", type=int, default=20000)
+    parser.add_argument("--customers", type=int, default=2000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--single", type=int, default=2000, help="1件ずつ登録で測る来店数")
+    args = parser.parse_args()
+
+    data = make_ndjson(args.visits, args.customers)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, session_factory = fresh_db(tmp, "bulk.db", args.customers)
+        with session_factory() as db:
+            r = visit_import.import_visits(
+                db, visit_import.read_ndjson(io.StringIO(data)), chunk_size=args.chunk_size
+            )
+        print(f"bulk import   visits={r.visits} items={r.items} {r.elapsed_sec:6.2f}s {r.rows_per_sec:10,.0f} rows/s")
+        engine.dispose()
+
+        engine, session_factory = fresh_db(tmp, "single.db", args.customers)
+        records = [json.loads(line) for line in data.splitlines()[:args.single]]
+        rows = 0
+        t0 = time.perf_counter()
+        with session_factory() as db:
+            for rec in records:
+                visit = crud.create_visit(db, schemas.VisitCreate.model_validate(rec))
+                rows += 1 + len(visit.items)
+        elapsed = time.perf_counter() - t0
+        print(f"create_visit  visits={len(records)} {elapsed:6.2f}s {rows / elapsed:10,.0f} rows/s")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
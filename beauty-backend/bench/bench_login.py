@@ -0,0 +1,134 @@
+# bench/bench_login.py
+# ログインが同時に殺到したときのスループットと、その間の他のリクエストの待ち時間
+#
+# - legacy: これまでのログイン（同期関数のまま。照合はリクエストのスレッドで実行）
+# - pooled: 現在の /api/auth/login（照合は上限付きのスレッドで実行）
+# ログインを concurrency 件ずつ同時に投げながら、/api/status（同期関数 = スレッドプールで動く）の
+# 応答時間を測る。最後にパスワード違いを1つのIPから投げ続け、何件が照合前に 429 で断られるかを見る
+#
+#   cd beauty-backend
+#   python -m bench.bench_login --logins 400 --concurrency 10 100
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+_tmp = tempfile.TemporaryDirectory()
+os.environ["SQLALCHEMY_DATABASE_URL"] = f"sqlite:///{Path(_tmp.name) / 'bench.db'}"
+
+import httpx  # noqa: E402
+from fastapi import Depends, HTTPException  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app import auth, crud, migrations, schemas, security  # noqa: E402
+from app.database import SessionLocal, engine, get_db  # noqa: E402
+from app.main import app  # noqa: E402
+
+STAFFS = 20
+PASSWORD = "bench-password"
+
+
+@app.post("/bench/legacy-login")
+def legacy_login(payload: auth.LoginIn, db: Session = Depends(get_db)):
+    staff = crud.get_staff_by_email(db, email=str(payload.email))
+    if (not staff) or (not security.verify_password(payload.password, staff.hashed_password)):
+        raise HTTPException(status_code=401)
+    return {"access_token": auth.create_access_token({"sub": str(staff.id)})}
+
+
+# "/" の StaticFiles より前に判定されるよう先頭へ移す
+app.router.routes.insert(0, app.router.routes.pop())
+
+
+def seed() -> None:
+    migrations.upgrade(engine)
+    hashed = security.get_password_hash(PASSWORD)  # 全員同じパスワード
+    with SessionLocal() as db:
+        for i in range(STAFFS):
+            crud.create_staff(db, schemas.StaffCreate(
+                staff_code=f"B-{i}", email=f"bench{i}@example.com", password=PASSWORD,
+            ), hashed)
+
+
+async def run(path: str, logins: int, concurrency: int) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        queue = asyncio.Queue()
+        for i in range(logins):
+            queue.put_nowait(i)
+        statuses: dict[int, int] = {}
+        probe_ms: list[float] = []
+        done = asyncio.Event()
+
+        async def login_worker():
+            while not queue.empty():
+                i = queue.get_nowait()
+                r = await client.post(path, json={"email": f"bench{i % STAFFS}@example.com", "password": PASSWORD})
+                statuses[r.status_code] = statuses.get(r.status_code, 0) + 1
+
+        async def probe():
+            while not done.is_set():
+                t0 = time.perf_counter()
+                await client.get("/api/status")
+                probe_ms.append((time.perf_counter() - t0) * 1000)
+                await asyncio.sleep(0.01)
+
+        probe_task = asyncio.create_task(probe())
+        t0 = time.perf_counter()
+        await asyncio.gather(*(login_worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - t0
+        done.set()
+        await probe_task
+
+    probe_ms.sort()
+    return {
+        "logins_per_sec": statuses.get(200, 0) / elapsed,  # 成功したログインだけ数える
+        "statuses": statuses,
+        "probe_p50": statistics.median(probe_ms),
+        "probe_p95": probe_ms[int(len(probe_ms) * 0.95) - 1],
+        "probe_max": probe_ms[-1],
+    }
+
+
+async def stuffing(attempts: int) -> dict:
+    # 1つのIPから、存在するアカウントにパスワード違いを投げ続ける
+    auth._failures_by_email.clear()
+    auth._failures_by_ip.clear()
+    transport = httpx.ASGITransport(app=app)
+    statuses: dict[int, int] = {}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        t0 = time.perf_counter()
+        for i in range(attempts):
+            r = await client.post("/api/auth/login", json={"email": f"bench{i % STAFFS}@example.com", "password": "wrong"})
+            statuses[r.status_code] = statuses.get(r.status_code, 0) + 1
+        elapsed = time.perf_counter() - t0
+    return {"statuses": statuses, "elapsed": elapsed}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--attempts", type=int, default=500, help="パスワード違いの試行回数")
+    args = parser.parse_args()
+
+    seed()
+    print(f"hash workers={security.HASH_WORKERS} max pending={security.HASH_MAX_PENDING} cpus={os.cpu_count()}")
+    for concurrency in args.concurrency:
+        for name, path in (("legacy", "/bench/legacy-login"), ("pooled", "/api/auth/login")):
+            r = asyncio.run(run(path, args.logins, concurrency))
+            print(
+                f"{name:6s} c={concurrency:<4d} {r['logins_per_sec']:7.1f} logins/s  statuses={r['statuses']}  "
+                f"/api/status p50={r['probe_p50']:6.1f}ms p95={r['probe_p95']:7.1f}ms max={r['probe_max']:7.1f}ms"
+            )
+
+    r = asyncio.run(stuffing(args.attempts))
+    print(f"wrong passwords from one IP: {args.attempts} attempts in {r['elapsed']:.2f}s statuses={r['statuses']}")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# bench/bench_search.py
+# 顧客検索のベンチマーク（従来の ilike 4本 OR スキャン vs 検索インデックス）
+#
+#   cd beauty-backend
+#   python -m bench.bench_search --customers 100000
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert, or_
+from sqlalchemy.orm import Session
+
+from app import migrations, models, search
+
+FAMILY = [("山田", "やまだ"), ("田中", "たなか"), ("佐藤", "さとう"), ("鈴木", "すずき"), ("高橋", "たかはし"), ("中村", "なかむら")]
+GIVEN = [("花子", "はなこ"), ("みつき", "みつき"), ("美咲", "みさき"), ("結衣", "ゆい"), ("葵", "あおい"), ("陽菜", "ひな")]
+
+QUERIES = ["山田 花", "ナカムラ", "みさき", "090-12", "user123", "example.com", "存在しない名前", "佐藤", "たか", "存在"]
+
+
+def seed(engine, n: int) -> None:
+    rng = random.Random(42)
+    rows = []
+    for i in range(n):
+        fam, fam_kana = rng.choice(FAMILY)
+        giv, giv_kana = rng.choice(GIVEN)
+        kana = f"{fam_kana} {giv_kana}"
+        phone = f"090-{rng.randint(0, 9999):04d}-{rng.randint(0, 9999):04d}"
+        rows.append({
+            "name": f"{fam} {giv}",
+            "kana": kana,
+            "kana_norm": search.normalize_kana(kana),
+            "phone": phone,
+            "phone_norm": search.normalize_phone(phone),
+            "email": f"user{i}@example.com",
+        })
+
+    with engine.begin() as conn:
+        for start in range(0, n, 10000):
+            conn.execute(insert(models.Customer), rows[start:start + 10000])
+
+
+def legacy_search(db: Session, q: str, limit: int = 50):
+    like = f"%{q}%"
+    C = models.Customer
+    return (
+        db.query(C)
+        .filter(or_(C.name.ilike(like), C.kana.ilike(like), C.phone.ilike(like), C.email.ilike(like)))
+        .order_by(C.id.desc())
+        .limit(limit)
+        .all()
+    )
+
+
+def timeit(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--customers", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        migrations.upgrade(engine)
+        seed(engine, args.customers)
+
+        print(f"customers={args.customers}")
+        print(f"{'query':<16}{'legacy ms':>12}{'indexed ms':>12}{'speedup':>10}")
+        with Session(engine) as db:
+            for q in QUERIES:
+                legacy = timeit(lambda: legacy_search(db, q), args.repeat)
+                indexed = timeit(lambda: search.search_customers(db, q), args.repeat)
+                print(f"{q:<16}{legacy:>12.2f}{indexed:>12.2f}{legacy / indexed:>9.1f}x")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
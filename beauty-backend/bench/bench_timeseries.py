@@ -0,0 +1,78 @@
+# bench/bench_timeseries.py
+# 推移グラフ1年分: 来店テーブルをその場で GROUP BY する場合と、日別集計（daily_rollups）を読む場合の比較
+#
+#   cd beauty-backend
+#   python -m bench.bench_timeseries --visits 200000 --customers 20000
+import argparse
+import io
+import tempfile
+import time
+from datetime import date
+
+from sqlalchemy import func, select
+
+from bench.bench_import import fresh_db, make_ndjson
+from app import models, rollups, visit_import
+
+
+def per_call_ms(fn, n: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) / n * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--visits", type=int, default=200000)
+    parser.add_argument("--customers", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    date_from, date_to = date(2024, 1, 1), date(2024, 12, 31)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, session_factory = fresh_db(tmp, "bench.db", args.customers)
+        with session_factory() as db:
+            r = visit_import.import_visits(
+                db, visit_import.read_ndjson(io.StringIO(make_ndjson(args.visits, args.customers))), chunk_size=5000
+            )
+            print(f"seeded visits={r.visits} items={r.items} in {r.elapsed_sec:.1f}s (rollups updated per chunk)")
+
+            t0 = time.perf_counter()
+            rollups.rebuild(db)
+            print(f"full rebuild (nightly job)   {time.perf_counter() - t0:8.2f}s")
+
+            V = models.Visit
+
+            def live_visits():
+                db.execute(
+                    select(V.visit_date, func.count())
+                    .where(V.visit_date.between(date_from, date_to))
+                    .group_by(V.visit_date)
+                ).all()
+
+            def live_categories():
+                db.execute(
+                    select(V.visit_date, models.VisitItem.category, func.count())
+                    .join(models.VisitItem, models.VisitItem.visit_id == V.id)
+                    .where(V.visit_date.between(date_from, date_to))
+                    .group_by(V.visit_date, models.VisitItem.category)
+                ).all()
+
+            for name, live, metric in (
+                ("visits/day", live_visits, "visits"),
+                ("category mix/day", live_categories, "category_mix"),
+            ):
+                live_ms = per_call_ms(live, args.repeat)
+                rollup_ms = per_call_ms(lambda: rollups.timeseries(db, metric, date_from, date_to, "day"), args.repeat)
+                print(f"{name:18s} 1 year  live GROUP BY {live_ms:8.2f} ms   rollups {rollup_ms:8.2f} ms")
+
+            rows = db.query(func.count()).select_from(models.DailyRollup).filter(
+                models.DailyRollup.metric == "visits", models.DailyRollup.day.between(date_from, date_to)
+            ).scalar()
+            print(f"rollup rows read for visits/day over 1 year: {rows}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+# bench/seed.py
+# ベンチマーク用の合成データを SQLite に作る（bench.suite から呼ぶ。単体でも使える）
+#
+#   cd beauty-backend
+#   python -m bench.seed --db bench/data/crm.db --customers 1000000 --visits 5000000
+#
+# - 顧客: 名前・かな・電話・メール（一部なし・配信停止あり）・誕生日（一部なし）。登録日は直近ほど多い
+# - 来店: 1人あたりの回数は幾何分布（1回きりの人が多く、常連が少し）。登録日〜today の間で土日が多め
+# - 明細: 1来店 1〜3件。カテゴリは skincare / makeup / other、商品は上位ほど売れる偏り
+#   フォロー期限はフォロー周期ルールから計算し、期限を過ぎたものは8割を送信済みにする
+# - 最終来店日・最終購入サマリー・日別集計もアプリと同じ内容にする
+# 乱数は --seed で固定（同じ引数なら同じデータ）。日付は --today 基準なので、ベースラインと同じ日付で作り直せる
+import argparse
+import json
+import math
+import random
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, event, func, insert, select
+from sqlalchemy.orm import Session
+
+from app import crud, follow_rules, last_purchases, migrations, models, rollups, schemas, search, security
+
+FAMILY = [
+    ("山田", "やまだ"), ("田中", "たなか"), ("佐藤", "さとう"), ("鈴木", "すずき"), ("高橋", "たかはし"),
+    ("中村", "なかむら"), ("小林", "こばやし"), ("伊藤", "いとう"), ("渡辺", "わたなべ"), ("加藤", "かとう"),
+]
+GIVEN = [
+    ("花子", "はなこ"), ("みつき", "みつき"), ("美咲", "みさき"), ("結衣", "ゆい"), ("葵", "あおい"),
+    ("陽菜", "ひな"), ("さくら", "さくら"), ("彩", "あや"), ("真由美", "まゆみ"), ("恵", "めぐみ"),
+]
+CATEGORIES = (("skincare", 55), ("makeup", 35), ("other", 10))
+PRODUCTS_PER_CATEGORY = 30
+
+STAFF_PASSWORD = "bench-password"
+CHUNK_CUSTOMERS = 5000
+
+
+@dataclass
+class SeedConfig:
+    customers: int = 100_000
+    visits: int = 500_000
+    staffs: int = 10
+    years: int = 5
+    seed: int = 42
+    today: str = ""  # YYYY-MM-DD（空なら実行日）
+
+
+def meta_path(db_path: Path) -> Path:
+    return db_path.with_name(db_path.name + ".json")
+
+
+def read_meta(db_path: Path) -> dict | None:
+    path = meta_path(db_path)
+    return json.loads(path.read_text()) if path.exists() else None
+
+
+def staff_email(i: int) -> str:
+    return f"bench{i}@example.com"
+
+
+def _geometric(rnd: random.Random, mean: float) -> int:
+    # 0, 1, 2, ... を平均 mean で（p = 1 / (1 + mean)）
+    if mean <= 0:
+        return 0
+    return int(math.log(1.0 - rnd.random()) / math.log(mean / (1.0 + mean)))
+
+
+def _visit_count(rnd: random.Random, mean: float) -> int:
+    if mean <= 1:
+        return 1 if rnd.random() < mean else 0
+    return 1 + _geometric(rnd, mean - 1)
+
+
+def _visit_day(rnd: random.Random, today: date, start: int, end: int) -> int:
+    # start〜end（today からの日数のオフセット）。平日は3割ほど引き直して土日を多めに
+    d = rnd.randint(start, end)
+    if (today + timedelta(days=d)).weekday() < 5 and rnd.random() < 0.3:
+        d = rnd.randint(start, end)
+    return d
+
+
+def seed(db_path: Path, config: SeedConfig, log=print) -> dict:
+    today = date.fromisoformat(config.today) if config.today else date.today()
+    config.today = today.isoformat()
+    span = config.years * 365
+    rnd = random.Random(config.seed)
+
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    for p in (db_path, db_path.with_name(db_path.name + "-wal"), db_path.with_name(db_path.name + "-shm")):
+        p.unlink(missing_ok=True)
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    migrations.upgrade(engine, log=lambda _: None)
+
+    @event.listens_for(engine, "connect")
+    def _fast_writes(dbapi_connection, connection_record):
+        # 作り直せるデータなので書き込みの同期は省く
+        dbapi_connection.execute("PRAGMA journal_mode=WAL")
+        dbapi_connection.execute("PRAGMA synchronous=OFF")
+
+    engine.dispose()
+    t0 = time.perf_counter()
+
+    hashed = security.get_password_hash(STAFF_PASSWORD)  # 全員同じパスワード
+    with Session(engine) as db:
+        for i in range(config.staffs):
+            crud.create_staff(db, schemas.StaffCreate(
+                staff_code=f"B-{i:03d}", name=f"スタッフ{i}", email=staff_email(i), password=STAFF_PASSWORD,
+            ), hashed)
+        staff_ids = [s.id for s in crud.get_staffs(db)]
+        rules = follow_rules.get_rules(db)
+
+    categories = [c for c, _ in CATEGORIES]
+    category_weights = list(_cumulative(w for _, w in CATEGORIES))
+    product_weights = list(_cumulative(1 / (rank + 1) for rank in range(PRODUCTS_PER_CATEGORY)))
+    products = {c: [f"{c}-{n:02d}" for n in range(PRODUCTS_PER_CATEGORY)] for c in categories}
+    staff_weights = list(_cumulative(1 / (rank + 1) ** 0.5 for rank in range(len(staff_ids))))
+
+    mean_visits = config.visits / max(config.customers, 1)
+    visit_id = item_id = 0
+    customer_rows, visit_rows, item_rows = [], [], []
+
+    def flush() -> None:
+        with engine.begin() as conn:
+            for model, rows in ((models.Customer, customer_rows), (models.Visit, visit_rows), (models.VisitItem, item_rows)):
+                if rows:
+                    conn.execute(insert(model), rows)
+                    rows.clear()
+
+    for customer_id in range(1, config.customers + 1):
+        # 登録日: 直近ほど多い（店が伸びている想定）
+        created = -int(rnd.triangular(0, span, 0))
+        fam, fam_kana = rnd.choice(FAMILY)
+        giv, giv_kana = rnd.choice(GIVEN)
+        kana = f"{fam_kana} {giv_kana}"
+        phone = f"090-{rnd.randint(0, 9999):04d}-{rnd.randint(0, 9999):04d}" if rnd.random() < 0.8 else None
+        birthday = date(1950, 1, 1) + timedelta(days=rnd.randint(0, 55 * 365)) if rnd.random() < 0.75 else None
+
+        days = sorted(_visit_day(rnd, today, created, 0) for _ in range(_visit_count(rnd, mean_visits)))
+        for offset in days:
+            visit_id += 1
+            visit_date = today + timedelta(days=offset)
+            visit_rows.append({
+                "id": visit_id,
+                "customer_id": customer_id,
+                "visit_date": visit_date,
+                "staff_id": rnd.choices(staff_ids, cum_weights=staff_weights)[0] if rnd.random() < 0.9 else None,
+                "created_at": datetime.combine(visit_date, datetime.min.time()) + timedelta(hours=rnd.randint(10, 19)),
+            })
+            for _ in range(1 + (rnd.random() < 0.35) + (rnd.random() < 0.1)):
+                item_id += 1
+                category = rnd.choices(categories, cum_weights=category_weights)[0]
+                product = rnd.choices(products[category], cum_weights=product_weights)[0]
+                due = rules.due_date(visit_date, category, product)
+                sent = due < today and rnd.random() < 0.8
+                item_rows.append({
+                    "id": item_id,
+                    "visit_id": visit_id,
+                    "category": category,
+                    "product_name": product,
+                    "follow_due_date": due,
+                    "follow_sent_at": datetime.combine(due, datetime.min.time()) if sent else None,
+                })
+
+        customer_rows.append({
+            "id": customer_id,
+            "name": f"{fam} {giv}",
+            "kana": kana,
+            "kana_norm": search.normalize_kana(kana),
+            "phone": phone,
+            "phone_norm": search.normalize_phone(phone),
+            "email": f"user{customer_id}@example.com" if rnd.random() < 0.85 else None,
+            "email_opt_in": rnd.random() < 0.9,
+            "birthday": birthday,
+            "birth_month": birthday.month if birthday else None,
+            "birth_day": birthday.day if birthday else None,
+            "last_visit_date": today + timedelta(days=days[-1]) if days else None,
+            "created_at": datetime.combine(today + timedelta(days=created), datetime.min.time()),
+        })
+
+        if customer_id % CHUNK_CUSTOMERS == 0:
+            flush()
+            if customer_id % (CHUNK_CUSTOMERS * 20) == 0:
+                log(f"  customers={customer_id} visits={visit_id} items={item_id} ({time.perf_counter() - t0:.0f}s)")
+    flush()
+    inserted = time.perf_counter() - t0
+
+    with Session(engine) as db:
+        last_purchases.rebuild(db)
+        rollups.rebuild(db)
+        counts = {
+            name: db.execute(select(func.count()).select_from(model)).scalar()
+            for name, model in (("customers", models.Customer), ("visits", models.Visit), ("visit_items", models.VisitItem))
+        }
+    with engine.connect() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    engine.dispose()
+
+    meta = {"config": asdict(config), "counts": counts, "seconds": round(time.perf_counter() - t0, 1)}
+    meta_path(db_path).write_text(json.dumps(meta, ensure_ascii=False, indent=2))
+    log(f"seeded {counts} in {meta['seconds']}s (inserts {inserted:.1f}s)")
+    return meta
+
+
+def _cumulative(weights):
+    total = 0
+    for w in weights:
+        total += w
+        yield total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db", type=Path, default=Path("bench/data/crm.db"))
+    parser.add_argument("--customers", type=int, default=SeedConfig.customers)
+    parser.add_argument("--visits", type=int, default=SeedConfig.visits, help="来店数の目安（実数は分布で前後する）")
+    parser.add_argument("--staffs", type=int, default=SeedConfig.staffs)
+    parser.add_argument("--years", type=int, default=SeedConfig.years)
+    parser.add_argument("--seed", type=int, default=SeedConfig.seed)
+    parser.add_argument("--today", default="", help="データの基準日 YYYY-MM-DD（既定は実行日）")
+    args = parser.parse_args()
+
+    seed(args.db, SeedConfig(args.customers, args.visits, args.staffs, args.years, args.seed, args.today))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+# bench/suite.py
+# よく使う処理のベンチマーク一式（TestClient でアプリをそのまま呼ぶ。結果は JSON）
+#
+#   cd beauty-backend
+#   python -m bench.suite                                   # bench/data/crm.db が無ければ作ってから測る
+#   python -m bench.suite --out result.json --baseline bench/baseline.json   # ベースラインより遅ければ exit 1
+#   python -m bench.suite --save-baseline bench/baseline.json               # ベースラインを更新
+#   python -m bench.suite --db bench/data/big.db --customers 2000000 --visits 10000000 --reseed
+#
+# - 各シナリオを warmup 回まわしてから repeat 回測る（p50 / p95 / 最小 / 平均 ms）
+#   SQL の回数・DB 時間はレスポンスの Server-Timing から取る
+# - 比較: p50 が ベースライン × (1 + tolerance) を超え、かつ min-delta-ms 以上遅くなったら回帰
+#   SQL の回数が増えたら（N+1 など）時間に関係なく回帰
+# - データ（件数・基準日）がベースラインと違うときは警告を出す（時間の比較は参考程度になる）
+# ベースラインは測ったマシンの値。別のマシンで比べるときは先に --save-baseline で取り直す
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Callable
+
+# app（と app を使う bench.seed）は接続先の環境変数を入れてから読み込む（run / main の中で import する）
+
+SEARCH_QUERIES = ["山田 花", "ナカムラ", "みさき", "090-12", "user123", "存在しない名前"]
+
+
+@dataclass
+class Scenario:
+    name: str
+    request: Callable[[random.Random], tuple]  # 乱数 → (method, path, json)
+    repeat: int
+    cleanup: Callable | None = None  # レスポンス → 後片付け（時間に含めない）
+
+
+def scenarios(customers: int, client) -> list[Scenario]:
+    from bench import seed as seed_data
+
+    def customer_id(rnd):
+        return rnd.randint(1, customers)
+
+    def delete_visit(r):
+        client.delete(f"/api/visits/{r.json()['id']}")
+
+    return [
+        Scenario("login", lambda rnd: (
+            "POST", "/api/auth/login", {"email": seed_data.staff_email(0), "password": seed_data.STAFF_PASSWORD},
+        ), repeat=10),
+        Scenario("customers_search", lambda rnd: (
+            "GET", f"/api/customers?q={rnd.choice(SEARCH_QUERIES)}", None,
+        ), repeat=30),
+        Scenario("customers_list", lambda rnd: ("GET", "/api/customers", None), repeat=30),
+        Scenario("inactive_by_segment", lambda rnd: (
+            "GET", f"/api/dashboard/inactive-customers?segment={rnd.choice(['skincare', 'makeup'])}", None,
+        ), repeat=5),
+        Scenario("event_targets", lambda rnd: ("GET", "/api/follow-mail/targets?mail_type=event", None), repeat=5),
+        Scenario("birthday_targets", lambda rnd: ("GET", "/api/follow-mail/targets?mail_type=birthday", None), repeat=10),
+        Scenario("upcoming_birthdays", lambda rnd: ("GET", "/api/follow-mail/upcoming-birthdays?days=30", None), repeat=10),
+        Scenario("visits_by_customer", lambda rnd: (
+            "GET", f"/api/visits/by-customer/{customer_id(rnd)}", None,
+        ), repeat=50),
+        Scenario("create_visit", lambda rnd: (
+            "POST", "/api/visits/", {
+                "customer_id": customer_id(rnd),
+                "visit_date": date.today().isoformat(),
+                "items": [{"category": "skincare", "product_name": "skincare-00"}, {"category": "makeup"}],
+            },
+        ), repeat=30, cleanup=delete_visit),
+    ]
+
+
+def _server_timing(header: str) -> tuple[float, int]:
+    # 'app;dur=1.2, db;dur=0.3;desc="2 queries"' → (0.3, 2)
+    db_ms, queries = 0.0, 0
+    for metric in header.split(","):
+        name, *params = [p.strip() for p in metric.split(";")]
+        if name != "db":
+            continue
+        for p in params:
+            if p.startswith("dur="):
+                db_ms = float(p[4:])
+            elif p.startswith("desc="):
+                queries = int(p[5:].strip('"').split()[0])
+    return db_ms, queries
+
+
+def _percentile(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+def run_scenario(client, scenario: Scenario, warmup: int, seed: int) -> dict:
+    rnd = random.Random(seed)
+    samples, db_samples, queries = [], [], 0
+    for i in range(warmup + scenario.repeat):
+        method, path, body = scenario.request(rnd)
+        t0 = time.perf_counter()
+        r = client.request(method, path, json=body)
+        elapsed = (time.perf_counter() - t0) * 1000
+        if r.status_code != 200:
+            raise RuntimeError(f"{scenario.name}: {method} {path} -> {r.status_code} {r.text[:200]}")
+        if scenario.cleanup:
+            scenario.cleanup(r)
+        if i < warmup:
+            continue
+        db_ms, n = _server_timing(r.headers.get("server-timing", ""))
+        samples.append(elapsed)
+        db_samples.append(db_ms)
+        queries = max(queries, n)
+    return {
+        "n": len(samples),
+        "p50_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(_percentile(samples, 0.95), 3),
+        "min_ms": round(min(samples), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "db_p50_ms": round(statistics.median(db_samples), 3),
+        "queries": queries,
+        "rows": len(r.json()) if isinstance(r.json(), list) else None,
+    }
+
+
+def run(db_path: Path, warmup: int, only: list[str] | None, log) -> dict:
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+    from bench import seed as seed_data
+
+    meta = seed_data.read_meta(db_path) or {}
+    results = {}
+    with TestClient(app) as client:
+        r = client.post("/api/auth/login", json={"email": seed_data.staff_email(0), "password": seed_data.STAFF_PASSWORD})
+        r.raise_for_status()
+        client.headers["Authorization"] = f"Bearer {r.json()['access_token']}"
+
+        for i, scenario in enumerate(scenarios(meta.get("counts", {}).get("customers", 1), client)):
+            if only and scenario.name not in only:
+                continue
+            results[scenario.name] = run_scenario(client, scenario, warmup, seed=i)
+            res = results[scenario.name]
+            log(f"{scenario.name:<22}{res['p50_ms']:>10.2f}{res['p95_ms']:>10.2f}{res['db_p50_ms']:>10.2f}{res['queries']:>8}")
+
+    return {
+        "meta": {
+            "dataset": meta,
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "warmup": warmup,
+            "run_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float, min_delta_ms: float, log) -> list[str]:
+    """ベースラインより悪くなったシナリオの説明を返す（空なら合格）"""
+    base_data = baseline["meta"].get("dataset", {})
+    cur_data = current["meta"].get("dataset", {})
+    if base_data.get("counts") != cur_data.get("counts") or base_data.get("config", {}).get("today") != cur_data.get("config", {}).get("today"):
+        log("warning: dataset differs from the baseline (counts or --today); timings are not directly comparable")
+
+    regressions = []
+    log(f"\n{'scenario':<22}{'base p50':>10}{'p50':>10}{'change':>9}  queries")
+    for name, cur in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            log(f"{name:<22}{'-':>10}{cur['p50_ms']:>10.2f}{'new':>9}")
+            continue
+        change = cur["p50_ms"] / base["p50_ms"] - 1 if base["p50_ms"] else 0.0
+        slower = change > tolerance and cur["p50_ms"] - base["p50_ms"] >= min_delta_ms
+        more_queries = cur["queries"] > base["queries"]
+        mark = "  REGRESSION" if slower or more_queries else ""
+        log(f"{name:<22}{base['p50_ms']:>10.2f}{cur['p50_ms']:>10.2f}{change:>+9.0%}  {base['queries']}→{cur['queries']}{mark}")
+        if slower:
+            regressions.append(f"{name}: p50 {base['p50_ms']:.2f}ms → {cur['p50_ms']:.2f}ms ({change:+.0%})")
+        if more_queries:
+            regressions.append(f"{name}: queries {base['queries']} → {cur['queries']}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db", type=Path, default=Path("bench/data/crm.db"))
+    parser.add_argument("--reseed", action="store_true", help="DB があっても作り直す")
+    parser.add_argument("--customers", type=int, help="作るときの顧客数（既定は bench.seed と同じ）")
+    parser.add_argument("--visits", type=int, help="作るときの来店数の目安")
+    parser.add_argument("--today", default="", help="データの基準日（ベースラインと揃えるとき）")
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--only", nargs="*", help="測るシナリオ名")
+    parser.add_argument("--out", type=Path, help="結果の JSON（省略時は標準出力）")
+    parser.add_argument("--baseline", type=Path, help="比べるベースラインの JSON")
+    parser.add_argument("--save-baseline", type=Path, help="結果をベースラインとして保存")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="p50 がこの割合を超えて遅くなったら回帰")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0, help="これ未満の差は誤差として無視")
+    args = parser.parse_args()
+
+    def log(msg: str) -> None:
+        print(msg, file=sys.stderr)
+
+    # アプリは import 時に接続先を決めるので、ここで入れてから読み込む
+    os.environ["SQLALCHEMY_DATABASE_URL"] = f"sqlite:///{args.db.resolve()}"
+    os.environ.setdefault("SLOW_QUERY_MS", "60000")  # 遅いクエリのログで出力が埋まらないように
+    from bench import seed as seed_data
+
+    if args.reseed or not args.db.exists():
+        sizes = {k: v for k, v in (("customers", args.customers), ("visits", args.visits)) if v}
+        config = seed_data.SeedConfig(**sizes, today=args.today)
+        log(f"seeding {args.db} (customers={config.customers}, visits≈{config.visits}) ...")
+        seed_data.seed(args.db, config, log=log)
+
+    log(f"\n{'scenario':<22}{'p50 ms':>10}{'p95 ms':>10}{'db ms':>10}{'queries':>8}")
+    current = run(args.db.resolve(), args.warmup, args.only, log)
+
+    text = json.dumps(current, ensure_ascii=False, indent=2)
+    if args.out:
+        args.out.write_text(text + "\n")
+    elif not args.save_baseline:
+        print(text)
+    if args.save_baseline:
+        args.save_baseline.write_text(text + "\n")
+        log(f"saved baseline to {args.save_baseline}")
+
+    if args.baseline:
+        regressions = compare(current, json.loads(args.baseline.read_text()), args.tolerance, args.min_delta_ms, log)
+        if regressions:
+            log("\nperformance regressions:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+        log("\nno regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# tests/conftest.py
+# テスト用の共通設定（使い捨ての SQLite ファイルにマイグレーションを当てて使う）
+#
+#   cd beauty-backend
+#   pip install -r requirements-dev.txt
+#   python -m pytest
+import os
+import tempfile
+import uuid
+from datetime import date
+
+import pytest
+
+# app は import 時に接続先を決めるので、ここで入れてから読み込む
+_tmpdir = tempfile.TemporaryDirectory(prefix="beauty-crm-test-")
+os.environ["SQLALCHEMY_DATABASE_URL"] = f"sqlite:///{_tmpdir.name}/test.db"
+os.environ.setdefault("SLOW_QUERY_MS", "60000")
+
+from sqlalchemy import event  # noqa: E402
+
+from app import crud, migrations, schemas  # noqa: E402
+from app.database import SessionLocal, engine  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _schema():
+    migrations.upgrade(engine, log=lambda _: None)
+    yield
+    engine.dispose()
+    _tmpdir.cleanup()
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def statements():
+    """実行された SQL 文を記録するリスト（テスト中だけ before_cursor_execute を仕掛ける）"""
+    executed: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield executed
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def make_customer(db):
+    """顧客を1人作る関数（テストごとに別の顧客。DB はテスト間で共有なので名前・メールは毎回変える）"""
+    def make(**fields):
+        code = uuid.uuid4().hex[:8]
+        fields.setdefault("name", f"テスト {code}")
+        fields.setdefault("email", f"customer-{code}@example.com")
+        return crud.create_customer(db, schemas.CustomerCreate(**fields))
+
+    return make
+
+
+@pytest.fixture
+def make_visit(db):
+    """来店を1件作る関数。items は (category, product_name) のタプルか category だけ"""
+    def make(customer_id: int, visit_date: date, items=(), **fields):
+        return crud.create_visit(db, schemas.VisitCreate(
+            customer_id=customer_id,
+            visit_date=visit_date,
+            items=[
+                schemas.VisitItemCreate(category=i, product_name=None)
+                if isinstance(i, str)
+                else schemas.VisitItemCreate(category=i[0], product_name=i[1])
+                for i in items
+            ],
+            **fields,
+        ))
+
+    return make
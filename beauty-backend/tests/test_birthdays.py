@@ -0,0 +1,40 @@
+# tests/test_birthdays.py
+# 誕生月日のカラム（birth_month / birth_day）と誕生日が近い顧客の抽出
+from datetime import date
+
+from app import crud, schemas
+
+
+def test_birth_columns_follow_birthday(db, make_customer):
+    customer = make_customer(birthday=date(1990, 7, 15))
+    assert (customer.birth_month, customer.birth_day) == (7, 15)
+
+    customer = crud.update_customer(db, customer.id, schemas.CustomerUpdate(birthday=date(1991, 2, 28)))
+    assert (customer.birth_month, customer.birth_day) == (2, 28)
+    customer = crud.update_customer(db, customer.id, schemas.CustomerUpdate(name="名前だけ変更"))
+    assert (customer.birth_month, customer.birth_day) == (2, 28)
+    customer = crud.update_customer(db, customer.id, schemas.CustomerUpdate(birthday=None))
+    assert (customer.birth_month, customer.birth_day) == (None, None)
+
+
+def test_next_birthday():
+    today = date(2027, 2, 1)
+    assert crud.next_birthday(date(1990, 2, 1), today) == date(2027, 2, 1)
+    assert crud.next_birthday(date(1990, 1, 31), today) == date(2028, 1, 31)
+    # うるう年以外は 2/28 扱い
+    assert crud.next_birthday(date(1992, 2, 29), today) == date(2027, 2, 28)
+    assert crud.next_birthday(date(1992, 2, 29), date(2027, 3, 1)) == date(2028, 2, 29)
+
+
+def test_upcoming_birthday_targets_in_birthday_order(db, make_customer, make_visit):
+    today = date(2026, 12, 20)
+    later = make_customer(birthday=date(1985, 1, 5))      # 年明け
+    sooner = make_customer(birthday=date(1990, 12, 25))
+    no_visit = make_customer(birthday=date(1990, 12, 24))  # 直近の来店なし
+    past = make_customer(birthday=date(1990, 12, 19))      # 今年はもう過ぎた
+    for c in (later, sooner, past):
+        make_visit(c.id, date(2026, 11, 1))
+
+    targets = crud.get_upcoming_birthday_targets(db, days=30, today=today)
+    mine = [(c.id, nb) for c, _, nb in targets if c.id in {later.id, sooner.id, no_visit.id, past.id}]
+    assert mine == [(sooner.id, date(2026, 12, 25)), (later.id, date(2027, 1, 5))]
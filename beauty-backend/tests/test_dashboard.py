@@ -0,0 +1,59 @@
+# tests/test_dashboard.py
+# ダッシュボードのサマリー（全ウィジェットをまとめて集計・短い TTL のキャッシュ・書き込みで invalidate）
+import uuid
+from datetime import date, timedelta
+
+from app import dashboard, follow_rules
+
+
+def test_summary_is_cached_until_a_write(db, make_customer, make_visit, statements):
+    dashboard.invalidate()
+    before = dashboard.get_summary(db)
+    statements.clear()
+    assert dashboard.get_summary(db) is before
+    assert statements == []  # TTL の間は集計しない
+
+    customer = make_customer()
+    make_visit(customer.id, date.today())
+    after = dashboard.get_summary(db)
+    assert after["today_visit_count"] == before["today_visit_count"] + 1
+    assert after["monthly_new_customer_count"] == before["monthly_new_customer_count"] + 1
+
+
+def test_summary_written_during_aggregation_is_not_cached(db, monkeypatch):
+    summarize = dashboard.summarize
+
+    def racing(session):
+        summary = summarize(session)
+        dashboard.invalidate()  # 集計中に別のリクエストが来店を登録した
+        return summary
+
+    dashboard.invalidate()
+    monkeypatch.setattr(dashboard, "summarize", racing)
+    dashboard.get_summary(db)
+    assert dashboard.get_cached() is None
+
+
+def test_inactive_widget_counts_and_previews_oldest_first(db, make_customer, make_visit, monkeypatch):
+    category = f"inactive-{uuid.uuid4().hex[:8]}"
+    follow_rules.upsert_rule(db, category, None, 30)
+    monkeypatch.setattr(dashboard, "INACTIVE_PREVIEW", 2)
+    today = date.today()
+
+    lapsed = []
+    for days in (40, 90, 60):
+        c = make_customer()
+        make_visit(c.id, today - timedelta(days=days), items=[category])
+        lapsed.append((days, c))
+    recent = make_customer()
+    make_visit(recent.id, today - timedelta(days=10), items=[category])
+    opted_out = make_customer(email_opt_in=False)
+    make_visit(opted_out.id, today - timedelta(days=100), items=[category])
+
+    dashboard.invalidate()
+    widget = next(w for w in dashboard.get_summary(db)["inactive"] if w["segment"] == category)
+    assert (widget["threshold_days"], widget["count"]) == (30, 3)
+    by_days = dict(lapsed)
+    assert [(c["customer_id"], c["days_since"]) for c in widget["customers"]] == [
+        (by_days[90].id, 90), (by_days[60].id, 60),
+    ]
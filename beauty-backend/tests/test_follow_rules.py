@@ -0,0 +1,103 @@
+# tests/test_follow_rules.py
+# フォロー周期ルールの登録（1件にまとまる）と、ルール変更後の follow_due_date の再計算、重複ルールを消すマイグレーション
+import uuid
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.exc import IntegrityError
+
+from app import follow_rules, models
+from app.database import SessionLocal
+from app.migrations import m0005_follow_rules_unique
+
+
+@pytest.fixture
+def category():
+    # DB はテスト間で共有なので、テストごとに別のカテゴリを使う
+    return f"cat-{uuid.uuid4().hex[:8]}"
+
+
+def _due_dates(db, visit):
+    db.expire_all()
+    items = db.query(models.VisitItem).filter(models.VisitItem.visit_id == visit.id).order_by(models.VisitItem.id)
+    return [i.follow_due_date for i in items]
+
+
+def test_upsert_keeps_one_rule_per_category_and_product(db, category):
+    follow_rules.upsert_rule(db, category, None, 30)
+    follow_rules.upsert_rule(db, category, "", 40)  # 空文字もカテゴリ全体のルール
+    follow_rules.upsert_rule(db, category, "serum", 50)
+    rule = follow_rules.upsert_rule(db, category, "serum", 60)
+
+    rules = db.query(models.FollowRule).filter(models.FollowRule.category == category).all()
+    assert sorted((r.product_name or "", r.cycle_days) for r in rules) == [("", 40), ("serum", 60)]
+    assert rule.cycle_days == 60
+
+
+def test_duplicate_category_rule_is_rejected(db, category):
+    # product_name が NULL 同士でも重複させない（部分一意インデックス）
+    db.add(models.FollowRule(category=category, cycle_days=30))
+    db.commit()
+    db.add(models.FollowRule(category=category, cycle_days=31))
+    with pytest.raises(IntegrityError):
+        db.commit()
+    db.rollback()
+
+
+def test_recompute_due_dates(db, category, make_customer, make_visit):
+    follow_rules.upsert_rule(db, category, None, 10)
+    customer = make_customer()
+    visit = make_visit(customer.id, date(2024, 1, 1), [category, (category, "serum"), (category, "cream")])
+    sent = make_visit(customer.id, date(2024, 2, 1), [(category, "serum")])
+    sent.items[0].follow_sent_at = datetime(2024, 3, 1)
+    db.commit()
+    assert _due_dates(db, visit) == [date(2024, 1, 11)] * 3
+
+    # 商品ルールを足すとその商品だけ変わる
+    follow_rules.upsert_rule(db, category, "serum", 30)
+    assert follow_rules.recompute_due_dates(SessionLocal, category, "serum", chunk_size=1) == 1
+    assert _due_dates(db, visit) == [date(2024, 1, 11), date(2024, 1, 31), date(2024, 1, 11)]
+
+    # カテゴリルールを変えると商品ルールの無い明細だけ変わる（送信済みは触らない）
+    follow_rules.upsert_rule(db, category, None, 60)
+    assert follow_rules.recompute_due_dates(SessionLocal, category, chunk_size=2) == 2
+    assert _due_dates(db, visit) == [date(2024, 3, 1), date(2024, 1, 31), date(2024, 3, 1)]
+    assert _due_dates(db, sent) == [date(2024, 2, 11)]
+
+    # ルールを全部消すと0日（来店日）。もう一度実行しても変わる行は無い
+    for rule in follow_rules.list_rules(db):
+        if rule.category == category:
+            follow_rules.delete_rule(db, rule.id)
+    assert follow_rules.recompute_due_dates(SessionLocal, category) == 3
+    assert _due_dates(db, visit) == [date(2024, 1, 1)] * 3
+    assert follow_rules.recompute_due_dates(SessionLocal, category) == 0
+
+
+def test_migration_removes_duplicate_rules(tmp_path):
+    # 一意インデックスを張る前の DB に重複ルールがあっても、最後に登録したものを残して適用できる
+    engine = create_engine(f"sqlite:///{tmp_path}/old.db")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE follow_rules (id INTEGER PRIMARY KEY, category VARCHAR NOT NULL, "
+            "product_name VARCHAR, cycle_days INTEGER NOT NULL, updated_at DATETIME)"
+        ))
+        conn.execute(text("CREATE INDEX ix_follow_rules_category_product ON follow_rules (category, product_name)"))
+        conn.execute(text(
+            "INSERT INTO follow_rules (category, product_name, cycle_days) VALUES "
+            "('skincare', NULL, 90), ('skincare', NULL, 91), ('skincare', 'serum', 30), ('skincare', 'serum', 31), "
+            "('makeup', NULL, 120)"
+        ))
+
+    m0005_follow_rules_unique.upgrade(engine)
+    m0005_follow_rules_unique.upgrade(engine)  # 何度実行しても同じ
+
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT category, product_name, cycle_days FROM follow_rules ORDER BY id")).all()
+        assert rows == [("skincare", None, 91), ("skincare", "serum", 31), ("makeup", None, 120)]
+        with pytest.raises(IntegrityError):
+            conn.execute(text("INSERT INTO follow_rules (category, cycle_days) VALUES ('makeup', 1)"))
+    assert {ix["name"] for ix in inspect(engine).get_indexes("follow_rules")} == {
+        "ux_follow_rules_category_product", "ux_follow_rules_category",
+    }
+    engine.dispose()
@@ -0,0 +1,70 @@
+# tests/test_last_purchases.py
+# 顧客×カテゴリの最終購入サマリー（来店の登録・更新・削除・顧客削除で作り直す）
+import uuid
+from datetime import date
+
+from sqlalchemy import select
+
+from app import crud, last_purchases, models, schemas
+
+LP = models.CustomerLastPurchase
+
+
+def _summary(db, customer_id):
+    rows = db.execute(
+        select(LP.category, LP.last_purchase_date, LP.last_visit_item_id).where(LP.customer_id == customer_id)
+    ).all()
+    return {category: (day, item_id) for category, day, item_id in rows}
+
+
+def _item_id(visit, category):
+    return next(i.id for i in visit.items if i.category == category)
+
+
+def test_summary_follows_visit_writes(db, make_customer, make_visit):
+    hair, nail = f"hair-{uuid.uuid4().hex[:6]}", f"nail-{uuid.uuid4().hex[:6]}"
+    customer = make_customer()
+
+    first = make_visit(customer.id, date(2026, 3, 1), items=[hair])
+    second = make_visit(customer.id, date(2026, 4, 1), items=[hair, nail])
+    # 来店日の古い来店を後から登録しても、サマリーは新しい方のまま
+    make_visit(customer.id, date(2026, 2, 1), items=[nail])
+    assert _summary(db, customer.id) == {
+        hair: (date(2026, 4, 1), _item_id(second, hair)),
+        nail: (date(2026, 4, 1), _item_id(second, nail)),
+    }
+
+    # 明細の入れ替え: nail を外すと1つ前の来店に戻る、hair の日付は更新後の来店日
+    second = crud.update_visit(db, second.id, schemas.VisitUpdate(
+        visit_date=date(2026, 4, 5), items=[schemas.VisitItemCreate(category=hair)],
+    ))
+    summary = _summary(db, customer.id)
+    assert summary[hair] == (date(2026, 4, 5), _item_id(second, hair))
+    assert summary[nail][0] == date(2026, 2, 1)
+
+    # 来店削除: そのカテゴリの最後の来店が消えたら前の来店、来店が無くなれば行ごと消える
+    assert crud.delete_visit(db, second.id)
+    assert _summary(db, customer.id)[hair] == (date(2026, 3, 1), _item_id(first, hair))
+    assert crud.delete_visit(db, first.id)
+    assert set(_summary(db, customer.id)) == {nail}
+
+    assert crud.delete_customer(db, customer.id)
+    assert _summary(db, customer.id) == {}
+
+
+def test_rebuild_matches_incremental_upkeep(db, make_customer, make_visit):
+    color = f"color-{uuid.uuid4().hex[:6]}"
+    customer = make_customer()
+    make_visit(customer.id, date(2026, 1, 10), items=[color, (color, "トリートメント")])
+    make_visit(customer.id, date(2026, 1, 10), items=[color])
+    before = _summary(db, customer.id)
+
+    last_purchases.rebuild(db)
+    # 同じ日に同じカテゴリを2回買ったら明細IDの大きい方
+    assert _summary(db, customer.id) == before
+    assert before[color][1] == db.execute(
+        select(models.VisitItem.id)
+        .join(models.Visit)
+        .where(models.Visit.customer_id == customer.id)
+        .order_by(models.VisitItem.id.desc())
+    ).scalars().first()
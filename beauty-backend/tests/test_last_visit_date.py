@@ -0,0 +1,46 @@
+# tests/test_last_visit_date.py
+# Customer.last_visit_date（来店の登録・更新・削除のたびに来店から計算し直す）
+from datetime import date
+
+from sqlalchemy import update
+
+from app import crud, models, schemas
+
+
+def _last_visit_date(db, customer_id):
+    db.expire_all()
+    return crud.get_customer(db, customer_id).last_visit_date
+
+
+def test_last_visit_date_follows_visit_writes(db, make_customer, make_visit):
+    customer = make_customer()
+    assert customer.last_visit_date is None
+
+    latest = make_visit(customer.id, date(2026, 5, 1))
+    assert _last_visit_date(db, customer.id) == date(2026, 5, 1)
+    older = make_visit(customer.id, date(2026, 3, 1))
+    assert _last_visit_date(db, customer.id) == date(2026, 5, 1)
+
+    crud.update_visit(db, older.id, schemas.VisitUpdate(visit_date=date(2026, 6, 1), items=[]))
+    assert _last_visit_date(db, customer.id) == date(2026, 6, 1)
+    crud.update_visit(db, older.id, schemas.VisitUpdate(visit_date=date(2026, 1, 1), items=[]))
+    assert _last_visit_date(db, customer.id) == date(2026, 5, 1)
+
+    assert crud.delete_visit(db, latest.id)
+    assert _last_visit_date(db, customer.id) == date(2026, 1, 1)
+    assert crud.delete_visit(db, older.id)
+    assert _last_visit_date(db, customer.id) is None
+
+
+def test_check_last_visit_dates_reports_and_repairs(db, make_customer, make_visit):
+    customer = make_customer()
+    make_visit(customer.id, date(2026, 5, 1))
+    db.execute(update(models.Customer).where(models.Customer.id == customer.id).values(last_visit_date=date(2020, 1, 1)))
+    db.commit()
+
+    assert (customer.id, date(2020, 1, 1), date(2026, 5, 1)) in crud.check_last_visit_dates(db)
+    assert _last_visit_date(db, customer.id) == date(2020, 1, 1)  # repair=False なら直さない
+
+    crud.check_last_visit_dates(db, repair=True)
+    assert _last_visit_date(db, customer.id) == date(2026, 5, 1)
+    assert crud.check_last_visit_dates(db) == []
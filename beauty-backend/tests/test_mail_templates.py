@@ -0,0 +1,46 @@
+# tests/test_mail_templates.py
+# 一斉メールの差し込みテンプレート（compile はジョブごとに1回、render は部品をつなぐだけ）
+from datetime import date, datetime
+
+import pytest
+
+from app.mail_templates import compile_template, recipient_values, render_messages
+
+
+def test_compile_splits_fields_and_resolves_aliases():
+    tpl = compile_template("{{name}}様 前回は{{ latest_visit_date }}、{{product}}")
+    assert tpl.fields == {"name", "last_visit_date", "product_name"}
+    assert tpl.render({
+        "name": "山田", "last_visit_date": datetime(2026, 4, 1, 10, 30), "product_name": None,
+    }) == "山田様 前回は2026/04/01、"
+
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(ValueError, match="address, phone"):
+        compile_template("{{name}} {{phone}} {{address}} {{phone}}")
+    # {{ }} の形でないものは文字列のまま
+    assert compile_template("{name} {{ 1x }}").render({}) == "{name} {{ 1x }}"
+
+
+def test_render_messages_is_lazy():
+    subject, body = compile_template("{{name}}様"), compile_template("{{days_since}}日ぶり")
+    seen = []
+
+    def recipients():
+        for i in range(3):
+            seen.append(i)
+            yield {"name": f"顧客{i}", "days_since": i}
+
+    messages = render_messages(subject, body, recipients())
+    r, subj, text = next(messages)
+    assert (subj, text, seen) == ("顧客0様", "0日ぶり", [0])  # 1件ずつ取り出して差し込む
+    assert [s for _, s, _ in messages] == ["顧客1様", "顧客2様"]
+
+
+def test_days_since_uses_segment_purchase_date():
+    row = {"name": "山田", "last_visit_date": date(2026, 5, 1), "last_purchase_date": date(2026, 3, 2)}
+    today = date(2026, 5, 11)
+    assert recipient_values(row, None, today)["days_since"] == 10
+    values = recipient_values(row, "skincare", today)
+    assert (values["segment"], values["days_since"]) == ("skincare", 70)
+    assert recipient_values({"last_visit_date": None}, None, today)["days_since"] is None
@@ -0,0 +1,163 @@
+# tests/test_mail_worker.py
+# 一斉メールのワーカー（ローカルの SMTP sink 相手に送る）: 差し込み、再送、再送上限での失敗、リースを引き継いだときの二重送信防止
+import asyncio
+import email
+import uuid
+from collections import Counter
+from datetime import date, datetime, timedelta
+from email import policy
+
+import pytest
+from sqlalchemy import update
+
+from app import mail_worker, models
+from app.database import SessionLocal
+from app.mail_sink import LocalSMTPSink
+from app.mail_worker import MailWorker, enqueue_job
+from app.mailer import MailSettings, SMTPPool
+
+
+def _settings(sink: LocalSMTPSink, **kw) -> MailSettings:
+    return MailSettings(smtp_host=sink.host, smtp_port=sink.port, smtp_starttls=False, **kw)
+
+
+def _received(sink: LocalSMTPSink) -> Counter:
+    return Counter(r.strip("<>") for m in sink.messages for r in m.rcpt_to)
+
+
+def _outbox(db, job_id: int) -> dict[str, models.EmailOutbox]:
+    db.expire_all()
+    return {o.email: o for o in db.query(models.EmailOutbox).filter(models.EmailOutbox.job_id == job_id)}
+
+
+@pytest.fixture
+def job(db, make_customer):
+    customers = [make_customer() for _ in range(5)]
+    return enqueue_job(db, "お知らせ", "{{ name }} 様", [c.id for c in customers])
+
+
+async def _run(settings_kw: dict, job_id: int, refuse: dict[str, int] | None = None) -> LocalSMTPSink:
+    sink = await LocalSMTPSink(refuse=dict(refuse or {})).start()
+    settings = _settings(sink, **settings_kw)
+    worker = MailWorker(session_factory=SessionLocal, settings=settings, backend=SMTPPool(settings))
+    await worker.run_job(job_id)
+    await worker.backend.close()
+    await sink.stop()
+    return sink
+
+
+def test_messages_are_personalized_per_recipient(db, make_customer, make_visit):
+    category = f"skincare-{uuid.uuid4().hex[:6]}"
+    bought = make_customer(name="購入あり")
+    make_visit(bought.id, date(2026, 3, 1), items=[(category, "化粧水")])
+    make_visit(bought.id, date(2026, 4, 1), items=[(category, "美容液")])
+    other = make_customer(name="購入なし")
+    make_visit(other.id, date(2026, 4, 2))
+    job = enqueue_job(
+        db, "{{name}}様へ", "前回の{{product}}（{{last_purchase_date}}）/ 最終来店 {{last_visit_date}}",
+        [bought.id, other.id], segment=category,
+    )
+
+    sink = asyncio.run(_run({"batch_size": 1}, job.id))
+
+    received = {}
+    for m in sink.messages:
+        msg = email.message_from_bytes(m.data, policy=policy.default)
+        received[msg["To"]] = (msg["Subject"], msg.get_body().get_content().strip())
+    assert received == {
+        bought.email: ("購入あり様へ", "前回の美容液（2026/04/01）/ 最終来店 2026/04/01"),
+        other.email: ("購入なし様へ", "前回の（）/ 最終来店 2026/04/02"),
+    }
+
+
+def test_refused_recipient_is_retried(db, job):
+    emails = sorted(_outbox(db, job.id))
+    sink = asyncio.run(_run({"batch_size": 2}, job.id, refuse={emails[0]: 1}))
+
+    assert _received(sink) == Counter(emails)  # 1回断られた宛先も、次の周回で1回だけ届く
+    outbox = _outbox(db, job.id)
+    assert {o.status for o in outbox.values()} == {"sent"}
+    assert outbox[emails[0]].attempts == 2
+    db.refresh(job)
+    assert (job.status, job.sent_count, job.failed_count) == ("done", 5, 0)
+
+
+def test_recipient_fails_after_max_attempts(db, job):
+    emails = sorted(_outbox(db, job.id))
+    sink = asyncio.run(_run({"batch_size": 2, "max_attempts": 3}, job.id, refuse={emails[0]: -1}))
+
+    assert _received(sink) == Counter(emails[1:])
+    failed = _outbox(db, job.id)[emails[0]]
+    assert (failed.status, failed.attempts) == ("failed", 3)
+    assert "SMTPRecipientsRefused" in failed.error
+    db.refresh(job)
+    assert (job.status, job.sent_count, job.failed_count) == ("done", 4, 1)
+
+
+class _StallingBackend:
+    """最初の1通を送る途中で止まるバックエンド（止まっている間にリースを切らして、別のワーカーに引き継がせる）"""
+
+    delivered_status = "sent"
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.stalled = asyncio.Event()
+        self.resume = asyncio.Event()
+
+    async def send(self, msg):
+        if not self.stalled.is_set():
+            self.stalled.set()
+            await self.resume.wait()
+        await self.inner.send(msg)
+
+    async def close(self):
+        await self.inner.close()
+
+
+def _expire_lease(job_id: int) -> None:
+    with SessionLocal() as db:
+        db.execute(
+            update(models.EmailJob)
+            .where(models.EmailJob.id == job_id)
+            .values(locked_until=datetime.utcnow() - timedelta(seconds=1))
+        )
+        db.commit()
+
+
+def test_no_double_send_after_lease_takeover(db, job, monkeypatch):
+    monkeypatch.setattr(mail_worker, "LEASE_RENEW_AFTER", timedelta(0))  # 送るたびにリースを確かめる
+    emails = sorted(_outbox(db, job.id))
+
+    async def scenario():
+        sink = await LocalSMTPSink().start()
+        settings = _settings(sink, batch_size=2, concurrency=1)
+        stalled = MailWorker(SessionLocal, settings, backend=_StallingBackend(SMTPPool(settings)))
+        other = MailWorker(SessionLocal, settings, backend=SMTPPool(settings))
+
+        # 1台目がバッチ（2件）を取り出して1通目の送信中に止まる → その間にリースが切れて2台目が引き継ぐ
+        first = asyncio.create_task(stalled.run_job(job.id))
+        await stalled.backend.stalled.wait()
+        await asyncio.to_thread(_expire_lease, job.id)
+        locked_until = await asyncio.to_thread(other._claim_job, job.id)
+        assert locked_until is not None
+        await other.run_job(job.id, locked_until)
+
+        # 1台目が動き出しても、リースを失っているので止まっていた1通以外は送らない
+        stalled.backend.resume.set()
+        await first
+        for w in (stalled, other):
+            await w.backend.close()
+        await sink.stop()
+        return sink
+
+    sink = asyncio.run(scenario())
+
+    received = _received(sink)
+    assert max(received.values()) == 1  # どの宛先にも2通以上届いていない
+    assert set(received) == {emails[0], *emails[2:]}
+    outbox = _outbox(db, job.id)
+    assert outbox[emails[0]].status == "sent"  # 止まっていた1通は実際に届いたので sent
+    assert (outbox[emails[1]].status, outbox[emails[1]].error) == ("failed", mail_worker.INTERRUPTED_ERROR)
+    assert {outbox[e].status for e in emails[2:]} == {"sent"}
+    db.refresh(job)
+    assert job.status == "done"
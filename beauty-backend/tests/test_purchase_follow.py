@@ -0,0 +1,69 @@
+# tests/test_purchase_follow.py
+# 購入フォロー: 送信済みの記録（まとめて・未送信のものだけ）と、フォロー期限が来た購入品の抽出
+import uuid
+from datetime import date
+
+import pytest
+
+from app import crud, follow_rules, models
+
+
+@pytest.fixture
+def category(db):
+    # DB はテスト間で共有なので、テストごとに別のカテゴリ（フォロー周期 30 日）を使う
+    category = f"follow-{uuid.uuid4().hex[:8]}"
+    follow_rules.upsert_rule(db, category, None, 30)
+    return category
+
+
+def _item_ids(visit):
+    return sorted(i.id for i in visit.items)
+
+
+def test_mark_sent_bulk_is_idempotent(db, category, make_customer, make_visit, statements):
+    customer = make_customer()
+    ids = _item_ids(make_visit(customer.id, date(2026, 1, 1), items=[category] * 5))
+    missing = max(ids) + 1000
+
+    first = crud.mark_purchase_follow_sent_bulk(db, ids[:3] + ids[:1] + [missing], chunk_size=2)
+    assert (first["marked"], first["already_sent"], first["not_found"]) == (ids[:3], [], [missing])
+    # UPDATE はチャンクごとに1文
+    assert sum(s.lstrip().upper().startswith("UPDATE VISIT_ITEMS") for s in statements) == 2
+
+    second = crud.mark_purchase_follow_sent_bulk(db, ids)
+    assert (second["marked"], second["already_sent"], second["not_found"]) == (ids[3:], ids[:3], [])
+
+    db.expire_all()
+    sent_at = {i.id: i.follow_sent_at for i in db.query(models.VisitItem).filter(models.VisitItem.id.in_(ids))}
+    # 先に記録した送信日時は上書きしない
+    assert {sent_at[i] for i in ids[:3]} == {first["sent_at"]}
+    assert {sent_at[i] for i in ids[3:]} == {second["sent_at"]}
+
+
+def test_targets_are_due_unsent_latest_purchases(db, category, make_customer, make_visit):
+    today = date(2026, 6, 1)  # 周期 30 日 → 5/2 以前の購入が期限切れ
+    overdue = make_customer()
+    old = make_visit(overdue.id, date(2026, 3, 1), items=[(category, "A")])
+    older = make_customer()
+    make_visit(older.id, date(2026, 2, 1), items=[(category, "B")])
+
+    rebought = make_customer()                          # 買い直した人には前の購入品で送らない（最新も期限前）
+    make_visit(rebought.id, date(2026, 3, 1), items=[category])
+    make_visit(rebought.id, date(2026, 5, 20), items=[category])
+    sent = make_customer()                              # 送信済み
+    crud.mark_purchase_follow_sent_bulk(db, _item_ids(make_visit(sent.id, date(2026, 3, 1), items=[category])))
+    opted_out = make_customer(email_opt_in=False)
+    make_visit(opted_out.id, date(2026, 3, 1), items=[category])
+
+    page = crud.get_purchase_follow_targets(db, category=category, limit=1, today=today)
+    assert [(t["customer_id"], t["product_name"], t["days_overdue"]) for t in page.items] == [(older.id, "B", 90)]
+    page = crud.get_purchase_follow_targets(db, category=category, limit=1, cursor=page.next_cursor, today=today)
+    assert [(t["customer_id"], t["visit_item_id"]) for t in page.items] == [(overdue.id, old.items[0].id)]
+    assert page.next_cursor is None
+
+
+def test_targets_skip_categories_without_a_rule(db, make_customer, make_visit):
+    customer = make_customer()
+    make_visit(customer.id, date(2026, 1, 1), items=[f"norule-{uuid.uuid4().hex[:8]}"])
+    page = crud.get_purchase_follow_targets(db, limit=1000, today=date(2026, 6, 1))
+    assert customer.id not in {t["customer_id"] for t in page.items}
@@ -0,0 +1,59 @@
+# tests/test_query_count.py
+# 来店履歴の取得で SQL の数が来店数・明細数に比例しないこと（N+1 になっていないこと）
+from datetime import date, timedelta
+
+import pytest
+
+from app import crud, schemas
+from app.database import SessionLocal
+
+
+def _customer_with_visits(db, n_visits: int) -> tuple[int, list[int]]:
+    customer = crud.create_customer(db, schemas.CustomerCreate(name=f"来店{n_visits}回"))
+    visit_ids = []
+    for i in range(n_visits):
+        visit = crud.create_visit(db, schemas.VisitCreate(
+            customer_id=customer.id,
+            visit_date=date(2024, 1, 1) + timedelta(days=i),
+            items=[
+                schemas.VisitItemCreate(category=("skincare", "makeup", "other")[j % 3], product_name=f"商品{j}")
+                for j in range(1 + i % 3)  # 明細は 1〜3件
+            ],
+        ))
+        visit_ids.append(visit.id)
+    return customer.id, visit_ids
+
+
+def _touch(visits) -> int:
+    # 画面に返すときと同じく明細まで読む（遅延ロードが起きればここで SQL が増える）
+    return sum(len(v.items) + sum(len(item.category) for item in v.items) for v in visits)
+
+
+@pytest.fixture
+def customers(db):
+    return {n: _customer_with_visits(db, n) for n in (1, 5, 20)}
+
+
+def test_visits_by_customer_query_count_is_constant(customers, statements):
+    counts = {}
+    for n, (customer_id, _) in customers.items():
+        with SessionLocal() as db:  # 新しいセッション（identity map のキャッシュに頼らない）
+            statements.clear()
+            page = crud.get_visits_by_customer(db, customer_id)
+            assert len(page.items) == n
+            assert _touch(page.items) > 0
+            counts[n] = len(statements)
+
+    assert counts[1] == counts[5] == counts[20], counts
+
+
+def test_visit_with_items_query_count_is_constant(customers, statements):
+    counts = {}
+    for n, (_, visit_ids) in customers.items():
+        with SessionLocal() as db:
+            statements.clear()
+            visits = [crud.get_visit_with_items(db, visit_id) for visit_id in visit_ids]
+            assert _touch(visits) > 0
+            counts[n] = len(statements) / len(visit_ids)  # 1件あたり
+
+    assert counts[1] == counts[5] == counts[20], counts
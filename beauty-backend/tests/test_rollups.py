@@ -0,0 +1,82 @@
+# tests/test_rollups.py
+# 来店の日別集計（来店の登録・更新・削除で影響する日だけ作り直す）と推移の読み出し
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+
+from app import crud, models, rollups, schemas
+
+R = models.DailyRollup
+# この日付の来店はこのファイルのテストでしか作らない（DB はテスト間で共有）
+D1, D2, D3 = date(2033, 3, 1), date(2033, 3, 2), date(2033, 3, 3)
+
+
+def _stored(db, days) -> dict:
+    rows = db.execute(select(R.metric, R.day, R.dim, R.value).where(R.day.in_(days))).all()
+    return {(m, d, dim): v for m, d, dim, v in rows if v}
+
+
+def _aggregated(db, days) -> dict:
+    # 同じ日を来店から集計し直した値（作り直しの結果と一致するはず）
+    out = {}
+    for stmt in rollups._aggregate_selects(models.Visit.visit_date.in_(days)):
+        for d, m, dim, v in db.execute(stmt).all():
+            out[(m, d, dim)] = v
+    return out
+
+
+def _visit(db, customer_id, day, category, staff_id=None):
+    return crud.create_visit(db, schemas.VisitCreate(
+        customer_id=customer_id, visit_date=day, staff_id=staff_id,
+        items=[schemas.VisitItemCreate(category=category)],
+    ))
+
+
+def test_rollups_follow_visit_writes(db, make_customer):
+    days = [D1, D2, D3]
+    customer = make_customer()
+    first = _visit(db, customer.id, D1, "skincare")
+    second = _visit(db, customer.id, D2, "makeup")
+    stored = _stored(db, days)
+    assert stored == _aggregated(db, days)
+    assert stored[("repeat_visits", D2, "")] == 1
+    assert ("repeat_visits", D1, "") not in stored
+
+    # 最初の来店を後ろにずらすと、D2 の来店が初来店になり D3 が再来になる（D2 の値も作り直す）
+    crud.update_visit(db, first.id, schemas.VisitUpdate(
+        visit_date=D3, items=[schemas.VisitItemCreate(category="nail")],
+    ))
+    stored = _stored(db, days)
+    assert stored == _aggregated(db, days)
+    assert ("visits", D1, "") not in stored and ("category_items", D1, "skincare") not in stored
+    assert ("repeat_visits", D2, "") not in stored
+    assert stored[("repeat_visits", D3, "")] == 1
+
+    # 初来店を消すと、次の来店が初来店になる
+    crud.delete_visit(db, second.id)
+    stored = _stored(db, days)
+    assert stored == _aggregated(db, days)
+    assert ("repeat_visits", D3, "") not in stored
+
+    crud.delete_customer(db, customer.id)
+    assert _stored(db, days) == {}
+
+
+def test_timeseries_fills_empty_periods(db, make_customer):
+    a, b = make_customer(), make_customer()
+    _visit(db, a.id, date(2034, 5, 1), "skincare")
+    _visit(db, a.id, date(2034, 5, 2), "skincare")
+    _visit(db, b.id, date(2034, 5, 2), "makeup")
+
+    visits = rollups.timeseries(db, "visits", date(2034, 4, 30), date(2034, 5, 3))
+    assert [p["value"] for p in visits["series"][0]["points"]] == [0, 1, 2, 0]
+    rate = rollups.timeseries(db, "repeat_rate", date(2034, 5, 1), date(2034, 5, 31), "month")
+    assert rate["series"][0]["points"] == [{"period": date(2034, 5, 1), "value": round(1 / 3, 4)}]
+    mix = rollups.timeseries(db, "category_mix", date(2034, 5, 1), date(2034, 5, 7), "week")
+    assert {s["key"]: [p["value"] for p in s["points"]] for s in mix["series"]} == {
+        "makeup": [1], "skincare": [2],
+    }
+
+    with pytest.raises(ValueError):
+        rollups.timeseries(db, "visits", date(2034, 5, 3), date(2034, 5, 1))
@@ -0,0 +1,45 @@
+# tests/test_search.py
+# 顧客検索の短い検索語（1〜2文字）: 名前・かなの先頭一致をインデックスで引く
+from sqlalchemy import event
+
+from app import search
+from app.database import engine
+
+
+def _ids(page):
+    return [c.id for c in page.items]
+
+
+def test_short_query_matches_name_and_kana_prefix(db, make_customer):
+    washio = make_customer(name="鷲尾 花子", kana="わしお はなこ")
+    washio2 = make_customer(name="鷲尾 一郎", kana="ワシオ イチロウ")
+    owashi = make_customer(name="大鷲 一郎", kana="おおわし いちろう")
+
+    assert _ids(search.search_customers(db, "鷲尾")) == [washio2.id, washio.id]  # 新しい順
+    assert owashi.id not in _ids(search.search_customers(db, "鷲"))  # 先頭一致だけ（部分一致はしない）
+    assert _ids(search.search_customers(db, "わし")) == [washio2.id, washio.id]  # ひらがなでもカタカナのかなに当たる
+    assert _ids(search.search_customers(db, "ｵｵ")) == [owashi.id]  # 半角カナ
+
+    first = search.search_customers(db, "鷲", limit=1)
+    assert _ids(first) == [washio2.id]
+    assert _ids(search.search_customers(db, "鷲", limit=1, cursor=first.next_cursor)) == [washio.id]
+
+
+def test_short_query_uses_indexes(db, make_customer):
+    make_customer(name="鷲尾 花子")
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        search.search_customers(db, "鷲尾")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    statement, parameters = executed[-1]
+    plan = " ".join(r[-1] for r in db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters))
+    # 全件スキャン（SCAN customers）ではなく、各カラムのインデックスの範囲検索
+    assert "MULTI-INDEX OR" in plan
+    assert "SCAN customers" not in plan
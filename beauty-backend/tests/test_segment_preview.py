@@ -0,0 +1,69 @@
+# tests/test_segment_preview.py
+# 条件ツリーのプレビュー（POST /api/segments/preview）: 人数の打ち切り、SQL のタイムアウト、使えない条件
+import time
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app import crud, schemas, segments
+from app.auth import create_access_token
+from app.main import app
+from app.security import get_password_hash
+
+
+def _auth_headers(db) -> dict:
+    code = uuid.uuid4().hex[:8]
+    staff = crud.create_staff(db, schemas.StaffCreate(
+        staff_code=f"T-{code}", name="テスト", email=f"staff-{code}@example.com", password="x",
+    ), get_password_hash("x"))
+    token = create_access_token({"sub": str(staff.id), "email": staff.email, "role": "staff"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_count_is_capped(db, make_customer, monkeypatch):
+    tag = uuid.uuid4().hex[:8]
+    ids = [make_customer(name=f"プレビュー {tag} {i}").id for i in range(3)]
+    payload = {"filter": {"field": "customer.name", "op": "contains", "value": tag}, "limit": 2}
+    client, headers = TestClient(app), _auth_headers(db)
+
+    r = client.post("/api/segments/preview", json=payload, headers=headers)
+    assert r.status_code == 200
+    body = r.json()
+    assert (body["count"], body["count_capped"]) == (3, False)
+    assert [c["id"] for c in body["customers"]] == sorted(ids, reverse=True)[:2]
+
+    monkeypatch.setattr(segments, "SEGMENT_COUNT_CAP", 2)
+    body = client.post("/api/segments/preview", json=payload, headers=headers).json()
+    assert (body["count"], body["count_capped"]) == (2, True)
+
+
+def test_unusable_filters_are_rejected(db):
+    client, headers = TestClient(app), _auth_headers(db)
+    for bad in (
+        {"field": "customer.password", "op": "eq", "value": "x"},
+        {"field": "visit.visit_date", "op": "within_days", "value": 30},  # exists / count の外
+        {"field": "customer.id", "op": "eq", "value": 1.5},
+        {"and": [{"field": "customer.id", "op": "gt", "value": i} for i in range(60)]},
+    ):
+        r = client.post("/api/segments/preview", json={"filter": bad}, headers=headers)
+        assert r.status_code == 400, bad
+
+
+def _count_to(n: int):
+    # 1〜n を数えるだけの SQL（n が大きいと数秒かかる）
+    return text(f"WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < {n}) SELECT count(*) FROM n")
+
+
+def test_statement_timeout_interrupts_and_resets(db):
+    started = time.monotonic()
+    with pytest.raises(segments.SegmentTimeout):
+        with segments.statement_timeout(db, 0.05):
+            db.execute(_count_to(100_000_000)).scalar()
+    assert time.monotonic() - started < 5
+
+    # 中断用のハンドラは外してあるので、同じ接続の後の SQL は止まらない
+    with segments.statement_timeout(db, 5):
+        assert db.execute(text("SELECT 1")).scalar() == 1
+    assert db.execute(_count_to(200_000)).scalar() == 200_000
@@ -0,0 +1,90 @@
+# tests/test_segments.py
+# セグメントの条件（segments.build で AND して1本の SELECT にする）: スタッフ・来店回数、誕生日が近い顧客
+import uuid
+from datetime import date
+
+from app import crud, schemas, segments
+from app.security import get_password_hash
+
+
+def _staff(db):
+    code = uuid.uuid4().hex[:8]
+    return crud.create_staff(db, schemas.StaffCreate(
+        staff_code=f"T-{code}", name="テスト", email=f"staff-{code}@example.com", password="password",
+    ), get_password_hash("password"))
+
+
+def _ids(db, conditions, among):
+    ids = {c.id for c in among}
+    return {r.id for r in db.execute(segments.build(conditions)).all() if r.id in ids}
+
+
+def test_by_staff_and_min_visits_compose_with_other_conditions(db, make_customer, make_visit):
+    staff, other = _staff(db), _staff(db)
+    today = date(2026, 6, 1)
+    since = date(2026, 1, 1)
+
+    regular = make_customer()               # 担当スタッフの来店が今年2回
+    make_visit(regular.id, date(2026, 2, 1), staff_id=staff.id)
+    make_visit(regular.id, date(2026, 5, 1), staff_id=staff.id)
+
+    once = make_customer()                  # 今年は1回だけ（去年の来店は数えない）
+    make_visit(once.id, date(2025, 6, 1), staff_id=staff.id)
+    make_visit(once.id, date(2026, 5, 1), staff_id=staff.id)
+
+    other_staff = make_customer()           # 2回来ているが担当は別のスタッフ
+    make_visit(other_staff.id, date(2026, 2, 1), staff_id=other.id)
+    make_visit(other_staff.id, date(2026, 5, 1), staff_id=other.id)
+
+    opted_out = make_customer(email_opt_in=False)
+    make_visit(opted_out.id, date(2026, 2, 1), staff_id=staff.id)
+    make_visit(opted_out.id, date(2026, 5, 1), staff_id=staff.id)
+
+    lapsed = make_customer()                # 条件は満たすが直近30日の来店がない
+    make_visit(lapsed.id, date(2026, 1, 10), staff_id=staff.id)
+    make_visit(lapsed.id, date(2026, 2, 1), staff_id=staff.id)
+
+    among = [regular, once, other_staff, opted_out, lapsed]
+    assert _ids(db, [
+        segments.opted_in(),
+        segments.recent_visit(45, today),
+        segments.by_staff(staff.id),
+        segments.min_visits(2, since),
+    ], among) == {regular.id}
+
+    # since なしなら全期間の来店を数える・担当した来店があるかどうかも全期間
+    assert _ids(db, [segments.by_staff(staff.id), segments.min_visits(2)], among) == {
+        regular.id, once.id, opted_out.id, lapsed.id,
+    }
+    assert _ids(db, [segments.by_staff(staff.id, since=date(2026, 3, 1))], among) == {
+        regular.id, once.id, opted_out.id,
+    }
+
+
+def test_birthday_within_wraps_the_year(db, make_customer):
+    dec31 = make_customer(birthday=date(1990, 12, 31))
+    jan5 = make_customer(birthday=date(1990, 1, 5))
+    jan20 = make_customer(birthday=date(1990, 1, 20))   # 30日より先
+    dec19 = make_customer(birthday=date(1990, 12, 19))  # 今年はもう過ぎた
+    among = [dec31, jan5, jan20, dec19]
+
+    assert _ids(db, [segments.birthday_within(30, date(2026, 12, 20))], among) == {dec31.id, jan5.id}
+    assert _ids(db, [segments.birthday_within(0, date(2026, 12, 31))], among) == {dec31.id}
+    assert _ids(db, [segments.birthday_within(365, date(2026, 12, 20))], among) == {c.id for c in among}
+
+
+def test_birthday_within_feb29(db, make_customer):
+    leap = make_customer(birthday=date(1992, 2, 29))
+    feb28 = make_customer(birthday=date(1990, 2, 28))
+    mar1 = make_customer(birthday=date(1990, 3, 1))
+    among = [leap, feb28, mar1]
+
+    # うるう年以外は 2/28 に含める
+    assert _ids(db, [segments.birthday_within(0, date(2027, 2, 28))], among) == {leap.id, feb28.id}
+    assert _ids(db, [segments.birthday_within(3, date(2027, 2, 26))], among) == {leap.id, feb28.id, mar1.id}
+    # 年をまたいで翌年（うるう年以外）の 2/28 まで
+    assert leap.id in _ids(db, [segments.birthday_within(70, date(2026, 12, 25))], among)
+    # うるう年は 2/29 当日だけ
+    assert _ids(db, [segments.birthday_within(0, date(2028, 2, 28))], among) == {feb28.id}
+    assert _ids(db, [segments.birthday_within(0, date(2028, 2, 29))], among) == {leap.id}
+    assert _ids(db, [segments.birthday_within(1, date(2028, 3, 1))], among) == {mar1.id}
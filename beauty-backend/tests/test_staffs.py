@@ -0,0 +1,86 @@
+# tests/test_staffs.py
+# スタッフ情報の更新（PATCH /api/staffs/{id}）の権限
+import threading
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import crud, schemas, security
+from app.auth import create_access_token
+from app.main import app
+from app.security import get_password_hash, verify_password
+
+
+def _staff(db, password: str):
+    code = uuid.uuid4().hex[:8]
+    staff = crud.create_staff(db, schemas.StaffCreate(
+        staff_code=f"T-{code}", name="テスト", email=f"staff-{code}@example.com", password=password,
+    ), get_password_hash(password))
+    token = create_access_token({"sub": str(staff.id), "email": staff.email, "role": "staff"})
+    return staff, {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def test_cannot_update_another_staff(db, client):
+    me, headers = _staff(db, "my-password")
+    other, _ = _staff(db, "other-password")
+
+    r = client.patch(f"/api/staffs/{other.id}", json={"is_active": False}, headers=headers)
+    assert r.status_code == 403
+    r = client.patch(f"/api/staffs/{other.id}", json={"password": "taken-over"}, headers=headers)
+    assert r.status_code == 403
+
+    db.refresh(other)
+    assert other.is_active is not False
+    assert verify_password("other-password", other.hashed_password)
+
+
+def test_password_change_requires_current_password(db, client):
+    me, headers = _staff(db, "my-password")
+
+    r = client.patch(f"/api/staffs/{me.id}", json={"password": "new-password"}, headers=headers)
+    assert r.status_code == 400
+    r = client.patch(
+        f"/api/staffs/{me.id}", json={"password": "new-password", "current_password": "wrong"}, headers=headers
+    )
+    assert r.status_code == 403
+    db.refresh(me)
+    assert verify_password("my-password", me.hashed_password)
+
+    r = client.patch(
+        f"/api/staffs/{me.id}", json={"password": "new-password", "current_password": "my-password"}, headers=headers
+    )
+    assert r.status_code == 200
+    db.refresh(me)
+    assert verify_password("new-password", me.hashed_password)
+
+
+def test_can_update_own_name(db, client):
+    me, headers = _staff(db, "my-password")
+    r = client.patch(f"/api/staffs/{me.id}", json={"name": "新しい名前"}, headers=headers)
+    assert r.status_code == 200
+    assert r.json()["name"] == "新しい名前"
+
+
+def test_password_hash_runs_off_the_event_loop(db, client, monkeypatch):
+    me, headers = _staff(db, "my-password")
+    threads = []
+
+    def record(plain):
+        threads.append(threading.current_thread().name)
+        return get_password_hash(plain)
+
+    monkeypatch.setattr(security, "get_password_hash", record)
+    r = client.patch(
+        f"/api/staffs/{me.id}", json={"password": "new-password", "current_password": "my-password"}, headers=headers
+    )
+    assert r.status_code == 200
+    # ハッシュは crud（DB 処理の中）ではなく、パスワード用の上限付きワーカースレッドで作る
+    assert threads == ["AnyIO worker thread"]
+    db.refresh(me)
+    assert verify_password("new-password", me.hashed_password)
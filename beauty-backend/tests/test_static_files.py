@@ -0,0 +1,69 @@
+# tests/test_static_files.py
+# フロントの配信（圧縮版・キャッシュヘッダー・304・index.html へのフォールバック）
+import pytest
+from fastapi.testclient import TestClient
+
+from app import static_files
+from app.static_files import IMMUTABLE, REVALIDATE, SPAStaticFiles
+
+BUNDLE = "console.log('hello');\n" * 200
+
+
+@pytest.fixture
+def client(tmp_path):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "index.html").write_text("<!doctype html><div id=root></div>")
+    (tmp_path / "assets" / "index-DFhVN9qZ.js").write_text(BUNDLE)
+    (tmp_path / "assets" / "logo.svg").write_text("<svg/>")
+    return TestClient(SPAStaticFiles(tmp_path))
+
+
+def test_hashed_assets_are_immutable_and_compressed(client):
+    r = client.get("/assets/index-DFhVN9qZ.js", headers={"Accept-Encoding": "gzip"})
+    assert r.status_code == 200
+    assert r.headers["cache-control"] == IMMUTABLE
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.headers["vary"] == "Accept-Encoding"
+    assert int(r.headers["content-length"]) < len(BUNDLE)
+    assert r.text == BUNDLE
+
+    plain = client.get("/assets/index-DFhVN9qZ.js", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["etag"] != r.headers["etag"]  # 圧縮形式ごとに別の ETag
+
+    # ハッシュの無いファイルは毎回確認
+    assert client.get("/assets/logo.svg").headers["cache-control"] == REVALIDATE
+
+
+def test_etag_revalidation_returns_304(client):
+    r = client.get("/", headers={"Accept-Encoding": "identity"})
+    assert r.headers["cache-control"] == REVALIDATE
+    again = client.get("/", headers={"Accept-Encoding": "identity", "If-None-Match": r.headers["etag"]})
+    assert again.status_code == 304
+    assert again.content == b""
+
+    r = client.get("/assets/index-DFhVN9qZ.js", headers={"Accept-Encoding": "gzip"})
+    again = client.get(
+        "/assets/index-DFhVN9qZ.js", headers={"Accept-Encoding": "gzip", "If-None-Match": r.headers["etag"]}
+    )
+    assert again.status_code == 304
+    assert "content-encoding" not in again.headers
+
+
+def test_large_files_are_served_from_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(static_files, "MAX_MEMORY_FILE_SIZE", 10)
+    (tmp_path / "big.txt").write_text("x" * 100)
+    client = TestClient(SPAStaticFiles(tmp_path))
+
+    r = client.get("/big.txt", headers={"Accept-Encoding": "gzip"})
+    assert (r.status_code, r.text) == (200, "x" * 100)
+    assert "content-encoding" not in r.headers
+    assert client.get("/big.txt", headers={"If-None-Match": r.headers["etag"]}).status_code == 304
+
+
+def test_spa_fallback(client):
+    assert client.get("/customers/1").text.startswith("<!doctype html>")
+    assert client.get("/assets/missing-12345678.js").status_code == 404
+    r = client.get("/api/nope")
+    assert (r.status_code, r.json()) == (404, {"detail": "Not Found"})
+    assert client.post("/").status_code == 405
@@ -0,0 +1,125 @@
+# tests/test_visit_import.py
+# 来店履歴の一括取り込み（POST /api/visits/import と visit_import.import_visits）
+import asyncio
+import io
+import json
+import uuid
+from datetime import date
+
+import httpx
+import pytest
+
+from app import crud, last_purchases, models, schemas, visit_import
+from app.auth import create_access_token
+from app.database import SessionLocal
+from app.main import app
+from app.security import get_password_hash
+
+
+def _auth_headers(db) -> dict:
+    code = uuid.uuid4().hex[:8]
+    staff = crud.create_staff(db, schemas.StaffCreate(
+        staff_code=f"T-{code}", name="テスト", email=f"staff-{code}@example.com", password="x",
+    ), get_password_hash("x"))
+    token = create_access_token({"sub": str(staff.id), "email": staff.email, "role": "staff"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _ndjson(customer_id: int, days: range) -> bytes:
+    return b"".join(
+        json.dumps({
+            "customer_id": customer_id,
+            "visit_date": f"2024-01-{d:02d}",
+            "items": [{"category": "skincare"}],
+        }).encode() + b"\n"
+        for d in days
+    )
+
+
+def _visit_count(customer_id: int) -> int:
+    with SessionLocal() as db:
+        return db.query(models.Visit).filter(models.Visit.customer_id == customer_id).count()
+
+
+def test_import_reads_body_while_it_arrives(db, make_customer):
+    customer = make_customer()
+    headers = _auth_headers(db)
+    imported_before_rest = []
+
+    async def body():
+        yield _ndjson(customer.id, range(1, 4))
+        # 受け取ったそばから取り込んでいれば、残りを送る前に最初の3来店が登録されている
+        for _ in range(200):
+            if await asyncio.to_thread(_visit_count, customer.id) == 3:
+                imported_before_rest.append(True)
+                break
+            await asyncio.sleep(0.01)
+        yield _ndjson(customer.id, range(4, 6))
+
+    async def post():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post("/api/visits/import?format=ndjson&chunk_size=1", content=body(), headers=headers)
+
+    r = asyncio.run(post())
+    assert r.status_code == 200, r.text
+    assert (r.json()["visits"], r.json()["chunks"]) == (5, 5)
+    assert imported_before_rest == [True]
+    assert _visit_count(customer.id) == 5
+
+
+def test_import_rejects_csv_without_required_columns(db):
+    async def post():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post(
+                "/api/visits/import?format=csv", content=b"customer_id,memo\n1,x\n" * 5000, headers=_auth_headers(db)
+            )
+
+    r = asyncio.run(post())
+    assert r.status_code == 400
+
+
+def test_bad_rows_are_skipped_and_csv_rows_grouped_by_visit_ref(db, make_customer):
+    customer = make_customer()
+    missing = customer.id + 100000
+    csv = (
+        "visit_ref,customer_id,visit_date,memo,staff_id,category,product_name,note\n"
+        f"a,{customer.id},2024-02-01,,,skincare,化粧水,\n"
+        f"a,{customer.id},2024-02-01,,,makeup,,\n"
+        f"b,{customer.id},2024-02-02,,,,,\n"          # 明細なしの来店
+        f"c,{customer.id},2024-02-30,,,skincare,,\n"  # 日付が不正
+        f"d,{missing},2024-02-03,,,skincare,,\n"     # 顧客がいない
+    )
+    result = visit_import.import_visits(db, visit_import.read_records(io.StringIO(csv), "csv"), chunk_size=2)
+
+    assert (result.visits, result.items, result.skipped, result.chunks) == (2, 2, 2, 1)
+    assert [e["line"] for e in result.errors] == [5, 6]
+    assert f"customer_id {missing}" in result.errors[1]["error"]
+    assert _visit_count(customer.id) == 2
+
+
+def test_failed_chunk_is_rolled_back_and_earlier_chunks_kept(db, make_customer, monkeypatch):
+    customer = make_customer()
+    calls = []
+    refresh = last_purchases.refresh_customers
+
+    def fail_second_chunk(session, customer_ids):
+        calls.append(customer_ids)
+        if len(calls) == 2:
+            raise RuntimeError("boom")
+        refresh(session, customer_ids)
+
+    monkeypatch.setattr(last_purchases, "refresh_customers", fail_second_chunk)
+    records = visit_import.read_ndjson(_ndjson(customer.id, range(1, 6)).decode().splitlines())
+    with pytest.raises(RuntimeError):
+        visit_import.import_visits(db, records, chunk_size=2)
+
+    # 1チャンク目（2来店）は commit 済み、2チャンク目は途中まで INSERT していても rollback
+    assert _visit_count(customer.id) == 2
+    db.expire_all()
+    assert crud.get_customer(db, customer.id).last_visit_date == date(2024, 1, 2)
+    # 失敗しても、commit 済みのチャンクの日別集計は作り直してある
+    for d in (date(2024, 1, 1), date(2024, 1, 2)):
+        rollup = db.get(models.DailyRollup, ("visits", d, ""))
+        assert rollup.value == db.query(models.Visit).filter(models.Visit.visit_date == d).count()
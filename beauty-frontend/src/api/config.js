@@ -1,2 +1,5 @@
 export const API_BASE_URL =
   import.meta.env.VITE_API_BASE_URL || "http://localhost:8000";
+
+// 一覧 API の次ページのカーソル（バックエンドの pagination.NEXT_CURSOR_HEADER）
+export const NEXT_CURSOR_HEADER = "X-Next-Cursor";
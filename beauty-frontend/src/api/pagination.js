@@ -0,0 +1,42 @@
+// src/api/pagination.js
+import { NEXT_CURSOR_HEADER } from "./config";
+
+// 一覧 API を1ページ読む。{ items, nextCursor } を返す（nextCursor が null なら最後のページ）
+// サーバーは1回 limit 件までしか返さず、続きがあれば X-Next-Cursor ヘッダーにカーソルを入れてくる
+// 失敗したら status / body 付きの Error を投げる
+export async function fetchPage(url, { pageSize, cursor, ...options } = {}) {
+  const params = new URLSearchParams();
+  if (pageSize) params.set("limit", pageSize);
+  if (cursor) params.set("cursor", cursor);
+  const query = params.toString();
+  const sep = url.includes("?") ? "&" : "?";
+  const res = await fetch(query ? `${url}${sep}${query}` : url, options);
+
+  if (!res.ok) {
+    const body = await res.text().catch(() => "");
+    const error = new Error(body || `HTTP ${res.status}`);
+    error.status = res.status;
+    error.body = body;
+    throw error;
+  }
+
+  const page = await res.json();
+  return {
+    items: Array.isArray(page) ? page : [],
+    nextCursor: res.headers.get(NEXT_CURSOR_HEADER),
+  };
+}
+
+// 最後のページまで読んで1つの配列にする（件数に上限がある一覧だけに使う。顧客一覧のような全件には使わない）
+export async function fetchAllPages(url, { pageSize, ...options } = {}) {
+  const items = [];
+  let cursor = null;
+
+  do {
+    const page = await fetchPage(url, { pageSize, cursor, ...options });
+    items.push(...page.items);
+    cursor = page.nextCursor;
+  } while (cursor);
+
+  return items;
+}
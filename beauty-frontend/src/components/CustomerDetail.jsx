@@ -3,6 +3,7 @@ import { useNavigate, useParams } from "react-router-dom";
 import DashboardLayout from "./DashboardLayout";
 import { updateCustomer } from "../api/customers";
 import { API_BASE_URL } from "../api/config";
+import { fetchAllPages } from "../api/pagination";
 
 //////////// 共通のコンポーネント ///////////
 function SectionCard({ title, children, className = "", right }) {
@@ -550,7 +551,7 @@ export default function CustomerDetail() {
   const [visitLoading, setVisitLoading] = useState(false);
   const [visitError, setVisitError] = useState("");
 
-  // 来店履歴取得（GET /visits/by-customer/{id}）
+  // 来店履歴取得（GET /visits/by-customer/{id}。ページを最後までたどって全件）
   useEffect(() => {
     if (!id) return;
 
@@ -563,19 +564,18 @@ export default function CustomerDetail() {
           localStorage.getItem("access_token") ||
           localStorage.getItem("rb_token");
 
-        const res = await fetch(`${API_BASE_URL}/visits/by-customer/${id}`, {
-          headers: token ? { Authorization: `Bearer ${token}` } : {},
+        const data = await fetchAllPages(
+          `${API_BASE_URL}/visits/by-customer/${id}`,
+          {
+            headers: token ? { Authorization: `Bearer ${token}` } : {},
+            pageSize: 500, // API の1ページの上限
+          }
+        ).catch((e) => {
+          throw e.status
+            ? new Error(`来店履歴の取得に失敗しました（${e.status}）${e.body}`)
+            : e;
         });
 
-        if (!res.ok) {
-          const txt = await res.text().catch(() => "");
-          throw new Error(
-            `来店履歴の取得に失敗しました（${res.status}）${txt}`
-          );
-        }
-
-        const data = await res.json();
-
         const mapped = data.map((v) => {
           const items = (v.items ?? []).map((it) => {
             return `${it.category}${
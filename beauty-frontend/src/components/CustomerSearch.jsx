@@ -1,7 +1,10 @@
-import React, { useEffect, useMemo, useState } from "react";
+import React, { useEffect, useRef, useState } from "react";
 import { useNavigate } from "react-router-dom";
 import DashboardLayout from "./DashboardLayout";
 import { API_BASE_URL } from "../api/config";
+import { fetchPage } from "../api/pagination";
+
+const PAGE_SIZE = 20; // 1回に読む件数（続きは「さらに表示」・一覧の下までスクロール）
 
 ///////// 共通：ゆる一致（全角↔半角、カナ↔ひら、大小無視） ////////
 const normalize = (s = "") =>
@@ -27,7 +30,50 @@ const highlight = (text, kw) => {
     );
 };
 
+//////// API の顧客 → 一覧の行 //////////
+const toRow = (c) => {
+  const full = (c.name ?? "").trim(); // 例: "山田 花子" or "山田花子"
+
+  // 「山田 花子」なら分割、スペース無しなら雑に半分で分割（仮）
+  let lastName = "";
+  let firstName = "";
+  if (full.includes(" ")) {
+    const parts = full.split(/\s+/);
+    lastName = parts[0] ?? "";
+    firstName = parts.slice(1).join(" ") ?? "";
+  } else {
+    const mid = Math.ceil(full.length / 2);
+    lastName = full.slice(0, mid);
+    firstName = full.slice(mid);
+  }
+
+  return {
+    id: String(c.id), // ルーティングで使う
+    number: String(c.id), // いまは顧客番号が無いので id を代用（後で顧客番号追加したら差し替え）
+    lastName,
+    firstName,
+    phone: c.phone ?? "",
+  };
+};
+
+const authHeaders = () => {
+  const token =
+    localStorage.getItem("access_token") || localStorage.getItem("rb_token");
+  return token ? { Authorization: `Bearer ${token}` } : {};
+};
+
+// 顧客番号（= id）で1件。無ければ空
+const fetchById = async (id) => {
+  const res = await fetch(`${API_BASE_URL}/customers/${id}`, {
+    headers: authHeaders(),
+  });
+  if (res.status === 404) return [];
+  if (!res.ok) throw new Error(`顧客の取得に失敗しました（${res.status}）`);
+  return [await res.json()];
+};
+
 //////// 顧客検索（番号 / 名前 / 電話：分割入力） //////////
+// 名前・電話はサーバーの検索（GET /customers?q=）に投げる。ブラウザに全件は読まない
 export default function CustomerSearchSplit() {
   const navigate = useNavigate();
 
@@ -37,92 +83,99 @@ export default function CustomerSearchSplit() {
   const [qPhone, setQPhone] = useState("");
   const [activeIdx, setActiveIdx] = useState(0);
 
-  // customers はAPIから入れる
-  const [customers, setCustomers] = useState([]);
+  // 検索結果と、名前・電話それぞれの続きのカーソル（{ name: { q, cursor } }。無ければ最後まで読んだ）
+  const [results, setResults] = useState([]);
+  const [more, setMore] = useState({});
+  const [loading, setLoading] = useState(false);
+  const [error, setError] = useState("");
+  const seqRef = useRef(0); // 入力が変わったら、前の入力の結果は捨てる
 
-  // APIから顧客一覧を取得して customers にセット
+  // デバウンス
+  const [debounced, setDebounced] = useState({ qNumber, qName, qPhone });
   useEffect(() => {
-    const fetchCustomers = async () => {
-      try {
-        const token =
-          localStorage.getItem("access_token") ||
-          localStorage.getItem("rb_token");
+    const t = setTimeout(() => setDebounced({ qNumber, qName, qPhone }), 250);
+    return () => clearTimeout(t);
+  }, [qNumber, qName, qPhone]);
 
-        const res = await fetch(`${API_BASE_URL}/customers`, {
-          headers: token ? { Authorization: `Bearer ${token}` } : {},
-        });
+  // 検索語ごとに1ページ読んで結果に足す（OR条件：どれかが一致でOK。同じ顧客は1回だけ）
+  const load = async (sources, byId, append) => {
+    const seq = append ? seqRef.current : ++seqRef.current;
+    setLoading(true);
+    setError("");
+    try {
+      const headers = authHeaders();
+      const [found, ...pages] = await Promise.all([
+        byId ? fetchById(byId) : [],
+        ...Object.entries(sources).map(([key, { q, cursor }]) => {
+          const url = `${API_BASE_URL}/customers?q=${encodeURIComponent(q)}`;
+          return fetchPage(url, { headers, pageSize: PAGE_SIZE, cursor }).then(
+            (page) => ({ key, q, ...page })
+          );
+        }),
+      ]);
+      if (seq !== seqRef.current) return;
 
-        if (!res.ok) {
-          throw new Error(`顧客一覧の取得に失敗しました（${res.status}）`);
+      const next = {};
+      const rows = found.map(toRow);
+      for (const page of pages) {
+        if (page.nextCursor) {
+          next[page.key] = { q: page.q, cursor: page.nextCursor };
         }
-
-        const data = await res.json();
-
-        // いまの画面の検索ロジックが動くように、MOCKと同じ形に変換
-        const mapped = (Array.isArray(data) ? data : []).map((c) => {
-          const full = (c.name ?? "").trim(); // 例: "山田 花子" or "山田花子"
-
-          // 「山田 花子」なら分割、スペース無しなら雑に半分で分割（仮）
-          let lastName = "";
-          let firstName = "";
-          if (full.includes(" ")) {
-            const parts = full.split(/\s+/);
-            lastName = parts[0] ?? "";
-            firstName = parts.slice(1).join(" ") ?? "";
-          } else {
-            const mid = Math.ceil(full.length / 2);
-            lastName = full.slice(0, mid);
-            firstName = full.slice(mid);
-          }
-
-          return {
-            id: String(c.id), // ルーティングで使う
-            number: String(c.id), // いまは顧客番号が無いので id を代用（後で顧客番号追加したら差し替え）
-            lastName,
-            firstName,
-            phone: c.phone ?? "",
-          };
-        });
-
-        setCustomers(mapped);
-      } catch (e) {
-        console.error(e);
-        alert(e.message || "顧客一覧取得エラー");
+        rows.push(...page.items.map(toRow));
       }
-    };
-
-    fetchCustomers();
-  }, []);
+      setMore(next);
+      setResults((prev) => {
+        const seen = new Set();
+        return [...(append ? prev : []), ...rows].filter(
+          (c) => !seen.has(c.id) && seen.add(c.id)
+        );
+      });
+    } catch (e) {
+      if (seq !== seqRef.current) return;
+      console.error(e);
+      setError(
+        e.status
+          ? `顧客検索に失敗しました（${e.status}）`
+          : e.message || "顧客検索エラー"
+      );
+    } finally {
+      if (seq === seqRef.current) setLoading(false);
+    }
+  };
 
-  // デバウンス
-  const [debounced, setDebounced] = useState({ qNumber, qName, qPhone });
+  // 入力が変わったら1ページ目から
   useEffect(() => {
-    const t = setTimeout(() => setDebounced({ qNumber, qName, qPhone }), 250);
-    return () => clearTimeout(t);
-  }, [qNumber, qName, qPhone]);
+    const sources = {};
+    const name = debounced.qName.trim();
+    const phone = debounced.qPhone.trim();
+    if (name) sources.name = { q: name };
+    if (phone) sources.phone = { q: phone };
+    const id = /^\d+$/.test(debounced.qNumber) ? debounced.qNumber : "";
 
-  // フィルタ（OR条件：どれかが一致でOK）
-  const results = useMemo(() => {
-    const nNum = normalize(debounced.qNumber);
-    const nName = normalize(debounced.qName);
-    const nPhone = normalize(debounced.qPhone);
+    if (!id && !name && !phone) {
+      seqRef.current++;
+      setResults([]);
+      setMore({});
+      setLoading(false);
+      setError("");
+      return;
+    }
+    load(sources, id, false);
+  }, [debounced]);
 
-    const anyFilled = nNum || nName || nPhone;
-    if (!anyFilled) return [];
+  const hasMore = Object.keys(more).length > 0;
+  const loadMore = () => {
+    if (hasMore && !loading) load(more, "", true);
+  };
 
-    return customers
-      .filter((c) => {
-        const nameFull = `${c.lastName ?? ""}${c.firstName ?? ""}`;
-        const byNumber = nNum && normalize(c.number).includes(nNum);
-        const byName = nName && normalize(nameFull).includes(nName);
-        const byPhone = nPhone && normalize(c.phone).includes(nPhone);
-        return byNumber || byName || byPhone;
-      })
-      .slice(0, 20);
-  }, [customers, debounced]);
+  // 一覧の下までスクロールしたら続きを読む
+  const handleScroll = (e) => {
+    const el = e.currentTarget;
+    if (el.scrollTop + el.clientHeight >= el.scrollHeight - 40) loadMore();
+  };
 
-  // キーボード操作
-  useEffect(() => setActiveIdx(0), [results.length]);
+  // キーボード操作（新しく検索したら先頭から。続きを足したときはそのまま）
+  useEffect(() => setActiveIdx(0), [debounced]);
 
   const handlePick = (c) => {
     const id = Number(normalize(c.id));
@@ -220,9 +273,16 @@ export default function CustomerSearchSplit() {
             {/* 結果 */}
             <div className="mt-4">
               <div className="rounded-xl border">
-                <ul className="divide-y max-h-[420px] overflow-auto">
-                  {results.length === 0 ? (
-                    <li className="text-sm text-gray-400 p-4">検索候補一覧</li>
+                <ul
+                  className="divide-y max-h-[420px] overflow-auto"
+                  onScroll={handleScroll}
+                >
+                  {error ? (
+                    <li className="text-sm text-red-600 p-4">{error}</li>
+                  ) : results.length === 0 ? (
+                    <li className="text-sm text-gray-400 p-4">
+                      {loading ? "検索中…" : "検索候補一覧"}
+                    </li>
                   ) : (
                     results.map((c, i) => {
                       const isActive = i === activeIdx;
@@ -252,6 +312,17 @@ export default function CustomerSearchSplit() {
                     })
                   )}
                 </ul>
+                {hasMore && results.length > 0 && (
+                  <div className="border-t p-2 text-center">
+                    <button
+                      onClick={loadMore}
+                      disabled={loading}
+                      className="rounded-md border px-3 py-1.5 text-sm hover:bg-gray-50 disabled:opacity-50"
+                    >
+                      {loading ? "読み込み中…" : "さらに表示"}
+                    </button>
+                  </div>
+                )}
               </div>
             </div>
           </section>
@@ -3,7 +3,12 @@ import React, { useEffect, useState } from "react";
 
 import { API_BASE_URL } from "../api/config";
 
-function SummaryCard({ title, value, emphasize = false }) {
+// サマリーの取り直し間隔（サーバー側も数秒キャッシュしているので、端末が多くても集計は増えない）
+const POLL_INTERVAL_MS = 30000;
+
+const SEGMENT_LABELS = { skincare: "スキンケア", makeup: "メイク" };
+
+function SummaryCard({ title, value, note, emphasize = false }) {
   return (
     <div className="rounded-2xl border bg-white p-5 shadow-sm">
       <div className="text-sm text-gray-500">{title}</div>
@@ -12,13 +17,13 @@ function SummaryCard({ title, value, emphasize = false }) {
       >
         {value}
       </div>
+      {note && <div className="mt-1 text-xs text-gray-400">{note}</div>}
     </div>
   );
 }
 
 export default function DashboardSummary() {
-  const [todayVisits, setTodayVisits] = useState(0);
-  const [monthlyNew, setMonthlyNew] = useState(0);
+  const [summary, setSummary] = useState(null);
 
   const getAuthHeaders = () => {
     const token =
@@ -26,54 +31,47 @@ export default function DashboardSummary() {
     return token ? { Authorization: `Bearer ${token}` } : {};
   };
 
-  // 本日の来店数
+  // 本日の来店数・今月の新規・来店なし顧客数を1回のリクエストでまとめて取る
   useEffect(() => {
     const controller = new AbortController();
 
-    async function fetchTodayVisits() {
+    async function fetchSummary() {
+      if (document.hidden) return; // 画面が裏にあるときは取りに行かない
       try {
-        const res = await fetch(`${API_BASE_URL}/visits/today-count`, {
+        const res = await fetch(`${API_BASE_URL}/dashboard/summary`, {
           headers: getAuthHeaders(),
           signal: controller.signal,
         });
         if (!res.ok) return;
-        const data = await res.json();
-        setTodayVisits(data.count ?? 0);
+        setSummary(await res.json());
       } catch (e) {
         if (e.name !== "AbortError") console.error(e);
       }
     }
 
-    fetchTodayVisits();
-    return () => controller.abort();
+    fetchSummary();
+    const timer = setInterval(fetchSummary, POLL_INTERVAL_MS);
+    return () => {
+      clearInterval(timer);
+      controller.abort();
+    };
   }, []);
 
-  // 今月の新規
-  useEffect(() => {
-    const controller = new AbortController();
-
-    async function fetchMonthlyNew() {
-      try {
-        const res = await fetch(`${API_BASE_URL}/dashboard/monthly-new-count`, {
-          headers: getAuthHeaders(),
-          signal: controller.signal,
-        });
-        if (!res.ok) return;
-        const data = await res.json();
-        setMonthlyNew(data.count ?? 0);
-      } catch (e) {
-        if (e.name !== "AbortError") console.error(e);
-      }
-    }
-
-    fetchMonthlyNew();
-    return () => controller.abort();
-  }, []);
+  const inactive = summary?.inactive ?? [];
 
   return (
-    <div className="grid grid-cols-1 gap-4 md:grid-cols-2">
-      <SummaryCard title="本日の来店数" value={todayVisits} />
-      <SummaryCard title="今月の新規" value={monthlyNew} />
+    <div className="grid grid-cols-1 gap-4 md:grid-cols-2 lg:grid-cols-4">
+      <SummaryCard title="本日の来店数" value={summary?.today_visit_count ?? 0} />
+      <SummaryCard title="今月の新規" value={summary?.monthly_new_customer_count ?? 0} />
+      {inactive.map((s) => (
+        <SummaryCard
+          key={s.segment}
+          title={`フォロー対象（${SEGMENT_LABELS[s.segment] ?? s.segment}）`}
+          value={s.count}
+          note={`${s.threshold_days}日以上来店なし`}
+          emphasize={s.count > 0}
+        />
+      ))}
     </div>
   );
 }